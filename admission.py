@@ -0,0 +1,91 @@
+import threading
+import time
+
+
+class Overloaded(Exception):
+    """A scan was shed; ``reason`` is "saturated" or "stale_frame"."""
+
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Bounded in-flight recognitions per worker, in front of the dlib path.
+
+    A scan takes ``weight`` slots (one per frame, capped at
+    ``max_in_flight``) for as long as it runs. When the slots are taken it
+    waits at most ``max_wait`` seconds and is then shed, so during a rush
+    kiosks get an immediate 503 + Retry-After instead of queueing behind
+    slow dlib calls until the gunicorn timeout. Frames captured more than
+    ``max_frame_age`` seconds ago (client timestamp, checked again after
+    waiting) are dropped: the person has moved on and the kiosk will send
+    a fresh frame anyway.
+    """
+
+    def __init__(self, max_in_flight=4, max_wait=0.25, retry_after=1, max_frame_age=5.0):
+        self.max_in_flight = max_in_flight
+        self.max_wait = max_wait
+        self.retry_after = retry_after
+        self.max_frame_age = max_frame_age
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._waiting = 0
+        self.stats = {"admitted": 0, "saturated": 0, "stale_frame": 0}
+
+    def acquire(self, weight=1, captured_at=None):
+        """
+        Take ``weight`` slots or raise Overloaded. ``captured_at`` is the
+        frame's client timestamp (epoch seconds), None when unknown.
+        Returns the slots taken, to pass to release().
+        """
+        weight = max(1, min(weight, self.max_in_flight))
+        self._check_age(captured_at)
+        deadline = time.monotonic() + self.max_wait
+        with self._cond:
+            self._waiting += 1
+            try:
+                while self._in_flight + weight > self.max_in_flight:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.stats["saturated"] += 1
+                        raise Overloaded("saturated", self.retry_after)
+                    self._cond.wait(remaining)
+                self._in_flight += weight
+            finally:
+                self._waiting -= 1
+        try:
+            self._check_age(captured_at)
+        except Overloaded:
+            self.release(weight)
+            raise
+        with self._cond:
+            self.stats["admitted"] += 1
+        return weight
+
+    def release(self, weight):
+        with self._cond:
+            self._in_flight -= weight
+            self._cond.notify_all()
+
+    def _check_age(self, captured_at):
+        if captured_at is None or not self.max_frame_age:
+            return
+        if time.time() - captured_at > self.max_frame_age:
+            with self._cond:
+                self.stats["stale_frame"] += 1
+            raise Overloaded("stale_frame", 0)
+
+    def depth(self):
+        with self._cond:
+            return {"in_flight": self._in_flight, "waiting": self._waiting}
+
+
+def parse_frame_timestamp(value):
+    """Client capture time (epoch milliseconds, e.g. Date.now()) -> epoch seconds, None if absent/invalid"""
+    try:
+        return float(value) / 1000.0 if value else None
+    except (TypeError, ValueError):
+        return None
@@ -1,14 +1,30 @@
 import threading
+import atexit
+import hmac
 import os
+import json
+import tempfile
+import time
+import zipfile
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
-from datetime import datetime
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from datetime import datetime, timedelta
+from flask import Flask, Response, abort, g, render_template, request, jsonify, session, redirect, url_for
 from pymongo import MongoClient
 from bson.objectid import ObjectId
-from face_engine import FaceEngine
+from face_engine import QUALITY_REASONS, FaceEngine
+from face_pool import FacePool, FacePoolBusy
+from admission import AdmissionController, Overloaded, parse_frame_timestamp
+from attendance_cache import AttendanceCache
+from attendance_writer import AttendanceWriter
+from attendance_history import AttendanceHistory, serialize_log
+from attendance_feed import AttendanceFeed, parse_since, serialize_row
+from attendance_rollup import DailyRollup
+from bulk_enroll import BulkEnroller
 from dotenv import load_dotenv
-from utils import compress_base64_image
+from utils import decode_data_uri
+from preview_store import PreviewStore, preview_etag
+from metrics import MongoCommandMetrics, metrics
 from functools import wraps
 load_dotenv()
 
@@ -62,11 +78,16 @@ def _log_to_sheets_thread(user_name, user_id):
     except Exception as e:
         print(f"[Background] Sheets Error: {e}")
         # Reset client to force reconnect next time
-        global sheets_client
-        sheets_client = None
+        reset_sheets_client()
+
+
+def reset_sheets_client():
+    global sheets_client
+    sheets_client = None
 
 
 def log_to_sheets(user_name, user_id):
+    # Single-row fallback when the batched attendance writer is full.
     # Run in background thread to avoid blocking response
     thread = threading.Thread(
         target=_log_to_sheets_thread, args=(user_name, user_id))
@@ -79,18 +100,115 @@ def log_to_sheets(user_name, user_id):
 # ============================================
 MONGO_URI = os.getenv("MONGO_URI")
 
+# Stage timers, Mongo command counts and gauges served by /metrics; workers
+# share snapshots through METRICS_DIR so any worker can answer a scrape
+metrics.start(os.getenv("METRICS_DIR", "metrics"),
+              flush_interval=float(os.getenv("METRICS_FLUSH_INTERVAL", "5")))
+atexit.register(metrics.stop)
+
 try:
-    client = MongoClient(MONGO_URI)
+    client = MongoClient(MONGO_URI, event_listeners=[MongoCommandMetrics(metrics)])
     db = client['db_absensi']
     collection = db['log_absensi']        # Attendance History
     users_collection = db['daftar_wajah']  # Face Data
+    rollup_collection = db['rekap_harian']  # Daily attendance rollups
+    import_jobs = db['import_jobs']        # Bulk enrollment job status
     print("Successfully connected to MongoDB Atlas")
 except Exception as e:
     print(f"Database connection failed: {e}")
 
+# Today's present names + user lookups held in memory (Mongo stays source of truth)
+attendance_cache = AttendanceCache(collection, users_collection)
+attendance_cache.warm_in_background()
+
+# Today's log in memory for /api/today_log and its SSE stream
+attendance_feed = AttendanceFeed(
+    collection, max_subscribers=int(os.getenv("FEED_MAX_STREAMS", "8")))
+
+# Registration previews live on disk, served by /api/preview/<id>
+preview_store = PreviewStore(os.getenv("PREVIEW_DIR", "previews"))
+preview_store.migrate_in_background(users_collection)
+
+# Cursor-paginated admin history + calendar (indexes created in background)
+attendance_history = AttendanceHistory(collection)
+attendance_history.ensure_indexes_in_background()
+
+# Per-day member lists for the calendar, kept in step with the log
+daily_rollup = DailyRollup(rollup_collection, collection)
+daily_rollup.rebuild_once_in_background()
+
+# Mongo inserts + Sheets rows are batched by one background writer,
+# with an on-disk spool so queued rows survive restarts
+attendance_writer = AttendanceWriter(
+    collection,
+    get_sheet=get_sheets_client,
+    on_sheets_error=reset_sheets_client,
+    spool_dir=os.getenv("ATTENDANCE_SPOOL_DIR", "spool"),
+    batch_size=int(os.getenv("ATTENDANCE_BATCH_SIZE", "100")),
+    flush_interval=float(os.getenv("ATTENDANCE_FLUSH_INTERVAL", "2.0")),
+    rollup=daily_rollup).start()
+atexit.register(attendance_writer.stop)
+
+# Optional process pool for HOG + dlib encoding. Its processes are spawned
+# and would re-run this file if it were __main__, so the dev server
+# (python app.py) always scans in-process.
+FACE_POOL_PROCESSES = int(os.getenv("FACE_POOL_PROCESSES", "0"))
+face_pool = None
+if FACE_POOL_PROCESSES and __name__ != '__main__':
+    face_pool = FacePool(
+        FACE_POOL_PROCESSES,
+        max_pending=int(os.getenv("FACE_POOL_QUEUE", "0")) or None,
+        queue_timeout=float(os.getenv("FACE_POOL_QUEUE_TIMEOUT", "5")))
+    face_pool.warm_in_background()
+    atexit.register(face_pool.stop)
+
 if not os.path.exists('known_faces'):
     os.makedirs('known_faces')
-face_engine = FaceEngine(known_faces_dir='known_faces')
+face_engine = FaceEngine(
+    known_faces_dir='known_faces',
+    ann_threshold=int(os.getenv("FACE_INDEX_ANN_THRESHOLD", "20000")),
+    ann_nlist=int(os.getenv("FACE_INDEX_NLIST", "0")) or None,
+    ann_nprobe=int(os.getenv("FACE_INDEX_NPROBE", "8")),
+    detection_scale=float(os.getenv("FACE_DETECTION_SCALE", "0.5")),
+    batch_workers=int(os.getenv("FACE_BATCH_WORKERS", "4")),
+    quality_gate=os.getenv("FACE_QUALITY_GATE", "True").lower() == "true",
+    pool=face_pool)
+
+# Bulk enrollment (one job per worker at a time); spawns one process per
+# core for detect + encode, in-process under the dev server like the pool
+bulk_enroller = BulkEnroller(
+    'known_faces', users_collection, preview_store,
+    workers=1 if __name__ == '__main__' else int(os.getenv("BULK_ENROLL_WORKERS", "0")) or None)
+bulk_enroll_lock = threading.Lock()
+
+# Read at scrape time (globals looked up on each call)
+metrics.register("gallery_size", lambda: face_engine.gallery_size(), "Matchable embeddings in the index")
+metrics.register("gallery_tombstones", lambda: face_engine.index.tombstones,
+                 "Removed gallery rows waiting for compaction")
+metrics.register("attendance_queue_depth", lambda: attendance_writer.depth(),
+                 "Attendance rows waiting in the writer", label="stage")
+metrics.register("attendance_writer_total", lambda: dict(attendance_writer.stats),
+                 "Attendance writer rows by outcome", kind="counter", label="result")
+metrics.register("present_today", lambda: attendance_cache.stats()["present"],
+                 "Names present today in the attendance cache")
+metrics.register("feed_subscribers", lambda: attendance_feed.stats()["subscribers"],
+                 "Open today_log SSE streams")
+# Scan admission: bounded in-flight recognitions per worker, fast 503 when full
+scan_admission = AdmissionController(
+    max_in_flight=int(os.getenv("SCAN_MAX_IN_FLIGHT", "4")),
+    max_wait=float(os.getenv("SCAN_QUEUE_WAIT", "0.25")),
+    retry_after=int(os.getenv("SCAN_RETRY_AFTER", "1")),
+    max_frame_age=float(os.getenv("SCAN_MAX_FRAME_AGE", "5")))
+metrics.register("scan_admission", scan_admission.depth,
+                 "Scans running / waiting for an admission slot", label="state")
+metrics.register("scan_admission_total", lambda: dict(scan_admission.stats),
+                 "Scans admitted or shed, by reason", kind="counter", label="result")
+
+if face_pool is not None:
+    metrics.register("face_pool_pending", face_pool.depth, "Scans queued or running in the face pool")
+    metrics.register("face_pool_total", lambda: dict(face_pool.stats),
+                     "Face pool calls by outcome", kind="counter", label="result")
+metrics.describe("attendance_total", "counter", "Recognized scans by attendance outcome")
 
 # ============================================
 # 3. AUTHENTICATION & HELPERS
@@ -110,6 +228,34 @@ def admin_required(f):
     return decorated_function
 
 
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_latency(response):
+    # Streaming responses (SSE) are timed up to the first byte
+    started = g.pop('request_started', None)
+    if started is not None:
+        metrics.observe("http_request_seconds", time.perf_counter() - started,
+                        endpoint=request.endpoint or "unmatched", method=request.method,
+                        status=response.status_code)
+    return response
+
+
+# Scan endpoints echo the server clock so kiosks can send X-Frame-Timestamp
+# in server time (their own clock may be off by more than SCAN_MAX_FRAME_AGE)
+SCAN_ENDPOINTS = {"process_image", "process_batch"}
+
+
+@app.after_request
+def echo_server_time(response):
+    if request.endpoint in SCAN_ENDPOINTS:
+        response.headers['X-Server-Time'] = str(int(time.time() * 1000))
+    return response
+
+
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     # Redirect already logged-in admins to their dashboard
@@ -177,18 +323,23 @@ def register_page():
 @app.route('/admin/history')
 @admin_required
 def admin_history():
-    """Admin-only attendance history page"""
-    logs = list(collection.find().sort("created_at", -1))
+    """Admin-only attendance history page (first page, the rest via /api/admin/logs)"""
+    logs, next_cursor = attendance_history.page()
     for log in logs:
         log['id'] = str(log['_id'])
-    return render_template('admin_history.html', logs=logs, role=session.get('role'))
+    return render_template('admin_history.html', logs=logs, next_cursor=next_cursor,
+                           total_logs=collection.estimated_document_count(),
+                           role=session.get('role'))
 
 
 @app.route('/admin/database')
 @admin_required
 def admin_database():
     """Admin-only user database management page"""
-    users = list(users_collection.find().sort("nama", 1))
+    users = list(users_collection.find(
+        {}, {"nama": 1, "created_at": 1, "preview_etag": 1}).sort("nama", 1))
+    for user in users:
+        user['preview_url'] = preview_url(user)
     return render_template('admin_database.html', users=users, role=session.get('role'))
 
 # ============================================
@@ -201,8 +352,17 @@ def admin_database():
 def edit_user(id):
     new_nama = request.json.get('nama')
     try:
+        user = users_collection.find_one({"_id": ObjectId(id)}, {"nama": 1})
+        if user is None:
+            return jsonify({"status": "error", "message": "User not found"})
+        if new_nama != user.get('nama'):
+            # Gallery row keeps its id; only the name (and file name) change
+            renamed, msg = face_engine.rename_face(id, new_nama, name=user.get('nama'))
+            if not renamed:
+                return jsonify({"status": "error", "message": msg})
         users_collection.update_one({"_id": ObjectId(id)}, {
                                     "$set": {"nama": new_nama}})
+        attendance_cache.invalidate_user()
         return jsonify({"status": "success"})
     except Exception as e:
         print(f"Error editing user: {e}")
@@ -213,7 +373,12 @@ def edit_user(id):
 @admin_required
 def delete_user(id):
     try:
-        users_collection.delete_one({"_id": ObjectId(id)})
+        user = users_collection.find_one_and_delete({"_id": ObjectId(id)}, projection={"nama": 1})
+        if user is not None:
+            # Image file goes, gallery row is tombstoned in every worker
+            face_engine.remove_face(id, name=user.get('nama'))
+        preview_store.remove(str(ObjectId(id)))
+        attendance_cache.invalidate_user()
         return jsonify({"status": "success"})
     except Exception as e:
         print(f"Error deleting user: {e}")
@@ -230,15 +395,11 @@ def delete_all_users():
         # Delete all users from database
         users_collection.delete_many({})
 
-        # Delete all face encodings from known_faces directory
-        import shutil
-        known_faces_dir = "known_faces"
-        if os.path.exists(known_faces_dir):
-            shutil.rmtree(known_faces_dir)
-            os.makedirs(known_faces_dir)
-
-        # Reload face engine
-        face_engine.load_known_faces()
+        # Delete all face images + encodings; every worker picks this up
+        # through the shared gallery generation counter
+        face_engine.clear_faces()
+        preview_store.clear()
+        attendance_cache.invalidate_user()
 
         return jsonify({
             "status": "success",
@@ -253,11 +414,95 @@ def delete_all_users():
         }), 500
 
 
+def _run_bulk_enroll(job_id, archive_path, names_csv):
+    def progress(report):
+        import_jobs.update_one({"_id": job_id}, {"$set": {
+            "processed": report["failed"] + report["enrolled"] + report["skipped"]}})
+
+    try:
+        report = bulk_enroller.run(archive_path, names_csv=names_csv, on_progress=progress)
+        import_jobs.update_one({"_id": job_id}, {"$set": {
+            "status": "done", "report": report, "finished_at": datetime.now()}})
+        print(f"[Background] Bulk enroll {job_id}: {report['enrolled']} enrolled, "
+              f"{report['skipped']} skipped, {report['failed']} failed")
+    except Exception as e:
+        print(f"[Background] Bulk enroll {job_id} failed: {e}")
+        import_jobs.update_one({"_id": job_id}, {"$set": {
+            "status": "error", "error": str(e), "finished_at": datetime.now()}})
+    finally:
+        try:
+            os.remove(archive_path)
+            # New gallery generation is picked up by every worker; names changed
+            face_engine.refresh_gallery()
+            attendance_cache.invalidate_user()
+        finally:
+            bulk_enroll_lock.release()
+
+
+@app.route('/api/admin/bulk_enroll', methods=['POST'])
+@admin_required
+def bulk_enroll():
+    """Zip of photos (+ optional file,nama CSV) enrolled in the background; poll the job"""
+    archive = request.files.get('archive')
+    if archive is None:
+        return jsonify({"status": "error", "message": "No archive uploaded"}), 400
+    names = request.files.get('names')
+    names_csv = names.read() if names else None
+
+    if not bulk_enroll_lock.acquire(blocking=False):
+        return jsonify({"status": "error", "message": "A bulk enrollment is already running"}), 409
+    # From here the lock (and the temp archive) belong to the job thread;
+    # until it starts, any failure must give them back
+    archive_path = None
+    try:
+        fd, archive_path = tempfile.mkstemp(suffix=".zip", prefix="bulk-")
+        with os.fdopen(fd, "wb") as f:
+            archive.save(f)
+        if not zipfile.is_zipfile(archive_path):
+            os.remove(archive_path)
+            bulk_enroll_lock.release()
+            return jsonify({"status": "error", "message": "Archive must be a .zip file"}), 400
+
+        job_id = import_jobs.insert_one({
+            "status": "running", "file": archive.filename, "processed": 0,
+            "created_at": datetime.now()}).inserted_id
+        thread = threading.Thread(target=_run_bulk_enroll, args=(job_id, archive_path, names_csv))
+        thread.daemon = True
+        thread.start()
+    except Exception as e:
+        print(f"Error starting bulk enroll: {e}")
+        if archive_path and os.path.exists(archive_path):
+            os.remove(archive_path)
+        bulk_enroll_lock.release()
+        return jsonify({"status": "error", "message": str(e)}), 500
+    return jsonify({"status": "accepted", "job_id": str(job_id)}), 202
+
+
+@app.route('/api/admin/bulk_enroll/<job_id>')
+@admin_required
+def bulk_enroll_status(job_id):
+    try:
+        job = import_jobs.find_one({"_id": ObjectId(job_id)})
+    except Exception:
+        job = None
+    if job is None:
+        return jsonify({"status": "error", "message": "Job not found"}), 404
+    job["job_id"] = str(job.pop("_id"))
+    for key in ("created_at", "finished_at"):
+        if job.get(key):
+            job[key] = job[key].strftime("%Y-%m-%d %H:%M:%S")
+    return jsonify(job)
+
+
 @app.route('/api/admin/delete_log/<id>', methods=['POST'])
 @admin_required
 def delete_log(id):
     try:
-        collection.delete_one({"_id": ObjectId(id)})
+        deleted = collection.find_one_and_delete({"_id": ObjectId(id)})
+        if deleted:
+            attendance_cache.forget(deleted.get('nama'), deleted.get('tanggal'))
+            daily_rollup.remove(deleted.get('nama'), deleted.get('tanggal'))
+            attendance_feed.invalidate()
         return jsonify({"status": "success"})
     except Exception as e:
         print(f"Error deleting log: {e}")
@@ -269,6 +514,9 @@ def delete_log(id):
 def clear_logs():
     try:
         collection.delete_many({})
+        daily_rollup.clear()
+        attendance_cache.forget()
+        attendance_feed.invalidate()
         return jsonify({"status": "success"})
     except:
         return jsonify({"status": "error"})
@@ -278,51 +526,305 @@ def clear_logs():
 # ============================================
 
 
+def preview_url(user):
+    """Versioned /api/preview URL of a user document, None without a preview"""
+    etag = user.get("preview_etag")
+    if not etag:
+        return None
+    return url_for('user_preview', id=str(user["_id"]), v=etag[:16])
+
+
+@app.route('/api/preview/<id>')
+def user_preview(id):
+    """
+    Registration preview JPEG. Strong ETag (content SHA-1); URLs carrying
+    the matching ?v= are immutable, anything else revalidates.
+
+    Enrolled faces are personal data: served to admin sessions, or to
+    anyone holding the content token ?v= (handed out in scan results and
+    admin pages). Everything else is a 404, like an unknown id.
+    """
+    admin = session.get('role') == 'admin'
+    token = request.args.get('v')
+    if not admin and not token:
+        abort(404)
+    try:
+        user_id = ObjectId(id)
+    except Exception:
+        abort(404)
+    data = preview_store.get(str(user_id))
+    if data is None:
+        # Inline preview not migrated yet: move it to disk now
+        user = users_collection.find_one({"_id": user_id}, {"image_preview": 1})
+        if not user or not isinstance(user.get("image_preview"), str):
+            abort(404)
+        try:
+            data = preview_store.migrate_user(users_collection, user)
+        except ValueError:
+            abort(404)
+
+    etag = preview_etag(data)
+    if not admin and not hmac.compare_digest(token.encode('utf-8'), etag[:16].encode('ascii')):
+        abort(404)
+    response = Response(data, mimetype='image/jpeg')
+    response.set_etag(etag)
+    if token == etag[:16]:
+        response.headers['Cache-Control'] = 'private, max-age=31536000, immutable'
+    else:
+        response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+
+def record_attendance(status, message, nama):
+    """Dedup + save + Sheets for one recognition result, returns the JSON payload"""
+    if status == "rejected":
+        return rejected_payload(message)
+    if status == "error":
+        return {"status": "error", "message": message}
+
+    today_date = datetime.now().strftime("%Y-%m-%d")
+
+    with metrics.timer("stage_seconds", stage="attendance_dedup"):
+        # Repeat scans are answered from the in-memory present set
+        # (claim: concurrent scan of the same person in this worker, only one row)
+        claimed = not attendance_cache.is_present(nama, today_date) and \
+            attendance_cache.claim(nama, today_date)
+    if not claimed:
+        metrics.inc("attendance_total", result="already_present")
+        return {"status": "already_present", "nama": nama}
+
+    now = datetime.now()
+    u_id = f"ID-{(nama[:3]).upper()}"
+    doc = {
+        "nama": nama,
+        "tanggal": today_date,
+        "waktu": now.strftime("%H:%M:%S"),
+        "created_at": now
+    }
+    sheet_row = [now.strftime("%d-%m-%Y"), now.strftime("%H:%M:%S"), nama, u_id]
+
+    # A + B. Queue the MongoDB upsert and Sheets row for the batched writer
+    # (the unique nama+tanggal upsert keeps other workers from double-inserting)
+    with metrics.timer("stage_seconds", stage="attendance_submit"):
+        queued = attendance_writer.submit(doc, sheet_row)
+    if not queued:
+        # Writer backlog full: write synchronously instead
+        with metrics.timer("stage_seconds", stage="attendance_insert"):
+            inserted = attendance_cache.mark_present(nama, today_date, {
+                "waktu": doc["waktu"], "created_at": now})
+        if not inserted:
+            metrics.inc("attendance_total", result="already_present")
+            return {"status": "already_present", "nama": nama}
+        daily_rollup.add(nama, today_date)
+        log_to_sheets(nama, u_id)
+    metrics.inc("attendance_total", result="recorded" if queued else "recorded_sync")
+
+    # Push the new row to live log subscribers
+    attendance_feed.publish(nama, doc["waktu"], now)
+
+    # C. Get user image for frontend alert (LRU cached)
+    with metrics.timer("stage_seconds", stage="preview_lookup"):
+        user_info = attendance_cache.user_info(nama)
+    image_preview = preview_url(user_info) if user_info else None
+    user_id = str(user_info.get("_id")) if user_info else "N/A"
+    waktu = datetime.now().strftime("%H:%M:%S")
+
+    return {
+        "status": "success",
+        "nama": nama,
+        "image_preview": image_preview,
+        "waktu": waktu,
+        "user_id": user_id
+    }
+
+
+SHED_MESSAGES = {
+    "saturated": "Server busy, retrying shortly.",
+    "pool_busy": "Server busy, retrying shortly.",
+    "stale_frame": "Frame too old, send a new one.",
+}
+
+
+def frame_timestamp():
+    """
+    Capture time of the frame (X-Frame-Timestamp header or ?ts=, epoch ms)
+    in server time: kiosks correct their clock with the X-Server-Time echo
+    and send no timestamp (no age check) until they have an estimate.
+    """
+    return parse_frame_timestamp(request.headers.get('X-Frame-Timestamp') or request.args.get('ts'))
+
+
+def shed_response(overloaded):
+    """503 + Retry-After for saturation, 408 for stale frames"""
+    response = jsonify({"status": "error", "reason": overloaded.reason,
+                        "message": SHED_MESSAGES[overloaded.reason]})
+    response.status_code = 408 if overloaded.reason == "stale_frame" else 503
+    if overloaded.retry_after:
+        response.headers['Retry-After'] = str(overloaded.retry_after)
+    return response
+
+
+def rejected_payload(reason):
+    """Frame turned away by the quality gate: error + machine-readable reason code"""
+    return {"status": "error", "reason": reason, "message": QUALITY_REASONS.get(reason, reason)}
+
+
+def get_request_image():
+    """
+    Image payload of a scan/registration request, in any supported form:
+    raw body (Content-Type: image/jpeg, image/png, application/octet-stream),
+    multipart upload (file field "image"), or legacy JSON {"image": base64}.
+
+    Returns bytes for binary uploads (decoded without a base64 round-trip)
+    or the base64 string for JSON.
+    """
+    if request.mimetype.startswith('image/') or request.mimetype == 'application/octet-stream':
+        # Read the stream once, don't keep a second cached copy on the request
+        return request.get_data(cache=False)
+    if 'image' in request.files:
+        return request.files['image'].read()
+    return (request.get_json(silent=True) or {}).get('image')
+
+
+# Record every recognized face of a scan frame by default (?multi=0/1 per request)
+MULTI_FACE_SCAN = os.getenv("MULTI_FACE_SCAN", "False").lower() == "true"
+
+
+def request_option(name):
+    """Scan option from the query string, a multipart field or the JSON body"""
+    value = request.args.get(name)
+    if value is None and request.mimetype == 'multipart/form-data':
+        value = request.form.get(name)
+    if value is None and request.is_json:
+        value = (request.get_json(silent=True) or {}).get(name)
+    return value
+
+
+def multi_face_requested():
+    value = request_option('multi')
+    if value is None:
+        return MULTI_FACE_SCAN
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+def requested_face_box(img):
+    """
+    Face located by the kiosk's detector, as (top, right, bottom, left) in img
+    pixels: ?region=face when the upload is already a padded face crop, or
+    ?box=x,y,w,h in relative (0-1) coordinates of the uploaded frame, like
+    MediaPipe's boundingBox. None means full-frame detection.
+
+    Raises:
+        ValueError: on a malformed box.
+    """
+    region, box = request_option('region'), request_option('box')
+    if region != 'face' and box is None:
+        return None
+    height, width = img.shape[:2]
+    if region == 'face':
+        return (0, width, height, 0)
+    try:
+        x, y, w, h = (float(v) for v in (box.split(',') if isinstance(box, str) else box))
+    except (TypeError, ValueError):
+        raise ValueError("Invalid box (expected x,y,w,h)")
+    if not (w > 0 and h > 0 and -0.5 < x < 1 and -0.5 < y < 1 and x + w > 0 and y + h > 0):
+        raise ValueError("Invalid box (expected x,y,w,h)")
+    return (max(0, int(y * height)), min(width, int(round((x + w) * width))),
+            min(height, int(round((y + h) * height))), max(0, int(x * width)))
+
+
 @app.route('/api/process_image', methods=['POST'])
 def process_image():
-    """Public API - Face scanning for attendance"""
-    try:
-        data = request.json['image']
-        img = face_engine.process_base64_image(data)
-        status, message, nama = face_engine.recognize_face(img)
+    """
+    Public API - Face scanning for attendance.
+
+    With multi mode (?multi=1, "multi": true, or MULTI_FACE_SCAN) every
+    recognized face in the frame is recorded and the response carries one
+    process_image-shaped result per person in "results".
 
-        if status == "error":
-            return jsonify({"status": "error", "message": message})
+    Single scans may pass the kiosk's face box (?box= or ?region=face, see
+    requested_face_box): the server then only verifies and encodes that
+    region instead of running HOG on the whole frame.
 
-        today_date = datetime.now().strftime("%Y-%m-%d")
+    Admission controlled (see AdmissionController): 503 + Retry-After when
+    the worker is saturated, 408 for frames older than SCAN_MAX_FRAME_AGE.
+    """
+    try:
+        slots = scan_admission.acquire(captured_at=frame_timestamp())
+    except Overloaded as e:
+        return shed_response(e)
+    try:
+        data = get_request_image()
+        if not data:
+            return jsonify({"status": "error", "message": "No image provided"})
+        img = face_engine.decode_image(data)
+        if multi_face_requested():
+            status, message, names = face_engine.recognize_faces(img)
+            if status == "rejected":
+                return jsonify(dict(rejected_payload(message), results=[]))
+            if status == "error":
+                return jsonify({"status": "error", "message": message, "results": []})
+            return jsonify({"status": "success", "message": message,
+                            "results": [record_attendance(status, message, nama) for nama in names]})
+        status, message, nama = face_engine.recognize_face(img, face_box=requested_face_box(img))
+        return jsonify(record_attendance(status, message, nama))
+    except FacePoolBusy:
+        return shed_response(Overloaded("pool_busy", scan_admission.retry_after))
+    except Exception as e:
+        print(f"Error: {e}")
+        return jsonify({"status": "error", "message": str(e)})
+    finally:
+        scan_admission.release(slots)
 
-        # Check if already marked attendance today in MongoDB
-        existing_log = collection.find_one(
-            {"nama": nama, "tanggal": today_date})
-        if existing_log:
-            return jsonify({"status": "already_present", "nama": nama})
 
-        # A. Save to MongoDB
-        collection.insert_one({
-            "nama": nama,
-            "tanggal": today_date,
-            "waktu": datetime.now().strftime("%H:%M:%S"),
-            "created_at": datetime.now()
-        })
+# Max frames accepted by one /api/process_batch request
+MAX_BATCH_FRAMES = int(os.getenv("MAX_BATCH_FRAMES", "16"))
 
-        # B. Send to Google Sheets
-        u_id = f"ID-{(nama[:3]).upper()}"
-        log_to_sheets(nama, u_id)
 
-        # C. Get user image for frontend alert
-        user_info = users_collection.find_one(
-            {"nama": nama}, {"image_preview": 1, "_id": 1})
-        image_preview = user_info.get("image_preview") if user_info else None
-        user_id = str(user_info.get("_id")) if user_info else "N/A"
-        waktu = datetime.now().strftime("%H:%M:%S")
+@app.route('/api/process_batch', methods=['POST'])
+def process_batch():
+    """
+    Public API - Scan several frames (one or many kiosks) in one request.
 
-        return jsonify({
-            "status": "success",
-            "nama": nama,
-            "image_preview": image_preview,
-            "waktu": waktu,
-            "user_id": user_id
-        })
+    Body: {"frames": ["data:image/jpeg;base64,...", {"image": "...", "kiosk_id": "..."}]}
+    or multipart with repeated "frames" file fields (filename used as kiosk_id).
+    Returns per-frame results in order, each shaped like /api/process_image.
+    """
+    try:
+        if request.files:
+            frames = [{"image": f.read(), "kiosk_id": f.filename or None}
+                      for f in request.files.getlist('frames')]
+        else:
+            frames = request.json.get('frames') or []
+        if len(frames) > MAX_BATCH_FRAMES:
+            return jsonify({"status": "error",
+                            "message": f"Too many frames (max {MAX_BATCH_FRAMES})"}), 413
+
+        frames = [f if isinstance(f, dict) else {"image": f} for f in frames]
+        # One admission slot per frame
+        try:
+            slots = scan_admission.acquire(weight=len(frames), captured_at=frame_timestamp())
+        except Overloaded as e:
+            return shed_response(e)
+        try:
+            recognized = face_engine.recognize_batch([f.get('image') or "" for f in frames])
+        finally:
+            scan_admission.release(slots)
+
+        results = []
+        for frame, (status, message, nama) in zip(frames, recognized):
+            # Same dedup as process_image: a person seen in two frames of
+            # this batch is "success" once, then "already_present"
+            try:
+                result = record_attendance(status, message, nama)
+            except Exception as e:
+                print(f"Error: {e}")
+                result = {"status": "error", "message": str(e)}
+            if frame.get('kiosk_id') is not None:
+                result["kiosk_id"] = frame['kiosk_id']
+            results.append(result)
+
+        return jsonify({"status": "success", "results": results})
     except Exception as e:
         print(f"Error: {e}")
         return jsonify({"status": "error", "message": str(e)})
@@ -331,29 +833,34 @@ def process_image():
 @app.route('/api/register_face', methods=['POST'])
 def register_face():
     """Public API - Face registration"""
-    data = request.json
-    nama = data.get('nama')
-    img_data = data.get('image')
+    # Name comes from the JSON body, a multipart form field, or ?nama= for raw uploads
+    data = request.get_json(silent=True) or {}
+    nama = data.get('nama') or request.form.get('nama') or request.args.get('nama')
+    img_data = get_request_image()
+    if not nama or not img_data:
+        return jsonify({"status": "error", "message": "Name and image are required"})
+    # Base64 (legacy JSON) is decoded once; the engine and the preview
+    # share these bytes
+    try:
+        image_bytes = decode_data_uri(img_data) if isinstance(img_data, str) else img_data
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)})
 
-    # Register face with original image for face recognition
-    success, msg = face_engine.register_face(nama, img_data)
+    # Register face with original image for face recognition; the user id
+    # is the gallery entry's stable id (used by rename/delete)
+    user_id = ObjectId()
+    success, msg = face_engine.register_face(nama, image_bytes, face_id=str(user_id))
 
     if success:
-        # Compress image for database storage (preview only)
-        try:
-            compressed_image = compress_base64_image(
-                img_data, max_width=400, quality=85)
-            print(f"Image compressed successfully for {nama}")
-        except Exception as e:
-            print(f"Image compression failed, using original: {e}")
-            compressed_image = img_data
-
-        # Save to database with compressed image
+        # Save to database; the preview itself stays out of the document and
+        # is made after the response (preview_etag is set once it is stored)
         users_collection.insert_one({
+            "_id": user_id,
             "nama": nama,
             "created_at": datetime.now(),
-            "image_preview": compressed_image
+            "preview_etag": None
         })
+        preview_store.put_in_background(users_collection, user_id, image_bytes)
         return jsonify({"status": "success", "message": msg})
     return jsonify({"status": "error", "message": msg})
 
@@ -364,27 +871,160 @@ def register_face():
 
 @app.route('/api/today_log')
 def today_log():
-    """Get today's attendance logs - public access"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    query = {"tanggal": today}
-    logs = list(collection.find(query).sort("created_at", -1))
-    return jsonify([{"nama": l.get('nama', 'Unknown'), "waktu": l['waktu']} for l in logs])
+    """
+    Get today's attendance logs - public access.
+
+    Served from the in-memory feed with an ETag (If-None-Match -> 304).
+    With ?since=<created_at> only newer rows are returned, as
+    {"logs": [...], "since": <cursor for the next call>}; rows overlap a
+    little between calls, dedup by nama.
+    """
+    try:
+        since = parse_since(request.args.get('since'))
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    rows = attendance_feed.rows(since)
+    if since is None:
+        response = jsonify([{"nama": r['nama'], "waktu": r['waktu']} for r in rows])
+    else:
+        latest = max([r['created_at'] for r in rows if r['created_at']] + [since])
+        response = jsonify({"logs": [serialize_row(r) for r in rows], "since": latest.isoformat()})
+    response.add_etag()
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+# SSE stream length; EventSource reconnects (with Last-Event-ID) afterwards
+FEED_STREAM_SECONDS = int(os.getenv("FEED_STREAM_SECONDS", "300"))
+FEED_HEARTBEAT_SECONDS = 15
+
+
+def sse_event(event, data, event_id=None):
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+@app.route('/api/today_log/stream')
+def today_log_stream():
+    """
+    Server-Sent Events: an "attendance" event per new row of today's log
+    (id = created_at, so a reconnect resumes after the last row seen) and
+    "reset" when rows were deleted and the client should refetch.
+    Streams are capped per worker; over the cap the client gets 503 and
+    should fall back to polling /api/today_log?since=.
+    """
+    try:
+        since = parse_since(request.headers.get('Last-Event-ID') or request.args.get('since'))
+    except ValueError:
+        since = None
+    if not attendance_feed.subscribe():
+        return jsonify({"status": "error", "message": "Too many live streams"}), 503, \
+            {"Retry-After": "30"}
+
+    def generate():
+        try:
+            yield "retry: 3000\n\n"
+            attendance_feed.refresh()
+            seq, epoch = attendance_feed.cursor()
+            if since is not None:
+                for row in reversed(attendance_feed.rows(since)):
+                    yield sse_event("attendance", serialize_row(row), row['created_at'].isoformat())
+            deadline = time.monotonic() + FEED_STREAM_SECONDS
+            while time.monotonic() < deadline:
+                rows, seq, epoch, reset = attendance_feed.wait(seq, epoch, FEED_HEARTBEAT_SECONDS)
+                if reset:
+                    yield sse_event("reset", {})
+                for row in rows:
+                    created_at = row['created_at']
+                    yield sse_event("attendance", serialize_row(row),
+                                    created_at.isoformat() if created_at else None)
+                if not rows and not reset:
+                    yield ": ping\n\n"
+        finally:
+            attendance_feed.unsubscribe()
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.route('/api/admin/logs')
+@admin_required
+def admin_logs():
+    """
+    Admin-only attendance history, one page at a time (newest first).
+
+    Query: limit, cursor (next_cursor of the previous page),
+    date_from / date_to (YYYY-MM-DD, inclusive), nama (exact),
+    search (case-insensitive part of the name).
+    """
+    try:
+        logs, next_cursor = attendance_history.page(
+            limit=request.args.get('limit'),
+            cursor=request.args.get('cursor'),
+            date_from=request.args.get('date_from'),
+            date_to=request.args.get('date_to'),
+            nama=request.args.get('nama'),
+            search=request.args.get('search'))
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    return jsonify({"status": "success", "logs": [serialize_log(l) for l in logs],
+                    "next_cursor": next_cursor})
 
 
 @app.route('/api/admin/calendar_events')
 @admin_required
 def calendar_events():
-    """Admin-only calendar events"""
+    """
+    Admin-only calendar events for the visible range (FullCalendar start/end),
+    counts only; names are fetched per day from /api/admin/calendar_day.
+    """
     events = []
-    pipeline = [{"$group": {"_id": "$tanggal", "count": {"$sum": 1}, "details": {
-        "$push": {"nama": {"$ifNull": ["$nama", "Unknown"]}, "waktu": "$waktu"}}}}]
-    logs_grouped = list(collection.aggregate(pipeline))
-    for g in logs_grouped:
+    start, end = request.args.get('start'), request.args.get('end')
+    if not start or not end:
+        # Default to the last 6 weeks
+        end_date = datetime.now() + timedelta(days=1)
+        start = (end_date - timedelta(days=42)).strftime("%Y-%m-%d")
+        end = end_date.strftime("%Y-%m-%d")
+    try:
+        days = daily_rollup.counts(start, end)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    for g in days:
         events.append({"title": str(g['count']), "start": g['_id'], "extendedProps": {
-                      "is_admin": True, "count": g['count'], "users": g['details']}, "backgroundColor": "transparent", "borderColor": "transparent"})
+                      "is_admin": True, "count": g['count']}, "backgroundColor": "transparent", "borderColor": "transparent"})
     return jsonify(events)
 
 
+@app.route('/api/admin/calendar_day/<tanggal>')
+@admin_required
+def calendar_day(tanggal):
+    """Admin-only names and times of one calendar day"""
+    try:
+        users = attendance_history.day(tanggal)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    return jsonify({"status": "success", "tanggal": tanggal, "users": users})
+
+
+# ============================================
+# 9. MONITORING
+# ============================================
+# Optional bearer token for /metrics (unset = open, e.g. scraped on a private network)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus text format: stage/HTTP/Mongo latency histograms, queue depths, gallery size"""
+    if METRICS_TOKEN and request.headers.get('Authorization') != f"Bearer {METRICS_TOKEN}":
+        abort(401)
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
 if __name__ == '__main__':
     host = os.getenv("FLASK_HOST")
     port = os.getenv("FLASK_PORT")
@@ -0,0 +1,176 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+
+class AttendanceCache:
+    """
+    In-process cache in front of the attendance and user collections.
+
+    - A per-day set of names already present, so repeat scans of the same
+      person are answered without a MongoDB round-trip.
+    - A bounded LRU of user lookups (``_id`` + ``preview_etag``).
+
+    MongoDB stays the source of truth across workers: a unique index on
+    (nama, tanggal) plus an upsert means two workers can never both record
+    the same person for the same day, whatever their local sets contain.
+    The present set is re-warmed on the first call after midnight and every
+    ``refresh_seconds`` so admin deletions made in other workers show up.
+    """
+
+    def __init__(self, collection, users_collection, user_cache_size=1024,
+                 refresh_seconds=60, user_ttl_seconds=300):
+        self.collection = collection
+        self.users_collection = users_collection
+        self.user_cache_size = user_cache_size
+        self.refresh_seconds = refresh_seconds
+        self.user_ttl_seconds = user_ttl_seconds
+        self._lock = threading.Lock()
+        self._day = None
+        self._present = set()
+        self._warmed_at = 0.0
+        # Names claimed locally whose async write may not be in MongoDB yet
+        self._recent_claims = {}
+        self._users = OrderedDict()
+
+    # ============================================
+    # STARTUP
+    # ============================================
+
+    def ensure_indexes(self):
+        """Unique (nama, tanggal) index backing the upsert dedup"""
+        try:
+            self.collection.create_index(
+                [("nama", 1), ("tanggal", 1)], unique=True, name="nama_tanggal_unique")
+        except PyMongoError as e:
+            # e.g. old duplicate rows: dedup still works through the upsert filter
+            print(f"Failed to create attendance index: {e}")
+
+    def warm(self, today=None):
+        """Load today's present names from MongoDB (startup / midnight rollover)"""
+        today = today or datetime.now().strftime("%Y-%m-%d")
+        names = {
+            doc.get("nama") for doc in
+            self.collection.find({"tanggal": today}, {"nama": 1, "_id": 0})
+        }
+        with self._lock:
+            now = time.monotonic()
+            if self._day == today:
+                # Keep claims still in the writer's queue
+                self._recent_claims = {n: t for n, t in self._recent_claims.items()
+                                       if now - t < self.refresh_seconds}
+                names |= set(self._recent_claims)
+            else:
+                self._recent_claims = {}
+            self._day = today
+            self._present = names
+            self._warmed_at = now
+        return len(names)
+
+    def warm_in_background(self):
+        def run():
+            try:
+                self.ensure_indexes()
+                count = self.warm()
+                print(f"[Background] Attendance cache warmed ({count} present today)")
+            except Exception as e:
+                print(f"[Background] Attendance cache warm failed: {e}")
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    # ============================================
+    # ATTENDANCE
+    # ============================================
+
+    def _refresh_if_stale(self, today):
+        if self._day != today or time.monotonic() - self._warmed_at > self.refresh_seconds:
+            self.warm(today)
+
+    def is_present(self, nama, today):
+        """True when nama is already known to be present today (no DB access on a hit)"""
+        self._refresh_if_stale(today)
+        with self._lock:
+            return nama in self._present
+
+    def claim(self, nama, today):
+        """
+        Mark nama present in this worker before the (asynchronous) write.
+        Returns False if it already was, so concurrent scans in one worker
+        queue a single row.
+        """
+        with self._lock:
+            if self._day != today or nama in self._present:
+                return False
+            self._present.add(nama)
+            self._recent_claims[nama] = time.monotonic()
+            return True
+
+    def mark_present(self, nama, today, fields):
+        """
+        Record attendance with an upsert. Returns True if this call inserted
+        the row, False if another request/worker already had.
+        """
+        doc = {"nama": nama, "tanggal": today}
+        doc.update(fields)
+        try:
+            result = self.collection.update_one(
+                {"nama": nama, "tanggal": today}, {"$setOnInsert": doc}, upsert=True)
+            inserted = result.upserted_id is not None
+        except DuplicateKeyError:
+            # Concurrent upsert from another worker won the unique index race
+            inserted = False
+
+        with self._lock:
+            if self._day == today:
+                self._present.add(nama)
+        return inserted
+
+    def forget(self, nama=None, today=None):
+        """Drop one name (or everything) after logs are deleted"""
+        with self._lock:
+            if nama is None:
+                self._present = set()
+                self._recent_claims = {}
+            elif today is None or today == self._day:
+                self._present.discard(nama)
+                self._recent_claims.pop(nama, None)
+
+    # ============================================
+    # USER LOOKUPS
+    # ============================================
+
+    def user_info(self, nama):
+        """``{"_id", "preview_etag"}`` of a registered user, or None (LRU cached)"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._users.get(nama)
+            if cached is not None and cached[1] > now:
+                self._users.move_to_end(nama)
+                return cached[0]
+
+        info = self.users_collection.find_one(
+            {"nama": nama}, {"preview_etag": 1, "_id": 1})
+
+        with self._lock:
+            self._users[nama] = (info, now + self.user_ttl_seconds)
+            self._users.move_to_end(nama)
+            while len(self._users) > self.user_cache_size:
+                self._users.popitem(last=False)
+        return info
+
+    def invalidate_user(self, nama=None):
+        with self._lock:
+            if nama is None:
+                self._users.clear()
+            else:
+                self._users.pop(nama, None)
+
+    def stats(self):
+        with self._lock:
+            return {"day": self._day, "present": len(self._present), "users_cached": len(self._users)}
@@ -0,0 +1,216 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+class AttendanceFeed:
+    """
+    Today's attendance rows held in memory, with change notification for
+    the kiosk / dashboard live log.
+
+    - record_attendance publishes each new row here the moment it is
+      accepted, so subscribers in this worker see it immediately.
+    - Rows recorded by other workers are picked up by a cheap incremental
+      query (``created_at`` newer than the latest known row, minus
+      ``overlap_seconds`` for rows still in a writer's queue) at most every
+      ``poll_interval`` seconds, shared by all readers of the worker.
+    - The whole day is reloaded after midnight, after deletions and every
+      ``reload_seconds`` so deletions made in other workers show up.
+      A reload that drops rows bumps ``epoch`` so subscribers can reset.
+
+    Cursors handed to clients are ``created_at`` timestamps (valid on every
+    worker); responses overlap by ``overlap_seconds`` and clients dedup by
+    nama, which is unique per day.
+    """
+
+    def __init__(self, collection, poll_interval=2.0, reload_seconds=60,
+                 overlap_seconds=30, max_subscribers=8):
+        self.collection = collection
+        self.poll_interval = poll_interval
+        self.reload_seconds = reload_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.max_subscribers = max_subscribers
+        self._cond = threading.Condition()
+        self._refresh_lock = threading.Lock()
+        self._day = None
+        self._rows = []          # arrival order; seq = position in this list
+        self._names = set()
+        self._epoch = 0
+        self._loaded_at = 0.0
+        self._polled_at = None
+        self._reload_requested = False
+        self._subscribers = 0
+
+    # ============================================
+    # WRITE SIDE
+    # ============================================
+
+    def publish(self, nama, waktu, created_at):
+        """Add a row recorded by this worker and wake subscribers"""
+        today = created_at.strftime("%Y-%m-%d")
+        with self._cond:
+            if today == self._day and self._add(nama, waktu, created_at):
+                self._cond.notify_all()
+
+    def invalidate(self):
+        """Rows were deleted: reload on the next read"""
+        with self._cond:
+            self._reload_requested = True
+
+    def _add(self, nama, waktu, created_at):
+        if nama in self._names:
+            return False
+        self._names.add(nama)
+        self._rows.append({"nama": nama, "waktu": waktu, "created_at": created_at})
+        return True
+
+    # ============================================
+    # REFRESH FROM MONGODB
+    # ============================================
+
+    def refresh(self, today=None):
+        """Reload or poll if due; concurrent callers don't stack queries"""
+        today = today or datetime.now().strftime("%Y-%m-%d")
+        now = time.monotonic()
+        with self._cond:
+            reload_due = (self._day != today or self._reload_requested
+                          or now - self._loaded_at > self.reload_seconds)
+            poll_due = self._polled_at is None or now - self._polled_at > self.poll_interval
+        if not (reload_due or poll_due):
+            return
+        if not self._refresh_lock.acquire(blocking=self._day != today):
+            return
+        try:
+            if reload_due:
+                self._reload(today)
+            else:
+                self._poll(today)
+        finally:
+            self._refresh_lock.release()
+
+    def _query(self, today, after=None):
+        query = {"tanggal": today}
+        if after is not None:
+            query["created_at"] = {"$gt": after}
+        return list(self.collection.find(
+            query, {"_id": 0, "nama": 1, "waktu": 1, "created_at": 1}).sort("created_at", 1))
+
+    def _reload(self, today):
+        docs = self._query(today)
+        now = time.monotonic()
+        with self._cond:
+            names = {doc.get("nama", "Unknown") for doc in docs}
+            # Local rows newer than the overlap may still be in the writer's queue
+            cutoff = datetime.now() - self.overlap
+            dropped = {r["nama"] for r in self._rows
+                       if r["nama"] not in names and r["created_at"] < cutoff}
+            if self._day != today or dropped:
+                kept = [r for r in self._rows
+                        if self._day == today and r["nama"] not in names and r["nama"] not in dropped]
+                self._day = today
+                self._rows, self._names = [], set()
+                self._epoch += 1
+            else:
+                kept = []
+            # Same day, nothing deleted: existing rows keep their seq
+            for doc in docs:
+                self._add(doc.get("nama", "Unknown"), doc.get("waktu"), doc.get("created_at"))
+            for row in kept:
+                self._add(row["nama"], row["waktu"], row["created_at"])
+            self._loaded_at = self._polled_at = now
+            self._reload_requested = False
+            self._cond.notify_all()
+
+    def _poll(self, today):
+        with self._cond:
+            latest = max((r["created_at"] for r in self._rows if r["created_at"]), default=None)
+        after = latest - self.overlap if latest else None
+        docs = self._query(today, after)
+        with self._cond:
+            added = False
+            if self._day == today:
+                for doc in docs:
+                    added |= self._add(doc.get("nama", "Unknown"), doc.get("waktu"), doc.get("created_at"))
+            self._polled_at = time.monotonic()
+            if added:
+                self._cond.notify_all()
+
+    # ============================================
+    # READ SIDE
+    # ============================================
+
+    def rows(self, since=None):
+        """
+        Today's rows newest first, only those created after ``since``
+        (datetime) minus the overlap window when given.
+        """
+        self.refresh()
+        with self._cond:
+            rows = list(self._rows)
+        if since is not None:
+            after = since - self.overlap
+            rows = [r for r in rows if r["created_at"] and r["created_at"] > after]
+        return sorted(rows, key=lambda r: r["created_at"] or datetime.min, reverse=True)
+
+    def cursor(self):
+        """(seq, epoch) marking what a subscriber has seen so far"""
+        with self._cond:
+            return len(self._rows), self._epoch
+
+    def wait(self, seq, epoch, timeout):
+        """
+        Block until rows after ``seq`` exist, the epoch changes or
+        ``timeout`` passes. Returns (rows, seq, epoch, reset).
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self.refresh()
+            with self._cond:
+                if self._epoch != epoch:
+                    return [], len(self._rows), self._epoch, True
+                if len(self._rows) > seq:
+                    return self._rows[seq:], len(self._rows), epoch, False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return [], seq, epoch, False
+                self._cond.wait(min(remaining, self.poll_interval))
+
+    def subscribe(self):
+        """Reserve a stream slot; False when the worker is at max_subscribers"""
+        with self._cond:
+            if self._subscribers >= self.max_subscribers:
+                return False
+            self._subscribers += 1
+            return True
+
+    def unsubscribe(self):
+        with self._cond:
+            self._subscribers -= 1
+
+    def stats(self):
+        with self._cond:
+            return {"day": self._day, "rows": len(self._rows), "epoch": self._epoch,
+                    "subscribers": self._subscribers}
+
+
+def serialize_row(row):
+    created_at = row.get("created_at")
+    return {"nama": row.get("nama", "Unknown"), "waktu": row.get("waktu"),
+            "created_at": created_at.isoformat() if isinstance(created_at, datetime) else None}
+
+
+def parse_since(value):
+    """
+    ISO timestamp cursor from a client, None if absent; ValueError if
+    malformed. Offsets (``Z``, ``+07:00``) are converted to naive local
+    time, the way ``created_at`` is stored.
+    """
+    if not value:
+        return None
+    try:
+        since = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid since: {value}")
+    if since.tzinfo is not None:
+        since = since.astimezone().replace(tzinfo=None)
+    return since
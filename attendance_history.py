@@ -0,0 +1,151 @@
+import base64
+import json
+import re
+import threading
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+from pymongo.errors import PyMongoError
+
+# Only what the history table / calendar render
+LOG_PROJECTION = {"nama": 1, "tanggal": 1, "waktu": 1, "created_at": 1}
+
+
+class AttendanceHistory:
+    """
+    Read side of the attendance log for the admin dashboard.
+
+    History is served in pages with keyset (cursor) pagination on
+    (created_at, _id) descending: each page is one index range scan that
+    starts right after the last row of the previous page, so page 1000
+    costs the same as page 1 (no skip()). Date filters narrow the same
+    index range. Calendar day details are read per day on demand (the
+    per-day counts come from DailyRollup).
+    """
+
+    def __init__(self, collection, default_limit=50, max_limit=200):
+        self.collection = collection
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+
+    # ============================================
+    # STARTUP
+    # ============================================
+
+    def ensure_indexes(self):
+        """Indexes backing page() and day()"""
+        try:
+            self.collection.create_index(
+                [("created_at", -1), ("_id", -1)], name="created_at_id")
+            self.collection.create_index(
+                [("tanggal", 1), ("waktu", 1)], name="tanggal_waktu")
+        except PyMongoError as e:
+            print(f"Failed to create history indexes: {e}")
+
+    def ensure_indexes_in_background(self):
+        thread = threading.Thread(target=self.ensure_indexes)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    # ============================================
+    # HISTORY PAGES
+    # ============================================
+
+    def page(self, limit=None, cursor=None, date_from=None, date_to=None, nama=None, search=None):
+        """
+        One page of logs, newest first.
+
+        Args:
+            limit: rows per page (capped at max_limit)
+            cursor: ``next_cursor`` of the previous page
+            date_from, date_to: inclusive "YYYY-MM-DD" bounds
+            nama: exact name filter
+            search: case-insensitive substring of the name (search box)
+
+        Returns:
+            (logs, next_cursor): next_cursor is None on the last page.
+
+        Raises:
+            ValueError: on a malformed cursor, date or limit.
+        """
+        limit = min(max(int(limit or self.default_limit), 1), self.max_limit)
+
+        conditions = []
+        created_at = {}
+        if date_from:
+            created_at["$gte"] = parse_date(date_from)
+        if date_to:
+            created_at["$lt"] = parse_date(date_to) + timedelta(days=1)
+        if created_at:
+            conditions.append({"created_at": created_at})
+        if nama:
+            conditions.append({"nama": nama})
+        if search and search.strip():
+            conditions.append({"nama": {"$regex": re.escape(search.strip()), "$options": "i"}})
+        if cursor:
+            last_created_at, last_id = decode_cursor(cursor)
+            conditions.append({"$or": [
+                {"created_at": {"$lt": last_created_at}},
+                {"created_at": last_created_at, "_id": {"$lt": last_id}},
+            ]})
+
+        query = {"$and": conditions} if conditions else {}
+        # One extra row tells whether another page exists
+        logs = list(self.collection.find(query, LOG_PROJECTION)
+                    .sort([("created_at", -1), ("_id", -1)])
+                    .limit(limit + 1))
+
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_cursor(logs[-1])
+        return logs, next_cursor
+
+    # ============================================
+    # CALENDAR DAY DETAILS
+    # ============================================
+
+    def day(self, tanggal):
+        """Names and times present on one day (calendar click), by time"""
+        tanggal = parse_date(tanggal).strftime("%Y-%m-%d")
+        return [{"nama": log.get("nama", "Unknown"), "waktu": log.get("waktu")}
+                for log in self.collection.find(
+                    {"tanggal": tanggal}, {"_id": 0, "nama": 1, "waktu": 1}).sort("waktu", 1)]
+
+
+def serialize_log(log):
+    """JSON-safe history row"""
+    created_at = log.get("created_at")
+    return {
+        "id": str(log["_id"]),
+        "nama": log.get("nama", "Unknown"),
+        "tanggal": log.get("tanggal"),
+        "waktu": log.get("waktu"),
+        "created_at": created_at.isoformat() if isinstance(created_at, datetime) else None,
+    }
+
+
+def parse_date(value):
+    """'YYYY-MM-DD' (or an ISO timestamp from FullCalendar) -> midnight datetime"""
+    try:
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"Invalid date: {value}")
+
+
+def encode_cursor(log):
+    created_at = log.get("created_at")
+    payload = {"t": created_at.isoformat() if isinstance(created_at, datetime) else None,
+               "id": str(log["_id"])}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor, ValueError for anything malformed"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        created_at = datetime.fromisoformat(payload["t"]) if payload["t"] else None
+        return created_at, ObjectId(payload["id"])
+    except Exception:
+        raise ValueError("Invalid cursor")
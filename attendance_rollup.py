@@ -0,0 +1,134 @@
+import threading
+from datetime import datetime, timedelta
+
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from attendance_history import parse_date
+
+
+class DailyRollup:
+    """
+    One document per day (``_id`` = tanggal) holding the names present,
+    so the calendar reads a month as ~30 small documents instead of
+    grouping the whole attendance log.
+
+    Updates are ``$addToSet`` / ``$pull`` on ``members``, which makes them
+    idempotent: the attendance writer can replay a batch after a crash, and
+    a row re-submitted for an existing (nama, tanggal) changes nothing.
+    The count is ``$size`` of the member list at read time.
+
+    The startup rebuild runs once: it is claimed through a lock document
+    in the same collection (``_id`` REBUILD_LOCK, outside every date
+    range) that stays behind marked done, so only one gunicorn worker, on
+    any host, rebuilds. The claim expires after ``lock_seconds`` in case
+    its holder dies mid-rebuild.
+    """
+
+    REBUILD_LOCK = "_rebuild_lock"
+
+    def __init__(self, collection, log_collection, lock_seconds=600):
+        self.collection = collection
+        self.log_collection = log_collection
+        self.lock_seconds = lock_seconds
+
+    # ============================================
+    # UPDATES
+    # ============================================
+
+    def add_many(self, rows):
+        """Record (nama, tanggal) pairs present in the log"""
+        ops = [UpdateOne({"_id": tanggal}, {"$addToSet": {"members": nama}}, upsert=True)
+               for nama, tanggal in rows]
+        if ops:
+            self.collection.bulk_write(ops, ordered=False)
+
+    def add(self, nama, tanggal):
+        self.add_many([(nama, tanggal)])
+
+    def remove(self, nama, tanggal):
+        self.collection.update_one({"_id": tanggal}, {"$pull": {"members": nama}})
+
+    def clear(self):
+        self.collection.delete_many({})
+
+    def rebuild(self, merge=False):
+        """
+        Recompute every day from the log (migration / repair). Returns days
+        written. ``merge`` only adds members (no delete/replace), so rows
+        recorded by other workers while it runs are never dropped.
+        """
+        pipeline = [{"$group": {"_id": "$tanggal", "members": {"$addToSet": "$nama"}}}]
+        days = [day for day in self.log_collection.aggregate(pipeline) if day["_id"]]
+        if merge:
+            ops = [UpdateOne({"_id": day["_id"]}, {"$addToSet": {"members": {"$each": day["members"]}}},
+                             upsert=True) for day in days]
+        else:
+            ops = [ReplaceOne({"_id": day["_id"]}, {"members": day["members"]}, upsert=True)
+                   for day in days]
+            self.collection.delete_many({"_id": {"$ne": self.REBUILD_LOCK}})
+        if ops:
+            self.collection.bulk_write(ops, ordered=False)
+        return len(ops)
+
+    def claim_rebuild(self):
+        """
+        Take the cross-worker rebuild lock. False while another worker
+        holds it, or once the rebuild is done.
+        """
+        now = datetime.now()
+        try:
+            self.collection.find_one_and_update(
+                {"_id": self.REBUILD_LOCK, "done": {"$ne": True}, "expires_at": {"$lt": now}},
+                {"$set": {"expires_at": now + timedelta(seconds=self.lock_seconds)}},
+                upsert=True)
+            return True
+        except DuplicateKeyError:
+            return False
+
+    def rebuild_once(self):
+        """
+        First start after upgrading: build rollups for the existing log,
+        once across all workers. Returns days written, None when it was
+        already done or another worker is on it.
+        """
+        if not self.claim_rebuild():
+            return None
+        try:
+            built = self.rebuild(merge=True)
+        except Exception:
+            self.collection.delete_one({"_id": self.REBUILD_LOCK})
+            raise
+        self.collection.update_one({"_id": self.REBUILD_LOCK},
+                                   {"$set": {"done": True}, "$unset": {"expires_at": ""}})
+        return built
+
+    def rebuild_once_in_background(self):
+        """rebuild_once() off the import path (every worker calls this)"""
+        def run():
+            try:
+                built = self.rebuild_once()
+                if built is not None:
+                    print(f"[Background] Built {built} daily rollups")
+            except PyMongoError as e:
+                print(f"[Background] Daily rollup rebuild failed: {e}")
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    # ============================================
+    # READS
+    # ============================================
+
+    def counts(self, start, end):
+        """``[{"_id": tanggal, "count": n}]`` for ``start <= tanggal < end``"""
+        pipeline = [
+            {"$match": {"_id": {"$gte": parse_date(start).strftime("%Y-%m-%d"),
+                                "$lt": parse_date(end).strftime("%Y-%m-%d")}}},
+            {"$project": {"count": {"$size": "$members"}}},
+            {"$match": {"count": {"$gt": 0}}},
+            {"$sort": {"_id": 1}},
+        ]
+        return list(self.collection.aggregate(pipeline))
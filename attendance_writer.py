@@ -0,0 +1,384 @@
+import glob
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process dev server, no spool sharing
+    fcntl = None
+
+
+class AttendanceWriter:
+    """
+    Background writer for attendance rows (MongoDB + Google Sheets).
+
+    Requests only append to a local spool file and a bounded queue. One
+    worker thread drains the queue and flushes when ``batch_size`` rows are
+    waiting or ``flush_interval`` seconds have passed:
+
+    1. MongoDB: one ``bulk_write`` of (nama, tanggal) upserts. Each row's
+       ``_id`` is its record id, so the rows this writer inserted are the
+       upserted ids, and replaying the spool after a crash never duplicates.
+       The daily rollup is updated afterwards, best effort: a rollup error
+       is logged and never holds back the batch (``rebuild()`` repairs it).
+    2. Sheets: one ``append_rows`` with the rows MongoDB actually inserted.
+       A replayed row whose ``_id`` is already in MongoDB was inserted
+       before the crash, so it still goes to Sheets unless the spool
+       recorded it as sent.
+
+    Failures are retried with exponential backoff. Every stage is recorded
+    in the spool (``spool_dir/attendance-<pid>.jsonl``), so rows that were
+    not written yet survive a restart; spools left by dead workers are
+    adopted by the next writer that starts.
+    """
+
+    def __init__(self, collection, get_sheet=None, on_sheets_error=None, spool_dir="spool",
+                 batch_size=100, flush_interval=2.0, max_queue=10000,
+                 max_backoff=60.0, compact_every=1000, rollup=None):
+        self.collection = collection
+        self.rollup = rollup
+        self.get_sheet = get_sheet
+        self.on_sheets_error = on_sheets_error
+        self.spool_dir = spool_dir
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_backoff = max_backoff
+        self.compact_every = compact_every
+        # Bounds everything in flight (queued + awaiting retry), not just the queue
+        self.max_queue = max_queue
+        self.queue = queue.Queue()
+
+        self._lock = threading.Lock()
+        self._records = {}            # id -> record not fully written yet
+        self._mongo_pending = []      # ids waiting for the MongoDB stage
+        self._sheets_pending = []     # ids inserted in MongoDB, waiting for Sheets
+        self._replayed = set()        # recovered ids that may have reached MongoDB already
+        self._mongo_retry_at = 0.0
+        self._sheets_retry_at = 0.0
+        self._mongo_failures = 0
+        self._sheets_failures = 0
+        self._spool_lines = 0
+        self._spool = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self.stats = {"submitted": 0, "mongo_written": 0, "sheets_written": 0,
+                      "mongo_errors": 0, "sheets_errors": 0, "rollup_errors": 0, "recovered": 0}
+
+    # ============================================
+    # LIFECYCLE
+    # ============================================
+
+    def start(self):
+        """Open this process' spool, adopt orphaned spools, start the worker thread"""
+        if self._thread is not None:
+            return self
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self._open_spool()
+        self._recover()
+        self._rewrite_spool()
+
+        self._thread = threading.Thread(target=self._run, name="attendance-writer")
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=10.0):
+        """Flush what can be flushed and stop the worker thread"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ============================================
+    # SUBMIT (request thread)
+    # ============================================
+
+    def submit(self, doc, sheet_row=None):
+        """
+        Queue one attendance document. Returns False when the queue is full
+        (the caller should write synchronously instead).
+        """
+        # The record id doubles as the row's _id, so an insert can be matched
+        # back to its record from the upserted ids alone
+        record = {"id": str(ObjectId()), "doc": doc, "sheet_row": sheet_row}
+        with self._lock:
+            if len(self._records) >= self.max_queue:
+                return False
+            self._append_spool({"op": "add", "record": _encode(record)})
+            self._records[record["id"]] = record
+            self.stats["submitted"] += 1
+        self.queue.put_nowait(record["id"])
+        if self.queue.qsize() >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def depth(self):
+        """Rows accepted but not yet written to MongoDB / Sheets"""
+        with self._lock:
+            return {"queue": self.queue.qsize(), "mongo": len(self._mongo_pending),
+                    "sheets": len(self._sheets_pending)}
+
+    # ============================================
+    # WORKER THREAD
+    # ============================================
+
+    def _run(self):
+        while True:
+            # Size trigger (submit sets _wake) or time trigger, whichever first
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            stopping = self._stop.is_set()
+            self.flush(force=stopping)
+            if stopping:
+                return
+
+    def flush(self, force=False):
+        """Drain the queue and run both stages (respecting backoff unless force=True)"""
+        while True:
+            try:
+                record_id = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._mongo_pending.append(record_id)
+
+        while self._mongo_pending and (force or time.monotonic() >= self._mongo_retry_at):
+            if not self._flush_mongo():
+                break
+        while self._sheets_pending and (force or time.monotonic() >= self._sheets_retry_at):
+            if not self._flush_sheets():
+                break
+        if self._spool_lines >= self.compact_every:
+            with self._lock:
+                self._rewrite_spool()
+
+    def _flush_mongo(self):
+        with self._lock:
+            ids = self._mongo_pending[:self.batch_size]
+            records = [self._records[i] for i in ids]
+        ops = [UpdateOne({"nama": r["doc"]["nama"], "tanggal": r["doc"]["tanggal"]},
+                         {"$setOnInsert": dict(r["doc"], _id=ObjectId(r["id"]))}, upsert=True)
+               for r in records]
+        try:
+            try:
+                result = self.collection.bulk_write(ops, ordered=False)
+                upserted = result.upserted_ids or {}
+            except Exception as e:
+                upserted = _upserted_from_error(e)
+                if upserted is None:
+                    raise
+            upserted_ids = set(upserted.values())
+            inserted = [i for i in ids if ObjectId(i) in upserted_ids]
+            # Replayed rows not upserted now may have been inserted before the crash
+            replayed = [ObjectId(i) for i in ids if i in self._replayed and i not in inserted]
+            if replayed:
+                existing = {doc["_id"] for doc in
+                            self.collection.find({"_id": {"$in": replayed}}, {"_id": 1})}
+                inserted = [i for i in ids if i in inserted or ObjectId(i) in existing]
+        except Exception as e:
+            self._mongo_failures += 1
+            self.stats["mongo_errors"] += 1
+            self._mongo_retry_at = time.monotonic() + self._backoff(self._mongo_failures)
+            print(f"[Background] Mongo batch failed ({len(ops)} rows), retrying: {e}")
+            return False
+
+        with self._lock:
+            self._append_spool({"op": "mongo", "ids": ids, "inserted": inserted})
+            del self._mongo_pending[:len(ids)]
+            for record_id in ids:
+                if record_id not in inserted or self._records[record_id]["sheet_row"] is None:
+                    self._records.pop(record_id, None)
+            self._sheets_pending.extend(
+                i for i in inserted if i in self._records)
+            self._replayed.difference_update(ids)
+        self._mongo_failures = 0
+        self.stats["mongo_written"] += len(inserted)
+        self._update_rollup(records)
+        return True
+
+    def _update_rollup(self, records):
+        """Best effort: the log rows are committed, a rollup miss is repaired by rebuild()"""
+        if self.rollup is None:
+            return
+        try:
+            # Every (nama, tanggal) of the batch now exists in the log
+            self.rollup.add_many((r["doc"]["nama"], r["doc"]["tanggal"]) for r in records)
+        except Exception as e:
+            self.stats["rollup_errors"] += 1
+            print(f"[Background] Daily rollup update failed ({len(records)} rows): {e}")
+
+    def _flush_sheets(self):
+        if self.get_sheet is None:
+            with self._lock:
+                for record_id in self._sheets_pending:
+                    self._records.pop(record_id, None)
+                self._sheets_pending = []
+            return True
+        with self._lock:
+            ids = self._sheets_pending[:self.batch_size]
+            rows = [self._records[i]["sheet_row"] for i in ids]
+        try:
+            sheet = self.get_sheet()
+            if sheet is None:
+                raise RuntimeError("Sheets client unavailable")
+            sheet.append_rows(rows)
+        except Exception as e:
+            self._sheets_failures += 1
+            self.stats["sheets_errors"] += 1
+            self._sheets_retry_at = time.monotonic() + self._backoff(self._sheets_failures)
+            print(f"[Background] Sheets batch failed ({len(rows)} rows), retrying: {e}")
+            if self.on_sheets_error is not None:
+                self.on_sheets_error()
+            return False
+
+        with self._lock:
+            self._append_spool({"op": "sheets", "ids": ids})
+            del self._sheets_pending[:len(ids)]
+            for record_id in ids:
+                self._records.pop(record_id, None)
+        self._sheets_failures = 0
+        self.stats["sheets_written"] += len(ids)
+        print(f"[Background] Logged {len(ids)} rows to Sheets")
+        return True
+
+    def _backoff(self, failures):
+        return min(self.max_backoff, self.flush_interval * (2 ** (failures - 1)))
+
+    # ============================================
+    # SPOOL
+    # ============================================
+
+    def _open_spool(self):
+        """Open and lock this process' spool (a live namesake on a shared dir gets a suffix)"""
+        suffix = ""
+        for attempt in range(100):
+            path = os.path.join(self.spool_dir, f"attendance-{os.getpid()}{suffix}.jsonl")
+            spool = open(path, "a+", encoding="utf-8")
+            # Held for the life of the process: marks this spool as owned
+            if _try_lock(spool):
+                self._spool, self._spool_path = spool, path
+                return
+            spool.close()
+            suffix = f"-{attempt + 1}"
+        raise RuntimeError("No free attendance spool file")
+
+    def _append_spool(self, entry):
+        if self._spool is None:
+            return
+        self._spool.write(json.dumps(entry) + "\n")
+        self._spool.flush()
+        self._spool_lines += 1
+
+    def _rewrite_spool(self):
+        """Compact the spool down to the rows still in flight"""
+        if self._spool is None:
+            return
+        self._spool.seek(0)
+        self._spool.truncate()
+        for record_id, record in self._records.items():
+            self._spool.write(json.dumps({"op": "add", "record": _encode(record)}) + "\n")
+        if self._sheets_pending:
+            self._spool.write(json.dumps(
+                {"op": "mongo", "ids": list(self._sheets_pending), "inserted": list(self._sheets_pending)}) + "\n")
+        self._spool.flush()
+        os.fsync(self._spool.fileno())
+        self._spool_lines = 0
+
+    def _recover(self):
+        """
+        Replay this process' spool and any spool whose owner process is gone.
+        Every spool is read under its lock (ours is already held).
+        """
+        for path in sorted(glob.glob(os.path.join(self.spool_dir, "attendance-*.jsonl"))):
+            if path == self._spool_path:
+                self._spool.seek(0)
+                self._replay(self._spool)
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                if not _try_lock(f):
+                    continue  # owned by a live worker
+                self._replay(f)
+                # Removed while still locked so no other worker adopts it too
+                os.remove(path)
+        if self.stats["recovered"]:
+            print(f"[Background] Recovered {self.stats['recovered']} attendance rows from spool")
+
+    def _replay(self, f):
+        records, sheets_pending = _read_spool(f)
+        for record_id, record in records.items():
+            self._records[record_id] = record
+            if record_id in sheets_pending:
+                self._sheets_pending.append(record_id)
+            else:
+                self._mongo_pending.append(record_id)
+                self._replayed.add(record_id)
+        self.stats["recovered"] += len(records)
+
+
+def _read_spool(f):
+    """Replay a spool file: returns (records still in flight, ids only missing Sheets)"""
+    records = {}
+    sheets_pending = set()
+    for line in f:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # torn last line from a crash
+        if entry["op"] == "add":
+            record = _decode(entry["record"])
+            records[record["id"]] = record
+        elif entry["op"] == "mongo":
+            for record_id in entry["ids"]:
+                if record_id not in entry["inserted"] or \
+                        records.get(record_id, {}).get("sheet_row") is None:
+                    records.pop(record_id, None)
+            sheets_pending.update(entry["inserted"])
+        elif entry["op"] == "sheets":
+            for record_id in entry["ids"]:
+                records.pop(record_id, None)
+    return records, sheets_pending & set(records)
+
+
+def _try_lock(f):
+    """True when no live process holds the spool's lock (lock kept until close)"""
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _upserted_from_error(error):
+    """
+    A BulkWriteError where every failure is a duplicate key (another worker
+    inserted the same person first) still succeeded for the rest of the batch.
+    """
+    details = getattr(error, "details", None)
+    if not details or any(e.get("code") != 11000 for e in details.get("writeErrors", [])):
+        return None
+    return {u["index"]: u["_id"] for u in details.get("upserted", [])}
+
+
+def _encode(record):
+    doc = dict(record["doc"])
+    if isinstance(doc.get("created_at"), datetime):
+        doc["created_at"] = {"$date": doc["created_at"].isoformat()}
+    return dict(record, doc=doc)
+
+
+def _decode(record):
+    doc = dict(record["doc"])
+    if isinstance(doc.get("created_at"), dict):
+        doc["created_at"] = datetime.fromisoformat(doc["created_at"]["$date"])
+    return dict(record, doc=doc)
@@ -0,0 +1,264 @@
+import argparse
+import csv
+import hashlib
+import io
+import multiprocessing
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+
+from embedding_store import EmbeddingStore
+from face_engine import decode_rgb, encode_single_face, gallery_jpeg
+from face_pool import preload_models
+from utils import compress_image_to_jpeg
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+class BulkEnroller:
+    """
+    Enroll a whole directory or zip of photos in one pass.
+
+    - Photos already enrolled (same content SHA-1, kept as ``source_sha1``
+      on the ``daftar_wajah`` document) and duplicates inside the batch
+      are skipped before any decoding.
+    - Decode + detect + encode + gallery JPEG + preview compression run in
+      a spawned process pool over every core (same rules as register_face:
+      exactly one face per photo).
+    - Results are written in bulk: gallery files plus one locked
+      EmbeddingStore save (one generation bump, so every worker re-maps the
+      gallery once), previews, and one ``bulk_write`` upserting the user
+      documents by nama (re-enrolling a name replaces its face).
+    """
+
+    def __init__(self, known_faces_dir, users_collection, preview_store, workers=None):
+        self.known_faces_dir = known_faces_dir
+        self.users_collection = users_collection
+        self.preview_store = preview_store
+        self.workers = workers or os.cpu_count() or 1  # 1 = in-process
+
+    def run(self, source, names_csv=None, on_progress=None):
+        """
+        Enroll every photo in ``source`` (directory or .zip).
+
+        Args:
+            names_csv: optional CSV of ``file,nama`` rows (file = name or
+                relative path inside the source); otherwise nama is the
+                file name without extension.
+            on_progress: called with the partial report after each photo.
+
+        Returns:
+            Report dict: counts, per-image failures and throughput.
+        """
+        started = time.perf_counter()
+        self.users_collection.create_index("source_sha1", name="source_sha1")
+        names = load_name_mapping(names_csv) if names_csv else {}
+        report = {"total": 0, "enrolled": 0, "skipped": 0, "failed": 0,
+                  "failures": [], "skipped_files": []}
+
+        # 1. Read + hash, skip already-enrolled and duplicate photos
+        photos = []
+        for entry, data in iter_photos(source):
+            report["total"] += 1
+            nama = names.get(entry) or names.get(os.path.basename(entry)) or \
+                os.path.splitext(os.path.basename(entry))[0]
+            if not valid_name(nama):
+                fail(report, entry, f"Invalid name: {nama!r}")
+                continue
+            photos.append({"file": entry, "nama": nama, "data": data,
+                           "sha1": hashlib.sha1(data).hexdigest()})
+
+        enrolled = {doc["source_sha1"] for doc in self.users_collection.find(
+            {"source_sha1": {"$in": [p["sha1"] for p in photos]}}, {"source_sha1": 1})}
+        pending, seen, seen_names = [], set(), set()
+        for photo in photos:
+            if photo["sha1"] in enrolled or photo["sha1"] in seen:
+                report["skipped"] += 1
+                report["skipped_files"].append(photo["file"])
+            elif photo["nama"] in seen_names:
+                fail(report, photo["file"], f"Duplicate name in batch: {photo['nama']}")
+            else:
+                seen.add(photo["sha1"])
+                seen_names.add(photo["nama"])
+                pending.append(photo)
+
+        # 2. Detect + encode across all cores
+        prepared = []
+        if pending:
+            with self._executor(len(pending)) as map_fn:
+                results = map_fn(prepare_photo, [p["data"] for p in pending])
+                for photo, (result, error) in zip(pending, results):
+                    photo.pop("data")
+                    if error:
+                        fail(report, photo["file"], error)
+                    else:
+                        photo.update(result)
+                        prepared.append(photo)
+                    if on_progress:
+                        on_progress(report)
+
+        # 3. Bulk writes
+        if prepared:
+            self._write(prepared, report)
+
+        seconds = time.perf_counter() - started
+        report["seconds"] = round(seconds, 3)
+        report["images_per_second"] = round(report["total"] / seconds, 2) if seconds else None
+        return report
+
+    @contextmanager
+    def _executor(self, pending):
+        # workers=1 stays in-process (no spawn, e.g. under the dev server)
+        if self.workers <= 1:
+            yield map
+            return
+        with ProcessPoolExecutor(max_workers=min(self.workers, pending),
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=preload_models) as executor:
+            chunksize = max(1, pending // (self.workers * 4))
+            yield lambda fn, items: executor.map(fn, items, chunksize=chunksize)
+
+    def _write(self, prepared, report):
+        existing = {doc["nama"]: doc["_id"] for doc in self.users_collection.find(
+            {"nama": {"$in": [p["nama"] for p in prepared]}}, {"nama": 1})}
+        for photo in prepared:
+            photo["user_id"] = existing.get(photo["nama"]) or ObjectId()
+
+        # Gallery: every file + encoding under one lock, one save
+        store = EmbeddingStore(self.known_faces_dir)
+        with store.locked():
+            store.load()
+            for photo in prepared:
+                filename = f"{photo['nama']}.jpg"
+                path = os.path.join(self.known_faces_dir, filename)
+                with open(path, "wb") as f:
+                    f.write(photo["gallery_jpeg"])
+                store.put(filename, path, photo["nama"], photo["encoding"],
+                          face_id=str(photo["user_id"]))
+            store.save()
+
+        now = datetime.now()
+        ops = []
+        for photo in prepared:
+            user_id = photo["user_id"]
+            try:
+                etag = self.preview_store.put(str(user_id), photo["preview"])
+            except OSError as e:
+                print(f"Preview not saved for {photo['nama']}: {e}")
+                etag = None
+            ops.append(UpdateOne(
+                {"nama": photo["nama"]},
+                {"$set": {"preview_etag": etag, "source_sha1": photo["sha1"]},
+                 "$setOnInsert": {"_id": user_id, "created_at": now}},
+                upsert=True))
+        self.users_collection.bulk_write(ops, ordered=False)
+        report["enrolled"] += len(prepared)
+        report["enrolled_names"] = [p["nama"] for p in prepared]
+
+
+def prepare_photo(data):
+    """
+    Pool process: decode once, detect/encode exactly one face, and build
+    the gallery JPEG (the photo itself when possible) and the preview.
+    Returns (result, None) or (None, error).
+    """
+    try:
+        img_rgb = decode_rgb(data)
+        encoding, error = encode_single_face(img_rgb)
+        if error:
+            return None, error
+        try:
+            preview = compress_image_to_jpeg(data, max_width=400, quality=85)
+        except ValueError:
+            preview = data
+        return {"encoding": encoding, "gallery_jpeg": gallery_jpeg(data, img_rgb),
+                "preview": preview}, None
+    except Exception as e:
+        return None, str(e)
+
+
+def iter_photos(source):
+    """(relative path, bytes) for every image in a directory tree or zip archive"""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in sorted(archive.infolist(), key=lambda i: i.filename):
+                if not info.is_dir() and is_image(info.filename):
+                    yield info.filename, archive.read(info)
+        return
+    if not os.path.isdir(source):
+        raise ValueError(f"Not a directory or zip archive: {source}")
+    for root, _, files in sorted(os.walk(source)):
+        for filename in sorted(files):
+            if is_image(filename):
+                path = os.path.join(root, filename)
+                with open(path, "rb") as f:
+                    yield os.path.relpath(path, source).replace(os.sep, "/"), f.read()
+
+
+def is_image(filename):
+    basename = os.path.basename(filename)
+    return basename.lower().endswith(IMAGE_EXTENSIONS) and not basename.startswith(".")
+
+
+def load_name_mapping(path_or_bytes):
+    """``file,nama`` CSV (header row optional) -> {file: nama}"""
+    if isinstance(path_or_bytes, bytes):
+        text = path_or_bytes.decode("utf-8-sig")
+    else:
+        with open(path_or_bytes, "r", encoding="utf-8-sig") as f:
+            text = f.read()
+    mapping = {}
+    for row in csv.reader(io.StringIO(text)):
+        if len(row) < 2 or not row[0].strip():
+            continue
+        file, nama = row[0].strip(), row[1].strip()
+        if file.lower() in ("file", "filename", "foto", "photo") and not mapping:
+            continue
+        mapping[file] = nama
+    return mapping
+
+
+def valid_name(nama):
+    """Names become gallery file names: no path separators or hidden files"""
+    return bool(nama) and "/" not in nama and "\\" not in nama and not nama.startswith(".")
+
+
+def fail(report, entry, error):
+    report["failed"] += 1
+    report["failures"].append({"file": entry, "error": error})
+
+
+# ============================================
+# CLI
+# ============================================
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    from pymongo import MongoClient
+    from preview_store import PreviewStore
+
+    parser = argparse.ArgumentParser(description="Bulk-enroll a directory or zip of face photos")
+    parser.add_argument("source", help="directory or .zip of photos")
+    parser.add_argument("--names", help="CSV of file,nama rows (default: file name = nama)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--known-faces", default="known_faces")
+    args = parser.parse_args()
+
+    load_dotenv()
+    users = MongoClient(os.getenv("MONGO_URI"))['db_absensi']['daftar_wajah']
+    os.makedirs(args.known_faces, exist_ok=True)
+    enroller = BulkEnroller(args.known_faces, users,
+                            PreviewStore(os.getenv("PREVIEW_DIR", "previews")), workers=args.workers)
+    report = enroller.run(args.source, names_csv=args.names)
+
+    for failure in report["failures"]:
+        print(f"FAILED  {failure['file']}: {failure['error']}")
+    print(f"--- {report['total']} photos: {report['enrolled']} enrolled, {report['skipped']} already "
+          f"enrolled, {report['failed']} failed in {report['seconds']} s "
+          f"({report['images_per_second']} images/s) ---")
@@ -0,0 +1,522 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import uuid
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process dev server, no locking needed
+    fcntl = None
+
+
+class EmbeddingStore:
+    """
+    Persistent cache of face encodings for the images in known_faces.
+
+    Encodings live in one float32 matrix (``.embeddings.npy``) next to a JSON
+    index (``.embeddings.json``) mapping each image file to its matrix row,
+    content hash and mtime. On startup the matrix is memory-mapped in a single
+    call and only images that are new or changed need to be re-encoded.
+
+    The matrix file doubles as the gallery segment shared by every gunicorn
+    worker: all of them map it read-only, writers serialise on a flock, and a
+    generation counter (``.embeddings.gen``, itself mmapped) is bumped on
+    every save so the other workers know to look again. The file is
+    preallocated (its capacity doubles when full) and the index records how
+    many rows are in use, so a save writes only the appended rows, in place;
+    workers keep their mapping and just see more rows. Existing rows never
+    move: removed or overwritten rows stay behind as tombstones (no entry
+    points at them) until ``save(compact=True)``.
+    ``epoch`` is a token that only changes when rows move (compaction), so
+    readers can extend their index and tombstone rows incrementally instead
+    of rebuilding it.
+
+    Index changes (new, removed, renamed entries) are appended to a change
+    log (``.embeddings.log``), one JSON line per save, and ``load()`` only
+    reads the lines added since it last ran. The JSON index is rewritten
+    (and the log started over) on compaction and once the log has more
+    lines than the index has entries, so a save costs O(changed entries)
+    amortised instead of a rewrite of every entry.
+
+    Entries may carry a stable ``id`` (the user's id) that survives renames;
+    ``find()`` looks it up in an in-memory id -> file map.
+    """
+
+    MATRIX_FILE = ".embeddings.npy"
+    INDEX_FILE = ".embeddings.json"
+    GENERATION_FILE = ".embeddings.gen"
+    LOCK_FILE = ".embeddings.lock"
+    LOG_FILE = ".embeddings.log"
+    VERSION = 1
+    MIN_CAPACITY = 64
+    MIN_LOG_LINES = 256
+
+    def __init__(self, directory, dim=128):
+        self.directory = directory
+        self.dim = dim
+        self.matrix_path = os.path.join(directory, self.MATRIX_FILE)
+        self.index_path = os.path.join(directory, self.INDEX_FILE)
+        self.generation_path = os.path.join(directory, self.GENERATION_FILE)
+        self.lock_path = os.path.join(directory, self.LOCK_FILE)
+        self.log_path = os.path.join(directory, self.LOG_FILE)
+        self.entries = {}
+        self.matrix = np.empty((0, dim), dtype=np.float32)
+        self.epoch = None
+        self._by_id = {}          # stable id -> file name
+        self._pending = {}
+        self._changed = set()     # file names added/changed/removed since load()
+        self._generation = None
+        self._map = None          # whole preallocated matrix file (read-only mmap)
+        self._map_key = None      # identity of the mapped file, remapped when replaced
+        self._rows = 0
+        self._index_key = None    # identity of the index file this state was loaded from
+        self._log_id = None       # token tying the change log to that index
+        self._log_offset = 0      # bytes of the log applied so far
+        self._log_lines = 0
+        self._replayed = set()    # file names the last log replay touched
+        self.dirty = False
+
+    # ============================================
+    # LOAD / SAVE
+    # ============================================
+
+    def load(self):
+        """
+        Bring the store up to date with disk (unsaved changes are dropped).
+        Returns number of cached files. When only the change log grew since
+        the last load, just its new lines are read.
+        """
+        if not self.dirty and self._index_key is not None:
+            try:
+                if _file_key(self.index_path) == self._index_key:
+                    self._replay_log()
+                    self._map_matrix()
+                    self._check_rows()
+                    self.matrix = self._map[:self._rows]
+                    return len(self.entries)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # fall back to a full load
+        return self._load_full()
+
+    def _load_full(self):
+        """Read the index and the whole change log, memory-map the matrix"""
+        self.entries = {}
+        self._by_id = {}
+        self.matrix = np.empty((0, self.dim), dtype=np.float32)
+        self.epoch = None
+        self._pending = {}
+        self._changed = set()
+        self._index_key = self._log_id = None
+        self._log_offset = self._log_lines = 0
+        self.dirty = False
+
+        try:
+            key = _file_key(self.index_path)
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != self.VERSION or index.get("dim") != self.dim:
+                raise ValueError("incompatible embedding index")
+            self._map_matrix()
+            # Stores written before preallocation: every row of the file is used
+            self._rows = index.get("rows", len(self._map))
+            for filename, entry in index.get("files", {}).items():
+                self._set_entry(filename, entry)
+            self._log_id = index.get("log")
+            self._replay_log()
+            self._check_rows()
+        except FileNotFoundError:
+            self._reset()
+            return 0
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Corrupt or stale cache: start over, images will be re-encoded
+            print(f"Embedding cache ignored: {e}")
+            self._reset()
+            self.dirty = True
+            return 0
+
+        self._index_key = key
+        self.matrix = self._map[:self._rows]
+        self.epoch = index.get("epoch")
+        return len(self.entries)
+
+    def _reset(self):
+        self.entries = {}
+        self._by_id = {}
+        self._map = self._map_key = None
+        self._index_key = self._log_id = None
+        self._rows = 0
+
+    def _check_rows(self):
+        if self._rows > len(self._map) or any(e["row"] >= self._rows for e in self._touched()):
+            raise ValueError("embedding index out of range")
+
+    def _touched(self):
+        """Entries to validate: all of them after a full read, else the ones the log changed"""
+        if self._index_key is None:
+            return self.entries.values()
+        return [self.entries[f] for f in self._replayed if f in self.entries]
+
+    def _replay_log(self):
+        """Apply the change-log lines written since the last load"""
+        self._replayed = set()
+        if self._log_id is None:
+            return  # index written before the change log (or by a crashed rewrite)
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            self._log_id = None
+            return
+        with f:
+            if self._log_offset == 0:
+                header = f.readline()
+                if not header.endswith(b"\n") or json.loads(header).get("log") != self._log_id:
+                    # Left over from an interrupted index rewrite: the index has it all
+                    self._log_id = None
+                    return
+                self._log_offset = len(header)
+            f.seek(self._log_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn last line from a crashed writer, never acknowledged
+                change = json.loads(line)
+                for filename in change.get("del", []):
+                    self._drop_entry(filename)
+                for filename, entry in change.get("set", {}).items():
+                    self._set_entry(filename, entry)
+                self._rows = change["rows"]
+                self._replayed.update(change.get("del", []))
+                self._replayed.update(change.get("set", {}))
+                self._log_offset += len(line)
+                self._log_lines += 1
+
+    def _map_matrix(self):
+        """Map the matrix file, reusing the current mapping unless the file was replaced"""
+        stat = os.stat(self.matrix_path)
+        key = (stat.st_dev, stat.st_ino)
+        if key == self._map_key:
+            return
+        matrix = np.load(self.matrix_path, mmap_mode="r")
+        if matrix.dtype != np.float32 or matrix.ndim != 2 or matrix.shape[1] != self.dim:
+            raise ValueError("incompatible embedding matrix")
+        self._map, self._map_key = matrix, key
+
+    def save(self, compact=False):
+        """
+        Write matrix rows and index changes (only if something changed).
+        Callers hold ``locked()`` and ``load()`` first, like every writer.
+
+        Without ``compact`` rows never move: new encodings are written in
+        place after the used rows (a full file is copied once into one of
+        twice the capacity), nothing is written to the matrix file when
+        nothing was appended, and the changed entries go to the change log.
+        ``compact`` copies the live rows into a new file, which starts a new
+        epoch when any row moved, and rewrites the index.
+        """
+        if not self.dirty and not (compact and len(self.tombstones())):
+            return False
+
+        added = [(filename, encoding) for filename, encoding in sorted(self._pending.items())
+                 if filename in self.entries and encoding is not None]
+        new_rows = np.asarray([encoding for _, encoding in added],
+                              dtype=np.float32).reshape(-1, self.dim)
+        # Re-encoded files drop their old row (it becomes a tombstone)
+        rows_of = {filename: -1 for filename in self._pending if filename in self.entries}
+
+        epoch = self.epoch
+        rewrite_index = compact or self._map is None
+        if rewrite_index:
+            live = sorted(
+                (entry["row"], filename) for filename, entry in self.entries.items()
+                if entry["row"] >= 0 and filename not in self._pending)
+            kept_rows = [row for row, _ in live]
+            for row, (_, filename) in enumerate(live):
+                rows_of[filename] = row
+            if kept_rows != list(range(len(self.matrix))):
+                epoch = None
+            rows = len(kept_rows) + len(new_rows)
+            self._write_matrix(np.concatenate([self.matrix[kept_rows], new_rows]),
+                               _capacity(rows, self.MIN_CAPACITY))
+        else:
+            rows = len(self.matrix) + len(new_rows)
+            if rows > len(self._map):
+                # Full: move to a file twice the size (amortised, rows keep their ids)
+                self._write_matrix(np.concatenate([self.matrix, new_rows]),
+                                   _capacity(rows, len(self._map)))
+            elif len(new_rows):
+                self._write_rows(len(self.matrix), new_rows)
+        for row, (filename, _) in enumerate(added, start=rows - len(new_rows)):
+            rows_of[filename] = row
+
+        updated = {filename: dict(self.entries[filename], row=rows_of.get(
+                       filename, self.entries[filename]["row"]))
+                   for filename in self._changed | set(rows_of) if filename in self.entries}
+        deleted = sorted(filename for filename in self._changed if filename not in self.entries)
+        if epoch is None:
+            epoch = uuid.uuid4().hex
+
+        # Rows are written first so the index never points at unwritten ones
+        if rewrite_index or self._log_id is None or \
+                self._log_lines >= max(self.MIN_LOG_LINES, len(self.entries)):
+            self._write_index(dict(self.entries, **updated), epoch, rows)
+        else:
+            self._append_log({"rows": rows, "set": updated, "del": deleted})
+        self._bump_generation()
+
+        self._map_matrix()
+        for filename, entry in updated.items():
+            self._set_entry(filename, entry)
+        self._rows = rows
+        self.matrix = self._map[:rows]
+        self.epoch = epoch
+        self._pending = {}
+        self._changed = set()
+        self.dirty = False
+        return True
+
+    def _write_index(self, files, epoch, rows):
+        """Rewrite the whole index and start an empty change log tied to it"""
+        log_id = uuid.uuid4().hex
+        index = {"version": self.VERSION, "dim": self.dim, "epoch": epoch, "rows": rows,
+                 "log": log_id, "files": files}
+        header = (json.dumps({"log": log_id}) + "\n").encode("utf-8")
+        self._atomic_write(self.index_path, lambda f: f.write(
+            json.dumps(index).encode("utf-8")))
+        # A crash here leaves the old log behind: its header no longer matches
+        self._atomic_write(self.log_path, lambda f: f.write(header))
+        self._index_key = _file_key(self.index_path)
+        self._log_id = log_id
+        self._log_offset = len(header)
+        self._log_lines = 0
+
+    def _append_log(self, change):
+        line = (json.dumps(change) + "\n").encode("utf-8")
+        with open(self.log_path, "r+b") as f:
+            # Cut a torn line left by a crashed writer before appending
+            f.seek(self._log_offset)
+            f.truncate()
+            f.write(line)
+        self._log_offset += len(line)
+        self._log_lines += 1
+
+    def _write_matrix(self, rows, capacity):
+        """Replace the matrix file with a new preallocated one holding ``rows``"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        os.close(fd)
+        try:
+            matrix = np.lib.format.open_memmap(
+                tmp_path, mode="w+", dtype=np.float32, shape=(capacity, self.dim))
+            matrix[:len(rows)] = rows
+            matrix.flush()
+            del matrix
+            os.replace(tmp_path, self.matrix_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _write_rows(self, start, rows):
+        """
+        Write rows past the used ones into the current file. No worker reads
+        them before the index (written next) counts them.
+        """
+        matrix = np.lib.format.open_memmap(self.matrix_path, mode="r+")
+        matrix[start:start + len(rows)] = rows
+        matrix.flush()
+        del matrix
+
+    def _atomic_write(self, path, write):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # ============================================
+    # CROSS-WORKER SYNC
+    # ============================================
+
+    @contextlib.contextmanager
+    def locked(self, shared=False):
+        """
+        Hold the store lock across workers (exclusive for writers, shared
+        for readers so they never see a half-replaced matrix/index pair).
+        """
+        try:
+            lock_file = open(self.lock_path, "a+b")
+        except OSError:
+            # Directory not writable/missing: nothing on disk to protect
+            yield
+            return
+        with lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def generation(self):
+        """Current gallery generation (one mmapped read, cheap enough per scan)."""
+        counter = self._generation_counter()
+        return int(counter[0]) if counter is not None else 0
+
+    def _generation_counter(self):
+        if self._generation is None:
+            try:
+                if not os.path.exists(self.generation_path):
+                    with open(self.generation_path, "ab") as f:
+                        f.truncate(8)
+                self._generation = np.memmap(self.generation_path, dtype="<u8", mode="r+", shape=(1,))
+            except (OSError, ValueError):
+                return None
+        return self._generation
+
+    def _bump_generation(self):
+        counter = self._generation_counter()
+        if counter is not None:
+            counter[0] += 1
+            counter.flush()
+
+    # ============================================
+    # LOOKUP / UPDATE
+    # ============================================
+
+    def lookup(self, filename, path):
+        """
+        Return ``(hit, encoding)`` for an image file.
+
+        ``hit`` is False when the file is new or its content changed and it must
+        be re-encoded. ``encoding`` is None for cached images without a face.
+        """
+        entry = self.entries.get(filename)
+        if entry is None:
+            return False, None
+
+        stat = os.stat(path)
+        if entry["mtime"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            # mtime changed (copy, touch, re-save): fall back to content hash
+            if entry["sha1"] != file_sha1(path):
+                return False, None
+            entry["mtime"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self._changed.add(filename)
+            self.dirty = True
+
+        return True, self.encoding_for(filename)
+
+    def put(self, filename, path, name, encoding, face_id=None):
+        """Record the encoding (or None when no face was found) for an image file."""
+        stat = os.stat(path)
+        previous = self.entries.get(filename, {})
+        self._set_entry(filename, {
+            "name": name,
+            "id": face_id or previous.get("id"),
+            "sha1": file_sha1(path),
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "row": previous.get("row", -1),
+        })
+        self._pending[filename] = None if encoding is None else np.asarray(
+            encoding, dtype=np.float32)
+        self._changed.add(filename)
+        self.dirty = True
+
+    def remove(self, filename):
+        if self._drop_entry(filename) is not None:
+            self._pending.pop(filename, None)
+            self._changed.add(filename)
+            self.dirty = True
+
+    def rename(self, filename, new_filename, name):
+        """Move an entry to a new file name / display name, keeping its row and id."""
+        entry = self._drop_entry(filename)
+        self._set_entry(new_filename, dict(entry, name=name))
+        if filename in self._pending:
+            self._pending[new_filename] = self._pending.pop(filename)
+        self._changed.update((filename, new_filename))
+        self.dirty = True
+
+    def find(self, face_id):
+        """File name of the entry with this stable id, None if there is none."""
+        if face_id is None:
+            return None
+        return self._by_id.get(face_id)
+
+    def prune(self, filenames):
+        """Forget cached files that are no longer in the directory."""
+        for filename in set(self.entries) - set(filenames):
+            self.remove(filename)
+
+    def clear(self):
+        if self.entries:
+            self._changed.update(self.entries)
+            self.entries = {}
+            self._by_id = {}
+            self._pending = {}
+            self.dirty = True
+
+    def _set_entry(self, filename, entry):
+        self._drop_entry(filename)
+        self.entries[filename] = entry
+        if entry.get("id") is not None:
+            self._by_id[entry["id"]] = filename
+
+    def _drop_entry(self, filename):
+        entry = self.entries.pop(filename, None)
+        if entry is not None and self._by_id.get(entry.get("id")) == filename:
+            del self._by_id[entry["id"]]
+        return entry
+
+    def gallery(self):
+        """``(matrix, names)`` of the saved encodings, names[i] owns matrix row i."""
+        names = [None] * len(self.matrix)
+        for entry in self.entries.values():
+            if entry["row"] >= 0:
+                names[entry["row"]] = entry["name"]
+        return self.matrix, names
+
+    def tombstones(self):
+        """Matrix rows no entry points at any more (reclaimed by compaction)."""
+        live = np.zeros(len(self.matrix), dtype=bool)
+        live[[entry["row"] for entry in self.entries.values() if entry["row"] >= 0]] = True
+        return np.flatnonzero(~live)
+
+    def encoding_for(self, filename):
+        if filename in self._pending:
+            return self._pending[filename]
+        row = self.entries[filename]["row"]
+        if row < 0:
+            return None
+        return self.matrix[row]
+
+
+def _file_key(path):
+    """Identity of a file that is only ever replaced, never rewritten in place"""
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _capacity(rows, current):
+    """Smallest doubling of ``current`` that holds ``rows``"""
+    capacity = max(current, EmbeddingStore.MIN_CAPACITY)
+    while capacity < rows:
+        capacity *= 2
+    return capacity
+
+
+def file_sha1(path, chunk_size=1024 * 1024):
+    """Content hash of a file, read in chunks."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
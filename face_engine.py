@@ -2,115 +2,920 @@ import face_recognition
 import cv2
 import numpy as np
 import base64
+import contextlib
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from embedding_store import EmbeddingStore
+from face_index import BruteForceIndex, GallerySnapshot, build_index
+from metrics import metrics
+from utils import is_upright_jpeg
+
+# Max face distance for a match (lower = stricter)
+MATCH_TOLERANCE = 0.5
+
+# Client face boxes are padded by this fraction of the box size on each
+# side, and the padded region is resized so its longer side is
+# REGION_DETECT_SIZE px before HOG verifies it (face ~130 px, no upsampling)
+REGION_PADDING = 0.25
+REGION_DETECT_SIZE = 200
+MIN_REGION_SIZE = 40
+
+# Frame quality gate, measured on a grayscale thumbnail (longer side
+# QUALITY_SIZE px) before any dlib stage. Rejections carry a reason code.
+QUALITY_SIZE = 160
+MIN_BRIGHTNESS = 25        # mean gray below this: too dark to recover
+MAX_BRIGHTNESS = 235       # mean gray above this: washed out
+MIN_SHARPNESS = 10.0       # variance of the Laplacian on the thumbnail
+# Dark or flat (low contrast) frames are contrast-enhanced for detection
+ENHANCE_BELOW_BRIGHTNESS = 80
+ENHANCE_BELOW_CONTRAST = 30
+QUALITY_REASONS = {
+    "too_dark": "Image too dark. Move to a brighter spot.",
+    "overexposed": "Image too bright. Avoid strong light on the camera.",
+    "blurry": "Image is blurry. Hold still for a moment.",
+    "no_face": "Face not detected",
+}
+
+# Removed gallery rows stay as tombstones until they are at least
+# COMPACT_MIN_TOMBSTONES and COMPACT_RATIO of the matrix, then the owner
+# rewrites the matrix in the background
+COMPACT_MIN_TOMBSTONES = 64
+COMPACT_RATIO = 0.25
+
+# Brighten slightly (alpha=1.1, beta=10) and swap BGR -> RGB as one 3x4
+# affine colour transform, so the frame is only traversed once
+BRIGHTEN_BGR2RGB = np.array([[0, 0, 1.1, 10],
+                             [0, 1.1, 0, 10],
+                             [1.1, 0, 0, 10]], dtype=np.float32)
 
 class FaceEngine:
-    def __init__(self, known_faces_dir='known_faces'):
+    def __init__(self, known_faces_dir='known_faces', ann_threshold=20000, ann_nlist=None, ann_nprobe=8,
+                 detection_scale=0.5, batch_workers=4, quality_gate=False, pool=None):
         self.known_faces_dir = known_faces_dir
-        self.known_encodings = []
-        self.known_names = []
+        # Optional FacePool: scan detection/encoding run in its processes
+        # (the gallery and matching stay in this process)
+        self.pool = pool
+        # Reject blurry/dark/face-less frames before HOG (see assess_frame)
+        self.quality_gate = quality_gate
+        self._face_cascade = load_face_cascade() if quality_gate else None
+        self._quality_lock = threading.Lock()
+        self._quality_counts = {"checked": 0, "passed": 0, "enhanced": 0,
+                                **{reason: 0 for reason in QUALITY_REASONS}}
+        # Scan HOG runs on a copy downscaled by this factor (1.0 = full frame)
+        self.detection_scale = detection_scale
+        # Threads used by recognize_batch to decode/detect frames concurrently
+        self.batch_workers = batch_workers
+        self._executor = None
+        # Index backend: exact brute force for small galleries, IVF-flat
+        # once the gallery reaches ann_threshold (0 = always exact)
+        self.ann_threshold = ann_threshold
+        self.ann_nlist = ann_nlist
+        self.ann_nprobe = ann_nprobe
+        # Current GallerySnapshot (index + names + store version). Replaced
+        # as a whole, never mutated: scans read one reference and match
+        # against it while the next snapshot is built aside.
+        self.gallery = GallerySnapshot(BruteForceIndex(), [])
+        # Precomputed encodings so startup only re-encodes new/changed images.
+        # The store's matrix file is also the gallery shared (mmapped) by all
+        # workers; its generation counter tells us when another worker changed it.
+        self.embedding_store = EmbeddingStore(known_faces_dir)
+        # _store_lock serialises this process's threads on the store object
+        # (load() replaces its entries/matrix); the flock only covers workers.
+        # _sync_lock is held for a whole refresh, background rebuild included;
+        # _publish_lock only for swapping the snapshot, so appends and scans
+        # never wait on a rebuild.
+        self._store_lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._publish_lock = threading.RLock()
+        self._executor_lock = threading.Lock()
+        self._compact_lock = threading.Lock()
         # Load known faces on initialization
         self.load_known_faces()
 
+    @property
+    def index(self):
+        return self.gallery.index
+
+    @property
+    def known_names(self):
+        """Registered names, deleted (tombstoned) faces excluded"""
+        return self.gallery.live_names()
+
+    @property
+    def known_encodings(self):
+        """Gallery matrix view (N, 128) incl. tombstones, row i belongs to gallery.names[i]"""
+        return self.gallery.index.vectors
+
+    @property
+    def _gallery_generation(self):
+        return self.gallery.generation
+
+    @property
+    def _gallery_epoch(self):
+        return self.gallery.epoch
+
+    def _publish(self, index, names, generation, epoch):
+        # One reference swap: scans see the old snapshot or the new one
+        with self._publish_lock:
+            self.gallery = GallerySnapshot(index, names, generation, epoch)
+
+    @contextlib.contextmanager
+    def _locked_store(self, shared=False):
+        """Hold the store across this process's threads and across workers"""
+        with self._store_lock, self.embedding_store.locked(shared=shared):
+            yield self.embedding_store
+
+    def _set_gallery(self, encodings, names, generation=None, epoch=None):
+        index = build_index(encodings, **self._index_options())
+        with self._publish_lock:
+            current = self.gallery
+            self._publish(index, list(names),
+                          current.generation if generation is None else generation,
+                          current.epoch if epoch is None else epoch)
+
+    def _append_gallery(self, encoding, name):
+        with self._publish_lock:
+            current = self.gallery
+            index = current.index.clone()
+            index.add(encoding)
+            self._publish(self._upgraded(index), current.names + [name],
+                          current.generation, current.epoch)
+
+    def _needs_upgrade(self, index):
+        if index.kind != "ivf":
+            return bool(self.ann_threshold) and len(index) >= self.ann_threshold
+        return index.needs_retrain
+
+    def _upgraded(self, index):
+        # Switch to the ANN backend once the gallery outgrows brute force,
+        # and retrain IVF cells after the gallery has doubled since training
+        if not self._needs_upgrade(index):
+            return index
+        if index.kind != "ivf":
+            tombstones = np.flatnonzero(np.isinf(index.sq_norms))
+            upgraded = build_index(index.vectors, copy=False, **self._index_options())
+            upgraded.remove(tombstones)
+            return upgraded
+        upgraded = index.clone()
+        upgraded.train()
+        return upgraded
+
+    def _sync_gallery(self, force=False):
+        """
+        Pick up gallery changes saved by any worker (registrations, deletions,
+        renames, clears). Costs one mmapped counter read when nothing changed.
+
+        Appended rows and tombstones are applied to a clone of the current
+        index; only a compaction (new epoch) rebuilds it from the shared
+        matrix (without copying it). Scans never call this directly, they
+        go through ``_poll_gallery`` (background refresh); writers call it
+        after saving. IVF builds, retrains and ANN switches run in a
+        background thread that publishes the new snapshot when it is done.
+        ``force`` (startup, clear) refreshes inline and waits for a running
+        refresh.
+        """
+        store = self.embedding_store
+        if not force and store.generation() == self.gallery.generation:
+            return False
+        if not self._sync_lock.acquire(blocking=force):
+            return False
+
+        handed_off = False
+        try:
+            with metrics.timer("stage_seconds", stage="gallery_sync"):
+                # Everything read from the store in one consistent copy:
+                # other threads reload the same store object
+                with self._locked_store(shared=True):
+                    generation = store.generation()
+                    if not force and generation == self.gallery.generation:
+                        return False
+                    store.load()
+                    matrix, names = store.gallery()
+                    tombstones = store.tombstones()
+                    epoch = store.epoch
+                current = self.gallery
+
+                if not force and epoch == current.epoch and len(current.index) <= len(matrix):
+                    index = current.index.clone()
+                    index.extend(matrix)
+                elif force or not (self.ann_threshold and len(matrix) >= self.ann_threshold):
+                    index = self._build(matrix, current.index)
+                else:
+                    handed_off = self._in_background(
+                        self._rebuild, matrix, names, tombstones, generation, epoch)
+                    return False
+                index.remove(tombstones)
+
+                if force:
+                    index = self._upgraded(index)
+                self._publish(index, names, generation, epoch)
+                if not force and self._needs_upgrade(index):
+                    handed_off = self._in_background(self._upgrade, self.gallery)
+            return True
+        finally:
+            if not handed_off:
+                self._sync_lock.release()
+
+    def _poll_gallery(self):
+        """
+        Scan path: one mmapped counter read. When another worker changed the
+        gallery, the whole refresh (store load, gallery copy, tombstones,
+        index update) runs in a background thread and this scan keeps
+        matching against the current snapshot. Returns True when a refresh
+        was started.
+        """
+        if self.embedding_store.generation() == self.gallery.generation:
+            return False
+        if not self._poll_lock.acquire(blocking=False):
+            return False  # a refresh is already on its way
+
+        def run():
+            try:
+                self._sync_gallery()
+            except Exception as e:
+                print(f"[Background] Gallery refresh failed: {e}")
+            finally:
+                self._poll_lock.release()
+
+        thread = threading.Thread(target=run, name="gallery-refresh")
+        thread.daemon = True
+        thread.start()
+        return True
+
+    def refresh_gallery(self):
+        """
+        Pick up gallery changes written to the shared store by another
+        process or tool (e.g. bulk enrollment). Returns True when a new
+        snapshot was published; never waits for a refresh in progress.
+        """
+        return self._sync_gallery()
+
+    def _build(self, matrix, previous):
+        centroids = previous.centroids if previous.kind == "ivf" else None
+        return build_index(matrix, copy=False, centroids=centroids, **self._index_options())
+
+    def _index_options(self):
+        return dict(ann_threshold=self.ann_threshold, nlist=self.ann_nlist, nprobe=self.ann_nprobe)
+
+    def _in_background(self, fn, *args):
+        """Run fn in a thread that owns (and finally releases) the held _sync_lock"""
+        def run():
+            try:
+                with metrics.timer("stage_seconds", stage="gallery_rebuild"):
+                    fn(*args)
+            except Exception as e:
+                print(f"[Background] Gallery rebuild failed: {e}")
+            finally:
+                self._sync_lock.release()
+
+        thread = threading.Thread(target=run, name="gallery-rebuild")
+        thread.daemon = True
+        thread.start()
+        return True
+
+    def _rebuild(self, matrix, names, tombstones, generation, epoch):
+        index = self._build(matrix, self.gallery.index)
+        index.remove(tombstones)
+        self._publish(index, names, generation, epoch)
+        print(f"[Background] Gallery rebuilt ({len(names)} rows, {index.kind})")
+
+    def _upgrade(self, snapshot):
+        index = self._upgraded(snapshot.index)
+        with self._publish_lock:
+            if self.gallery is snapshot:
+                self._publish(index, snapshot.names, snapshot.generation, snapshot.epoch)
+
+    def gallery_size(self):
+        """Matchable faces (index rows minus tombstones)"""
+        index = self.gallery.index
+        return len(index) - index.tombstones
+
+    def match_encodings(self, face_encodings, k=1, gallery=None):
+        """
+        Match all probe encodings against the gallery in one pass.
+
+        Returns:
+            (indices, distances): arrays of shape (M, k) sorted by distance,
+            or None when the gallery is empty.
+        """
+        gallery = gallery or self.gallery
+        with metrics.timer("stage_seconds", stage="match"):
+            return gallery.index.search(face_encodings, k=k)
+
+    def set_ann_nprobe(self, nprobe):
+        """Recall/latency knob for the IVF backend (more cells = higher recall)"""
+        self.ann_nprobe = nprobe
+        if self.index.kind == "ivf":
+            self.index.nprobe = nprobe
+
+    def index_stats(self):
+        return self.index.stats()
+
     def load_known_faces(self):
         """Reload face database from folder to memory"""
-        self.known_encodings = []
-        self.known_names = []
-        
         # Create folder if it doesn't exist
         if not os.path.exists(self.known_faces_dir):
             os.makedirs(self.known_faces_dir)
             
         print("Loading face database...")
-        
-        for filename in os.listdir(self.known_faces_dir):
-            if filename.endswith((".jpg", ".png", ".jpeg")):
-                path = os.path.join(self.known_faces_dir, filename)
-                try:
-                    image = face_recognition.load_image_file(path)
-                    encoding = face_recognition.face_encodings(image)
-                    if encoding:
-                        self.known_encodings.append(encoding[0])
-                        self.known_names.append(os.path.splitext(filename)[0])
-                except Exception as e:
-                    print(f"Failed to load {filename}: {e}")
-        
-        print(f"Database ready! Total users: {len(self.known_names)}")
+        store = self.embedding_store
+        encoded = 0
+        filenames = []
+
+        # Exclusive lock: when several workers boot together the first one
+        # encodes new images, the others then find them all cached
+        with self._locked_store():
+            cached = store.load()
+            for filename in sorted(os.listdir(self.known_faces_dir)):
+                if filename.endswith((".jpg", ".png", ".jpeg")):
+                    filenames.append(filename)
+                    path = os.path.join(self.known_faces_dir, filename)
+                    try:
+                        hit, encoding = store.lookup(filename, path)
+                        if not hit:
+                            # New or changed image: run the full detect + encode
+                            image = face_recognition.load_image_file(path)
+                            found = face_recognition.face_encodings(image)
+                            encoding = found[0] if found else None
+                            store.put(filename, path, os.path.splitext(filename)[0], encoding)
+                            encoded += 1
+                    except Exception as e:
+                        print(f"Failed to load {filename}: {e}")
+
+            store.prune(filenames)
+            try:
+                store.save()
+                saved = True
+            except OSError as e:
+                print(f"Failed to save embedding cache: {e}")
+                saved = False
+
+        if saved:
+            self._sync_gallery(force=True)
+            self._maybe_compact()
+        else:
+            # Cache not writable: keep this worker's encodings in private memory
+            rows = [(entry["name"], store.encoding_for(filename))
+                    for filename, entry in sorted(store.entries.items())]
+            rows = [(name, encoding) for name, encoding in rows if encoding is not None]
+            self._set_gallery([encoding for _, encoding in rows], [name for name, _ in rows])
+
+        print(f"Database ready! Total users: {self.gallery_size()} "
+              f"(cached: {cached}, encoded: {encoded})")
+
+    def clear_faces(self):
+        """Delete every registered face (images + cached encodings) for all workers"""
+        store = self.embedding_store
+        removed = 0
+        with self._locked_store():
+            for filename in os.listdir(self.known_faces_dir):
+                if filename.endswith((".jpg", ".png", ".jpeg")):
+                    os.remove(os.path.join(self.known_faces_dir, filename))
+                    removed += 1
+            store.load()
+            store.clear()
+            store.save(compact=True)
+        self._sync_gallery(force=True)
+        return removed
+
+    def _find_face(self, face_id, name=None):
+        """
+        Store file name for a stable face id. Faces registered before ids
+        existed are found by ``name`` (their ``<name>.jpg``), unless that
+        file now belongs to another id.
+        """
+        store = self.embedding_store
+        filename = store.find(face_id)
+        if filename is None and name:
+            entry = store.entries.get(f"{name}.jpg")
+            if entry is not None and entry.get("id") in (None, face_id):
+                filename = f"{name}.jpg"
+        return filename
+
+    def remove_face(self, face_id, name=None):
+        """
+        Delete one registered face for all workers: the image file goes and
+        its gallery row is tombstoned (no matrix rewrite, no index rebuild).
+        Returns False when the face is not in the gallery.
+        """
+        store = self.embedding_store
+        with self._locked_store():
+            store.load()
+            filename = self._find_face(face_id, name)
+            if filename is None:
+                return False
+            path = os.path.join(self.known_faces_dir, filename)
+            if os.path.exists(path):
+                os.remove(path)
+            store.remove(filename)
+            store.save()
+        self._sync_gallery()
+        self._maybe_compact()
+        return True
+
+    def rename_face(self, face_id, new_name, name=None):
+        """
+        Rename a registered face for all workers, keeping its row and id
+        (the image file follows the name). Returns (success, message); a
+        face that is not in the gallery has nothing to rename.
+        """
+        new_filename = f"{new_name}.jpg"
+        if not new_name or os.path.basename(new_name) != new_name or new_name.startswith("."):
+            return False, "Invalid name"
+        store = self.embedding_store
+        with self._locked_store():
+            store.load()
+            filename = self._find_face(face_id, name)
+            if filename is None:
+                return True, "Face not in gallery"
+            if filename == new_filename:
+                return True, "Name unchanged"
+            new_path = os.path.join(self.known_faces_dir, new_filename)
+            if new_filename in store.entries or os.path.exists(new_path):
+                return False, f"Name {new_name} is already registered"
+            os.rename(os.path.join(self.known_faces_dir, filename), new_path)
+            store.rename(filename, new_filename, new_name)
+            store.save()
+        self._sync_gallery()
+        return True, f"Face renamed to {new_name}"
+
+    def compact_gallery(self):
+        """Rewrite the shared matrix without tombstoned rows (new epoch)"""
+        store = self.embedding_store
+        with self._locked_store():
+            store.load()
+            compacted = store.save(compact=True)
+        if compacted:
+            self._sync_gallery()
+        return compacted
+
+    def _maybe_compact(self):
+        dead = self.index.tombstones
+        if dead < COMPACT_MIN_TOMBSTONES or dead < COMPACT_RATIO * len(self.index):
+            return None
+        if not self._compact_lock.acquire(blocking=False):
+            return None
+
+        def run():
+            try:
+                if self.compact_gallery():
+                    print(f"[Background] Gallery compacted ({dead} tombstones)")
+            except OSError as e:
+                print(f"[Background] Gallery compaction failed: {e}")
+            finally:
+                self._compact_lock.release()
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return thread
 
     def process_base64_image(self, base64_string):
         """Convert base64 string from webcam to OpenCV image"""
         if "," in base64_string:
             base64_string = base64_string.split(",")[1]
         
-        img_data = base64.b64decode(base64_string)
-        nparr = np.frombuffer(img_data, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        
-        # Image optimization: Brighten slightly for easier detection
-        img = cv2.convertScaleAbs(img, alpha=1.1, beta=10)
-        
-        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        with metrics.timer("stage_seconds", stage="base64"):
+            img_data = base64.b64decode(base64_string)
+        return self.decode_image_bytes(img_data)
 
-    def recognize_face(self, rgb_img):
-        """Attendance Process (Scan)"""
-        # Upsample 1x is sufficient for fast scanning
-        face_locations = face_recognition.face_locations(rgb_img)
-        face_encodings = face_recognition.face_encodings(rgb_img, face_locations)
+    def decode_image(self, image):
+        """Decode either a base64 string (JSON API) or raw encoded bytes (binary upload)"""
+        if isinstance(image, str):
+            return self.process_base64_image(image)
+        return self.decode_image_bytes(image)
 
-        if not face_encodings:
-            return "error", "Face not detected", None
+    def decode_image_bytes(self, img_data):
+        """Encoded JPEG/PNG bytes (or any buffer) to RGB, without copying the input"""
+        with metrics.timer("stage_seconds", stage="decode"):
+            return decode_rgb(img_data)
 
-        for face_encoding in face_encodings:
-            # Tolerance 0.5 for accuracy
-            matches = face_recognition.compare_faces(self.known_encodings, face_encoding, tolerance=0.5)
-            face_distances = face_recognition.face_distance(self.known_encodings, face_encoding)
-            
-            if len(face_distances) > 0:
-                best_match_index = np.argmin(face_distances)
-                if matches[best_match_index]:
-                    nama = self.known_names[best_match_index]
+    def detect_faces(self, rgb_img, scale=None, upsample=1):
+        """
+        HOG detection on a downscaled copy, boxes mapped back to full resolution.
+
+        Returns face_recognition style (top, right, bottom, left) tuples in
+        rgb_img coordinates, so landmarks/encodings still use the original pixels.
+        """
+        scale = self.detection_scale if scale is None else scale
+        with metrics.timer("stage_seconds", stage="detect"):
+            return locate_faces(rgb_img, scale, upsample)
+
+    def detect_face_in_region(self, rgb_img, face_box):
+        """
+        Verify a client-supplied face box (top, right, bottom, left) by running
+        HOG on just that region (padded, resized to REGION_DETECT_SIZE)
+        instead of the whole frame.
+
+        Returns at most one location in rgb_img coordinates (the largest face
+        HOG finds in the region), or [] when the region holds no face.
+        """
+        with metrics.timer("stage_seconds", stage="detect_region"):
+            return locate_face_in_region(rgb_img, face_box)
+
+    # ============================================
+    # FRAME QUALITY GATE
+    # ============================================
+
+    def assess_frame(self, rgb_img, face_box=None, detect=True):
+        """
+        Cheap pre-check on a small grayscale thumbnail (of face_box when
+        given): exposure, blur (Laplacian variance) and, for full frames, a
+        Haar cascade face check when OpenCV ships one (``detect``).
+
+        Returns (reason, detect_img): reason is a QUALITY_REASONS code or
+        None when the frame may go on to HOG; detect_img is the frame to run
+        detection on (a contrast-enhanced copy for dark or flat frames).
+        """
+        with metrics.timer("stage_seconds", stage="quality"):
+            region = rgb_img
+            if face_box is not None:
+                top, right, bottom, left = face_box
+                region = rgb_img[max(0, top):bottom, max(0, left):right]
+            reason, enhance = self._assess(region, detect and face_box is None)
+
+        with self._quality_lock:
+            self._quality_counts["checked"] += 1
+            self._quality_counts[reason or "passed"] += 1
+            if enhance and not reason:
+                self._quality_counts["enhanced"] += 1
+        metrics.inc("quality_total", result=reason or ("enhanced" if enhance else "passed"))
+
+        if reason or not enhance:
+            return reason, rgb_img
+        return None, cv2.convertScaleAbs(rgb_img, alpha=1.5, beta=20)
+
+    def _assess(self, region, detect):
+        height, width = region.shape[:2]
+        if not height or not width:
+            return "no_face", False
+        scale = min(1.0, QUALITY_SIZE / max(height, width))
+        small = cv2.resize(region, (max(1, int(width * scale)), max(1, int(height * scale))),
+                           interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+
+        mean, std = (float(v[0][0]) for v in cv2.meanStdDev(gray))
+        if mean < MIN_BRIGHTNESS:
+            return "too_dark", False
+        if mean > MAX_BRIGHTNESS:
+            return "overexposed", False
+        if cv2.Laplacian(gray, cv2.CV_64F).var() < MIN_SHARPNESS:
+            return "blurry", False
+
+        enhance = mean < ENHANCE_BELOW_BRIGHTNESS or std < ENHANCE_BELOW_CONTRAST
+        if detect and self._face_cascade is not None:
+            if enhance:
+                gray = cv2.equalizeHist(gray)
+            faces = self._face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=3,
+                                                        minSize=(16, 16))
+            if len(faces) == 0:
+                return "no_face", enhance
+        return None, enhance
+
+    def quality_stats(self):
+        with self._quality_lock:
+            return dict(self._quality_counts)
+
+    def _gate(self, rgb_img, face_box=None):
+        """(reason, enhanced copy or None) from assess_frame, (None, None) with the gate off"""
+        if not self.quality_gate:
+            return None, None
+        reason, detect_img = self.assess_frame(rgb_img, face_box)
+        return reason, None if detect_img is rgb_img else detect_img
+
+    def encode_faces(self, rgb_img, face_box=None, detect_img=None):
+        """
+        Detect and encode every face in a frame (or only the face in face_box).
+        Detection runs on detect_img when given (e.g. the gate's enhanced
+        copy); encodings always use the original pixels.
+        """
+        if self.pool is not None:
+            # Decode/gate stay here; HOG + dlib run in a pool process
+            encodings, timings = self.pool.run(
+                detect_and_encode, rgb_img, face_box, detect_img, self.detection_scale)
+            for stage, seconds in timings.items():
+                metrics.observe("stage_seconds", seconds, stage=stage)
+            return encodings
+
+        detect_img = rgb_img if detect_img is None else detect_img
+        if face_box is not None:
+            face_locations = self.detect_face_in_region(detect_img, face_box)
+        else:
+            # Upsample 1x on the downscaled copy is sufficient for fast scanning
+            face_locations = self.detect_faces(detect_img)
+        with metrics.timer("stage_seconds", stage="encode"):
+            return face_recognition.face_encodings(rgb_img, face_locations)
+
+    def _first_match(self, result, start, stop, names):
+        """First face in rows [start, stop) of a match result within tolerance"""
+        if result is not None:
+            indices, distances = result
+            for best_match_index, distance in zip(indices[start:stop, 0], distances[start:stop, 0]):
+                # Tolerance 0.5 for accuracy
+                if distance <= MATCH_TOLERANCE:
+                    nama = names[best_match_index]
                     return "success", "Face recognized", nama
 
         return "error", "Face not recognized", None
 
-    def register_face(self, nama, base64_image):
-        """New Face Registration Process (More Precise)"""
+    def recognize_face(self, rgb_img, face_box=None):
+        """
+        Attendance Process (Scan)
+
+        face_box: (top, right, bottom, left) of the face found by the kiosk's
+        detector; only that region is verified and encoded (no full-frame HOG).
+
+        Returns ("rejected", reason, None) when the quality gate turns the
+        frame away (reason is a QUALITY_REASONS code).
+        """
+        reason, detect_img = self._gate(rgb_img, face_box)
+        if reason:
+            return "rejected", reason, None
+
+        # Cheap check for registrations/deletions made by other workers
+        self._poll_gallery()
+
+        face_encodings = self.encode_faces(rgb_img, face_box, detect_img)
+
+        if not face_encodings:
+            return "error", "Face not detected", None
+
+        # Single vectorized pass for every face in the frame, against the
+        # snapshot taken once for this scan
+        gallery = self.gallery
+        result = self.match_encodings(face_encodings, gallery=gallery)
+        return self._first_match(result, 0, len(face_encodings), gallery.names)
+
+    def _all_matches(self, result, start, stop, gallery_names):
+        """Distinct names matched by faces in rows [start, stop), in frame order"""
+        names = []
+        if result is not None:
+            indices, distances = result
+            for best_match_index, distance in zip(indices[start:stop, 0], distances[start:stop, 0]):
+                if distance <= MATCH_TOLERANCE:
+                    nama = gallery_names[best_match_index]
+                    if nama not in names:
+                        names.append(nama)
+        return names
+
+    def recognize_faces(self, rgb_img):
+        """
+        Group scan: detect and encode every face in the frame, match them all
+        in one vectorized pass and return every recognized person.
+
+        Returns (status, message, names) with names in frame order, or
+        ("rejected", reason, []) when the quality gate turns the frame away.
+        """
+        reason, detect_img = self._gate(rgb_img)
+        if reason:
+            return "rejected", reason, []
+
+        self._poll_gallery()
+
+        face_encodings = self.encode_faces(rgb_img, detect_img=detect_img)
+
+        if not face_encodings:
+            return "error", "Face not detected", []
+
+        gallery = self.gallery
+        result = self.match_encodings(face_encodings, gallery=gallery)
+        names = self._all_matches(result, 0, len(face_encodings), gallery.names)
+        if not names:
+            return "error", "Face not recognized", []
+        return "success", f"{len(names)} of {len(face_encodings)} faces recognized", names
+
+    def recognize_batch(self, images):
+        """
+        Batch scan: decode/detect/encode all frames concurrently, then match
+        every face of every frame in one vectorized pass. Frames may be
+        base64 strings or raw encoded bytes.
+
+        Returns one (status, message, nama) tuple per frame, in input order
+        (("rejected", reason, None) for frames the quality gate turns away).
+        """
+        def encode(image):
+            try:
+                rgb_img = self.decode_image(image)
+                reason, detect_img = self._gate(rgb_img)
+                if reason:
+                    return reason
+                if detect_img is not None:
+                    return self.encode_faces(rgb_img, detect_img=detect_img)
+                return self.encode_faces(rgb_img)
+            except Exception as e:
+                return e
+
+        per_frame = list(self._batch_executor().map(encode, images))
+
+        self._poll_gallery()
+        all_encodings = [encoding for item in per_frame
+                         if isinstance(item, list) for encoding in item]
+        gallery = self.gallery
+        result = self.match_encodings(all_encodings, gallery=gallery) if all_encodings else None
+
+        results = []
+        offset = 0
+        for item in per_frame:
+            if isinstance(item, Exception):
+                results.append(("error", f"Invalid image: {item}", None))
+            elif isinstance(item, str):
+                results.append(("rejected", item, None))
+            elif not item:
+                results.append(("error", "Face not detected", None))
+            else:
+                results.append(self._first_match(result, offset, offset + len(item), gallery.names))
+                offset += len(item)
+        return results
+
+    def _batch_executor(self):
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.batch_workers, thread_name_prefix="face-batch")
+        return self._executor
+
+    def register_face(self, nama, image, face_id=None):
+        """
+        New Face Registration Process (More Precise)
+
+        face_id: stable id (the user's id) used later by remove_face /
+        rename_face. Re-registering a name tombstones its old row.
+        """
         try:
-            img_rgb = self.process_base64_image(base64_image)
-            
-            # --- ANTI-FAILURE DETECTION FEATURE ---
-            # number_of_times_to_upsample=1 is balance between speed & accuracy
-            face_locations = face_recognition.face_locations(img_rgb, number_of_times_to_upsample=1)
-            
-            if not face_locations:
-                # Try again with high contrast if failed
-                img_enhanced = cv2.convertScaleAbs(img_rgb, alpha=1.5, beta=20)
-                face_locations = face_recognition.face_locations(img_enhanced, number_of_times_to_upsample=1)
-                
-                if not face_locations:
-                    return False, "Face not found. Try moving closer to the camera."
-
-            # --- VALIDATION: ONLY 1 FACE ALLOWED ---
-            if len(face_locations) > 1:
-                return False, "Only 1 face is allowed per image!"
-
-            # Get encoding
-            face_encodings = face_recognition.face_encodings(img_rgb, face_locations)
-            
-            if not face_encodings:
-                return False, "Face detected but blurry. Ensure sufficient lighting."
+            img_rgb = self.decode_image(image)
 
-            # Save file
-            img_bgr = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR)
+            detect_img = img_rgb
+            if self.quality_gate:
+                # Exposure/blur only (HOG below is the face check); dark or
+                # flat photos are enhanced up front instead of a second HOG pass
+                reason, detect_img = self.assess_frame(img_rgb, detect=False)
+                if reason:
+                    return False, QUALITY_REASONS[reason]
+
+            encoding, error = encode_single_face(
+                img_rgb, detect_img, retry_enhanced=not self.quality_gate)
+            if error:
+                return False, error
+            face_encodings = [encoding]
+
+            # Save file + shared embedding store in one locked step, then
+            # map the new gallery generation like every other worker will
+            gallery_bytes = gallery_jpeg(image, img_rgb)
             file_path = os.path.join(self.known_faces_dir, f"{nama}.jpg")
-            cv2.imwrite(file_path, img_bgr)
-            
-            # --- OPTIMIZATION: APPEND TO MEMORY WITHOUT FULL RELOAD ---
-            self.known_encodings.append(face_encodings[0])
-            self.known_names.append(nama)
+            store = self.embedding_store
+            try:
+                with self._locked_store():
+                    with open(file_path, "wb") as f:
+                        f.write(gallery_bytes)
+                    store.load()
+                    store.put(f"{nama}.jpg", file_path, nama, face_encodings[0], face_id=face_id)
+                    store.save()
+                self._sync_gallery()
+            except OSError as e:
+                # --- FALLBACK: APPEND TO THIS WORKER'S MEMORY ONLY ---
+                print(f"Failed to update embedding store: {e}")
+                self._append_gallery(face_encodings[0], nama)
             
             return True, f"Success! Face {nama} saved."
 
         except Exception as e:
             print(f"Error Register: {str(e)}")
-            return False, f"System Error: {str(e)}"
\ No newline at end of file
+            return False, f"System Error: {str(e)}"
+
+
+# ============================================
+# DETECTION / ENCODING (also run in FacePool processes)
+# ============================================
+
+def locate_faces(rgb_img, scale, upsample=1):
+    """HOG on a copy downscaled by scale, boxes mapped back to rgb_img coordinates"""
+    if not scale or scale >= 1.0:
+        return face_recognition.face_locations(rgb_img, number_of_times_to_upsample=upsample)
+
+    small = cv2.resize(rgb_img, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    height, width = rgb_img.shape[:2]
+    locations = []
+    for top, right, bottom, left in face_recognition.face_locations(
+            small, number_of_times_to_upsample=upsample):
+        locations.append((
+            max(0, int(top / scale)),
+            min(width, int(round(right / scale))),
+            min(height, int(round(bottom / scale))),
+            max(0, int(left / scale)),
+        ))
+    return locations
+
+
+def locate_face_in_region(rgb_img, face_box):
+    """HOG on the padded face_box only; the largest face found, as a 0/1 item list"""
+    height, width = rgb_img.shape[:2]
+    top, right, bottom, left = face_box
+    pad_y = int((bottom - top) * REGION_PADDING)
+    pad_x = int((right - left) * REGION_PADDING)
+    top, bottom = max(0, top - pad_y), min(height, bottom + pad_y)
+    left, right = max(0, left - pad_x), min(width, right + pad_x)
+    if bottom - top < MIN_REGION_SIZE or right - left < MIN_REGION_SIZE:
+        return []
+
+    region = rgb_img[top:bottom, left:right]
+    scale = REGION_DETECT_SIZE / max(region.shape[:2])
+    small = cv2.resize(region, (0, 0), fx=scale, fy=scale,
+                       interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
+    found = face_recognition.face_locations(small, number_of_times_to_upsample=0)
+    if not found:
+        return []
+
+    t, r, b, l = max(found, key=lambda box: (box[1] - box[3]) * (box[2] - box[0]))
+    return [(
+        max(0, top + int(t / scale)),
+        min(width, left + int(round(r / scale))),
+        min(height, top + int(round(b / scale))),
+        max(0, left + int(l / scale)),
+    )]
+
+
+def detect_and_encode(rgb_img, face_box=None, detect_img=None, scale=0.5):
+    """
+    FaceEngine.encode_faces without the engine, for pool processes.
+    Returns (encodings, {stage: seconds}) so the caller can record timings.
+    """
+    detect_img = rgb_img if detect_img is None else detect_img
+    start = time.perf_counter()
+    if face_box is not None:
+        stage, locations = "detect_region", locate_face_in_region(detect_img, face_box)
+    else:
+        stage, locations = "detect", locate_faces(detect_img, scale)
+    detected = time.perf_counter()
+    encodings = face_recognition.face_encodings(rgb_img, locations)
+    return encodings, {stage: detected - start, "encode": time.perf_counter() - detected}
+
+
+def encode_single_face(img_rgb, detect_img=None, retry_enhanced=True):
+    """
+    Registration detect + encode (full resolution, exactly one face).
+    Returns (encoding, None) or (None, error message for the user).
+    """
+    detect_img = img_rgb if detect_img is None else detect_img
+
+    # --- ANTI-FAILURE DETECTION FEATURE ---
+    # number_of_times_to_upsample=1 is balance between speed & accuracy
+    face_locations = face_recognition.face_locations(detect_img, number_of_times_to_upsample=1)
+
+    if not face_locations and retry_enhanced:
+        # Try again with high contrast if failed
+        img_enhanced = cv2.convertScaleAbs(img_rgb, alpha=1.5, beta=20)
+        face_locations = face_recognition.face_locations(img_enhanced, number_of_times_to_upsample=1)
+
+    if not face_locations:
+        return None, "Face not found. Try moving closer to the camera."
+
+    # --- VALIDATION: ONLY 1 FACE ALLOWED ---
+    if len(face_locations) > 1:
+        return None, "Only 1 face is allowed per image!"
+
+    # Get encoding
+    face_encodings = face_recognition.face_encodings(img_rgb, face_locations)
+
+    if not face_encodings:
+        return None, "Face detected but blurry. Ensure sufficient lighting."
+    return face_encodings[0], None
+
+
+def gallery_jpeg(image, img_rgb):
+    """
+    known_faces JPEG for a registration: the uploaded bytes themselves when
+    they are an upright JPEG (no second encode), else img_rgb re-encoded.
+    """
+    if isinstance(image, (bytes, bytearray)) and is_upright_jpeg(image):
+        return bytes(image)
+    ok, encoded = cv2.imencode(".jpg", cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR))
+    if not ok:
+        raise ValueError("Failed to encode gallery image")
+    return encoded.tobytes()
+
+
+def decode_rgb(img_data):
+    """Encoded image bytes to the brightened RGB frame every detector here expects"""
+    nparr = np.frombuffer(img_data, np.uint8)
+    img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("Unable to decode image")
+
+    # Image optimization: Brighten slightly for easier detection
+    # (fused with the BGR -> RGB conversion in a single pass)
+    return cv2.transform(img, BRIGHTEN_BGR2RGB)
+
+
+def load_face_cascade():
+    """OpenCV's frontal face Haar cascade, None when this OpenCV build has none"""
+    path = os.path.join(getattr(getattr(cv2, "data", None), "haarcascades", ""),
+                        "haarcascade_frontalface_default.xml")
+    if not os.path.exists(path):
+        print("Haar face cascade not available: quality gate checks exposure/blur only")
+        return None
+    cascade = cv2.CascadeClassifier(path)
+    return None if cascade.empty() else cascade
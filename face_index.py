@@ -0,0 +1,366 @@
+import copy
+
+import numpy as np
+
+EMBEDDING_DIM = 128
+
+
+class BruteForceIndex:
+    """
+    Exact nearest-neighbour search over a contiguous float32 gallery.
+
+    Rows live in one (capacity, dim) buffer with precomputed squared norms.
+    The buffer grows by doubling so add() is amortised O(1). remove()
+    tombstones rows in place (infinite norm, so they never match) and keeps
+    every other row id valid; compaction is up to the gallery owner.
+    """
+
+    kind = "exact"
+
+    def __init__(self, dim=EMBEDDING_DIM):
+        self.dim = dim
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        self._sq_norms = np.empty(0, dtype=np.float32)
+        self._size = 0
+        self.tombstones = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def vectors(self):
+        """(N, dim) view of the stored rows, row i has id i"""
+        return self._vectors[:self._size]
+
+    @property
+    def sq_norms(self):
+        return self._sq_norms[:self._size]
+
+    def build(self, matrix, copy=True):
+        """
+        Replace the contents with ``matrix`` (row order = ids).
+
+        With ``copy=False`` a float32 matrix is used in place, so a read-only
+        memory map shared between processes stays shared; add() switches to a
+        private buffer the first time it has to grow.
+        """
+        matrix = np.asarray(matrix, dtype=np.float32).reshape(-1, self.dim)
+        self._vectors = matrix.copy() if copy else matrix
+        self._sq_norms = np.einsum('ij,ij->i', self._vectors, self._vectors)
+        self._size = len(matrix)
+        self.tombstones = 0
+
+    def extend(self, matrix):
+        """
+        Adopt ``matrix`` whose first len(self) rows are the current rows
+        (an appended gallery). Only the new rows are processed.
+        """
+        matrix = np.asarray(matrix, dtype=np.float32).reshape(-1, self.dim)
+        n = self._size
+        tail = matrix[n:]
+        self._sq_norms = np.concatenate(
+            [self._sq_norms[:n], np.einsum('ij,ij->i', tail, tail)])
+        self._vectors = matrix
+        self._size = len(matrix)
+        return range(n, len(matrix))
+
+    def add(self, vector):
+        """Append one row. Returns its id."""
+        n = self._size
+        if n == len(self._vectors):
+            capacity = max(16, 2 * n)
+            grown = np.empty((capacity, self.dim), dtype=np.float32)
+            grown[:n] = self._vectors[:n]
+            norms = np.empty(capacity, dtype=np.float32)
+            norms[:n] = self._sq_norms[:n]
+            self._vectors, self._sq_norms = grown, norms
+        row = np.asarray(vector, dtype=np.float32).reshape(self.dim)
+        self._vectors[n] = row
+        self._sq_norms[n] = row @ row
+        self._size = n + 1
+        return n
+
+    def clone(self):
+        """
+        Copy to extend, add to or tombstone without changing this index
+        (rows are shared: both only ever read rows below their own size).
+        """
+        other = copy.copy(self)
+        other._sq_norms = self._sq_norms.copy()
+        return other
+
+    def remove(self, ids):
+        """Tombstone rows by id (O(1) each). Already removed ids are ignored."""
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        ids = ids[np.isfinite(self._sq_norms[ids])]
+        self._sq_norms[ids] = np.inf
+        self.tombstones += len(ids)
+        return len(ids)
+
+    def search(self, probes, k=1):
+        """
+        Return ``(indices, distances)`` of shape (M, k), nearest first,
+        or None when the index is empty.
+        """
+        if self._size == 0:
+            return None
+        probes = _as_probes(probes, self.dim)
+        return _top_k(_sq_distances(probes, self.vectors, self.sq_norms), k)
+
+    def stats(self):
+        return {"kind": self.kind, "size": self._size, "tombstones": self.tombstones}
+
+
+class IVFFlatIndex(BruteForceIndex):
+    """
+    Approximate search with an inverted file over k-means cells (IVF-flat).
+
+    build() trains ``nlist`` centroids and buckets every row into its nearest
+    cell. A search only scans the rows in the ``nprobe`` cells closest to each
+    probe, so raising nprobe trades latency for recall (nprobe == nlist is
+    exact). Rows are kept in id order in the parent buffer; cells only hold ids.
+    """
+
+    kind = "ivf"
+
+    def __init__(self, dim=EMBEDDING_DIM, nlist=None, nprobe=8, train_iters=10,
+                 max_train_points=32, seed=0):
+        super().__init__(dim)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_iters = train_iters
+        # Training sample is capped at max_train_points per centroid
+        self.max_train_points = max_train_points
+        self.seed = seed
+        self.centroids = np.empty((0, dim), dtype=np.float32)
+        self._lists = []
+        self._list_sizes = np.empty(0, dtype=np.int64)
+        self.trained_size = 0
+
+    def build(self, matrix, copy=True, centroids=None):
+        """Build cells, reusing ``centroids`` from a previous index if given."""
+        super().build(matrix, copy=copy)
+        if centroids is not None and len(centroids) and self._size:
+            self.centroids = np.asarray(centroids, dtype=np.float32)
+            self._fill_cells()
+        else:
+            self.train()
+
+    def extend(self, matrix):
+        added = super().extend(matrix)
+        if len(self.centroids) == 0:
+            self.train()
+        else:
+            for row_id in added:
+                self._add_to_cell(row_id)
+        return added
+
+    def clone(self):
+        other = super().clone()
+        other._lists = [ids.copy() for ids in self._lists]
+        other._list_sizes = self._list_sizes.copy()
+        return other
+
+    def train(self):
+        """(Re)train centroids on the current rows and rebuild the cells."""
+        n = self._size
+        if n == 0:
+            self.centroids = np.empty((0, self.dim), dtype=np.float32)
+            self._lists, self._list_sizes = [], np.empty(0, dtype=np.int64)
+            self.trained_size = 0
+            return
+
+        nlist = min(self.nlist or default_nlist(n), n)
+        self.centroids = kmeans(self.vectors, nlist, iters=self.train_iters,
+                                max_points=nlist * self.max_train_points, seed=self.seed)
+        self._fill_cells()
+
+    def _fill_cells(self):
+        n = self._size
+        nlist = len(self.centroids)
+        assignment = self._assign(self.vectors)
+
+        order = np.argsort(assignment, kind='stable')
+        counts = np.bincount(assignment, minlength=nlist)
+        self._lists = []
+        self._list_sizes = counts.astype(np.int64)
+        start = 0
+        for count in counts:
+            ids = np.empty(max(16, int(count)), dtype=np.int64)
+            ids[:count] = order[start:start + count]
+            self._lists.append(ids)
+            start += count
+        self.trained_size = n
+
+    @property
+    def needs_retrain(self):
+        """Cells drift as rows are added without retraining; retrain on doubling."""
+        return self._size >= 2 * max(self.trained_size, 1)
+
+    def add(self, vector):
+        row_id = super().add(vector)
+        if len(self.centroids) == 0:
+            self.train()
+        else:
+            self._add_to_cell(row_id)
+        return row_id
+
+    def _add_to_cell(self, row_id):
+        cell = int(self._assign(self.vectors[row_id:row_id + 1])[0])
+        size = self._list_sizes[cell]
+        ids = self._lists[cell]
+        if size == len(ids):
+            grown = np.empty(2 * len(ids), dtype=np.int64)
+            grown[:size] = ids[:size]
+            self._lists[cell] = ids = grown
+        ids[size] = row_id
+        self._list_sizes[cell] = size + 1
+
+    def search(self, probes, k=1, nprobe=None):
+        if self._size == 0:
+            return None
+        probes = _as_probes(probes, self.dim)
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+
+        # Coarse step: nearest cells for every probe in one multiply
+        cell_dist = _sq_distances(probes, self.centroids)
+        cells = np.argpartition(cell_dist, nprobe - 1, axis=1)[:, :nprobe]
+
+        indices = np.zeros((len(probes), k), dtype=np.int64)
+        distances = np.full((len(probes), k), np.inf, dtype=np.float32)
+        vectors, sq_norms = self.vectors, self.sq_norms
+        for i, probe_cells in enumerate(cells):
+            candidates = np.concatenate(
+                [self._lists[c][:self._list_sizes[c]] for c in probe_cells])
+            if len(candidates) == 0:
+                continue
+            sq = _sq_distances(probes[i:i + 1], vectors[candidates], sq_norms[candidates])
+            local_idx, local_dist = _top_k(sq, k)
+            found = local_idx.shape[1]
+            indices[i, :found] = candidates[local_idx[0]]
+            distances[i, :found] = local_dist[0]
+        return indices, distances
+
+    def _assign(self, vectors, chunk=8192):
+        assignment = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), chunk):
+            block = vectors[start:start + chunk]
+            assignment[start:start + chunk] = np.argmin(_sq_distances(block, self.centroids), axis=1)
+        return assignment
+
+    def stats(self):
+        sizes = self._list_sizes
+        return {
+            "kind": self.kind,
+            "size": self._size,
+            "nlist": len(self.centroids),
+            "nprobe": self.nprobe,
+            "trained_size": self.trained_size,
+            "tombstones": self.tombstones,
+            "max_cell": int(sizes.max()) if len(sizes) else 0,
+        }
+
+
+class GallerySnapshot:
+    """
+    One version of the match gallery: the search index, the name of every
+    row and the store ``generation``/``epoch`` it was built from.
+
+    Snapshots are never changed once published. FaceEngine builds the next
+    one aside (cloning the index for incremental updates) and swaps the
+    reference, so a scan that took a snapshot never sees a half-built index
+    or names that do not line up with its rows.
+    """
+
+    __slots__ = ("index", "names", "generation", "epoch")
+
+    def __init__(self, index, names, generation=None, epoch=None):
+        self.index = index
+        self.names = names
+        self.generation = generation
+        self.epoch = epoch
+
+    def live_names(self):
+        """Names of the matchable rows (``names`` keeps tombstoned rows as None)"""
+        live = np.isfinite(self.index.sq_norms)
+        return [name for name, alive in zip(self.names, live) if alive and name is not None]
+
+
+def build_index(matrix, ann_threshold=20000, nlist=None, nprobe=8, dim=EMBEDDING_DIM,
+                copy=True, centroids=None):
+    """
+    Pick the index for a gallery: exact brute force below ``ann_threshold``
+    rows, IVF-flat above it. ``ann_threshold=0`` disables the ANN backend.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32).reshape(-1, dim)
+    if ann_threshold and len(matrix) >= ann_threshold:
+        index = IVFFlatIndex(dim=dim, nlist=nlist, nprobe=nprobe)
+        index.build(matrix, copy=copy, centroids=centroids)
+        return index
+    index = BruteForceIndex(dim=dim)
+    index.build(matrix, copy=copy)
+    return index
+
+
+def default_nlist(n):
+    """About 4 * sqrt(N) cells, the usual IVF starting point"""
+    return max(1, int(4 * np.sqrt(n)))
+
+
+def kmeans(vectors, k, iters=10, max_points=None, seed=0, chunk=8192):
+    """Plain Lloyd's k-means on a random sample. Returns (k, dim) float32 centroids."""
+    rng = np.random.default_rng(seed)
+    if max_points and len(vectors) > max_points:
+        sample = vectors[rng.choice(len(vectors), max_points, replace=False)]
+    else:
+        sample = vectors
+    sample = np.ascontiguousarray(sample, dtype=np.float32)
+    centroids = sample[rng.choice(len(sample), k, replace=False)].copy()
+
+    for _ in range(iters):
+        assignment = np.empty(len(sample), dtype=np.int64)
+        for start in range(0, len(sample), chunk):
+            block = sample[start:start + chunk]
+            assignment[start:start + chunk] = np.argmin(_sq_distances(block, centroids), axis=1)
+
+        # Per-cell means from a prefix sum over the rows sorted by cell
+        # (np.add.at / reduceat are an order of magnitude slower here)
+        order = np.argsort(assignment, kind='stable')
+        counts = np.bincount(assignment, minlength=k)
+        empty = counts == 0
+        prefix = np.zeros((len(sample) + 1, sample.shape[1]), dtype=np.float64)
+        np.cumsum(sample[order], axis=0, out=prefix[1:])
+        ends = np.cumsum(counts)
+        sums = prefix[ends] - prefix[ends - counts]
+        centroids[~empty] = sums[~empty] / counts[~empty, None]
+        # Re-seed empty cells with random points so every cell stays in use
+        if empty.any():
+            centroids[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+    return centroids
+
+
+def _as_probes(probes, dim):
+    return np.ascontiguousarray(probes, dtype=np.float32).reshape(-1, dim)
+
+
+def _sq_distances(probes, vectors, sq_norms=None):
+    """(M, N) squared L2 distances via ||a||^2 + ||b||^2 - 2 a.b"""
+    if sq_norms is None:
+        sq_norms = np.einsum('ij,ij->i', vectors, vectors)
+    sq = probes @ vectors.T
+    sq *= -2.0
+    sq += sq_norms[None, :]
+    sq += np.einsum('ij,ij->i', probes, probes)[:, None]
+    return sq
+
+
+def _top_k(sq_dist, k):
+    k = min(k, sq_dist.shape[1])
+    if k == 1:
+        indices = np.argmin(sq_dist, axis=1)[:, None]
+    else:
+        indices = np.argpartition(sq_dist, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(sq_dist, indices, axis=1), axis=1)
+        indices = np.take_along_axis(indices, order, axis=1)
+    distances = np.sqrt(np.maximum(np.take_along_axis(sq_dist, indices, axis=1), 0.0))
+    return indices, distances
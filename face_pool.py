@@ -0,0 +1,110 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+class FacePoolBusy(Exception):
+    """Every pool slot stayed taken for ``queue_timeout`` seconds"""
+
+
+class FacePool:
+    """
+    Pool of worker processes for the CPU-bound dlib stages (HOG detection
+    and face encoding), so request threads only decode, gate and match.
+
+    - Processes are started with ``spawn`` (safe next to the writer/feed
+      threads of a gunicorn worker) and import face_recognition once in
+      the initializer, which loads the dlib models for the process' life.
+    - Only frames go to the processes and only 128-d encodings come back:
+      the gallery stays in the caller (the shared mmapped EmbeddingStore).
+    - At most ``max_pending`` calls are queued or running; further callers
+      wait up to ``queue_timeout`` seconds for a slot, then get FacePoolBusy.
+    """
+
+    def __init__(self, processes, max_pending=None, queue_timeout=5.0):
+        self.processes = processes
+        self.max_pending = max_pending or processes * 2
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._executor = None
+        self.stats = {"completed": 0, "busy": 0, "restarts": 0}
+
+    def start(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=preload_models)
+        return self
+
+    def warm_in_background(self):
+        """Spawn every process (model load) before the first scan needs one"""
+        def run():
+            try:
+                executor = self.start()._executor
+                for future in [executor.submit(_ping) for _ in range(self.processes)]:
+                    future.result()
+                print(f"[Background] Face pool ready ({self.processes} processes)")
+            except Exception as e:
+                print(f"[Background] Face pool warm-up failed: {e}")
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def run(self, fn, *args):
+        """Call a module-level ``fn(*args)`` in a pool process and return its result"""
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self.stats["busy"] += 1
+            raise FacePoolBusy("Face pool busy")
+        with self._lock:
+            self._pending += 1
+        try:
+            executor = self.start()._executor
+            try:
+                result = executor.submit(fn, *args).result()
+            except BrokenProcessPool:
+                # A process died (OOM kill, segfault): replace the pool, retry once
+                self._restart(executor)
+                result = self.start()._executor.submit(fn, *args).result()
+            with self._lock:
+                self.stats["completed"] += 1
+            return result
+        finally:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+
+    def _restart(self, broken):
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+                self.stats["restarts"] += 1
+        print("Face pool process died, restarting the pool")
+        broken.shutdown(wait=False)
+
+    def depth(self):
+        """Calls queued or running in the pool"""
+        with self._lock:
+            return self._pending
+
+    def stop(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def preload_models():
+    # Importing face_recognition loads the dlib detector/landmark/encoder models
+    import face_recognition  # noqa: F401
+
+
+def _ping():
+    return True
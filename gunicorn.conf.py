@@ -0,0 +1,20 @@
+import glob
+import os
+import uuid
+
+# Loaded by gunicorn from the working directory (the Dockerfile also passes -c)
+
+
+def on_starting(server):
+    """
+    Master start-up, before any worker forks: give this boot its own metrics
+    id (workers inherit it through the environment) and drop the snapshot
+    files of earlier runs so a reused directory does not grow forever.
+    """
+    os.environ["METRICS_BOOT_ID"] = uuid.uuid4().hex[:12]
+    directory = os.getenv("METRICS_DIR", "metrics")
+    for path in glob.glob(os.path.join(directory, "worker-*.json")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
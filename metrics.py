@@ -0,0 +1,266 @@
+import bisect
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from pymongo import monitoring
+
+# Latency buckets (seconds) shared by every histogram: 1 ms .. 10 s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metrics:
+    """
+    Dependency-free counters, gauges and latency histograms rendered in the
+    Prometheus text format.
+
+    Recording is a perf_counter pair, a bisect over the bucket bounds and a
+    dict update under one lock, so stage timers stay on in production.
+
+    Every gunicorn worker has its own registry. With ``start(directory)``
+    each worker also dumps a snapshot to
+    ``<directory>/worker-<boot>-<pid>-<started>.json`` every ``flush_interval``
+    seconds, and ``render()`` sums the snapshots of all workers of the same
+    boot, so a scrape of any worker sees the whole server. ``boot`` is
+    ``METRICS_BOOT_ID`` (set once by the gunicorn master, see gunicorn.conf.py)
+    or the parent pid, so files left by an earlier server run are ignored,
+    and the start time keeps a worker that reuses a dead worker's pid from
+    overwriting its file. Counters and histograms of workers that exited
+    during this boot keep counting (totals never go down until a restart).
+    Gauges carry a ``worker`` label and are dropped once that worker's
+    snapshot is ``stale_after`` old.
+    """
+
+    def __init__(self, prefix="absensi", buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self.directory = None
+        self.flush_interval = 5.0
+        self.stale_after = 30.0
+        self.boot_id = None
+        self._started = int(time.time() * 1000)
+        self._lock = threading.Lock()
+        self._counters = {}       # name -> {labels: value}
+        self._histograms = {}     # name -> {labels: [bucket counts..., +Inf count, sum]}
+        self._callbacks = []      # (name, kind, fn, label)
+        self._help = {}           # name -> (kind, help)
+        self._thread = None
+        self._stop = threading.Event()
+
+    # ============================================
+    # RECORDING
+    # ============================================
+
+    def describe(self, name, kind, help_text):
+        self._help[f"{self.prefix}_{name}"] = (kind, help_text)
+
+    def inc(self, name, amount=1, **labels):
+        key = format_labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(f"{self.prefix}_{name}", {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        key = format_labels(labels)
+        slot = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._histograms.setdefault(f"{self.prefix}_{name}", {})
+            values = series.get(key)
+            if values is None:
+                values = series[key] = [0] * (len(self.buckets) + 2)
+            values[slot] += 1
+            values[-1] += seconds
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """``with metrics.timer("stage_seconds", stage="detect"):``"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def register(self, name, fn, help_text, kind="gauge", label=None):
+        """
+        Value read at snapshot time: ``fn()`` returns a number, or a dict of
+        ``{label value: number}`` when ``label`` is given. ``kind="counter"``
+        for monotonic totals kept elsewhere (e.g. AttendanceWriter.stats).
+        """
+        self.describe(name, kind, help_text)
+        self._callbacks.append((f"{self.prefix}_{name}", kind, fn, label))
+
+    # ============================================
+    # SNAPSHOTS (one per worker)
+    # ============================================
+
+    def snapshot(self):
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: {key: list(values) for key, values in series.items()}
+                          for name, series in self._histograms.items()}
+        gauges = {}
+        for name, kind, fn, label in self._callbacks:
+            try:
+                value = fn()
+            except Exception as e:
+                print(f"Metric {name} failed: {e}")
+                continue
+            if label is None:
+                series = {"": value}
+            else:
+                series = {format_labels({label: k}): v for k, v in value.items()}
+            (counters if kind == "counter" else gauges).setdefault(name, {}).update(series)
+        return {"pid": os.getpid(), "time": time.time(), "counters": counters,
+                "histograms": histograms, "gauges": gauges}
+
+    def start(self, directory, flush_interval=5.0, stale_after=30.0, boot_id=None):
+        """Share this worker's snapshot through ``directory`` (see class docstring)"""
+        if self._thread is not None:
+            return self
+        self.boot_id = boot_id or os.getenv("METRICS_BOOT_ID") or str(os.getppid())
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.stale_after = stale_after
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="metrics-writer")
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self.directory:
+            self._write()
+
+    def _path(self):
+        name = f"worker-{self.boot_id}-{os.getpid()}-{self._started}.json"
+        return os.path.join(self.directory, name)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self._write()
+
+    def _write(self):
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot(), f)
+            os.replace(tmp_path, self._path())
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[Background] Metrics snapshot failed: {e}")
+
+    def _snapshots(self):
+        """This worker's live snapshot plus the latest one of every other worker of this boot"""
+        snapshots = [self.snapshot()]
+        if self.directory:
+            own = self._path()
+            pattern = os.path.join(self.directory, f"worker-{glob.escape(self.boot_id or '')}-*.json")
+            for path in glob.glob(pattern):
+                if path == own:
+                    continue
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        snapshots.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return snapshots
+
+    # ============================================
+    # PROMETHEUS TEXT FORMAT
+    # ============================================
+
+    def render(self):
+        counters, histograms, gauges = {}, {}, {}
+        now = time.time()
+        for snap in self._snapshots():
+            for name, series in snap["counters"].items():
+                merged = counters.setdefault(name, {})
+                for key, value in series.items():
+                    merged[key] = merged.get(key, 0) + value
+            for name, series in snap["histograms"].items():
+                merged = histograms.setdefault(name, {})
+                for key, values in series.items():
+                    if key in merged:
+                        merged[key] = [a + b for a, b in zip(merged[key], values)]
+                    else:
+                        merged[key] = list(values)
+            # Gauges are per worker state (gallery size, queue depth): one series each
+            if now - snap["time"] <= self.stale_after:
+                worker = format_labels({"worker": snap["pid"]})
+                for name, series in snap["gauges"].items():
+                    merged = gauges.setdefault(name, {})
+                    for key, value in series.items():
+                        merged[",".join(p for p in (key, worker) if p)] = value
+
+        lines = []
+        for kind, families in (("counter", counters), ("gauge", gauges)):
+            for name in sorted(families):
+                self._header(lines, name, kind)
+                for key, value in sorted(families[name].items()):
+                    lines.append(f"{name}{wrap_labels(key)} {format_value(value)}")
+        for name in sorted(histograms):
+            self._header(lines, name, "histogram")
+            for key, values in sorted(histograms[name].items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + ("+Inf",), values[:-1]):
+                    cumulative += count
+                    le = 'le="{}"'.format(bound if bound == "+Inf" else format_value(bound))
+                    lines.append(f"{name}_bucket{wrap_labels(key, le)} {cumulative}")
+                lines.append(f"{name}_sum{wrap_labels(key)} {format_value(values[-1])}")
+                lines.append(f"{name}_count{wrap_labels(key)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines, name, kind):
+        kind, help_text = self._help.get(name, (kind, ""))
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo command listener: count and time every MongoDB command by name"""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        metrics.describe("mongo_command_seconds", "histogram", "MongoDB command latency")
+        metrics.describe("mongo_command_failures_total", "counter", "Failed MongoDB commands")
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.metrics.observe("mongo_command_seconds", event.duration_micros / 1e6,
+                             command=event.command_name)
+
+    def failed(self, event):
+        self.metrics.observe("mongo_command_seconds", event.duration_micros / 1e6,
+                             command=event.command_name)
+        self.metrics.inc("mongo_command_failures_total", command=event.command_name)
+
+
+def format_labels(labels):
+    """{"stage": "detect"} -> 'stage="detect"' (sorted, escaped); also the series key"""
+    return ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in sorted(labels.items()))
+
+
+def wrap_labels(key, extra=None):
+    parts = [p for p in (key, extra) if p]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+# Process-wide registry used by FaceEngine and the app routes
+metrics = Metrics()
+metrics.describe("stage_seconds", "histogram", "Latency of each scan/registration stage")
+metrics.describe("http_request_seconds", "histogram", "HTTP request latency by endpoint")
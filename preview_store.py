@@ -0,0 +1,136 @@
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import compress_image_to_jpeg, decode_data_uri
+
+
+class PreviewStore:
+    """
+    On-disk store for the registration preview JPEGs, one file per user
+    (``<directory>/<user_id>.jpg``).
+
+    Previews used to be base64 data URIs inside each ``daftar_wajah``
+    document, so every user list query and scan response carried them.
+    Documents now only keep ``preview_etag`` (SHA-1 of the JPEG) and the
+    bytes are served by ``/api/preview/<user_id>``. The directory is shared
+    by all gunicorn workers, like known_faces.
+    """
+
+    def __init__(self, directory="previews"):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def path(self, user_id):
+        return os.path.join(self.directory, f"{user_id}.jpg")
+
+    def put(self, user_id, jpeg_bytes):
+        """Write a preview atomically. Returns its ETag."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(jpeg_bytes)
+            os.replace(tmp_path, self.path(user_id))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return preview_etag(jpeg_bytes)
+
+    def put_in_background(self, users_collection, user_id, image_bytes, max_width=400, quality=85):
+        """
+        Make the thumbnail of a registration upload (JPEG draft-mode
+        downscale), store it and set the document's ``preview_etag``, after
+        the response. One thread, so a burst of registrations is a queue.
+        """
+        def run():
+            try:
+                try:
+                    jpeg_bytes = compress_image_to_jpeg(image_bytes, max_width=max_width, quality=quality)
+                except ValueError as e:
+                    print(f"[Background] Preview compression failed, using original: {e}")
+                    jpeg_bytes = image_bytes
+                etag = self.put(str(user_id), jpeg_bytes)
+                result = users_collection.update_one(
+                    {"_id": user_id}, {"$set": {"preview_etag": etag}})
+                if result.matched_count == 0:
+                    # User deleted before the preview was ready
+                    self.remove(str(user_id))
+            except Exception as e:
+                print(f"[Background] Preview not saved for {user_id}: {e}")
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview")
+        return self._executor.submit(run)
+
+    def drain(self, timeout=None):
+        """Wait for the queued background previews"""
+        if self._executor is not None:
+            self._executor.submit(lambda: None).result(timeout)
+
+    def get(self, user_id):
+        """Preview bytes, or None when the user has none"""
+        try:
+            with open(self.path(user_id), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def remove(self, user_id):
+        try:
+            os.remove(self.path(user_id))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".jpg"):
+                os.remove(os.path.join(self.directory, filename))
+
+    # ============================================
+    # LEGACY INLINE PREVIEWS
+    # ============================================
+
+    def migrate_user(self, users_collection, user):
+        """Move one document's inline ``image_preview`` to disk. Returns the bytes."""
+        jpeg_bytes = decode_data_uri(user["image_preview"])
+        etag = self.put(str(user["_id"]), jpeg_bytes)
+        users_collection.update_one(
+            {"_id": user["_id"]},
+            {"$set": {"preview_etag": etag}, "$unset": {"image_preview": ""}})
+        return jpeg_bytes
+
+    def migrate(self, users_collection):
+        """Move every inline preview to disk. Returns the number migrated."""
+        migrated = 0
+        for user in users_collection.find(
+                {"image_preview": {"$type": "string"}}, {"image_preview": 1}):
+            try:
+                self.migrate_user(users_collection, user)
+                migrated += 1
+            except ValueError as e:
+                print(f"Preview migration skipped for {user['_id']}: {e}")
+        return migrated
+
+    def migrate_in_background(self, users_collection):
+        def run():
+            try:
+                count = self.migrate(users_collection)
+                if count:
+                    print(f"[Background] Moved {count} inline previews to {self.directory}")
+            except Exception as e:
+                print(f"[Background] Preview migration failed: {e}")
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+
+def preview_etag(jpeg_bytes):
+    return hashlib.sha1(jpeg_bytes).hexdigest()
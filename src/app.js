@@ -155,7 +155,7 @@ function initScannerPage() {
           vW - det.xCenter * vW - (det.width * vW) / 2 + "px";
         guideline.style.top = det.yCenter * vH - (det.height * vH) / 2 + "px";
 
-        if (!isProcessing) processScan(video, canvas);
+        if (!isProcessing) processScan(video, canvas, det);
       } else {
         guideline.classList.add("hidden");
       }
@@ -212,33 +212,94 @@ function initScannerPage() {
     }
   }
 
-  // --- Process Scan API ---
-  async function processScan(videoEl, canvasEl) {
-    isProcessing = true;
-    updateStatus("Verifying...", "bg-blue-500");
-
-    canvasEl.width = 640;
-    canvasEl.height = 480;
+  // --- Face crop upload ---
+  // Only the padded face region MediaPipe found is uploaded (?region=face):
+  // a much smaller JPEG, cut from the full camera resolution, and the server
+  // verifies/encodes just that region instead of running HOG on a frame
+  const FACE_CROP_PADDING = 0.25;
+  const FACE_CROP_MAX_SIZE = 320;
+
+  function drawFaceCrop(videoEl, canvasEl, det) {
+    const vW = videoEl.videoWidth;
+    const vH = videoEl.videoHeight;
+    const w = det.width * vW;
+    const h = det.height * vH;
+    const sx = Math.max(0, det.xCenter * vW - w * (0.5 + FACE_CROP_PADDING));
+    const sy = Math.max(0, det.yCenter * vH - h * (0.5 + FACE_CROP_PADDING));
+    const sw = Math.min(vW - sx, w * (1 + 2 * FACE_CROP_PADDING));
+    const sh = Math.min(vH - sy, h * (1 + 2 * FACE_CROP_PADDING));
+    if (sw <= 0 || sh <= 0) return false;
+
+    const scale = Math.min(1, FACE_CROP_MAX_SIZE / Math.max(sw, sh));
+    canvasEl.width = Math.round(sw * scale);
+    canvasEl.height = Math.round(sh * scale);
     const ctx = canvasEl.getContext("2d");
     ctx.save();
     ctx.scale(-1, 1);
-    ctx.drawImage(videoEl, -canvasEl.width, 0, canvasEl.width, canvasEl.height);
+    ctx.drawImage(videoEl, sx, sy, sw, sh, -canvasEl.width, 0, canvasEl.width, canvasEl.height);
     ctx.restore();
+    return true;
+  }
+
+  // Kiosk clock minus server clock (ms), from the X-Server-Time echo of the
+  // last scan response. Frame timestamps are sent in server time so a kiosk
+  // clock that is off can't make every frame look stale; until the first
+  // response none is sent (the server then skips the age check).
+  let serverClockOffset = null;
+
+  function updateClockOffset(res) {
+    const serverTime = parseFloat(res.headers.get("X-Server-Time"));
+    if (serverTime) serverClockOffset = Date.now() - serverTime;
+  }
+
+  // --- Process Scan API ---
+  async function processScan(videoEl, canvasEl, det) {
+    isProcessing = true;
+    updateStatus("Verifying...", "bg-blue-500");
+
+    let url = "/api/process_image";
+    // Capture time: the server drops frames that waited too long to be scanned
+    const capturedAt = Date.now();
+    if (det && videoEl.videoWidth && drawFaceCrop(videoEl, canvasEl, det)) {
+      url += "?region=face";
+    } else {
+      canvasEl.width = 640;
+      canvasEl.height = 480;
+      const ctx = canvasEl.getContext("2d");
+      ctx.save();
+      ctx.scale(-1, 1);
+      ctx.drawImage(videoEl, -canvasEl.width, 0, canvasEl.width, canvasEl.height);
+      ctx.restore();
+    }
 
-    const base64 = canvasEl.toDataURL("image/jpeg", 0.7);
+    // Send the JPEG as a raw binary body (no base64/JSON overhead)
+    const blob = await new Promise((resolve) =>
+      canvasEl.toBlob(resolve, "image/jpeg", 0.7),
+    );
+
+    const headers = { "Content-Type": "image/jpeg" };
+    if (serverClockOffset !== null) {
+      headers["X-Frame-Timestamp"] = String(Math.round(capturedAt - serverClockOffset));
+    }
 
     try {
-      const res = await fetch("/api/process_image", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ image: base64 }),
-      });
+      const res = await fetch(url, { method: "POST", headers, body: blob });
+      updateClockOffset(res);
+      if (res.status === 503 || res.status === 408) {
+        // Shed by the server (busy / stale frame): quietly retry with a new frame
+        const retryAfter = parseFloat(res.headers.get("Retry-After") || "0");
+        updateStatus("Busy, retrying...", "bg-amber-500");
+        setTimeout(() => {
+          isProcessing = false;
+        }, Math.max(retryAfter * 1000, 300));
+        return;
+      }
       const data = await res.json();
 
       if (data.status === "success") {
         updateStatus(data.nama.toUpperCase(), "bg-emerald-500");
         speak("Attendance successful. Thank you " + data.nama);
-        loadLogs();
+        addLogs([{ nama: data.nama, waktu: data.waktu }]);
         // Show the new modular success alert
         showSuccessAlert(
           data.nama,
@@ -252,6 +313,13 @@ function initScannerPage() {
         setTimeout(() => {
           isProcessing = false;
         }, 2000);
+      } else if (data.reason) {
+        // Frame rejected by the quality gate: tell the user how to fix it
+        updateStatus(data.reason.replace("_", " ").toUpperCase(), "bg-amber-500");
+        speak(data.message);
+        setTimeout(() => {
+          isProcessing = false;
+        }, 1200);
       } else {
         updateStatus("UNKNOWN", "bg-red-500");
         speak("Face not recognized.");
@@ -265,22 +333,23 @@ function initScannerPage() {
   }
 
   // --- Load Logs ---
-  async function loadLogs() {
+  // --- Today's log: one full load, then only new rows (SSE or ?since=) ---
+  let todayLogs = [];
+  let logsSince = null;
+  let logsPollTimer = null;
+
+  function renderLogs() {
     const logsContainer = document.getElementById("today-logs");
     const emptyState = document.getElementById("empty-logs-state");
     if (!logsContainer) return;
 
-    try {
-      const r = await fetch("/api/today_log");
-      const d = await r.json();
-
-      if (emptyState) {
-        emptyState.classList.toggle("hidden", d.length > 0);
-      }
+    if (emptyState) {
+      emptyState.classList.toggle("hidden", todayLogs.length > 0);
+    }
 
-      logsContainer.innerHTML = d
-        .map(
-          (l) => `
+    logsContainer.innerHTML = todayLogs
+      .map(
+        (l) => `
                     <div class="p-3 bg-white/5 border border-white/5 rounded-xl flex items-center justify-between">
                         <div>
                             <p class="text-white font-bold text-xs uppercase">${l.nama}</p>
@@ -288,13 +357,65 @@ function initScannerPage() {
                         </div>
                     </div>
                 `,
-        )
-        .join("");
+      )
+      .join("");
+  }
+
+  // Rows may arrive more than once (overlapping cursors); nama is unique per day
+  function addLogs(rows) {
+    const known = new Set(todayLogs.map((l) => l.nama));
+    const fresh = rows.filter((l) => !known.has(l.nama));
+    if (fresh.length === 0) return;
+    todayLogs = fresh.concat(todayLogs);
+    renderLogs();
+  }
+
+  async function loadLogs() {
+    try {
+      // Revalidated with the ETag: unchanged lists come back as 304
+      const r = await fetch("/api/today_log");
+      todayLogs = await r.json();
+      renderLogs();
     } catch (e) {
       console.error("Error loading logs", e);
     }
   }
 
+  async function pollLogs() {
+    try {
+      // The first poll asks for everything to get a server-side cursor
+      const since = logsSince || "1970-01-01T00:00:00";
+      const r = await fetch(`/api/today_log?since=${encodeURIComponent(since)}`);
+      const d = await r.json();
+      addLogs(d.logs);
+      logsSince = d.since;
+    } catch (e) {
+      console.error("Error polling logs", e);
+    }
+  }
+
+  function startLogsPolling() {
+    if (!logsPollTimer) logsPollTimer = setInterval(pollLogs, 10000);
+  }
+
+  function subscribeLogs() {
+    if (typeof window.EventSource === "undefined") {
+      startLogsPolling();
+      return;
+    }
+    const source = new EventSource("/api/today_log/stream");
+    source.addEventListener("attendance", (e) => {
+      const row = JSON.parse(e.data);
+      logsSince = row.created_at || logsSince;
+      addLogs([row]);
+    });
+    source.addEventListener("reset", () => loadLogs());
+    source.onerror = () => {
+      // Closed for good (e.g. 503, too many streams): fall back to polling
+      if (source.readyState === EventSource.CLOSED) startLogsPolling();
+    };
+  }
+
   // --- Custom Success Alert ---
   window.showSuccessAlert = function (nama, imagePreview, waktu, userId) {
     const overlay = document.createElement("div");
@@ -337,7 +458,7 @@ function initScannerPage() {
   };
 
   // Initial load
-  loadLogs();
+  loadLogs().then(subscribeLogs);
 }
 
 // ==========================================
@@ -685,48 +806,82 @@ function initHistoryPage() {
 
   // --- Search Logic ---
   const searchInput = document.getElementById("tableSearch");
-  const tableRows = document.querySelectorAll(".log-row");
+  const tableBody = document.getElementById("logTableBody");
+  const loadMoreBtn = document.getElementById("loadMoreLogs");
   const noLogsFound = document.getElementById("noLogsFound");
 
   // Store current filter state
   let currentDateFilter = null;
+  let nextCursor = loadMoreBtn ? loadMoreBtn.dataset.nextCursor || null : null;
+
+  function createLogRow(log) {
+    const row = document.createElement("tr");
+    row.className = "log-row group hover:bg-blue-500/[0.02] transition-colors";
+    row.innerHTML = `
+      <td class="px-6 py-4">
+        <div class="flex items-center gap-3">
+          <div class="w-1 h-3 bg-blue-500/50 group-hover:bg-blue-500 transition-colors"></div>
+          <span class="text-xs font-bold text-slate-200 uppercase tracking-tight"></span>
+        </div>
+      </td>
+      <td class="px-6 py-4">
+        <div class="flex flex-col">
+          <span class="text-[10px] text-blue-400 font-mono font-bold"></span>
+          <span class="text-[8px] text-white-600 font-mono"></span>
+        </div>
+      </td>`;
+    // textContent: names come from user input
+    row.querySelector("td:nth-child(1) span").textContent = log.nama;
+    row.querySelector("td:nth-child(2) .font-bold").textContent = log.waktu;
+    row.querySelector("td:nth-child(2) .text-\\[8px\\]").textContent =
+      log.tanggal;
+    return row;
+  }
 
-  if (searchInput) {
-    searchInput.addEventListener("input", (e) => {
-      const term = e.target.value.toLowerCase();
-      filterTable(term, currentDateFilter);
-    });
+  // Fetch one page from the cursor-paginated API (replace=true starts over).
+  // Search and date filters run server-side so they cover every page.
+  let fetchSeq = 0;
+  async function fetchLogs(replace) {
+    const params = new URLSearchParams();
+    if (!replace && nextCursor) params.set("cursor", nextCursor);
+    if (currentDateFilter) {
+      params.set("date_from", currentDateFilter);
+      params.set("date_to", currentDateFilter);
+    }
+    const term = searchInput ? searchInput.value.trim() : "";
+    if (term) params.set("search", term);
+    const seq = ++fetchSeq;
+    const res = await fetch(`/api/admin/logs?${params}`);
+    const data = await res.json();
+    // A newer search/filter started meanwhile: drop this stale page
+    if (seq !== fetchSeq || data.status !== "success") return;
+
+    if (replace) tableBody.innerHTML = "";
+    data.logs.forEach((log) => tableBody.appendChild(createLogRow(log)));
+    nextCursor = data.next_cursor;
+    if (loadMoreBtn) loadMoreBtn.classList.toggle("hidden", !nextCursor);
+    updateNoLogs();
   }
 
-  // Function to filter table based on search term and date
-  function filterTable(searchTerm = "", dateFilter = null) {
-    let hasVisible = false;
-
-    tableRows.forEach((row) => {
-      const text = row.innerText.toLowerCase();
-      const matchSearch = searchTerm === "" || text.includes(searchTerm);
-
-      let matchDate = true;
-      if (dateFilter) {
-        // Get the date from the row (format: YYYY-MM-DD)
-        const dateCell = row.querySelector("td:nth-child(2) .text-\\[8px\\]");
-        if (dateCell) {
-          const rowDate = dateCell.innerText.trim();
-          matchDate = rowDate === dateFilter;
-        }
-      }
+  window.loadMoreLogs = function () {
+    if (nextCursor) fetchLogs(false);
+  };
 
-      const shouldShow = matchSearch && matchDate;
-      row.style.display = shouldShow ? "" : "none";
-      if (shouldShow) hasVisible = true;
+  if (searchInput) {
+    let searchTimer = null;
+    searchInput.addEventListener("input", () => {
+      // Debounced: one request once typing pauses, from the first page
+      clearTimeout(searchTimer);
+      searchTimer = setTimeout(() => {
+        nextCursor = null;
+        fetchLogs(true);
+      }, 250);
     });
+  }
 
+  function updateNoLogs() {
     if (noLogsFound) {
-      if (hasVisible) {
-        noLogsFound.classList.add("hidden");
-      } else {
-        noLogsFound.classList.remove("hidden");
-      }
+      noLogsFound.classList.toggle("hidden", tableBody.children.length > 0);
     }
   }
 
@@ -735,6 +890,9 @@ function initHistoryPage() {
     const calendarEl = document.getElementById("calendar");
     const tooltip = document.getElementById("calendar-tooltip");
 
+    // Per-day names, fetched on click and kept for hover
+    const dayDetails = {};
+
     window.calendarInstance = new window.FullCalendar.Calendar(calendarEl, {
       plugins: [window.dayGridPlugin, window.interactionPlugin],
       initialView: "dayGridMonth",
@@ -755,7 +913,7 @@ function initHistoryPage() {
         // Toggle filter: if same date clicked, reset filter
         if (currentDateFilter === clickedDate) {
           currentDateFilter = null;
-          filterTable(searchInput ? searchInput.value.toLowerCase() : "", null);
+          fetchLogs(true);
 
           // Show notification
           showDateFilterNotification("Date filter removed - Showing all data");
@@ -765,11 +923,14 @@ function initHistoryPage() {
           // Highlight selected date
           info.dayEl.classList.add("selected-date");
 
-          // Filter table by date
-          filterTable(
-            searchInput ? searchInput.value.toLowerCase() : "",
-            clickedDate,
-          );
+          // Reload the table with that day's logs
+          fetchLogs(true);
+
+          // Names for the day are only fetched when it is clicked
+          loadDayDetails(clickedDate).then((users) => {
+            if (users && users.length)
+              showTooltip({ is_admin: true, users }, info.dayEl);
+          });
 
           // Show notification with formatted date
           const formattedDate = new Date(
@@ -817,8 +978,9 @@ function initHistoryPage() {
           // Attach Hover to the CELL (td), not just the event anchor
           // Only for desktop view (>= 768px) to avoid bug on mobile
           if (window.innerWidth >= 768) {
+            const day = info.event.startStr;
             dayCell.addEventListener("mouseenter", () =>
-              showTooltip(eventProps, dayCell),
+              showTooltip({ ...eventProps, users: dayDetails[day] }, dayCell),
             );
             dayCell.addEventListener("mouseleave", () => hideTooltip());
           }
@@ -859,6 +1021,19 @@ function initHistoryPage() {
       }, 3000);
     }
 
+    async function loadDayDetails(day) {
+      if (!dayDetails[day]) {
+        try {
+          const r = await fetch(`/api/admin/calendar_day/${day}`);
+          const d = await r.json();
+          if (d.status === "success") dayDetails[day] = d.users;
+        } catch (e) {
+          console.error("Error loading day details", e);
+        }
+      }
+      return dayDetails[day];
+    }
+
     // Helper Functions for Tooltip
     function showTooltip(props, targetEl) {
       const tooltip = document.getElementById("calendar-tooltip");
@@ -878,6 +1053,9 @@ function initHistoryPage() {
                             <span class="font-mono text-blue-400">${u.waktu}</span>
                         </div>`;
           });
+          if (!props.users && props.count) {
+            html = `<span class="text-slate-400 text-[10px]">${props.count} present - click the date for names</span>`;
+          }
           contentEl.innerHTML =
             html || '<span class="text-slate-500 text-[10px]">Kosong</span>';
         } else {
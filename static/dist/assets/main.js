@@ -1,135 +0,0 @@
-const Da={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":2,"stroke-linecap":"round","stroke-linejoin":"round"};const _a=([t,e,n])=>{const r=document.createElementNS("http://www.w3.org/2000/svg",t);return Object.keys(e).forEach(i=>{r.setAttribute(i,String(e[i]))}),n?.length&&n.forEach(i=>{const o=_a(i);r.appendChild(o)}),r},Fu=(t,e={})=>{const r={...Da,...e};return _a(["svg",r,t])};const Uu=t=>Array.from(t.attributes).reduce((e,n)=>(e[n.name]=n.value,e),{}),Vu=t=>typeof t=="string"?t:!t||!t.class?"":t.class&&typeof t.class=="string"?t.class.split(" "):t.class&&Array.isArray(t.class)?t.class:"",zu=t=>t.flatMap(Vu).map(n=>n.trim()).filter(Boolean).filter((n,r,i)=>i.indexOf(n)===r).join(" "),Wu=t=>t.replace(/(\w)(\w*)(_|-|\s*)/g,(e,n,r)=>n.toUpperCase()+r.toLowerCase()),us=(t,{nameAttr:e,icons:n,attrs:r})=>{const i=t.getAttribute(e);if(i==null)return;const o=Wu(i),a=n[o];if(!a)return console.warn(`${t.outerHTML} icon name was not found in the provided icons object.`);const l=Uu(t),u={...Da,"data-lucide":i,...r,...l},h=zu(["lucide",`lucide-${i}`,l,r]);h&&Object.assign(u,{class:h});const f=Fu(a,u);return t.parentNode?.replaceChild(f,t)};const $u=[["path",{d:"M5 12h14"}],["path",{d:"m12 5 7 7-7 7"}]];const Gu=[["path",{d:"M8 2v4"}],["path",{d:"M16 2v4"}],["rect",{width:"18",height:"18",x:"3",y:"4",rx:"2"}],["path",{d:"M3 10h18"}]];const qu=[["path",{d:"M13.997 4a2 2 0 0 1 1.76 1.05l.486.9A2 2 0 0 0 18.003 7H20a2 2 0 0 1 2 2v9a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V9a2 2 0 0 1 2-2h1.997a2 2 0 0 0 1.759-1.048l.489-.904A2 2 0 0 1 10.004 4z"}],["circle",{cx:"12",cy:"13",r:"3"}]];const Yu=[["path",{d:"M21.801 10A10 10 0 1 1 17 3.335"}],["path",{d:"m9 11 3 3L22 4"}]];const Qu=[["path",{d:"m18 16 4-4-4-4"}],["path",{d:"m6 8-4 4 4 4"}],["path",{d:"m14.5 4-5 16"}]];const Zu=[["path",{d:"M12 10a2 2 0 0 0-2 2c0 1.02-.1 2.51-.26 4"}],["path",{d:"M14 13.12c0 2.38 0 6.38-1 8.88"}],["path",{d:"M17.29 21.02c.12-.6.43-2.3.5-3.02"}],["path",{d:"M2 12a10 10 0 0 1 18-6"}],["path",{d:"M2 16h.01"}],["path",{d:"M21.8 16c.2-2 .131-5.354 0-6"}],["path",{d:"M5 19.5C5.5 18 6 15 6 12a6 6 0 0 1 .34-2"}],["path",{d:"M8.65 22c.21-.66.45-1.32.57-2"}],["path",{d:"M9 6.8a6 6 0 0 1 9 5.2v2"}]];const Xu=[["path",{d:"M10 20a1 1 0 0 0 .553.895l2 1A1 1 0 0 0 14 21v-7a2 2 0 0 1 .517-1.341L21.74 4.67A1 1 0 0 0 21 3H3a1 1 0 0 0-.742 1.67l7.225 7.989A2 2 0 0 1 10 14z"}]];const Ju=[["path",{d:"M3 12a9 9 0 1 0 9-9 9.75 9.75 0 0 0-6.74 2.74L3 8"}],["path",{d:"M3 3v5h5"}],["path",{d:"M12 7v5l4 2"}]];const Ku=[["path",{d:"M16 5h6"}],["path",{d:"M19 2v6"}],["path",{d:"M21 11.5V19a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h7.5"}],["path",{d:"m21 15-3.086-3.086a2 2 0 0 0-2.828 0L6 21"}],["circle",{cx:"9",cy:"9",r:"2"}]];const ed=[["circle",{cx:"12",cy:"12",r:"10"}],["path",{d:"M12 16v-4"}],["path",{d:"M12 8h.01"}]];const td=[["path",{d:"m10 17 5-5-5-5"}],["path",{d:"M15 12H3"}],["path",{d:"M15 3h4a2 2 0 0 1 2 2v14a2 2 0 0 1-2 2h-4"}]];const nd=[["path",{d:"m16 17 5-5-5-5"}],["path",{d:"M21 12H9"}],["path",{d:"M9 21H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h4"}]];const rd=[["path",{d:"M12 16h.01"}],["path",{d:"M12 8v4"}],["path",{d:"M15.312 2a2 2 0 0 1 1.414.586l4.688 4.688A2 2 0 0 1 22 8.688v6.624a2 2 0 0 1-.586 1.414l-4.688 4.688a2 2 0 0 1-1.414.586H8.688a2 2 0 0 1-1.414-.586l-4.688-4.688A2 2 0 0 1 2 15.312V8.688a2 2 0 0 1 .586-1.414l4.688-4.688A2 2 0 0 1 8.688 2z"}]];const id=[["path",{d:"M5 12h14"}],["path",{d:"M12 5v14"}]];const od=[["path",{d:"M4 11a9 9 0 0 1 9 9"}],["path",{d:"M4 4a16 16 0 0 1 16 16"}],["circle",{cx:"5",cy:"19",r:"1"}]];const sd=[["path",{d:"M15.2 3a2 2 0 0 1 1.4.6l3.8 3.8a2 2 0 0 1 .6 1.4V19a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2z"}],["path",{d:"M17 21v-7a1 1 0 0 0-1-1H8a1 1 0 0 0-1 1v7"}],["path",{d:"M7 3v4a1 1 0 0 0 1 1h7"}]];const ad=[["path",{d:"M3 7V5a2 2 0 0 1 2-2h2"}],["path",{d:"M17 3h2a2 2 0 0 1 2 2v2"}],["path",{d:"M21 17v2a2 2 0 0 1-2 2h-2"}],["path",{d:"M7 21H5a2 2 0 0 1-2-2v-2"}],["path",{d:"M8 14s1.5 2 4 2 4-2 4-2"}],["path",{d:"M9 9h.01"}],["path",{d:"M15 9h.01"}]];const ld=[["path",{d:"m13.5 8.5-5 5"}],["path",{d:"m8.5 8.5 5 5"}],["circle",{cx:"11",cy:"11",r:"8"}],["path",{d:"m21 21-4.3-4.3"}]];const cd=[["path",{d:"m21 21-4.34-4.34"}],["circle",{cx:"11",cy:"11",r:"8"}]];const ud=[["path",{d:"M20 13c0 5-3.5 7.5-7.66 8.95a1 1 0 0 1-.67-.01C7.5 20.5 4 18 4 13V6a1 1 0 0 1 1-1c2 0 4.5-1.2 6.24-2.72a1.17 1.17 0 0 1 1.52 0C14.51 3.81 17 5 19 5a1 1 0 0 1 1 1z"}],["path",{d:"m9 12 2 2 4-4"}]];const dd=[["path",{d:"M12 3H5a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7"}],["path",{d:"M18.375 2.625a1 1 0 0 1 3 3l-9.013 9.014a2 2 0 0 1-.853.505l-2.873.84a.5.5 0 0 1-.62-.62l.84-2.873a2 2 0 0 1 .506-.852z"}]];const fd=[["rect",{width:"18",height:"18",x:"3",y:"3",rx:"2"}],["path",{d:"M8 12h8"}],["path",{d:"M12 8v8"}]];const hd=[["path",{d:"M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6"}],["path",{d:"M3 6h18"}],["path",{d:"M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"}]];const gd=[["path",{d:"M12 3v12"}],["path",{d:"m17 8-5-5-5 5"}],["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"}]];const pd=[["path",{d:"M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2"}],["circle",{cx:"9",cy:"7",r:"4"}],["line",{x1:"19",x2:"19",y1:"8",y2:"14"}],["line",{x1:"22",x2:"16",y1:"11",y2:"11"}]];const md=[["path",{d:"M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2"}],["circle",{cx:"12",cy:"7",r:"4"}]];const vd=[["path",{d:"M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2"}],["path",{d:"M16 3.128a4 4 0 0 1 0 7.744"}],["path",{d:"M22 21v-2a4 4 0 0 0-3-3.87"}],["circle",{cx:"9",cy:"7",r:"4"}]];const wd=[["path",{d:"M18 6 6 18"}],["path",{d:"m6 6 12 12"}]];const Ta=({icons:t={},nameAttr:e="data-lucide",attrs:n={},root:r=document,inTemplates:i}={})=>{if(!Object.values(t).length)throw new Error(`Please provide an icons object.
-If you want to use all the icons you can import it like:
- \`import { createIcons, icons } from 'lucide';
-lucide.createIcons({icons});\``);if(typeof r>"u")throw new Error("`createIcons()` only works in a browser environment.");if(Array.from(r.querySelectorAll(`[${e}]`)).forEach(a=>us(a,{nameAttr:e,icons:t,attrs:n})),i&&Array.from(r.querySelectorAll("template")).forEach(l=>Ta({icons:t,nameAttr:e,attrs:n,root:l.content,inTemplates:i})),e==="data-lucide"){const a=r.querySelectorAll("[icon-name]");a.length>0&&(console.warn("[Lucide] Some icons were found with the now deprecated icon-name attribute. These will still be replaced for backwards compatibility, but will no longer be supported in v1.0 and you should switch to data-lucide"),Array.from(a).forEach(l=>us(l,{nameAttr:"icon-name",icons:t,attrs:n})))}};function xa(t,e,n){if(typeof t=="function"?t===e:t.has(e))return arguments.length<3?e:n;throw new TypeError("Private element is not present on this object")}function bd(t,e){if(e.has(t))throw new TypeError("Cannot initialize the same private elements twice on an object")}function ds(t,e){return t.get(xa(t,e))}function yd(t,e,n){bd(t,e),e.set(t,n)}function Ed(t,e,n){return t.set(xa(t,e),n),n}const Ad=100,H={},Cd=()=>{H.previousActiveElement instanceof HTMLElement?(H.previousActiveElement.focus(),H.previousActiveElement=null):document.body&&document.body.focus()},Sd=t=>new Promise(e=>{if(!t)return e();const n=window.scrollX,r=window.scrollY;H.restoreFocusTimeout=setTimeout(()=>{Cd(),e()},Ad),window.scrollTo(n,r)}),Ra="swal2-",Dd=["container","shown","height-auto","iosfix","popup","modal","no-backdrop","no-transition","toast","toast-shown","show","hide","close","title","html-container","actions","confirm","deny","cancel","footer","icon","icon-content","image","input","file","range","select","radio","checkbox","label","textarea","inputerror","input-label","validation-message","progress-steps","active-progress-step","progress-step","progress-step-line","loader","loading","styled","top","top-start","top-end","top-left","top-right","center","center-start","center-end","center-left","center-right","bottom","bottom-start","bottom-end","bottom-left","bottom-right","grow-row","grow-column","grow-fullscreen","rtl","timer-progress-bar","timer-progress-bar-container","scrollbar-measure","icon-success","icon-warning","icon-info","icon-question","icon-error","draggable","dragging"],_=Dd.reduce((t,e)=>(t[e]=Ra+e,t),{}),_d=["success","warning","info","question","error"],Gn=_d.reduce((t,e)=>(t[e]=Ra+e,t),{}),ka="SweetAlert2:",Di=t=>t.charAt(0).toUpperCase()+t.slice(1),Te=t=>{console.warn(`${ka} ${typeof t=="object"?t.join(" "):t}`)},St=t=>{console.error(`${ka} ${t}`)},fs=[],Td=t=>{fs.includes(t)||(fs.push(t),Te(t))},Ia=(t,e=null)=>{Td(`"${t}" is deprecated and will be removed in the next major release.${e?` Use "${e}" instead.`:""}`)},vr=t=>typeof t=="function"?t():t,_i=t=>t&&typeof t.toPromise=="function",fn=t=>_i(t)?t.toPromise():Promise.resolve(t),Ti=t=>t&&Promise.resolve(t)===t,xe=()=>document.body.querySelector(`.${_.container}`),hn=t=>{const e=xe();return e?e.querySelector(t):null},Pe=t=>hn(`.${t}`),ne=()=>Pe(_.popup),Wt=()=>Pe(_.icon),xd=()=>Pe(_["icon-content"]),Ma=()=>Pe(_.title),xi=()=>Pe(_["html-container"]),Oa=()=>Pe(_.image),Ri=()=>Pe(_["progress-steps"]),wr=()=>Pe(_["validation-message"]),Ye=()=>hn(`.${_.actions} .${_.confirm}`),$t=()=>hn(`.${_.actions} .${_.cancel}`),Dt=()=>hn(`.${_.actions} .${_.deny}`),Rd=()=>Pe(_["input-label"]),Gt=()=>hn(`.${_.loader}`),gn=()=>Pe(_.actions),Ba=()=>Pe(_.footer),br=()=>Pe(_["timer-progress-bar"]),ki=()=>Pe(_.close),kd=`
-  a[href],
-  area[href],
-  input:not([disabled]),
-  select:not([disabled]),
-  textarea:not([disabled]),
-  button:not([disabled]),
-  iframe,
-  object,
-  embed,
-  [tabindex="0"],
-  [contenteditable],
-  audio[controls],
-  video[controls],
-  summary
-`,Ii=()=>{const t=ne();if(!t)return[];const e=t.querySelectorAll('[tabindex]:not([tabindex="-1"]):not([tabindex="0"])'),n=Array.from(e).sort((o,a)=>{const l=parseInt(o.getAttribute("tabindex")||"0"),u=parseInt(a.getAttribute("tabindex")||"0");return l>u?1:l<u?-1:0}),r=t.querySelectorAll(kd),i=Array.from(r).filter(o=>o.getAttribute("tabindex")!=="-1");return[...new Set(n.concat(i))].filter(o=>Ie(o))},Mi=()=>Xe(document.body,_.shown)&&!Xe(document.body,_["toast-shown"])&&!Xe(document.body,_["no-backdrop"]),yr=()=>{const t=ne();return t?Xe(t,_.toast):!1},Id=()=>{const t=ne();return t?t.hasAttribute("data-loading"):!1},Ne=(t,e)=>{if(t.textContent="",e){const r=new DOMParser().parseFromString(e,"text/html"),i=r.querySelector("head");i&&Array.from(i.childNodes).forEach(a=>{t.appendChild(a)});const o=r.querySelector("body");o&&Array.from(o.childNodes).forEach(a=>{a instanceof HTMLVideoElement||a instanceof HTMLAudioElement?t.appendChild(a.cloneNode(!0)):t.appendChild(a)})}},Xe=(t,e)=>{if(!e)return!1;const n=e.split(/\s+/);for(let r=0;r<n.length;r++)if(!t.classList.contains(n[r]))return!1;return!0},Md=(t,e)=>{Array.from(t.classList).forEach(n=>{!Object.values(_).includes(n)&&!Object.values(Gn).includes(n)&&!Object.values(e.showClass||{}).includes(n)&&t.classList.remove(n)})},Be=(t,e,n)=>{if(Md(t,e),!e.customClass)return;const r=e.customClass[n];if(r){if(typeof r!="string"&&!r.forEach){Te(`Invalid type of customClass.${n}! Expected string or iterable object, got "${typeof r}"`);return}te(t,r)}},Er=(t,e)=>{if(!e)return null;switch(e){case"select":case"textarea":case"file":return t.querySelector(`.${_.popup} > .${_[e]}`);case"checkbox":return t.querySelector(`.${_.popup} > .${_.checkbox} input`);case"radio":return t.querySelector(`.${_.popup} > .${_.radio} input:checked`)||t.querySelector(`.${_.popup} > .${_.radio} input:first-child`);case"range":return t.querySelector(`.${_.popup} > .${_.range} input`);default:return t.querySelector(`.${_.popup} > .${_.input}`)}},Pa=t=>{if(t.focus(),t.type!=="file"){const e=t.value;t.value="",t.value=e}},Na=(t,e,n)=>{!t||!e||(typeof e=="string"&&(e=e.split(/\s+/).filter(Boolean)),e.forEach(r=>{Array.isArray(t)?t.forEach(i=>{n?i.classList.add(r):i.classList.remove(r)}):n?t.classList.add(r):t.classList.remove(r)}))},te=(t,e)=>{Na(t,e,!0)},je=(t,e)=>{Na(t,e,!1)},nt=(t,e)=>{const n=Array.from(t.children);for(let r=0;r<n.length;r++){const i=n[r];if(i instanceof HTMLElement&&Xe(i,e))return i}},bt=(t,e,n)=>{n===`${parseInt(`${n}`)}`&&(n=parseInt(n)),n||parseInt(`${n}`)===0?t.style.setProperty(e,typeof n=="number"?`${n}px`:n):t.style.removeProperty(e)},ye=(t,e="flex")=>{t&&(t.style.display=e)},Se=t=>{t&&(t.style.display="none")},Oi=(t,e="block")=>{t&&new MutationObserver(()=>{pn(t,t.innerHTML,e)}).observe(t,{childList:!0,subtree:!0})},hs=(t,e,n,r)=>{const i=t.querySelector(e);i&&i.style.setProperty(n,r)},pn=(t,e,n="flex")=>{e?ye(t,n):Se(t)},Ie=t=>!!(t&&(t.offsetWidth||t.offsetHeight||t.getClientRects().length)),Od=()=>!Ie(Ye())&&!Ie(Dt())&&!Ie($t()),ui=t=>t.scrollHeight>t.clientHeight,Bd=(t,e)=>{let n=t;for(;n&&n!==e;){if(ui(n))return!0;n=n.parentElement}return!1},La=t=>{const e=window.getComputedStyle(t),n=parseFloat(e.getPropertyValue("animation-duration")||"0"),r=parseFloat(e.getPropertyValue("transition-duration")||"0");return n>0||r>0},Bi=(t,e=!1)=>{const n=br();n&&Ie(n)&&(e&&(n.style.transition="none",n.style.width="100%"),setTimeout(()=>{n.style.transition=`width ${t/1e3}s linear`,n.style.width="0%"},10))},Pd=()=>{const t=br();if(!t)return;const e=parseInt(window.getComputedStyle(t).width);t.style.removeProperty("transition"),t.style.width="100%";const n=parseInt(window.getComputedStyle(t).width),r=e/n*100;t.style.width=`${r}%`},Nd=()=>typeof window>"u"||typeof document>"u",Ld=`
- <div aria-labelledby="${_.title}" aria-describedby="${_["html-container"]}" class="${_.popup}" tabindex="-1">
-   <button type="button" class="${_.close}"></button>
-   <ul class="${_["progress-steps"]}"></ul>
-   <div class="${_.icon}"></div>
-   <img class="${_.image}" />
-   <h2 class="${_.title}" id="${_.title}"></h2>
-   <div class="${_["html-container"]}" id="${_["html-container"]}"></div>
-   <input class="${_.input}" id="${_.input}" />
-   <input type="file" class="${_.file}" />
-   <div class="${_.range}">
-     <input type="range" />
-     <output></output>
-   </div>
-   <select class="${_.select}" id="${_.select}"></select>
-   <div class="${_.radio}"></div>
-   <label class="${_.checkbox}">
-     <input type="checkbox" id="${_.checkbox}" />
-     <span class="${_.label}"></span>
-   </label>
-   <textarea class="${_.textarea}" id="${_.textarea}"></textarea>
-   <div class="${_["validation-message"]}" id="${_["validation-message"]}"></div>
-   <div class="${_.actions}">
-     <div class="${_.loader}"></div>
-     <button type="button" class="${_.confirm}"></button>
-     <button type="button" class="${_.deny}"></button>
-     <button type="button" class="${_.cancel}"></button>
-   </div>
-   <div class="${_.footer}"></div>
-   <div class="${_["timer-progress-bar-container"]}">
-     <div class="${_["timer-progress-bar"]}"></div>
-   </div>
- </div>
-`.replace(/(^|\n)\s*/g,""),Hd=()=>{const t=xe();return t?(t.remove(),je([document.documentElement,document.body],[_["no-backdrop"],_["toast-shown"],_["has-column"]]),!0):!1},gt=()=>{H.currentInstance&&H.currentInstance.resetValidationMessage()},jd=()=>{const t=ne();if(!t)return;const e=nt(t,_.input),n=nt(t,_.file),r=t.querySelector(`.${_.range} input`),i=t.querySelector(`.${_.range} output`),o=nt(t,_.select),a=t.querySelector(`.${_.checkbox} input`),l=nt(t,_.textarea);e&&(e.oninput=gt),n&&(n.onchange=gt),o&&(o.onchange=gt),a&&(a.onchange=gt),l&&(l.oninput=gt),r&&i&&(r.oninput=()=>{gt(),i.value=r.value},r.onchange=()=>{gt(),i.value=r.value})},Fd=t=>{if(typeof t=="string"){const e=document.querySelector(t);if(!e)throw new Error(`Target element "${t}" not found`);return e}return t},Ud=t=>{const e=ne();e&&(e.setAttribute("role",t.toast?"alert":"dialog"),e.setAttribute("aria-live",t.toast?"polite":"assertive"),t.toast||e.setAttribute("aria-modal","true"))},Vd=t=>{window.getComputedStyle(t).direction==="rtl"&&(te(xe(),_.rtl),H.isRTL=!0)},zd=t=>{const e=Hd();if(Nd()){St("SweetAlert2 requires document to initialize");return}const n=document.createElement("div");n.className=_.container,e&&te(n,_["no-transition"]),Ne(n,Ld),n.dataset.swal2Theme=t.theme;const r=Fd(t.target||"body");r.appendChild(n),t.topLayer&&(n.setAttribute("popover",""),n.showPopover()),Ud(t),Vd(r),jd()},Pi=(t,e)=>{t instanceof HTMLElement?e.appendChild(t):typeof t=="object"?Wd(t,e):t&&Ne(e,t)},Wd=(t,e)=>{"jquery"in t?$d(e,t):Ne(e,t.toString())},$d=(t,e)=>{if(t.textContent="",0 in e)for(let n=0;n in e;n++)t.appendChild(e[n].cloneNode(!0));else t.appendChild(e.cloneNode(!0))},Gd=(t,e)=>{const n=gn(),r=Gt();!n||!r||(!e.showConfirmButton&&!e.showDenyButton&&!e.showCancelButton?Se(n):ye(n),Be(n,e,"actions"),qd(n,r,e),Ne(r,e.loaderHtml||""),Be(r,e,"loader"))};function qd(t,e,n){const r=Ye(),i=Dt(),o=$t();!r||!i||!o||(zr(r,"confirm",n),zr(i,"deny",n),zr(o,"cancel",n),Yd(r,i,o,n),n.reverseButtons&&(n.toast?(t.insertBefore(o,r),t.insertBefore(i,r)):(t.insertBefore(o,e),t.insertBefore(i,e),t.insertBefore(r,e))))}function Yd(t,e,n,r){if(!r.buttonsStyling){je([t,e,n],_.styled);return}te([t,e,n],_.styled),r.confirmButtonColor&&t.style.setProperty("--swal2-confirm-button-background-color",r.confirmButtonColor),r.denyButtonColor&&e.style.setProperty("--swal2-deny-button-background-color",r.denyButtonColor),r.cancelButtonColor&&n.style.setProperty("--swal2-cancel-button-background-color",r.cancelButtonColor),Vr(t),Vr(e),Vr(n)}function Vr(t){const e=window.getComputedStyle(t);if(e.getPropertyValue("--swal2-action-button-focus-box-shadow"))return;const n=e.backgroundColor.replace(/rgba?\((\d+), (\d+), (\d+).*/,"rgba($1, $2, $3, 0.5)");t.style.setProperty("--swal2-action-button-focus-box-shadow",e.getPropertyValue("--swal2-outline").replace(/ rgba\(.*/,` ${n}`))}function zr(t,e,n){const r=Di(e);pn(t,n[`show${r}Button`],"inline-block"),Ne(t,n[`${e}ButtonText`]||""),t.setAttribute("aria-label",n[`${e}ButtonAriaLabel`]||""),t.className=_[e],Be(t,n,`${e}Button`)}const Qd=(t,e)=>{const n=ki();n&&(Ne(n,e.closeButtonHtml||""),Be(n,e,"closeButton"),pn(n,e.showCloseButton),n.setAttribute("aria-label",e.closeButtonAriaLabel||""))},Zd=(t,e)=>{const n=xe();n&&(Xd(n,e.backdrop),Jd(n,e.position),Kd(n,e.grow),Be(n,e,"container"))};function Xd(t,e){typeof e=="string"?t.style.background=e:e||te([document.documentElement,document.body],_["no-backdrop"])}function Jd(t,e){e&&(e in _?te(t,_[e]):(Te('The "position" parameter is not valid, defaulting to "center"'),te(t,_.center)))}function Kd(t,e){e&&te(t,_[`grow-${e}`])}var ie={innerParams:new WeakMap,domCache:new WeakMap};const ef=["input","file","range","select","radio","checkbox","textarea"],tf=(t,e)=>{const n=ne();if(!n)return;const r=ie.innerParams.get(t),i=!r||e.input!==r.input;ef.forEach(o=>{const a=nt(n,_[o]);a&&(of(o,e.inputAttributes),a.className=_[o],i&&Se(a))}),e.input&&(i&&nf(e),sf(e))},nf=t=>{if(!t.input)return;if(!he[t.input]){St(`Unexpected type of input! Expected ${Object.keys(he).join(" | ")}, got "${t.input}"`);return}const e=Ha(t.input);if(!e)return;const n=he[t.input](e,t);ye(e),t.inputAutoFocus&&setTimeout(()=>{Pa(n)})},rf=t=>{for(let e=0;e<t.attributes.length;e++){const n=t.attributes[e].name;["id","type","value","style"].includes(n)||t.removeAttribute(n)}},of=(t,e)=>{const n=ne();if(!n)return;const r=Er(n,t);if(r){rf(r);for(const i in e)r.setAttribute(i,e[i])}},sf=t=>{if(!t.input)return;const e=Ha(t.input);e&&Be(e,t,"input")},Ni=(t,e)=>{!t.placeholder&&e.inputPlaceholder&&(t.placeholder=e.inputPlaceholder)},mn=(t,e,n)=>{if(n.inputLabel){const r=document.createElement("label"),i=_["input-label"];r.setAttribute("for",t.id),r.className=i,typeof n.customClass=="object"&&te(r,n.customClass.inputLabel),r.innerText=n.inputLabel,e.insertAdjacentElement("beforebegin",r)}},Ha=t=>{const e=ne();if(e)return nt(e,_[t]||_.input)},qn=(t,e)=>{["string","number"].includes(typeof e)?t.value=`${e}`:Ti(e)||Te(`Unexpected type of inputValue! Expected "string", "number" or "Promise", got "${typeof e}"`)},he={};he.text=he.email=he.password=he.number=he.tel=he.url=he.search=he.date=he["datetime-local"]=he.time=he.week=he.month=(t,e)=>{const n=t;return qn(n,e.inputValue),mn(n,n,e),Ni(n,e),n.type=e.input,n};he.file=(t,e)=>{const n=t;return mn(n,n,e),Ni(n,e),n};he.range=(t,e)=>{const n=t,r=n.querySelector("input"),i=n.querySelector("output");return r&&(qn(r,e.inputValue),r.type=e.input,mn(r,t,e)),i&&qn(i,e.inputValue),t};he.select=(t,e)=>{const n=t;if(n.textContent="",e.inputPlaceholder){const r=document.createElement("option");Ne(r,e.inputPlaceholder),r.value="",r.disabled=!0,r.selected=!0,n.appendChild(r)}return mn(n,n,e),n};he.radio=t=>{const e=t;return e.textContent="",t};he.checkbox=(t,e)=>{const n=ne();if(!n)throw new Error("Popup not found");const r=Er(n,"checkbox");if(!r)throw new Error("Checkbox input not found");r.value="1",r.checked=!!e.inputValue;const o=t.querySelector("span");if(o){const a=e.inputPlaceholder||e.inputLabel;a&&Ne(o,a)}return r};he.textarea=(t,e)=>{const n=t;qn(n,e.inputValue),Ni(n,e),mn(n,n,e);const r=i=>parseInt(window.getComputedStyle(i).marginLeft)+parseInt(window.getComputedStyle(i).marginRight);return setTimeout(()=>{if("MutationObserver"in window){const i=ne();if(!i)return;const o=parseInt(window.getComputedStyle(i).width),a=()=>{if(!document.body.contains(n))return;const l=n.offsetWidth+r(n),u=ne();u&&(l>o?u.style.width=`${l}px`:bt(u,"width",e.width))};new MutationObserver(a).observe(n,{attributes:!0,attributeFilter:["style"]})}}),n};const af=(t,e)=>{const n=xi();n&&(Oi(n),Be(n,e,"htmlContainer"),e.html?(Pi(e.html,n),ye(n,"block")):e.text?(n.textContent=e.text,ye(n,"block")):Se(n),tf(t,e))},lf=(t,e)=>{const n=Ba();n&&(Oi(n),pn(n,!!e.footer,"block"),e.footer&&Pi(e.footer,n),Be(n,e,"footer"))},cf=(t,e)=>{const n=ie.innerParams.get(t),r=Wt();if(!r)return;if(n&&e.icon===n.icon){ps(r,e),gs(r,e);return}if(!e.icon&&!e.iconHtml){Se(r);return}if(e.icon&&Object.keys(Gn).indexOf(e.icon)===-1){St(`Unknown icon! Expected "success", "error", "warning", "info" or "question", got "${e.icon}"`),Se(r);return}ye(r),ps(r,e),gs(r,e),te(r,e.showClass&&e.showClass.icon),window.matchMedia("(prefers-color-scheme: dark)").addEventListener("change",ja)},gs=(t,e)=>{for(const[n,r]of Object.entries(Gn))e.icon!==n&&je(t,r);te(t,e.icon&&Gn[e.icon]),ff(t,e),ja(),Be(t,e,"icon")},ja=()=>{const t=ne();if(!t)return;const e=window.getComputedStyle(t).getPropertyValue("background-color"),n=t.querySelectorAll("[class^=swal2-success-circular-line], .swal2-success-fix");for(let r=0;r<n.length;r++)n[r].style.backgroundColor=e},uf=t=>`
-  ${t.animation?'<div class="swal2-success-circular-line-left"></div>':""}
-  <span class="swal2-success-line-tip"></span> <span class="swal2-success-line-long"></span>
-  <div class="swal2-success-ring"></div>
-  ${t.animation?'<div class="swal2-success-fix"></div>':""}
-  ${t.animation?'<div class="swal2-success-circular-line-right"></div>':""}
-`,df=`
-  <span class="swal2-x-mark">
-    <span class="swal2-x-mark-line-left"></span>
-    <span class="swal2-x-mark-line-right"></span>
-  </span>
-`,ps=(t,e)=>{if(!e.icon&&!e.iconHtml)return;let n=t.innerHTML,r="";e.iconHtml?r=ms(e.iconHtml):e.icon==="success"?(r=uf(e),n=n.replace(/ style=".*?"/g,"")):e.icon==="error"?r=df:e.icon&&(r=ms({question:"?",warning:"!",info:"i"}[e.icon])),n.trim()!==r.trim()&&Ne(t,r)},ff=(t,e)=>{if(e.iconColor){t.style.color=e.iconColor,t.style.borderColor=e.iconColor;for(const n of[".swal2-success-line-tip",".swal2-success-line-long",".swal2-x-mark-line-left",".swal2-x-mark-line-right"])hs(t,n,"background-color",e.iconColor);hs(t,".swal2-success-ring","border-color",e.iconColor)}},ms=t=>`<div class="${_["icon-content"]}">${t}</div>`,hf=(t,e)=>{const n=Oa();if(n){if(!e.imageUrl){Se(n);return}ye(n,""),n.setAttribute("src",e.imageUrl),n.setAttribute("alt",e.imageAlt||""),bt(n,"width",e.imageWidth),bt(n,"height",e.imageHeight),n.className=_.image,Be(n,e,"image")}};let Li=!1,Fa=0,Ua=0,Va=0,za=0;const gf=t=>{t.addEventListener("mousedown",Yn),document.body.addEventListener("mousemove",Qn),t.addEventListener("mouseup",Zn),t.addEventListener("touchstart",Yn),document.body.addEventListener("touchmove",Qn),t.addEventListener("touchend",Zn)},pf=t=>{t.removeEventListener("mousedown",Yn),document.body.removeEventListener("mousemove",Qn),t.removeEventListener("mouseup",Zn),t.removeEventListener("touchstart",Yn),document.body.removeEventListener("touchmove",Qn),t.removeEventListener("touchend",Zn)},Yn=t=>{const e=ne();if(!e)return;const n=Wt();if(t.target===e||n&&n.contains(t.target)){Li=!0;const r=Wa(t);Fa=r.clientX,Ua=r.clientY,Va=parseInt(e.style.insetInlineStart)||0,za=parseInt(e.style.insetBlockStart)||0,te(e,"swal2-dragging")}},Qn=t=>{const e=ne();if(e&&Li){let{clientX:n,clientY:r}=Wa(t);const i=n-Fa;e.style.insetInlineStart=`${Va+(H.isRTL?-i:i)}px`,e.style.insetBlockStart=`${za+(r-Ua)}px`}},Zn=()=>{const t=ne();Li=!1,je(t,"swal2-dragging")},Wa=t=>{let e=0,n=0;return t.type.startsWith("mouse")?(e=t.clientX,n=t.clientY):t.type.startsWith("touch")&&(e=t.touches[0].clientX,n=t.touches[0].clientY),{clientX:e,clientY:n}},mf=(t,e)=>{const n=xe(),r=ne();if(!(!n||!r)){if(e.toast){bt(n,"width",e.width),r.style.width="100%";const i=Gt();i&&r.insertBefore(i,Wt())}else bt(r,"width",e.width);bt(r,"padding",e.padding),e.color&&(r.style.color=e.color),e.background&&(r.style.background=e.background),Se(wr()),vf(r,e),e.draggable&&!e.toast?(te(r,_.draggable),gf(r)):(je(r,_.draggable),pf(r))}},vf=(t,e)=>{const n=e.showClass||{};t.className=`${_.popup} ${Ie(t)?n.popup:""}`,e.toast?(te([document.documentElement,document.body],_["toast-shown"]),te(t,_.toast)):te(t,_.modal),Be(t,e,"popup"),typeof e.customClass=="string"&&te(t,e.customClass),e.icon&&te(t,_[`icon-${e.icon}`])},wf=(t,e)=>{const n=Ri();if(!n)return;const{progressSteps:r,currentProgressStep:i}=e;if(!r||r.length===0||i===void 0){Se(n);return}ye(n),n.textContent="",i>=r.length&&Te("Invalid currentProgressStep parameter, it should be less than progressSteps.length (currentProgressStep like JS arrays starts from 0)"),r.forEach((o,a)=>{const l=bf(o);if(n.appendChild(l),a===i&&te(l,_["active-progress-step"]),a!==r.length-1){const u=yf(e);n.appendChild(u)}})},bf=t=>{const e=document.createElement("li");return te(e,_["progress-step"]),Ne(e,t),e},yf=t=>{const e=document.createElement("li");return te(e,_["progress-step-line"]),t.progressStepsDistance&&bt(e,"width",t.progressStepsDistance),e},Ef=(t,e)=>{const n=Ma();n&&(Oi(n),pn(n,!!(e.title||e.titleText),"block"),e.title&&Pi(e.title,n),e.titleText&&(n.innerText=e.titleText),Be(n,e,"title"))},$a=(t,e)=>{var n;mf(t,e),Zd(t,e),wf(t,e),cf(t,e),hf(t,e),Ef(t,e),Qd(t,e),af(t,e),Gd(t,e),lf(t,e);const r=ne();typeof e.didRender=="function"&&r&&e.didRender(r),(n=H.eventEmitter)===null||n===void 0||n.emit("didRender",r)},Af=()=>Ie(ne()),Ga=()=>{var t;return(t=Ye())===null||t===void 0?void 0:t.click()},Cf=()=>{var t;return(t=Dt())===null||t===void 0?void 0:t.click()},Sf=()=>{var t;return(t=$t())===null||t===void 0?void 0:t.click()},qt=Object.freeze({cancel:"cancel",backdrop:"backdrop",close:"close",esc:"esc",timer:"timer"}),qa=t=>{if(t.keydownTarget&&t.keydownHandlerAdded&&t.keydownHandler){const e=t.keydownHandler;t.keydownTarget.removeEventListener("keydown",e,{capture:t.keydownListenerCapture}),t.keydownHandlerAdded=!1}},Df=(t,e,n)=>{if(qa(t),!e.toast){const r=o=>Tf(e,o,n);t.keydownHandler=r;const i=e.keydownListenerCapture?window:ne();if(i){t.keydownTarget=i,t.keydownListenerCapture=e.keydownListenerCapture;const o=r;t.keydownTarget.addEventListener("keydown",o,{capture:t.keydownListenerCapture}),t.keydownHandlerAdded=!0}}},di=(t,e)=>{var n;const r=Ii();if(r.length){t=t+e,t===-2&&(t=r.length-1),t===r.length?t=0:t===-1&&(t=r.length-1),r[t].focus();return}(n=ne())===null||n===void 0||n.focus()},Ya=["ArrowRight","ArrowDown"],_f=["ArrowLeft","ArrowUp"],Tf=(t,e,n)=>{t&&(e.isComposing||e.keyCode===229||(t.stopKeydownPropagation&&e.stopPropagation(),e.key==="Enter"?xf(e,t):e.key==="Tab"?Rf(e):[...Ya,..._f].includes(e.key)?kf(e.key):e.key==="Escape"&&If(e,t,n)))},xf=(t,e)=>{if(!vr(e.allowEnterKey))return;const n=ne();if(!n||!e.input)return;const r=Er(n,e.input);if(t.target&&r&&t.target instanceof HTMLElement&&t.target.outerHTML===r.outerHTML){if(["textarea","file"].includes(e.input))return;Ga(),t.preventDefault()}},Rf=t=>{const e=t.target,n=Ii();let r=-1;for(let i=0;i<n.length;i++)if(e===n[i]){r=i;break}t.shiftKey?di(r,-1):di(r,1),t.stopPropagation(),t.preventDefault()},kf=t=>{const e=gn(),n=Ye(),r=Dt(),i=$t();if(!e||!n||!r||!i)return;const o=[n,r,i];if(document.activeElement instanceof HTMLElement&&!o.includes(document.activeElement))return;const a=Ya.includes(t)?"nextElementSibling":"previousElementSibling";let l=document.activeElement;if(l){for(let u=0;u<e.children.length;u++){if(l=l[a],!l)return;if(l instanceof HTMLButtonElement&&Ie(l))break}l instanceof HTMLButtonElement&&l.focus()}},If=(t,e,n)=>{t.preventDefault(),vr(e.allowEscapeKey)&&n(qt.esc)};var jt={swalPromiseResolve:new WeakMap,swalPromiseReject:new WeakMap};const Mf=()=>{const t=xe();Array.from(document.body.children).forEach(n=>{n.contains(t)||(n.hasAttribute("aria-hidden")&&n.setAttribute("data-previous-aria-hidden",n.getAttribute("aria-hidden")||""),n.setAttribute("aria-hidden","true"))})},Qa=()=>{Array.from(document.body.children).forEach(e=>{e.hasAttribute("data-previous-aria-hidden")?(e.setAttribute("aria-hidden",e.getAttribute("data-previous-aria-hidden")||""),e.removeAttribute("data-previous-aria-hidden")):e.removeAttribute("aria-hidden")})},Za=typeof window<"u"&&!!window.GestureEvent,Of=()=>{if(Za&&!Xe(document.body,_.iosfix)){const t=document.body.scrollTop;document.body.style.top=`${t*-1}px`,te(document.body,_.iosfix),Bf()}},Bf=()=>{const t=xe();if(!t)return;let e;t.ontouchstart=n=>{e=Pf(n)},t.ontouchmove=n=>{e&&(n.preventDefault(),n.stopPropagation())}},Pf=t=>{const e=t.target,n=xe(),r=xi();return!n||!r||Nf(t)||Lf(t)?!1:e===n||!ui(n)&&e instanceof HTMLElement&&!Bd(e,r)&&e.tagName!=="INPUT"&&e.tagName!=="TEXTAREA"&&!(ui(r)&&r.contains(e))},Nf=t=>!!(t.touches&&t.touches.length&&t.touches[0].touchType==="stylus"),Lf=t=>t.touches&&t.touches.length>1,Hf=()=>{if(Xe(document.body,_.iosfix)){const t=parseInt(document.body.style.top,10);je(document.body,_.iosfix),document.body.style.top="",document.body.scrollTop=t*-1}},jf=()=>{const t=document.createElement("div");t.className=_["scrollbar-measure"],document.body.appendChild(t);const e=t.getBoundingClientRect().width-t.clientWidth;return document.body.removeChild(t),e};let Nt=null;const Ff=t=>{Nt===null&&(document.body.scrollHeight>window.innerHeight||t==="scroll")&&(Nt=parseInt(window.getComputedStyle(document.body).getPropertyValue("padding-right")),document.body.style.paddingRight=`${Nt+jf()}px`)},Uf=()=>{Nt!==null&&(document.body.style.paddingRight=`${Nt}px`,Nt=null)};function Xa(t,e,n,r){yr()?vs(t,r):(Sd(n).then(()=>vs(t,r)),qa(H)),Za?(e.setAttribute("style","display:none !important"),e.removeAttribute("class"),e.innerHTML=""):e.remove(),Mi()&&(Uf(),Hf(),Qa()),Vf()}function Vf(){je([document.documentElement,document.body],[_.shown,_["height-auto"],_["no-backdrop"],_["toast-shown"]])}function rt(t){t=Wf(t);const e=jt.swalPromiseResolve.get(this),n=zf(this);this.isAwaitingPromise?t.isDismissed||(vn(this),e(t)):n&&e(t)}const zf=t=>{const e=ne();if(!e)return!1;const n=ie.innerParams.get(t);if(!n||Xe(e,n.hideClass.popup))return!1;je(e,n.showClass.popup),te(e,n.hideClass.popup);const r=xe();return je(r,n.showClass.backdrop),te(r,n.hideClass.backdrop),$f(t,e,n),!0};function Ja(t){const e=jt.swalPromiseReject.get(this);vn(this),e&&e(t)}const vn=t=>{t.isAwaitingPromise&&(delete t.isAwaitingPromise,ie.innerParams.get(t)||t._destroy())},Wf=t=>typeof t>"u"?{isConfirmed:!1,isDenied:!1,isDismissed:!0}:Object.assign({isConfirmed:!1,isDenied:!1,isDismissed:!1},t),$f=(t,e,n)=>{var r;const i=xe(),o=La(e);typeof n.willClose=="function"&&n.willClose(e),(r=H.eventEmitter)===null||r===void 0||r.emit("willClose",e),o&&i?Gf(t,e,i,!!n.returnFocus,n.didClose):i&&Xa(t,i,!!n.returnFocus,n.didClose)},Gf=(t,e,n,r,i)=>{H.swalCloseEventFinishedCallback=Xa.bind(null,t,n,r,i);const o=function(a){if(a.target===e){var l;(l=H.swalCloseEventFinishedCallback)===null||l===void 0||l.call(H),delete H.swalCloseEventFinishedCallback,e.removeEventListener("animationend",o),e.removeEventListener("transitionend",o)}};e.addEventListener("animationend",o),e.addEventListener("transitionend",o)},vs=(t,e)=>{setTimeout(()=>{var n;typeof e=="function"&&e.bind(t.params)(),(n=H.eventEmitter)===null||n===void 0||n.emit("didClose"),t._destroy&&t._destroy()})},Ft=t=>{let e=ne();if(e||new tr,e=ne(),!e)return;const n=Gt();yr()?Se(Wt()):qf(e,t),ye(n),e.setAttribute("data-loading","true"),e.setAttribute("aria-busy","true"),e.focus()},qf=(t,e)=>{const n=gn(),r=Gt();!n||!r||(!e&&Ie(Ye())&&(e=Ye()),ye(n),e&&(Se(e),r.setAttribute("data-button-to-replace",e.className),n.insertBefore(r,e)),te([t,n],_.loading))},Yf=(t,e)=>{e.input==="select"||e.input==="radio"?Kf(t,e):["text","email","number","tel","textarea"].some(n=>n===e.input)&&(_i(e.inputValue)||Ti(e.inputValue))&&(Ft(Ye()),eh(t,e))},Qf=(t,e)=>{const n=t.getInput();if(!n)return null;switch(e.input){case"checkbox":return Zf(n);case"radio":return Xf(n);case"file":return Jf(n);default:return e.inputAutoTrim?n.value.trim():n.value}},Zf=t=>t.checked?1:0,Xf=t=>t.checked?t.value:null,Jf=t=>t.files&&t.files.length?t.getAttribute("multiple")!==null?t.files:t.files[0]:null,Kf=(t,e)=>{const n=ne();if(!n)return;const r=i=>{e.input==="select"?th(n,Xn(i),e):e.input==="radio"&&nh(n,Xn(i),e)};_i(e.inputOptions)||Ti(e.inputOptions)?(Ft(Ye()),fn(e.inputOptions).then(i=>{t.hideLoading(),r(i)})):typeof e.inputOptions=="object"?r(e.inputOptions):St(`Unexpected type of inputOptions! Expected object, Map or Promise, got ${typeof e.inputOptions}`)},eh=(t,e)=>{const n=t.getInput();n&&(Se(n),fn(e.inputValue).then(r=>{n.value=e.input==="number"?`${parseFloat(r)||0}`:`${r}`,ye(n),n.focus(),t.hideLoading()}).catch(r=>{St(`Error in inputValue promise: ${r}`),n.value="",ye(n),n.focus(),t.hideLoading()}))};function th(t,e,n){const r=nt(t,_.select);if(!r)return;const i=(o,a,l)=>{const u=document.createElement("option");u.value=l,Ne(u,a),u.selected=Ka(l,n.inputValue),o.appendChild(u)};e.forEach(o=>{const a=o[0],l=o[1];if(Array.isArray(l)){const u=document.createElement("optgroup");u.label=a,u.disabled=!1,r.appendChild(u),l.forEach(h=>i(u,h[1],h[0]))}else i(r,l,a)}),r.focus()}function nh(t,e,n){const r=nt(t,_.radio);if(!r)return;e.forEach(o=>{const a=o[0],l=o[1],u=document.createElement("input"),h=document.createElement("label");u.type="radio",u.name=_.radio,u.value=a,Ka(a,n.inputValue)&&(u.checked=!0);const f=document.createElement("span");Ne(f,l),f.className=_.label,h.appendChild(u),h.appendChild(f),r.appendChild(h)});const i=r.querySelectorAll("input");i.length&&i[0].focus()}const Xn=t=>{const e=[];return t instanceof Map?t.forEach((n,r)=>{let i=n;typeof i=="object"&&(i=Xn(i)),e.push([r,i])}):Object.keys(t).forEach(n=>{let r=t[n];typeof r=="object"&&(r=Xn(r)),e.push([n,r])}),e},Ka=(t,e)=>!!e&&e!==null&&e!==void 0&&e.toString()===t.toString(),rh=t=>{const e=ie.innerParams.get(t);t.disableButtons(),e.input?el(t,"confirm"):ji(t,!0)},ih=t=>{const e=ie.innerParams.get(t);t.disableButtons(),e.returnInputValueOnDeny?el(t,"deny"):Hi(t,!1)},oh=(t,e)=>{t.disableButtons(),e(qt.cancel)},el=(t,e)=>{const n=ie.innerParams.get(t);if(!n.input){St(`The "input" parameter is needed to be set when using returnInputValueOn${Di(e)}`);return}const r=t.getInput(),i=Qf(t,n);n.inputValidator?sh(t,i,e):r&&!r.checkValidity()?(t.enableButtons(),t.showValidationMessage(n.validationMessage||r.validationMessage)):e==="deny"?Hi(t,i):ji(t,i)},sh=(t,e,n)=>{const r=ie.innerParams.get(t);t.disableInput(),Promise.resolve().then(()=>fn(r.inputValidator(e,r.validationMessage))).then(o=>{t.enableButtons(),t.enableInput(),o?t.showValidationMessage(o):n==="deny"?Hi(t,e):ji(t,e)})},Hi=(t,e)=>{const n=ie.innerParams.get(t);n.showLoaderOnDeny&&Ft(Dt()),n.preDeny?(t.isAwaitingPromise=!0,Promise.resolve().then(()=>fn(n.preDeny(e,n.validationMessage))).then(i=>{i===!1?(t.hideLoading(),vn(t)):t.close({isDenied:!0,value:typeof i>"u"?e:i})}).catch(i=>tl(t,i))):t.close({isDenied:!0,value:e})},ws=(t,e)=>{t.close({isConfirmed:!0,value:e})},tl=(t,e)=>{t.rejectPromise(e)},ji=(t,e)=>{const n=ie.innerParams.get(t);n.showLoaderOnConfirm&&Ft(),n.preConfirm?(t.resetValidationMessage(),t.isAwaitingPromise=!0,Promise.resolve().then(()=>fn(n.preConfirm(e,n.validationMessage))).then(i=>{Ie(wr())||i===!1?(t.hideLoading(),vn(t)):ws(t,typeof i>"u"?e:i)}).catch(i=>tl(t,i))):ws(t,e)};function Jn(){const t=ie.innerParams.get(this);if(!t)return;const e=ie.domCache.get(this);Se(e.loader),yr()?t.icon&&ye(Wt()):ah(e),je([e.popup,e.actions],_.loading),e.popup.removeAttribute("aria-busy"),e.popup.removeAttribute("data-loading"),e.confirmButton.disabled=!1,e.denyButton.disabled=!1,e.cancelButton.disabled=!1}const ah=t=>{const e=t.loader.getAttribute("data-button-to-replace"),n=e?t.popup.getElementsByClassName(e):[];n.length?ye(n[0],"inline-block"):Od()&&Se(t.actions)};function nl(){const t=ie.innerParams.get(this),e=ie.domCache.get(this);return e?Er(e.popup,t.input):null}function rl(t,e,n){const r=ie.domCache.get(t);e.forEach(i=>{r[i].disabled=n})}function il(t,e){const n=ne();if(!(!n||!t))if(t.type==="radio"){const r=n.querySelectorAll(`[name="${_.radio}"]`);for(let i=0;i<r.length;i++)r[i].disabled=e}else t.disabled=e}function ol(){rl(this,["confirmButton","denyButton","cancelButton"],!1)}function sl(){rl(this,["confirmButton","denyButton","cancelButton"],!0)}function al(){il(this.getInput(),!1)}function ll(){il(this.getInput(),!0)}function cl(t){const e=ie.domCache.get(this),n=ie.innerParams.get(this);Ne(e.validationMessage,t),e.validationMessage.className=_["validation-message"],n.customClass&&n.customClass.validationMessage&&te(e.validationMessage,n.customClass.validationMessage),ye(e.validationMessage);const r=this.getInput();r&&(r.setAttribute("aria-invalid","true"),r.setAttribute("aria-describedby",_["validation-message"]),Pa(r),te(r,_.inputerror))}function ul(){const t=ie.domCache.get(this);t.validationMessage&&Se(t.validationMessage);const e=this.getInput();e&&(e.removeAttribute("aria-invalid"),e.removeAttribute("aria-describedby"),je(e,_.inputerror))}const it={title:"",titleText:"",text:"",html:"",footer:"",icon:void 0,iconColor:void 0,iconHtml:void 0,template:void 0,toast:!1,draggable:!1,animation:!0,theme:"light",showClass:{popup:"swal2-show",backdrop:"swal2-backdrop-show",icon:"swal2-icon-show"},hideClass:{popup:"swal2-hide",backdrop:"swal2-backdrop-hide",icon:"swal2-icon-hide"},customClass:{},target:"body",color:void 0,backdrop:!0,heightAuto:!0,allowOutsideClick:!0,allowEscapeKey:!0,allowEnterKey:!0,stopKeydownPropagation:!0,keydownListenerCapture:!1,showConfirmButton:!0,showDenyButton:!1,showCancelButton:!1,preConfirm:void 0,preDeny:void 0,confirmButtonText:"OK",confirmButtonAriaLabel:"",confirmButtonColor:void 0,denyButtonText:"No",denyButtonAriaLabel:"",denyButtonColor:void 0,cancelButtonText:"Cancel",cancelButtonAriaLabel:"",cancelButtonColor:void 0,buttonsStyling:!0,reverseButtons:!1,focusConfirm:!0,focusDeny:!1,focusCancel:!1,returnFocus:!0,showCloseButton:!1,closeButtonHtml:"&times;",closeButtonAriaLabel:"Close this dialog",loaderHtml:"",showLoaderOnConfirm:!1,showLoaderOnDeny:!1,imageUrl:void 0,imageWidth:void 0,imageHeight:void 0,imageAlt:"",timer:void 0,timerProgressBar:!1,width:void 0,padding:void 0,background:void 0,input:void 0,inputPlaceholder:"",inputLabel:"",inputValue:"",inputOptions:{},inputAutoFocus:!0,inputAutoTrim:!0,inputAttributes:{},inputValidator:void 0,returnInputValueOnDeny:!1,validationMessage:void 0,grow:!1,position:"center",progressSteps:[],currentProgressStep:void 0,progressStepsDistance:void 0,willOpen:void 0,didOpen:void 0,didRender:void 0,willClose:void 0,didClose:void 0,didDestroy:void 0,scrollbarPadding:!0,topLayer:!1},lh=["allowEscapeKey","allowOutsideClick","background","buttonsStyling","cancelButtonAriaLabel","cancelButtonColor","cancelButtonText","closeButtonAriaLabel","closeButtonHtml","color","confirmButtonAriaLabel","confirmButtonColor","confirmButtonText","currentProgressStep","customClass","denyButtonAriaLabel","denyButtonColor","denyButtonText","didClose","didDestroy","draggable","footer","hideClass","html","icon","iconColor","iconHtml","imageAlt","imageHeight","imageUrl","imageWidth","preConfirm","preDeny","progressSteps","returnFocus","reverseButtons","showCancelButton","showCloseButton","showConfirmButton","showDenyButton","text","title","titleText","theme","willClose"],ch={allowEnterKey:void 0},uh=["allowOutsideClick","allowEnterKey","backdrop","draggable","focusConfirm","focusDeny","focusCancel","returnFocus","heightAuto","keydownListenerCapture"],dl=t=>Object.prototype.hasOwnProperty.call(it,t),fl=t=>lh.indexOf(t)!==-1,hl=t=>ch[t],dh=t=>{dl(t)||Te(`Unknown parameter "${t}"`)},fh=t=>{uh.includes(t)&&Te(`The parameter "${t}" is incompatible with toasts`)},hh=t=>{const e=hl(t);e&&Ia(t,e)},gl=t=>{t.backdrop===!1&&t.allowOutsideClick&&Te('"allowOutsideClick" parameter requires `backdrop` parameter to be set to `true`'),t.theme&&!["light","dark","auto","minimal","borderless","bootstrap-4","bootstrap-4-light","bootstrap-4-dark","bootstrap-5","bootstrap-5-light","bootstrap-5-dark","material-ui","material-ui-light","material-ui-dark","embed-iframe","bulma","bulma-light","bulma-dark"].includes(t.theme)&&Te(`Invalid theme "${t.theme}"`);for(const e in t)dh(e),t.toast&&fh(e),hh(e)};function pl(t){const e=xe(),n=ne(),r=ie.innerParams.get(this);if(!n||Xe(n,r.hideClass.popup)){Te("You're trying to update the closed or closing popup, that won't work. Use the update() method in preConfirm parameter or show a new popup.");return}const i=gh(t),o=Object.assign({},r,i);gl(o),e&&(e.dataset.swal2Theme=o.theme),$a(this,o),ie.innerParams.set(this,o),Object.defineProperties(this,{params:{value:Object.assign({},this.params,t),writable:!1,enumerable:!0}})}const gh=t=>{const e={};return Object.keys(t).forEach(n=>{if(fl(n)){const r=t;e[n]=r[n]}else Te(`Invalid parameter to update: ${n}`)}),e};function ml(){var t;const e=ie.domCache.get(this),n=ie.innerParams.get(this);if(!n){vl(this);return}e.popup&&H.swalCloseEventFinishedCallback&&(H.swalCloseEventFinishedCallback(),delete H.swalCloseEventFinishedCallback),typeof n.didDestroy=="function"&&n.didDestroy(),(t=H.eventEmitter)===null||t===void 0||t.emit("didDestroy"),ph(this)}const ph=t=>{vl(t),delete t.params,delete H.keydownHandler,delete H.keydownTarget,delete H.currentInstance},vl=t=>{t.isAwaitingPromise?(Wr(ie,t),t.isAwaitingPromise=!0):(Wr(jt,t),Wr(ie,t),delete t.isAwaitingPromise,delete t.disableButtons,delete t.enableButtons,delete t.getInput,delete t.disableInput,delete t.enableInput,delete t.hideLoading,delete t.disableLoading,delete t.showValidationMessage,delete t.resetValidationMessage,delete t.close,delete t.closePopup,delete t.closeModal,delete t.closeToast,delete t.rejectPromise,delete t.update,delete t._destroy)},Wr=(t,e)=>{for(const n in t)t[n].delete(e)};var mh=Object.freeze({__proto__:null,_destroy:ml,close:rt,closeModal:rt,closePopup:rt,closeToast:rt,disableButtons:sl,disableInput:ll,disableLoading:Jn,enableButtons:ol,enableInput:al,getInput:nl,handleAwaitingPromise:vn,hideLoading:Jn,rejectPromise:Ja,resetValidationMessage:ul,showValidationMessage:cl,update:pl});const vh=(t,e,n)=>{t.toast?wh(t,e,n):(yh(e),Eh(e),Ah(t,e,n))},wh=(t,e,n)=>{e.popup.onclick=()=>{t&&(bh(t)||t.timer||t.input)||n(qt.close)}},bh=t=>!!(t.showConfirmButton||t.showDenyButton||t.showCancelButton||t.showCloseButton);let Kn=!1;const yh=t=>{t.popup.onmousedown=()=>{t.container.onmouseup=function(e){t.container.onmouseup=()=>{},e.target===t.container&&(Kn=!0)}}},Eh=t=>{t.container.onmousedown=e=>{e.target===t.container&&e.preventDefault(),t.popup.onmouseup=function(n){t.popup.onmouseup=()=>{},(n.target===t.popup||n.target instanceof HTMLElement&&t.popup.contains(n.target))&&(Kn=!0)}}},Ah=(t,e,n)=>{e.container.onclick=r=>{if(Kn){Kn=!1;return}r.target===e.container&&vr(t.allowOutsideClick)&&n(qt.backdrop)}},Ch=t=>typeof t=="object"&&t.jquery,bs=t=>t instanceof Element||Ch(t),Sh=t=>{const e={};return typeof t[0]=="object"&&!bs(t[0])?Object.assign(e,t[0]):["title","html","icon"].forEach((n,r)=>{const i=t[r];typeof i=="string"||bs(i)?e[n]=i:i!==void 0&&St(`Unexpected type of ${n}! Expected "string" or "Element", got ${typeof i}`)}),e};function Dh(...t){return new this(...t)}function _h(t){class e extends this{_main(r,i){return super._main(r,Object.assign({},t,i))}}return e}const Th=()=>H.timeout&&H.timeout.getTimerLeft(),wl=()=>{if(H.timeout)return Pd(),H.timeout.stop()},bl=()=>{if(H.timeout){const t=H.timeout.start();return Bi(t),t}},xh=()=>{const t=H.timeout;return t&&(t.running?wl():bl())},Rh=t=>{if(H.timeout){const e=H.timeout.increase(t);return Bi(e,!0),e}},kh=()=>!!(H.timeout&&H.timeout.isRunning());let ys=!1;const fi={};function Ih(t="data-swal-template"){fi[t]=this,ys||(document.body.addEventListener("click",Mh),ys=!0)}const Mh=t=>{for(let e=t.target;e&&e!==document;e=e.parentNode)for(const n in fi){const r=e.getAttribute&&e.getAttribute(n);if(r){fi[n].fire({template:r});return}}};class Oh{constructor(){this.events={}}_getHandlersByEventName(e){return typeof this.events[e]>"u"&&(this.events[e]=[]),this.events[e]}on(e,n){const r=this._getHandlersByEventName(e);r.includes(n)||r.push(n)}once(e,n){const r=(...i)=>{this.removeListener(e,r),n.apply(this,i)};this.on(e,r)}emit(e,...n){this._getHandlersByEventName(e).forEach(r=>{try{r.apply(this,n)}catch(i){console.error(i)}})}removeListener(e,n){const r=this._getHandlersByEventName(e),i=r.indexOf(n);i>-1&&r.splice(i,1)}removeAllListeners(e){this.events[e]!==void 0&&(this.events[e].length=0)}reset(){this.events={}}}H.eventEmitter=new Oh;const Bh=(t,e)=>{H.eventEmitter&&H.eventEmitter.on(t,e)},Ph=(t,e)=>{H.eventEmitter&&H.eventEmitter.once(t,e)},Nh=(t,e)=>{if(H.eventEmitter){if(!t){H.eventEmitter.reset();return}e?H.eventEmitter.removeListener(t,e):H.eventEmitter.removeAllListeners(t)}};var Lh=Object.freeze({__proto__:null,argsToParams:Sh,bindClickHandler:Ih,clickCancel:Sf,clickConfirm:Ga,clickDeny:Cf,enableLoading:Ft,fire:Dh,getActions:gn,getCancelButton:$t,getCloseButton:ki,getConfirmButton:Ye,getContainer:xe,getDenyButton:Dt,getFocusableElements:Ii,getFooter:Ba,getHtmlContainer:xi,getIcon:Wt,getIconContent:xd,getImage:Oa,getInputLabel:Rd,getLoader:Gt,getPopup:ne,getProgressSteps:Ri,getTimerLeft:Th,getTimerProgressBar:br,getTitle:Ma,getValidationMessage:wr,increaseTimer:Rh,isDeprecatedParameter:hl,isLoading:Id,isTimerRunning:kh,isUpdatableParameter:fl,isValidParameter:dl,isVisible:Af,mixin:_h,off:Nh,on:Bh,once:Ph,resumeTimer:bl,showLoading:Ft,stopTimer:wl,toggleTimer:xh});class Hh{constructor(e,n){this.callback=e,this.remaining=n,this.running=!1,this.start()}start(){return this.running||(this.running=!0,this.started=new Date,this.id=setTimeout(this.callback,this.remaining)),this.remaining}stop(){return this.started&&this.running&&(this.running=!1,clearTimeout(this.id),this.remaining-=new Date().getTime()-this.started.getTime()),this.remaining}increase(e){const n=this.running;return n&&this.stop(),this.remaining+=e,n&&this.start(),this.remaining}getTimerLeft(){return this.running&&(this.stop(),this.start()),this.remaining}isRunning(){return this.running}}const yl=["swal-title","swal-html","swal-footer"],jh=t=>{const e=typeof t.template=="string"?document.querySelector(t.template):t.template;if(!e)return{};const n=e.content;return qh(n),Object.assign(Fh(n),Uh(n),Vh(n),zh(n),Wh(n),$h(n),Gh(n,yl))},Fh=t=>{const e={};return Array.from(t.querySelectorAll("swal-param")).forEach(r=>{Et(r,["name","value"]);const i=r.getAttribute("name"),o=r.getAttribute("value");!i||!o||(i in it&&typeof it[i]=="boolean"?e[i]=o!=="false":i in it&&typeof it[i]=="object"?e[i]=JSON.parse(o):e[i]=o)}),e},Uh=t=>{const e={};return Array.from(t.querySelectorAll("swal-function-param")).forEach(r=>{const i=r.getAttribute("name"),o=r.getAttribute("value");!i||!o||(e[i]=new Function(`return ${o}`)())}),e},Vh=t=>{const e={};return Array.from(t.querySelectorAll("swal-button")).forEach(r=>{Et(r,["type","color","aria-label"]);const i=r.getAttribute("type");if(!(!i||!["confirm","cancel","deny"].includes(i))){if(e[`${i}ButtonText`]=r.innerHTML,e[`show${Di(i)}Button`]=!0,r.hasAttribute("color")){const o=r.getAttribute("color");o!==null&&(e[`${i}ButtonColor`]=o)}if(r.hasAttribute("aria-label")){const o=r.getAttribute("aria-label");o!==null&&(e[`${i}ButtonAriaLabel`]=o)}}}),e},zh=t=>{const e={},n=t.querySelector("swal-image");return n&&(Et(n,["src","width","height","alt"]),n.hasAttribute("src")&&(e.imageUrl=n.getAttribute("src")||void 0),n.hasAttribute("width")&&(e.imageWidth=n.getAttribute("width")||void 0),n.hasAttribute("height")&&(e.imageHeight=n.getAttribute("height")||void 0),n.hasAttribute("alt")&&(e.imageAlt=n.getAttribute("alt")||void 0)),e},Wh=t=>{const e={},n=t.querySelector("swal-icon");return n&&(Et(n,["type","color"]),n.hasAttribute("type")&&(e.icon=n.getAttribute("type")),n.hasAttribute("color")&&(e.iconColor=n.getAttribute("color")),e.iconHtml=n.innerHTML),e},$h=t=>{const e={},n=t.querySelector("swal-input");n&&(Et(n,["type","label","placeholder","value"]),e.input=n.getAttribute("type")||"text",n.hasAttribute("label")&&(e.inputLabel=n.getAttribute("label")),n.hasAttribute("placeholder")&&(e.inputPlaceholder=n.getAttribute("placeholder")),n.hasAttribute("value")&&(e.inputValue=n.getAttribute("value")));const r=Array.from(t.querySelectorAll("swal-input-option"));return r.length&&(e.inputOptions={},r.forEach(i=>{Et(i,["value"]);const o=i.getAttribute("value");if(!o)return;const a=i.innerHTML;e.inputOptions[o]=a})),e},Gh=(t,e)=>{const n={};for(const r in e){const i=e[r],o=t.querySelector(i);o&&(Et(o,[]),n[i.replace(/^swal-/,"")]=o.innerHTML.trim())}return n},qh=t=>{const e=yl.concat(["swal-param","swal-function-param","swal-button","swal-image","swal-icon","swal-input","swal-input-option"]);Array.from(t.children).forEach(n=>{const r=n.tagName.toLowerCase();e.includes(r)||Te(`Unrecognized element <${r}>`)})},Et=(t,e)=>{Array.from(t.attributes).forEach(n=>{e.indexOf(n.name)===-1&&Te([`Unrecognized attribute "${n.name}" on <${t.tagName.toLowerCase()}>.`,`${e.length?`Allowed attributes are: ${e.join(", ")}`:"To set the value, use HTML within the element."}`])})},El=10,Yh=t=>{var e,n;const r=xe(),i=ne();if(!r||!i)return;typeof t.willOpen=="function"&&t.willOpen(i),(e=H.eventEmitter)===null||e===void 0||e.emit("willOpen",i);const a=window.getComputedStyle(document.body).overflowY;if(Xh(r,i,t),setTimeout(()=>{Qh(r,i)},El),Mi()&&(Zh(r,t.scrollbarPadding!==void 0?t.scrollbarPadding:!1,a),Mf()),!yr()&&!H.previousActiveElement&&(H.previousActiveElement=document.activeElement),typeof t.didOpen=="function"){const l=t.didOpen;setTimeout(()=>l(i))}(n=H.eventEmitter)===null||n===void 0||n.emit("didOpen",i)},er=t=>{const e=ne();if(!e||t.target!==e)return;const n=xe();n&&(e.removeEventListener("animationend",er),e.removeEventListener("transitionend",er),n.style.overflowY="auto",je(n,_["no-transition"]))},Qh=(t,e)=>{La(e)?(t.style.overflowY="hidden",e.addEventListener("animationend",er),e.addEventListener("transitionend",er)):t.style.overflowY="auto"},Zh=(t,e,n)=>{Of(),e&&n!=="hidden"&&Ff(n),setTimeout(()=>{t.scrollTop=0})},Xh=(t,e,n)=>{var r;(r=n.showClass)!==null&&r!==void 0&&r.backdrop&&te(t,n.showClass.backdrop),n.animation?(e.style.setProperty("opacity","0","important"),ye(e,"grid"),setTimeout(()=>{var i;(i=n.showClass)!==null&&i!==void 0&&i.popup&&te(e,n.showClass.popup),e.style.removeProperty("opacity")},El)):ye(e,"grid"),te([document.documentElement,document.body],_.shown),n.heightAuto&&n.backdrop&&!n.toast&&te([document.documentElement,document.body],_["height-auto"])};var Es={email:(t,e)=>/^[a-zA-Z0-9.+_'-]+@[a-zA-Z0-9.-]+\.[a-zA-Z0-9-]+$/.test(t)?Promise.resolve():Promise.resolve(e||"Invalid email address"),url:(t,e)=>/^https?:\/\/(www\.)?[-a-zA-Z0-9@:%._+~#=]{1,256}\.[a-z]{2,63}\b([-a-zA-Z0-9@:%_+.~#?&/=]*)$/.test(t)?Promise.resolve():Promise.resolve(e||"Invalid URL")};function Jh(t){t.inputValidator||(t.input==="email"&&(t.inputValidator=Es.email),t.input==="url"&&(t.inputValidator=Es.url))}function Kh(t){(!t.target||typeof t.target=="string"&&!document.querySelector(t.target)||typeof t.target!="string"&&!t.target.appendChild)&&(Te('Target parameter is not valid, defaulting to "body"'),t.target="body")}function eg(t){Jh(t),t.showLoaderOnConfirm&&!t.preConfirm&&Te(`showLoaderOnConfirm is set to true, but preConfirm is not defined.
-showLoaderOnConfirm should be used together with preConfirm, see usage example:
-https://sweetalert2.github.io/#ajax-request`),Kh(t),typeof t.title=="string"&&(t.title=t.title.split(`
-`).join("<br />")),zd(t)}let Ge;var On=new WeakMap;class ge{constructor(...e){if(yd(this,On,Promise.resolve({isConfirmed:!1,isDenied:!1,isDismissed:!0})),typeof window>"u")return;Ge=this;const n=Object.freeze(this.constructor.argsToParams(e));this.params=n,this.isAwaitingPromise=!1,Ed(On,this,this._main(Ge.params))}_main(e,n={}){if(gl(Object.assign({},n,e)),H.currentInstance){const o=jt.swalPromiseResolve.get(H.currentInstance),{isAwaitingPromise:a}=H.currentInstance;H.currentInstance._destroy(),a||o({isDismissed:!0}),Mi()&&Qa()}H.currentInstance=Ge;const r=ng(e,n);eg(r),Object.freeze(r),H.timeout&&(H.timeout.stop(),delete H.timeout),clearTimeout(H.restoreFocusTimeout);const i=rg(Ge);return $a(Ge,r),ie.innerParams.set(Ge,r),tg(Ge,i,r)}then(e){return ds(On,this).then(e)}finally(e){return ds(On,this).finally(e)}}const tg=(t,e,n)=>new Promise((r,i)=>{const o=a=>{t.close({isDismissed:!0,dismiss:a,isConfirmed:!1,isDenied:!1})};jt.swalPromiseResolve.set(t,r),jt.swalPromiseReject.set(t,i),e.confirmButton.onclick=()=>{rh(t)},e.denyButton.onclick=()=>{ih(t)},e.cancelButton.onclick=()=>{oh(t,o)},e.closeButton.onclick=()=>{o(qt.close)},vh(n,e,o),Df(H,n,o),Yf(t,n),Yh(n),ig(H,n,o),og(e,n),setTimeout(()=>{e.container.scrollTop=0})}),ng=(t,e)=>{const n=jh(t),r=Object.assign({},it,e,n,t);return r.showClass=Object.assign({},it.showClass,r.showClass),r.hideClass=Object.assign({},it.hideClass,r.hideClass),r.animation===!1&&(r.showClass={backdrop:"swal2-noanimation"},r.hideClass={}),r},rg=t=>{const e={popup:ne(),container:xe(),actions:gn(),confirmButton:Ye(),denyButton:Dt(),cancelButton:$t(),loader:Gt(),closeButton:ki(),validationMessage:wr(),progressSteps:Ri()};return ie.domCache.set(t,e),e},ig=(t,e,n)=>{const r=br();Se(r),e.timer&&(t.timeout=new Hh(()=>{n("timer"),delete t.timeout},e.timer),e.timerProgressBar&&r&&(ye(r),Be(r,e,"timerProgressBar"),setTimeout(()=>{t.timeout&&t.timeout.running&&Bi(e.timer)})))},og=(t,e)=>{if(!e.toast){if(!vr(e.allowEnterKey)){Ia("allowEnterKey"),lg();return}sg(t)||ag(t,e)||di(-1,1)}},sg=t=>{const e=Array.from(t.popup.querySelectorAll("[autofocus]"));for(const n of e)if(n instanceof HTMLElement&&Ie(n))return n.focus(),!0;return!1},ag=(t,e)=>e.focusDeny&&Ie(t.denyButton)?(t.denyButton.focus(),!0):e.focusCancel&&Ie(t.cancelButton)?(t.cancelButton.focus(),!0):e.focusConfirm&&Ie(t.confirmButton)?(t.confirmButton.focus(),!0):!1,lg=()=>{document.activeElement instanceof HTMLElement&&typeof document.activeElement.blur=="function"&&document.activeElement.blur()};ge.prototype.disableButtons=sl;ge.prototype.enableButtons=ol;ge.prototype.getInput=nl;ge.prototype.disableInput=ll;ge.prototype.enableInput=al;ge.prototype.hideLoading=Jn;ge.prototype.disableLoading=Jn;ge.prototype.showValidationMessage=cl;ge.prototype.resetValidationMessage=ul;ge.prototype.close=rt;ge.prototype.closePopup=rt;ge.prototype.closeModal=rt;ge.prototype.closeToast=rt;ge.prototype.rejectPromise=Ja;ge.prototype.update=pl;ge.prototype._destroy=ml;Object.assign(ge,Lh);Object.keys(mh).forEach(t=>{ge[t]=function(...e){if(Ge&&Ge[t])return Ge[t](...e)}});ge.DismissReason=qt;ge.version="11.26.17";const tr=ge;tr.default=tr;typeof document<"u"&&(function(t,e){var n=t.createElement("style");if(t.getElementsByTagName("head")[0].appendChild(n),n.styleSheet)n.styleSheet.disabled||(n.styleSheet.cssText=e);else try{n.innerHTML=e}catch{n.innerText=e}})(document,':root{--swal2-outline: 0 0 0 3px rgba(100, 150, 200, 0.5);--swal2-container-padding: 0.625em;--swal2-backdrop: rgba(0, 0, 0, 0.4);--swal2-backdrop-transition: background-color 0.15s;--swal2-width: 32em;--swal2-padding: 0 0 1.25em;--swal2-border: none;--swal2-border-radius: 0.3125rem;--swal2-background: white;--swal2-color: #545454;--swal2-show-animation: swal2-show 0.3s;--swal2-hide-animation: swal2-hide 0.15s forwards;--swal2-icon-zoom: 1;--swal2-icon-animations: true;--swal2-title-padding: 0.8em 1em 0;--swal2-html-container-padding: 1em 1.6em 0.3em;--swal2-input-border: 1px solid #d9d9d9;--swal2-input-border-radius: 0.1875em;--swal2-input-box-shadow: inset 0 1px 1px rgba(0, 0, 0, 0.06), 0 0 0 3px transparent;--swal2-input-background: transparent;--swal2-input-transition: border-color 0.2s, box-shadow 0.2s;--swal2-input-hover-box-shadow: inset 0 1px 1px rgba(0, 0, 0, 0.06), 0 0 0 3px transparent;--swal2-input-focus-border: 1px solid #b4dbed;--swal2-input-focus-box-shadow: inset 0 1px 1px rgba(0, 0, 0, 0.06), 0 0 0 3px rgba(100, 150, 200, 0.5);--swal2-progress-step-background: #add8e6;--swal2-validation-message-background: #f0f0f0;--swal2-validation-message-color: #666;--swal2-footer-border-color: #eee;--swal2-footer-background: transparent;--swal2-footer-color: inherit;--swal2-timer-progress-bar-background: rgba(0, 0, 0, 0.3);--swal2-close-button-position: initial;--swal2-close-button-inset: auto;--swal2-close-button-font-size: 2.5em;--swal2-close-button-color: #ccc;--swal2-close-button-transition: color 0.2s, box-shadow 0.2s;--swal2-close-button-outline: initial;--swal2-close-button-box-shadow: inset 0 0 0 3px transparent;--swal2-close-button-focus-box-shadow: inset var(--swal2-outline);--swal2-close-button-hover-transform: none;--swal2-actions-justify-content: center;--swal2-actions-width: auto;--swal2-actions-margin: 1.25em auto 0;--swal2-actions-padding: 0;--swal2-actions-border-radius: 0;--swal2-actions-background: transparent;--swal2-action-button-transition: background-color 0.2s, box-shadow 0.2s;--swal2-action-button-hover: black 10%;--swal2-action-button-active: black 10%;--swal2-confirm-button-box-shadow: none;--swal2-confirm-button-border-radius: 0.25em;--swal2-confirm-button-background-color: #7066e0;--swal2-confirm-button-color: #fff;--swal2-deny-button-box-shadow: none;--swal2-deny-button-border-radius: 0.25em;--swal2-deny-button-background-color: #dc3741;--swal2-deny-button-color: #fff;--swal2-cancel-button-box-shadow: none;--swal2-cancel-button-border-radius: 0.25em;--swal2-cancel-button-background-color: #6e7881;--swal2-cancel-button-color: #fff;--swal2-toast-show-animation: swal2-toast-show 0.5s;--swal2-toast-hide-animation: swal2-toast-hide 0.1s forwards;--swal2-toast-border: none;--swal2-toast-box-shadow: 0 0 1px hsl(0deg 0% 0% / 0.075), 0 1px 2px hsl(0deg 0% 0% / 0.075), 1px 2px 4px hsl(0deg 0% 0% / 0.075), 1px 3px 8px hsl(0deg 0% 0% / 0.075), 2px 4px 16px hsl(0deg 0% 0% / 0.075)}[data-swal2-theme=dark]{--swal2-dark-theme-black: #19191a;--swal2-dark-theme-white: #e1e1e1;--swal2-background: var(--swal2-dark-theme-black);--swal2-color: var(--swal2-dark-theme-white);--swal2-footer-border-color: #555;--swal2-input-background: color-mix(in srgb, var(--swal2-dark-theme-black), var(--swal2-dark-theme-white) 10%);--swal2-validation-message-background: color-mix( in srgb, var(--swal2-dark-theme-black), var(--swal2-dark-theme-white) 10% );--swal2-validation-message-color: var(--swal2-dark-theme-white);--swal2-timer-progress-bar-background: rgba(255, 255, 255, 0.7)}@media(prefers-color-scheme: dark){[data-swal2-theme=auto]{--swal2-dark-theme-black: #19191a;--swal2-dark-theme-white: #e1e1e1;--swal2-background: var(--swal2-dark-theme-black);--swal2-color: var(--swal2-dark-theme-white);--swal2-footer-border-color: #555;--swal2-input-background: color-mix(in srgb, var(--swal2-dark-theme-black), var(--swal2-dark-theme-white) 10%);--swal2-validation-message-background: color-mix( in srgb, var(--swal2-dark-theme-black), var(--swal2-dark-theme-white) 10% );--swal2-validation-message-color: var(--swal2-dark-theme-white);--swal2-timer-progress-bar-background: rgba(255, 255, 255, 0.7)}}body.swal2-shown:not(.swal2-no-backdrop,.swal2-toast-shown){overflow:hidden}body.swal2-height-auto{height:auto !important}body.swal2-no-backdrop .swal2-container{background-color:rgba(0,0,0,0) !important;pointer-events:none}body.swal2-no-backdrop .swal2-container .swal2-popup{pointer-events:all}body.swal2-no-backdrop .swal2-container .swal2-modal{box-shadow:0 0 10px var(--swal2-backdrop)}body.swal2-toast-shown .swal2-container{box-sizing:border-box;width:360px;max-width:100%;background-color:rgba(0,0,0,0);pointer-events:none}body.swal2-toast-shown .swal2-container.swal2-top{inset:0 auto auto 50%;transform:translateX(-50%)}body.swal2-toast-shown .swal2-container.swal2-top-end,body.swal2-toast-shown .swal2-container.swal2-top-right{inset:0 0 auto auto}body.swal2-toast-shown .swal2-container.swal2-top-start,body.swal2-toast-shown .swal2-container.swal2-top-left{inset:0 auto auto 0}body.swal2-toast-shown .swal2-container.swal2-center-start,body.swal2-toast-shown .swal2-container.swal2-center-left{inset:50% auto auto 0;transform:translateY(-50%)}body.swal2-toast-shown .swal2-container.swal2-center{inset:50% auto auto 50%;transform:translate(-50%, -50%)}body.swal2-toast-shown .swal2-container.swal2-center-end,body.swal2-toast-shown .swal2-container.swal2-center-right{inset:50% 0 auto auto;transform:translateY(-50%)}body.swal2-toast-shown .swal2-container.swal2-bottom-start,body.swal2-toast-shown .swal2-container.swal2-bottom-left{inset:auto auto 0 0}body.swal2-toast-shown .swal2-container.swal2-bottom{inset:auto auto 0 50%;transform:translateX(-50%)}body.swal2-toast-shown .swal2-container.swal2-bottom-end,body.swal2-toast-shown .swal2-container.swal2-bottom-right{inset:auto 0 0 auto}@media print{body.swal2-shown:not(.swal2-no-backdrop,.swal2-toast-shown){overflow-y:scroll !important}body.swal2-shown:not(.swal2-no-backdrop,.swal2-toast-shown)>[aria-hidden=true]{display:none}body.swal2-shown:not(.swal2-no-backdrop,.swal2-toast-shown) .swal2-container{position:static !important}}div:where(.swal2-container){display:grid;position:fixed;z-index:1060;inset:0;box-sizing:border-box;grid-template-areas:"top-start     top            top-end" "center-start  center         center-end" "bottom-start  bottom-center  bottom-end";grid-template-rows:minmax(min-content, auto) minmax(min-content, auto) minmax(min-content, auto);height:100%;padding:var(--swal2-container-padding);overflow-x:hidden;transition:var(--swal2-backdrop-transition);-webkit-overflow-scrolling:touch}div:where(.swal2-container).swal2-backdrop-show,div:where(.swal2-container).swal2-noanimation{background:var(--swal2-backdrop)}div:where(.swal2-container).swal2-backdrop-hide{background:rgba(0,0,0,0) !important}div:where(.swal2-container).swal2-top-start,div:where(.swal2-container).swal2-center-start,div:where(.swal2-container).swal2-bottom-start{grid-template-columns:minmax(0, 1fr) auto auto}div:where(.swal2-container).swal2-top,div:where(.swal2-container).swal2-center,div:where(.swal2-container).swal2-bottom{grid-template-columns:auto minmax(0, 1fr) auto}div:where(.swal2-container).swal2-top-end,div:where(.swal2-container).swal2-center-end,div:where(.swal2-container).swal2-bottom-end{grid-template-columns:auto auto minmax(0, 1fr)}div:where(.swal2-container).swal2-top-start>.swal2-popup{align-self:start}div:where(.swal2-container).swal2-top>.swal2-popup{grid-column:2;place-self:start center}div:where(.swal2-container).swal2-top-end>.swal2-popup,div:where(.swal2-container).swal2-top-right>.swal2-popup{grid-column:3;place-self:start end}div:where(.swal2-container).swal2-center-start>.swal2-popup,div:where(.swal2-container).swal2-center-left>.swal2-popup{grid-row:2;align-self:center}div:where(.swal2-container).swal2-center>.swal2-popup{grid-column:2;grid-row:2;place-self:center center}div:where(.swal2-container).swal2-center-end>.swal2-popup,div:where(.swal2-container).swal2-center-right>.swal2-popup{grid-column:3;grid-row:2;place-self:center end}div:where(.swal2-container).swal2-bottom-start>.swal2-popup,div:where(.swal2-container).swal2-bottom-left>.swal2-popup{grid-column:1;grid-row:3;align-self:end}div:where(.swal2-container).swal2-bottom>.swal2-popup{grid-column:2;grid-row:3;place-self:end center}div:where(.swal2-container).swal2-bottom-end>.swal2-popup,div:where(.swal2-container).swal2-bottom-right>.swal2-popup{grid-column:3;grid-row:3;place-self:end end}div:where(.swal2-container).swal2-grow-row>.swal2-popup,div:where(.swal2-container).swal2-grow-fullscreen>.swal2-popup{grid-column:1/4;width:100%}div:where(.swal2-container).swal2-grow-column>.swal2-popup,div:where(.swal2-container).swal2-grow-fullscreen>.swal2-popup{grid-row:1/4;align-self:stretch}div:where(.swal2-container).swal2-no-transition{transition:none !important}div:where(.swal2-container)[popover]{width:auto;border:0}div:where(.swal2-container) div:where(.swal2-popup){display:none;position:relative;box-sizing:border-box;grid-template-columns:minmax(0, 100%);width:var(--swal2-width);max-width:100%;padding:var(--swal2-padding);border:var(--swal2-border);border-radius:var(--swal2-border-radius);background:var(--swal2-background);color:var(--swal2-color);font-family:inherit;font-size:1rem;container-name:swal2-popup}div:where(.swal2-container) div:where(.swal2-popup):focus{outline:none}div:where(.swal2-container) div:where(.swal2-popup).swal2-loading{overflow-y:hidden}div:where(.swal2-container) div:where(.swal2-popup).swal2-draggable{cursor:grab}div:where(.swal2-container) div:where(.swal2-popup).swal2-draggable div:where(.swal2-icon){cursor:grab}div:where(.swal2-container) div:where(.swal2-popup).swal2-dragging{cursor:grabbing}div:where(.swal2-container) div:where(.swal2-popup).swal2-dragging div:where(.swal2-icon){cursor:grabbing}div:where(.swal2-container) h2:where(.swal2-title){position:relative;max-width:100%;margin:0;padding:var(--swal2-title-padding);color:inherit;font-size:1.875em;font-weight:600;text-align:center;text-transform:none;overflow-wrap:break-word;cursor:initial}div:where(.swal2-container) div:where(.swal2-actions){display:flex;z-index:1;box-sizing:border-box;flex-wrap:wrap;align-items:center;justify-content:var(--swal2-actions-justify-content);width:var(--swal2-actions-width);margin:var(--swal2-actions-margin);padding:var(--swal2-actions-padding);border-radius:var(--swal2-actions-border-radius);background:var(--swal2-actions-background)}div:where(.swal2-container) div:where(.swal2-loader){display:none;align-items:center;justify-content:center;width:2.2em;height:2.2em;margin:0 1.875em;animation:swal2-rotate-loading 1.5s linear 0s infinite normal;border-width:.25em;border-style:solid;border-radius:100%;border-color:#2778c4 rgba(0,0,0,0) #2778c4 rgba(0,0,0,0)}div:where(.swal2-container) button:where(.swal2-styled){margin:.3125em;padding:.625em 1.1em;transition:var(--swal2-action-button-transition);border:none;box-shadow:0 0 0 3px rgba(0,0,0,0);font-weight:500}div:where(.swal2-container) button:where(.swal2-styled):not([disabled]){cursor:pointer}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-confirm){border-radius:var(--swal2-confirm-button-border-radius);background:initial;background-color:var(--swal2-confirm-button-background-color);box-shadow:var(--swal2-confirm-button-box-shadow);color:var(--swal2-confirm-button-color);font-size:1em}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-confirm):hover{background-color:color-mix(in srgb, var(--swal2-confirm-button-background-color), var(--swal2-action-button-hover))}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-confirm):active{background-color:color-mix(in srgb, var(--swal2-confirm-button-background-color), var(--swal2-action-button-active))}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-deny){border-radius:var(--swal2-deny-button-border-radius);background:initial;background-color:var(--swal2-deny-button-background-color);box-shadow:var(--swal2-deny-button-box-shadow);color:var(--swal2-deny-button-color);font-size:1em}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-deny):hover{background-color:color-mix(in srgb, var(--swal2-deny-button-background-color), var(--swal2-action-button-hover))}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-deny):active{background-color:color-mix(in srgb, var(--swal2-deny-button-background-color), var(--swal2-action-button-active))}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-cancel){border-radius:var(--swal2-cancel-button-border-radius);background:initial;background-color:var(--swal2-cancel-button-background-color);box-shadow:var(--swal2-cancel-button-box-shadow);color:var(--swal2-cancel-button-color);font-size:1em}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-cancel):hover{background-color:color-mix(in srgb, var(--swal2-cancel-button-background-color), var(--swal2-action-button-hover))}div:where(.swal2-container) button:where(.swal2-styled):where(.swal2-cancel):active{background-color:color-mix(in srgb, var(--swal2-cancel-button-background-color), var(--swal2-action-button-active))}div:where(.swal2-container) button:where(.swal2-styled):focus-visible{outline:none;box-shadow:var(--swal2-action-button-focus-box-shadow)}div:where(.swal2-container) button:where(.swal2-styled)[disabled]:not(.swal2-loading){opacity:.4}div:where(.swal2-container) button:where(.swal2-styled)::-moz-focus-inner{border:0}div:where(.swal2-container) div:where(.swal2-footer){margin:1em 0 0;padding:1em 1em 0;border-top:1px solid var(--swal2-footer-border-color);background:var(--swal2-footer-background);color:var(--swal2-footer-color);font-size:1em;text-align:center;cursor:initial}div:where(.swal2-container) .swal2-timer-progress-bar-container{position:absolute;right:0;bottom:0;left:0;grid-column:auto !important;overflow:hidden;border-bottom-right-radius:var(--swal2-border-radius);border-bottom-left-radius:var(--swal2-border-radius)}div:where(.swal2-container) div:where(.swal2-timer-progress-bar){width:100%;height:.25em;background:var(--swal2-timer-progress-bar-background)}div:where(.swal2-container) img:where(.swal2-image){max-width:100%;margin:2em auto 1em;cursor:initial}div:where(.swal2-container) button:where(.swal2-close){position:var(--swal2-close-button-position);inset:var(--swal2-close-button-inset);z-index:2;align-items:center;justify-content:center;width:1.2em;height:1.2em;margin-top:0;margin-right:0;margin-bottom:-1.2em;padding:0;overflow:hidden;transition:var(--swal2-close-button-transition);border:none;border-radius:var(--swal2-border-radius);outline:var(--swal2-close-button-outline);background:rgba(0,0,0,0);color:var(--swal2-close-button-color);font-family:monospace;font-size:var(--swal2-close-button-font-size);cursor:pointer;justify-self:end}div:where(.swal2-container) button:where(.swal2-close):hover{transform:var(--swal2-close-button-hover-transform);background:rgba(0,0,0,0);color:#f27474}div:where(.swal2-container) button:where(.swal2-close):focus-visible{outline:none;box-shadow:var(--swal2-close-button-focus-box-shadow)}div:where(.swal2-container) button:where(.swal2-close)::-moz-focus-inner{border:0}div:where(.swal2-container) div:where(.swal2-html-container){z-index:1;justify-content:center;margin:0;padding:var(--swal2-html-container-padding);overflow:auto;color:inherit;font-size:1.125em;font-weight:normal;line-height:normal;text-align:center;overflow-wrap:break-word;word-break:break-word;cursor:initial}div:where(.swal2-container) input:where(.swal2-input),div:where(.swal2-container) input:where(.swal2-file),div:where(.swal2-container) textarea:where(.swal2-textarea),div:where(.swal2-container) select:where(.swal2-select),div:where(.swal2-container) div:where(.swal2-radio),div:where(.swal2-container) label:where(.swal2-checkbox){margin:1em 2em 3px}div:where(.swal2-container) input:where(.swal2-input),div:where(.swal2-container) input:where(.swal2-file),div:where(.swal2-container) textarea:where(.swal2-textarea){box-sizing:border-box;width:auto;transition:var(--swal2-input-transition);border:var(--swal2-input-border);border-radius:var(--swal2-input-border-radius);background:var(--swal2-input-background);box-shadow:var(--swal2-input-box-shadow);color:inherit;font-size:1.125em}div:where(.swal2-container) input:where(.swal2-input).swal2-inputerror,div:where(.swal2-container) input:where(.swal2-file).swal2-inputerror,div:where(.swal2-container) textarea:where(.swal2-textarea).swal2-inputerror{border-color:#f27474 !important;box-shadow:0 0 2px #f27474 !important}div:where(.swal2-container) input:where(.swal2-input):hover,div:where(.swal2-container) input:where(.swal2-file):hover,div:where(.swal2-container) textarea:where(.swal2-textarea):hover{box-shadow:var(--swal2-input-hover-box-shadow)}div:where(.swal2-container) input:where(.swal2-input):focus,div:where(.swal2-container) input:where(.swal2-file):focus,div:where(.swal2-container) textarea:where(.swal2-textarea):focus{border:var(--swal2-input-focus-border);outline:none;box-shadow:var(--swal2-input-focus-box-shadow)}div:where(.swal2-container) input:where(.swal2-input)::placeholder,div:where(.swal2-container) input:where(.swal2-file)::placeholder,div:where(.swal2-container) textarea:where(.swal2-textarea)::placeholder{color:#ccc}div:where(.swal2-container) .swal2-range{margin:1em 2em 3px;background:var(--swal2-background)}div:where(.swal2-container) .swal2-range input{width:80%}div:where(.swal2-container) .swal2-range output{width:20%;color:inherit;font-weight:600;text-align:center}div:where(.swal2-container) .swal2-range input,div:where(.swal2-container) .swal2-range output{height:2.625em;padding:0;font-size:1.125em;line-height:2.625em}div:where(.swal2-container) .swal2-input{height:2.625em;padding:0 .75em}div:where(.swal2-container) .swal2-file{width:75%;margin-right:auto;margin-left:auto;background:var(--swal2-input-background);font-size:1.125em}div:where(.swal2-container) .swal2-textarea{height:6.75em;padding:.75em}div:where(.swal2-container) .swal2-select{min-width:50%;max-width:100%;padding:.375em .625em;background:var(--swal2-input-background);color:inherit;font-size:1.125em}div:where(.swal2-container) .swal2-radio,div:where(.swal2-container) .swal2-checkbox{align-items:center;justify-content:center;background:var(--swal2-background);color:inherit}div:where(.swal2-container) .swal2-radio label,div:where(.swal2-container) .swal2-checkbox label{margin:0 .6em;font-size:1.125em}div:where(.swal2-container) .swal2-radio input,div:where(.swal2-container) .swal2-checkbox input{flex-shrink:0;margin:0 .4em}div:where(.swal2-container) label:where(.swal2-input-label){display:flex;justify-content:center;margin:1em auto 0}div:where(.swal2-container) div:where(.swal2-validation-message){align-items:center;justify-content:center;margin:1em 0 0;padding:.625em;overflow:hidden;background:var(--swal2-validation-message-background);color:var(--swal2-validation-message-color);font-size:1em;font-weight:300}div:where(.swal2-container) div:where(.swal2-validation-message)::before{content:"!";display:inline-block;width:1.5em;min-width:1.5em;height:1.5em;margin:0 .625em;border-radius:50%;background-color:#f27474;color:#fff;font-weight:600;line-height:1.5em;text-align:center}div:where(.swal2-container) .swal2-progress-steps{flex-wrap:wrap;align-items:center;max-width:100%;margin:1.25em auto;padding:0;background:rgba(0,0,0,0);font-weight:600}div:where(.swal2-container) .swal2-progress-steps li{display:inline-block;position:relative}div:where(.swal2-container) .swal2-progress-steps .swal2-progress-step{z-index:20;flex-shrink:0;width:2em;height:2em;border-radius:2em;background:#2778c4;color:#fff;line-height:2em;text-align:center}div:where(.swal2-container) .swal2-progress-steps .swal2-progress-step.swal2-active-progress-step{background:#2778c4}div:where(.swal2-container) .swal2-progress-steps .swal2-progress-step.swal2-active-progress-step~.swal2-progress-step{background:var(--swal2-progress-step-background);color:#fff}div:where(.swal2-container) .swal2-progress-steps .swal2-progress-step.swal2-active-progress-step~.swal2-progress-step-line{background:var(--swal2-progress-step-background)}div:where(.swal2-container) .swal2-progress-steps .swal2-progress-step-line{z-index:10;flex-shrink:0;width:2.5em;height:.4em;margin:0 -1px;background:#2778c4}div:where(.swal2-icon){position:relative;box-sizing:content-box;justify-content:center;width:5em;height:5em;margin:2.5em auto .6em;zoom:var(--swal2-icon-zoom);border:.25em solid rgba(0,0,0,0);border-radius:50%;border-color:#000;font-family:inherit;line-height:5em;cursor:default;user-select:none}div:where(.swal2-icon) .swal2-icon-content{display:flex;align-items:center;font-size:3.75em}div:where(.swal2-icon).swal2-error{border-color:#f27474;color:#f27474}div:where(.swal2-icon).swal2-error .swal2-x-mark{position:relative;flex-grow:1}div:where(.swal2-icon).swal2-error [class^=swal2-x-mark-line]{display:block;position:absolute;top:2.3125em;width:2.9375em;height:.3125em;border-radius:.125em;background-color:#f27474}div:where(.swal2-icon).swal2-error [class^=swal2-x-mark-line][class$=left]{left:1.0625em;transform:rotate(45deg)}div:where(.swal2-icon).swal2-error [class^=swal2-x-mark-line][class$=right]{right:1em;transform:rotate(-45deg)}@container swal2-popup style(--swal2-icon-animations:true){div:where(.swal2-icon).swal2-error.swal2-icon-show{animation:swal2-animate-error-icon .5s}div:where(.swal2-icon).swal2-error.swal2-icon-show .swal2-x-mark{animation:swal2-animate-error-x-mark .5s}}div:where(.swal2-icon).swal2-warning{border-color:#f8bb86;color:#f8bb86}@container swal2-popup style(--swal2-icon-animations:true){div:where(.swal2-icon).swal2-warning.swal2-icon-show{animation:swal2-animate-error-icon .5s}div:where(.swal2-icon).swal2-warning.swal2-icon-show .swal2-icon-content{animation:swal2-animate-i-mark .5s}}div:where(.swal2-icon).swal2-info{border-color:#3fc3ee;color:#3fc3ee}@container swal2-popup style(--swal2-icon-animations:true){div:where(.swal2-icon).swal2-info.swal2-icon-show{animation:swal2-animate-error-icon .5s}div:where(.swal2-icon).swal2-info.swal2-icon-show .swal2-icon-content{animation:swal2-animate-i-mark .8s}}div:where(.swal2-icon).swal2-question{border-color:#87adbd;color:#87adbd}@container swal2-popup style(--swal2-icon-animations:true){div:where(.swal2-icon).swal2-question.swal2-icon-show{animation:swal2-animate-error-icon .5s}div:where(.swal2-icon).swal2-question.swal2-icon-show .swal2-icon-content{animation:swal2-animate-question-mark .8s}}div:where(.swal2-icon).swal2-success{border-color:#a5dc86;color:#a5dc86}div:where(.swal2-icon).swal2-success [class^=swal2-success-circular-line]{position:absolute;width:3.75em;height:7.5em;border-radius:50%}div:where(.swal2-icon).swal2-success [class^=swal2-success-circular-line][class$=left]{top:-0.4375em;left:-2.0635em;transform:rotate(-45deg);transform-origin:3.75em 3.75em;border-radius:7.5em 0 0 7.5em}div:where(.swal2-icon).swal2-success [class^=swal2-success-circular-line][class$=right]{top:-0.6875em;left:1.875em;transform:rotate(-45deg);transform-origin:0 3.75em;border-radius:0 7.5em 7.5em 0}div:where(.swal2-icon).swal2-success .swal2-success-ring{position:absolute;z-index:2;top:-0.25em;left:-0.25em;box-sizing:content-box;width:100%;height:100%;border:.25em solid rgba(165,220,134,.3);border-radius:50%}div:where(.swal2-icon).swal2-success .swal2-success-fix{position:absolute;z-index:1;top:.5em;left:1.625em;width:.4375em;height:5.625em;transform:rotate(-45deg)}div:where(.swal2-icon).swal2-success [class^=swal2-success-line]{display:block;position:absolute;z-index:2;height:.3125em;border-radius:.125em;background-color:#a5dc86}div:where(.swal2-icon).swal2-success [class^=swal2-success-line][class$=tip]{top:2.875em;left:.8125em;width:1.5625em;transform:rotate(45deg)}div:where(.swal2-icon).swal2-success [class^=swal2-success-line][class$=long]{top:2.375em;right:.5em;width:2.9375em;transform:rotate(-45deg)}@container swal2-popup style(--swal2-icon-animations:true){div:where(.swal2-icon).swal2-success.swal2-icon-show .swal2-success-line-tip{animation:swal2-animate-success-line-tip .75s}div:where(.swal2-icon).swal2-success.swal2-icon-show .swal2-success-line-long{animation:swal2-animate-success-line-long .75s}div:where(.swal2-icon).swal2-success.swal2-icon-show .swal2-success-circular-line-right{animation:swal2-rotate-success-circular-line 4.25s ease-in}}[class^=swal2]{-webkit-tap-highlight-color:rgba(0,0,0,0)}.swal2-show{animation:var(--swal2-show-animation)}.swal2-hide{animation:var(--swal2-hide-animation)}.swal2-noanimation{transition:none}.swal2-scrollbar-measure{position:absolute;top:-9999px;width:50px;height:50px;overflow:scroll}.swal2-rtl .swal2-close{margin-right:initial;margin-left:0}.swal2-rtl .swal2-timer-progress-bar{right:0;left:auto}.swal2-toast{box-sizing:border-box;grid-column:1/4 !important;grid-row:1/4 !important;grid-template-columns:min-content auto min-content;padding:1em;overflow-y:hidden;border:var(--swal2-toast-border);background:var(--swal2-background);box-shadow:var(--swal2-toast-box-shadow);pointer-events:all}.swal2-toast>*{grid-column:2}.swal2-toast h2:where(.swal2-title){margin:.5em 1em;padding:0;font-size:1em;text-align:initial}.swal2-toast .swal2-loading{justify-content:center}.swal2-toast input:where(.swal2-input){height:2em;margin:.5em;font-size:1em}.swal2-toast .swal2-validation-message{font-size:1em}.swal2-toast div:where(.swal2-footer){margin:.5em 0 0;padding:.5em 0 0;font-size:.8em}.swal2-toast button:where(.swal2-close){grid-column:3/3;grid-row:1/99;align-self:center;width:.8em;height:.8em;margin:0;font-size:2em}.swal2-toast div:where(.swal2-html-container){margin:.5em 1em;padding:0;overflow:initial;font-size:1em;text-align:initial}.swal2-toast div:where(.swal2-html-container):empty{padding:0}.swal2-toast .swal2-loader{grid-column:1;grid-row:1/99;align-self:center;width:2em;height:2em;margin:.25em}.swal2-toast .swal2-icon{grid-column:1;grid-row:1/99;align-self:center;width:2em;min-width:2em;height:2em;margin:0 .5em 0 0}.swal2-toast .swal2-icon .swal2-icon-content{display:flex;align-items:center;font-size:1.8em;font-weight:bold}.swal2-toast .swal2-icon.swal2-success .swal2-success-ring{width:2em;height:2em}.swal2-toast .swal2-icon.swal2-error [class^=swal2-x-mark-line]{top:.875em;width:1.375em}.swal2-toast .swal2-icon.swal2-error [class^=swal2-x-mark-line][class$=left]{left:.3125em}.swal2-toast .swal2-icon.swal2-error [class^=swal2-x-mark-line][class$=right]{right:.3125em}.swal2-toast div:where(.swal2-actions){justify-content:flex-start;height:auto;margin:0;margin-top:.5em;padding:0 .5em}.swal2-toast button:where(.swal2-styled){margin:.25em .5em;padding:.4em .6em;font-size:1em}.swal2-toast .swal2-success{border-color:#a5dc86}.swal2-toast .swal2-success [class^=swal2-success-circular-line]{position:absolute;width:1.6em;height:3em;border-radius:50%}.swal2-toast .swal2-success [class^=swal2-success-circular-line][class$=left]{top:-0.8em;left:-0.5em;transform:rotate(-45deg);transform-origin:2em 2em;border-radius:4em 0 0 4em}.swal2-toast .swal2-success [class^=swal2-success-circular-line][class$=right]{top:-0.25em;left:.9375em;transform-origin:0 1.5em;border-radius:0 4em 4em 0}.swal2-toast .swal2-success .swal2-success-ring{width:2em;height:2em}.swal2-toast .swal2-success .swal2-success-fix{top:0;left:.4375em;width:.4375em;height:2.6875em}.swal2-toast .swal2-success [class^=swal2-success-line]{height:.3125em}.swal2-toast .swal2-success [class^=swal2-success-line][class$=tip]{top:1.125em;left:.1875em;width:.75em}.swal2-toast .swal2-success [class^=swal2-success-line][class$=long]{top:.9375em;right:.1875em;width:1.375em}@container swal2-popup style(--swal2-icon-animations:true){.swal2-toast .swal2-success.swal2-icon-show .swal2-success-line-tip{animation:swal2-toast-animate-success-line-tip .75s}.swal2-toast .swal2-success.swal2-icon-show .swal2-success-line-long{animation:swal2-toast-animate-success-line-long .75s}}.swal2-toast.swal2-show{animation:var(--swal2-toast-show-animation)}.swal2-toast.swal2-hide{animation:var(--swal2-toast-hide-animation)}@keyframes swal2-show{0%{transform:translate3d(0, -50px, 0) scale(0.9);opacity:0}100%{transform:translate3d(0, 0, 0) scale(1);opacity:1}}@keyframes swal2-hide{0%{transform:translate3d(0, 0, 0) scale(1);opacity:1}100%{transform:translate3d(0, -50px, 0) scale(0.9);opacity:0}}@keyframes swal2-animate-success-line-tip{0%{top:1.1875em;left:.0625em;width:0}54%{top:1.0625em;left:.125em;width:0}70%{top:2.1875em;left:-0.375em;width:3.125em}84%{top:3em;left:1.3125em;width:1.0625em}100%{top:2.8125em;left:.8125em;width:1.5625em}}@keyframes swal2-animate-success-line-long{0%{top:3.375em;right:2.875em;width:0}65%{top:3.375em;right:2.875em;width:0}84%{top:2.1875em;right:0;width:3.4375em}100%{top:2.375em;right:.5em;width:2.9375em}}@keyframes swal2-rotate-success-circular-line{0%{transform:rotate(-45deg)}5%{transform:rotate(-45deg)}12%{transform:rotate(-405deg)}100%{transform:rotate(-405deg)}}@keyframes swal2-animate-error-x-mark{0%{margin-top:1.625em;transform:scale(0.4);opacity:0}50%{margin-top:1.625em;transform:scale(0.4);opacity:0}80%{margin-top:-0.375em;transform:scale(1.15)}100%{margin-top:0;transform:scale(1);opacity:1}}@keyframes swal2-animate-error-icon{0%{transform:rotateX(100deg);opacity:0}100%{transform:rotateX(0deg);opacity:1}}@keyframes swal2-rotate-loading{0%{transform:rotate(0deg)}100%{transform:rotate(360deg)}}@keyframes swal2-animate-question-mark{0%{transform:rotateY(-360deg)}100%{transform:rotateY(0)}}@keyframes swal2-animate-i-mark{0%{transform:rotateZ(45deg);opacity:0}25%{transform:rotateZ(-25deg);opacity:.4}50%{transform:rotateZ(15deg);opacity:.8}75%{transform:rotateZ(-5deg);opacity:1}100%{transform:rotateX(0);opacity:1}}@keyframes swal2-toast-show{0%{transform:translateY(-0.625em) rotateZ(2deg)}33%{transform:translateY(0) rotateZ(-2deg)}66%{transform:translateY(0.3125em) rotateZ(2deg)}100%{transform:translateY(0) rotateZ(0deg)}}@keyframes swal2-toast-hide{100%{transform:rotateZ(1deg);opacity:0}}@keyframes swal2-toast-animate-success-line-tip{0%{top:.5625em;left:.0625em;width:0}54%{top:.125em;left:.125em;width:0}70%{top:.625em;left:-0.25em;width:1.625em}84%{top:1.0625em;left:.75em;width:.5em}100%{top:1.125em;left:.1875em;width:.75em}}@keyframes swal2-toast-animate-success-line-long{0%{top:1.625em;right:1.375em;width:0}65%{top:1.25em;right:.9375em;width:0}84%{top:.9375em;right:0;width:1.125em}100%{top:.9375em;right:.1875em;width:1.375em}}');var Ar,j,Al,Cl,Ut,vt,As,Sl,Dl,nr={},_l=[],cg=/acit|ex(?:s|g|n|p|$)|rph|grid|ows|mnc|ntw|ine[ch]|zoo|^ord|itera/i;function ot(t,e){for(var n in e)t[n]=e[n];return t}function Tl(t){var e=t.parentNode;e&&e.removeChild(t)}function D(t,e,n){var r,i,o,a={};for(o in e)o=="key"?r=e[o]:o=="ref"?i=e[o]:a[o]=e[o];if(arguments.length>2&&(a.children=arguments.length>3?Ar.call(arguments,2):n),typeof t=="function"&&t.defaultProps!=null)for(o in t.defaultProps)a[o]===void 0&&(a[o]=t.defaultProps[o]);return Un(t,a,r,i,null)}function Un(t,e,n,r,i){var o={type:t,props:e,key:n,ref:r,__k:null,__:null,__b:0,__e:null,__d:void 0,__c:null,__h:null,constructor:void 0,__v:i??++Al};return i==null&&j.vnode!=null&&j.vnode(o),o}function Je(){return{current:null}}function fe(t){return t.children}function ug(t,e,n,r,i){var o;for(o in n)o==="children"||o==="key"||o in e||rr(t,o,null,n[o],r);for(o in e)i&&typeof e[o]!="function"||o==="children"||o==="key"||o==="value"||o==="checked"||n[o]===e[o]||rr(t,o,e[o],n[o],r)}function Cs(t,e,n){e[0]==="-"?t.setProperty(e,n??""):t[e]=n==null?"":typeof n!="number"||cg.test(e)?n:n+"px"}function rr(t,e,n,r,i){var o;e:if(e==="style")if(typeof n=="string")t.style.cssText=n;else{if(typeof r=="string"&&(t.style.cssText=r=""),r)for(e in r)n&&e in n||Cs(t.style,e,"");if(n)for(e in n)r&&n[e]===r[e]||Cs(t.style,e,n[e])}else if(e[0]==="o"&&e[1]==="n")o=e!==(e=e.replace(/Capture$/,"")),e=e.toLowerCase()in t?e.toLowerCase().slice(2):e.slice(2),t.l||(t.l={}),t.l[e+o]=n,n?r||t.addEventListener(e,o?Ds:Ss,o):t.removeEventListener(e,o?Ds:Ss,o);else if(e!=="dangerouslySetInnerHTML"){if(i)e=e.replace(/xlink(H|:h)/,"h").replace(/sName$/,"s");else if(e!=="width"&&e!=="height"&&e!=="href"&&e!=="list"&&e!=="form"&&e!=="tabIndex"&&e!=="download"&&e in t)try{t[e]=n??"";break e}catch{}typeof n=="function"||(n==null||n===!1&&e.indexOf("-")==-1?t.removeAttribute(e):t.setAttribute(e,n))}}function Ss(t){Ut=!0;try{return this.l[t.type+!1](j.event?j.event(t):t)}finally{Ut=!1}}function Ds(t){Ut=!0;try{return this.l[t.type+!0](j.event?j.event(t):t)}finally{Ut=!1}}function Oe(t,e){this.props=t,this.context=e}function ln(t,e){if(e==null)return t.__?ln(t.__,t.__.__k.indexOf(t)+1):null;for(var n;e<t.__k.length;e++)if((n=t.__k[e])!=null&&n.__e!=null)return n.__e;return typeof t.type=="function"?ln(t):null}function xl(t){var e,n;if((t=t.__)!=null&&t.__c!=null){for(t.__e=t.__c.base=null,e=0;e<t.__k.length;e++)if((n=t.__k[e])!=null&&n.__e!=null){t.__e=t.__c.base=n.__e;break}return xl(t)}}function dg(t){Ut?setTimeout(t):Sl(t)}function hi(t){(!t.__d&&(t.__d=!0)&&vt.push(t)&&!ir.__r++||As!==j.debounceRendering)&&((As=j.debounceRendering)||dg)(ir)}function ir(){var t,e,n,r,i,o,a,l;for(vt.sort(function(u,h){return u.__v.__b-h.__v.__b});t=vt.shift();)t.__d&&(e=vt.length,r=void 0,i=void 0,a=(o=(n=t).__v).__e,(l=n.__P)&&(r=[],(i=ot({},o)).__v=o.__v+1,Fi(l,o,i,n.__n,l.ownerSVGElement!==void 0,o.__h!=null?[a]:null,r,a??ln(o),o.__h),Ol(r,o),o.__e!=a&&xl(o)),vt.length>e&&vt.sort(function(u,h){return u.__v.__b-h.__v.__b}));ir.__r=0}function Rl(t,e,n,r,i,o,a,l,u,h){var f,v,p,m,E,R,x,k=r&&r.__k||_l,B=k.length;for(n.__k=[],f=0;f<e.length;f++)if((m=n.__k[f]=(m=e[f])==null||typeof m=="boolean"?null:typeof m=="string"||typeof m=="number"||typeof m=="bigint"?Un(null,m,null,null,m):Array.isArray(m)?Un(fe,{children:m},null,null,null):m.__b>0?Un(m.type,m.props,m.key,m.ref?m.ref:null,m.__v):m)!=null){if(m.__=n,m.__b=n.__b+1,(p=k[f])===null||p&&m.key==p.key&&m.type===p.type)k[f]=void 0;else for(v=0;v<B;v++){if((p=k[v])&&m.key==p.key&&m.type===p.type){k[v]=void 0;break}p=null}Fi(t,m,p=p||nr,i,o,a,l,u,h),E=m.__e,(v=m.ref)&&p.ref!=v&&(x||(x=[]),p.ref&&x.push(p.ref,null,m),x.push(v,m.__c||E,m)),E!=null?(R==null&&(R=E),typeof m.type=="function"&&m.__k===p.__k?m.__d=u=kl(m,u,t):u=Il(t,m,p,k,E,u),typeof n.type=="function"&&(n.__d=u)):u&&p.__e==u&&u.parentNode!=t&&(u=ln(p))}for(n.__e=R,f=B;f--;)k[f]!=null&&(typeof n.type=="function"&&k[f].__e!=null&&k[f].__e==n.__d&&(n.__d=Ml(r).nextSibling),Pl(k[f],k[f]));if(x)for(f=0;f<x.length;f++)Bl(x[f],x[++f],x[++f])}function kl(t,e,n){for(var r,i=t.__k,o=0;i&&o<i.length;o++)(r=i[o])&&(r.__=t,e=typeof r.type=="function"?kl(r,e,n):Il(n,r,r,i,r.__e,e));return e}function or(t,e){return e=e||[],t==null||typeof t=="boolean"||(Array.isArray(t)?t.some(function(n){or(n,e)}):e.push(t)),e}function Il(t,e,n,r,i,o){var a,l,u;if(e.__d!==void 0)a=e.__d,e.__d=void 0;else if(n==null||i!=o||i.parentNode==null)e:if(o==null||o.parentNode!==t)t.appendChild(i),a=null;else{for(l=o,u=0;(l=l.nextSibling)&&u<r.length;u+=1)if(l==i)break e;t.insertBefore(i,o),a=o}return a!==void 0?a:i.nextSibling}function Ml(t){var e,n,r;if(t.type==null||typeof t.type=="string")return t.__e;if(t.__k){for(e=t.__k.length-1;e>=0;e--)if((n=t.__k[e])&&(r=Ml(n)))return r}return null}function Fi(t,e,n,r,i,o,a,l,u){var h,f,v,p,m,E,R,x,k,B,P,$,pe,se,Z,W=e.type;if(e.constructor!==void 0)return null;n.__h!=null&&(u=n.__h,l=e.__e=n.__e,e.__h=null,o=[l]),(h=j.__b)&&h(e);try{e:if(typeof W=="function"){if(x=e.props,k=(h=W.contextType)&&r[h.__c],B=h?k?k.props.value:h.__:r,n.__c?R=(f=e.__c=n.__c).__=f.__E:("prototype"in W&&W.prototype.render?e.__c=f=new W(x,B):(e.__c=f=new Oe(x,B),f.constructor=W,f.render=hg),k&&k.sub(f),f.props=x,f.state||(f.state={}),f.context=B,f.__n=r,v=f.__d=!0,f.__h=[],f._sb=[]),f.__s==null&&(f.__s=f.state),W.getDerivedStateFromProps!=null&&(f.__s==f.state&&(f.__s=ot({},f.__s)),ot(f.__s,W.getDerivedStateFromProps(x,f.__s))),p=f.props,m=f.state,f.__v=e,v)W.getDerivedStateFromProps==null&&f.componentWillMount!=null&&f.componentWillMount(),f.componentDidMount!=null&&f.__h.push(f.componentDidMount);else{if(W.getDerivedStateFromProps==null&&x!==p&&f.componentWillReceiveProps!=null&&f.componentWillReceiveProps(x,B),!f.__e&&f.shouldComponentUpdate!=null&&f.shouldComponentUpdate(x,f.__s,B)===!1||e.__v===n.__v){for(e.__v!==n.__v&&(f.props=x,f.state=f.__s,f.__d=!1),e.__e=n.__e,e.__k=n.__k,e.__k.forEach(function(Ae){Ae&&(Ae.__=e)}),P=0;P<f._sb.length;P++)f.__h.push(f._sb[P]);f._sb=[],f.__h.length&&a.push(f);break e}f.componentWillUpdate!=null&&f.componentWillUpdate(x,f.__s,B),f.componentDidUpdate!=null&&f.__h.push(function(){f.componentDidUpdate(p,m,E)})}if(f.context=B,f.props=x,f.__P=t,$=j.__r,pe=0,"prototype"in W&&W.prototype.render){for(f.state=f.__s,f.__d=!1,$&&$(e),h=f.render(f.props,f.state,f.context),se=0;se<f._sb.length;se++)f.__h.push(f._sb[se]);f._sb=[]}else do f.__d=!1,$&&$(e),h=f.render(f.props,f.state,f.context),f.state=f.__s;while(f.__d&&++pe<25);f.state=f.__s,f.getChildContext!=null&&(r=ot(ot({},r),f.getChildContext())),v||f.getSnapshotBeforeUpdate==null||(E=f.getSnapshotBeforeUpdate(p,m)),Z=h!=null&&h.type===fe&&h.key==null?h.props.children:h,Rl(t,Array.isArray(Z)?Z:[Z],e,n,r,i,o,a,l,u),f.base=e.__e,e.__h=null,f.__h.length&&a.push(f),R&&(f.__E=f.__=null),f.__e=!1}else o==null&&e.__v===n.__v?(e.__k=n.__k,e.__e=n.__e):e.__e=fg(n.__e,e,n,r,i,o,a,u);(h=j.diffed)&&h(e)}catch(Ae){e.__v=null,(u||o!=null)&&(e.__e=l,e.__h=!!u,o[o.indexOf(l)]=null),j.__e(Ae,e,n)}}function Ol(t,e){j.__c&&j.__c(e,t),t.some(function(n){try{t=n.__h,n.__h=[],t.some(function(r){r.call(n)})}catch(r){j.__e(r,n.__v)}})}function fg(t,e,n,r,i,o,a,l){var u,h,f,v=n.props,p=e.props,m=e.type,E=0;if(m==="svg"&&(i=!0),o!=null){for(;E<o.length;E++)if((u=o[E])&&"setAttribute"in u==!!m&&(m?u.localName===m:u.nodeType===3)){t=u,o[E]=null;break}}if(t==null){if(m===null)return document.createTextNode(p);t=i?document.createElementNS("http://www.w3.org/2000/svg",m):document.createElement(m,p.is&&p),o=null,l=!1}if(m===null)v===p||l&&t.data===p||(t.data=p);else{if(o=o&&Ar.call(t.childNodes),h=(v=n.props||nr).dangerouslySetInnerHTML,f=p.dangerouslySetInnerHTML,!l){if(o!=null)for(v={},E=0;E<t.attributes.length;E++)v[t.attributes[E].name]=t.attributes[E].value;(f||h)&&(f&&(h&&f.__html==h.__html||f.__html===t.innerHTML)||(t.innerHTML=f&&f.__html||""))}if(ug(t,p,v,i,l),f)e.__k=[];else if(E=e.props.children,Rl(t,Array.isArray(E)?E:[E],e,n,r,i&&m!=="foreignObject",o,a,o?o[0]:n.__k&&ln(n,0),l),o!=null)for(E=o.length;E--;)o[E]!=null&&Tl(o[E]);l||("value"in p&&(E=p.value)!==void 0&&(E!==t.value||m==="progress"&&!E||m==="option"&&E!==v.value)&&rr(t,"value",E,v.value,!1),"checked"in p&&(E=p.checked)!==void 0&&E!==t.checked&&rr(t,"checked",E,v.checked,!1))}return t}function Bl(t,e,n){try{typeof t=="function"?t(e):t.current=e}catch(r){j.__e(r,n)}}function Pl(t,e,n){var r,i;if(j.unmount&&j.unmount(t),(r=t.ref)&&(r.current&&r.current!==t.__e||Bl(r,null,e)),(r=t.__c)!=null){if(r.componentWillUnmount)try{r.componentWillUnmount()}catch(o){j.__e(o,e)}r.base=r.__P=null,t.__c=void 0}if(r=t.__k)for(i=0;i<r.length;i++)r[i]&&Pl(r[i],e,n||typeof t.type!="function");n||t.__e==null||Tl(t.__e),t.__=t.__e=t.__d=void 0}function hg(t,e,n){return this.constructor(t,n)}function cn(t,e,n){var r,i,o;j.__&&j.__(t,e),i=(r=!1)?null:e.__k,o=[],Fi(e,t=e.__k=D(fe,null,[t]),i||nr,nr,e.ownerSVGElement!==void 0,i?null:e.firstChild?Ar.call(e.childNodes):null,o,i?i.__e:e.firstChild,r),Ol(o,t)}function gg(t,e){var n={__c:e="__cC"+Dl++,__:t,Consumer:function(r,i){return r.children(i)},Provider:function(r){var i,o;return this.getChildContext||(i=[],(o={})[e]=this,this.getChildContext=function(){return o},this.shouldComponentUpdate=function(a){this.props.value!==a.value&&i.some(function(l){l.__e=!0,hi(l)})},this.sub=function(a){i.push(a);var l=a.componentWillUnmount;a.componentWillUnmount=function(){i.splice(i.indexOf(a),1),l&&l.call(a)}}),r.children}};return n.Provider.__=n.Consumer.contextType=n}Ar=_l.slice,j={__e:function(t,e,n,r){for(var i,o,a;e=e.__;)if((i=e.__c)&&!i.__)try{if((o=i.constructor)&&o.getDerivedStateFromError!=null&&(i.setState(o.getDerivedStateFromError(t)),a=i.__d),i.componentDidCatch!=null&&(i.componentDidCatch(t,r||{}),a=i.__d),a)return i.__E=i}catch(l){t=l}throw t}},Al=0,Cl=function(t){return t!=null&&t.constructor===void 0},Ut=!1,Oe.prototype.setState=function(t,e){var n;n=this.__s!=null&&this.__s!==this.state?this.__s:this.__s=ot({},this.state),typeof t=="function"&&(t=t(ot({},n),this.props)),t&&ot(n,t),t!=null&&this.__v&&(e&&this._sb.push(e),hi(this))},Oe.prototype.forceUpdate=function(t){this.__v&&(this.__e=!0,t&&this.__h.push(t),hi(this))},Oe.prototype.render=fe,vt=[],Sl=typeof Promise=="function"?Promise.prototype.then.bind(Promise.resolve()):setTimeout,ir.__r=0,Dl=0;var qe,$r,_s,Nl=[],Gr=[],Ts=j.__b,xs=j.__r,Rs=j.diffed,ks=j.__c,Is=j.unmount;function pg(){for(var t;t=Nl.shift();)if(t.__P&&t.__H)try{t.__H.__h.forEach(Vn),t.__H.__h.forEach(gi),t.__H.__h=[]}catch(e){t.__H.__h=[],j.__e(e,t.__v)}}j.__b=function(t){qe=null,Ts&&Ts(t)},j.__r=function(t){xs&&xs(t);var e=(qe=t.__c).__H;e&&($r===qe?(e.__h=[],qe.__h=[],e.__.forEach(function(n){n.__N&&(n.__=n.__N),n.__V=Gr,n.__N=n.i=void 0})):(e.__h.forEach(Vn),e.__h.forEach(gi),e.__h=[])),$r=qe},j.diffed=function(t){Rs&&Rs(t);var e=t.__c;e&&e.__H&&(e.__H.__h.length&&(Nl.push(e)!==1&&_s===j.requestAnimationFrame||((_s=j.requestAnimationFrame)||mg)(pg)),e.__H.__.forEach(function(n){n.i&&(n.__H=n.i),n.__V!==Gr&&(n.__=n.__V),n.i=void 0,n.__V=Gr})),$r=qe=null},j.__c=function(t,e){e.some(function(n){try{n.__h.forEach(Vn),n.__h=n.__h.filter(function(r){return!r.__||gi(r)})}catch(r){e.some(function(i){i.__h&&(i.__h=[])}),e=[],j.__e(r,n.__v)}}),ks&&ks(t,e)},j.unmount=function(t){Is&&Is(t);var e,n=t.__c;n&&n.__H&&(n.__H.__.forEach(function(r){try{Vn(r)}catch(i){e=i}}),n.__H=void 0,e&&j.__e(e,n.__v))};var Ms=typeof requestAnimationFrame=="function";function mg(t){var e,n=function(){clearTimeout(r),Ms&&cancelAnimationFrame(e),setTimeout(t)},r=setTimeout(n,100);Ms&&(e=requestAnimationFrame(n))}function Vn(t){var e=qe,n=t.__c;typeof n=="function"&&(t.__c=void 0,n()),qe=e}function gi(t){var e=qe;t.__c=t.__(),qe=e}function vg(t,e){for(var n in e)t[n]=e[n];return t}function Os(t,e){for(var n in t)if(n!=="__source"&&!(n in e))return!0;for(var r in e)if(r!=="__source"&&t[r]!==e[r])return!0;return!1}function Bs(t){this.props=t}(Bs.prototype=new Oe).isPureReactComponent=!0,Bs.prototype.shouldComponentUpdate=function(t,e){return Os(this.props,t)||Os(this.state,e)};var Ps=j.__b;j.__b=function(t){t.type&&t.type.__f&&t.ref&&(t.props.ref=t.ref,t.ref=null),Ps&&Ps(t)};var wg=j.__e;j.__e=function(t,e,n,r){if(t.then){for(var i,o=e;o=o.__;)if((i=o.__c)&&i.__c)return e.__e==null&&(e.__e=n.__e,e.__k=n.__k),i.__c(t,e)}wg(t,e,n,r)};var Ns=j.unmount;function Ll(t,e,n){return t&&(t.__c&&t.__c.__H&&(t.__c.__H.__.forEach(function(r){typeof r.__c=="function"&&r.__c()}),t.__c.__H=null),(t=vg({},t)).__c!=null&&(t.__c.__P===n&&(t.__c.__P=e),t.__c=null),t.__k=t.__k&&t.__k.map(function(r){return Ll(r,e,n)})),t}function Hl(t,e,n){return t&&(t.__v=null,t.__k=t.__k&&t.__k.map(function(r){return Hl(r,e,n)}),t.__c&&t.__c.__P===e&&(t.__e&&n.insertBefore(t.__e,t.__d),t.__c.__e=!0,t.__c.__P=n)),t}function qr(){this.__u=0,this.t=null,this.__b=null}function jl(t){var e=t.__.__c;return e&&e.__a&&e.__a(t)}function Bn(){this.u=null,this.o=null}j.unmount=function(t){var e=t.__c;e&&e.__R&&e.__R(),e&&t.__h===!0&&(t.type=null),Ns&&Ns(t)},(qr.prototype=new Oe).__c=function(t,e){var n=e.__c,r=this;r.t==null&&(r.t=[]),r.t.push(n);var i=jl(r.__v),o=!1,a=function(){o||(o=!0,n.__R=null,i?i(l):l())};n.__R=a;var l=function(){if(!--r.__u){if(r.state.__a){var h=r.state.__a;r.__v.__k[0]=Hl(h,h.__c.__P,h.__c.__O)}var f;for(r.setState({__a:r.__b=null});f=r.t.pop();)f.forceUpdate()}},u=e.__h===!0;r.__u++||u||r.setState({__a:r.__b=r.__v.__k[0]}),t.then(a,a)},qr.prototype.componentWillUnmount=function(){this.t=[]},qr.prototype.render=function(t,e){if(this.__b){if(this.__v.__k){var n=document.createElement("div"),r=this.__v.__k[0].__c;this.__v.__k[0]=Ll(this.__b,n,r.__O=r.__P)}this.__b=null}var i=e.__a&&D(fe,null,t.fallback);return i&&(i.__h=null),[D(fe,null,e.__a?null:t.children),i]};var Ls=function(t,e,n){if(++n[1]===n[0]&&t.o.delete(e),t.props.revealOrder&&(t.props.revealOrder[0]!=="t"||!t.o.size))for(n=t.u;n;){for(;n.length>3;)n.pop()();if(n[1]<n[0])break;t.u=n=n[2]}};function bg(t){return this.getChildContext=function(){return t.context},t.children}function yg(t){var e=this,n=t.i;e.componentWillUnmount=function(){cn(null,e.l),e.l=null,e.i=null},e.i&&e.i!==n&&e.componentWillUnmount(),t.__v?(e.l||(e.i=n,e.l={nodeType:1,parentNode:n,childNodes:[],appendChild:function(r){this.childNodes.push(r),e.i.appendChild(r)},insertBefore:function(r,i){this.childNodes.push(r),e.i.appendChild(r)},removeChild:function(r){this.childNodes.splice(this.childNodes.indexOf(r)>>>1,1),e.i.removeChild(r)}}),cn(D(bg,{context:e.context},t.__v),e.l)):e.l&&e.componentWillUnmount()}function Eg(t,e){var n=D(yg,{__v:t,i:e});return n.containerInfo=e,n}(Bn.prototype=new Oe).__a=function(t){var e=this,n=jl(e.__v),r=e.o.get(t);return r[0]++,function(i){var o=function(){e.props.revealOrder?(r.push(i),Ls(e,t,r)):i()};n?n(o):o()}},Bn.prototype.render=function(t){this.u=null,this.o=new Map;var e=or(t.children);t.revealOrder&&t.revealOrder[0]==="b"&&e.reverse();for(var n=e.length;n--;)this.o.set(e[n],this.u=[1,0,this.u]);return t.children},Bn.prototype.componentDidUpdate=Bn.prototype.componentDidMount=function(){var t=this;this.o.forEach(function(e,n){Ls(t,n,e)})};var Ag=typeof Symbol<"u"&&Symbol.for&&Symbol.for("react.element")||60103,Cg=/^(?:accent|alignment|arabic|baseline|cap|clip(?!PathU)|color|dominant|fill|flood|font|glyph(?!R)|horiz|image|letter|lighting|marker(?!H|W|U)|overline|paint|pointer|shape|stop|strikethrough|stroke|text(?!L)|transform|underline|unicode|units|v|vector|vert|word|writing|x(?!C))[A-Z]/,Sg=typeof document<"u",Dg=function(t){return(typeof Symbol<"u"&&typeof Symbol()=="symbol"?/fil|che|rad/i:/fil|che|ra/i).test(t)};Oe.prototype.isReactComponent={},["componentWillMount","componentWillReceiveProps","componentWillUpdate"].forEach(function(t){Object.defineProperty(Oe.prototype,t,{configurable:!0,get:function(){return this["UNSAFE_"+t]},set:function(e){Object.defineProperty(this,t,{configurable:!0,writable:!0,value:e})}})});var Hs=j.event;function _g(){}function Tg(){return this.cancelBubble}function xg(){return this.defaultPrevented}j.event=function(t){return Hs&&(t=Hs(t)),t.persist=_g,t.isPropagationStopped=Tg,t.isDefaultPrevented=xg,t.nativeEvent=t};var js={configurable:!0,get:function(){return this.class}},Fs=j.vnode;j.vnode=function(t){var e=t.type,n=t.props,r=n;if(typeof e=="string"){var i=e.indexOf("-")===-1;for(var o in r={},n){var a=n[o];Sg&&o==="children"&&e==="noscript"||o==="value"&&"defaultValue"in n&&a==null||(o==="defaultValue"&&"value"in n&&n.value==null?o="value":o==="download"&&a===!0?a="":/ondoubleclick/i.test(o)?o="ondblclick":/^onchange(textarea|input)/i.test(o+e)&&!Dg(n.type)?o="oninput":/^onfocus$/i.test(o)?o="onfocusin":/^onblur$/i.test(o)?o="onfocusout":/^on(Ani|Tra|Tou|BeforeInp|Compo)/.test(o)?o=o.toLowerCase():i&&Cg.test(o)?o=o.replace(/[A-Z0-9]/g,"-$&").toLowerCase():a===null&&(a=void 0),/^oninput$/i.test(o)&&(o=o.toLowerCase(),r[o]&&(o="oninputCapture")),r[o]=a)}e=="select"&&r.multiple&&Array.isArray(r.value)&&(r.value=or(n.children).forEach(function(l){l.props.selected=r.value.indexOf(l.props.value)!=-1})),e=="select"&&r.defaultValue!=null&&(r.value=or(n.children).forEach(function(l){l.props.selected=r.multiple?r.defaultValue.indexOf(l.props.value)!=-1:r.defaultValue==l.props.value})),t.props=r,n.class!=n.className&&(js.enumerable="className"in n,n.className!=null&&(r.class=n.className),Object.defineProperty(r,"className",js))}t.$$typeof=Ag,Fs&&Fs(t)};var Us=j.__r;j.__r=function(t){Us&&Us(t),t.__c};const Fl=[],pi=new Map;function Ul(t){Fl.push(t),pi.forEach(e=>{zl(e,t)})}function Rg(t){t.isConnected&&t.getRootNode&&Vl(t.getRootNode())}function Vl(t){let e=pi.get(t);if(!e||!e.isConnected){if(e=t.querySelector("style[data-fullcalendar]"),!e){e=document.createElement("style"),e.setAttribute("data-fullcalendar","");const n=Ig();n&&(e.nonce=n);const r=t===document?document.head:t,i=t===document?r.querySelector("script,link[rel=stylesheet],link[as=style],style"):r.firstChild;r.insertBefore(e,i)}pi.set(t,e),kg(e)}}function kg(t){for(const e of Fl)zl(t,e)}function zl(t,e){const{sheet:n}=t,r=n.cssRules.length;e.split("}").forEach((i,o)=>{i=i.trim(),i&&n.insertRule(i+"}",r+o)})}let Yr;function Ig(){return Yr===void 0&&(Yr=Mg()),Yr}function Mg(){const t=document.querySelector('meta[name="csp-nonce"]');if(t&&t.hasAttribute("content"))return t.getAttribute("content");const e=document.querySelector("script[nonce]");return e&&e.nonce||""}typeof document<"u"&&Vl(document);var Og=':root{--fc-small-font-size:.85em;--fc-page-bg-color:#fff;--fc-neutral-bg-color:hsla(0,0%,82%,.3);--fc-neutral-text-color:grey;--fc-border-color:#ddd;--fc-button-text-color:#fff;--fc-button-bg-color:#2c3e50;--fc-button-border-color:#2c3e50;--fc-button-hover-bg-color:#1e2b37;--fc-button-hover-border-color:#1a252f;--fc-button-active-bg-color:#1a252f;--fc-button-active-border-color:#151e27;--fc-event-bg-color:#3788d8;--fc-event-border-color:#3788d8;--fc-event-text-color:#fff;--fc-event-selected-overlay-color:rgba(0,0,0,.25);--fc-more-link-bg-color:#d0d0d0;--fc-more-link-text-color:inherit;--fc-event-resizer-thickness:8px;--fc-event-resizer-dot-total-width:8px;--fc-event-resizer-dot-border-width:1px;--fc-non-business-color:hsla(0,0%,84%,.3);--fc-bg-event-color:#8fdf82;--fc-bg-event-opacity:0.3;--fc-highlight-color:rgba(188,232,241,.3);--fc-today-bg-color:rgba(255,220,40,.15);--fc-now-indicator-color:red}.fc-not-allowed,.fc-not-allowed .fc-event{cursor:not-allowed}.fc{display:flex;flex-direction:column;font-size:1em}.fc,.fc *,.fc :after,.fc :before{box-sizing:border-box}.fc table{border-collapse:collapse;border-spacing:0;font-size:1em}.fc th{text-align:center}.fc td,.fc th{padding:0;vertical-align:top}.fc a[data-navlink]{cursor:pointer}.fc a[data-navlink]:hover{text-decoration:underline}.fc-direction-ltr{direction:ltr;text-align:left}.fc-direction-rtl{direction:rtl;text-align:right}.fc-theme-standard td,.fc-theme-standard th{border:1px solid var(--fc-border-color)}.fc-liquid-hack td,.fc-liquid-hack th{position:relative}@font-face{font-family:fcicons;font-style:normal;font-weight:400;src:url("data:application/x-font-ttf;charset=utf-8;base64,AAEAAAALAIAAAwAwT1MvMg8SBfAAAAC8AAAAYGNtYXAXVtKNAAABHAAAAFRnYXNwAAAAEAAAAXAAAAAIZ2x5ZgYydxIAAAF4AAAFNGhlYWQUJ7cIAAAGrAAAADZoaGVhB20DzAAABuQAAAAkaG10eCIABhQAAAcIAAAALGxvY2ED4AU6AAAHNAAAABhtYXhwAA8AjAAAB0wAAAAgbmFtZXsr690AAAdsAAABhnBvc3QAAwAAAAAI9AAAACAAAwPAAZAABQAAApkCzAAAAI8CmQLMAAAB6wAzAQkAAAAAAAAAAAAAAAAAAAABEAAAAAAAAAAAAAAAAAAAAABAAADpBgPA/8AAQAPAAEAAAAABAAAAAAAAAAAAAAAgAAAAAAADAAAAAwAAABwAAQADAAAAHAADAAEAAAAcAAQAOAAAAAoACAACAAIAAQAg6Qb//f//AAAAAAAg6QD//f//AAH/4xcEAAMAAQAAAAAAAAAAAAAAAQAB//8ADwABAAAAAAAAAAAAAgAANzkBAAAAAAEAAAAAAAAAAAACAAA3OQEAAAAAAQAAAAAAAAAAAAIAADc5AQAAAAABAWIAjQKeAskAEwAAJSc3NjQnJiIHAQYUFwEWMjc2NCcCnuLiDQ0MJAz/AA0NAQAMJAwNDcni4gwjDQwM/wANIwz/AA0NDCMNAAAAAQFiAI0CngLJABMAACUBNjQnASYiBwYUHwEHBhQXFjI3AZ4BAA0N/wAMJAwNDeLiDQ0MJAyNAQAMIw0BAAwMDSMM4uINIwwNDQAAAAIA4gC3Ax4CngATACcAACUnNzY0JyYiDwEGFB8BFjI3NjQnISc3NjQnJiIPAQYUHwEWMjc2NCcB87e3DQ0MIw3VDQ3VDSMMDQ0BK7e3DQ0MJAzVDQ3VDCQMDQ3zuLcMJAwNDdUNIwzWDAwNIwy4twwkDA0N1Q0jDNYMDA0jDAAAAgDiALcDHgKeABMAJwAAJTc2NC8BJiIHBhQfAQcGFBcWMjchNzY0LwEmIgcGFB8BBwYUFxYyNwJJ1Q0N1Q0jDA0Nt7cNDQwjDf7V1Q0N1QwkDA0Nt7cNDQwkDLfWDCMN1Q0NDCQMt7gMIw0MDNYMIw3VDQ0MJAy3uAwjDQwMAAADAFUAAAOrA1UAMwBoAHcAABMiBgcOAQcOAQcOARURFBYXHgEXHgEXHgEzITI2Nz4BNz4BNz4BNRE0JicuAScuAScuASMFITIWFx4BFx4BFx4BFREUBgcOAQcOAQcOASMhIiYnLgEnLgEnLgE1ETQ2Nz4BNz4BNz4BMxMhMjY1NCYjISIGFRQWM9UNGAwLFQkJDgUFBQUFBQ4JCRULDBgNAlYNGAwLFQkJDgUFBQUFBQ4JCRULDBgN/aoCVgQIBAQHAwMFAQIBAQIBBQMDBwQECAT9qgQIBAQHAwMFAQIBAQIBBQMDBwQECASAAVYRGRkR/qoRGRkRA1UFBAUOCQkVDAsZDf2rDRkLDBUJCA4FBQUFBQUOCQgVDAsZDQJVDRkLDBUJCQ4FBAVVAgECBQMCBwQECAX9qwQJAwQHAwMFAQICAgIBBQMDBwQDCQQCVQUIBAQHAgMFAgEC/oAZEhEZGRESGQAAAAADAFUAAAOrA1UAMwBoAIkAABMiBgcOAQcOAQcOARURFBYXHgEXHgEXHgEzITI2Nz4BNz4BNz4BNRE0JicuAScuAScuASMFITIWFx4BFx4BFx4BFREUBgcOAQcOAQcOASMhIiYnLgEnLgEnLgE1ETQ2Nz4BNz4BNz4BMxMzFRQWMzI2PQEzMjY1NCYrATU0JiMiBh0BIyIGFRQWM9UNGAwLFQkJDgUFBQUFBQ4JCRULDBgNAlYNGAwLFQkJDgUFBQUFBQ4JCRULDBgN/aoCVgQIBAQHAwMFAQIBAQIBBQMDBwQECAT9qgQIBAQHAwMFAQIBAQIBBQMDBwQECASAgBkSEhmAERkZEYAZEhIZgBEZGREDVQUEBQ4JCRUMCxkN/asNGQsMFQkIDgUFBQUFBQ4JCBUMCxkNAlUNGQsMFQkJDgUEBVUCAQIFAwIHBAQIBf2rBAkDBAcDAwUBAgICAgEFAwMHBAMJBAJVBQgEBAcCAwUCAQL+gIASGRkSgBkSERmAEhkZEoAZERIZAAABAOIAjQMeAskAIAAAExcHBhQXFjI/ARcWMjc2NC8BNzY0JyYiDwEnJiIHBhQX4uLiDQ0MJAzi4gwkDA0N4uINDQwkDOLiDCQMDQ0CjeLiDSMMDQ3h4Q0NDCMN4uIMIw0MDOLiDAwNIwwAAAABAAAAAQAAa5n0y18PPPUACwQAAAAAANivOVsAAAAA2K85WwAAAAADqwNVAAAACAACAAAAAAAAAAEAAAPA/8AAAAQAAAAAAAOrAAEAAAAAAAAAAAAAAAAAAAALBAAAAAAAAAAAAAAAAgAAAAQAAWIEAAFiBAAA4gQAAOIEAABVBAAAVQQAAOIAAAAAAAoAFAAeAEQAagCqAOoBngJkApoAAQAAAAsAigADAAAAAAACAAAAAAAAAAAAAAAAAAAAAAAAAA4ArgABAAAAAAABAAcAAAABAAAAAAACAAcAYAABAAAAAAADAAcANgABAAAAAAAEAAcAdQABAAAAAAAFAAsAFQABAAAAAAAGAAcASwABAAAAAAAKABoAigADAAEECQABAA4ABwADAAEECQACAA4AZwADAAEECQADAA4APQADAAEECQAEAA4AfAADAAEECQAFABYAIAADAAEECQAGAA4AUgADAAEECQAKADQApGZjaWNvbnMAZgBjAGkAYwBvAG4Ac1ZlcnNpb24gMS4wAFYAZQByAHMAaQBvAG4AIAAxAC4AMGZjaWNvbnMAZgBjAGkAYwBvAG4Ac2ZjaWNvbnMAZgBjAGkAYwBvAG4Ac1JlZ3VsYXIAUgBlAGcAdQBsAGEAcmZjaWNvbnMAZgBjAGkAYwBvAG4Ac0ZvbnQgZ2VuZXJhdGVkIGJ5IEljb01vb24uAEYAbwBuAHQAIABnAGUAbgBlAHIAYQB0AGUAZAAgAGIAeQAgAEkAYwBvAE0AbwBvAG4ALgAAAAMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=") format("truetype")}.fc-icon{speak:none;-webkit-font-smoothing:antialiased;-moz-osx-font-smoothing:grayscale;display:inline-block;font-family:fcicons!important;font-style:normal;font-variant:normal;font-weight:400;height:1em;line-height:1;text-align:center;text-transform:none;-webkit-user-select:none;-moz-user-select:none;user-select:none;width:1em}.fc-icon-chevron-left:before{content:"\\e900"}.fc-icon-chevron-right:before{content:"\\e901"}.fc-icon-chevrons-left:before{content:"\\e902"}.fc-icon-chevrons-right:before{content:"\\e903"}.fc-icon-minus-square:before{content:"\\e904"}.fc-icon-plus-square:before{content:"\\e905"}.fc-icon-x:before{content:"\\e906"}.fc .fc-button{border-radius:0;font-family:inherit;font-size:inherit;line-height:inherit;margin:0;overflow:visible;text-transform:none}.fc .fc-button:focus{outline:1px dotted;outline:5px auto -webkit-focus-ring-color}.fc .fc-button{-webkit-appearance:button}.fc .fc-button:not(:disabled){cursor:pointer}.fc .fc-button{background-color:transparent;border:1px solid transparent;border-radius:.25em;display:inline-block;font-size:1em;font-weight:400;line-height:1.5;padding:.4em .65em;text-align:center;-webkit-user-select:none;-moz-user-select:none;user-select:none;vertical-align:middle}.fc .fc-button:hover{text-decoration:none}.fc .fc-button:focus{box-shadow:0 0 0 .2rem rgba(44,62,80,.25);outline:0}.fc .fc-button:disabled{opacity:.65}.fc .fc-button-primary{background-color:var(--fc-button-bg-color);border-color:var(--fc-button-border-color);color:var(--fc-button-text-color)}.fc .fc-button-primary:hover{background-color:var(--fc-button-hover-bg-color);border-color:var(--fc-button-hover-border-color);color:var(--fc-button-text-color)}.fc .fc-button-primary:disabled{background-color:var(--fc-button-bg-color);border-color:var(--fc-button-border-color);color:var(--fc-button-text-color)}.fc .fc-button-primary:focus{box-shadow:0 0 0 .2rem rgba(76,91,106,.5)}.fc .fc-button-primary:not(:disabled).fc-button-active,.fc .fc-button-primary:not(:disabled):active{background-color:var(--fc-button-active-bg-color);border-color:var(--fc-button-active-border-color);color:var(--fc-button-text-color)}.fc .fc-button-primary:not(:disabled).fc-button-active:focus,.fc .fc-button-primary:not(:disabled):active:focus{box-shadow:0 0 0 .2rem rgba(76,91,106,.5)}.fc .fc-button .fc-icon{font-size:1.5em;vertical-align:middle}.fc .fc-button-group{display:inline-flex;position:relative;vertical-align:middle}.fc .fc-button-group>.fc-button{flex:1 1 auto;position:relative}.fc .fc-button-group>.fc-button.fc-button-active,.fc .fc-button-group>.fc-button:active,.fc .fc-button-group>.fc-button:focus,.fc .fc-button-group>.fc-button:hover{z-index:1}.fc-direction-ltr .fc-button-group>.fc-button:not(:first-child){border-bottom-left-radius:0;border-top-left-radius:0;margin-left:-1px}.fc-direction-ltr .fc-button-group>.fc-button:not(:last-child){border-bottom-right-radius:0;border-top-right-radius:0}.fc-direction-rtl .fc-button-group>.fc-button:not(:first-child){border-bottom-right-radius:0;border-top-right-radius:0;margin-right:-1px}.fc-direction-rtl .fc-button-group>.fc-button:not(:last-child){border-bottom-left-radius:0;border-top-left-radius:0}.fc .fc-toolbar{align-items:center;display:flex;justify-content:space-between}.fc .fc-toolbar.fc-header-toolbar{margin-bottom:1.5em}.fc .fc-toolbar.fc-footer-toolbar{margin-top:1.5em}.fc .fc-toolbar-title{font-size:1.75em;margin:0}.fc-direction-ltr .fc-toolbar>*>:not(:first-child){margin-left:.75em}.fc-direction-rtl .fc-toolbar>*>:not(:first-child){margin-right:.75em}.fc-direction-rtl .fc-toolbar-ltr{flex-direction:row-reverse}.fc .fc-scroller{-webkit-overflow-scrolling:touch;position:relative}.fc .fc-scroller-liquid{height:100%}.fc .fc-scroller-liquid-absolute{bottom:0;left:0;position:absolute;right:0;top:0}.fc .fc-scroller-harness{direction:ltr;overflow:hidden;position:relative}.fc .fc-scroller-harness-liquid{height:100%}.fc-direction-rtl .fc-scroller-harness>.fc-scroller{direction:rtl}.fc-theme-standard .fc-scrollgrid{border:1px solid var(--fc-border-color)}.fc .fc-scrollgrid,.fc .fc-scrollgrid table{table-layout:fixed;width:100%}.fc .fc-scrollgrid table{border-left-style:hidden;border-right-style:hidden;border-top-style:hidden}.fc .fc-scrollgrid{border-bottom-width:0;border-collapse:separate;border-right-width:0}.fc .fc-scrollgrid-liquid{height:100%}.fc .fc-scrollgrid-section,.fc .fc-scrollgrid-section table,.fc .fc-scrollgrid-section>td{height:1px}.fc .fc-scrollgrid-section-liquid>td{height:100%}.fc .fc-scrollgrid-section>*{border-left-width:0;border-top-width:0}.fc .fc-scrollgrid-section-footer>*,.fc .fc-scrollgrid-section-header>*{border-bottom-width:0}.fc .fc-scrollgrid-section-body table,.fc .fc-scrollgrid-section-footer table{border-bottom-style:hidden}.fc .fc-scrollgrid-section-sticky>*{background:var(--fc-page-bg-color);position:sticky;z-index:3}.fc .fc-scrollgrid-section-header.fc-scrollgrid-section-sticky>*{top:0}.fc .fc-scrollgrid-section-footer.fc-scrollgrid-section-sticky>*{bottom:0}.fc .fc-scrollgrid-sticky-shim{height:1px;margin-bottom:-1px}.fc-sticky{position:sticky}.fc .fc-view-harness{flex-grow:1;position:relative}.fc .fc-view-harness-active>.fc-view{bottom:0;left:0;position:absolute;right:0;top:0}.fc .fc-col-header-cell-cushion{display:inline-block;padding:2px 4px}.fc .fc-bg-event,.fc .fc-highlight,.fc .fc-non-business{bottom:0;left:0;position:absolute;right:0;top:0}.fc .fc-non-business{background:var(--fc-non-business-color)}.fc .fc-bg-event{background:var(--fc-bg-event-color);opacity:var(--fc-bg-event-opacity)}.fc .fc-bg-event .fc-event-title{font-size:var(--fc-small-font-size);font-style:italic;margin:.5em}.fc .fc-highlight{background:var(--fc-highlight-color)}.fc .fc-cell-shaded,.fc .fc-day-disabled{background:var(--fc-neutral-bg-color)}a.fc-event,a.fc-event:hover{text-decoration:none}.fc-event.fc-event-draggable,.fc-event[href]{cursor:pointer}.fc-event .fc-event-main{position:relative;z-index:2}.fc-event-dragging:not(.fc-event-selected){opacity:.75}.fc-event-dragging.fc-event-selected{box-shadow:0 2px 7px rgba(0,0,0,.3)}.fc-event .fc-event-resizer{display:none;position:absolute;z-index:4}.fc-event-selected .fc-event-resizer,.fc-event:hover .fc-event-resizer{display:block}.fc-event-selected .fc-event-resizer{background:var(--fc-page-bg-color);border-color:inherit;border-radius:calc(var(--fc-event-resizer-dot-total-width)/2);border-style:solid;border-width:var(--fc-event-resizer-dot-border-width);height:var(--fc-event-resizer-dot-total-width);width:var(--fc-event-resizer-dot-total-width)}.fc-event-selected .fc-event-resizer:before{bottom:-20px;content:"";left:-20px;position:absolute;right:-20px;top:-20px}.fc-event-selected,.fc-event:focus{box-shadow:0 2px 5px rgba(0,0,0,.2)}.fc-event-selected:before,.fc-event:focus:before{bottom:0;content:"";left:0;position:absolute;right:0;top:0;z-index:3}.fc-event-selected:after,.fc-event:focus:after{background:var(--fc-event-selected-overlay-color);bottom:-1px;content:"";left:-1px;position:absolute;right:-1px;top:-1px;z-index:1}.fc-h-event{background-color:var(--fc-event-bg-color);border:1px solid var(--fc-event-border-color);display:block}.fc-h-event .fc-event-main{color:var(--fc-event-text-color)}.fc-h-event .fc-event-main-frame{display:flex}.fc-h-event .fc-event-time{max-width:100%;overflow:hidden}.fc-h-event .fc-event-title-container{flex-grow:1;flex-shrink:1;min-width:0}.fc-h-event .fc-event-title{display:inline-block;left:0;max-width:100%;overflow:hidden;right:0;vertical-align:top}.fc-h-event.fc-event-selected:before{bottom:-10px;top:-10px}.fc-direction-ltr .fc-daygrid-block-event:not(.fc-event-start),.fc-direction-rtl .fc-daygrid-block-event:not(.fc-event-end){border-bottom-left-radius:0;border-left-width:0;border-top-left-radius:0}.fc-direction-ltr .fc-daygrid-block-event:not(.fc-event-end),.fc-direction-rtl .fc-daygrid-block-event:not(.fc-event-start){border-bottom-right-radius:0;border-right-width:0;border-top-right-radius:0}.fc-h-event:not(.fc-event-selected) .fc-event-resizer{bottom:0;top:0;width:var(--fc-event-resizer-thickness)}.fc-direction-ltr .fc-h-event:not(.fc-event-selected) .fc-event-resizer-start,.fc-direction-rtl .fc-h-event:not(.fc-event-selected) .fc-event-resizer-end{cursor:w-resize;left:calc(var(--fc-event-resizer-thickness)*-.5)}.fc-direction-ltr .fc-h-event:not(.fc-event-selected) .fc-event-resizer-end,.fc-direction-rtl .fc-h-event:not(.fc-event-selected) .fc-event-resizer-start{cursor:e-resize;right:calc(var(--fc-event-resizer-thickness)*-.5)}.fc-h-event.fc-event-selected .fc-event-resizer{margin-top:calc(var(--fc-event-resizer-dot-total-width)*-.5);top:50%}.fc-direction-ltr .fc-h-event.fc-event-selected .fc-event-resizer-start,.fc-direction-rtl .fc-h-event.fc-event-selected .fc-event-resizer-end{left:calc(var(--fc-event-resizer-dot-total-width)*-.5)}.fc-direction-ltr .fc-h-event.fc-event-selected .fc-event-resizer-end,.fc-direction-rtl .fc-h-event.fc-event-selected .fc-event-resizer-start{right:calc(var(--fc-event-resizer-dot-total-width)*-.5)}.fc .fc-popover{box-shadow:0 2px 6px rgba(0,0,0,.15);position:absolute;z-index:9999}.fc .fc-popover-header{align-items:center;display:flex;flex-direction:row;justify-content:space-between;padding:3px 4px}.fc .fc-popover-title{margin:0 2px}.fc .fc-popover-close{cursor:pointer;font-size:1.1em;opacity:.65}.fc-theme-standard .fc-popover{background:var(--fc-page-bg-color);border:1px solid var(--fc-border-color)}.fc-theme-standard .fc-popover-header{background:var(--fc-neutral-bg-color)}';Ul(Og);class Ui{constructor(e){this.drainedOption=e,this.isRunning=!1,this.isDirty=!1,this.pauseDepths={},this.timeoutId=0}request(e){this.isDirty=!0,this.isPaused()||(this.clearTimeout(),e==null?this.tryDrain():this.timeoutId=setTimeout(this.tryDrain.bind(this),e))}pause(e=""){let{pauseDepths:n}=this;n[e]=(n[e]||0)+1,this.clearTimeout()}resume(e="",n){let{pauseDepths:r}=this;e in r&&(n?delete r[e]:(r[e]-=1,r[e]<=0&&delete r[e]),this.tryDrain())}isPaused(){return Object.keys(this.pauseDepths).length}tryDrain(){if(!this.isRunning&&!this.isPaused()){for(this.isRunning=!0;this.isDirty;)this.isDirty=!1,this.drained();this.isRunning=!1}}clear(){this.clearTimeout(),this.isDirty=!1,this.pauseDepths={}}clearTimeout(){this.timeoutId&&(clearTimeout(this.timeoutId),this.timeoutId=0)}drained(){this.drainedOption&&this.drainedOption()}}function Vi(t){t.parentNode&&t.parentNode.removeChild(t)}function Ce(t,e){if(t.closest)return t.closest(e);if(!document.documentElement.contains(t))return null;do{if(Bg(t,e))return t;t=t.parentElement||t.parentNode}while(t!==null&&t.nodeType===1);return null}function Bg(t,e){return(t.matches||t.matchesSelector||t.msMatchesSelector).call(t,e)}function Pg(t,e){let n=t instanceof HTMLElement?[t]:t,r=[];for(let i=0;i<n.length;i+=1){let o=n[i].querySelectorAll(e);for(let a=0;a<o.length;a+=1)r.push(o[a])}return r}const Ng=/(top|left|right|bottom|width|height)$/i;function nn(t,e){for(let n in e)Wl(t,n,e[n])}function Wl(t,e,n){n==null?t.style[e]="":typeof n=="number"&&Ng.test(e)?t.style[e]=`${n}px`:t.style[e]=n}function $l(t){var e,n;return(n=(e=t.composedPath)===null||e===void 0?void 0:e.call(t)[0])!==null&&n!==void 0?n:t.target}let Vs=0;function Cr(){return Vs+=1,"fc-dom-"+Vs}function Sr(t){t.preventDefault()}function Lg(t,e){return n=>{let r=Ce(n.target,t);r&&e.call(r,n,r)}}function Gl(t,e,n,r){let i=Lg(n,r);return t.addEventListener(e,i),()=>{t.removeEventListener(e,i)}}function Hg(t,e,n,r){let i;return Gl(t,"mouseover",e,(o,a)=>{if(a!==i){i=a,n(o,a);let l=u=>{i=null,r(u,a),a.removeEventListener("mouseleave",l)};a.addEventListener("mouseleave",l)}})}const zs=["webkitTransitionEnd","otransitionend","oTransitionEnd","msTransitionEnd","transitionend"];function jg(t,e){let n=r=>{e(r),zs.forEach(i=>{t.removeEventListener(i,n)})};zs.forEach(r=>{t.addEventListener(r,n)})}function ql(t){return Object.assign({onClick:t},Yl(t))}function Yl(t){return{tabIndex:0,onKeyDown(e){(e.key==="Enter"||e.key===" ")&&(t(e),e.preventDefault())}}}let Ws=0;function _t(){return Ws+=1,String(Ws)}function zi(){document.body.classList.add("fc-not-allowed")}function Wi(){document.body.classList.remove("fc-not-allowed")}function Fg(t){t.style.userSelect="none",t.style.webkitUserSelect="none",t.addEventListener("selectstart",Sr)}function Ug(t){t.style.userSelect="",t.style.webkitUserSelect="",t.removeEventListener("selectstart",Sr)}function Vg(t){t.addEventListener("contextmenu",Sr)}function zg(t){t.removeEventListener("contextmenu",Sr)}function Wg(t){let e=[],n=[],r,i;for(typeof t=="string"?n=t.split(/\s*,\s*/):typeof t=="function"?n=[t]:Array.isArray(t)&&(n=t),r=0;r<n.length;r+=1)i=n[r],typeof i=="string"?e.push(i.charAt(0)==="-"?{field:i.substring(1),order:-1}:{field:i,order:1}):typeof i=="function"&&e.push({func:i});return e}function $g(t,e,n){let r,i;for(r=0;r<n.length;r+=1)if(i=Gg(t,e,n[r]),i)return i;return 0}function Gg(t,e,n){return n.func?n.func(t,e):qg(t[n.field],e[n.field])*(n.order||1)}function qg(t,e){return!t&&!e?0:e==null?-1:t==null?1:typeof t=="string"||typeof e=="string"?String(t).localeCompare(String(e)):t-e}function Qr(t,e){let n=String(t);return"000".substr(0,e-n.length)+n}function rn(t,e,n){return typeof t=="function"?t(...e):typeof t=="string"?e.reduce((r,i,o)=>r.replace("$"+o,i||""),t):n}function Yg(t,e){return t-e}function Zr(t){return t%1===0}function Qg(t){let e=t.querySelector(".fc-scrollgrid-shrink-frame"),n=t.querySelector(".fc-scrollgrid-shrink-cushion");if(!e)throw new Error("needs fc-scrollgrid-shrink-frame className");if(!n)throw new Error("needs fc-scrollgrid-shrink-cushion className");return t.getBoundingClientRect().width-e.getBoundingClientRect().width+n.getBoundingClientRect().width}const Zg=/^(-?)(?:(\d+)\.)?(\d+):(\d\d)(?::(\d\d)(?:\.(\d\d\d))?)?/;function ee(t,e){return typeof t=="string"?Xg(t):typeof t=="object"&&t?$s(t):typeof t=="number"?$s({[e||"milliseconds"]:t}):null}function Xg(t){let e=Zg.exec(t);if(e){let n=e[1]?-1:1;return{years:0,months:0,days:n*(e[2]?parseInt(e[2],10):0),milliseconds:n*((e[3]?parseInt(e[3],10):0)*60*60*1e3+(e[4]?parseInt(e[4],10):0)*60*1e3+(e[5]?parseInt(e[5],10):0)*1e3+(e[6]?parseInt(e[6],10):0))}}return null}function $s(t){let e={years:t.years||t.year||0,months:t.months||t.month||0,days:t.days||t.day||0,milliseconds:(t.hours||t.hour||0)*60*60*1e3+(t.minutes||t.minute||0)*60*1e3+(t.seconds||t.second||0)*1e3+(t.milliseconds||t.millisecond||t.ms||0)},n=t.weeks||t.week;return n&&(e.days+=n*7,e.specifiedWeeks=!0),e}function Jg(t,e){return t.years===e.years&&t.months===e.months&&t.days===e.days&&t.milliseconds===e.milliseconds}function Kg(t,e){return{years:t.years-e.years,months:t.months-e.months,days:t.days-e.days,milliseconds:t.milliseconds-e.milliseconds}}function ep(t){return Lt(t)/365}function tp(t){return Lt(t)/30}function Lt(t){return un(t)/864e5}function un(t){return t.years*(365*864e5)+t.months*(30*864e5)+t.days*864e5+t.milliseconds}function mi(t){let e=t.milliseconds;if(e){if(e%1e3!==0)return{unit:"millisecond",value:e};if(e%(1e3*60)!==0)return{unit:"second",value:e/1e3};if(e%(1e3*60*60)!==0)return{unit:"minute",value:e/(1e3*60)};if(e)return{unit:"hour",value:e/(1e3*60*60)}}return t.days?t.specifiedWeeks&&t.days%7===0?{unit:"week",value:t.days/7}:{unit:"day",value:t.days}:t.months?{unit:"month",value:t.months}:t.years?{unit:"year",value:t.years}:{unit:"millisecond",value:0}}function ct(t,e,n){if(t===e)return!0;let r=t.length,i;if(r!==e.length)return!1;for(i=0;i<r;i+=1)if(!(n?n(t[i],e[i]):t[i]===e[i]))return!1;return!0}const np=["sun","mon","tue","wed","thu","fri","sat"];function Gs(t,e){let n=st(t);return n[2]+=e*7,ke(n)}function be(t,e){let n=st(t);return n[2]+=e,ke(n)}function ut(t,e){let n=st(t);return n[6]+=e,ke(n)}function rp(t,e){return Yt(t,e)/7}function Yt(t,e){return(e.valueOf()-t.valueOf())/(1e3*60*60*24)}function ip(t,e){return(e.valueOf()-t.valueOf())/(1e3*60*60)}function op(t,e){return(e.valueOf()-t.valueOf())/(1e3*60)}function sp(t,e){return(e.valueOf()-t.valueOf())/1e3}function ap(t,e){let n=ae(t),r=ae(e);return{years:0,months:0,days:Math.round(Yt(n,r)),milliseconds:e.valueOf()-r.valueOf()-(t.valueOf()-n.valueOf())}}function lp(t,e){let n=sr(t,e);return n!==null&&n%7===0?n/7:null}function sr(t,e){return at(t)===at(e)?Math.round(Yt(t,e)):null}function ae(t){return ke([t.getUTCFullYear(),t.getUTCMonth(),t.getUTCDate()])}function cp(t){return ke([t.getUTCFullYear(),t.getUTCMonth(),t.getUTCDate(),t.getUTCHours()])}function up(t){return ke([t.getUTCFullYear(),t.getUTCMonth(),t.getUTCDate(),t.getUTCHours(),t.getUTCMinutes()])}function dp(t){return ke([t.getUTCFullYear(),t.getUTCMonth(),t.getUTCDate(),t.getUTCHours(),t.getUTCMinutes(),t.getUTCSeconds()])}function fp(t,e,n){let r=t.getUTCFullYear(),i=Xr(t,r,e,n);if(i<1)return Xr(t,r-1,e,n);let o=Xr(t,r+1,e,n);return o>=1?Math.min(i,o):i}function Xr(t,e,n,r){let i=ke([e,0,1+hp(e,n,r)]),o=ae(t),a=Math.round(Yt(i,o));return Math.floor(a/7)+1}function hp(t,e,n){let r=7+e-n;return-((7+ke([t,0,r]).getUTCDay()-e)%7)+r-1}function qs(t){return[t.getFullYear(),t.getMonth(),t.getDate(),t.getHours(),t.getMinutes(),t.getSeconds(),t.getMilliseconds()]}function Ys(t){return new Date(t[0],t[1]||0,t[2]==null?1:t[2],t[3]||0,t[4]||0,t[5]||0)}function st(t){return[t.getUTCFullYear(),t.getUTCMonth(),t.getUTCDate(),t.getUTCHours(),t.getUTCMinutes(),t.getUTCSeconds(),t.getUTCMilliseconds()]}function ke(t){return t.length===1&&(t=t.concat([0])),new Date(Date.UTC(...t))}function Ql(t){return!isNaN(t.valueOf())}function at(t){return t.getUTCHours()*1e3*60*60+t.getUTCMinutes()*1e3*60+t.getUTCSeconds()*1e3+t.getUTCMilliseconds()}function gp(t,e,n=!1){let r=t.toISOString();return r=r.replace(".000",""),n&&(r=r.replace("T00:00:00Z","")),r.length>10&&(e==null?r=r.replace("Z",""):e!==0&&(r=r.replace("Z",Gi(e,!0)))),r}function $i(t){return t.toISOString().replace(/T.*$/,"")}function pp(t){return t.toISOString().match(/^\d{4}-\d{2}/)[0]}function Gi(t,e=!1){let n=t<0?"-":"+",r=Math.abs(t),i=Math.floor(r/60),o=Math.round(r%60);return e?`${n+Qr(i,2)}:${Qr(o,2)}`:`GMT${n}${i}${o?`:${Qr(o,2)}`:""}`}function K(t,e,n){let r,i;return function(...o){if(!r)i=t.apply(this,o);else if(!ct(r,o)){let a=t.apply(this,o);(!e||!e(a,i))&&(i=a)}return r=o,i}}function zn(t,e,n){let r,i;return o=>(r?ze(r,o)||(i=t.call(this,o)):i=t.call(this,o),r=o,i)}const Jr={week:3,separator:9,omitZeroMinute:9,meridiem:9,omitCommas:9},ar={timeZoneName:7,era:6,year:5,month:4,day:2,weekday:2,hour:1,minute:1,second:1},Pn=/\s*([ap])\.?m\.?/i,mp=/,/g,vp=/\s+/g,wp=/\u200e/g,bp=/UTC|GMT/;class yp{constructor(e){let n={},r={},i=9;for(let o in e)o in Jr?(r[o]=e[o],Jr[o]<9&&(i=Math.min(Jr[o],i))):(n[o]=e[o],o in ar&&(i=Math.min(ar[o],i)));this.standardDateProps=n,this.extendedSettings=r,this.smallestUnitNum=i,this.buildFormattingFunc=K(Qs)}format(e,n){return this.buildFormattingFunc(this.standardDateProps,this.extendedSettings,n)(e)}formatRange(e,n,r,i){let{standardDateProps:o,extendedSettings:a}=this,l=_p(e.marker,n.marker,r.calendarSystem);if(!l)return this.format(e,r);let u=l;u>1&&(o.year==="numeric"||o.year==="2-digit")&&(o.month==="numeric"||o.month==="2-digit")&&(o.day==="numeric"||o.day==="2-digit")&&(u=1);let h=this.format(e,r),f=this.format(n,r);if(h===f)return h;let v=Tp(o,u),p=Qs(v,a,r),m=p(e),E=p(n),R=xp(h,m,f,E),x=a.separator||i||r.defaultSeparator||"";return R?R.before+m+x+E+R.after:h+x+f}getSmallestUnit(){switch(this.smallestUnitNum){case 7:case 6:case 5:return"year";case 4:return"month";case 3:return"week";case 2:return"day";default:return"time"}}}function Qs(t,e,n){let r=Object.keys(t).length;return r===1&&t.timeZoneName==="short"?i=>Gi(i.timeZoneOffset):r===0&&e.week?i=>Dp(n.computeWeekNumber(i.marker),n.weekText,n.weekTextLong,n.locale,e.week):Ep(t,e,n)}function Ep(t,e,n){t=Object.assign({},t),e=Object.assign({},e),Ap(t,e),t.timeZone="UTC";let r=new Intl.DateTimeFormat(n.locale.codes,t),i;if(e.omitZeroMinute){let o=Object.assign({},t);delete o.minute,i=new Intl.DateTimeFormat(n.locale.codes,o)}return o=>{let{marker:a}=o,l;i&&!a.getUTCMinutes()?l=i:l=r;let u=l.format(a);return Cp(u,o,t,e,n)}}function Ap(t,e){t.timeZoneName&&(t.hour||(t.hour="2-digit"),t.minute||(t.minute="2-digit")),t.timeZoneName==="long"&&(t.timeZoneName="short"),e.omitZeroMinute&&(t.second||t.millisecond)&&delete e.omitZeroMinute}function Cp(t,e,n,r,i){return t=t.replace(wp,""),n.timeZoneName==="short"&&(t=Sp(t,i.timeZone==="UTC"||e.timeZoneOffset==null?"UTC":Gi(e.timeZoneOffset))),r.omitCommas&&(t=t.replace(mp,"").trim()),r.omitZeroMinute&&(t=t.replace(":00","")),r.meridiem===!1?t=t.replace(Pn,"").trim():r.meridiem==="narrow"?t=t.replace(Pn,(o,a)=>a.toLocaleLowerCase()):r.meridiem==="short"?t=t.replace(Pn,(o,a)=>`${a.toLocaleLowerCase()}m`):r.meridiem==="lowercase"&&(t=t.replace(Pn,o=>o.toLocaleLowerCase())),t=t.replace(vp," "),t=t.trim(),t}function Sp(t,e){let n=!1;return t=t.replace(bp,()=>(n=!0,e)),n||(t+=` ${e}`),t}function Dp(t,e,n,r,i){let o=[];return i==="long"?o.push(n):(i==="short"||i==="narrow")&&o.push(e),(i==="long"||i==="short")&&o.push(" "),o.push(r.simpleNumberFormat.format(t)),r.options.direction==="rtl"&&o.reverse(),o.join("")}function _p(t,e,n){return n.getMarkerYear(t)!==n.getMarkerYear(e)?5:n.getMarkerMonth(t)!==n.getMarkerMonth(e)?4:n.getMarkerDay(t)!==n.getMarkerDay(e)?2:at(t)!==at(e)?1:0}function Tp(t,e){let n={};for(let r in t)(!(r in ar)||ar[r]<=e)&&(n[r]=t[r]);return n}function xp(t,e,n,r){let i=0;for(;i<t.length;){let o=t.indexOf(e,i);if(o===-1)break;let a=t.substr(0,o);i=o+e.length;let l=t.substr(i),u=0;for(;u<n.length;){let h=n.indexOf(r,u);if(h===-1)break;let f=n.substr(0,h);u=h+r.length;let v=n.substr(u);if(a===f&&l===v)return{before:a,after:l}}}return null}function Zs(t,e){let n=e.markerToArray(t.marker);return{marker:t.marker,timeZoneOffset:t.timeZoneOffset,array:n,year:n[0],month:n[1],day:n[2],hour:n[3],minute:n[4],second:n[5],millisecond:n[6]}}function lr(t,e,n,r){let i=Zs(t,n.calendarSystem),o=e?Zs(e,n.calendarSystem):null;return{date:i,start:i,end:o,timeZone:n.timeZone,localeCodes:n.locale.codes,defaultSeparator:r||n.defaultSeparator}}class Rp{constructor(e){this.cmdStr=e}format(e,n,r){return n.cmdFormatter(this.cmdStr,lr(e,null,n,r))}formatRange(e,n,r,i){return r.cmdFormatter(this.cmdStr,lr(e,n,r,i))}}class kp{constructor(e){this.func=e}format(e,n,r){return this.func(lr(e,null,n,r))}formatRange(e,n,r,i){return this.func(lr(e,n,r,i))}}function we(t){return typeof t=="object"&&t?new yp(t):typeof t=="string"?new Rp(t):typeof t=="function"?new kp(t):null}const Xs={navLinkDayClick:S,navLinkWeekClick:S,duration:ee,bootstrapFontAwesome:S,buttonIcons:S,customButtons:S,defaultAllDayEventDuration:ee,defaultTimedEventDuration:ee,nextDayThreshold:ee,scrollTime:ee,scrollTimeReset:Boolean,slotMinTime:ee,slotMaxTime:ee,dayPopoverFormat:we,slotDuration:ee,snapDuration:ee,headerToolbar:S,footerToolbar:S,defaultRangeSeparator:String,titleRangeSeparator:String,forceEventDuration:Boolean,dayHeaders:Boolean,dayHeaderFormat:we,dayHeaderClassNames:S,dayHeaderContent:S,dayHeaderDidMount:S,dayHeaderWillUnmount:S,dayCellClassNames:S,dayCellContent:S,dayCellDidMount:S,dayCellWillUnmount:S,initialView:String,aspectRatio:Number,weekends:Boolean,weekNumberCalculation:S,weekNumbers:Boolean,weekNumberClassNames:S,weekNumberContent:S,weekNumberDidMount:S,weekNumberWillUnmount:S,editable:Boolean,viewClassNames:S,viewDidMount:S,viewWillUnmount:S,nowIndicator:Boolean,nowIndicatorSnap:S,nowIndicatorClassNames:S,nowIndicatorContent:S,nowIndicatorDidMount:S,nowIndicatorWillUnmount:S,showNonCurrentDates:Boolean,lazyFetching:Boolean,startParam:String,endParam:String,timeZoneParam:String,timeZone:String,locales:S,locale:S,themeSystem:String,dragRevertDuration:Number,dragScroll:Boolean,allDayMaintainDuration:Boolean,unselectAuto:Boolean,dropAccept:S,eventOrder:Wg,eventOrderStrict:Boolean,handleWindowResize:Boolean,windowResizeDelay:Number,longPressDelay:Number,eventDragMinDistance:Number,expandRows:Boolean,height:S,contentHeight:S,direction:String,weekNumberFormat:we,eventResizableFromStart:Boolean,displayEventTime:Boolean,displayEventEnd:Boolean,weekText:String,weekTextLong:String,progressiveEventRendering:Boolean,businessHours:S,initialDate:S,now:S,eventDataTransform:S,stickyHeaderDates:S,stickyFooterScrollbar:S,viewHeight:S,defaultAllDay:Boolean,eventSourceFailure:S,eventSourceSuccess:S,eventDisplay:String,eventStartEditable:Boolean,eventDurationEditable:Boolean,eventOverlap:S,eventConstraint:S,eventAllow:S,eventBackgroundColor:String,eventBorderColor:String,eventTextColor:String,eventColor:String,eventClassNames:S,eventContent:S,eventDidMount:S,eventWillUnmount:S,selectConstraint:S,selectOverlap:S,selectAllow:S,droppable:Boolean,unselectCancel:String,slotLabelFormat:S,slotLaneClassNames:S,slotLaneContent:S,slotLaneDidMount:S,slotLaneWillUnmount:S,slotLabelClassNames:S,slotLabelContent:S,slotLabelDidMount:S,slotLabelWillUnmount:S,dayMaxEvents:S,dayMaxEventRows:S,dayMinWidth:Number,slotLabelInterval:ee,allDayText:String,allDayClassNames:S,allDayContent:S,allDayDidMount:S,allDayWillUnmount:S,slotMinWidth:Number,navLinks:Boolean,eventTimeFormat:we,rerenderDelay:Number,moreLinkText:S,moreLinkHint:S,selectMinDistance:Number,selectable:Boolean,selectLongPressDelay:Number,eventLongPressDelay:Number,selectMirror:Boolean,eventMaxStack:Number,eventMinHeight:Number,eventMinWidth:Number,eventShortHeight:Number,slotEventOverlap:Boolean,plugins:S,firstDay:Number,dayCount:Number,dateAlignment:String,dateIncrement:ee,hiddenDays:S,fixedWeekCount:Boolean,validRange:S,visibleRange:S,titleFormat:S,eventInteractive:Boolean,noEventsText:String,viewHint:S,navLinkHint:S,closeHint:String,timeHint:String,eventHint:String,moreLinkClick:S,moreLinkClassNames:S,moreLinkContent:S,moreLinkDidMount:S,moreLinkWillUnmount:S,monthStartFormat:we,handleCustomRendering:S,customRenderingMetaMap:S,customRenderingReplaces:Boolean},on={eventDisplay:"auto",defaultRangeSeparator:" - ",titleRangeSeparator:" – ",defaultTimedEventDuration:"01:00:00",defaultAllDayEventDuration:{day:1},forceEventDuration:!1,nextDayThreshold:"00:00:00",dayHeaders:!0,initialView:"",aspectRatio:1.35,headerToolbar:{start:"title",center:"",end:"today prev,next"},weekends:!0,weekNumbers:!1,weekNumberCalculation:"local",editable:!1,nowIndicator:!1,scrollTime:"06:00:00",scrollTimeReset:!0,slotMinTime:"00:00:00",slotMaxTime:"24:00:00",showNonCurrentDates:!0,lazyFetching:!0,startParam:"start",endParam:"end",timeZoneParam:"timeZone",timeZone:"local",locales:[],locale:"",themeSystem:"standard",dragRevertDuration:500,dragScroll:!0,allDayMaintainDuration:!1,unselectAuto:!0,dropAccept:"*",eventOrder:"start,-duration,allDay,title",dayPopoverFormat:{month:"long",day:"numeric",year:"numeric"},handleWindowResize:!0,windowResizeDelay:100,longPressDelay:1e3,eventDragMinDistance:5,expandRows:!1,navLinks:!1,selectable:!1,eventMinHeight:15,eventMinWidth:30,eventShortHeight:30,monthStartFormat:{month:"long",day:"numeric"},nowIndicatorSnap:"auto"},Js={datesSet:S,eventsSet:S,eventAdd:S,eventChange:S,eventRemove:S,windowResize:S,eventClick:S,eventMouseEnter:S,eventMouseLeave:S,select:S,unselect:S,loading:S,_unmount:S,_beforeprint:S,_afterprint:S,_noEventDrop:S,_noEventResize:S,_resize:S,_scrollRequest:S},Ks={buttonText:S,buttonHints:S,views:S,plugins:S,initialEvents:S,events:S,eventSources:S},pt={headerToolbar:mt,footerToolbar:mt,buttonText:mt,buttonHints:mt,buttonIcons:mt,dateIncrement:mt,plugins:Nn,events:Nn,eventSources:Nn,resources:Nn};function mt(t,e){return typeof t=="object"&&typeof e=="object"&&t&&e?ze(t,e):t===e}function Nn(t,e){return Array.isArray(t)&&Array.isArray(e)?ct(t,e):t===e}const Ip={type:String,component:S,buttonText:String,buttonTextKey:String,dateProfileGeneratorClass:S,usesMinMaxTime:Boolean,classNames:S,content:S,didMount:S,willUnmount:S};function Kr(t){return Yi(t,pt)}function qi(t,e){let n={},r={};for(let i in e)i in t&&(n[i]=e[i](t[i]));for(let i in t)i in e||(r[i]=t[i]);return{refined:n,extra:r}}function S(t){return t}const{hasOwnProperty:cr}=Object.prototype;function Yi(t,e){let n={};if(e){for(let r in e)if(e[r]===mt){let i=[];for(let o=t.length-1;o>=0;o-=1){let a=t[o][r];if(typeof a=="object"&&a)i.unshift(a);else if(a!==void 0){n[r]=a;break}}i.length&&(n[r]=Yi(i))}}for(let r=t.length-1;r>=0;r-=1){let i=t[r];for(let o in i)o in n||(n[o]=i[o])}return n}function At(t,e){let n={};for(let r in t)e(t[r],r)&&(n[r]=t[r]);return n}function Tt(t,e){let n={};for(let r in t)n[r]=e(t[r],r);return n}function Zl(t){let e={};for(let n of t)e[n]=!0;return e}function Qi(t){let e=[];for(let n in t)e.push(t[n]);return e}function ze(t,e){if(t===e)return!0;for(let n in t)if(cr.call(t,n)&&!(n in e))return!1;for(let n in e)if(cr.call(e,n)&&t[n]!==e[n])return!1;return!0}const Mp=/^on[A-Z]/;function Op(t,e){const n=Bp(t,e);for(let r of n)if(!Mp.test(r))return!1;return!0}function Bp(t,e){let n=[];for(let r in t)cr.call(t,r)&&(r in e||n.push(r));for(let r in e)cr.call(e,r)&&t[r]!==e[r]&&n.push(r);return n}function ei(t,e,n={}){if(t===e)return!0;for(let r in e)if(!(r in t&&Pp(t[r],e[r],n[r])))return!1;for(let r in t)if(!(r in e))return!1;return!0}function Pp(t,e,n){return t===e||n===!0?!0:n?n(t,e):!1}function Np(t,e=0,n,r=1){let i=[];n==null&&(n=Object.keys(t).length);for(let o=e;o<n;o+=r){let a=t[o];a!==void 0&&i.push(a)}return i}let Xl={};function Lp(t,e){Xl[t]=e}function Hp(t){return new Xl[t]}class jp{getMarkerYear(e){return e.getUTCFullYear()}getMarkerMonth(e){return e.getUTCMonth()}getMarkerDay(e){return e.getUTCDate()}arrayToMarker(e){return ke(e)}markerToArray(e){return st(e)}}Lp("gregory",jp);const Fp=/^\s*(\d{4})(-?(\d{2})(-?(\d{2})([T ](\d{2}):?(\d{2})(:?(\d{2})(\.(\d+))?)?(Z|(([-+])(\d{2})(:?(\d{2}))?))?)?)?)?$/;function Up(t){let e=Fp.exec(t);if(e){let n=new Date(Date.UTC(Number(e[1]),e[3]?Number(e[3])-1:0,Number(e[5]||1),Number(e[7]||0),Number(e[8]||0),Number(e[10]||0),e[12]?+`0.${e[12]}`*1e3:0));if(Ql(n)){let r=null;return e[13]&&(r=(e[15]==="-"?-1:1)*(Number(e[16]||0)*60+Number(e[18]||0))),{marker:n,isTimeUnspecified:!e[6],timeZoneOffset:r}}}return null}class Vp{constructor(e){let n=this.timeZone=e.timeZone,r=n!=="local"&&n!=="UTC";e.namedTimeZoneImpl&&r&&(this.namedTimeZoneImpl=new e.namedTimeZoneImpl(n)),this.canComputeOffset=!!(!r||this.namedTimeZoneImpl),this.calendarSystem=Hp(e.calendarSystem),this.locale=e.locale,this.weekDow=e.locale.week.dow,this.weekDoy=e.locale.week.doy,e.weekNumberCalculation==="ISO"&&(this.weekDow=1,this.weekDoy=4),typeof e.firstDay=="number"&&(this.weekDow=e.firstDay),typeof e.weekNumberCalculation=="function"&&(this.weekNumberFunc=e.weekNumberCalculation),this.weekText=e.weekText!=null?e.weekText:e.locale.options.weekText,this.weekTextLong=(e.weekTextLong!=null?e.weekTextLong:e.locale.options.weekTextLong)||this.weekText,this.cmdFormatter=e.cmdFormatter,this.defaultSeparator=e.defaultSeparator}createMarker(e){let n=this.createMarkerMeta(e);return n===null?null:n.marker}createNowMarker(){return this.canComputeOffset?this.timestampToMarker(new Date().valueOf()):ke(qs(new Date))}createMarkerMeta(e){if(typeof e=="string")return this.parse(e);let n=null;return typeof e=="number"?n=this.timestampToMarker(e):e instanceof Date?(e=e.valueOf(),isNaN(e)||(n=this.timestampToMarker(e))):Array.isArray(e)&&(n=ke(e)),n===null||!Ql(n)?null:{marker:n,isTimeUnspecified:!1,forcedTzo:null}}parse(e){let n=Up(e);if(n===null)return null;let{marker:r}=n,i=null;return n.timeZoneOffset!==null&&(this.canComputeOffset?r=this.timestampToMarker(r.valueOf()-n.timeZoneOffset*60*1e3):i=n.timeZoneOffset),{marker:r,isTimeUnspecified:n.isTimeUnspecified,forcedTzo:i}}getYear(e){return this.calendarSystem.getMarkerYear(e)}getMonth(e){return this.calendarSystem.getMarkerMonth(e)}getDay(e){return this.calendarSystem.getMarkerDay(e)}add(e,n){let r=this.calendarSystem.markerToArray(e);return r[0]+=n.years,r[1]+=n.months,r[2]+=n.days,r[6]+=n.milliseconds,this.calendarSystem.arrayToMarker(r)}subtract(e,n){let r=this.calendarSystem.markerToArray(e);return r[0]-=n.years,r[1]-=n.months,r[2]-=n.days,r[6]-=n.milliseconds,this.calendarSystem.arrayToMarker(r)}addYears(e,n){let r=this.calendarSystem.markerToArray(e);return r[0]+=n,this.calendarSystem.arrayToMarker(r)}addMonths(e,n){let r=this.calendarSystem.markerToArray(e);return r[1]+=n,this.calendarSystem.arrayToMarker(r)}diffWholeYears(e,n){let{calendarSystem:r}=this;return at(e)===at(n)&&r.getMarkerDay(e)===r.getMarkerDay(n)&&r.getMarkerMonth(e)===r.getMarkerMonth(n)?r.getMarkerYear(n)-r.getMarkerYear(e):null}diffWholeMonths(e,n){let{calendarSystem:r}=this;return at(e)===at(n)&&r.getMarkerDay(e)===r.getMarkerDay(n)?r.getMarkerMonth(n)-r.getMarkerMonth(e)+(r.getMarkerYear(n)-r.getMarkerYear(e))*12:null}greatestWholeUnit(e,n){let r=this.diffWholeYears(e,n);return r!==null?{unit:"year",value:r}:(r=this.diffWholeMonths(e,n),r!==null?{unit:"month",value:r}:(r=lp(e,n),r!==null?{unit:"week",value:r}:(r=sr(e,n),r!==null?{unit:"day",value:r}:(r=ip(e,n),Zr(r)?{unit:"hour",value:r}:(r=op(e,n),Zr(r)?{unit:"minute",value:r}:(r=sp(e,n),Zr(r)?{unit:"second",value:r}:{unit:"millisecond",value:n.valueOf()-e.valueOf()}))))))}countDurationsBetween(e,n,r){let i;return r.years&&(i=this.diffWholeYears(e,n),i!==null)?i/ep(r):r.months&&(i=this.diffWholeMonths(e,n),i!==null)?i/tp(r):r.days&&(i=sr(e,n),i!==null)?i/Lt(r):(n.valueOf()-e.valueOf())/un(r)}startOf(e,n){return n==="year"?this.startOfYear(e):n==="month"?this.startOfMonth(e):n==="week"?this.startOfWeek(e):n==="day"?ae(e):n==="hour"?cp(e):n==="minute"?up(e):n==="second"?dp(e):null}startOfYear(e){return this.calendarSystem.arrayToMarker([this.calendarSystem.getMarkerYear(e)])}startOfMonth(e){return this.calendarSystem.arrayToMarker([this.calendarSystem.getMarkerYear(e),this.calendarSystem.getMarkerMonth(e)])}startOfWeek(e){return this.calendarSystem.arrayToMarker([this.calendarSystem.getMarkerYear(e),this.calendarSystem.getMarkerMonth(e),e.getUTCDate()-(e.getUTCDay()-this.weekDow+7)%7])}computeWeekNumber(e){return this.weekNumberFunc?this.weekNumberFunc(this.toDate(e)):fp(e,this.weekDow,this.weekDoy)}format(e,n,r={}){return n.format({marker:e,timeZoneOffset:r.forcedTzo!=null?r.forcedTzo:this.offsetForMarker(e)},this)}formatRange(e,n,r,i={}){return i.isEndExclusive&&(n=ut(n,-1)),r.formatRange({marker:e,timeZoneOffset:i.forcedStartTzo!=null?i.forcedStartTzo:this.offsetForMarker(e)},{marker:n,timeZoneOffset:i.forcedEndTzo!=null?i.forcedEndTzo:this.offsetForMarker(n)},this,i.defaultSeparator)}formatIso(e,n={}){let r=null;return n.omitTimeZoneOffset||(n.forcedTzo!=null?r=n.forcedTzo:r=this.offsetForMarker(e)),gp(e,r,n.omitTime)}timestampToMarker(e){return this.timeZone==="local"?ke(qs(new Date(e))):this.timeZone==="UTC"||!this.namedTimeZoneImpl?new Date(e):ke(this.namedTimeZoneImpl.timestampToArray(e))}offsetForMarker(e){return this.timeZone==="local"?-Ys(st(e)).getTimezoneOffset():this.timeZone==="UTC"?0:this.namedTimeZoneImpl?this.namedTimeZoneImpl.offsetForArray(st(e)):null}toDate(e,n){return this.timeZone==="local"?Ys(st(e)):this.timeZone==="UTC"?new Date(e.valueOf()):this.namedTimeZoneImpl?new Date(e.valueOf()-this.namedTimeZoneImpl.offsetForArray(st(e))*1e3*60):new Date(e.valueOf()-(n||0))}}class wn{constructor(e){this.iconOverrideOption&&this.setIconOverride(e[this.iconOverrideOption])}setIconOverride(e){let n,r;if(typeof e=="object"&&e){n=Object.assign({},this.iconClasses);for(r in e)n[r]=this.applyIconOverridePrefix(e[r]);this.iconClasses=n}else e===!1&&(this.iconClasses={})}applyIconOverridePrefix(e){let n=this.iconOverridePrefix;return n&&e.indexOf(n)!==0&&(e=n+e),e}getClass(e){return this.classes[e]||""}getIconClass(e,n){let r;return n&&this.rtlIconClasses?r=this.rtlIconClasses[e]||this.iconClasses[e]:r=this.iconClasses[e],r?`${this.baseIconClass} ${r}`:""}getCustomButtonIconClass(e){let n;return this.iconOverrideCustomButtonOption&&(n=e[this.iconOverrideCustomButtonOption],n)?`${this.baseIconClass} ${this.applyIconOverridePrefix(n)}`:""}}wn.prototype.classes={};wn.prototype.iconClasses={};wn.prototype.baseIconClass="";wn.prototype.iconOverridePrefix="";function ur(t){t();let e=j.debounceRendering,n=[];function r(i){n.push(i)}for(j.debounceRendering=r,cn(D(zp,{}),document.createElement("div"));n.length;)n.shift()();j.debounceRendering=e}class zp extends Oe{render(){return D("div",{})}componentDidMount(){this.setState({})}}function Jl(t){let e=gg(t),n=e.Provider;return e.Provider=function(){let r=!this.getChildContext,i=n.apply(this,arguments);if(r){let o=[];this.shouldComponentUpdate=a=>{this.props.value!==a.value&&o.forEach(l=>{l.context=a.value,l.forceUpdate()})},this.sub=a=>{o.push(a);let l=a.componentWillUnmount;a.componentWillUnmount=()=>{o.splice(o.indexOf(a),1),l&&l.call(a)}}}return i},e}class Wp{constructor(e,n,r,i){this.execFunc=e,this.emitter=n,this.scrollTime=r,this.scrollTimeReset=i,this.handleScrollRequest=o=>{this.queuedRequest=Object.assign({},this.queuedRequest||{},o),this.drain()},n.on("_scrollRequest",this.handleScrollRequest),this.fireInitialScroll()}detach(){this.emitter.off("_scrollRequest",this.handleScrollRequest)}update(e){e&&this.scrollTimeReset?this.fireInitialScroll():this.drain()}fireInitialScroll(){this.handleScrollRequest({time:this.scrollTime})}drain(){this.queuedRequest&&this.execFunc(this.queuedRequest)&&(this.queuedRequest=null)}}const xt=Jl({});function $p(t,e,n,r,i,o,a,l,u,h,f,v,p,m){return{dateEnv:i,nowManager:o,options:n,pluginHooks:l,emitter:f,dispatch:u,getCurrentData:h,calendarApi:v,viewSpec:t,viewApi:e,dateProfileGenerator:r,theme:a,isRtl:n.direction==="rtl",addResizeHandler(E){f.on("_resize",E)},removeResizeHandler(E){f.off("_resize",E)},createScrollResponder(E){return new Wp(E,f,ee(n.scrollTime),n.scrollTimeReset)},registerInteractiveComponent:p,unregisterInteractiveComponent:m}}class Rt extends Oe{shouldComponentUpdate(e,n){return!ei(this.props,e,this.propEquality)||!ei(this.state,n,this.stateEquality)}safeSetState(e){ei(this.state,Object.assign(Object.assign({},this.state),e),this.stateEquality)||this.setState(e)}}Rt.addPropsEquality=Gp;Rt.addStateEquality=qp;Rt.contextType=xt;Rt.prototype.propEquality={};Rt.prototype.stateEquality={};class ce extends Rt{}ce.contextType=xt;function Gp(t){let e=Object.create(this.prototype.propEquality);Object.assign(e,t),this.prototype.propEquality=e}function qp(t){let e=Object.create(this.prototype.stateEquality);Object.assign(e,t),this.prototype.stateEquality=e}function Qe(t,e){typeof t=="function"?t(e):t&&(t.current=e)}class Zi extends ce{constructor(){super(...arguments),this.id=_t(),this.queuedDomNodes=[],this.currentDomNodes=[],this.handleEl=e=>{const{options:n}=this.context,{generatorName:r}=this.props;(!n.customRenderingReplaces||!vi(r,n))&&this.updateElRef(e)},this.updateElRef=e=>{this.props.elRef&&Qe(this.props.elRef,e)}}render(){const{props:e,context:n}=this,{options:r}=n,{customGenerator:i,defaultGenerator:o,renderProps:a}=e,l=Kl(e,[],this.handleEl);let u=!1,h,f=[],v;if(i!=null){const p=typeof i=="function"?i(a,D):i;if(p===!0)u=!0;else{const m=p&&typeof p=="object";m&&"html"in p?l.dangerouslySetInnerHTML={__html:p.html}:m&&"domNodes"in p?f=Array.prototype.slice.call(p.domNodes):(m?Cl(p):typeof p!="function")?h=p:v=p}}else u=!vi(e.generatorName,r);return u&&o&&(h=o(a)),this.queuedDomNodes=f,this.currentGeneratorMeta=v,D(e.elTag,l,h)}componentDidMount(){this.applyQueueudDomNodes(),this.triggerCustomRendering(!0)}componentDidUpdate(){this.applyQueueudDomNodes(),this.triggerCustomRendering(!0)}componentWillUnmount(){this.triggerCustomRendering(!1)}triggerCustomRendering(e){var n;const{props:r,context:i}=this,{handleCustomRendering:o,customRenderingMetaMap:a}=i.options;if(o){const l=(n=this.currentGeneratorMeta)!==null&&n!==void 0?n:a?.[r.generatorName];l&&o(Object.assign(Object.assign({id:this.id,isActive:e,containerEl:this.base,reportNewContainerEl:this.updateElRef,generatorMeta:l},r),{elClasses:(r.elClasses||[]).filter(Yp)}))}}applyQueueudDomNodes(){const{queuedDomNodes:e,currentDomNodes:n}=this,r=this.base;if(!ct(e,n)){n.forEach(Vi);for(let i of e)r.appendChild(i);this.currentDomNodes=e}}}Zi.addPropsEquality({elClasses:ct,elStyle:ze,elAttrs:Op,renderProps:ze});function vi(t,e){var n;return!!(e.handleCustomRendering&&t&&(!((n=e.customRenderingMetaMap)===null||n===void 0)&&n[t]))}function Kl(t,e,n){const r=Object.assign(Object.assign({},t.elAttrs),{ref:n});return(t.elClasses||e)&&(r.className=(t.elClasses||[]).concat(e||[]).concat(r.className||[]).filter(Boolean).join(" ")),t.elStyle&&(r.style=t.elStyle),r}function Yp(t){return!!t}const ec=Jl(0);class Ke extends Oe{constructor(){super(...arguments),this.InnerContent=Qp.bind(void 0,this),this.handleEl=e=>{this.el=e,this.props.elRef&&(Qe(this.props.elRef,e),e&&this.didMountMisfire&&this.componentDidMount())}}render(){const{props:e}=this,n=Zp(e.classNameGenerator,e.renderProps);if(e.children){const r=Kl(e,n,this.handleEl),i=e.children(this.InnerContent,e.renderProps,r);return e.elTag?D(e.elTag,r,i):i}else return D(Zi,Object.assign(Object.assign({},e),{elRef:this.handleEl,elTag:e.elTag||"div",elClasses:(e.elClasses||[]).concat(n),renderId:this.context}))}componentDidMount(){var e,n;this.el?(n=(e=this.props).didMount)===null||n===void 0||n.call(e,Object.assign(Object.assign({},this.props.renderProps),{el:this.el})):this.didMountMisfire=!0}componentWillUnmount(){var e,n;(n=(e=this.props).willUnmount)===null||n===void 0||n.call(e,Object.assign(Object.assign({},this.props.renderProps),{el:this.el}))}}Ke.contextType=ec;function Qp(t,e){const n=t.props;return D(Zi,Object.assign({renderProps:n.renderProps,generatorName:n.generatorName,customGenerator:n.customGenerator,defaultGenerator:n.defaultGenerator,renderId:t.context},e))}function Zp(t,e){const n=typeof t=="function"?t(e):t||[];return typeof n=="string"?[n]:n}class ea extends ce{render(){let{props:e,context:n}=this,{options:r}=n,i={view:n.viewApi};return D(Ke,{elRef:e.elRef,elTag:e.elTag||"div",elAttrs:e.elAttrs,elClasses:[...tc(e.viewSpec),...e.elClasses||[]],elStyle:e.elStyle,renderProps:i,classNameGenerator:r.viewClassNames,generatorName:void 0,didMount:r.viewDidMount,willUnmount:r.viewWillUnmount},()=>e.children)}}function tc(t){return[`fc-${t.type}-view`,"fc-view"]}function Xp(t,e){let n=null,r=null;return t.start&&(n=e.createMarker(t.start)),t.end&&(r=e.createMarker(t.end)),!n&&!r||n&&r&&r<n?null:{start:n,end:r}}function ta(t,e){let n=[],{start:r}=e,i,o;for(t.sort(Jp),i=0;i<t.length;i+=1)o=t[i],o.start>r&&n.push({start:r,end:o.start}),o.end>r&&(r=o.end);return r<e.end&&n.push({start:r,end:e.end}),n}function Jp(t,e){return t.start.valueOf()-e.start.valueOf()}function Vt(t,e){let{start:n,end:r}=t,i=null;return e.start!==null&&(n===null?n=e.start:n=new Date(Math.max(n.valueOf(),e.start.valueOf()))),e.end!=null&&(r===null?r=e.end:r=new Date(Math.min(r.valueOf(),e.end.valueOf()))),(n===null||r===null||n<r)&&(i={start:n,end:r}),i}function Kp(t,e){return(t.start===null?null:t.start.valueOf())===(e.start===null?null:e.start.valueOf())&&(t.end===null?null:t.end.valueOf())===(e.end===null?null:e.end.valueOf())}function Xi(t,e){return(t.end===null||e.start===null||t.end>e.start)&&(t.start===null||e.end===null||t.start<e.end)}function Dr(t,e){return(t.start===null||e.start!==null&&e.start>=t.start)&&(t.end===null||e.end!==null&&e.end<=t.end)}function lt(t,e){return(t.start===null||e>=t.start)&&(t.end===null||e<t.end)}function em(t,e){return e.start!=null&&t<e.start?e.start:e.end!=null&&t>=e.end?new Date(e.end.valueOf()-1):t}function nc(t){let e=Math.floor(Yt(t.start,t.end))||1,n=ae(t.start),r=be(n,e);return{start:n,end:r}}function rc(t,e=ee(0)){let n=null,r=null;if(t.end){r=ae(t.end);let i=t.end.valueOf()-r.valueOf();i&&i>=un(e)&&(r=be(r,1))}return t.start&&(n=ae(t.start),r&&r<=n&&(r=be(n,1))),{start:n,end:r}}function Pt(t,e,n,r){return r==="year"?ee(n.diffWholeYears(t,e),"year"):r==="month"?ee(n.diffWholeMonths(t,e),"month"):ap(t,e)}class ic{constructor(e){this.props=e,this.initHiddenDays()}buildPrev(e,n,r){let{dateEnv:i}=this.props,o=i.subtract(i.startOf(n,e.currentRangeUnit),e.dateIncrement);return this.build(o,-1,r)}buildNext(e,n,r){let{dateEnv:i}=this.props,o=i.add(i.startOf(n,e.currentRangeUnit),e.dateIncrement);return this.build(o,1,r)}build(e,n,r=!0){let{props:i}=this,o,a,l,u,h,f;return o=this.buildValidRange(),o=this.trimHiddenDays(o),r&&(e=em(e,o)),a=this.buildCurrentRangeInfo(e,n),l=/^(year|month|week|day)$/.test(a.unit),u=this.buildRenderRange(this.trimHiddenDays(a.range),a.unit,l),u=this.trimHiddenDays(u),h=u,i.showNonCurrentDates||(h=Vt(h,a.range)),h=this.adjustActiveRange(h),h=Vt(h,o),f=Xi(a.range,o),lt(u,e)||(e=u.start),{currentDate:e,validRange:o,currentRange:a.range,currentRangeUnit:a.unit,isRangeAllDay:l,activeRange:h,renderRange:u,slotMinTime:i.slotMinTime,slotMaxTime:i.slotMaxTime,isValid:f,dateIncrement:this.buildDateIncrement(a.duration)}}buildValidRange(){let e=this.props.validRangeInput,n=typeof e=="function"?e.call(this.props.calendarApi,this.props.dateEnv.toDate(this.props.nowManager.getDateMarker())):e;return this.refineRange(n)||{start:null,end:null}}buildCurrentRangeInfo(e,n){let{props:r}=this,i=null,o=null,a=null,l;return r.duration?(i=r.duration,o=r.durationUnit,a=this.buildRangeFromDuration(e,n,i,o)):(l=this.props.dayCount)?(o="day",a=this.buildRangeFromDayCount(e,n,l)):(a=this.buildCustomVisibleRange(e))?o=r.dateEnv.greatestWholeUnit(a.start,a.end).unit:(i=this.getFallbackDuration(),o=mi(i).unit,a=this.buildRangeFromDuration(e,n,i,o)),{duration:i,unit:o,range:a}}getFallbackDuration(){return ee({day:1})}adjustActiveRange(e){let{dateEnv:n,usesMinMaxTime:r,slotMinTime:i,slotMaxTime:o}=this.props,{start:a,end:l}=e;return r&&(Lt(i)<0&&(a=ae(a),a=n.add(a,i)),Lt(o)>1&&(l=ae(l),l=be(l,-1),l=n.add(l,o))),{start:a,end:l}}buildRangeFromDuration(e,n,r,i){let{dateEnv:o,dateAlignment:a}=this.props,l,u,h;if(!a){let{dateIncrement:v}=this.props;v&&un(v)<un(r)?a=mi(v).unit:a=i}Lt(r)<=1&&this.isHiddenDay(l)&&(l=this.skipHiddenDays(l,n),l=ae(l));function f(){l=o.startOf(e,a),u=o.add(l,r),h={start:l,end:u}}return f(),this.trimHiddenDays(h)||(e=this.skipHiddenDays(e,n),f()),h}buildRangeFromDayCount(e,n,r){let{dateEnv:i,dateAlignment:o}=this.props,a=0,l=e,u;o&&(l=i.startOf(l,o)),l=ae(l),l=this.skipHiddenDays(l,n),u=l;do u=be(u,1),this.isHiddenDay(u)||(a+=1);while(a<r);return{start:l,end:u}}buildCustomVisibleRange(e){let{props:n}=this,r=n.visibleRangeInput,i=typeof r=="function"?r.call(n.calendarApi,n.dateEnv.toDate(e)):r,o=this.refineRange(i);return o&&(o.start==null||o.end==null)?null:o}buildRenderRange(e,n,r){return e}buildDateIncrement(e){let{dateIncrement:n}=this.props,r;return n||((r=this.props.dateAlignment)?ee(1,r):e||ee({days:1}))}refineRange(e){if(e){let n=Xp(e,this.props.dateEnv);return n&&(n=rc(n)),n}return null}initHiddenDays(){let e=this.props.hiddenDays||[],n=[],r=0,i;for(this.props.weekends===!1&&e.push(0,6),i=0;i<7;i+=1)(n[i]=e.indexOf(i)!==-1)||(r+=1);if(!r)throw new Error("invalid hiddenDays");this.isHiddenDayHash=n}trimHiddenDays(e){let{start:n,end:r}=e;return n&&(n=this.skipHiddenDays(n)),r&&(r=this.skipHiddenDays(r,-1,!0)),n==null||r==null||n<r?{start:n,end:r}:null}isHiddenDay(e){return e instanceof Date&&(e=e.getUTCDay()),this.isHiddenDayHash[e]}skipHiddenDays(e,n=1,r=!1){for(;this.isHiddenDayHash[(e.getUTCDay()+(r?n:0)+7)%7];)e=be(e,n);return e}}function Ji(t,e,n,r){return{instanceId:_t(),defId:t,range:e,forcedStartTzo:n??null,forcedEndTzo:r??null}}function tm(t,e,n,r){for(let i=0;i<r.length;i+=1){let o=r[i].parse(t,n);if(o){let{allDay:a}=t;return a==null&&(a=e,a==null&&(a=o.allDayGuess,a==null&&(a=!1))),{allDay:a,duration:o.duration,typeData:o.typeData,typeId:i}}}return null}function Ct(t,e,n){let{dateEnv:r,pluginHooks:i,options:o}=n,{defs:a,instances:l}=t;l=At(l,u=>!a[u.defId].recurringDef);for(let u in a){let h=a[u];if(h.recurringDef){let{duration:f}=h.recurringDef;f||(f=h.allDay?o.defaultAllDayEventDuration:o.defaultTimedEventDuration);let v=nm(h,f,e,r,i.recurringTypes);for(let p of v){let m=Ji(u,{start:p,end:r.add(p,f)});l[m.instanceId]=m}}}return{defs:a,instances:l}}function nm(t,e,n,r,i){let a=i[t.recurringDef.typeId].expand(t.recurringDef.typeData,{start:r.subtract(n.start,e),end:n.end},r);return t.allDay&&(a=a.map(ae)),a}const Wn={id:String,groupId:String,title:String,url:String,interactive:Boolean},oc={start:S,end:S,date:S,allDay:Boolean},rm=Object.assign(Object.assign(Object.assign({},Wn),oc),{extendedProps:S});function sc(t,e,n,r,i=Ki(n),o,a){let{refined:l,extra:u}=ac(t,n,i),h=om(e,n),f=tm(l,h,n.dateEnv,n.pluginHooks.recurringTypes);if(f){let p=wi(l,u,e?e.sourceId:"",f.allDay,!!f.duration,n,o);return p.recurringDef={typeId:f.typeId,typeData:f.typeData,duration:f.duration},{def:p,instance:null}}let v=im(l,h,n,r);if(v){let p=wi(l,u,e?e.sourceId:"",v.allDay,v.hasEnd,n,o),m=Ji(p.defId,v.range,v.forcedStartTzo,v.forcedEndTzo);return a&&p.publicId&&a[p.publicId]&&(m.instanceId=a[p.publicId]),{def:p,instance:m}}return null}function ac(t,e,n=Ki(e)){return qi(t,n)}function Ki(t){return Object.assign(Object.assign(Object.assign({},dr),rm),t.pluginHooks.eventRefiners)}function wi(t,e,n,r,i,o,a){let l={title:t.title||"",groupId:t.groupId||"",publicId:t.id||"",url:t.url||"",recurringDef:null,defId:(a&&t.id?a[t.id]:"")||_t(),sourceId:n,allDay:r,hasEnd:i,interactive:t.interactive,ui:fr(t,o),extendedProps:Object.assign(Object.assign({},t.extendedProps||{}),e)};for(let u of o.pluginHooks.eventDefMemberAdders)Object.assign(l,u(t));return Object.freeze(l.ui.classNames),Object.freeze(l.extendedProps),l}function im(t,e,n,r){let{allDay:i}=t,o,a=null,l=!1,u,h=null,f=t.start!=null?t.start:t.date;if(o=n.dateEnv.createMarkerMeta(f),o)a=o.marker;else if(!r)return null;return t.end!=null&&(u=n.dateEnv.createMarkerMeta(t.end)),i==null&&(e!=null?i=e:i=(!o||o.isTimeUnspecified)&&(!u||u.isTimeUnspecified)),i&&a&&(a=ae(a)),u&&(h=u.marker,i&&(h=ae(h)),a&&h<=a&&(h=null)),h?l=!0:r||(l=n.options.forceEventDuration||!1,h=n.dateEnv.add(a,i?n.options.defaultAllDayEventDuration:n.options.defaultTimedEventDuration)),{allDay:i,hasEnd:l,range:{start:a,end:h},forcedStartTzo:o?o.forcedTzo:null,forcedEndTzo:u?u.forcedTzo:null}}function om(t,e){let n=null;return t&&(n=t.defaultAllDay),n==null&&(n=e.options.defaultAllDay),n}function dn(t,e,n,r,i,o){let a=Ve(),l=Ki(n);for(let u of t){let h=sc(u,e,n,r,l,i,o);h&&bi(h,a)}return a}function bi(t,e=Ve()){return e.defs[t.def.defId]=t.def,t.instance&&(e.instances[t.instance.instanceId]=t.instance),e}function eo(t,e){let n=t.instances[e];if(n){let r=t.defs[n.defId],i=_r(t,o=>sm(r,o));return i.defs[r.defId]=r,i.instances[n.instanceId]=n,i}return Ve()}function sm(t,e){return!!(t.groupId&&t.groupId===e.groupId)}function Ve(){return{defs:{},instances:{}}}function to(t,e){return{defs:Object.assign(Object.assign({},t.defs),e.defs),instances:Object.assign(Object.assign({},t.instances),e.instances)}}function _r(t,e){let n=At(t.defs,e),r=At(t.instances,i=>n[i.defId]);return{defs:n,instances:r}}function am(t,e){let{defs:n,instances:r}=t,i={},o={};for(let a in n)e.defs[a]||(i[a]=n[a]);for(let a in r)!e.instances[a]&&i[r[a].defId]&&(o[a]=r[a]);return{defs:i,instances:o}}function lm(t,e){return Array.isArray(t)?dn(t,null,e,!0):typeof t=="object"&&t?dn([t],null,e,!0):t!=null?String(t):null}function na(t){return Array.isArray(t)?t:typeof t=="string"?t.split(/\s+/):[]}const dr={display:String,editable:Boolean,startEditable:Boolean,durationEditable:Boolean,constraint:S,overlap:S,allow:S,className:na,classNames:na,color:String,backgroundColor:String,borderColor:String,textColor:String},cm={display:null,startEditable:null,durationEditable:null,constraints:[],overlap:null,allows:[],backgroundColor:"",borderColor:"",textColor:"",classNames:[]};function fr(t,e){let n=lm(t.constraint,e);return{display:t.display||null,startEditable:t.startEditable!=null?t.startEditable:t.editable,durationEditable:t.durationEditable!=null?t.durationEditable:t.editable,constraints:n!=null?[n]:[],overlap:t.overlap!=null?t.overlap:null,allows:t.allow!=null?[t.allow]:[],backgroundColor:t.backgroundColor||t.color||"",borderColor:t.borderColor||t.color||"",textColor:t.textColor||"",classNames:(t.className||[]).concat(t.classNames||[])}}function um(t){return t.reduce(dm,cm)}function dm(t,e){return{display:e.display!=null?e.display:t.display,startEditable:e.startEditable!=null?e.startEditable:t.startEditable,durationEditable:e.durationEditable!=null?e.durationEditable:t.durationEditable,constraints:t.constraints.concat(e.constraints),overlap:typeof e.overlap=="boolean"?e.overlap:t.overlap,allows:t.allows.concat(e.allows),backgroundColor:e.backgroundColor||t.backgroundColor,borderColor:e.borderColor||t.borderColor,textColor:e.textColor||t.textColor,classNames:t.classNames.concat(e.classNames)}}const fm={id:String,defaultAllDay:Boolean,url:String,format:String,events:S,eventDataTransform:S,success:S,failure:S};function lc(t,e,n=cc(e)){let r;if(typeof t=="string"?r={url:t}:typeof t=="function"||Array.isArray(t)?r={events:t}:typeof t=="object"&&t&&(r=t),r){let{refined:i,extra:o}=qi(r,n),a=hm(i,e);if(a)return{_raw:t,isFetching:!1,latestFetchId:"",fetchRange:null,defaultAllDay:i.defaultAllDay,eventDataTransform:i.eventDataTransform,success:i.success,failure:i.failure,publicId:i.id||"",sourceId:_t(),sourceDefId:a.sourceDefId,meta:a.meta,ui:fr(i,e),extendedProps:o}}return null}function cc(t){return Object.assign(Object.assign(Object.assign({},dr),fm),t.pluginHooks.eventSourceRefiners)}function hm(t,e){let n=e.pluginHooks.eventSourceDefs;for(let r=n.length-1;r>=0;r-=1){let o=n[r].parseMeta(t);if(o)return{sourceDefId:r,meta:o}}return null}function gm(t,e,n,r,i){switch(e.type){case"RECEIVE_EVENTS":return pm(t,n[e.sourceId],e.fetchId,e.fetchRange,e.rawEvents,i);case"RESET_RAW_EVENTS":return mm(t,n[e.sourceId],e.rawEvents,r.activeRange,i);case"ADD_EVENTS":return vm(t,e.eventStore,r?r.activeRange:null,i);case"RESET_EVENTS":return e.eventStore;case"MERGE_EVENTS":return to(t,e.eventStore);case"PREV":case"NEXT":case"CHANGE_DATE":case"CHANGE_VIEW_TYPE":return r?Ct(t,r.activeRange,i):t;case"REMOVE_EVENTS":return am(t,e.eventStore);case"REMOVE_EVENT_SOURCE":return dc(t,e.sourceId);case"REMOVE_ALL_EVENT_SOURCES":return _r(t,o=>!o.sourceId);case"REMOVE_ALL_EVENTS":return Ve();default:return t}}function pm(t,e,n,r,i,o){if(e&&n===e.latestFetchId){let a=dn(uc(i,e,o),e,o);return r&&(a=Ct(a,r,o)),to(dc(t,e.sourceId),a)}return t}function mm(t,e,n,r,i){const{defIdMap:o,instanceIdMap:a}=bm(t);let l=dn(uc(n,e,i),e,i,!1,o,a);return Ct(l,r,i)}function uc(t,e,n){let r=n.options.eventDataTransform,i=e?e.eventDataTransform:null;return i&&(t=ra(t,i)),r&&(t=ra(t,r)),t}function ra(t,e){let n;if(!e)n=t;else{n=[];for(let r of t){let i=e(r);i?n.push(i):i==null&&n.push(r)}}return n}function vm(t,e,n,r){return n&&(e=Ct(e,n,r)),to(t,e)}function ia(t,e,n){let{defs:r}=t,i=Tt(t.instances,o=>r[o.defId].allDay?o:Object.assign(Object.assign({},o),{range:{start:n.createMarker(e.toDate(o.range.start,o.forcedStartTzo)),end:n.createMarker(e.toDate(o.range.end,o.forcedEndTzo))},forcedStartTzo:n.canComputeOffset?null:o.forcedStartTzo,forcedEndTzo:n.canComputeOffset?null:o.forcedEndTzo}));return{defs:r,instances:i}}function dc(t,e){return _r(t,n=>n.sourceId!==e)}function wm(t,e){return{defs:t.defs,instances:At(t.instances,n=>!e[n.instanceId])}}function bm(t){const{defs:e,instances:n}=t,r={},i={};for(let o in e){const a=e[o],{publicId:l}=a;l&&(r[l]=o)}for(let o in n){const a=n[o],l=e[a.defId],{publicId:u}=l;u&&(i[u]=o)}return{defIdMap:r,instanceIdMap:i}}class Tr{constructor(){this.handlers={},this.thisContext=null}setThisContext(e){this.thisContext=e}setOptions(e){this.options=e}on(e,n){ym(this.handlers,e,n)}off(e,n){Em(this.handlers,e,n)}trigger(e,...n){let r=this.handlers[e]||[],i=this.options&&this.options[e],o=[].concat(i||[],r);for(let a of o)a.apply(this.thisContext,n)}hasHandlers(e){return!!(this.handlers[e]&&this.handlers[e].length||this.options&&this.options[e])}}function ym(t,e,n){(t[e]||(t[e]=[])).push(n)}function Em(t,e,n){n?t[e]&&(t[e]=t[e].filter(r=>r!==n)):delete t[e]}const Am={startTime:"09:00",endTime:"17:00",daysOfWeek:[1,2,3,4,5],display:"inverse-background",classNames:"fc-non-business",groupId:"_businessHours"};function Cm(t,e){return dn(Sm(t),null,e)}function Sm(t){let e;return t===!0?e=[{}]:Array.isArray(t)?e=t.filter(n=>n.daysOfWeek):typeof t=="object"&&t?e=[t]:e=[],e=e.map(n=>Object.assign(Object.assign({},Am),n)),e}function fc(t,e,n){n.emitter.trigger("select",Object.assign(Object.assign({},no(t,n)),{jsEvent:e?e.origEvent:null,view:n.viewApi||n.calendarApi.view}))}function Dm(t,e){e.emitter.trigger("unselect",{jsEvent:t?t.origEvent:null,view:e.viewApi||e.calendarApi.view})}function no(t,e){let n={};for(let r of e.pluginHooks.dateSpanTransforms)Object.assign(n,r(t,e));return Object.assign(n,Fm(t,e.dateEnv)),n}function oa(t,e,n){let{dateEnv:r,options:i}=n,o=e;return t?(o=ae(o),o=r.add(o,i.defaultAllDayEventDuration)):o=r.add(o,i.defaultTimedEventDuration),o}function ro(t,e,n,r){let i=hr(t.defs,e),o=Ve();for(let a in t.defs){let l=t.defs[a];o.defs[a]=_m(l,i[a],n,r)}for(let a in t.instances){let l=t.instances[a],u=o.defs[l.defId];o.instances[a]=Tm(l,u,i[l.defId],n,r)}return o}function _m(t,e,n,r){let i=n.standardProps||{};i.hasEnd==null&&e.durationEditable&&(n.startDelta||n.endDelta)&&(i.hasEnd=!0);let o=Object.assign(Object.assign(Object.assign({},t),i),{ui:Object.assign(Object.assign({},t.ui),i.ui)});n.extendedProps&&(o.extendedProps=Object.assign(Object.assign({},o.extendedProps),n.extendedProps));for(let a of r.pluginHooks.eventDefMutationAppliers)a(o,n,r);return!o.hasEnd&&r.options.forceEventDuration&&(o.hasEnd=!0),o}function Tm(t,e,n,r,i){let{dateEnv:o}=i,a=r.standardProps&&r.standardProps.allDay===!0,l=r.standardProps&&r.standardProps.hasEnd===!1,u=Object.assign({},t);return a&&(u.range=nc(u.range)),r.datesDelta&&n.startEditable&&(u.range={start:o.add(u.range.start,r.datesDelta),end:o.add(u.range.end,r.datesDelta)}),r.startDelta&&n.durationEditable&&(u.range={start:o.add(u.range.start,r.startDelta),end:u.range.end}),r.endDelta&&n.durationEditable&&(u.range={start:u.range.start,end:o.add(u.range.end,r.endDelta)}),l&&(u.range={start:u.range.start,end:oa(e.allDay,u.range.start,i)}),e.allDay&&(u.range={start:ae(u.range.start),end:ae(u.range.end)}),u.range.end<u.range.start&&(u.range.end=oa(e.allDay,u.range.start,i)),u}class Bt{constructor(e,n){this.context=e,this.internalEventSource=n}remove(){this.context.dispatch({type:"REMOVE_EVENT_SOURCE",sourceId:this.internalEventSource.sourceId})}refetch(){this.context.dispatch({type:"FETCH_EVENT_SOURCES",sourceIds:[this.internalEventSource.sourceId],isRefetch:!0})}get id(){return this.internalEventSource.publicId}get url(){return this.internalEventSource.meta.url}get format(){return this.internalEventSource.meta.format}}class le{constructor(e,n,r){this._context=e,this._def=n,this._instance=r||null}setProp(e,n){if(e in oc)console.warn("Could not set date-related prop 'name'. Use one of the date-related methods instead.");else if(e==="id")n=Wn[e](n),this.mutate({standardProps:{publicId:n}});else if(e in Wn)n=Wn[e](n),this.mutate({standardProps:{[e]:n}});else if(e in dr){let r=dr[e](n);e==="color"?r={backgroundColor:n,borderColor:n}:e==="editable"?r={startEditable:n,durationEditable:n}:r={[e]:n},this.mutate({standardProps:{ui:r}})}else console.warn(`Could not set prop '${e}'. Use setExtendedProp instead.`)}setExtendedProp(e,n){this.mutate({extendedProps:{[e]:n}})}setStart(e,n={}){let{dateEnv:r}=this._context,i=r.createMarker(e);if(i&&this._instance){let o=this._instance.range,a=Pt(o.start,i,r,n.granularity);n.maintainDuration?this.mutate({datesDelta:a}):this.mutate({startDelta:a})}}setEnd(e,n={}){let{dateEnv:r}=this._context,i;if(!(e!=null&&(i=r.createMarker(e),!i))&&this._instance)if(i){let o=Pt(this._instance.range.end,i,r,n.granularity);this.mutate({endDelta:o})}else this.mutate({standardProps:{hasEnd:!1}})}setDates(e,n,r={}){let{dateEnv:i}=this._context,o={allDay:r.allDay},a=i.createMarker(e),l;if(a&&!(n!=null&&(l=i.createMarker(n),!l))&&this._instance){let u=this._instance.range;r.allDay===!0&&(u=nc(u));let h=Pt(u.start,a,i,r.granularity);if(l){let f=Pt(u.end,l,i,r.granularity);Jg(h,f)?this.mutate({datesDelta:h,standardProps:o}):this.mutate({startDelta:h,endDelta:f,standardProps:o})}else o.hasEnd=!1,this.mutate({datesDelta:h,standardProps:o})}}moveStart(e){let n=ee(e);n&&this.mutate({startDelta:n})}moveEnd(e){let n=ee(e);n&&this.mutate({endDelta:n})}moveDates(e){let n=ee(e);n&&this.mutate({datesDelta:n})}setAllDay(e,n={}){let r={allDay:e},{maintainDuration:i}=n;i==null&&(i=this._context.options.allDayMaintainDuration),this._def.allDay!==e&&(r.hasEnd=i),this.mutate({standardProps:r})}formatRange(e){let{dateEnv:n}=this._context,r=this._instance,i=we(e);return this._def.hasEnd?n.formatRange(r.range.start,r.range.end,i,{forcedStartTzo:r.forcedStartTzo,forcedEndTzo:r.forcedEndTzo}):n.format(r.range.start,i,{forcedTzo:r.forcedStartTzo})}mutate(e){let n=this._instance;if(n){let r=this._def,i=this._context,{eventStore:o}=i.getCurrentData(),a=eo(o,n.instanceId);a=ro(a,{"":{display:"",startEditable:!0,durationEditable:!0,constraints:[],overlap:null,allows:[],backgroundColor:"",borderColor:"",textColor:"",classNames:[]}},e,i);let u=new le(i,r,n);this._def=a.defs[r.defId],this._instance=a.instances[n.instanceId],i.dispatch({type:"MERGE_EVENTS",eventStore:a}),i.emitter.trigger("eventChange",{oldEvent:u,event:this,relatedEvents:yt(a,i,n),revert(){i.dispatch({type:"RESET_EVENTS",eventStore:o})}})}}remove(){let e=this._context,n=hc(this);e.dispatch({type:"REMOVE_EVENTS",eventStore:n}),e.emitter.trigger("eventRemove",{event:this,relatedEvents:[],revert(){e.dispatch({type:"MERGE_EVENTS",eventStore:n})}})}get source(){let{sourceId:e}=this._def;return e?new Bt(this._context,this._context.getCurrentData().eventSources[e]):null}get start(){return this._instance?this._context.dateEnv.toDate(this._instance.range.start):null}get end(){return this._instance&&this._def.hasEnd?this._context.dateEnv.toDate(this._instance.range.end):null}get startStr(){let e=this._instance;return e?this._context.dateEnv.formatIso(e.range.start,{omitTime:this._def.allDay,forcedTzo:e.forcedStartTzo}):""}get endStr(){let e=this._instance;return e&&this._def.hasEnd?this._context.dateEnv.formatIso(e.range.end,{omitTime:this._def.allDay,forcedTzo:e.forcedEndTzo}):""}get id(){return this._def.publicId}get groupId(){return this._def.groupId}get allDay(){return this._def.allDay}get title(){return this._def.title}get url(){return this._def.url}get display(){return this._def.ui.display||"auto"}get startEditable(){return this._def.ui.startEditable}get durationEditable(){return this._def.ui.durationEditable}get constraint(){return this._def.ui.constraints[0]||null}get overlap(){return this._def.ui.overlap}get allow(){return this._def.ui.allows[0]||null}get backgroundColor(){return this._def.ui.backgroundColor}get borderColor(){return this._def.ui.borderColor}get textColor(){return this._def.ui.textColor}get classNames(){return this._def.ui.classNames}get extendedProps(){return this._def.extendedProps}toPlainObject(e={}){let n=this._def,{ui:r}=n,{startStr:i,endStr:o}=this,a={allDay:n.allDay};return n.title&&(a.title=n.title),i&&(a.start=i),o&&(a.end=o),n.publicId&&(a.id=n.publicId),n.groupId&&(a.groupId=n.groupId),n.url&&(a.url=n.url),r.display&&r.display!=="auto"&&(a.display=r.display),e.collapseColor&&r.backgroundColor&&r.backgroundColor===r.borderColor?a.color=r.backgroundColor:(r.backgroundColor&&(a.backgroundColor=r.backgroundColor),r.borderColor&&(a.borderColor=r.borderColor)),r.textColor&&(a.textColor=r.textColor),r.classNames.length&&(a.classNames=r.classNames),Object.keys(n.extendedProps).length&&(e.collapseExtendedProps?Object.assign(a,n.extendedProps):a.extendedProps=n.extendedProps),a}toJSON(){return this.toPlainObject()}}function hc(t){let e=t._def,n=t._instance;return{defs:{[e.defId]:e},instances:n?{[n.instanceId]:n}:{}}}function yt(t,e,n){let{defs:r,instances:i}=t,o=[],a=n?n.instanceId:"";for(let l in i){let u=i[l],h=r[u.defId];u.instanceId!==a&&o.push(new le(e,h,u))}return o}function sa(t,e,n,r){let i={},o={},a={},l=[],u=[],h=hr(t.defs,e);for(let f in t.defs){let v=t.defs[f];h[v.defId].display==="inverse-background"&&(v.groupId?(i[v.groupId]=[],a[v.groupId]||(a[v.groupId]=v)):o[f]=[])}for(let f in t.instances){let v=t.instances[f],p=t.defs[v.defId],m=h[p.defId],E=v.range,R=!p.allDay&&r?rc(E,r):E,x=Vt(R,n);x&&(m.display==="inverse-background"?p.groupId?i[p.groupId].push(x):o[v.defId].push(x):m.display!=="none"&&(m.display==="background"?l:u).push({def:p,ui:m,instance:v,range:x,isStart:R.start&&R.start.valueOf()===x.start.valueOf(),isEnd:R.end&&R.end.valueOf()===x.end.valueOf()}))}for(let f in i){let v=i[f],p=ta(v,n);for(let m of p){let E=a[f],R=h[E.defId];l.push({def:E,ui:R,instance:null,range:m,isStart:!1,isEnd:!1})}}for(let f in o){let v=o[f],p=ta(v,n);for(let m of p)l.push({def:t.defs[f],ui:h[f],instance:null,range:m,isStart:!1,isEnd:!1})}return{bg:l,fg:u}}function aa(t,e){t.fcSeg=e}function zt(t){return t.fcSeg||t.parentNode.fcSeg||null}function hr(t,e){return Tt(t,n=>gc(n,e))}function gc(t,e){let n=[];return e[""]&&n.push(e[""]),e[t.defId]&&n.push(e[t.defId]),n.push(t.ui),um(n)}function xm(t,e){let n=t.map(Rm);return n.sort((r,i)=>$g(r,i,e)),n.map(r=>r._seg)}function Rm(t){let{eventRange:e}=t,n=e.def,r=e.instance?e.instance.range:e.range,i=r.start?r.start.valueOf():0,o=r.end?r.end.valueOf():0;return Object.assign(Object.assign(Object.assign({},n.extendedProps),n),{id:n.publicId,start:i,end:o,duration:o-i,allDay:Number(n.allDay),_seg:t})}function km(t,e){let{pluginHooks:n}=e,r=n.isDraggableTransformers,{def:i,ui:o}=t.eventRange,a=o.startEditable;for(let l of r)a=l(a,i,o,e);return a}function Im(t,e){return t.isStart&&t.eventRange.ui.durationEditable&&e.options.eventResizableFromStart}function Mm(t,e){return t.isEnd&&t.eventRange.ui.durationEditable}function pc(t,e,n,r,i,o,a){let{dateEnv:l,options:u}=n,{displayEventTime:h,displayEventEnd:f}=u,v=t.eventRange.def,p=t.eventRange.instance;h==null&&(h=r!==!1),f==null&&(f=i!==!1);let m=p.range.start,E=p.range.end,R=t.start||t.eventRange.range.start,x=t.end||t.eventRange.range.end,k=ae(m).valueOf()===ae(R).valueOf(),B=ae(ut(E,-1)).valueOf()===ae(ut(x,-1)).valueOf();return h&&!v.allDay&&(k||B)?(R=k?m:R,x=B?E:x,f&&v.hasEnd?l.formatRange(R,x,e,{forcedStartTzo:p.forcedStartTzo,forcedEndTzo:p.forcedEndTzo}):l.format(R,e,{forcedTzo:p.forcedStartTzo})):""}function sn(t,e,n){let r=t.eventRange.range;return{isPast:r.end<=e.start,isFuture:r.start>=e.end,isToday:e&&lt(e,r.start)}}function Om(t){let e=["fc-event"];return t.isMirror&&e.push("fc-event-mirror"),t.isDraggable&&e.push("fc-event-draggable"),(t.isStartResizable||t.isEndResizable)&&e.push("fc-event-resizable"),t.isDragging&&e.push("fc-event-dragging"),t.isResizing&&e.push("fc-event-resizing"),t.isSelected&&e.push("fc-event-selected"),t.isStart&&e.push("fc-event-start"),t.isEnd&&e.push("fc-event-end"),t.isPast&&e.push("fc-event-past"),t.isToday&&e.push("fc-event-today"),t.isFuture&&e.push("fc-event-future"),e}function Bm(t){return t.instance?t.instance.instanceId:`${t.def.defId}:${t.range.start.toISOString()}`}function mc(t,e){let{def:n,instance:r}=t.eventRange,{url:i}=n;if(i)return{href:i};let{emitter:o,options:a}=e,{eventInteractive:l}=a;return l==null&&(l=n.interactive,l==null&&(l=!!o.hasHandlers("eventClick"))),l?Yl(u=>{o.trigger("eventClick",{el:u.target,event:new le(e,n,r),jsEvent:u,view:e.viewApi})}):{}}const Pm={start:S,end:S,allDay:Boolean};function Nm(t,e,n){let r=Lm(t,e),{range:i}=r;if(!i.start)return null;if(!i.end){if(n==null)return null;i.end=e.add(i.start,n)}return r}function Lm(t,e){let{refined:n,extra:r}=qi(t,Pm),i=n.start?e.createMarkerMeta(n.start):null,o=n.end?e.createMarkerMeta(n.end):null,{allDay:a}=n;return a==null&&(a=i&&i.isTimeUnspecified&&(!o||o.isTimeUnspecified)),Object.assign({range:{start:i?i.marker:null,end:o?o.marker:null},allDay:a},r)}function Hm(t,e){return Kp(t.range,e.range)&&t.allDay===e.allDay&&jm(t,e)}function jm(t,e){for(let n in e)if(n!=="range"&&n!=="allDay"&&t[n]!==e[n])return!1;for(let n in t)if(!(n in e))return!1;return!0}function Fm(t,e){return Object.assign(Object.assign({},wc(t.range,e,t.allDay)),{allDay:t.allDay})}function vc(t,e,n){return Object.assign(Object.assign({},wc(t,e,n)),{timeZone:e.timeZone})}function wc(t,e,n){return{start:e.toDate(t.start),end:e.toDate(t.end),startStr:e.formatIso(t.start,{omitTime:n}),endStr:e.formatIso(t.end,{omitTime:n})}}function Um(t,e,n){let r=ac({editable:!1},n),i=wi(r.refined,r.extra,"",t.allDay,!0,n);return{def:i,ui:gc(i,e),instance:Ji(i.defId,t.range),range:t.range,isStart:!0,isEnd:!0}}function Vm(t,e,n){let r=!1,i=function(l){r||(r=!0,e(l))},o=function(l){r||(r=!0,n(l))},a=t(i,o);a&&typeof a.then=="function"&&a.then(i,o)}class la extends Error{constructor(e,n){super(e),this.response=n}}function zm(t,e,n){t=t.toUpperCase();const r={method:t};return t==="GET"?e+=(e.indexOf("?")===-1?"?":"&")+new URLSearchParams(n):(r.body=new URLSearchParams(n),r.headers={"Content-Type":"application/x-www-form-urlencoded"}),fetch(e,r).then(i=>{if(i.ok)return i.json().then(o=>[o,i],()=>{throw new la("Failure parsing JSON",i)});throw new la("Request failed",i)})}let ti;function bc(){return ti==null&&(ti=Wm()),ti}function Wm(){if(typeof document>"u")return!0;let t=document.createElement("div");t.style.position="absolute",t.style.top="0px",t.style.left="0px",t.innerHTML="<table><tr><td><div></div></td></tr></table>",t.querySelector("table").style.height="100px",t.querySelector("div").style.height="100%",document.body.appendChild(t);let n=t.querySelector("div").offsetHeight>0;return document.body.removeChild(t),n}class $m extends ce{constructor(){super(...arguments),this.state={forPrint:!1},this.handleBeforePrint=()=>{ur(()=>{this.setState({forPrint:!0})})},this.handleAfterPrint=()=>{ur(()=>{this.setState({forPrint:!1})})}}render(){let{props:e}=this,{options:n}=e,{forPrint:r}=this.state,i=r||n.height==="auto"||n.contentHeight==="auto",o=!i&&n.height!=null?n.height:"",a=["fc",r?"fc-media-print":"fc-media-screen",`fc-direction-${n.direction}`,e.theme.getClass("root")];return bc()||a.push("fc-liquid-hack"),e.children(a,o,i,r)}componentDidMount(){let{emitter:e}=this.props;e.on("_beforeprint",this.handleBeforePrint),e.on("_afterprint",this.handleAfterPrint)}componentWillUnmount(){let{emitter:e}=this.props;e.off("_beforeprint",this.handleBeforePrint),e.off("_afterprint",this.handleAfterPrint)}}class Qt{constructor(e){this.component=e.component,this.isHitComboAllowed=e.isHitComboAllowed||null}destroy(){}}function Gm(t,e){return{component:t,el:e.el,useEventCenter:e.useEventCenter!=null?e.useEventCenter:!0,isHitComboAllowed:e.isHitComboAllowed||null}}function io(t){return{[t.component.uid]:t}}const yi={};class xr extends Oe{constructor(e,n){super(e,n),this.handleRefresh=()=>{let r=this.computeTiming();r.state.nowDate.valueOf()!==this.state.nowDate.valueOf()&&this.setState(r.state),this.clearTimeout(),this.setTimeout(r.waitMs)},this.handleVisibilityChange=()=>{document.hidden||this.handleRefresh()},this.state=this.computeTiming().state}render(){let{props:e,state:n}=this;return e.children(n.nowDate,n.todayRange)}componentDidMount(){this.setTimeout(),this.context.nowManager.addResetListener(this.handleRefresh),document.addEventListener("visibilitychange",this.handleVisibilityChange)}componentDidUpdate(e){e.unit!==this.props.unit&&(this.clearTimeout(),this.setTimeout())}componentWillUnmount(){this.clearTimeout(),this.context.nowManager.removeResetListener(this.handleRefresh),document.removeEventListener("visibilitychange",this.handleVisibilityChange)}computeTiming(){let{props:e,context:n}=this,r=n.nowManager.getDateMarker(),{nowIndicatorSnap:i}=n.options;i==="auto"&&(i=/year|month|week|day/.test(e.unit)||(e.unitValue||1)===1);let o,a;return i?(o=n.dateEnv.startOf(r,e.unit),a=n.dateEnv.add(o,ee(1,e.unit)).valueOf()-r.valueOf()):(o=r,a=1e3*60),a=Math.min(1e3*60*60*24,a),{state:{nowDate:o,todayRange:qm(o)},waitMs:a}}setTimeout(e=this.computeTiming().waitMs){this.timeoutId=setTimeout(()=>{const n=this.computeTiming();this.setState(n.state,()=>{this.setTimeout(n.waitMs)})},e)}clearTimeout(){this.timeoutId&&clearTimeout(this.timeoutId)}}xr.contextType=xt;function qm(t){let e=ae(t),n=be(e,1);return{start:e,end:n}}class Ym{getCurrentData(){return this.currentDataManager.getCurrentData()}dispatch(e){this.currentDataManager.dispatch(e)}get view(){return this.getCurrentData().viewApi}batchRendering(e){e()}updateSize(){this.trigger("_resize",!0)}setOption(e,n){this.dispatch({type:"SET_OPTION",optionName:e,rawOptionValue:n})}getOption(e){return this.currentDataManager.currentCalendarOptionsInput[e]}getAvailableLocaleCodes(){return Object.keys(this.getCurrentData().availableRawLocales)}on(e,n){let{currentDataManager:r}=this;r.currentCalendarOptionsRefiners[e]?r.emitter.on(e,n):console.warn(`Unknown listener name '${e}'`)}off(e,n){this.currentDataManager.emitter.off(e,n)}trigger(e,...n){this.currentDataManager.emitter.trigger(e,...n)}changeView(e,n){this.batchRendering(()=>{if(this.unselect(),n)if(n.start&&n.end)this.dispatch({type:"CHANGE_VIEW_TYPE",viewType:e}),this.dispatch({type:"SET_OPTION",optionName:"visibleRange",rawOptionValue:n});else{let{dateEnv:r}=this.getCurrentData();this.dispatch({type:"CHANGE_VIEW_TYPE",viewType:e,dateMarker:r.createMarker(n)})}else this.dispatch({type:"CHANGE_VIEW_TYPE",viewType:e})})}zoomTo(e,n){let r=this.getCurrentData(),i;n=n||"day",i=r.viewSpecs[n]||this.getUnitViewSpec(n),this.unselect(),i?this.dispatch({type:"CHANGE_VIEW_TYPE",viewType:i.type,dateMarker:e}):this.dispatch({type:"CHANGE_DATE",dateMarker:e})}getUnitViewSpec(e){let{viewSpecs:n,toolbarConfig:r}=this.getCurrentData(),i=[].concat(r.header?r.header.viewsWithButtons:[],r.footer?r.footer.viewsWithButtons:[]),o,a;for(let l in n)i.push(l);for(o=0;o<i.length;o+=1)if(a=n[i[o]],a&&a.singleUnit===e)return a;return null}prev(){this.unselect(),this.dispatch({type:"PREV"})}next(){this.unselect(),this.dispatch({type:"NEXT"})}prevYear(){let e=this.getCurrentData();this.unselect(),this.dispatch({type:"CHANGE_DATE",dateMarker:e.dateEnv.addYears(e.currentDate,-1)})}nextYear(){let e=this.getCurrentData();this.unselect(),this.dispatch({type:"CHANGE_DATE",dateMarker:e.dateEnv.addYears(e.currentDate,1)})}today(){let e=this.getCurrentData();this.unselect(),this.dispatch({type:"CHANGE_DATE",dateMarker:e.nowManager.getDateMarker()})}gotoDate(e){let n=this.getCurrentData();this.unselect(),this.dispatch({type:"CHANGE_DATE",dateMarker:n.dateEnv.createMarker(e)})}incrementDate(e){let n=this.getCurrentData(),r=ee(e);r&&(this.unselect(),this.dispatch({type:"CHANGE_DATE",dateMarker:n.dateEnv.add(n.currentDate,r)}))}getDate(){let e=this.getCurrentData();return e.dateEnv.toDate(e.currentDate)}formatDate(e,n){let{dateEnv:r}=this.getCurrentData();return r.format(r.createMarker(e),we(n))}formatRange(e,n,r){let{dateEnv:i}=this.getCurrentData();return i.formatRange(i.createMarker(e),i.createMarker(n),we(r),r)}formatIso(e,n){let{dateEnv:r}=this.getCurrentData();return r.formatIso(r.createMarker(e),{omitTime:n})}select(e,n){let r;n==null?e.start!=null?r=e:r={start:e,end:null}:r={start:e,end:n};let i=this.getCurrentData(),o=Nm(r,i.dateEnv,ee({days:1}));o&&(this.dispatch({type:"SELECT_DATES",selection:o}),fc(o,null,i))}unselect(e){let n=this.getCurrentData();n.dateSelection&&(this.dispatch({type:"UNSELECT_DATES"}),Dm(e,n))}addEvent(e,n){if(e instanceof le){let a=e._def,l=e._instance;return this.getCurrentData().eventStore.defs[a.defId]||(this.dispatch({type:"ADD_EVENTS",eventStore:bi({def:a,instance:l})}),this.triggerEventAdd(e)),e}let r=this.getCurrentData(),i;if(n instanceof Bt)i=n.internalEventSource;else if(typeof n=="boolean")n&&([i]=Qi(r.eventSources));else if(n!=null){let a=this.getEventSourceById(n);if(!a)return console.warn(`Could not find an event source with ID "${n}"`),null;i=a.internalEventSource}let o=sc(e,i,r,!1);if(o){let a=new le(r,o.def,o.def.recurringDef?null:o.instance);return this.dispatch({type:"ADD_EVENTS",eventStore:bi(o)}),this.triggerEventAdd(a),a}return null}triggerEventAdd(e){let{emitter:n}=this.getCurrentData();n.trigger("eventAdd",{event:e,relatedEvents:[],revert:()=>{this.dispatch({type:"REMOVE_EVENTS",eventStore:hc(e)})}})}getEventById(e){let n=this.getCurrentData(),{defs:r,instances:i}=n.eventStore;e=String(e);for(let o in r){let a=r[o];if(a.publicId===e){if(a.recurringDef)return new le(n,a,null);for(let l in i){let u=i[l];if(u.defId===a.defId)return new le(n,a,u)}}}return null}getEvents(){let e=this.getCurrentData();return yt(e.eventStore,e)}removeAllEvents(){this.dispatch({type:"REMOVE_ALL_EVENTS"})}getEventSources(){let e=this.getCurrentData(),n=e.eventSources,r=[];for(let i in n)r.push(new Bt(e,n[i]));return r}getEventSourceById(e){let n=this.getCurrentData(),r=n.eventSources;e=String(e);for(let i in r)if(r[i].publicId===e)return new Bt(n,r[i]);return null}addEventSource(e){let n=this.getCurrentData();if(e instanceof Bt)return n.eventSources[e.internalEventSource.sourceId]||this.dispatch({type:"ADD_EVENT_SOURCES",sources:[e.internalEventSource]}),e;let r=lc(e,n);return r?(this.dispatch({type:"ADD_EVENT_SOURCES",sources:[r]}),new Bt(n,r)):null}removeAllEventSources(){this.dispatch({type:"REMOVE_ALL_EVENT_SOURCES"})}refetchEvents(){this.dispatch({type:"FETCH_EVENT_SOURCES",isRefetch:!0})}scrollToTime(e){let n=ee(e);n&&this.trigger("_scrollRequest",{time:n})}}function Qm(t,e){return t.left>=e.left&&t.left<e.right&&t.top>=e.top&&t.top<e.bottom}function yc(t,e){let n={left:Math.max(t.left,e.left),right:Math.min(t.right,e.right),top:Math.max(t.top,e.top),bottom:Math.min(t.bottom,e.bottom)};return n.left<n.right&&n.top<n.bottom?n:!1}function Zm(t,e){return{left:Math.min(Math.max(t.left,e.left),e.right),top:Math.min(Math.max(t.top,e.top),e.bottom)}}function Xm(t){return{left:(t.left+t.right)/2,top:(t.top+t.bottom)/2}}function Jm(t,e){return{left:t.left-e.left,top:t.top-e.top}}function Ec(t,e,n,r){return{dow:t.getUTCDay(),isDisabled:!!(r&&(!r.activeRange||!lt(r.activeRange,t))),isOther:!!(r&&!lt(r.currentRange,t)),isToday:!!(e&&lt(e,t)),isPast:!!(e&&t<e.start),isFuture:!!(e&&t>=e.end)}}function oo(t,e){let n=["fc-day",`fc-day-${np[t.dow]}`];return t.isDisabled?n.push("fc-day-disabled"):(t.isToday&&(n.push("fc-day-today"),n.push(e.getClass("today"))),t.isPast&&n.push("fc-day-past"),t.isFuture&&n.push("fc-day-future"),t.isOther&&n.push("fc-day-other")),n}const Km=we({year:"numeric",month:"long",day:"numeric"}),e2=we({week:"long"});function Ei(t,e,n="day",r=!0){const{dateEnv:i,options:o,calendarApi:a}=t;let l=i.format(e,n==="week"?e2:Km);if(o.navLinks){let u=i.toDate(e);const h=f=>{let v=n==="day"?o.navLinkDayClick:n==="week"?o.navLinkWeekClick:null;typeof v=="function"?v.call(a,i.toDate(e),f):(typeof v=="string"&&(n=v),a.zoomTo(e,n))};return Object.assign({title:rn(o.navLinkHint,[l,u],l),"data-navlink":""},r?ql(h):{onClick:h})}return{"aria-label":l}}let ni=null;function t2(){return ni===null&&(ni=n2()),ni}function n2(){let t=document.createElement("div");nn(t,{position:"absolute",top:-1e3,left:0,border:0,padding:0,overflow:"scroll",direction:"rtl"}),t.innerHTML="<div></div>",document.body.appendChild(t);let n=t.firstChild.getBoundingClientRect().left>t.getBoundingClientRect().left;return Vi(t),n}let ri;function r2(){return ri||(ri=i2()),ri}function i2(){let t=document.createElement("div");t.style.overflow="scroll",t.style.position="absolute",t.style.top="-9999px",t.style.left="-9999px",document.body.appendChild(t);let e=Ac(t);return document.body.removeChild(t),e}function Ac(t){return{x:t.offsetHeight-t.clientHeight,y:t.offsetWidth-t.clientWidth}}function o2(t,e=!1){let n=window.getComputedStyle(t),r=parseInt(n.borderLeftWidth,10)||0,i=parseInt(n.borderRightWidth,10)||0,o=parseInt(n.borderTopWidth,10)||0,a=parseInt(n.borderBottomWidth,10)||0,l=Ac(t),u=l.y-r-i,h=l.x-o-a,f={borderLeft:r,borderRight:i,borderTop:o,borderBottom:a,scrollbarBottom:h,scrollbarLeft:0,scrollbarRight:0};return t2()&&n.direction==="rtl"?f.scrollbarLeft=u:f.scrollbarRight=u,e&&(f.paddingLeft=parseInt(n.paddingLeft,10)||0,f.paddingRight=parseInt(n.paddingRight,10)||0,f.paddingTop=parseInt(n.paddingTop,10)||0,f.paddingBottom=parseInt(n.paddingBottom,10)||0),f}function s2(t,e=!1,n){let r=so(t),i=o2(t,e),o={left:r.left+i.borderLeft+i.scrollbarLeft,right:r.right-i.borderRight-i.scrollbarRight,top:r.top+i.borderTop,bottom:r.bottom-i.borderBottom-i.scrollbarBottom};return e&&(o.left+=i.paddingLeft,o.right-=i.paddingRight,o.top+=i.paddingTop,o.bottom-=i.paddingBottom),o}function so(t){let e=t.getBoundingClientRect();return{left:e.left+window.scrollX,top:e.top+window.scrollY,right:e.right+window.scrollX,bottom:e.bottom+window.scrollY}}function a2(t){let e=Cc(t),n=t.getBoundingClientRect();for(let r of e){let i=yc(n,r.getBoundingClientRect());if(i)n=i;else return null}return n}function Cc(t){let e=[];for(;t instanceof HTMLElement;){let n=window.getComputedStyle(t);if(n.position==="fixed")break;/(auto|scroll)/.test(n.overflow+n.overflowY+n.overflowX)&&e.push(t),t=t.parentNode}return e}class gr{constructor(e,n,r,i){this.els=n;let o=this.originClientRect=e.getBoundingClientRect();r&&this.buildElHorizontals(o.left),i&&this.buildElVerticals(o.top)}buildElHorizontals(e){let n=[],r=[];for(let i of this.els){let o=i.getBoundingClientRect();n.push(o.left-e),r.push(o.right-e)}this.lefts=n,this.rights=r}buildElVerticals(e){let n=[],r=[];for(let i of this.els){let o=i.getBoundingClientRect();n.push(o.top-e),r.push(o.bottom-e)}this.tops=n,this.bottoms=r}leftToIndex(e){let{lefts:n,rights:r}=this,i=n.length,o;for(o=0;o<i;o+=1)if(e>=n[o]&&e<r[o])return o}topToIndex(e){let{tops:n,bottoms:r}=this,i=n.length,o;for(o=0;o<i;o+=1)if(e>=n[o]&&e<r[o])return o}getWidth(e){return this.rights[e]-this.lefts[e]}getHeight(e){return this.bottoms[e]-this.tops[e]}similarTo(e){return Ln(this.tops||[],e.tops||[])&&Ln(this.bottoms||[],e.bottoms||[])&&Ln(this.lefts||[],e.lefts||[])&&Ln(this.rights||[],e.rights||[])}}function Ln(t,e){const n=t.length;if(n!==e.length)return!1;for(let r=0;r<n;r++)if(Math.round(t[r])!==Math.round(e[r]))return!1;return!0}class ao{getMaxScrollTop(){return this.getScrollHeight()-this.getClientHeight()}getMaxScrollLeft(){return this.getScrollWidth()-this.getClientWidth()}canScrollVertically(){return this.getMaxScrollTop()>0}canScrollHorizontally(){return this.getMaxScrollLeft()>0}canScrollUp(){return this.getScrollTop()>0}canScrollDown(){return this.getScrollTop()<this.getMaxScrollTop()}canScrollLeft(){return this.getScrollLeft()>0}canScrollRight(){return this.getScrollLeft()<this.getMaxScrollLeft()}}class l2 extends ao{constructor(e){super(),this.el=e}getScrollTop(){return this.el.scrollTop}getScrollLeft(){return this.el.scrollLeft}setScrollTop(e){this.el.scrollTop=e}setScrollLeft(e){this.el.scrollLeft=e}getScrollWidth(){return this.el.scrollWidth}getScrollHeight(){return this.el.scrollHeight}getClientHeight(){return this.el.clientHeight}getClientWidth(){return this.el.clientWidth}}class c2 extends ao{getScrollTop(){return window.scrollY}getScrollLeft(){return window.scrollX}setScrollTop(e){window.scroll(window.scrollX,e)}setScrollLeft(e){window.scroll(e,window.scrollY)}getScrollWidth(){return document.documentElement.scrollWidth}getScrollHeight(){return document.documentElement.scrollHeight}getClientHeight(){return document.documentElement.clientHeight}getClientWidth(){return document.documentElement.clientWidth}}class kt extends ce{constructor(){super(...arguments),this.uid=_t()}prepareHits(){}queryHit(e,n,r,i){return null}isValidSegDownEl(e){return!this.props.eventDrag&&!this.props.eventResize&&!Ce(e,".fc-event-mirror")}isValidDateDownEl(e){return!Ce(e,".fc-event:not(.fc-bg-event)")&&!Ce(e,".fc-more-link")&&!Ce(e,"a[data-navlink]")&&!Ce(e,".fc-popover")}}class u2{constructor(e=n=>n.thickness||1){this.getEntryThickness=e,this.strictOrder=!1,this.allowReslicing=!1,this.maxCoord=-1,this.maxStackCnt=-1,this.levelCoords=[],this.entriesByLevel=[],this.stackCnts={}}addSegs(e){let n=[];for(let r of e)this.insertEntry(r,n);return n}insertEntry(e,n){let r=this.findInsertion(e);this.isInsertionValid(r,e)?this.insertEntryAt(e,r):this.handleInvalidInsertion(r,e,n)}isInsertionValid(e,n){return(this.maxCoord===-1||e.levelCoord+this.getEntryThickness(n)<=this.maxCoord)&&(this.maxStackCnt===-1||e.stackCnt<this.maxStackCnt)}handleInvalidInsertion(e,n,r){if(this.allowReslicing&&e.touchingEntry){const i=Object.assign(Object.assign({},n),{span:Sc(n.span,e.touchingEntry.span)});r.push(i),this.splitEntry(n,e.touchingEntry,r)}else r.push(n)}splitEntry(e,n,r){let i=e.span,o=n.span;i.start<o.start&&this.insertEntry({index:e.index,thickness:e.thickness,span:{start:i.start,end:o.start}},r),i.end>o.end&&this.insertEntry({index:e.index,thickness:e.thickness,span:{start:o.end,end:i.end}},r)}insertEntryAt(e,n){let{entriesByLevel:r,levelCoords:i}=this;n.lateral===-1?(ii(i,n.level,n.levelCoord),ii(r,n.level,[e])):ii(r[n.level],n.lateral,e),this.stackCnts[an(e)]=n.stackCnt}findInsertion(e){let{levelCoords:n,entriesByLevel:r,strictOrder:i,stackCnts:o}=this,a=n.length,l=0,u=-1,h=-1,f=null,v=0;for(let E=0;E<a;E+=1){const R=n[E];if(!i&&R>=l+this.getEntryThickness(e))break;let x=r[E],k,B=ua(x,e.span.start,ca),P=B[0]+B[1];for(;(k=x[P])&&k.span.start<e.span.end;){let $=R+this.getEntryThickness(k);$>l&&(l=$,f=k,u=E,h=P),$===l&&(v=Math.max(v,o[an(k)]+1)),P+=1}}let p=0;if(f)for(p=u+1;p<a&&n[p]<l;)p+=1;let m=-1;return p<a&&n[p]===l&&(m=ua(r[p],e.span.end,ca)[0]),{touchingLevel:u,touchingLateral:h,touchingEntry:f,stackCnt:v,levelCoord:l,level:p,lateral:m}}toRects(){let{entriesByLevel:e,levelCoords:n}=this,r=e.length,i=[];for(let o=0;o<r;o+=1){let a=e[o],l=n[o];for(let u of a)i.push(Object.assign(Object.assign({},u),{thickness:this.getEntryThickness(u),levelCoord:l}))}return i}}function ca(t){return t.span.end}function an(t){return t.index+":"+t.span.start}function Sc(t,e){let n=Math.max(t.start,e.start),r=Math.min(t.end,e.end);return n<r?{start:n,end:r}:null}function ii(t,e,n){t.splice(e,0,n)}function ua(t,e,n){let r=0,i=t.length;if(!i||e<n(t[r]))return[0,0];if(e>n(t[i-1]))return[i,0];for(;r<i;){let o=Math.floor(r+(i-r)/2),a=n(t[o]);if(e<a)i=o;else if(e>a)r=o+1;else return[o,1]}return[r,0]}class d2{constructor(e,n){this.emitter=new Tr}destroy(){}setMirrorIsVisible(e){}setMirrorNeedsRevert(e){}setAutoScrollEnabled(e){}}const lo={};function f2(t,e){return!t||e>10?we({weekday:"short"}):e>1?we({weekday:"short",month:"numeric",day:"numeric",omitCommas:!0}):we({weekday:"long"})}const Dc="fc-col-header-cell";function _c(t){return t.text}class h2 extends ce{render(){let{dateEnv:e,options:n,theme:r,viewApi:i}=this.context,{props:o}=this,{date:a,dateProfile:l}=o,u=Ec(a,o.todayRange,null,l),h=[Dc].concat(oo(u,r)),f=e.format(a,o.dayHeaderFormat),v=!u.isDisabled&&o.colCnt>1?Ei(this.context,a):{},p=e.toDate(a);e.namedTimeZoneImpl&&(p=ut(p,36e5));let m=Object.assign(Object.assign(Object.assign({date:p,view:i},o.extraRenderProps),{text:f}),u);return D(Ke,{elTag:"th",elClasses:h,elAttrs:Object.assign({role:"columnheader",colSpan:o.colSpan,"data-date":u.isDisabled?void 0:$i(a)},o.extraDataAttrs),renderProps:m,generatorName:"dayHeaderContent",customGenerator:n.dayHeaderContent,defaultGenerator:_c,classNameGenerator:n.dayHeaderClassNames,didMount:n.dayHeaderDidMount,willUnmount:n.dayHeaderWillUnmount},E=>D("div",{className:"fc-scrollgrid-sync-inner"},!u.isDisabled&&D(E,{elTag:"a",elAttrs:v,elClasses:["fc-col-header-cell-cushion",o.isSticky&&"fc-sticky"]})))}}const g2=we({weekday:"long"});class p2 extends ce{render(){let{props:e}=this,{dateEnv:n,theme:r,viewApi:i,options:o}=this.context,a=be(new Date(2592e5),e.dow),l={dow:e.dow,isDisabled:!1,isFuture:!1,isPast:!1,isToday:!1,isOther:!1},u=n.format(a,e.dayHeaderFormat),h=Object.assign(Object.assign(Object.assign(Object.assign({date:a},l),{view:i}),e.extraRenderProps),{text:u});return D(Ke,{elTag:"th",elClasses:[Dc,...oo(l,r),...e.extraClassNames||[]],elAttrs:Object.assign({role:"columnheader",colSpan:e.colSpan},e.extraDataAttrs),renderProps:h,generatorName:"dayHeaderContent",customGenerator:o.dayHeaderContent,defaultGenerator:_c,classNameGenerator:o.dayHeaderClassNames,didMount:o.dayHeaderDidMount,willUnmount:o.dayHeaderWillUnmount},f=>D("div",{className:"fc-scrollgrid-sync-inner"},D(f,{elTag:"a",elClasses:["fc-col-header-cell-cushion",e.isSticky&&"fc-sticky"],elAttrs:{"aria-label":n.format(a,g2)}})))}}class m2 extends ce{constructor(){super(...arguments),this.createDayHeaderFormatter=K(v2)}render(){let{context:e}=this,{dates:n,dateProfile:r,datesRepDistinctDays:i,renderIntro:o}=this.props,a=this.createDayHeaderFormatter(e.options.dayHeaderFormat,i,n.length);return D(xr,{unit:"day"},(l,u)=>D("tr",{role:"row"},o&&o("day"),n.map(h=>i?D(h2,{key:h.toISOString(),date:h,dateProfile:r,todayRange:u,colCnt:n.length,dayHeaderFormat:a}):D(p2,{key:h.getUTCDay(),dow:h.getUTCDay(),dayHeaderFormat:a}))))}}function v2(t,e,n){return t||f2(e,n)}class w2{constructor(e,n){let r=e.start,{end:i}=e,o=[],a=[],l=-1;for(;r<i;)n.isHiddenDay(r)?o.push(l+.5):(l+=1,o.push(l),a.push(r)),r=be(r,1);this.dates=a,this.indices=o,this.cnt=a.length}sliceRange(e){let n=this.getDateDayIndex(e.start),r=this.getDateDayIndex(be(e.end,-1)),i=Math.max(0,n),o=Math.min(this.cnt-1,r);return i=Math.ceil(i),o=Math.floor(o),i<=o?{firstIndex:i,lastIndex:o,isStart:n===i,isEnd:r===o}:null}getDateDayIndex(e){let{indices:n}=this,r=Math.floor(Yt(this.dates[0],e));return r<0?n[0]-1:r>=n.length?n[n.length-1]+1:n[r]}}class b2{constructor(e,n){let{dates:r}=e,i,o,a;if(n){for(o=r[0].getUTCDay(),i=1;i<r.length&&r[i].getUTCDay()!==o;i+=1);a=Math.ceil(r.length/i)}else a=1,i=r.length;this.rowCnt=a,this.colCnt=i,this.daySeries=e,this.cells=this.buildCells(),this.headerDates=this.buildHeaderDates()}buildCells(){let e=[];for(let n=0;n<this.rowCnt;n+=1){let r=[];for(let i=0;i<this.colCnt;i+=1)r.push(this.buildCell(n,i));e.push(r)}return e}buildCell(e,n){let r=this.daySeries.dates[e*this.colCnt+n];return{key:r.toISOString(),date:r}}buildHeaderDates(){let e=[];for(let n=0;n<this.colCnt;n+=1)e.push(this.cells[0][n].date);return e}sliceRange(e){let{colCnt:n}=this,r=this.daySeries.sliceRange(e),i=[];if(r){let{firstIndex:o,lastIndex:a}=r,l=o;for(;l<=a;){let u=Math.floor(l/n),h=Math.min((u+1)*n,a+1);i.push({row:u,firstCol:l%n,lastCol:(h-1)%n,isStart:r.isStart&&l===o,isEnd:r.isEnd&&h-1===a}),l=h}}return i}}class y2{constructor(){this.sliceBusinessHours=K(this._sliceBusinessHours),this.sliceDateSelection=K(this._sliceDateSpan),this.sliceEventStore=K(this._sliceEventStore),this.sliceEventDrag=K(this._sliceInteraction),this.sliceEventResize=K(this._sliceInteraction),this.forceDayIfListItem=!1}sliceProps(e,n,r,i,...o){let{eventUiBases:a}=e,l=this.sliceEventStore(e.eventStore,a,n,r,...o);return{dateSelectionSegs:this.sliceDateSelection(e.dateSelection,n,r,a,i,...o),businessHourSegs:this.sliceBusinessHours(e.businessHours,n,r,i,...o),fgEventSegs:l.fg,bgEventSegs:l.bg,eventDrag:this.sliceEventDrag(e.eventDrag,a,n,r,...o),eventResize:this.sliceEventResize(e.eventResize,a,n,r,...o),eventSelection:e.eventSelection}}sliceNowDate(e,n,r,i,...o){return this._sliceDateSpan({range:{start:e,end:ut(e,1)},allDay:!1},n,r,{},i,...o)}_sliceBusinessHours(e,n,r,i,...o){return e?this._sliceEventStore(Ct(e,Hn(n,!!r),i),{},n,r,...o).bg:[]}_sliceEventStore(e,n,r,i,...o){if(e){let a=sa(e,n,Hn(r,!!i),i);return{bg:this.sliceEventRanges(a.bg,o),fg:this.sliceEventRanges(a.fg,o)}}return{bg:[],fg:[]}}_sliceInteraction(e,n,r,i,...o){if(!e)return null;let a=sa(e.mutatedEvents,n,Hn(r,!!i),i);return{segs:this.sliceEventRanges(a.fg,o),affectedInstances:e.affectedEvents.instances,isEvent:e.isEvent}}_sliceDateSpan(e,n,r,i,o,...a){if(!e)return[];let l=Hn(n,!!r),u=Vt(e.range,l);if(u){e=Object.assign(Object.assign({},e),{range:u});let h=Um(e,i,o),f=this.sliceRange(e.range,...a);for(let v of f)v.eventRange=h;return f}return[]}sliceEventRanges(e,n){let r=[];for(let i of e)r.push(...this.sliceEventRange(i,n));return r}sliceEventRange(e,n){let r=e.range;this.forceDayIfListItem&&e.ui.display==="list-item"&&(r={start:r.start,end:be(r.start,1)});let i=this.sliceRange(r,...n);for(let o of i)o.eventRange=e,o.isStart=e.isStart&&o.isStart,o.isEnd=e.isEnd&&o.isEnd;return i}}function Hn(t,e){let n=t.activeRange;return e?n:{start:ut(n.start,t.slotMinTime.milliseconds),end:ut(n.end,t.slotMaxTime.milliseconds-864e5)}}function Tc(t,e,n){let{instances:r}=t.mutatedEvents;for(let i in r)if(!Dr(e.validRange,r[i].range))return!1;return xc({eventDrag:t},n)}function E2(t,e,n){return Dr(e.validRange,t.range)?xc({dateSelection:t},n):!1}function xc(t,e){let n=e.getCurrentData(),r=Object.assign({businessHours:n.businessHours,dateSelection:"",eventStore:n.eventStore,eventUiBases:n.eventUiBases,eventSelection:"",eventDrag:null,eventResize:null},t);return(e.pluginHooks.isPropsValid||A2)(r,e)}function A2(t,e,n={},r){return!(t.eventDrag&&!C2(t,e,n,r)||t.dateSelection&&!S2(t,e,n,r))}function C2(t,e,n,r){let i=e.getCurrentData(),o=t.eventDrag,a=o.mutatedEvents,l=a.defs,u=a.instances,h=hr(l,o.isEvent?t.eventUiBases:{"":i.selectionConfig});r&&(h=Tt(h,r));let f=wm(t.eventStore,o.affectedEvents.instances),v=f.defs,p=f.instances,m=hr(v,t.eventUiBases);for(let E in u){let R=u[E],x=R.range,k=h[R.defId],B=l[R.defId];if(!Rc(k.constraints,x,f,t.businessHours,e))return!1;let{eventOverlap:P}=e.options,$=typeof P=="function"?P:null;for(let se in p){let Z=p[se];if(Xi(x,Z.range)&&(m[Z.defId].overlap===!1&&o.isEvent||k.overlap===!1||$&&!$(new le(e,v[Z.defId],Z),new le(e,B,R))))return!1}let pe=i.eventStore;for(let se of k.allows){let Z=Object.assign(Object.assign({},n),{range:R.range,allDay:B.allDay}),W=pe.defs[B.defId],Ae=pe.instances[E],A;if(W?A=new le(e,W,Ae):A=new le(e,B),!se(no(Z,e),A))return!1}}return!0}function S2(t,e,n,r){let i=t.eventStore,o=i.defs,a=i.instances,l=t.dateSelection,u=l.range,{selectionConfig:h}=e.getCurrentData();if(r&&(h=r(h)),!Rc(h.constraints,u,i,t.businessHours,e))return!1;let{selectOverlap:f}=e.options,v=typeof f=="function"?f:null;for(let p in a){let m=a[p];if(Xi(u,m.range)&&(h.overlap===!1||v&&!v(new le(e,o[m.defId],m),null)))return!1}for(let p of h.allows){let m=Object.assign(Object.assign({},n),l);if(!p(no(m,e),null))return!1}return!0}function Rc(t,e,n,r,i){for(let o of t)if(!_2(D2(o,e,n,r,i),e))return!1;return!0}function D2(t,e,n,r,i){return t==="businessHours"?oi(Ct(r,e,i)):typeof t=="string"?oi(_r(n,o=>o.groupId===t)):typeof t=="object"&&t?oi(Ct(t,e,i)):[]}function oi(t){let{instances:e}=t,n=[];for(let r in e)n.push(e[r].range);return n}function _2(t,e){for(let n of t)if(Dr(n,e))return!0;return!1}const jn=/^(visible|hidden)$/;class T2 extends ce{constructor(){super(...arguments),this.handleEl=e=>{this.el=e,Qe(this.props.elRef,e)}}render(){let{props:e}=this,{liquid:n,liquidIsAbsolute:r}=e,i=n&&r,o=["fc-scroller"];return n&&(r?o.push("fc-scroller-liquid-absolute"):o.push("fc-scroller-liquid")),D("div",{ref:this.handleEl,className:o.join(" "),style:{overflowX:e.overflowX,overflowY:e.overflowY,left:i&&-(e.overcomeLeft||0)||"",right:i&&-(e.overcomeRight||0)||"",bottom:i&&-(e.overcomeBottom||0)||"",marginLeft:!i&&-(e.overcomeLeft||0)||"",marginRight:!i&&-(e.overcomeRight||0)||"",marginBottom:!i&&-(e.overcomeBottom||0)||"",maxHeight:e.maxHeight||""}},e.children)}needsXScrolling(){if(jn.test(this.props.overflowX))return!1;let{el:e}=this,n=this.el.getBoundingClientRect().width-this.getYScrollbarWidth(),{children:r}=e;for(let i=0;i<r.length;i+=1)if(r[i].getBoundingClientRect().width>n)return!0;return!1}needsYScrolling(){if(jn.test(this.props.overflowY))return!1;let{el:e}=this,n=this.el.getBoundingClientRect().height-this.getXScrollbarWidth(),{children:r}=e;for(let i=0;i<r.length;i+=1)if(r[i].getBoundingClientRect().height>n)return!0;return!1}getXScrollbarWidth(){return jn.test(this.props.overflowX)?0:this.el.offsetHeight-this.el.clientHeight}getYScrollbarWidth(){return jn.test(this.props.overflowY)?0:this.el.offsetWidth-this.el.clientWidth}}class wt{constructor(e){this.masterCallback=e,this.currentMap={},this.depths={},this.callbackMap={},this.handleValue=(n,r)=>{let{depths:i,currentMap:o}=this,a=!1,l=!1;n!==null?(a=r in o,o[r]=n,i[r]=(i[r]||0)+1,l=!0):(i[r]-=1,i[r]||(delete o[r],delete this.callbackMap[r],a=!0)),this.masterCallback&&(a&&this.masterCallback(null,String(r)),l&&this.masterCallback(n,String(r)))}}createRef(e){let n=this.callbackMap[e];return n||(n=this.callbackMap[e]=r=>{this.handleValue(r,String(e))}),n}collect(e,n,r){return Np(this.currentMap,e,n,r)}getAll(){return Qi(this.currentMap)}}function x2(t){let e=Pg(t,".fc-scrollgrid-shrink"),n=0;for(let r of e)n=Math.max(n,Qg(r));return Math.ceil(n)}function kc(t,e){return t.liquid&&e.liquid}function R2(t,e){return e.maxHeight!=null||kc(t,e)}function k2(t,e,n,r){let{expandRows:i}=n;return typeof e.content=="function"?e.content(n):D("table",{role:"presentation",className:[e.tableClassName,t.syncRowHeights?"fc-scrollgrid-sync-table":""].join(" "),style:{minWidth:n.tableMinWidth,width:n.clientWidth,height:i?n.clientHeight:""}},n.tableColGroupNode,D(r?"thead":"tbody",{role:"presentation"},typeof e.rowContent=="function"?e.rowContent(n):e.rowContent))}function I2(t,e){return ct(t,e,ze)}function M2(t,e){let n=[];for(let r of t){let i=r.span||1;for(let o=0;o<i;o+=1)n.push(D("col",{style:{width:r.width==="shrink"?O2(e):r.width||"",minWidth:r.minWidth||""}}))}return D("colgroup",{},...n)}function O2(t){return t??4}function B2(t){for(let e of t)if(e.width==="shrink")return!0;return!1}function P2(t,e){let n=["fc-scrollgrid",e.theme.getClass("table")];return t&&n.push("fc-scrollgrid-liquid"),n}function N2(t,e){let n=["fc-scrollgrid-section",`fc-scrollgrid-section-${t.type}`,t.className];return e&&t.liquid&&t.maxHeight==null&&n.push("fc-scrollgrid-section-liquid"),t.isSticky&&n.push("fc-scrollgrid-section-sticky"),n}function L2(t){return D("div",{className:"fc-scrollgrid-sticky-shim",style:{width:t.clientWidth,minWidth:t.tableMinWidth}})}function da(t){let{stickyHeaderDates:e}=t;return(e==null||e==="auto")&&(e=t.height==="auto"||t.viewHeight==="auto"),e}function H2(t){let{stickyFooterScrollbar:e}=t;return(e==null||e==="auto")&&(e=t.height==="auto"||t.viewHeight==="auto"),e}class Ic extends ce{constructor(){super(...arguments),this.processCols=K(e=>e,I2),this.renderMicroColGroup=K(M2),this.scrollerRefs=new wt,this.scrollerElRefs=new wt(this._handleScrollerEl.bind(this)),this.state={shrinkWidth:null,forceYScrollbars:!1,scrollerClientWidths:{},scrollerClientHeights:{}},this.handleSizing=()=>{this.safeSetState(Object.assign({shrinkWidth:this.computeShrinkWidth()},this.computeScrollerDims()))}}render(){let{props:e,state:n,context:r}=this,i=e.sections||[],o=this.processCols(e.cols),a=this.renderMicroColGroup(o,n.shrinkWidth),l=P2(e.liquid,r);e.collapsibleWidth&&l.push("fc-scrollgrid-collapsible");let u=i.length,h=0,f,v=[],p=[],m=[];for(;h<u&&(f=i[h]).type==="header";)v.push(this.renderSection(f,a,!0)),h+=1;for(;h<u&&(f=i[h]).type==="body";)p.push(this.renderSection(f,a,!1)),h+=1;for(;h<u&&(f=i[h]).type==="footer";)m.push(this.renderSection(f,a,!0)),h+=1;let E=!bc();const R={role:"rowgroup"};return D("table",{role:"grid",className:l.join(" "),style:{height:e.height}},!!(!E&&v.length)&&D("thead",R,...v),!!(!E&&p.length)&&D("tbody",R,...p),!!(!E&&m.length)&&D("tfoot",R,...m),E&&D("tbody",R,...v,...p,...m))}renderSection(e,n,r){return"outerContent"in e?D(fe,{key:e.key},e.outerContent):D("tr",{key:e.key,role:"presentation",className:N2(e,this.props.liquid).join(" ")},this.renderChunkTd(e,n,e.chunk,r))}renderChunkTd(e,n,r,i){if("outerContent"in r)return r.outerContent;let{props:o}=this,{forceYScrollbars:a,scrollerClientWidths:l,scrollerClientHeights:u}=this.state,h=R2(o,e),f=kc(o,e),v=o.liquid?a?"scroll":h?"auto":"hidden":"visible",p=e.key,m=k2(e,r,{tableColGroupNode:n,tableMinWidth:"",clientWidth:!o.collapsibleWidth&&l[p]!==void 0?l[p]:null,clientHeight:u[p]!==void 0?u[p]:null,expandRows:e.expandRows,syncRowHeights:!1,rowSyncHeights:[],reportRowHeightChange:()=>{}},i);return D(i?"th":"td",{ref:r.elRef,role:"presentation"},D("div",{className:`fc-scroller-harness${f?" fc-scroller-harness-liquid":""}`},D(T2,{ref:this.scrollerRefs.createRef(p),elRef:this.scrollerElRefs.createRef(p),overflowY:v,overflowX:o.liquid?"hidden":"visible",maxHeight:e.maxHeight,liquid:f,liquidIsAbsolute:!0},m)))}_handleScrollerEl(e,n){let r=j2(this.props.sections,n);r&&Qe(r.chunk.scrollerElRef,e)}componentDidMount(){this.handleSizing(),this.context.addResizeHandler(this.handleSizing)}componentDidUpdate(){this.handleSizing()}componentWillUnmount(){this.context.removeResizeHandler(this.handleSizing)}computeShrinkWidth(){return B2(this.props.cols)?x2(this.scrollerElRefs.getAll()):0}computeScrollerDims(){let e=r2(),{scrollerRefs:n,scrollerElRefs:r}=this,i=!1,o={},a={};for(let l in n.currentMap){let u=n.currentMap[l];if(u&&u.needsYScrolling()){i=!0;break}}for(let l of this.props.sections){let u=l.key,h=r.currentMap[u];if(h){let f=h.parentNode;o[u]=Math.floor(f.getBoundingClientRect().width-(i?e.y:0)),a[u]=Math.floor(f.getBoundingClientRect().height)}}return{forceYScrollbars:i,scrollerClientWidths:o,scrollerClientHeights:a}}}Ic.addStateEquality({scrollerClientWidths:ze,scrollerClientHeights:ze});function j2(t,e){for(let n of t)if(n.key===e)return n;return null}class co extends ce{constructor(){super(...arguments),this.buildPublicEvent=K((e,n,r)=>new le(e,n,r)),this.handleEl=e=>{this.el=e,Qe(this.props.elRef,e),e&&aa(e,this.props.seg)}}render(){const{props:e,context:n}=this,{options:r}=n,{seg:i}=e,{eventRange:o}=i,{ui:a}=o,l={event:this.buildPublicEvent(n,o.def,o.instance),view:n.viewApi,timeText:e.timeText,textColor:a.textColor,backgroundColor:a.backgroundColor,borderColor:a.borderColor,isDraggable:!e.disableDragging&&km(i,n),isStartResizable:!e.disableResizing&&Im(i,n),isEndResizable:!e.disableResizing&&Mm(i),isMirror:!!(e.isDragging||e.isResizing||e.isDateSelecting),isStart:!!i.isStart,isEnd:!!i.isEnd,isPast:!!e.isPast,isFuture:!!e.isFuture,isToday:!!e.isToday,isSelected:!!e.isSelected,isDragging:!!e.isDragging,isResizing:!!e.isResizing};return D(Ke,{elRef:this.handleEl,elTag:e.elTag,elAttrs:e.elAttrs,elClasses:[...Om(l),...i.eventRange.ui.classNames,...e.elClasses||[]],elStyle:e.elStyle,renderProps:l,generatorName:"eventContent",customGenerator:r.eventContent,defaultGenerator:e.defaultGenerator,classNameGenerator:r.eventClassNames,didMount:r.eventDidMount,willUnmount:r.eventWillUnmount},e.children)}componentDidUpdate(e){this.el&&this.props.seg!==e.seg&&aa(this.el,this.props.seg)}}class Mc extends ce{render(){let{props:e,context:n}=this,{options:r}=n,{seg:i}=e,{ui:o}=i.eventRange,a=r.eventTimeFormat||e.defaultTimeFormat,l=pc(i,a,n,e.defaultDisplayEventTime,e.defaultDisplayEventEnd);return D(co,Object.assign({},e,{elTag:"a",elStyle:{borderColor:o.borderColor,backgroundColor:o.backgroundColor},elAttrs:mc(i,n),defaultGenerator:F2,timeText:l}),(u,h)=>D(fe,null,D(u,{elTag:"div",elClasses:["fc-event-main"],elStyle:{color:h.textColor}}),!!h.isStartResizable&&D("div",{className:"fc-event-resizer fc-event-resizer-start"}),!!h.isEndResizable&&D("div",{className:"fc-event-resizer fc-event-resizer-end"})))}}Mc.addPropsEquality({seg:ze});function F2(t){return D("div",{className:"fc-event-main-frame"},t.timeText&&D("div",{className:"fc-event-time"},t.timeText),D("div",{className:"fc-event-title-container"},D("div",{className:"fc-event-title fc-sticky"},t.event.title||D(fe,null," "))))}const U2=we({day:"numeric"});class Oc extends ce{constructor(){super(...arguments),this.refineRenderProps=zn(V2)}render(){let{props:e,context:n}=this,{options:r}=n,i=this.refineRenderProps({date:e.date,dateProfile:e.dateProfile,todayRange:e.todayRange,isMonthStart:e.isMonthStart||!1,showDayNumber:e.showDayNumber,extraRenderProps:e.extraRenderProps,viewApi:n.viewApi,dateEnv:n.dateEnv,monthStartFormat:r.monthStartFormat});return D(Ke,{elRef:e.elRef,elTag:e.elTag,elAttrs:Object.assign(Object.assign({},e.elAttrs),i.isDisabled?{}:{"data-date":$i(e.date)}),elClasses:[...oo(i,n.theme),...e.elClasses||[]],elStyle:e.elStyle,renderProps:i,generatorName:"dayCellContent",customGenerator:r.dayCellContent,defaultGenerator:e.defaultGenerator,classNameGenerator:i.isDisabled?void 0:r.dayCellClassNames,didMount:r.dayCellDidMount,willUnmount:r.dayCellWillUnmount},e.children)}}function Bc(t){return!!(t.dayCellContent||vi("dayCellContent",t))}function V2(t){let{date:e,dateEnv:n,dateProfile:r,isMonthStart:i}=t,o=Ec(e,t.todayRange,null,r),a=t.showDayNumber?n.format(e,i?t.monthStartFormat:U2):"";return Object.assign(Object.assign(Object.assign({date:n.toDate(e),view:t.viewApi},o),{isMonthStart:i,dayNumberText:a}),t.extraRenderProps)}class z2 extends ce{render(){let{props:e}=this,{seg:n}=e;return D(co,{elTag:"div",elClasses:["fc-bg-event"],elStyle:{backgroundColor:n.eventRange.ui.backgroundColor},defaultGenerator:W2,seg:n,timeText:"",isDragging:!1,isResizing:!1,isDateSelecting:!1,isSelected:!1,isPast:e.isPast,isFuture:e.isFuture,isToday:e.isToday,disableDragging:!0,disableResizing:!0})}}function W2(t){let{title:e}=t.event;return e&&D("div",{className:"fc-event-title"},t.event.title)}function $2(t){return D("div",{className:`fc-${t}`})}const G2=t=>D(xt.Consumer,null,e=>{let{dateEnv:n,options:r}=e,{date:i}=t,o=r.weekNumberFormat||t.defaultFormat,a=n.computeWeekNumber(i),l=n.format(i,o),u={num:a,text:l,date:i};return D(Ke,{elRef:t.elRef,elTag:t.elTag,elAttrs:t.elAttrs,elClasses:t.elClasses,elStyle:t.elStyle,renderProps:u,generatorName:"weekNumberContent",customGenerator:r.weekNumberContent,defaultGenerator:q2,classNameGenerator:r.weekNumberClassNames,didMount:r.weekNumberDidMount,willUnmount:r.weekNumberWillUnmount},t.children)});function q2(t){return t.text}const si=10;class Y2 extends ce{constructor(){super(...arguments),this.state={titleId:Cr()},this.handleRootEl=e=>{this.rootEl=e,this.props.elRef&&Qe(this.props.elRef,e)},this.handleDocumentMouseDown=e=>{const n=$l(e);this.rootEl.contains(n)||this.handleCloseClick()},this.handleDocumentKeyDown=e=>{e.key==="Escape"&&this.handleCloseClick()},this.handleCloseClick=()=>{let{onClose:e}=this.props;e&&e()}}render(){let{theme:e,options:n}=this.context,{props:r,state:i}=this,o=["fc-popover",e.getClass("popover")].concat(r.extraClassNames||[]);return Eg(D("div",Object.assign({},r.extraAttrs,{id:r.id,className:o.join(" "),"aria-labelledby":i.titleId,ref:this.handleRootEl}),D("div",{className:"fc-popover-header "+e.getClass("popoverHeader")},D("span",{className:"fc-popover-title",id:i.titleId},r.title),D("span",{className:"fc-popover-close "+e.getIconClass("close"),title:n.closeHint,onClick:this.handleCloseClick})),D("div",{className:"fc-popover-body "+e.getClass("popoverContent")},r.children)),r.parentEl)}componentDidMount(){document.addEventListener("mousedown",this.handleDocumentMouseDown),document.addEventListener("keydown",this.handleDocumentKeyDown),this.updateSize()}componentWillUnmount(){document.removeEventListener("mousedown",this.handleDocumentMouseDown),document.removeEventListener("keydown",this.handleDocumentKeyDown)}updateSize(){let{isRtl:e}=this.context,{alignmentEl:n,alignGridTop:r}=this.props,{rootEl:i}=this,o=a2(n);if(o){let a=i.getBoundingClientRect(),l=r?Ce(n,".fc-scrollgrid").getBoundingClientRect().top:o.top,u=e?o.right-a.width:o.left;l=Math.max(l,si),u=Math.min(u,document.documentElement.clientWidth-si-a.width),u=Math.max(u,si);let h=i.offsetParent.getBoundingClientRect();nn(i,{top:l-h.top,left:u-h.left})}}}class Q2 extends kt{constructor(){super(...arguments),this.handleRootEl=e=>{this.rootEl=e,e?this.context.registerInteractiveComponent(this,{el:e,useEventCenter:!1}):this.context.unregisterInteractiveComponent(this)}}render(){let{options:e,dateEnv:n}=this.context,{props:r}=this,{startDate:i,todayRange:o,dateProfile:a}=r,l=n.format(i,e.dayPopoverFormat);return D(Oc,{elRef:this.handleRootEl,date:i,dateProfile:a,todayRange:o},(u,h,f)=>D(Y2,{elRef:f.ref,id:r.id,title:l,extraClassNames:["fc-more-popover"].concat(f.className||[]),extraAttrs:f,parentEl:r.parentEl,alignmentEl:r.alignmentEl,alignGridTop:r.alignGridTop,onClose:r.onClose},Bc(e)&&D(u,{elTag:"div",elClasses:["fc-more-popover-misc"]}),r.children))}queryHit(e,n,r,i){let{rootEl:o,props:a}=this;return e>=0&&e<r&&n>=0&&n<i?{dateProfile:a.dateProfile,dateSpan:Object.assign({allDay:!a.forceTimed,range:{start:a.startDate,end:a.endDate}},a.extraDateSpan),dayEl:o,rect:{left:0,top:0,right:r,bottom:i},layer:1}:null}}class Z2 extends ce{constructor(){super(...arguments),this.state={isPopoverOpen:!1,popoverId:Cr()},this.handleLinkEl=e=>{this.linkEl=e,this.props.elRef&&Qe(this.props.elRef,e)},this.handleClick=e=>{let{props:n,context:r}=this,{moreLinkClick:i}=r.options,o=fa(n).start;function a(l){let{def:u,instance:h,range:f}=l.eventRange;return{event:new le(r,u,h),start:r.dateEnv.toDate(f.start),end:r.dateEnv.toDate(f.end),isStart:l.isStart,isEnd:l.isEnd}}typeof i=="function"&&(i=i({date:o,allDay:!!n.allDayDate,allSegs:n.allSegs.map(a),hiddenSegs:n.hiddenSegs.map(a),jsEvent:e,view:r.viewApi})),!i||i==="popover"?this.setState({isPopoverOpen:!0}):typeof i=="string"&&r.calendarApi.zoomTo(o,i)},this.handlePopoverClose=()=>{this.setState({isPopoverOpen:!1})}}render(){let{props:e,state:n}=this;return D(xt.Consumer,null,r=>{let{viewApi:i,options:o,calendarApi:a}=r,{moreLinkText:l}=o,{moreCnt:u}=e,h=fa(e),f=typeof l=="function"?l.call(a,u):`+${u} ${l}`,v=rn(o.moreLinkHint,[u],f),p={num:u,shortText:`+${u}`,text:f,view:i};return D(fe,null,!!e.moreCnt&&D(Ke,{elTag:e.elTag||"a",elRef:this.handleLinkEl,elClasses:[...e.elClasses||[],"fc-more-link"],elStyle:e.elStyle,elAttrs:Object.assign(Object.assign(Object.assign({},e.elAttrs),ql(this.handleClick)),{title:v,"aria-expanded":n.isPopoverOpen,"aria-controls":n.isPopoverOpen?n.popoverId:""}),renderProps:p,generatorName:"moreLinkContent",customGenerator:o.moreLinkContent,defaultGenerator:e.defaultGenerator||X2,classNameGenerator:o.moreLinkClassNames,didMount:o.moreLinkDidMount,willUnmount:o.moreLinkWillUnmount},e.children),n.isPopoverOpen&&D(Q2,{id:n.popoverId,startDate:h.start,endDate:h.end,dateProfile:e.dateProfile,todayRange:e.todayRange,extraDateSpan:e.extraDateSpan,parentEl:this.parentEl,alignmentEl:e.alignmentElRef?e.alignmentElRef.current:this.linkEl,alignGridTop:e.alignGridTop,forceTimed:e.forceTimed,onClose:this.handlePopoverClose},e.popoverContent()))})}componentDidMount(){this.updateParentEl()}componentDidUpdate(){this.updateParentEl()}updateParentEl(){this.linkEl&&(this.parentEl=Ce(this.linkEl,".fc-view-harness"))}}function X2(t){return t.text}function fa(t){if(t.allDayDate)return{start:t.allDayDate,end:be(t.allDayDate,1)};let{hiddenSegs:e}=t;return{start:J2(e),end:e1(e)}}function J2(t){return t.reduce(K2).eventRange.range.start}function K2(t,e){return t.eventRange.range.start<e.eventRange.range.start?t:e}function e1(t){return t.reduce(t1).eventRange.range.end}function t1(t,e){return t.eventRange.range.end>e.eventRange.range.end?t:e}const n1=[],Pc={code:"en",week:{dow:0,doy:4},direction:"ltr",buttonText:{prev:"prev",next:"next",prevYear:"prev year",nextYear:"next year",year:"year",today:"today",month:"month",week:"week",day:"day",list:"list"},weekText:"W",weekTextLong:"Week",closeHint:"Close",timeHint:"Time",eventHint:"Event",allDayText:"all-day",moreLinkText:"more",noEventsText:"No events to display"},Nc=Object.assign(Object.assign({},Pc),{buttonHints:{prev:"Previous $0",next:"Next $0",today(t,e){return e==="day"?"Today":`This ${t}`}},viewHint:"$0 view",navLinkHint:"Go to $0",moreLinkHint(t){return`Show ${t} more event${t===1?"":"s"}`}});function r1(t){let e=t.length>0?t[0].code:"en",n=n1.concat(t),r={en:Nc};for(let i of n)r[i.code]=i;return{map:r,defaultCode:e}}function Lc(t,e){return typeof t=="object"&&!Array.isArray(t)?Hc(t.code,[t.code],t):i1(t,e)}function i1(t,e){let n=[].concat(t||[]),r=o1(n,e)||Nc;return Hc(t,n,r)}function o1(t,e){for(let n=0;n<t.length;n+=1){let r=t[n].toLocaleLowerCase().split("-");for(let i=r.length;i>0;i-=1){let o=r.slice(0,i).join("-");if(e[o])return e[o]}}return null}function Hc(t,e,n){let r=Yi([Pc,n],["buttonText"]);delete r.code;let{week:i}=r;return delete r.week,{codeArg:t,codes:e,week:i,simpleNumberFormat:new Intl.NumberFormat(t),options:r}}function dt(t){return{id:_t(),name:t.name,premiumReleaseDate:t.premiumReleaseDate?new Date(t.premiumReleaseDate):void 0,deps:t.deps||[],reducers:t.reducers||[],isLoadingFuncs:t.isLoadingFuncs||[],contextInit:[].concat(t.contextInit||[]),eventRefiners:t.eventRefiners||{},eventDefMemberAdders:t.eventDefMemberAdders||[],eventSourceRefiners:t.eventSourceRefiners||{},isDraggableTransformers:t.isDraggableTransformers||[],eventDragMutationMassagers:t.eventDragMutationMassagers||[],eventDefMutationAppliers:t.eventDefMutationAppliers||[],dateSelectionTransformers:t.dateSelectionTransformers||[],datePointTransforms:t.datePointTransforms||[],dateSpanTransforms:t.dateSpanTransforms||[],views:t.views||{},viewPropsTransformers:t.viewPropsTransformers||[],isPropsValid:t.isPropsValid||null,externalDefTransforms:t.externalDefTransforms||[],viewContainerAppends:t.viewContainerAppends||[],eventDropTransformers:t.eventDropTransformers||[],componentInteractions:t.componentInteractions||[],calendarInteractions:t.calendarInteractions||[],themeClasses:t.themeClasses||{},eventSourceDefs:t.eventSourceDefs||[],cmdFormatter:t.cmdFormatter,recurringTypes:t.recurringTypes||[],namedTimeZonedImpl:t.namedTimeZonedImpl,initialView:t.initialView||"",elementDraggingImpl:t.elementDraggingImpl,optionChangeHandlers:t.optionChangeHandlers||{},scrollGridImpl:t.scrollGridImpl||null,listenerRefiners:t.listenerRefiners||{},optionRefiners:t.optionRefiners||{},propSetHandlers:t.propSetHandlers||{}}}function s1(t,e){let n={},r={premiumReleaseDate:void 0,reducers:[],isLoadingFuncs:[],contextInit:[],eventRefiners:{},eventDefMemberAdders:[],eventSourceRefiners:{},isDraggableTransformers:[],eventDragMutationMassagers:[],eventDefMutationAppliers:[],dateSelectionTransformers:[],datePointTransforms:[],dateSpanTransforms:[],views:{},viewPropsTransformers:[],isPropsValid:null,externalDefTransforms:[],viewContainerAppends:[],eventDropTransformers:[],componentInteractions:[],calendarInteractions:[],themeClasses:{},eventSourceDefs:[],cmdFormatter:null,recurringTypes:[],namedTimeZonedImpl:null,initialView:"",elementDraggingImpl:null,optionChangeHandlers:{},scrollGridImpl:null,listenerRefiners:{},optionRefiners:{},propSetHandlers:{}};function i(o){for(let a of o){const l=a.name,u=n[l];u===void 0?(n[l]=a.id,i(a.deps),r=l1(r,a)):u!==a.id&&console.warn(`Duplicate plugin '${l}'`)}}return t&&i(t),i(e),r}function a1(){let t=[],e=[],n;return(r,i)=>((!n||!ct(r,t)||!ct(i,e))&&(n=s1(r,i)),t=r,e=i,n)}function l1(t,e){return{premiumReleaseDate:c1(t.premiumReleaseDate,e.premiumReleaseDate),reducers:t.reducers.concat(e.reducers),isLoadingFuncs:t.isLoadingFuncs.concat(e.isLoadingFuncs),contextInit:t.contextInit.concat(e.contextInit),eventRefiners:Object.assign(Object.assign({},t.eventRefiners),e.eventRefiners),eventDefMemberAdders:t.eventDefMemberAdders.concat(e.eventDefMemberAdders),eventSourceRefiners:Object.assign(Object.assign({},t.eventSourceRefiners),e.eventSourceRefiners),isDraggableTransformers:t.isDraggableTransformers.concat(e.isDraggableTransformers),eventDragMutationMassagers:t.eventDragMutationMassagers.concat(e.eventDragMutationMassagers),eventDefMutationAppliers:t.eventDefMutationAppliers.concat(e.eventDefMutationAppliers),dateSelectionTransformers:t.dateSelectionTransformers.concat(e.dateSelectionTransformers),datePointTransforms:t.datePointTransforms.concat(e.datePointTransforms),dateSpanTransforms:t.dateSpanTransforms.concat(e.dateSpanTransforms),views:Object.assign(Object.assign({},t.views),e.views),viewPropsTransformers:t.viewPropsTransformers.concat(e.viewPropsTransformers),isPropsValid:e.isPropsValid||t.isPropsValid,externalDefTransforms:t.externalDefTransforms.concat(e.externalDefTransforms),viewContainerAppends:t.viewContainerAppends.concat(e.viewContainerAppends),eventDropTransformers:t.eventDropTransformers.concat(e.eventDropTransformers),calendarInteractions:t.calendarInteractions.concat(e.calendarInteractions),componentInteractions:t.componentInteractions.concat(e.componentInteractions),themeClasses:Object.assign(Object.assign({},t.themeClasses),e.themeClasses),eventSourceDefs:t.eventSourceDefs.concat(e.eventSourceDefs),cmdFormatter:e.cmdFormatter||t.cmdFormatter,recurringTypes:t.recurringTypes.concat(e.recurringTypes),namedTimeZonedImpl:e.namedTimeZonedImpl||t.namedTimeZonedImpl,initialView:t.initialView||e.initialView,elementDraggingImpl:t.elementDraggingImpl||e.elementDraggingImpl,optionChangeHandlers:Object.assign(Object.assign({},t.optionChangeHandlers),e.optionChangeHandlers),scrollGridImpl:e.scrollGridImpl||t.scrollGridImpl,listenerRefiners:Object.assign(Object.assign({},t.listenerRefiners),e.listenerRefiners),optionRefiners:Object.assign(Object.assign({},t.optionRefiners),e.optionRefiners),propSetHandlers:Object.assign(Object.assign({},t.propSetHandlers),e.propSetHandlers)}}function c1(t,e){return t===void 0?e:e===void 0?t:new Date(Math.max(t.valueOf(),e.valueOf()))}class ft extends wn{}ft.prototype.classes={root:"fc-theme-standard",tableCellShaded:"fc-cell-shaded",buttonGroup:"fc-button-group",button:"fc-button fc-button-primary",buttonActive:"fc-button-active"};ft.prototype.baseIconClass="fc-icon";ft.prototype.iconClasses={close:"fc-icon-x",prev:"fc-icon-chevron-left",next:"fc-icon-chevron-right",prevYear:"fc-icon-chevrons-left",nextYear:"fc-icon-chevrons-right"};ft.prototype.rtlIconClasses={prev:"fc-icon-chevron-right",next:"fc-icon-chevron-left",prevYear:"fc-icon-chevrons-right",nextYear:"fc-icon-chevrons-left"};ft.prototype.iconOverrideOption="buttonIcons";ft.prototype.iconOverrideCustomButtonOption="icon";ft.prototype.iconOverridePrefix="fc-icon-";function u1(t,e){let n={},r;for(r in t)Ai(r,n,t,e);for(r in e)Ai(r,n,t,e);return n}function Ai(t,e,n,r){if(e[t])return e[t];let i=d1(t,e,n,r);return i&&(e[t]=i),i}function d1(t,e,n,r){let i=n[t],o=r[t],a=f=>i&&i[f]!==null?i[f]:o&&o[f]!==null?o[f]:null,l=a("component"),u=a("superType"),h=null;if(u){if(u===t)throw new Error("Can't have a custom view type that references itself");h=Ai(u,e,n,r)}return!l&&h&&(l=h.component),l?{type:t,component:l,defaults:Object.assign(Object.assign({},h?h.defaults:{}),i?i.rawOptions:{}),overrides:Object.assign(Object.assign({},h?h.overrides:{}),o?o.rawOptions:{})}:null}function ha(t){return Tt(t,f1)}function f1(t){let e=typeof t=="function"?{component:t}:t,{component:n}=e;return e.content?n=ga(e):n&&!(n.prototype instanceof ce)&&(n=ga(Object.assign(Object.assign({},e),{content:n}))),{superType:e.type,component:n,rawOptions:e}}function ga(t){return e=>D(xt.Consumer,null,n=>D(Ke,{elTag:"div",elClasses:tc(n.viewSpec),renderProps:Object.assign(Object.assign({},e),{nextDayThreshold:n.options.nextDayThreshold}),generatorName:void 0,customGenerator:t.content,classNameGenerator:t.classNames,didMount:t.didMount,willUnmount:t.willUnmount}))}function h1(t,e,n,r){let i=ha(t),o=ha(e.views),a=u1(i,o);return Tt(a,l=>g1(l,o,e,n,r))}function g1(t,e,n,r,i){let o=t.overrides.duration||t.defaults.duration||r.duration||n.duration,a=null,l="",u="",h={};if(o&&(a=p1(o),a)){let p=mi(a);l=p.unit,p.value===1&&(u=l,h=e[l]?e[l].rawOptions:{})}let f=p=>{let m=p.buttonText||{},E=t.defaults.buttonTextKey;return E!=null&&m[E]!=null?m[E]:m[t.type]!=null?m[t.type]:m[u]!=null?m[u]:null},v=p=>{let m=p.buttonHints||{},E=t.defaults.buttonTextKey;return E!=null&&m[E]!=null?m[E]:m[t.type]!=null?m[t.type]:m[u]!=null?m[u]:null};return{type:t.type,component:t.component,duration:a,durationUnit:l,singleUnit:u,optionDefaults:t.defaults,optionOverrides:Object.assign(Object.assign({},h),t.overrides),buttonTextOverride:f(r)||f(n)||t.overrides.buttonText,buttonTextDefault:f(i)||t.defaults.buttonText||f(on)||t.type,buttonTitleOverride:v(r)||v(n)||t.overrides.buttonHint,buttonTitleDefault:v(i)||t.defaults.buttonHint||v(on)}}let pa={};function p1(t){let e=JSON.stringify(t),n=pa[e];return n===void 0&&(n=ee(t),pa[e]=n),n}function m1(t,e){return e.type==="CHANGE_VIEW_TYPE"&&(t=e.viewType),t}function v1(t,e){return e.type==="CHANGE_DATE"?e.dateMarker:t}function w1(t,e,n){let r=t.initialDate;return r!=null?e.createMarker(r):n.getDateMarker()}function b1(t,e){return e.type==="SET_OPTION"?Object.assign(Object.assign({},t),{[e.optionName]:e.rawOptionValue}):t}function y1(t,e,n,r){let i;switch(e.type){case"CHANGE_VIEW_TYPE":return r.build(e.dateMarker||n);case"CHANGE_DATE":return r.build(e.dateMarker);case"PREV":if(i=r.buildPrev(t,n),i.isValid)return i;break;case"NEXT":if(i=r.buildNext(t,n),i.isValid)return i;break}return t}function E1(t,e,n){let r=e?e.activeRange:null;return Fc({},x1(t,n),r,n)}function A1(t,e,n,r){let i=n?n.activeRange:null;switch(e.type){case"ADD_EVENT_SOURCES":return Fc(t,e.sources,i,r);case"REMOVE_EVENT_SOURCE":return S1(t,e.sourceId);case"PREV":case"NEXT":case"CHANGE_DATE":case"CHANGE_VIEW_TYPE":return n?Uc(t,i,r):t;case"FETCH_EVENT_SOURCES":return uo(t,e.sourceIds?Zl(e.sourceIds):Vc(t,r),i,e.isRefetch||!1,r);case"RECEIVE_EVENTS":case"RECEIVE_EVENT_ERROR":return T1(t,e.sourceId,e.fetchId,e.fetchRange);case"REMOVE_ALL_EVENT_SOURCES":return{};default:return t}}function C1(t,e,n){let r=e?e.activeRange:null;return uo(t,Vc(t,n),r,!0,n)}function jc(t){for(let e in t)if(t[e].isFetching)return!0;return!1}function Fc(t,e,n,r){let i={};for(let o of e)i[o.sourceId]=o;return n&&(i=Uc(i,n,r)),Object.assign(Object.assign({},t),i)}function S1(t,e){return At(t,n=>n.sourceId!==e)}function Uc(t,e,n){return uo(t,At(t,r=>D1(r,e,n)),e,!1,n)}function D1(t,e,n){return zc(t,n)?!n.options.lazyFetching||!t.fetchRange||t.isFetching||e.start<t.fetchRange.start||e.end>t.fetchRange.end:!t.latestFetchId}function uo(t,e,n,r,i){let o={};for(let a in t){let l=t[a];e[a]?o[a]=_1(l,n,r,i):o[a]=l}return o}function _1(t,e,n,r){let{options:i,calendarApi:o}=r,a=r.pluginHooks.eventSourceDefs[t.sourceDefId],l=_t();return a.fetch({eventSource:t,range:e,isRefetch:n,context:r},u=>{let{rawEvents:h}=u;i.eventSourceSuccess&&(h=i.eventSourceSuccess.call(o,h,u.response)||h),t.success&&(h=t.success.call(o,h,u.response)||h),r.dispatch({type:"RECEIVE_EVENTS",sourceId:t.sourceId,fetchId:l,fetchRange:e,rawEvents:h})},u=>{let h=!1;i.eventSourceFailure&&(i.eventSourceFailure.call(o,u),h=!0),t.failure&&(t.failure(u),h=!0),h||console.warn(u.message,u),r.dispatch({type:"RECEIVE_EVENT_ERROR",sourceId:t.sourceId,fetchId:l,fetchRange:e,error:u})}),Object.assign(Object.assign({},t),{isFetching:!0,latestFetchId:l})}function T1(t,e,n,r){let i=t[e];return i&&n===i.latestFetchId?Object.assign(Object.assign({},t),{[e]:Object.assign(Object.assign({},i),{isFetching:!1,fetchRange:r})}):t}function Vc(t,e){return At(t,n=>zc(n,e))}function x1(t,e){let n=cc(e),r=[].concat(t.eventSources||[]),i=[];t.initialEvents&&r.unshift(t.initialEvents),t.events&&r.unshift(t.events);for(let o of r){let a=lc(o,e,n);a&&i.push(a)}return i}function zc(t,e){return!e.pluginHooks.eventSourceDefs[t.sourceDefId].ignoreRange}function R1(t,e){switch(e.type){case"UNSELECT_DATES":return null;case"SELECT_DATES":return e.selection;default:return t}}function k1(t,e){switch(e.type){case"UNSELECT_EVENT":return"";case"SELECT_EVENT":return e.eventInstanceId;default:return t}}function I1(t,e){let n;switch(e.type){case"UNSET_EVENT_DRAG":return null;case"SET_EVENT_DRAG":return n=e.state,{affectedEvents:n.affectedEvents,mutatedEvents:n.mutatedEvents,isEvent:n.isEvent};default:return t}}function M1(t,e){let n;switch(e.type){case"UNSET_EVENT_RESIZE":return null;case"SET_EVENT_RESIZE":return n=e.state,{affectedEvents:n.affectedEvents,mutatedEvents:n.mutatedEvents,isEvent:n.isEvent};default:return t}}function O1(t,e,n,r,i){let o=t.headerToolbar?ma(t.headerToolbar,t,e,n,r,i):null,a=t.footerToolbar?ma(t.footerToolbar,t,e,n,r,i):null;return{header:o,footer:a}}function ma(t,e,n,r,i,o){let a={},l=[],u=!1;for(let h in t){let f=t[h],v=B1(f,e,n,r,i,o);a[h]=v.widgets,l.push(...v.viewsWithButtons),u=u||v.hasTitle}return{sectionWidgets:a,viewsWithButtons:l,hasTitle:u}}function B1(t,e,n,r,i,o){let a=e.direction==="rtl",l=e.customButtons||{},u=n.buttonText||{},h=e.buttonText||{},f=n.buttonHints||{},v=e.buttonHints||{},p=t?t.split(" "):[],m=[],E=!1;return{widgets:p.map(x=>x.split(",").map(k=>{if(k==="title")return E=!0,{buttonName:k};let B,P,$,pe,se,Z;if(B=l[k])$=W=>{B.click&&B.click.call(W.target,W,W.target)},(pe=r.getCustomButtonIconClass(B))||(pe=r.getIconClass(k,a))||(se=B.text),Z=B.hint||B.text;else if(P=i[k]){m.push(k),$=()=>{o.changeView(k)},(se=P.buttonTextOverride)||(pe=r.getIconClass(k,a))||(se=P.buttonTextDefault);let W=P.buttonTextOverride||P.buttonTextDefault;Z=rn(P.buttonTitleOverride||P.buttonTitleDefault||e.viewHint,[W,k],W)}else if(o[k])if($=()=>{o[k]()},(se=u[k])||(pe=r.getIconClass(k,a))||(se=h[k]),k==="prevYear"||k==="nextYear"){let W=k==="prevYear"?"prev":"next";Z=rn(f[W]||v[W],[h.year||"year","year"],h[k])}else Z=W=>rn(f[k]||v[k],[h[W]||W,W],h[k]);return{buttonName:k,buttonClick:$,buttonIcon:pe,buttonText:se,buttonHint:Z}})),viewsWithButtons:m,hasTitle:E}}class P1{constructor(e,n,r){this.type=e,this.getCurrentData=n,this.dateEnv=r}get calendar(){return this.getCurrentData().calendarApi}get title(){return this.getCurrentData().viewTitle}get activeStart(){return this.dateEnv.toDate(this.getCurrentData().dateProfile.activeRange.start)}get activeEnd(){return this.dateEnv.toDate(this.getCurrentData().dateProfile.activeRange.end)}get currentStart(){return this.dateEnv.toDate(this.getCurrentData().dateProfile.currentRange.start)}get currentEnd(){return this.dateEnv.toDate(this.getCurrentData().dateProfile.currentRange.end)}getOption(e){return this.getCurrentData().options[e]}}let N1={ignoreRange:!0,parseMeta(t){return Array.isArray(t.events)?t.events:null},fetch(t,e){e({rawEvents:t.eventSource.meta})}};const L1=dt({name:"array-event-source",eventSourceDefs:[N1]});let H1={parseMeta(t){return typeof t.events=="function"?t.events:null},fetch(t,e,n){const{dateEnv:r}=t.context,i=t.eventSource.meta;Vm(i.bind(null,vc(t.range,r)),o=>e({rawEvents:o}),n)}};const j1=dt({name:"func-event-source",eventSourceDefs:[H1]}),F1={method:String,extraParams:S,startParam:String,endParam:String,timeZoneParam:String};let U1={parseMeta(t){return t.url&&(t.format==="json"||!t.format)?{url:t.url,format:"json",method:(t.method||"GET").toUpperCase(),extraParams:t.extraParams,startParam:t.startParam,endParam:t.endParam,timeZoneParam:t.timeZoneParam}:null},fetch(t,e,n){const{meta:r}=t.eventSource,i=z1(r,t.range,t.context);zm(r.method,r.url,i).then(([o,a])=>{e({rawEvents:o,response:a})},n)}};const V1=dt({name:"json-event-source",eventSourceRefiners:F1,eventSourceDefs:[U1]});function z1(t,e,n){let{dateEnv:r,options:i}=n,o,a,l,u,h={};return o=t.startParam,o==null&&(o=i.startParam),a=t.endParam,a==null&&(a=i.endParam),l=t.timeZoneParam,l==null&&(l=i.timeZoneParam),typeof t.extraParams=="function"?u=t.extraParams():u=t.extraParams||{},Object.assign(h,u),h[o]=r.formatIso(e.start),h[a]=r.formatIso(e.end),r.timeZone!=="local"&&(h[l]=r.timeZone),h}const W1={daysOfWeek:S,startTime:ee,endTime:ee,duration:ee,startRecur:S,endRecur:S};let $1={parse(t,e){if(t.daysOfWeek||t.startTime||t.endTime||t.startRecur||t.endRecur){let n={daysOfWeek:t.daysOfWeek||null,startTime:t.startTime||null,endTime:t.endTime||null,startRecur:t.startRecur?e.createMarker(t.startRecur):null,endRecur:t.endRecur?e.createMarker(t.endRecur):null,dateEnv:e},r;return t.duration&&(r=t.duration),!r&&t.startTime&&t.endTime&&(r=Kg(t.endTime,t.startTime)),{allDayGuess:!t.startTime&&!t.endTime,duration:r,typeData:n}}return null},expand(t,e,n){let r=Vt(e,{start:t.startRecur,end:t.endRecur});return r?q1(t.daysOfWeek,t.startTime,t.dateEnv,n,r):[]}};const G1=dt({name:"simple-recurring-event",recurringTypes:[$1],eventRefiners:W1});function q1(t,e,n,r,i){let o=t?Zl(t):null,a=ae(i.start),l=i.end,u=[];for(e&&(e.milliseconds<0?l=be(l,1):e.milliseconds>=1e3*60*60*24&&(a=be(a,-1)));a<l;){let h;(!o||o[a.getUTCDay()])&&(e?h=r.add(a,e):h=a,u.push(r.createMarker(n.toDate(h)))),a=be(a,1)}return u}const Y1=dt({name:"change-handler",optionChangeHandlers:{events(t,e){va([t],e)},eventSources:va}});function va(t,e){let n=Qi(e.getCurrentData().eventSources);if(n.length===1&&t.length===1&&Array.isArray(n[0]._raw)&&Array.isArray(t[0])){e.dispatch({type:"RESET_RAW_EVENTS",sourceId:n[0].sourceId,rawEvents:t[0]});return}let r=[];for(let i of t){let o=!1;for(let a=0;a<n.length;a+=1)if(n[a]._raw===i){n.splice(a,1),o=!0;break}o||r.push(i)}for(let i of n)e.dispatch({type:"REMOVE_EVENT_SOURCE",sourceId:i.sourceId});for(let i of r)e.calendarApi.addEventSource(i)}function Q1(t,e){e.emitter.trigger("datesSet",Object.assign(Object.assign({},vc(t.activeRange,e.dateEnv)),{view:e.viewApi}))}function Z1(t,e){let{emitter:n}=e;n.hasHandlers("eventsSet")&&n.trigger("eventsSet",yt(t,e))}const X1=[L1,j1,V1,G1,Y1,dt({name:"misc",isLoadingFuncs:[t=>jc(t.eventSources)],propSetHandlers:{dateProfile:Q1,eventStore:Z1}})];class J1{constructor(e,n){this.runTaskOption=e,this.drainedOption=n,this.queue=[],this.delayedRunner=new Ui(this.drain.bind(this))}request(e,n){this.queue.push(e),this.delayedRunner.request(n)}pause(e){this.delayedRunner.pause(e)}resume(e,n){this.delayedRunner.resume(e,n)}drain(){let{queue:e}=this;for(;e.length;){let n=[],r;for(;r=e.shift();)this.runTask(r),n.push(r);this.drained(n)}}runTask(e){this.runTaskOption&&this.runTaskOption(e)}drained(e){this.drainedOption&&this.drainedOption(e)}}function K1(t,e,n){let r;return/^(year|month)$/.test(t.currentRangeUnit)?r=t.currentRange:r=t.activeRange,n.formatRange(r.start,r.end,we(e.titleFormat||ev(t)),{isEndExclusive:t.isRangeAllDay,defaultSeparator:e.titleRangeSeparator})}function ev(t){let{currentRangeUnit:e}=t;if(e==="year")return{year:"numeric"};if(e==="month")return{year:"numeric",month:"long"};let n=sr(t.currentRange.start,t.currentRange.end);return n!==null&&n>1?{year:"numeric",month:"short",day:"numeric"}:{year:"numeric",month:"long",day:"numeric"}}class wa{constructor(){this.resetListeners=new Set}handleInput(e,n){const r=this.dateEnv;if(e!==r&&(typeof n=="function"?this.nowFn=n:r||(this.nowAnchorDate=e.toDate(n?e.createMarker(n):e.createNowMarker()),this.nowAnchorQueried=Date.now()),this.dateEnv=e,r))for(const i of this.resetListeners.values())i()}getDateMarker(){return this.nowAnchorDate?this.dateEnv.timestampToMarker(this.nowAnchorDate.valueOf()+(Date.now()-this.nowAnchorQueried)):this.dateEnv.createMarker(this.nowFn())}addResetListener(e){this.resetListeners.add(e)}removeResetListener(e){this.resetListeners.delete(e)}}class tv{constructor(e){this.computeCurrentViewData=K(this._computeCurrentViewData),this.organizeRawLocales=K(r1),this.buildLocale=K(Lc),this.buildPluginHooks=a1(),this.buildDateEnv=K(nv),this.buildTheme=K(rv),this.parseToolbars=K(O1),this.buildViewSpecs=K(h1),this.buildDateProfileGenerator=zn(iv),this.buildViewApi=K(ov),this.buildViewUiProps=zn(lv),this.buildEventUiBySource=K(sv,ze),this.buildEventUiBases=K(av),this.parseContextBusinessHours=zn(cv),this.buildTitle=K(K1),this.nowManager=new wa,this.emitter=new Tr,this.actionRunner=new J1(this._handleAction.bind(this),this.updateData.bind(this)),this.currentCalendarOptionsInput={},this.currentCalendarOptionsRefined={},this.currentViewOptionsInput={},this.currentViewOptionsRefined={},this.currentCalendarOptionsRefiners={},this.optionsForRefining=[],this.optionsForHandling=[],this.getCurrentData=()=>this.data,this.dispatch=p=>{this.actionRunner.request(p)},this.props=e,this.actionRunner.pause(),this.nowManager=new wa;let n={},r=this.computeOptionsData(e.optionOverrides,n,e.calendarApi),i=r.calendarOptions.initialView||r.pluginHooks.initialView,o=this.computeCurrentViewData(i,r,e.optionOverrides,n);e.calendarApi.currentDataManager=this,this.emitter.setThisContext(e.calendarApi),this.emitter.setOptions(o.options);let a={nowManager:this.nowManager,dateEnv:r.dateEnv,options:r.calendarOptions,pluginHooks:r.pluginHooks,calendarApi:e.calendarApi,dispatch:this.dispatch,emitter:this.emitter,getCurrentData:this.getCurrentData},l=w1(r.calendarOptions,r.dateEnv,this.nowManager),u=o.dateProfileGenerator.build(l);lt(u.activeRange,l)||(l=u.currentRange.start);for(let p of r.pluginHooks.contextInit)p(a);let h=E1(r.calendarOptions,u,a),f={dynamicOptionOverrides:n,currentViewType:i,currentDate:l,dateProfile:u,businessHours:this.parseContextBusinessHours(a),eventSources:h,eventUiBases:{},eventStore:Ve(),renderableEventStore:Ve(),dateSelection:null,eventSelection:"",eventDrag:null,eventResize:null,selectionConfig:this.buildViewUiProps(a).selectionConfig},v=Object.assign(Object.assign({},a),f);for(let p of r.pluginHooks.reducers)Object.assign(f,p(null,null,v));ai(f,a)&&this.emitter.trigger("loading",!0),this.state=f,this.updateData(),this.actionRunner.resume()}resetOptions(e,n){let{props:r}=this;n===void 0?r.optionOverrides=e:(r.optionOverrides=Object.assign(Object.assign({},r.optionOverrides||{}),e),this.optionsForRefining.push(...n)),(n===void 0||n.length)&&this.actionRunner.request({type:"NOTHING"})}_handleAction(e){let{props:n,state:r,emitter:i}=this,o=b1(r.dynamicOptionOverrides,e),a=this.computeOptionsData(n.optionOverrides,o,n.calendarApi),l=m1(r.currentViewType,e),u=this.computeCurrentViewData(l,a,n.optionOverrides,o);n.calendarApi.currentDataManager=this,i.setThisContext(n.calendarApi),i.setOptions(u.options);let h={nowManager:this.nowManager,dateEnv:a.dateEnv,options:a.calendarOptions,pluginHooks:a.pluginHooks,calendarApi:n.calendarApi,dispatch:this.dispatch,emitter:i,getCurrentData:this.getCurrentData},{currentDate:f,dateProfile:v}=r;this.data&&this.data.dateProfileGenerator!==u.dateProfileGenerator&&(v=u.dateProfileGenerator.build(f)),f=v1(f,e),v=y1(v,e,f,u.dateProfileGenerator),(e.type==="PREV"||e.type==="NEXT"||!lt(v.currentRange,f))&&(f=v.currentRange.start);let p=A1(r.eventSources,e,v,h),m=gm(r.eventStore,e,p,v,h),R=jc(p)&&!u.options.progressiveEventRendering&&r.renderableEventStore||m,{eventUiSingleBase:x,selectionConfig:k}=this.buildViewUiProps(h),B=this.buildEventUiBySource(p),P=this.buildEventUiBases(R.defs,x,B),$={dynamicOptionOverrides:o,currentViewType:l,currentDate:f,dateProfile:v,eventSources:p,eventStore:m,renderableEventStore:R,selectionConfig:k,eventUiBases:P,businessHours:this.parseContextBusinessHours(h),dateSelection:R1(r.dateSelection,e),eventSelection:k1(r.eventSelection,e),eventDrag:I1(r.eventDrag,e),eventResize:M1(r.eventResize,e)},pe=Object.assign(Object.assign({},h),$);for(let W of a.pluginHooks.reducers)Object.assign($,W(r,e,pe));let se=ai(r,h),Z=ai($,h);!se&&Z?i.trigger("loading",!0):se&&!Z&&i.trigger("loading",!1),this.state=$,n.onAction&&n.onAction(e)}updateData(){let{props:e,state:n}=this,r=this.data,i=this.computeOptionsData(e.optionOverrides,n.dynamicOptionOverrides,e.calendarApi),o=this.computeCurrentViewData(n.currentViewType,i,e.optionOverrides,n.dynamicOptionOverrides),a=this.data=Object.assign(Object.assign(Object.assign({nowManager:this.nowManager,viewTitle:this.buildTitle(n.dateProfile,o.options,i.dateEnv),calendarApi:e.calendarApi,dispatch:this.dispatch,emitter:this.emitter,getCurrentData:this.getCurrentData},i),o),n),l=i.pluginHooks.optionChangeHandlers,u=r&&r.calendarOptions,h=i.calendarOptions;if(u&&u!==h){u.timeZone!==h.timeZone&&(n.eventSources=a.eventSources=C1(a.eventSources,n.dateProfile,a),n.eventStore=a.eventStore=ia(a.eventStore,r.dateEnv,a.dateEnv),n.renderableEventStore=a.renderableEventStore=ia(a.renderableEventStore,r.dateEnv,a.dateEnv));for(let f in l)(this.optionsForHandling.indexOf(f)!==-1||u[f]!==h[f])&&l[f](h[f],a)}this.optionsForHandling=[],e.onData&&e.onData(a)}computeOptionsData(e,n,r){if(!this.optionsForRefining.length&&e===this.stableOptionOverrides&&n===this.stableDynamicOptionOverrides)return this.stableCalendarOptionsData;let{refinedOptions:i,pluginHooks:o,localeDefaults:a,availableLocaleData:l,extra:u}=this.processRawCalendarOptions(e,n);ba(u);let h=this.buildDateEnv(i.timeZone,i.locale,i.weekNumberCalculation,i.firstDay,i.weekText,o,l,i.defaultRangeSeparator),f=this.buildViewSpecs(o.views,this.stableOptionOverrides,this.stableDynamicOptionOverrides,a),v=this.buildTheme(i,o),p=this.parseToolbars(i,this.stableOptionOverrides,v,f,r);return this.stableCalendarOptionsData={calendarOptions:i,pluginHooks:o,dateEnv:h,viewSpecs:f,theme:v,toolbarConfig:p,localeDefaults:a,availableRawLocales:l.map}}processRawCalendarOptions(e,n){let{locales:r,locale:i}=Kr([on,e,n]),o=this.organizeRawLocales(r),a=o.map,l=this.buildLocale(i||o.defaultCode,a).options,u=this.buildPluginHooks(e.plugins||[],X1),h=this.currentCalendarOptionsRefiners=Object.assign(Object.assign(Object.assign(Object.assign(Object.assign({},Xs),Js),Ks),u.listenerRefiners),u.optionRefiners),f={},v=Kr([on,l,e,n]),p={},m=this.currentCalendarOptionsInput,E=this.currentCalendarOptionsRefined,R=!1;for(let x in v)this.optionsForRefining.indexOf(x)===-1&&(v[x]===m[x]||pt[x]&&x in m&&pt[x](m[x],v[x]))?p[x]=E[x]:h[x]?(p[x]=h[x](v[x]),R=!0):f[x]=m[x];return R&&(this.currentCalendarOptionsInput=v,this.currentCalendarOptionsRefined=p,this.stableOptionOverrides=e,this.stableDynamicOptionOverrides=n),this.optionsForHandling.push(...this.optionsForRefining),this.optionsForRefining=[],{rawOptions:this.currentCalendarOptionsInput,refinedOptions:this.currentCalendarOptionsRefined,pluginHooks:u,availableLocaleData:o,localeDefaults:l,extra:f}}_computeCurrentViewData(e,n,r,i){let o=n.viewSpecs[e];if(!o)throw new Error(`viewType "${e}" is not available. Please make sure you've loaded all neccessary plugins`);let{refinedOptions:a,extra:l}=this.processRawViewOptions(o,n.pluginHooks,n.localeDefaults,r,i);ba(l),this.nowManager.handleInput(n.dateEnv,a.now);let u=this.buildDateProfileGenerator({dateProfileGeneratorClass:o.optionDefaults.dateProfileGeneratorClass,nowManager:this.nowManager,duration:o.duration,durationUnit:o.durationUnit,usesMinMaxTime:o.optionDefaults.usesMinMaxTime,dateEnv:n.dateEnv,calendarApi:this.props.calendarApi,slotMinTime:a.slotMinTime,slotMaxTime:a.slotMaxTime,showNonCurrentDates:a.showNonCurrentDates,dayCount:a.dayCount,dateAlignment:a.dateAlignment,dateIncrement:a.dateIncrement,hiddenDays:a.hiddenDays,weekends:a.weekends,validRangeInput:a.validRange,visibleRangeInput:a.visibleRange,fixedWeekCount:a.fixedWeekCount}),h=this.buildViewApi(e,this.getCurrentData,n.dateEnv);return{viewSpec:o,options:a,dateProfileGenerator:u,viewApi:h}}processRawViewOptions(e,n,r,i,o){let a=Kr([on,e.optionDefaults,r,i,e.optionOverrides,o]),l=Object.assign(Object.assign(Object.assign(Object.assign(Object.assign(Object.assign({},Xs),Js),Ks),Ip),n.listenerRefiners),n.optionRefiners),u={},h=this.currentViewOptionsInput,f=this.currentViewOptionsRefined,v=!1,p={};for(let m in a)a[m]===h[m]||pt[m]&&pt[m](a[m],h[m])?u[m]=f[m]:(a[m]===this.currentCalendarOptionsInput[m]||pt[m]&&pt[m](a[m],this.currentCalendarOptionsInput[m])?m in this.currentCalendarOptionsRefined&&(u[m]=this.currentCalendarOptionsRefined[m]):l[m]?u[m]=l[m](a[m]):p[m]=a[m],v=!0);return v&&(this.currentViewOptionsInput=a,this.currentViewOptionsRefined=u),{rawOptions:this.currentViewOptionsInput,refinedOptions:this.currentViewOptionsRefined,extra:p}}}function nv(t,e,n,r,i,o,a,l){let u=Lc(e||a.defaultCode,a.map);return new Vp({calendarSystem:"gregory",timeZone:t,namedTimeZoneImpl:o.namedTimeZonedImpl,locale:u,weekNumberCalculation:n,firstDay:r,weekText:i,cmdFormatter:o.cmdFormatter,defaultSeparator:l})}function rv(t,e){let n=e.themeClasses[t.themeSystem]||ft;return new n(t)}function iv(t){let e=t.dateProfileGeneratorClass||ic;return new e(t)}function ov(t,e,n){return new P1(t,e,n)}function sv(t){return Tt(t,e=>e.ui)}function av(t,e,n){let r={"":e};for(let i in t){let o=t[i];o.sourceId&&n[o.sourceId]&&(r[i]=n[o.sourceId])}return r}function lv(t){let{options:e}=t;return{eventUiSingleBase:fr({display:e.eventDisplay,editable:e.editable,startEditable:e.eventStartEditable,durationEditable:e.eventDurationEditable,constraint:e.eventConstraint,overlap:typeof e.eventOverlap=="boolean"?e.eventOverlap:void 0,allow:e.eventAllow,backgroundColor:e.eventBackgroundColor,borderColor:e.eventBorderColor,textColor:e.eventTextColor,color:e.eventColor},t),selectionConfig:fr({constraint:e.selectConstraint,overlap:typeof e.selectOverlap=="boolean"?e.selectOverlap:void 0,allow:e.selectAllow},t)}}function ai(t,e){for(let n of e.pluginHooks.isLoadingFuncs)if(n(t))return!0;return!1}function cv(t){return Cm(t.options.businessHours,t)}function ba(t,e){for(let n in t)console.warn(`Unknown option '${n}'`)}class uv extends ce{render(){let e=this.props.widgetGroups.map(n=>this.renderWidgetGroup(n));return D("div",{className:"fc-toolbar-chunk"},...e)}renderWidgetGroup(e){let{props:n}=this,{theme:r}=this.context,i=[],o=!0;for(let a of e){let{buttonName:l,buttonClick:u,buttonText:h,buttonIcon:f,buttonHint:v}=a;if(l==="title")o=!1,i.push(D("h2",{className:"fc-toolbar-title",id:n.titleId},n.title));else{let p=l===n.activeButton,m=!n.isTodayEnabled&&l==="today"||!n.isPrevEnabled&&l==="prev"||!n.isNextEnabled&&l==="next",E=[`fc-${l}-button`,r.getClass("button")];p&&E.push(r.getClass("buttonActive")),i.push(D("button",{type:"button",title:typeof v=="function"?v(n.navUnit):v,disabled:m,"aria-pressed":p,className:E.join(" "),onClick:u},h||(f?D("span",{className:f,role:"img"}):"")))}}if(i.length>1){let a=o&&r.getClass("buttonGroup")||"";return D("div",{className:a},...i)}return i[0]}}class ya extends ce{render(){let{model:e,extraClassName:n}=this.props,r=!1,i,o,a=e.sectionWidgets,l=a.center;return a.left?(r=!0,i=a.left):i=a.start,a.right?(r=!0,o=a.right):o=a.end,D("div",{className:[n||"","fc-toolbar",r?"fc-toolbar-ltr":""].join(" ")},this.renderSection("start",i||[]),this.renderSection("center",l||[]),this.renderSection("end",o||[]))}renderSection(e,n){let{props:r}=this;return D(uv,{key:e,widgetGroups:n,title:r.title,navUnit:r.navUnit,activeButton:r.activeButton,isTodayEnabled:r.isTodayEnabled,isPrevEnabled:r.isPrevEnabled,isNextEnabled:r.isNextEnabled,titleId:r.titleId})}}class dv extends ce{constructor(){super(...arguments),this.state={availableWidth:null},this.handleEl=e=>{this.el=e,Qe(this.props.elRef,e),this.updateAvailableWidth()},this.handleResize=()=>{this.updateAvailableWidth()}}render(){let{props:e,state:n}=this,{aspectRatio:r}=e,i=["fc-view-harness",r||e.liquid||e.height?"fc-view-harness-active":"fc-view-harness-passive"],o="",a="";return r?n.availableWidth!==null?o=n.availableWidth/r:a=`${1/r*100}%`:o=e.height||"",D("div",{"aria-labelledby":e.labeledById,ref:this.handleEl,className:i.join(" "),style:{height:o,paddingBottom:a}},e.children)}componentDidMount(){this.context.addResizeHandler(this.handleResize)}componentWillUnmount(){this.context.removeResizeHandler(this.handleResize)}updateAvailableWidth(){this.el&&this.props.aspectRatio&&this.setState({availableWidth:this.el.offsetWidth})}}class fv extends Qt{constructor(e){super(e),this.handleSegClick=(n,r)=>{let{component:i}=this,{context:o}=i,a=zt(r);if(a&&i.isValidSegDownEl(n.target)){let l=Ce(n.target,".fc-event-forced-url"),u=l?l.querySelector("a[href]").href:"";o.emitter.trigger("eventClick",{el:r,event:new le(i.context,a.eventRange.def,a.eventRange.instance),jsEvent:n,view:o.viewApi}),u&&!n.defaultPrevented&&(window.location.href=u)}},this.destroy=Gl(e.el,"click",".fc-event",this.handleSegClick)}}class hv extends Qt{constructor(e){super(e),this.handleEventElRemove=n=>{n===this.currentSegEl&&this.handleSegLeave(null,this.currentSegEl)},this.handleSegEnter=(n,r)=>{zt(r)&&(this.currentSegEl=r,this.triggerEvent("eventMouseEnter",n,r))},this.handleSegLeave=(n,r)=>{this.currentSegEl&&(this.currentSegEl=null,this.triggerEvent("eventMouseLeave",n,r))},this.removeHoverListeners=Hg(e.el,".fc-event",this.handleSegEnter,this.handleSegLeave)}destroy(){this.removeHoverListeners()}triggerEvent(e,n,r){let{component:i}=this,{context:o}=i,a=zt(r);(!n||i.isValidSegDownEl(n.target))&&o.emitter.trigger(e,{el:r,event:new le(o,a.eventRange.def,a.eventRange.instance),jsEvent:n,view:o.viewApi})}}class gv extends Rt{constructor(){super(...arguments),this.buildViewContext=K($p),this.buildViewPropTransformers=K(mv),this.buildToolbarProps=K(pv),this.headerRef=Je(),this.footerRef=Je(),this.interactionsStore={},this.state={viewLabelId:Cr()},this.registerInteractiveComponent=(e,n)=>{let r=Gm(e,n),a=[fv,hv].concat(this.props.pluginHooks.componentInteractions).map(l=>new l(r));this.interactionsStore[e.uid]=a,yi[e.uid]=r},this.unregisterInteractiveComponent=e=>{let n=this.interactionsStore[e.uid];if(n){for(let r of n)r.destroy();delete this.interactionsStore[e.uid]}delete yi[e.uid]},this.resizeRunner=new Ui(()=>{this.props.emitter.trigger("_resize",!0),this.props.emitter.trigger("windowResize",{view:this.props.viewApi})}),this.handleWindowResize=e=>{let{options:n}=this.props;n.handleWindowResize&&e.target===window&&this.resizeRunner.request(n.windowResizeDelay)}}render(){let{props:e}=this,{toolbarConfig:n,options:r}=e,i=!1,o="",a;e.isHeightAuto||e.forPrint?o="":r.height!=null?i=!0:r.contentHeight!=null?o=r.contentHeight:a=Math.max(r.aspectRatio,.5);let l=this.buildViewContext(e.viewSpec,e.viewApi,e.options,e.dateProfileGenerator,e.dateEnv,e.nowManager,e.theme,e.pluginHooks,e.dispatch,e.getCurrentData,e.emitter,e.calendarApi,this.registerInteractiveComponent,this.unregisterInteractiveComponent),u=n.header&&n.header.hasTitle?this.state.viewLabelId:void 0;return D(xt.Provider,{value:l},D(xr,{unit:"day"},h=>{let f=this.buildToolbarProps(e.viewSpec,e.dateProfile,e.dateProfileGenerator,e.currentDate,h,e.viewTitle);return D(fe,null,n.header&&D(ya,Object.assign({ref:this.headerRef,extraClassName:"fc-header-toolbar",model:n.header,titleId:u},f)),D(dv,{liquid:i,height:o,aspectRatio:a,labeledById:u},this.renderView(e),this.buildAppendContent()),n.footer&&D(ya,Object.assign({ref:this.footerRef,extraClassName:"fc-footer-toolbar",model:n.footer,titleId:""},f)))}))}componentDidMount(){let{props:e}=this;this.calendarInteractions=e.pluginHooks.calendarInteractions.map(r=>new r(e)),window.addEventListener("resize",this.handleWindowResize);let{propSetHandlers:n}=e.pluginHooks;for(let r in n)n[r](e[r],e)}componentDidUpdate(e){let{props:n}=this,{propSetHandlers:r}=n.pluginHooks;for(let i in r)n[i]!==e[i]&&r[i](n[i],n)}componentWillUnmount(){window.removeEventListener("resize",this.handleWindowResize),this.resizeRunner.clear();for(let e of this.calendarInteractions)e.destroy();this.props.emitter.trigger("_unmount")}buildAppendContent(){let{props:e}=this,n=e.pluginHooks.viewContainerAppends.map(r=>r(e));return D(fe,{},...n)}renderView(e){let{pluginHooks:n}=e,{viewSpec:r}=e,i={dateProfile:e.dateProfile,businessHours:e.businessHours,eventStore:e.renderableEventStore,eventUiBases:e.eventUiBases,dateSelection:e.dateSelection,eventSelection:e.eventSelection,eventDrag:e.eventDrag,eventResize:e.eventResize,isHeightAuto:e.isHeightAuto,forPrint:e.forPrint},o=this.buildViewPropTransformers(n.viewPropsTransformers);for(let l of o)Object.assign(i,l.transform(i,e));let a=r.component;return D(a,Object.assign({},i))}}function pv(t,e,n,r,i,o){let a=n.build(i,void 0,!1),l=n.buildPrev(e,r,!1),u=n.buildNext(e,r,!1);return{title:o,activeButton:t.type,navUnit:t.singleUnit,isTodayEnabled:a.isValid&&!lt(e.currentRange,i),isPrevEnabled:l.isValid,isNextEnabled:u.isValid}}function mv(t){return t.map(e=>new e)}class vv extends Ym{constructor(e,n={}){super(),this.isRendering=!1,this.isRendered=!1,this.currentClassNames=[],this.customContentRenderId=0,this.handleAction=r=>{switch(r.type){case"SET_EVENT_DRAG":case"SET_EVENT_RESIZE":this.renderRunner.tryDrain()}},this.handleData=r=>{this.currentData=r,this.renderRunner.request(r.calendarOptions.rerenderDelay)},this.handleRenderRequest=()=>{if(this.isRendering){this.isRendered=!0;let{currentData:r}=this;ur(()=>{cn(D($m,{options:r.calendarOptions,theme:r.theme,emitter:r.emitter},(i,o,a,l)=>(this.setClassNames(i),this.setHeight(o),D(ec.Provider,{value:this.customContentRenderId},D(gv,Object.assign({isHeightAuto:a,forPrint:l},r))))),this.el)})}else this.isRendered&&(this.isRendered=!1,cn(null,this.el),this.setClassNames([]),this.setHeight(""))},Rg(e),this.el=e,this.renderRunner=new Ui(this.handleRenderRequest),new tv({optionOverrides:n,calendarApi:this,onAction:this.handleAction,onData:this.handleData})}render(){let e=this.isRendering;e?this.customContentRenderId+=1:this.isRendering=!0,this.renderRunner.request(),e&&this.updateSize()}destroy(){this.isRendering&&(this.isRendering=!1,this.renderRunner.request())}updateSize(){ur(()=>{super.updateSize()})}batchRendering(e){this.renderRunner.pause("batchRendering"),e(),this.renderRunner.resume("batchRendering")}pauseRendering(){this.renderRunner.pause("pauseRendering")}resumeRendering(){this.renderRunner.resume("pauseRendering",!0)}resetOptions(e,n){this.currentDataManager.resetOptions(e,n)}setClassNames(e){if(!ct(e,this.currentClassNames)){let{classList:n}=this.el;for(let r of this.currentClassNames)n.remove(r);for(let r of e)n.add(r);this.currentClassNames=e}}setHeight(e){Wl(this.el,"height",e)}}class wv extends kt{constructor(){super(...arguments),this.headerElRef=Je()}renderSimpleLayout(e,n){let{props:r,context:i}=this,o=[],a=da(i.options);return e&&o.push({type:"header",key:"header",isSticky:a,chunk:{elRef:this.headerElRef,tableClassName:"fc-col-header",rowContent:e}}),o.push({type:"body",key:"body",liquid:!0,chunk:{content:n}}),D(ea,{elClasses:["fc-daygrid"],viewSpec:i.viewSpec},D(Ic,{liquid:!r.isHeightAuto&&!r.forPrint,collapsibleWidth:r.forPrint,cols:[],sections:o}))}renderHScrollLayout(e,n,r,i){let o=this.context.pluginHooks.scrollGridImpl;if(!o)throw new Error("No ScrollGrid implementation");let{props:a,context:l}=this,u=!a.forPrint&&da(l.options),h=!a.forPrint&&H2(l.options),f=[];return e&&f.push({type:"header",key:"header",isSticky:u,chunks:[{key:"main",elRef:this.headerElRef,tableClassName:"fc-col-header",rowContent:e}]}),f.push({type:"body",key:"body",liquid:!0,chunks:[{key:"main",content:n}]}),h&&f.push({type:"footer",key:"footer",isSticky:!0,chunks:[{key:"main",content:L2}]}),D(ea,{elClasses:["fc-daygrid"],viewSpec:l.viewSpec},D(o,{liquid:!a.isHeightAuto&&!a.forPrint,forPrint:a.forPrint,collapsibleWidth:a.forPrint,colGroups:[{cols:[{span:r,minWidth:i}]}],sections:f}))}}function $n(t,e){let n=[];for(let r=0;r<e;r+=1)n[r]=[];for(let r of t)n[r.row].push(r);return n}function Fn(t,e){let n=[];for(let r=0;r<e;r+=1)n[r]=[];for(let r of t)n[r.firstCol].push(r);return n}function Ea(t,e){let n=[];if(t){for(let r=0;r<e;r+=1)n[r]={affectedInstances:t.affectedInstances,isEvent:t.isEvent,segs:[]};for(let r of t.segs)n[r.row].segs.push(r)}else for(let r=0;r<e;r+=1)n[r]=null;return n}const Wc=we({hour:"numeric",minute:"2-digit",omitZeroMinute:!0,meridiem:"narrow"});function $c(t){let{display:e}=t.eventRange.ui;return e==="list-item"||e==="auto"&&!t.eventRange.def.allDay&&t.firstCol===t.lastCol&&t.isStart&&t.isEnd}class Gc extends ce{render(){let{props:e}=this;return D(Mc,Object.assign({},e,{elClasses:["fc-daygrid-event","fc-daygrid-block-event","fc-h-event"],defaultTimeFormat:Wc,defaultDisplayEventEnd:e.defaultDisplayEventEnd,disableResizing:!e.seg.eventRange.def.allDay}))}}class qc extends ce{render(){let{props:e,context:n}=this,{options:r}=n,{seg:i}=e,o=r.eventTimeFormat||Wc,a=pc(i,o,n,!0,e.defaultDisplayEventEnd);return D(co,Object.assign({},e,{elTag:"a",elClasses:["fc-daygrid-event","fc-daygrid-dot-event"],elAttrs:mc(e.seg,n),defaultGenerator:bv,timeText:a,isResizing:!1,isDateSelecting:!1}))}}function bv(t){return D(fe,null,D("div",{className:"fc-daygrid-event-dot",style:{borderColor:t.borderColor||t.backgroundColor}}),t.timeText&&D("div",{className:"fc-event-time"},t.timeText),D("div",{className:"fc-event-title"},t.event.title||D(fe,null," ")))}class yv extends ce{constructor(){super(...arguments),this.compileSegs=K(Ev)}render(){let{props:e}=this,{allSegs:n,invisibleSegs:r}=this.compileSegs(e.singlePlacements);return D(Z2,{elClasses:["fc-daygrid-more-link"],dateProfile:e.dateProfile,todayRange:e.todayRange,allDayDate:e.allDayDate,moreCnt:e.moreCnt,allSegs:n,hiddenSegs:r,alignmentElRef:e.alignmentElRef,alignGridTop:e.alignGridTop,extraDateSpan:e.extraDateSpan,popoverContent:()=>{let i=(e.eventDrag?e.eventDrag.affectedInstances:null)||(e.eventResize?e.eventResize.affectedInstances:null)||{};return D(fe,null,n.map(o=>{let a=o.eventRange.instance.instanceId;return D("div",{className:"fc-daygrid-event-harness",key:a,style:{visibility:i[a]?"hidden":""}},$c(o)?D(qc,Object.assign({seg:o,isDragging:!1,isSelected:a===e.eventSelection,defaultDisplayEventEnd:!1},sn(o,e.todayRange))):D(Gc,Object.assign({seg:o,isDragging:!1,isResizing:!1,isDateSelecting:!1,isSelected:a===e.eventSelection,defaultDisplayEventEnd:!1},sn(o,e.todayRange))))}))}})}}function Ev(t){let e=[],n=[];for(let r of t)e.push(r.seg),r.isVisible||n.push(r.seg);return{allSegs:e,invisibleSegs:n}}const Av=we({week:"narrow"});class Cv extends kt{constructor(){super(...arguments),this.rootElRef=Je(),this.state={dayNumberId:Cr()},this.handleRootEl=e=>{Qe(this.rootElRef,e),Qe(this.props.elRef,e)}}render(){let{context:e,props:n,state:r,rootElRef:i}=this,{options:o,dateEnv:a}=e,{date:l,dateProfile:u}=n;const h=n.showDayNumber&&Dv(l,u.currentRange,a);return D(Oc,{elTag:"td",elRef:this.handleRootEl,elClasses:["fc-daygrid-day",...n.extraClassNames||[]],elAttrs:Object.assign(Object.assign(Object.assign({},n.extraDataAttrs),n.showDayNumber?{"aria-labelledby":r.dayNumberId}:{}),{role:"gridcell"}),defaultGenerator:Sv,date:l,dateProfile:u,todayRange:n.todayRange,showDayNumber:n.showDayNumber,isMonthStart:h,extraRenderProps:n.extraRenderProps},(f,v)=>D("div",{ref:n.innerElRef,className:"fc-daygrid-day-frame fc-scrollgrid-sync-inner",style:{minHeight:n.minHeight}},n.showWeekNumber&&D(G2,{elTag:"a",elClasses:["fc-daygrid-week-number"],elAttrs:Ei(e,l,"week"),date:l,defaultFormat:Av}),!v.isDisabled&&(n.showDayNumber||Bc(o)||n.forceDayTop)?D("div",{className:"fc-daygrid-day-top"},D(f,{elTag:"a",elClasses:["fc-daygrid-day-number",h&&"fc-daygrid-month-start"],elAttrs:Object.assign(Object.assign({},Ei(e,l)),{id:r.dayNumberId})})):n.showDayNumber?D("div",{className:"fc-daygrid-day-top",style:{visibility:"hidden"}},D("a",{className:"fc-daygrid-day-number"}," ")):void 0,D("div",{className:"fc-daygrid-day-events",ref:n.fgContentElRef},n.fgContent,D("div",{className:"fc-daygrid-day-bottom",style:{marginTop:n.moreMarginTop}},D(yv,{allDayDate:l,singlePlacements:n.singlePlacements,moreCnt:n.moreCnt,alignmentElRef:i,alignGridTop:!n.showDayNumber,extraDateSpan:n.extraDateSpan,dateProfile:n.dateProfile,eventSelection:n.eventSelection,eventDrag:n.eventDrag,eventResize:n.eventResize,todayRange:n.todayRange}))),D("div",{className:"fc-daygrid-day-bg"},n.bgContent)))}}function Sv(t){return t.dayNumberText||D(fe,null," ")}function Dv(t,e,n){const{start:r,end:i}=e,o=ut(i,-1),a=n.getYear(r),l=n.getMonth(r),u=n.getYear(o),h=n.getMonth(o);return!(a===u&&l===h)&&(t.valueOf()===r.valueOf()||n.getDay(t)===1&&t.valueOf()<i.valueOf())}function Yc(t){return t.eventRange.instance.instanceId+":"+t.firstCol}function Qc(t){return Yc(t)+":"+t.lastCol}function _v(t,e,n,r,i,o,a){let l=new Rv(k=>{let B=t[k.index].eventRange.instance.instanceId+":"+k.span.start+":"+(k.span.end-1);return i[B]||1});l.allowReslicing=!0,l.strictOrder=r,e===!0||n===!0?(l.maxCoord=o,l.hiddenConsumes=!0):typeof e=="number"?l.maxStackCnt=e:typeof n=="number"&&(l.maxStackCnt=n,l.hiddenConsumes=!0);let u=[],h=[];for(let k=0;k<t.length;k+=1){let B=t[k],P=Qc(B);i[P]!=null?u.push({index:k,span:{start:B.firstCol,end:B.lastCol+1}}):h.push(B)}let f=l.addSegs(u),v=l.toRects(),{singleColPlacements:p,multiColPlacements:m,leftoverMargins:E}=Tv(v,t,a),R=[],x=[];for(let k of h){m[k.firstCol].push({seg:k,isVisible:!1,isAbsolute:!0,absoluteTop:0,marginTop:0});for(let B=k.firstCol;B<=k.lastCol;B+=1)p[B].push({seg:Ht(k,B,B+1,a),isVisible:!1,isAbsolute:!1,absoluteTop:0,marginTop:0})}for(let k=0;k<a.length;k+=1)R.push(0);for(let k of f){let B=t[k.index],P=k.span;m[P.start].push({seg:Ht(B,P.start,P.end,a),isVisible:!1,isAbsolute:!0,absoluteTop:0,marginTop:0});for(let $=P.start;$<P.end;$+=1)R[$]+=1,p[$].push({seg:Ht(B,$,$+1,a),isVisible:!1,isAbsolute:!1,absoluteTop:0,marginTop:0})}for(let k=0;k<a.length;k+=1)x.push(E[k]);return{singleColPlacements:p,multiColPlacements:m,moreCnts:R,moreMarginTops:x}}function Tv(t,e,n){let r=xv(t,n.length),i=[],o=[],a=[];for(let l=0;l<n.length;l+=1){let u=r[l],h=[],f=0,v=0;for(let m of u){let E=e[m.index];h.push({seg:Ht(E,l,l+1,n),isVisible:!0,isAbsolute:!1,absoluteTop:m.levelCoord,marginTop:m.levelCoord-f}),f=m.levelCoord+m.thickness}let p=[];f=0,v=0;for(let m of u){let E=e[m.index],R=m.span.end-m.span.start>1,x=m.span.start===l;v+=m.levelCoord-f,f=m.levelCoord+m.thickness,R?(v+=m.thickness,x&&p.push({seg:Ht(E,m.span.start,m.span.end,n),isVisible:!0,isAbsolute:!0,absoluteTop:m.levelCoord,marginTop:0})):x&&(p.push({seg:Ht(E,m.span.start,m.span.end,n),isVisible:!0,isAbsolute:!1,absoluteTop:m.levelCoord,marginTop:v}),v=0)}i.push(h),o.push(p),a.push(v)}return{singleColPlacements:i,multiColPlacements:o,leftoverMargins:a}}function xv(t,e){let n=[];for(let r=0;r<e;r+=1)n.push([]);for(let r of t)for(let i=r.span.start;i<r.span.end;i+=1)n[i].push(r);return n}function Ht(t,e,n,r){if(t.firstCol===e&&t.lastCol===n-1)return t;let i=t.eventRange,o=i.range,a=Vt(o,{start:r[e].date,end:be(r[n-1].date,1)});return Object.assign(Object.assign({},t),{firstCol:e,lastCol:n-1,eventRange:{def:i.def,ui:Object.assign(Object.assign({},i.ui),{durationEditable:!1}),instance:i.instance,range:a},isStart:t.isStart&&a.start.valueOf()===o.start.valueOf(),isEnd:t.isEnd&&a.end.valueOf()===o.end.valueOf()})}class Rv extends u2{constructor(){super(...arguments),this.hiddenConsumes=!1,this.forceHidden={}}addSegs(e){const n=super.addSegs(e),{entriesByLevel:r}=this,i=o=>!this.forceHidden[an(o)];for(let o=0;o<r.length;o+=1)r[o]=r[o].filter(i);return n}handleInvalidInsertion(e,n,r){const{entriesByLevel:i,forceHidden:o}=this,{touchingEntry:a,touchingLevel:l,touchingLateral:u}=e;if(this.hiddenConsumes&&a){const h=an(a);if(!o[h])if(this.allowReslicing){const f=Object.assign(Object.assign({},a),{span:Sc(a.span,n.span)}),v=an(f);o[v]=!0,i[l][u]=f,r.push(f),this.splitEntry(a,n,r)}else o[h]=!0,r.push(a)}super.handleInvalidInsertion(e,n,r)}}class Zc extends kt{constructor(){super(...arguments),this.cellElRefs=new wt,this.frameElRefs=new wt,this.fgElRefs=new wt,this.segHarnessRefs=new wt,this.rootElRef=Je(),this.state={framePositions:null,maxContentHeight:null,segHeights:{}},this.handleResize=e=>{e&&this.updateSizing(!0)}}render(){let{props:e,state:n,context:r}=this,{options:i}=r,o=e.cells.length,a=Fn(e.businessHourSegs,o),l=Fn(e.bgEventSegs,o),u=Fn(this.getHighlightSegs(),o),h=Fn(this.getMirrorSegs(),o),{singleColPlacements:f,multiColPlacements:v,moreCnts:p,moreMarginTops:m}=_v(xm(e.fgEventSegs,i.eventOrder),e.dayMaxEvents,e.dayMaxEventRows,i.eventOrderStrict,n.segHeights,n.maxContentHeight,e.cells),E=e.eventDrag&&e.eventDrag.affectedInstances||e.eventResize&&e.eventResize.affectedInstances||{};return D("tr",{ref:this.rootElRef,role:"row"},e.renderIntro&&e.renderIntro(),e.cells.map((R,x)=>{let k=this.renderFgSegs(x,e.forPrint?f[x]:v[x],e.todayRange,E),B=this.renderFgSegs(x,kv(h[x],v),e.todayRange,{},!!e.eventDrag,!!e.eventResize,!1);return D(Cv,{key:R.key,elRef:this.cellElRefs.createRef(R.key),innerElRef:this.frameElRefs.createRef(R.key),dateProfile:e.dateProfile,date:R.date,showDayNumber:e.showDayNumbers,showWeekNumber:e.showWeekNumbers&&x===0,forceDayTop:e.showWeekNumbers,todayRange:e.todayRange,eventSelection:e.eventSelection,eventDrag:e.eventDrag,eventResize:e.eventResize,extraRenderProps:R.extraRenderProps,extraDataAttrs:R.extraDataAttrs,extraClassNames:R.extraClassNames,extraDateSpan:R.extraDateSpan,moreCnt:p[x],moreMarginTop:m[x],singlePlacements:f[x],fgContentElRef:this.fgElRefs.createRef(R.key),fgContent:D(fe,null,D(fe,null,k),D(fe,null,B)),bgContent:D(fe,null,this.renderFillSegs(u[x],"highlight"),this.renderFillSegs(a[x],"non-business"),this.renderFillSegs(l[x],"bg-event")),minHeight:e.cellMinHeight})}))}componentDidMount(){this.updateSizing(!0),this.context.addResizeHandler(this.handleResize)}componentDidUpdate(e,n){let r=this.props;this.updateSizing(!ze(e,r))}componentWillUnmount(){this.context.removeResizeHandler(this.handleResize)}getHighlightSegs(){let{props:e}=this;return e.eventDrag&&e.eventDrag.segs.length?e.eventDrag.segs:e.eventResize&&e.eventResize.segs.length?e.eventResize.segs:e.dateSelectionSegs}getMirrorSegs(){let{props:e}=this;return e.eventResize&&e.eventResize.segs.length?e.eventResize.segs:[]}renderFgSegs(e,n,r,i,o,a,l){let{context:u}=this,{eventSelection:h}=this.props,{framePositions:f}=this.state,v=this.props.cells.length===1,p=o||a||l,m=[];if(f)for(let E of n){let{seg:R}=E,{instanceId:x}=R.eventRange.instance,k=E.isVisible&&!i[x],B=E.isAbsolute,P="",$="";B&&(u.isRtl?($=0,P=f.lefts[R.lastCol]-f.lefts[R.firstCol]):(P=0,$=f.rights[R.firstCol]-f.rights[R.lastCol])),m.push(D("div",{className:"fc-daygrid-event-harness"+(B?" fc-daygrid-event-harness-abs":""),key:Yc(R),ref:p?null:this.segHarnessRefs.createRef(Qc(R)),style:{visibility:k?"":"hidden",marginTop:B?"":E.marginTop,top:B?E.absoluteTop:"",left:P,right:$}},$c(R)?D(qc,Object.assign({seg:R,isDragging:o,isSelected:x===h,defaultDisplayEventEnd:v},sn(R,r))):D(Gc,Object.assign({seg:R,isDragging:o,isResizing:a,isDateSelecting:l,isSelected:x===h,defaultDisplayEventEnd:v},sn(R,r)))))}return m}renderFillSegs(e,n){let{isRtl:r}=this.context,{todayRange:i}=this.props,{framePositions:o}=this.state,a=[];if(o)for(let l of e){let u=r?{right:0,left:o.lefts[l.lastCol]-o.lefts[l.firstCol]}:{left:0,right:o.rights[l.firstCol]-o.rights[l.lastCol]};a.push(D("div",{key:Bm(l.eventRange),className:"fc-daygrid-bg-harness",style:u},n==="bg-event"?D(z2,Object.assign({seg:l},sn(l,i))):$2(n)))}return D(fe,{},...a)}updateSizing(e){let{props:n,state:r,frameElRefs:i}=this;if(!n.forPrint&&n.clientWidth!==null){if(e){let u=n.cells.map(h=>i.currentMap[h.key]);if(u.length){let h=this.rootElRef.current,f=new gr(h,u,!0,!1);(!r.framePositions||!r.framePositions.similarTo(f))&&this.setState({framePositions:new gr(h,u,!0,!1)})}}const o=this.state.segHeights,a=this.querySegHeights(),l=n.dayMaxEvents===!0||n.dayMaxEventRows===!0;this.safeSetState({segHeights:Object.assign(Object.assign({},o),a),maxContentHeight:l?this.computeMaxContentHeight():null})}}querySegHeights(){let e=this.segHarnessRefs.currentMap,n={};for(let r in e){let i=Math.round(e[r].getBoundingClientRect().height);n[r]=Math.max(n[r]||0,i)}return n}computeMaxContentHeight(){let e=this.props.cells[0].key,n=this.cellElRefs.currentMap[e],r=this.fgElRefs.currentMap[e];return n.getBoundingClientRect().bottom-r.getBoundingClientRect().top}getCellEls(){let e=this.cellElRefs.currentMap;return this.props.cells.map(n=>e[n.key])}}Zc.addStateEquality({segHeights:ze});function kv(t,e){if(!t.length)return[];let n=Iv(e);return t.map(r=>({seg:r,isVisible:!0,isAbsolute:!0,absoluteTop:n[r.eventRange.instance.instanceId],marginTop:0}))}function Iv(t){let e={};for(let n of t)for(let r of n)e[r.seg.eventRange.instance.instanceId]=r.absoluteTop;return e}class Mv extends kt{constructor(){super(...arguments),this.splitBusinessHourSegs=K($n),this.splitBgEventSegs=K(Ov),this.splitFgEventSegs=K($n),this.splitDateSelectionSegs=K($n),this.splitEventDrag=K(Ea),this.splitEventResize=K(Ea),this.rowRefs=new wt}render(){let{props:e,context:n}=this,r=e.cells.length,i=this.splitBusinessHourSegs(e.businessHourSegs,r),o=this.splitBgEventSegs(e.bgEventSegs,r),a=this.splitFgEventSegs(e.fgEventSegs,r),l=this.splitDateSelectionSegs(e.dateSelectionSegs,r),u=this.splitEventDrag(e.eventDrag,r),h=this.splitEventResize(e.eventResize,r),f=r>=7&&e.clientWidth?e.clientWidth/n.options.aspectRatio/6:null;return D(xr,{unit:"day"},(v,p)=>D(fe,null,e.cells.map((m,E)=>D(Zc,{ref:this.rowRefs.createRef(E),key:m.length?m[0].date.toISOString():E,showDayNumbers:r>1,showWeekNumbers:e.showWeekNumbers,todayRange:p,dateProfile:e.dateProfile,cells:m,renderIntro:e.renderRowIntro,businessHourSegs:i[E],eventSelection:e.eventSelection,bgEventSegs:o[E],fgEventSegs:a[E],dateSelectionSegs:l[E],eventDrag:u[E],eventResize:h[E],dayMaxEvents:e.dayMaxEvents,dayMaxEventRows:e.dayMaxEventRows,clientWidth:e.clientWidth,clientHeight:e.clientHeight,cellMinHeight:f,forPrint:e.forPrint}))))}componentDidMount(){this.registerInteractiveComponent()}componentDidUpdate(){this.registerInteractiveComponent()}registerInteractiveComponent(){if(!this.rootEl){const e=this.rowRefs.currentMap[0].getCellEls()[0],n=e?e.closest(".fc-daygrid-body"):null;n&&(this.rootEl=n,this.context.registerInteractiveComponent(this,{el:n,isHitComboAllowed:this.props.isHitComboAllowed}))}}componentWillUnmount(){this.rootEl&&(this.context.unregisterInteractiveComponent(this),this.rootEl=null)}prepareHits(){this.rowPositions=new gr(this.rootEl,this.rowRefs.collect().map(e=>e.getCellEls()[0]),!1,!0),this.colPositions=new gr(this.rootEl,this.rowRefs.currentMap[0].getCellEls(),!0,!1)}queryHit(e,n){let{colPositions:r,rowPositions:i}=this,o=r.leftToIndex(e),a=i.topToIndex(n);if(a!=null&&o!=null){let l=this.props.cells[a][o];return{dateProfile:this.props.dateProfile,dateSpan:Object.assign({range:this.getCellRange(a,o),allDay:!0},l.extraDateSpan),dayEl:this.getCellEl(a,o),rect:{left:r.lefts[o],right:r.rights[o],top:i.tops[a],bottom:i.bottoms[a]},layer:0}}return null}getCellEl(e,n){return this.rowRefs.currentMap[e].getCellEls()[n]}getCellRange(e,n){let r=this.props.cells[e][n].date,i=be(r,1);return{start:r,end:i}}}function Ov(t,e){return $n(t.filter(Bv),e)}function Bv(t){return t.eventRange.def.allDay}class Pv extends kt{constructor(){super(...arguments),this.elRef=Je(),this.needsScrollReset=!1}render(){let{props:e}=this,{dayMaxEventRows:n,dayMaxEvents:r,expandRows:i}=e,o=r===!0||n===!0;o&&!i&&(o=!1,n=null,r=null);let a=["fc-daygrid-body",o?"fc-daygrid-body-balanced":"fc-daygrid-body-unbalanced",i?"":"fc-daygrid-body-natural"];return D("div",{ref:this.elRef,className:a.join(" "),style:{width:e.clientWidth,minWidth:e.tableMinWidth}},D("table",{role:"presentation",className:"fc-scrollgrid-sync-table",style:{width:e.clientWidth,minWidth:e.tableMinWidth,height:i?e.clientHeight:""}},e.colGroupNode,D("tbody",{role:"presentation"},D(Mv,{dateProfile:e.dateProfile,cells:e.cells,renderRowIntro:e.renderRowIntro,showWeekNumbers:e.showWeekNumbers,clientWidth:e.clientWidth,clientHeight:e.clientHeight,businessHourSegs:e.businessHourSegs,bgEventSegs:e.bgEventSegs,fgEventSegs:e.fgEventSegs,dateSelectionSegs:e.dateSelectionSegs,eventSelection:e.eventSelection,eventDrag:e.eventDrag,eventResize:e.eventResize,dayMaxEvents:r,dayMaxEventRows:n,forPrint:e.forPrint,isHitComboAllowed:e.isHitComboAllowed}))))}componentDidMount(){this.requestScrollReset()}componentDidUpdate(e){e.dateProfile!==this.props.dateProfile?this.requestScrollReset():this.flushScrollReset()}requestScrollReset(){this.needsScrollReset=!0,this.flushScrollReset()}flushScrollReset(){if(this.needsScrollReset&&this.props.clientWidth){const e=Nv(this.elRef.current,this.props.dateProfile);if(e){const n=e.closest(".fc-daygrid-body"),r=n.closest(".fc-scroller"),i=e.getBoundingClientRect().top-n.getBoundingClientRect().top;r.scrollTop=i?i+1:0}this.needsScrollReset=!1}}}function Nv(t,e){let n;return e.currentRangeUnit.match(/year|month/)&&(n=t.querySelector(`[data-date="${pp(e.currentDate)}-01"]`)),n||(n=t.querySelector(`[data-date="${$i(e.currentDate)}"]`)),n}class Lv extends y2{constructor(){super(...arguments),this.forceDayIfListItem=!0}sliceRange(e,n){return n.sliceRange(e)}}class Hv extends kt{constructor(){super(...arguments),this.slicer=new Lv,this.tableRef=Je()}render(){let{props:e,context:n}=this;return D(Pv,Object.assign({ref:this.tableRef},this.slicer.sliceProps(e,e.dateProfile,e.nextDayThreshold,n,e.dayTableModel),{dateProfile:e.dateProfile,cells:e.dayTableModel.cells,colGroupNode:e.colGroupNode,tableMinWidth:e.tableMinWidth,renderRowIntro:e.renderRowIntro,dayMaxEvents:e.dayMaxEvents,dayMaxEventRows:e.dayMaxEventRows,showWeekNumbers:e.showWeekNumbers,expandRows:e.expandRows,headerAlignElRef:e.headerAlignElRef,clientWidth:e.clientWidth,clientHeight:e.clientHeight,forPrint:e.forPrint}))}}class jv extends wv{constructor(){super(...arguments),this.buildDayTableModel=K(Fv),this.headerRef=Je(),this.tableRef=Je()}render(){let{options:e,dateProfileGenerator:n}=this.context,{props:r}=this,i=this.buildDayTableModel(r.dateProfile,n),o=e.dayHeaders&&D(m2,{ref:this.headerRef,dateProfile:r.dateProfile,dates:i.headerDates,datesRepDistinctDays:i.rowCnt===1}),a=l=>D(Hv,{ref:this.tableRef,dateProfile:r.dateProfile,dayTableModel:i,businessHours:r.businessHours,dateSelection:r.dateSelection,eventStore:r.eventStore,eventUiBases:r.eventUiBases,eventSelection:r.eventSelection,eventDrag:r.eventDrag,eventResize:r.eventResize,nextDayThreshold:e.nextDayThreshold,colGroupNode:l.tableColGroupNode,tableMinWidth:l.tableMinWidth,dayMaxEvents:e.dayMaxEvents,dayMaxEventRows:e.dayMaxEventRows,showWeekNumbers:e.weekNumbers,expandRows:!r.isHeightAuto,headerAlignElRef:this.headerElRef,clientWidth:l.clientWidth,clientHeight:l.clientHeight,forPrint:r.forPrint});return e.dayMinWidth?this.renderHScrollLayout(o,a,i.colCnt,e.dayMinWidth):this.renderSimpleLayout(o,a)}}function Fv(t,e){let n=new w2(t.renderRange,e);return new b2(n,/year|month|week/.test(t.currentRangeUnit))}class Uv extends ic{buildRenderRange(e,n,r){let i=super.buildRenderRange(e,n,r),{props:o}=this;return Vv({currentRange:i,snapToWeek:/^(year|month)$/.test(n),fixedWeekCount:o.fixedWeekCount,dateEnv:o.dateEnv})}}function Vv(t){let{dateEnv:e,currentRange:n}=t,{start:r,end:i}=n,o;if(t.snapToWeek&&(r=e.startOfWeek(r),o=e.startOfWeek(i),o.valueOf()!==i.valueOf()&&(i=Gs(o,1))),t.fixedWeekCount){let a=e.startOfWeek(e.startOfMonth(be(n.end,-1))),l=Math.ceil(rp(a,i));i=Gs(i,6-l)}return{start:r,end:i}}var zv=':root{--fc-daygrid-event-dot-width:8px}.fc-daygrid-day-events:after,.fc-daygrid-day-events:before,.fc-daygrid-day-frame:after,.fc-daygrid-day-frame:before,.fc-daygrid-event-harness:after,.fc-daygrid-event-harness:before{clear:both;content:"";display:table}.fc .fc-daygrid-body{position:relative;z-index:1}.fc .fc-daygrid-day.fc-day-today{background-color:var(--fc-today-bg-color)}.fc .fc-daygrid-day-frame{min-height:100%;position:relative}.fc .fc-daygrid-day-top{display:flex;flex-direction:row-reverse}.fc .fc-day-other .fc-daygrid-day-top{opacity:.3}.fc .fc-daygrid-day-number{padding:4px;position:relative;z-index:4}.fc .fc-daygrid-month-start{font-size:1.1em;font-weight:700}.fc .fc-daygrid-day-events{margin-top:1px}.fc .fc-daygrid-body-balanced .fc-daygrid-day-events{left:0;position:absolute;right:0}.fc .fc-daygrid-body-unbalanced .fc-daygrid-day-events{min-height:2em;position:relative}.fc .fc-daygrid-body-natural .fc-daygrid-day-events{margin-bottom:1em}.fc .fc-daygrid-event-harness{position:relative}.fc .fc-daygrid-event-harness-abs{left:0;position:absolute;right:0;top:0}.fc .fc-daygrid-bg-harness{bottom:0;position:absolute;top:0}.fc .fc-daygrid-day-bg .fc-non-business{z-index:1}.fc .fc-daygrid-day-bg .fc-bg-event{z-index:2}.fc .fc-daygrid-day-bg .fc-highlight{z-index:3}.fc .fc-daygrid-event{margin-top:1px;z-index:6}.fc .fc-daygrid-event.fc-event-mirror{z-index:7}.fc .fc-daygrid-day-bottom{font-size:.85em;margin:0 2px}.fc .fc-daygrid-day-bottom:after,.fc .fc-daygrid-day-bottom:before{clear:both;content:"";display:table}.fc .fc-daygrid-more-link{border-radius:3px;cursor:pointer;line-height:1;margin-top:1px;max-width:100%;overflow:hidden;padding:2px;position:relative;white-space:nowrap;z-index:4}.fc .fc-daygrid-more-link:hover{background-color:rgba(0,0,0,.1)}.fc .fc-daygrid-week-number{background-color:var(--fc-neutral-bg-color);color:var(--fc-neutral-text-color);min-width:1.5em;padding:2px;position:absolute;text-align:center;top:0;z-index:5}.fc .fc-more-popover .fc-popover-body{min-width:220px;padding:10px}.fc-direction-ltr .fc-daygrid-event.fc-event-start,.fc-direction-rtl .fc-daygrid-event.fc-event-end{margin-left:2px}.fc-direction-ltr .fc-daygrid-event.fc-event-end,.fc-direction-rtl .fc-daygrid-event.fc-event-start{margin-right:2px}.fc-direction-ltr .fc-daygrid-more-link{float:left}.fc-direction-ltr .fc-daygrid-week-number{border-radius:0 0 3px 0;left:0}.fc-direction-rtl .fc-daygrid-more-link{float:right}.fc-direction-rtl .fc-daygrid-week-number{border-radius:0 0 0 3px;right:0}.fc-liquid-hack .fc-daygrid-day-frame{position:static}.fc-daygrid-event{border-radius:3px;font-size:var(--fc-small-font-size);position:relative;white-space:nowrap}.fc-daygrid-block-event .fc-event-time{font-weight:700}.fc-daygrid-block-event .fc-event-time,.fc-daygrid-block-event .fc-event-title{padding:1px}.fc-daygrid-dot-event{align-items:center;display:flex;padding:2px 0}.fc-daygrid-dot-event .fc-event-title{flex-grow:1;flex-shrink:1;font-weight:700;min-width:0;overflow:hidden}.fc-daygrid-dot-event.fc-event-mirror,.fc-daygrid-dot-event:hover{background:rgba(0,0,0,.1)}.fc-daygrid-dot-event.fc-event-selected:before{bottom:-10px;top:-10px}.fc-daygrid-event-dot{border:calc(var(--fc-daygrid-event-dot-width)/2) solid var(--fc-event-border-color);border-radius:calc(var(--fc-daygrid-event-dot-width)/2);box-sizing:content-box;height:0;margin:0 4px;width:0}.fc-direction-ltr .fc-daygrid-event .fc-event-time{margin-right:3px}.fc-direction-rtl .fc-daygrid-event .fc-event-time{margin-left:3px}';Ul(zv);var Wv=dt({name:"@fullcalendar/daygrid",initialView:"dayGridMonth",views:{dayGrid:{component:jv,dateProfileGeneratorClass:Uv},dayGridDay:{type:"dayGrid",duration:{days:1}},dayGridWeek:{type:"dayGrid",duration:{weeks:1}},dayGridMonth:{type:"dayGrid",duration:{months:1},fixedWeekCount:!0},dayGridYear:{type:"dayGrid",duration:{years:1}}}});lo.touchMouseIgnoreWait=500;let Ci=0,pr=0,Si=!1;class Xc{constructor(e){this.subjectEl=null,this.selector="",this.handleSelector="",this.shouldIgnoreMove=!1,this.shouldWatchScroll=!0,this.isDragging=!1,this.isTouchDragging=!1,this.wasTouchScroll=!1,this.handleMouseDown=n=>{if(!this.shouldIgnoreMouse()&&$v(n)&&this.tryStart(n)){let r=this.createEventFromMouse(n,!0);this.emitter.trigger("pointerdown",r),this.initScrollWatch(r),this.shouldIgnoreMove||document.addEventListener("mousemove",this.handleMouseMove),document.addEventListener("mouseup",this.handleMouseUp)}},this.handleMouseMove=n=>{let r=this.createEventFromMouse(n);this.recordCoords(r),this.emitter.trigger("pointermove",r)},this.handleMouseUp=n=>{document.removeEventListener("mousemove",this.handleMouseMove),document.removeEventListener("mouseup",this.handleMouseUp),this.emitter.trigger("pointerup",this.createEventFromMouse(n)),this.cleanup()},this.handleTouchStart=n=>{if(this.tryStart(n)){this.isTouchDragging=!0;let r=this.createEventFromTouch(n,!0);this.emitter.trigger("pointerdown",r),this.initScrollWatch(r);let i=n.target;this.shouldIgnoreMove||i.addEventListener("touchmove",this.handleTouchMove),i.addEventListener("touchend",this.handleTouchEnd),i.addEventListener("touchcancel",this.handleTouchEnd),window.addEventListener("scroll",this.handleTouchScroll,!0)}},this.handleTouchMove=n=>{let r=this.createEventFromTouch(n);this.recordCoords(r),this.emitter.trigger("pointermove",r)},this.handleTouchEnd=n=>{if(this.isDragging){let r=n.target;r.removeEventListener("touchmove",this.handleTouchMove),r.removeEventListener("touchend",this.handleTouchEnd),r.removeEventListener("touchcancel",this.handleTouchEnd),window.removeEventListener("scroll",this.handleTouchScroll,!0),this.emitter.trigger("pointerup",this.createEventFromTouch(n)),this.cleanup(),this.isTouchDragging=!1,Gv()}},this.handleTouchScroll=()=>{this.wasTouchScroll=!0},this.handleScroll=n=>{if(!this.shouldIgnoreMove){let r=window.scrollX-this.prevScrollX+this.prevPageX,i=window.scrollY-this.prevScrollY+this.prevPageY;this.emitter.trigger("pointermove",{origEvent:n,isTouch:this.isTouchDragging,subjectEl:this.subjectEl,pageX:r,pageY:i,deltaX:r-this.origPageX,deltaY:i-this.origPageY})}},this.containerEl=e,this.emitter=new Tr,e.addEventListener("mousedown",this.handleMouseDown),e.addEventListener("touchstart",this.handleTouchStart,{passive:!0}),qv()}destroy(){this.containerEl.removeEventListener("mousedown",this.handleMouseDown),this.containerEl.removeEventListener("touchstart",this.handleTouchStart,{passive:!0}),Yv()}tryStart(e){let n=this.querySubjectEl(e),r=e.target;return n&&(!this.handleSelector||Ce(r,this.handleSelector))?(this.subjectEl=n,this.isDragging=!0,this.wasTouchScroll=!1,!0):!1}cleanup(){Si=!1,this.isDragging=!1,this.subjectEl=null,this.destroyScrollWatch()}querySubjectEl(e){return this.selector?Ce(e.target,this.selector):this.containerEl}shouldIgnoreMouse(){return Ci||this.isTouchDragging}cancelTouchScroll(){this.isDragging&&(Si=!0)}initScrollWatch(e){this.shouldWatchScroll&&(this.recordCoords(e),window.addEventListener("scroll",this.handleScroll,!0))}recordCoords(e){this.shouldWatchScroll&&(this.prevPageX=e.pageX,this.prevPageY=e.pageY,this.prevScrollX=window.scrollX,this.prevScrollY=window.scrollY)}destroyScrollWatch(){this.shouldWatchScroll&&window.removeEventListener("scroll",this.handleScroll,!0)}createEventFromMouse(e,n){let r=0,i=0;return n?(this.origPageX=e.pageX,this.origPageY=e.pageY):(r=e.pageX-this.origPageX,i=e.pageY-this.origPageY),{origEvent:e,isTouch:!1,subjectEl:this.subjectEl,pageX:e.pageX,pageY:e.pageY,deltaX:r,deltaY:i}}createEventFromTouch(e,n){let r=e.touches,i,o,a=0,l=0;return r&&r.length?(i=r[0].pageX,o=r[0].pageY):(i=e.pageX,o=e.pageY),n?(this.origPageX=i,this.origPageY=o):(a=i-this.origPageX,l=o-this.origPageY),{origEvent:e,isTouch:!0,subjectEl:this.subjectEl,pageX:i,pageY:o,deltaX:a,deltaY:l}}}function $v(t){return t.button===0&&!t.ctrlKey}function Gv(){Ci+=1,setTimeout(()=>{Ci-=1},lo.touchMouseIgnoreWait)}function qv(){pr+=1,pr===1&&window.addEventListener("touchmove",Jc,{passive:!1})}function Yv(){pr-=1,pr||window.removeEventListener("touchmove",Jc,{passive:!1})}function Jc(t){Si&&t.preventDefault()}class Qv{constructor(){this.isVisible=!1,this.sourceEl=null,this.mirrorEl=null,this.sourceElRect=null,this.parentNode=document.body,this.zIndex=9999,this.revertDuration=0}start(e,n,r){this.sourceEl=e,this.sourceElRect=this.sourceEl.getBoundingClientRect(),this.origScreenX=n-window.scrollX,this.origScreenY=r-window.scrollY,this.deltaX=0,this.deltaY=0,this.updateElPosition()}handleMove(e,n){this.deltaX=e-window.scrollX-this.origScreenX,this.deltaY=n-window.scrollY-this.origScreenY,this.updateElPosition()}setIsVisible(e){e?this.isVisible||(this.mirrorEl&&(this.mirrorEl.style.display=""),this.isVisible=e,this.updateElPosition()):this.isVisible&&(this.mirrorEl&&(this.mirrorEl.style.display="none"),this.isVisible=e)}stop(e,n){let r=()=>{this.cleanup(),n()};e&&this.mirrorEl&&this.isVisible&&this.revertDuration&&(this.deltaX||this.deltaY)?this.doRevertAnimation(r,this.revertDuration):setTimeout(r,0)}doRevertAnimation(e,n){let r=this.mirrorEl,i=this.sourceEl.getBoundingClientRect();r.style.transition="top "+n+"ms,left "+n+"ms",nn(r,{left:i.left,top:i.top}),jg(r,()=>{r.style.transition="",e()})}cleanup(){this.mirrorEl&&(Vi(this.mirrorEl),this.mirrorEl=null),this.sourceEl=null}updateElPosition(){this.sourceEl&&this.isVisible&&nn(this.getMirrorEl(),{left:this.sourceElRect.left+this.deltaX,top:this.sourceElRect.top+this.deltaY})}getMirrorEl(){let e=this.sourceElRect,n=this.mirrorEl;return n||(n=this.mirrorEl=this.sourceEl.cloneNode(!0),n.style.userSelect="none",n.style.webkitUserSelect="none",n.style.pointerEvents="none",n.classList.add("fc-event-dragging"),nn(n,{position:"fixed",zIndex:this.zIndex,visibility:"",boxSizing:"border-box",width:e.right-e.left,height:e.bottom-e.top,right:"auto",bottom:"auto",margin:0}),this.parentNode.appendChild(n)),n}}class Kc extends ao{constructor(e,n){super(),this.handleScroll=()=>{this.scrollTop=this.scrollController.getScrollTop(),this.scrollLeft=this.scrollController.getScrollLeft(),this.handleScrollChange()},this.scrollController=e,this.doesListening=n,this.scrollTop=this.origScrollTop=e.getScrollTop(),this.scrollLeft=this.origScrollLeft=e.getScrollLeft(),this.scrollWidth=e.getScrollWidth(),this.scrollHeight=e.getScrollHeight(),this.clientWidth=e.getClientWidth(),this.clientHeight=e.getClientHeight(),this.clientRect=this.computeClientRect(),this.doesListening&&this.getEventTarget().addEventListener("scroll",this.handleScroll)}destroy(){this.doesListening&&this.getEventTarget().removeEventListener("scroll",this.handleScroll)}getScrollTop(){return this.scrollTop}getScrollLeft(){return this.scrollLeft}setScrollTop(e){this.scrollController.setScrollTop(e),this.doesListening||(this.scrollTop=Math.max(Math.min(e,this.getMaxScrollTop()),0),this.handleScrollChange())}setScrollLeft(e){this.scrollController.setScrollLeft(e),this.doesListening||(this.scrollLeft=Math.max(Math.min(e,this.getMaxScrollLeft()),0),this.handleScrollChange())}getClientWidth(){return this.clientWidth}getClientHeight(){return this.clientHeight}getScrollWidth(){return this.scrollWidth}getScrollHeight(){return this.scrollHeight}handleScrollChange(){}}class eu extends Kc{constructor(e,n){super(new l2(e),n)}getEventTarget(){return this.scrollController.el}computeClientRect(){return s2(this.scrollController.el)}}class Zv extends Kc{constructor(e){super(new c2,e)}getEventTarget(){return window}computeClientRect(){return{left:this.scrollLeft,right:this.scrollLeft+this.clientWidth,top:this.scrollTop,bottom:this.scrollTop+this.clientHeight}}handleScrollChange(){this.clientRect=this.computeClientRect()}}const Aa=typeof performance=="function"?performance.now:Date.now;class Xv{constructor(){this.isEnabled=!0,this.scrollQuery=[window,".fc-scroller"],this.edgeThreshold=50,this.maxVelocity=300,this.pointerScreenX=null,this.pointerScreenY=null,this.isAnimating=!1,this.scrollCaches=null,this.everMovedUp=!1,this.everMovedDown=!1,this.everMovedLeft=!1,this.everMovedRight=!1,this.animate=()=>{if(this.isAnimating){let e=this.computeBestEdge(this.pointerScreenX+window.scrollX,this.pointerScreenY+window.scrollY);if(e){let n=Aa();this.handleSide(e,(n-this.msSinceRequest)/1e3),this.requestAnimation(n)}else this.isAnimating=!1}}}start(e,n,r){this.isEnabled&&(this.scrollCaches=this.buildCaches(r),this.pointerScreenX=null,this.pointerScreenY=null,this.everMovedUp=!1,this.everMovedDown=!1,this.everMovedLeft=!1,this.everMovedRight=!1,this.handleMove(e,n))}handleMove(e,n){if(this.isEnabled){let r=e-window.scrollX,i=n-window.scrollY,o=this.pointerScreenY===null?0:i-this.pointerScreenY,a=this.pointerScreenX===null?0:r-this.pointerScreenX;o<0?this.everMovedUp=!0:o>0&&(this.everMovedDown=!0),a<0?this.everMovedLeft=!0:a>0&&(this.everMovedRight=!0),this.pointerScreenX=r,this.pointerScreenY=i,this.isAnimating||(this.isAnimating=!0,this.requestAnimation(Aa()))}}stop(){if(this.isEnabled){this.isAnimating=!1;for(let e of this.scrollCaches)e.destroy();this.scrollCaches=null}}requestAnimation(e){this.msSinceRequest=e,requestAnimationFrame(this.animate)}handleSide(e,n){let{scrollCache:r}=e,{edgeThreshold:i}=this,o=i-e.distance,a=o*o/(i*i)*this.maxVelocity*n,l=1;switch(e.name){case"left":l=-1;case"right":r.setScrollLeft(r.getScrollLeft()+a*l);break;case"top":l=-1;case"bottom":r.setScrollTop(r.getScrollTop()+a*l);break}}computeBestEdge(e,n){let{edgeThreshold:r}=this,i=null,o=this.scrollCaches||[];for(let a of o){let l=a.clientRect,u=e-l.left,h=l.right-e,f=n-l.top,v=l.bottom-n;u>=0&&h>=0&&f>=0&&v>=0&&(f<=r&&this.everMovedUp&&a.canScrollUp()&&(!i||i.distance>f)&&(i={scrollCache:a,name:"top",distance:f}),v<=r&&this.everMovedDown&&a.canScrollDown()&&(!i||i.distance>v)&&(i={scrollCache:a,name:"bottom",distance:v}),u<=r&&this.everMovedLeft&&a.canScrollLeft()&&(!i||i.distance>u)&&(i={scrollCache:a,name:"left",distance:u}),h<=r&&this.everMovedRight&&a.canScrollRight()&&(!i||i.distance>h)&&(i={scrollCache:a,name:"right",distance:h}))}return i}buildCaches(e){return this.queryScrollEls(e).map(n=>n===window?new Zv(!1):new eu(n,!1))}queryScrollEls(e){let n=[];for(let r of this.scrollQuery)typeof r=="object"?n.push(r):n.push(...Array.prototype.slice.call(e.getRootNode().querySelectorAll(r)));return n}}class bn extends d2{constructor(e,n){super(e),this.containerEl=e,this.delay=null,this.minDistance=0,this.touchScrollAllowed=!0,this.mirrorNeedsRevert=!1,this.isInteracting=!1,this.isDragging=!1,this.isDelayEnded=!1,this.isDistanceSurpassed=!1,this.delayTimeoutId=null,this.onPointerDown=i=>{this.isDragging||(this.isInteracting=!0,this.isDelayEnded=!1,this.isDistanceSurpassed=!1,Fg(document.body),Vg(document.body),i.isTouch||i.origEvent.preventDefault(),this.emitter.trigger("pointerdown",i),this.isInteracting&&!this.pointer.shouldIgnoreMove&&(this.mirror.setIsVisible(!1),this.mirror.start(i.subjectEl,i.pageX,i.pageY),this.startDelay(i),this.minDistance||this.handleDistanceSurpassed(i)))},this.onPointerMove=i=>{if(this.isInteracting){if(this.emitter.trigger("pointermove",i),!this.isDistanceSurpassed){let o=this.minDistance,a,{deltaX:l,deltaY:u}=i;a=l*l+u*u,a>=o*o&&this.handleDistanceSurpassed(i)}this.isDragging&&(i.origEvent.type!=="scroll"&&(this.mirror.handleMove(i.pageX,i.pageY),this.autoScroller.handleMove(i.pageX,i.pageY)),this.emitter.trigger("dragmove",i))}},this.onPointerUp=i=>{this.isInteracting&&(this.isInteracting=!1,Ug(document.body),zg(document.body),this.emitter.trigger("pointerup",i),this.isDragging&&(this.autoScroller.stop(),this.tryStopDrag(i)),this.delayTimeoutId&&(clearTimeout(this.delayTimeoutId),this.delayTimeoutId=null))};let r=this.pointer=new Xc(e);r.emitter.on("pointerdown",this.onPointerDown),r.emitter.on("pointermove",this.onPointerMove),r.emitter.on("pointerup",this.onPointerUp),n&&(r.selector=n),this.mirror=new Qv,this.autoScroller=new Xv}destroy(){this.pointer.destroy(),this.onPointerUp({})}startDelay(e){typeof this.delay=="number"?this.delayTimeoutId=setTimeout(()=>{this.delayTimeoutId=null,this.handleDelayEnd(e)},this.delay):this.handleDelayEnd(e)}handleDelayEnd(e){this.isDelayEnded=!0,this.tryStartDrag(e)}handleDistanceSurpassed(e){this.isDistanceSurpassed=!0,this.tryStartDrag(e)}tryStartDrag(e){this.isDelayEnded&&this.isDistanceSurpassed&&(!this.pointer.wasTouchScroll||this.touchScrollAllowed)&&(this.isDragging=!0,this.mirrorNeedsRevert=!1,this.autoScroller.start(e.pageX,e.pageY,this.containerEl),this.emitter.trigger("dragstart",e),this.touchScrollAllowed===!1&&this.pointer.cancelTouchScroll())}tryStopDrag(e){this.mirror.stop(this.mirrorNeedsRevert,this.stopDrag.bind(this,e))}stopDrag(e){this.isDragging=!1,this.emitter.trigger("dragend",e)}setIgnoreMove(e){this.pointer.shouldIgnoreMove=e}setMirrorIsVisible(e){this.mirror.setIsVisible(e)}setMirrorNeedsRevert(e){this.mirrorNeedsRevert=e}setAutoScrollEnabled(e){this.autoScroller.isEnabled=e}}class Jv{constructor(e){this.el=e,this.origRect=so(e),this.scrollCaches=Cc(e).map(n=>new eu(n,!0))}destroy(){for(let e of this.scrollCaches)e.destroy()}computeLeft(){let e=this.origRect.left;for(let n of this.scrollCaches)e+=n.origScrollLeft-n.getScrollLeft();return e}computeTop(){let e=this.origRect.top;for(let n of this.scrollCaches)e+=n.origScrollTop-n.getScrollTop();return e}isWithinClipping(e,n){let r={left:e,top:n};for(let i of this.scrollCaches)if(!Kv(i.getEventTarget())&&!Qm(r,i.clientRect))return!1;return!0}}function Kv(t){let e=t.tagName;return e==="HTML"||e==="BODY"}class Rr{constructor(e,n){this.useSubjectCenter=!1,this.requireInitial=!0,this.disablePointCheck=!1,this.initialHit=null,this.movingHit=null,this.finalHit=null,this.handlePointerDown=r=>{let{dragging:i}=this;this.initialHit=null,this.movingHit=null,this.finalHit=null,this.prepareHits(),this.processFirstCoord(r),this.initialHit||!this.requireInitial?(i.setIgnoreMove(!1),this.emitter.trigger("pointerdown",r)):i.setIgnoreMove(!0)},this.handleDragStart=r=>{this.emitter.trigger("dragstart",r),this.handleMove(r,!0)},this.handleDragMove=r=>{this.emitter.trigger("dragmove",r),this.handleMove(r)},this.handlePointerUp=r=>{this.releaseHits(),this.emitter.trigger("pointerup",r)},this.handleDragEnd=r=>{this.movingHit&&this.emitter.trigger("hitupdate",null,!0,r),this.finalHit=this.movingHit,this.movingHit=null,this.emitter.trigger("dragend",r)},this.droppableStore=n,e.emitter.on("pointerdown",this.handlePointerDown),e.emitter.on("dragstart",this.handleDragStart),e.emitter.on("dragmove",this.handleDragMove),e.emitter.on("pointerup",this.handlePointerUp),e.emitter.on("dragend",this.handleDragEnd),this.dragging=e,this.emitter=new Tr}processFirstCoord(e){let n={left:e.pageX,top:e.pageY},r=n,i=e.subjectEl,o;i instanceof HTMLElement&&(o=so(i),r=Zm(r,o));let a=this.initialHit=this.queryHitForOffset(r.left,r.top);if(a){if(this.useSubjectCenter&&o){let l=yc(o,a.rect);l&&(r=Xm(l))}this.coordAdjust=Jm(r,n)}else this.coordAdjust={left:0,top:0}}handleMove(e,n){let r=this.queryHitForOffset(e.pageX+this.coordAdjust.left,e.pageY+this.coordAdjust.top);(n||!kr(this.movingHit,r))&&(this.movingHit=r,this.emitter.trigger("hitupdate",r,!1,e))}prepareHits(){this.offsetTrackers=Tt(this.droppableStore,e=>(e.component.prepareHits(),new Jv(e.el)))}releaseHits(){let{offsetTrackers:e}=this;for(let n in e)e[n].destroy();this.offsetTrackers={}}queryHitForOffset(e,n){let{droppableStore:r,offsetTrackers:i}=this,o=null;for(let a in r){let l=r[a].component,u=i[a];if(u&&u.isWithinClipping(e,n)){let h=u.computeLeft(),f=u.computeTop(),v=e-h,p=n-f,{origRect:m}=u,E=m.right-m.left,R=m.bottom-m.top;if(v>=0&&v<E&&p>=0&&p<R){let x=l.queryHit(v,p,E,R);x&&Dr(x.dateProfile.activeRange,x.dateSpan.range)&&(this.disablePointCheck||u.el.contains(u.el.getRootNode().elementFromPoint(v+h-window.scrollX,p+f-window.scrollY)))&&(!o||x.layer>o.layer)&&(x.componentId=a,x.context=l.context,x.rect.left+=h,x.rect.right+=h,x.rect.top+=f,x.rect.bottom+=f,o=x)}}}return o}}function kr(t,e){return!t&&!e?!0:!!t!=!!e?!1:Hm(t.dateSpan,e.dateSpan)}function tu(t,e){let n={};for(let r of e.pluginHooks.datePointTransforms)Object.assign(n,r(t,e));return Object.assign(n,ew(t,e.dateEnv)),n}function ew(t,e){return{date:e.toDate(t.range.start),dateStr:e.formatIso(t.range.start,{omitTime:t.allDay}),allDay:t.allDay}}class tw extends Qt{constructor(e){super(e),this.handlePointerDown=r=>{let{dragging:i}=this,o=r.origEvent.target;i.setIgnoreMove(!this.component.isValidDateDownEl(o))},this.handleDragEnd=r=>{let{component:i}=this,{pointer:o}=this.dragging;if(!o.wasTouchScroll){let{initialHit:a,finalHit:l}=this.hitDragging;if(a&&l&&kr(a,l)){let{context:u}=i,h=Object.assign(Object.assign({},tu(a.dateSpan,u)),{dayEl:a.dayEl,jsEvent:r.origEvent,view:u.viewApi||u.calendarApi.view});u.emitter.trigger("dateClick",h)}}},this.dragging=new bn(e.el),this.dragging.autoScroller.isEnabled=!1;let n=this.hitDragging=new Rr(this.dragging,io(e));n.emitter.on("pointerdown",this.handlePointerDown),n.emitter.on("dragend",this.handleDragEnd)}destroy(){this.dragging.destroy()}}class nw extends Qt{constructor(e){super(e),this.dragSelection=null,this.handlePointerDown=a=>{let{component:l,dragging:u}=this,{options:h}=l.context,f=h.selectable&&l.isValidDateDownEl(a.origEvent.target);u.setIgnoreMove(!f),u.delay=a.isTouch?rw(l):null},this.handleDragStart=a=>{this.component.context.calendarApi.unselect(a)},this.handleHitUpdate=(a,l)=>{let{context:u}=this.component,h=null,f=!1;if(a){let v=this.hitDragging.initialHit;a.componentId===v.componentId&&this.isHitComboAllowed&&!this.isHitComboAllowed(v,a)||(h=iw(v,a,u.pluginHooks.dateSelectionTransformers)),(!h||!E2(h,a.dateProfile,u))&&(f=!0,h=null)}h?u.dispatch({type:"SELECT_DATES",selection:h}):l||u.dispatch({type:"UNSELECT_DATES"}),f?zi():Wi(),l||(this.dragSelection=h)},this.handlePointerUp=a=>{this.dragSelection&&(fc(this.dragSelection,a,this.component.context),this.dragSelection=null)};let{component:n}=e,{options:r}=n.context,i=this.dragging=new bn(e.el);i.touchScrollAllowed=!1,i.minDistance=r.selectMinDistance||0,i.autoScroller.isEnabled=r.dragScroll;let o=this.hitDragging=new Rr(this.dragging,io(e));o.emitter.on("pointerdown",this.handlePointerDown),o.emitter.on("dragstart",this.handleDragStart),o.emitter.on("hitupdate",this.handleHitUpdate),o.emitter.on("pointerup",this.handlePointerUp)}destroy(){this.dragging.destroy()}}function rw(t){let{options:e}=t.context,n=e.selectLongPressDelay;return n==null&&(n=e.longPressDelay),n}function iw(t,e,n){let r=t.dateSpan,i=e.dateSpan,o=[r.range.start,r.range.end,i.range.start,i.range.end];o.sort(Yg);let a={};for(let l of n){let u=l(t,e);if(u===!1)return null;u&&Object.assign(a,u)}return a.range={start:o[0],end:o[3]},a.allDay=r.allDay,a}class yn extends Qt{constructor(e){super(e),this.subjectEl=null,this.subjectSeg=null,this.isDragging=!1,this.eventRange=null,this.relevantEvents=null,this.receivingContext=null,this.validMutation=null,this.mutatedRelevantEvents=null,this.handlePointerDown=a=>{let l=a.origEvent.target,{component:u,dragging:h}=this,{mirror:f}=h,{options:v}=u.context,p=u.context;this.subjectEl=a.subjectEl;let m=this.subjectSeg=zt(a.subjectEl),R=(this.eventRange=m.eventRange).instance.instanceId;this.relevantEvents=eo(p.getCurrentData().eventStore,R),h.minDistance=a.isTouch?0:v.eventDragMinDistance,h.delay=a.isTouch&&R!==u.props.eventSelection?sw(u):null,v.fixedMirrorParent?f.parentNode=v.fixedMirrorParent:f.parentNode=Ce(l,".fc"),f.revertDuration=v.dragRevertDuration;let x=u.isValidSegDownEl(l)&&!Ce(l,".fc-event-resizer");h.setIgnoreMove(!x),this.isDragging=x&&a.subjectEl.classList.contains("fc-event-draggable")},this.handleDragStart=a=>{let l=this.component.context,u=this.eventRange,h=u.instance.instanceId;a.isTouch?h!==this.component.props.eventSelection&&l.dispatch({type:"SELECT_EVENT",eventInstanceId:h}):l.dispatch({type:"UNSELECT_EVENT"}),this.isDragging&&(l.calendarApi.unselect(a),l.emitter.trigger("eventDragStart",{el:this.subjectEl,event:new le(l,u.def,u.instance),jsEvent:a.origEvent,view:l.viewApi}))},this.handleHitUpdate=(a,l)=>{if(!this.isDragging)return;let u=this.relevantEvents,h=this.hitDragging.initialHit,f=this.component.context,v=null,p=null,m=null,E=!1,R={affectedEvents:u,mutatedEvents:Ve(),isEvent:!0};if(a){v=a.context;let x=v.options;f===v||x.editable&&x.droppable?(p=ow(h,a,this.eventRange.instance.range.start,v.getCurrentData().pluginHooks.eventDragMutationMassagers),p&&(m=ro(u,v.getCurrentData().eventUiBases,p,v),R.mutatedEvents=m,Tc(R,a.dateProfile,v)||(E=!0,p=null,m=null,R.mutatedEvents=Ve()))):v=null}this.displayDrag(v,R),E?zi():Wi(),l||(f===v&&kr(h,a)&&(p=null),this.dragging.setMirrorNeedsRevert(!p),this.dragging.setMirrorIsVisible(!a||!this.subjectEl.getRootNode().querySelector(".fc-event-mirror")),this.receivingContext=v,this.validMutation=p,this.mutatedRelevantEvents=m)},this.handlePointerUp=()=>{this.isDragging||this.cleanup()},this.handleDragEnd=a=>{if(this.isDragging){let l=this.component.context,u=l.viewApi,{receivingContext:h,validMutation:f}=this,v=this.eventRange.def,p=this.eventRange.instance,m=new le(l,v,p),E=this.relevantEvents,R=this.mutatedRelevantEvents,{finalHit:x}=this.hitDragging;if(this.clearDrag(),l.emitter.trigger("eventDragStop",{el:this.subjectEl,event:m,jsEvent:a.origEvent,view:u}),f){if(h===l){let k=new le(l,R.defs[v.defId],p?R.instances[p.instanceId]:null);l.dispatch({type:"MERGE_EVENTS",eventStore:R});let B={oldEvent:m,event:k,relatedEvents:yt(R,l,p),revert(){l.dispatch({type:"MERGE_EVENTS",eventStore:E})}},P={};for(let $ of l.getCurrentData().pluginHooks.eventDropTransformers)Object.assign(P,$(f,l));l.emitter.trigger("eventDrop",Object.assign(Object.assign(Object.assign({},B),P),{el:a.subjectEl,delta:f.datesDelta,jsEvent:a.origEvent,view:u})),l.emitter.trigger("eventChange",B)}else if(h){let k={event:m,relatedEvents:yt(E,l,p),revert(){l.dispatch({type:"MERGE_EVENTS",eventStore:E})}};l.emitter.trigger("eventLeave",Object.assign(Object.assign({},k),{draggedEl:a.subjectEl,view:u})),l.dispatch({type:"REMOVE_EVENTS",eventStore:E}),l.emitter.trigger("eventRemove",k);let B=R.defs[v.defId],P=R.instances[p.instanceId],$=new le(h,B,P);h.dispatch({type:"MERGE_EVENTS",eventStore:R});let pe={event:$,relatedEvents:yt(R,h,P),revert(){h.dispatch({type:"REMOVE_EVENTS",eventStore:R})}};h.emitter.trigger("eventAdd",pe),a.isTouch&&h.dispatch({type:"SELECT_EVENT",eventInstanceId:p.instanceId}),h.emitter.trigger("drop",Object.assign(Object.assign({},tu(x.dateSpan,h)),{draggedEl:a.subjectEl,jsEvent:a.origEvent,view:x.context.viewApi})),h.emitter.trigger("eventReceive",Object.assign(Object.assign({},pe),{draggedEl:a.subjectEl,view:x.context.viewApi}))}}else l.emitter.trigger("_noEventDrop")}this.cleanup()};let{component:n}=this,{options:r}=n.context,i=this.dragging=new bn(e.el);i.pointer.selector=yn.SELECTOR,i.touchScrollAllowed=!1,i.autoScroller.isEnabled=r.dragScroll;let o=this.hitDragging=new Rr(this.dragging,yi);o.useSubjectCenter=e.useEventCenter,o.emitter.on("pointerdown",this.handlePointerDown),o.emitter.on("dragstart",this.handleDragStart),o.emitter.on("hitupdate",this.handleHitUpdate),o.emitter.on("pointerup",this.handlePointerUp),o.emitter.on("dragend",this.handleDragEnd)}destroy(){this.dragging.destroy()}displayDrag(e,n){let r=this.component.context,i=this.receivingContext;i&&i!==e&&(i===r?i.dispatch({type:"SET_EVENT_DRAG",state:{affectedEvents:n.affectedEvents,mutatedEvents:Ve(),isEvent:!0}}):i.dispatch({type:"UNSET_EVENT_DRAG"})),e&&e.dispatch({type:"SET_EVENT_DRAG",state:n})}clearDrag(){let e=this.component.context,{receivingContext:n}=this;n&&n.dispatch({type:"UNSET_EVENT_DRAG"}),e!==n&&e.dispatch({type:"UNSET_EVENT_DRAG"})}cleanup(){this.subjectSeg=null,this.isDragging=!1,this.eventRange=null,this.relevantEvents=null,this.receivingContext=null,this.validMutation=null,this.mutatedRelevantEvents=null}}yn.SELECTOR=".fc-event-draggable, .fc-event-resizable";function ow(t,e,n,r){let i=t.dateSpan,o=e.dateSpan,a=i.range.start,l=o.range.start,u={};i.allDay!==o.allDay&&(u.allDay=o.allDay,u.hasEnd=e.context.options.allDayMaintainDuration,o.allDay?a=ae(n):a=n);let h=Pt(a,l,t.context.dateEnv,t.componentId===e.componentId?t.largeUnit:null);h.milliseconds&&(u.allDay=!1);let f={datesDelta:h,standardProps:u};for(let v of r)v(f,t,e);return f}function sw(t){let{options:e}=t.context,n=e.eventLongPressDelay;return n==null&&(n=e.longPressDelay),n}class aw extends Qt{constructor(e){super(e),this.draggingSegEl=null,this.draggingSeg=null,this.eventRange=null,this.relevantEvents=null,this.validMutation=null,this.mutatedRelevantEvents=null,this.handlePointerDown=o=>{let{component:a}=this,l=this.querySegEl(o),u=zt(l),h=this.eventRange=u.eventRange;this.dragging.minDistance=a.context.options.eventDragMinDistance,this.dragging.setIgnoreMove(!this.component.isValidSegDownEl(o.origEvent.target)||o.isTouch&&this.component.props.eventSelection!==h.instance.instanceId)},this.handleDragStart=o=>{let{context:a}=this.component,l=this.eventRange;this.relevantEvents=eo(a.getCurrentData().eventStore,this.eventRange.instance.instanceId);let u=this.querySegEl(o);this.draggingSegEl=u,this.draggingSeg=zt(u),a.calendarApi.unselect(),a.emitter.trigger("eventResizeStart",{el:u,event:new le(a,l.def,l.instance),jsEvent:o.origEvent,view:a.viewApi})},this.handleHitUpdate=(o,a,l)=>{let{context:u}=this.component,h=this.relevantEvents,f=this.hitDragging.initialHit,v=this.eventRange.instance,p=null,m=null,E=!1,R={affectedEvents:h,mutatedEvents:Ve(),isEvent:!0};o&&(o.componentId===f.componentId&&this.isHitComboAllowed&&!this.isHitComboAllowed(f,o)||(p=lw(f,o,l.subjectEl.classList.contains("fc-event-resizer-start"),v.range))),p&&(m=ro(h,u.getCurrentData().eventUiBases,p,u),R.mutatedEvents=m,Tc(R,o.dateProfile,u)||(E=!0,p=null,m=null,R.mutatedEvents=null)),m?u.dispatch({type:"SET_EVENT_RESIZE",state:R}):u.dispatch({type:"UNSET_EVENT_RESIZE"}),E?zi():Wi(),a||(p&&kr(f,o)&&(p=null),this.validMutation=p,this.mutatedRelevantEvents=m)},this.handleDragEnd=o=>{let{context:a}=this.component,l=this.eventRange.def,u=this.eventRange.instance,h=new le(a,l,u),f=this.relevantEvents,v=this.mutatedRelevantEvents;if(a.emitter.trigger("eventResizeStop",{el:this.draggingSegEl,event:h,jsEvent:o.origEvent,view:a.viewApi}),this.validMutation){let p=new le(a,v.defs[l.defId],u?v.instances[u.instanceId]:null);a.dispatch({type:"MERGE_EVENTS",eventStore:v});let m={oldEvent:h,event:p,relatedEvents:yt(v,a,u),revert(){a.dispatch({type:"MERGE_EVENTS",eventStore:f})}};a.emitter.trigger("eventResize",Object.assign(Object.assign({},m),{el:this.draggingSegEl,startDelta:this.validMutation.startDelta||ee(0),endDelta:this.validMutation.endDelta||ee(0),jsEvent:o.origEvent,view:a.viewApi})),a.emitter.trigger("eventChange",m)}else a.emitter.trigger("_noEventResize");this.draggingSeg=null,this.relevantEvents=null,this.validMutation=null};let{component:n}=e,r=this.dragging=new bn(e.el);r.pointer.selector=".fc-event-resizer",r.touchScrollAllowed=!1,r.autoScroller.isEnabled=n.context.options.dragScroll;let i=this.hitDragging=new Rr(this.dragging,io(e));i.emitter.on("pointerdown",this.handlePointerDown),i.emitter.on("dragstart",this.handleDragStart),i.emitter.on("hitupdate",this.handleHitUpdate),i.emitter.on("dragend",this.handleDragEnd)}destroy(){this.dragging.destroy()}querySegEl(e){return Ce(e.subjectEl,".fc-event")}}function lw(t,e,n,r){let i=t.context.dateEnv,o=t.dateSpan.range.start,a=e.dateSpan.range.start,l=Pt(o,a,i,t.largeUnit);if(n){if(i.add(r.start,l)<r.end)return{startDelta:l}}else if(i.add(r.end,l)>r.start)return{endDelta:l};return null}class cw{constructor(e){this.context=e,this.isRecentPointerDateSelect=!1,this.matchesCancel=!1,this.matchesEvent=!1,this.onSelect=r=>{r.jsEvent&&(this.isRecentPointerDateSelect=!0)},this.onDocumentPointerDown=r=>{let i=this.context.options.unselectCancel,o=$l(r.origEvent);this.matchesCancel=!!Ce(o,i),this.matchesEvent=!!Ce(o,yn.SELECTOR)},this.onDocumentPointerUp=r=>{let{context:i}=this,{documentPointer:o}=this,a=i.getCurrentData();if(!o.wasTouchScroll){if(a.dateSelection&&!this.isRecentPointerDateSelect){let l=i.options.unselectAuto;l&&(!l||!this.matchesCancel)&&i.calendarApi.unselect(r)}a.eventSelection&&!this.matchesEvent&&i.dispatch({type:"UNSELECT_EVENT"})}this.isRecentPointerDateSelect=!1};let n=this.documentPointer=new Xc(document);n.shouldIgnoreMove=!0,n.shouldWatchScroll=!1,n.emitter.on("pointerdown",this.onDocumentPointerDown),n.emitter.on("pointerup",this.onDocumentPointerUp),e.emitter.on("select",this.onSelect)}destroy(){this.context.emitter.off("select",this.onSelect),this.documentPointer.destroy()}}const uw={fixedMirrorParent:S},dw={dateClick:S,eventDragStart:S,eventDragStop:S,eventDrop:S,eventResizeStart:S,eventResizeStop:S,eventResize:S,drop:S,eventReceive:S,eventLeave:S};lo.dataAttrPrefix="";var fw=dt({name:"@fullcalendar/interaction",componentInteractions:[tw,nw,yn,aw],calendarInteractions:[cw],elementDraggingImpl:bn,optionRefiners:uw,listenerRefiners:dw}),mr=typeof globalThis<"u"?globalThis:typeof window<"u"?window:typeof global<"u"?global:typeof self<"u"?self:{},li={},Ca;function hw(){return Ca||(Ca=1,(function(){var t;function e(s){var c=0;return function(){return c<s.length?{done:!1,value:s[c++]}:{done:!0}}}var n=typeof Object.defineProperties=="function"?Object.defineProperty:function(s,c,d){return s==Array.prototype||s==Object.prototype||(s[c]=d.value),s};function r(s){s=[typeof globalThis=="object"&&globalThis,s,typeof window=="object"&&window,typeof self=="object"&&self,typeof mr=="object"&&mr];for(var c=0;c<s.length;++c){var d=s[c];if(d&&d.Math==Math)return d}throw Error("Cannot find global object")}var i=r(this);function o(s,c){if(c)e:{var d=i;s=s.split(".");for(var g=0;g<s.length-1;g++){var w=s[g];if(!(w in d))break e;d=d[w]}s=s[s.length-1],g=d[s],c=c(g),c!=g&&c!=null&&n(d,s,{configurable:!0,writable:!0,value:c})}}o("Symbol",function(s){function c(y){if(this instanceof c)throw new TypeError("Symbol is not a constructor");return new d(g+(y||"")+"_"+w++,y)}function d(y,b){this.g=y,n(this,"description",{configurable:!0,writable:!0,value:b})}if(s)return s;d.prototype.toString=function(){return this.g};var g="jscomp_symbol_"+(1e9*Math.random()>>>0)+"_",w=0;return c}),o("Symbol.iterator",function(s){if(s)return s;s=Symbol("Symbol.iterator");for(var c="Array Int8Array Uint8Array Uint8ClampedArray Int16Array Uint16Array Int32Array Uint32Array Float32Array Float64Array".split(" "),d=0;d<c.length;d++){var g=i[c[d]];typeof g=="function"&&typeof g.prototype[s]!="function"&&n(g.prototype,s,{configurable:!0,writable:!0,value:function(){return a(e(this))}})}return s});function a(s){return s={next:s},s[Symbol.iterator]=function(){return this},s}function l(s){var c=typeof Symbol<"u"&&Symbol.iterator&&s[Symbol.iterator];return c?c.call(s):{next:e(s)}}function u(s){if(!(s instanceof Array)){s=l(s);for(var c,d=[];!(c=s.next()).done;)d.push(c.value);s=d}return s}var h=typeof Object.create=="function"?Object.create:function(s){function c(){}return c.prototype=s,new c},f;if(typeof Object.setPrototypeOf=="function")f=Object.setPrototypeOf;else{var v;e:{var p={a:!0},m={};try{m.__proto__=p,v=m.a;break e}catch{}v=!1}f=v?function(s,c){if(s.__proto__=c,s.__proto__!==c)throw new TypeError(s+" is not extensible");return s}:null}var E=f;function R(s,c){if(s.prototype=h(c.prototype),s.prototype.constructor=s,E)E(s,c);else for(var d in c)if(d!="prototype")if(Object.defineProperties){var g=Object.getOwnPropertyDescriptor(c,d);g&&Object.defineProperty(s,d,g)}else s[d]=c[d];s.na=c.prototype}function x(){this.l=!1,this.i=null,this.h=void 0,this.g=1,this.u=this.o=0,this.j=null}function k(s){if(s.l)throw new TypeError("Generator is already running");s.l=!0}x.prototype.s=function(s){this.h=s};function B(s,c){s.j={da:c,ea:!0},s.g=s.o||s.u}x.prototype.return=function(s){this.j={return:s},this.g=this.u};function P(s,c,d){return s.g=d,{value:c}}function $(s){this.g=new x,this.h=s}function pe(s,c){k(s.g);var d=s.g.i;return d?se(s,"return"in d?d.return:function(g){return{value:g,done:!0}},c,s.g.return):(s.g.return(c),Z(s))}function se(s,c,d,g){try{var w=c.call(s.g.i,d);if(!(w instanceof Object))throw new TypeError("Iterator result "+w+" is not an object");if(!w.done)return s.g.l=!1,w;var y=w.value}catch(b){return s.g.i=null,B(s.g,b),Z(s)}return s.g.i=null,g.call(s.g,y),Z(s)}function Z(s){for(;s.g.g;)try{var c=s.h(s.g);if(c)return s.g.l=!1,{value:c.value,done:!1}}catch(d){s.g.h=void 0,B(s.g,d)}if(s.g.l=!1,s.g.j){if(c=s.g.j,s.g.j=null,c.ea)throw c.da;return{value:c.return,done:!0}}return{value:void 0,done:!0}}function W(s){this.next=function(c){return k(s.g),s.g.i?c=se(s,s.g.i.next,c,s.g.s):(s.g.s(c),c=Z(s)),c},this.throw=function(c){return k(s.g),s.g.i?c=se(s,s.g.i.throw,c,s.g.s):(B(s.g,c),c=Z(s)),c},this.return=function(c){return pe(s,c)},this[Symbol.iterator]=function(){return this}}function Ae(s){function c(g){return s.next(g)}function d(g){return s.throw(g)}return new Promise(function(g,w){function y(b){b.done?g(b.value):Promise.resolve(b.value).then(c,d).then(y,w)}y(s.next())})}function A(s){return Ae(new W(new $(s)))}o("Promise",function(s){function c(b){this.h=0,this.i=void 0,this.g=[],this.s=!1;var C=this.j();try{b(C.resolve,C.reject)}catch(T){C.reject(T)}}function d(){this.g=null}function g(b){return b instanceof c?b:new c(function(C){C(b)})}if(s)return s;d.prototype.h=function(b){if(this.g==null){this.g=[];var C=this;this.i(function(){C.l()})}this.g.push(b)};var w=i.setTimeout;d.prototype.i=function(b){w(b,0)},d.prototype.l=function(){for(;this.g&&this.g.length;){var b=this.g;this.g=[];for(var C=0;C<b.length;++C){var T=b[C];b[C]=null;try{T()}catch(M){this.j(M)}}}this.g=null},d.prototype.j=function(b){this.i(function(){throw b})},c.prototype.j=function(){function b(M){return function(N){T||(T=!0,M.call(C,N))}}var C=this,T=!1;return{resolve:b(this.D),reject:b(this.l)}},c.prototype.D=function(b){if(b===this)this.l(new TypeError("A Promise cannot resolve to itself"));else if(b instanceof c)this.H(b);else{e:switch(typeof b){case"object":var C=b!=null;break e;case"function":C=!0;break e;default:C=!1}C?this.A(b):this.o(b)}},c.prototype.A=function(b){var C=void 0;try{C=b.then}catch(T){this.l(T);return}typeof C=="function"?this.I(C,b):this.o(b)},c.prototype.l=function(b){this.u(2,b)},c.prototype.o=function(b){this.u(1,b)},c.prototype.u=function(b,C){if(this.h!=0)throw Error("Cannot settle("+b+", "+C+"): Promise already settled in state"+this.h);this.h=b,this.i=C,this.h===2&&this.G(),this.B()},c.prototype.G=function(){var b=this;w(function(){if(b.C()){var C=i.console;typeof C<"u"&&C.error(b.i)}},1)},c.prototype.C=function(){if(this.s)return!1;var b=i.CustomEvent,C=i.Event,T=i.dispatchEvent;return typeof T>"u"?!0:(typeof b=="function"?b=new b("unhandledrejection",{cancelable:!0}):typeof C=="function"?b=new C("unhandledrejection",{cancelable:!0}):(b=i.document.createEvent("CustomEvent"),b.initCustomEvent("unhandledrejection",!1,!0,b)),b.promise=this,b.reason=this.i,T(b))},c.prototype.B=function(){if(this.g!=null){for(var b=0;b<this.g.length;++b)y.h(this.g[b]);this.g=null}};var y=new d;return c.prototype.H=function(b){var C=this.j();b.M(C.resolve,C.reject)},c.prototype.I=function(b,C){var T=this.j();try{b.call(C,T.resolve,T.reject)}catch(M){T.reject(M)}},c.prototype.then=function(b,C){function T(z,L){return typeof z=="function"?function(q){try{M(z(q))}catch(Q){N(Q)}}:L}var M,N,V=new c(function(z,L){M=z,N=L});return this.M(T(b,M),T(C,N)),V},c.prototype.catch=function(b){return this.then(void 0,b)},c.prototype.M=function(b,C){function T(){switch(M.h){case 1:b(M.i);break;case 2:C(M.i);break;default:throw Error("Unexpected state: "+M.h)}}var M=this;this.g==null?y.h(T):this.g.push(T),this.s=!0},c.resolve=g,c.reject=function(b){return new c(function(C,T){T(b)})},c.race=function(b){return new c(function(C,T){for(var M=l(b),N=M.next();!N.done;N=M.next())g(N.value).M(C,T)})},c.all=function(b){var C=l(b),T=C.next();return T.done?g([]):new c(function(M,N){function V(q){return function(Q){z[q]=Q,L--,L==0&&M(z)}}var z=[],L=0;do z.push(void 0),L++,g(T.value).M(V(z.length-1),N),T=C.next();while(!T.done)})},c});function I(s,c){s instanceof String&&(s+="");var d=0,g=!1,w={next:function(){if(!g&&d<s.length){var y=d++;return{value:c(y,s[y]),done:!1}}return g=!0,{done:!0,value:void 0}}};return w[Symbol.iterator]=function(){return w},w}var U=typeof Object.assign=="function"?Object.assign:function(s,c){for(var d=1;d<arguments.length;d++){var g=arguments[d];if(g)for(var w in g)Object.prototype.hasOwnProperty.call(g,w)&&(s[w]=g[w])}return s};o("Object.assign",function(s){return s||U}),o("Object.is",function(s){return s||function(c,d){return c===d?c!==0||1/c===1/d:c!==c&&d!==d}}),o("Array.prototype.includes",function(s){return s||function(c,d){var g=this;g instanceof String&&(g=String(g));var w=g.length;for(d=d||0,0>d&&(d=Math.max(d+w,0));d<w;d++){var y=g[d];if(y===c||Object.is(y,c))return!0}return!1}}),o("String.prototype.includes",function(s){return s||function(c,d){if(this==null)throw new TypeError("The 'this' value for String.prototype.includes must not be null or undefined");if(c instanceof RegExp)throw new TypeError("First argument to String.prototype.includes must not be a regular expression");return this.indexOf(c,d||0)!==-1}}),o("Array.prototype.keys",function(s){return s||function(){return I(this,function(c){return c})}});var G=this||self;function Y(s,c){s=s.split(".");var d=G;s[0]in d||typeof d.execScript>"u"||d.execScript("var "+s[0]);for(var g;s.length&&(g=s.shift());)s.length||c===void 0?d[g]&&d[g]!==Object.prototype[g]?d=d[g]:d=d[g]={}:d[g]=c}function ue(){throw Error("Invalid UTF8")}function O(s,c){return c=String.fromCharCode.apply(null,c),s==null?c:s+c}var F,X=typeof TextDecoder<"u",de,Me=typeof TextEncoder<"u",It={},De=null;function We(s){var c;c===void 0&&(c=0),fo(),c=It[c];for(var d=Array(Math.floor(s.length/3)),g=c[64]||"",w=0,y=0;w<s.length-2;w+=3){var b=s[w],C=s[w+1],T=s[w+2],M=c[b>>2];b=c[(b&3)<<4|C>>4],C=c[(C&15)<<2|T>>6],T=c[T&63],d[y++]=M+b+C+T}switch(M=0,T=g,s.length-w){case 2:M=s[w+1],T=c[(M&15)<<2]||g;case 1:s=s[w],d[y]=c[s>>2]+c[(s&3)<<4|M>>4]+T+g}return d.join("")}function Mt(s){var c=s.length,d=3*c/4;d%3?d=Math.floor(d):"=.".indexOf(s[c-1])!=-1&&(d="=.".indexOf(s[c-2])!=-1?d-2:d-1);var g=new Uint8Array(d),w=0;return Zt(s,function(y){g[w++]=y}),w!==d?g.subarray(0,w):g}function Zt(s,c){function d(T){for(;g<s.length;){var M=s.charAt(g++),N=De[M];if(N!=null)return N;if(!/^[\s\xa0]*$/.test(M))throw Error("Unknown base64 encoding at char: "+M)}return T}fo();for(var g=0;;){var w=d(-1),y=d(0),b=d(64),C=d(64);if(C===64&&w===-1)break;c(w<<2|y>>4),b!=64&&(c(y<<4&240|b>>2),C!=64&&c(b<<6&192|C))}}function fo(){if(!De){De={};for(var s="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789".split(""),c=["+/=","+/","-_=","-_.","-_"],d=0;5>d;d++){var g=s.concat(c[d].split(""));It[d]=g;for(var w=0;w<g.length;w++){var y=g[w];De[y]===void 0&&(De[y]=w)}}}}var ho=typeof Uint8Array=="function";function Ir(s){return ho&&s!=null&&s instanceof Uint8Array}var En;function go(s){if(this.L=s,s!==null&&s.length===0)throw Error("ByteString should be constructed with non-empty values")}var nu=typeof Uint8Array.prototype.slice=="function",Ze=0,et=0;function ru(s,c){if(s.constructor===Uint8Array)return s;if(s.constructor===ArrayBuffer)return new Uint8Array(s);if(s.constructor===Array)return new Uint8Array(s);if(s.constructor===String)return Mt(s);if(s.constructor===go)return!c&&(c=s.L)&&c.constructor===Uint8Array?c:(c=s.L,c=c==null||Ir(c)?c:typeof c=="string"?Mt(c):null,(s=s.L=c)?new Uint8Array(s):En||(En=new Uint8Array(0)));if(s instanceof Uint8Array)return new Uint8Array(s.buffer,s.byteOffset,s.byteLength);throw Error("Type not convertible to a Uint8Array, expected a Uint8Array, an ArrayBuffer, a base64 encoded string, or Array of numbers")}function po(s,c){return Error("Invalid wire type: "+s+" (at position "+c+")")}function Mr(){return Error("Failed to read varint, encoding is invalid.")}function mo(s,c){c=c===void 0?{}:c,c=c.v===void 0?!1:c.v,this.h=null,this.g=this.i=this.j=0,this.v=c,s&&Or(this,s)}function Or(s,c){s.h=ru(c,s.v),s.j=0,s.i=s.h.length,s.g=s.j}mo.prototype.reset=function(){this.g=this.j};function _e(s){if(s.g>s.i)throw Error("Tried to read past the end of the data "+s.g+" > "+s.i)}function Xt(s){var c=s.h,d=c[s.g],g=d&127;if(128>d)return s.g+=1,_e(s),g;if(d=c[s.g+1],g|=(d&127)<<7,128>d)return s.g+=2,_e(s),g;if(d=c[s.g+2],g|=(d&127)<<14,128>d)return s.g+=3,_e(s),g;if(d=c[s.g+3],g|=(d&127)<<21,128>d)return s.g+=4,_e(s),g;if(d=c[s.g+4],s.g+=5,g|=(d&15)<<28,128>d)return _e(s),g;if(128<=c[s.g++]&&128<=c[s.g++]&&128<=c[s.g++]&&128<=c[s.g++]&&128<=c[s.g++])throw Mr();return _e(s),g}var vo=[];function Br(){this.g=[]}Br.prototype.length=function(){return this.g.length},Br.prototype.end=function(){var s=this.g;return this.g=[],s};function ht(s,c){for(;127<c;)s.g.push(c&127|128),c>>>=7;s.g.push(c)}function wo(s){var c={},d=c.W===void 0?!1:c.W;this.l={v:c.v===void 0?!1:c.v},this.W=d,c=this.l,vo.length?(d=vo.pop(),c&&(d.v=c.v),s&&Or(d,s),s=d):s=new mo(s,c),this.g=s,this.j=this.g.g,this.h=this.i=-1}wo.prototype.reset=function(){this.g.reset(),this.j=this.g.g,this.h=this.i=-1};function bo(s){var c=s.g;if(c.g==c.i)return!1;s.j=s.g.g;var d=Xt(s.g)>>>0;if(c=d>>>3,d&=7,!(0<=d&&5>=d))throw po(d,s.j);if(1>c)throw Error("Invalid field number: "+c+" (at position "+s.j+")");return s.i=c,s.h=d,!0}function An(s){switch(s.h){case 0:if(s.h!=0)An(s);else e:{s=s.g;for(var c=s.g,d=c+10;c<d;)if((s.h[c++]&128)===0){s.g=c,_e(s);break e}throw Mr()}break;case 1:s=s.g,s.g+=8,_e(s);break;case 2:s.h!=2?An(s):(c=Xt(s.g)>>>0,s=s.g,s.g+=c,_e(s));break;case 5:s=s.g,s.g+=4,_e(s);break;case 3:c=s.i;do{if(!bo(s))throw Error("Unmatched start-group tag: stream EOF");if(s.h==4){if(s.i!=c)throw Error("Unmatched end-group tag");break}An(s)}while(!0);break;default:throw po(s.h,s.j)}}var Cn=[];function iu(){this.i=[],this.h=0,this.g=new Br}function Ot(s,c){c.length!==0&&(s.i.push(c),s.h+=c.length)}function ou(s,c){if(c=c.ba){Ot(s,s.g.end());for(var d=0;d<c.length;d++)Ot(s,c[d])}}var Sn=typeof Symbol=="function"&&typeof Symbol()=="symbol"?Symbol(void 0):void 0;function yo(s,c){Object.isFrozen(s)||(Sn?s[Sn]|=c:s.N!==void 0?s.N|=c:Object.defineProperties(s,{N:{value:c,configurable:!0,writable:!0,enumerable:!1}}))}function Eo(s){var c;return Sn?c=s[Sn]:c=s.N,c??0}function Jt(s){return yo(s,1),s}function Kt(s){return Array.isArray(s)?!!(Eo(s)&2):!1}function Pr(s){if(!Array.isArray(s))throw Error("cannot mark non-array as immutable");yo(s,2)}function Ao(s){return s!==null&&typeof s=="object"&&!Array.isArray(s)&&s.constructor===Object}var Dn=Object.freeze(Jt([]));function Co(s){if(Kt(s.m))throw Error("Cannot mutate an immutable Message")}var So=typeof Symbol<"u"&&typeof Symbol.hasInstance<"u";function Do(s){return{value:s,configurable:!1,writable:!1,enumerable:!1}}function Fe(s,c,d){return c===-1?null:c>=s.i?s.g?s.g[c]:void 0:d!==void 0&&d&&s.g&&(d=s.g[c],d!=null)?d:s.m[c+s.h]}function me(s,c,d,g){g=g===void 0?!1:g,Co(s),c<s.i&&!g?s.m[c+s.h]=d:(s.g||(s.g=s.m[s.i+s.h]={}))[c]=d}function _o(s,c,d,g){d=d===void 0?!0:d,g=g===void 0?!1:g;var w=Fe(s,c,g);return w==null&&(w=Dn),Kt(s.m)?d&&(Pr(w),Object.freeze(w)):(w===Dn||Kt(w))&&(w=Jt(w.slice()),me(s,c,w,g)),w}function $e(s,c,d){return s=Fe(s,c),s=s==null?s:+s,s??(d===void 0?0:d)}function _n(s,c,d,g){s.j||(s.j={});var w=Kt(s.m),y=s.j[d];if(!y){g=_o(s,d,!0,g===void 0?!1:g),y=[],w=w||Kt(g);for(var b=0;b<g.length;b++)y[b]=new c(g[b]),w&&Pr(y[b].m);w&&(Pr(y),Object.freeze(y)),s.j[d]=y}return y}function To(s,c,d,g,w){var y=y===void 0?!1:y;return Co(s),y=_n(s,d,c,y),d=g||new d,s=_o(s,c),w!=null?(y.splice(w,0,d),s.splice(w,0,d.m)):(y.push(d),s.push(d.m)),d}function xo(s,c){return s=Fe(s,c),s??0}function Ro(s,c){return s=Fe(s,c),s??""}function su(s){switch(typeof s){case"number":return isFinite(s)?s:String(s);case"object":if(s&&!Array.isArray(s)){if(Ir(s))return We(s);if(s instanceof go){var c=s.L;return c=c==null||typeof c=="string"?c:ho&&c instanceof Uint8Array?We(c):null,(s.L=c)||""}}}return s}function ko(s){var c=au;return c=c===void 0?lu:c,Mo(s,c)}function Io(s,c){if(s!=null){if(Array.isArray(s))s=Mo(s,c);else if(Ao(s)){var d={},g;for(g in s)d[g]=Io(s[g],c);s=d}else s=c(s);return s}}function Mo(s,c){for(var d=s.slice(),g=0;g<d.length;g++)d[g]=Io(d[g],c);return Array.isArray(s)&&Eo(s)&1&&Jt(d),d}function au(s){return s&&typeof s=="object"&&s.toJSON?s.toJSON():(s=su(s),Array.isArray(s)?ko(s):s)}function lu(s){return Ir(s)?new Uint8Array(s):s}function Tn(s,c,d){s||(s=Oo),Oo=null;var g=this.constructor.h;s||(s=g?[g]:[]),this.h=(g?0:-1)-(this.constructor.g||0),this.j=void 0,this.m=s;e:{if(g=this.m.length,s=g-1,g&&(g=this.m[s],Ao(g))){this.i=s-this.h,this.g=g;break e}c!==void 0&&-1<c?(this.i=Math.max(c,s+1-this.h),this.g=void 0):this.i=Number.MAX_VALUE}if(d)for(c=0;c<d.length;c++)if(s=d[c],s<this.i)s+=this.h,(g=this.m[s])?Array.isArray(g)&&Jt(g):this.m[s]=Dn;else{g=this.g||(this.g=this.m[this.i+this.h]={});var w=g[s];w?Array.isArray(w)&&Jt(w):g[s]=Dn}}Tn.prototype.toJSON=function(){return ko(this.m)},Tn.prototype.toString=function(){return this.m.toString()};var Oo;function xn(){Tn.apply(this,arguments)}if(R(xn,Tn),So){var Bo={};Object.defineProperties(xn,(Bo[Symbol.hasInstance]=Do(function(){throw Error("Cannot perform instanceof checks for MutableMessage")}),Bo))}function Po(s,c,d){if(d){var g={},w;for(w in d){var y=d[w],b=y.ha;b||(g.F=y.la||y.fa.P,y.aa?(g.U=jo(y.aa),b=(function(C){return function(T,M,N){return C.F(T,M,N,C.U)}})(g)):y.ca?(g.T=Fo(y.X.g,y.ca),b=(function(C){return function(T,M,N){return C.F(T,M,N,C.T)}})(g)):b=g.F,y.ha=b),b(c,s,y.X),g={F:g.F,U:g.U,T:g.T}}}ou(c,s)}var Rn=Symbol();function No(s,c,d){return s[Rn]||(s[Rn]=function(g,w){return c(g,w,d)})}function Lo(s){var c=s[Rn];if(!c){var d=Wo(s);c=function(g,w){return $o(g,w,d)},s[Rn]=c}return c}function cu(s){var c=s.aa;if(c)return Lo(c);if(c=s.ka)return No(s.X.g,c,s.ca)}function uu(s){var c=cu(s),d=s.X,g=s.fa.O;return c?function(w,y){return g(w,y,d,c)}:function(w,y){return g(w,y,d)}}function Ho(s,c,d,g,w,y){s=s();var b=0;for(s.length&&typeof s[0]!="number"&&(d(c,s[0]),b++);b<s.length;){d=s[b++];for(var C=b+1;C<s.length&&typeof s[C]!="number";)C++;var T=s[b++];switch(C-=b,C){case 0:g(c,d,T);break;case 1:g(c,d,T,s[b++]);break;case 2:w(c,d,T,s[b++],s[b++]);break;case 3:C=s[b++];var M=s[b++],N=s[b++];Array.isArray(N)?w(c,d,T,C,M,N):y(c,d,T,C,M,N);break;case 4:y(c,d,T,s[b++],s[b++],s[b++],s[b++]);break;default:throw Error("unexpected number of binary field arguments: "+C)}}return c}var kn=Symbol();function jo(s){var c=s[kn];if(!c){var d=Vo(s);c=function(g,w){return Go(g,w,d)},s[kn]=c}return c}function Fo(s,c){var d=s[kn];return d||(d=function(g,w){return Po(g,w,c)},s[kn]=d),d}var Uo=Symbol();function du(s,c){s.push(c)}function fu(s,c,d){s.push(c,d.P)}function hu(s,c,d,g,w){var y=jo(w),b=d.P;s.push(c,function(C,T,M){return b(C,T,M,g,y)})}function gu(s,c,d,g,w,y){var b=Fo(g,y),C=d.P;s.push(c,function(T,M,N){return C(T,M,N,g,b)})}function Vo(s){var c=s[Uo];return c||Ho(s,s[Uo]=[],du,fu,hu,gu)}var zo=Symbol();function pu(s,c){s[0]=c}function mu(s,c,d,g){var w=d.O;s[c]=g?function(y,b,C){return w(y,b,C,g)}:w}function vu(s,c,d,g,w,y){var b=d.O,C=Lo(w);s[c]=function(T,M,N){return b(T,M,N,g,C,y)}}function wu(s,c,d,g,w,y,b){var C=d.O,T=No(g,w,y);s[c]=function(M,N,V){return C(M,N,V,g,T,b)}}function Wo(s){var c=s[zo];return c||Ho(s,s[zo]={},pu,mu,vu,wu)}function $o(s,c,d){for(;bo(c)&&c.h!=4;){var g=c.i,w=d[g];if(!w){var y=d[0];y&&(y=y[g])&&(w=d[g]=uu(y))}if((!w||!w(c,s,g))&&(w=c,g=s,y=w.j,An(w),!w.W)){var b=w.g.h;w=w.g.g,w=y===w?En||(En=new Uint8Array(0)):nu?b.slice(y,w):new Uint8Array(b.subarray(y,w)),(y=g.ba)?y.push(w):g.ba=[w]}}return s}function Nr(s,c,d){if(Cn.length){var g=Cn.pop();s&&(Or(g.g,s),g.i=-1,g.h=-1),s=g}else s=new wo(s);try{return $o(new c,s,Wo(d))}finally{c=s.g,c.h=null,c.j=0,c.i=0,c.g=0,c.v=!1,s.i=-1,s.h=-1,100>Cn.length&&Cn.push(s)}}function Go(s,c,d){for(var g=d.length,w=g%2==1,y=w?1:0;y<g;y+=2)(0,d[y+1])(c,s,d[y]);Po(s,c,w?d[0]:void 0)}function Lr(s,c){var d=new iu;Go(s,d,Vo(c)),Ot(d,d.g.end()),s=new Uint8Array(d.h),c=d.i;for(var g=c.length,w=0,y=0;y<g;y++){var b=c[y];s.set(b,w),w+=b.length}return d.i=[s],s}function en(s,c){return{O:s,P:c}}var Ue=en(function(s,c,d){if(s.h!==5)return!1;s=s.g;var g=s.h[s.g],w=s.h[s.g+1],y=s.h[s.g+2],b=s.h[s.g+3];return s.g+=4,_e(s),w=(g<<0|w<<8|y<<16|b<<24)>>>0,s=2*(w>>31)+1,g=w>>>23&255,w&=8388607,me(c,d,g==255?w?NaN:1/0*s:g==0?s*Math.pow(2,-149)*w:s*Math.pow(2,g-150)*(w+Math.pow(2,23))),!0},function(s,c,d){if(c=Fe(c,d),c!=null){ht(s.g,8*d+5),s=s.g;var g=c;g=(d=0>g?1:0)?-g:g,g===0?0<1/g?Ze=et=0:(et=0,Ze=2147483648):isNaN(g)?(et=0,Ze=2147483647):34028234663852886e22<g?(et=0,Ze=(d<<31|2139095040)>>>0):11754943508222875e-54>g?(g=Math.round(g/Math.pow(2,-149)),et=0,Ze=(d<<31|g)>>>0):(c=Math.floor(Math.log(g)/Math.LN2),g*=Math.pow(2,-c),g=Math.round(8388608*g),16777216<=g&&++c,et=0,Ze=(d<<31|c+127<<23|g&8388607)>>>0),d=Ze,s.g.push(d>>>0&255),s.g.push(d>>>8&255),s.g.push(d>>>16&255),s.g.push(d>>>24&255)}}),bu=en(function(s,c,d){if(s.h!==0)return!1;for(var g=s.g,w=128,y=0,b=s=0;4>b&&128<=w;b++)w=g.h[g.g++],_e(g),y|=(w&127)<<7*b;if(128<=w&&(w=g.h[g.g++],_e(g),y|=(w&127)<<28,s|=(w&127)>>4),128<=w)for(b=0;5>b&&128<=w;b++)w=g.h[g.g++],_e(g),s|=(w&127)<<7*b+3;if(128>w)g=y>>>0,w=s>>>0,(s=w&2147483648)&&(g=~g+1>>>0,w=~w>>>0,g==0&&(w=w+1>>>0)),g=4294967296*w+(g>>>0);else throw Mr();return me(c,d,s?-g:g),!0},function(s,c,d){if(c=Fe(c,d),c!=null&&c!=null){ht(s.g,8*d),s=s.g;var g=c;for(d=0>g,g=Math.abs(g),c=g>>>0,g=Math.floor((g-c)/4294967296),g>>>=0,d&&(g=~g>>>0,c=(~c>>>0)+1,4294967295<c&&(c=0,g++,4294967295<g&&(g=0))),Ze=c,et=g,d=Ze,c=et;0<c||127<d;)s.g.push(d&127|128),d=(d>>>7|c<<25)>>>0,c>>>=7;s.g.push(d)}}),yu=en(function(s,c,d){return s.h!==0?!1:(me(c,d,Xt(s.g)),!0)},function(s,c,d){if(c=Fe(c,d),c!=null&&c!=null)if(ht(s.g,8*d),s=s.g,d=c,0<=d)ht(s,d);else{for(c=0;9>c;c++)s.g.push(d&127|128),d>>=7;s.g.push(1)}}),qo=en(function(s,c,d){if(s.h!==2)return!1;var g=Xt(s.g)>>>0;s=s.g;var w=s.g;s.g+=g,_e(s),s=s.h;var y;if(X)(y=F)||(y=F=new TextDecoder("utf-8",{fatal:!0})),y=y.decode(s.subarray(w,w+g));else{g=w+g;for(var b=[],C=null,T,M,N;w<g;)T=s[w++],128>T?b.push(T):224>T?w>=g?ue():(M=s[w++],194>T||(M&192)!==128?(w--,ue()):b.push((T&31)<<6|M&63)):240>T?w>=g-1?ue():(M=s[w++],(M&192)!==128||T===224&&160>M||T===237&&160<=M||((y=s[w++])&192)!==128?(w--,ue()):b.push((T&15)<<12|(M&63)<<6|y&63)):244>=T?w>=g-2?ue():(M=s[w++],(M&192)!==128||(T<<28)+(M-144)>>30!==0||((y=s[w++])&192)!==128||((N=s[w++])&192)!==128?(w--,ue()):(T=(T&7)<<18|(M&63)<<12|(y&63)<<6|N&63,T-=65536,b.push((T>>10&1023)+55296,(T&1023)+56320))):ue(),8192<=b.length&&(C=O(C,b),b.length=0);y=O(C,b)}return me(c,d,y),!0},function(s,c,d){if(c=Fe(c,d),c!=null){var g=!1;if(g=g===void 0?!1:g,Me){if(g&&/(?:[^\uD800-\uDBFF]|^)[\uDC00-\uDFFF]|[\uD800-\uDBFF](?![\uDC00-\uDFFF])/.test(c))throw Error("Found an unpaired surrogate");c=(de||(de=new TextEncoder)).encode(c)}else{for(var w=0,y=new Uint8Array(3*c.length),b=0;b<c.length;b++){var C=c.charCodeAt(b);if(128>C)y[w++]=C;else{if(2048>C)y[w++]=C>>6|192;else{if(55296<=C&&57343>=C){if(56319>=C&&b<c.length){var T=c.charCodeAt(++b);if(56320<=T&&57343>=T){C=1024*(C-55296)+T-56320+65536,y[w++]=C>>18|240,y[w++]=C>>12&63|128,y[w++]=C>>6&63|128,y[w++]=C&63|128;continue}else b--}if(g)throw Error("Found an unpaired surrogate");C=65533}y[w++]=C>>12|224,y[w++]=C>>6&63|128}y[w++]=C&63|128}}c=y.subarray(0,w)}ht(s.g,8*d+2),ht(s.g,c.length),Ot(s,s.g.end()),Ot(s,c)}}),Yo=en(function(s,c,d,g,w){if(s.h!==2)return!1;c=To(c,d,g),d=s.g.i,g=Xt(s.g)>>>0;var y=s.g.g+g,b=y-d;if(0>=b&&(s.g.i=y,w(c,s),b=y-s.g.g),b)throw Error("Message parsing ended unexpectedly. Expected to read "+(g+" bytes, instead read "+(g-b)+" bytes, either the data ended unexpectedly or the message misreported its own length"));return s.g.g=y,s.g.i=d,!0},function(s,c,d,g,w){if(c=_n(c,g,d),c!=null)for(g=0;g<c.length;g++){var y=s;ht(y.g,8*d+2);var b=y.g.end();Ot(y,b),b.push(y.h),y=b,w(c[g],s),b=s;var C=y.pop();for(C=b.h+b.g.length()-C;127<C;)y.push(C&127|128),C>>>=7,b.h++;y.push(C),b.h++}});function Le(){xn.apply(this,arguments)}if(R(Le,xn),So){var Qo={};Object.defineProperties(Le,(Qo[Symbol.hasInstance]=Do(Object[Symbol.hasInstance]),Qo))}function tn(s){Le.call(this,s)}R(tn,Le);function Zo(){return[1,yu,2,Ue,3,qo,4,qo]}function Hr(s){Le.call(this,s,-1,Au)}R(Hr,Le),Hr.prototype.addClassification=function(s,c){return To(this,1,tn,s,c),this};function Eu(){return[1,Yo,tn,Zo]}var Au=[1];function In(s){Le.call(this,s)}R(In,Le);function Xo(){return[1,Ue,2,Ue,3,Ue,4,Ue,5,Ue]}function Jo(s){Le.call(this,s,-1,Su)}R(Jo,Le);function Cu(){return[1,Yo,In,Xo]}var Su=[1];function jr(s){Le.call(this,s)}R(jr,Le);function Ko(){return[1,Ue,2,Ue,3,Ue,4,Ue,5,Ue,6,bu]}var es=[[61,146],[146,91],[91,181],[181,84],[84,17],[17,314],[314,405],[405,321],[321,375],[375,291],[61,185],[185,40],[40,39],[39,37],[37,0],[0,267],[267,269],[269,270],[270,409],[409,291],[78,95],[95,88],[88,178],[178,87],[87,14],[14,317],[317,402],[402,318],[318,324],[324,308],[78,191],[191,80],[80,81],[81,82],[82,13],[13,312],[312,311],[311,310],[310,415],[415,308]],ts=[[263,249],[249,390],[390,373],[373,374],[374,380],[380,381],[381,382],[382,362],[263,466],[466,388],[388,387],[387,386],[386,385],[385,384],[384,398],[398,362]],ns=[[276,283],[283,282],[282,295],[295,285],[300,293],[293,334],[334,296],[296,336]],rs=[[33,7],[7,163],[163,144],[144,145],[145,153],[153,154],[154,155],[155,133],[33,246],[246,161],[161,160],[160,159],[159,158],[158,157],[157,173],[173,133]],is=[[46,53],[53,52],[52,65],[65,55],[70,63],[63,105],[105,66],[66,107]],os=[[10,338],[338,297],[297,332],[332,284],[284,251],[251,389],[389,356],[356,454],[454,323],[323,361],[361,288],[288,397],[397,365],[365,379],[379,378],[378,400],[400,377],[377,152],[152,148],[148,176],[176,149],[149,150],[150,136],[136,172],[172,58],[58,132],[132,93],[93,234],[234,127],[127,162],[162,21],[21,54],[54,103],[103,67],[67,109],[109,10]],Du=[].concat(u(es),u(ts),u(ns),u(rs),u(is),u(os));function ss(s,c,d){if(d=s.createShader(d===0?s.VERTEX_SHADER:s.FRAGMENT_SHADER),s.shaderSource(d,c),s.compileShader(d),!s.getShaderParameter(d,s.COMPILE_STATUS))throw Error(`Could not compile WebGL shader.
-
-`+s.getShaderInfoLog(d));return d}function _u(s){return _n(s,tn,1).map(function(c){return{index:xo(c,1),ga:$e(c,2),label:Fe(c,3)!=null?Ro(c,3):void 0,displayName:Fe(c,4)!=null?Ro(c,4):void 0}})}function Tu(s){return{x:$e(s,1),y:$e(s,2),z:$e(s,3),visibility:Fe(s,4)!=null?$e(s,4):void 0}}function Fr(s,c){this.h=s,this.g=c,this.l=0}function as(s,c,d){return xu(s,c),typeof s.g.canvas.transferToImageBitmap=="function"?Promise.resolve(s.g.canvas.transferToImageBitmap()):d?Promise.resolve(s.g.canvas):typeof createImageBitmap=="function"?createImageBitmap(s.g.canvas):(s.i===void 0&&(s.i=document.createElement("canvas")),new Promise(function(g){s.i.height=s.g.canvas.height,s.i.width=s.g.canvas.width,s.i.getContext("2d",{}).drawImage(s.g.canvas,0,0,s.g.canvas.width,s.g.canvas.height),g(s.i)}))}function xu(s,c){var d=s.g;if(s.o===void 0){var g=ss(d,`
-  attribute vec2 aVertex;
-  attribute vec2 aTex;
-  varying vec2 vTex;
-  void main(void) {
-    gl_Position = vec4(aVertex, 0.0, 1.0);
-    vTex = aTex;
-  }`,0),w=ss(d,`
-  precision mediump float;
-  varying vec2 vTex;
-  uniform sampler2D sampler0;
-  void main(){
-    gl_FragColor = texture2D(sampler0, vTex);
-  }`,1),y=d.createProgram();if(d.attachShader(y,g),d.attachShader(y,w),d.linkProgram(y),!d.getProgramParameter(y,d.LINK_STATUS))throw Error(`Could not compile WebGL program.
-
-`+d.getProgramInfoLog(y));g=s.o=y,d.useProgram(g),w=d.getUniformLocation(g,"sampler0"),s.j={K:d.getAttribLocation(g,"aVertex"),J:d.getAttribLocation(g,"aTex"),ma:w},s.u=d.createBuffer(),d.bindBuffer(d.ARRAY_BUFFER,s.u),d.enableVertexAttribArray(s.j.K),d.vertexAttribPointer(s.j.K,2,d.FLOAT,!1,0,0),d.bufferData(d.ARRAY_BUFFER,new Float32Array([-1,-1,-1,1,1,1,1,-1]),d.STATIC_DRAW),d.bindBuffer(d.ARRAY_BUFFER,null),s.s=d.createBuffer(),d.bindBuffer(d.ARRAY_BUFFER,s.s),d.enableVertexAttribArray(s.j.J),d.vertexAttribPointer(s.j.J,2,d.FLOAT,!1,0,0),d.bufferData(d.ARRAY_BUFFER,new Float32Array([0,1,0,0,1,0,1,1]),d.STATIC_DRAW),d.bindBuffer(d.ARRAY_BUFFER,null),d.uniform1i(w,0)}g=s.j,d.useProgram(s.o),d.canvas.width=c.width,d.canvas.height=c.height,d.viewport(0,0,c.width,c.height),d.activeTexture(d.TEXTURE0),s.h.bindTexture2d(c.glName),d.enableVertexAttribArray(g.K),d.bindBuffer(d.ARRAY_BUFFER,s.u),d.vertexAttribPointer(g.K,2,d.FLOAT,!1,0,0),d.enableVertexAttribArray(g.J),d.bindBuffer(d.ARRAY_BUFFER,s.s),d.vertexAttribPointer(g.J,2,d.FLOAT,!1,0,0),d.bindFramebuffer(d.DRAW_FRAMEBUFFER?d.DRAW_FRAMEBUFFER:d.FRAMEBUFFER,null),d.clearColor(0,0,0,0),d.clear(d.COLOR_BUFFER_BIT),d.colorMask(!0,!0,!0,!0),d.drawArrays(d.TRIANGLE_FAN,0,4),d.disableVertexAttribArray(g.K),d.disableVertexAttribArray(g.J),d.bindBuffer(d.ARRAY_BUFFER,null),s.h.bindTexture2d(0)}function Ru(s){this.g=s}var ku=new Uint8Array([0,97,115,109,1,0,0,0,1,4,1,96,0,0,3,2,1,0,10,9,1,7,0,65,0,253,15,26,11]);function Iu(s,c){return c+s}function ls(s,c){window[s]=c}function Mu(s){var c=document.createElement("script");return c.setAttribute("src",s),c.setAttribute("crossorigin","anonymous"),new Promise(function(d){c.addEventListener("load",function(){d()},!1),c.addEventListener("error",function(){d()},!1),document.body.appendChild(c)})}function Ou(){return A(function(s){switch(s.g){case 1:return s.o=2,P(s,WebAssembly.instantiate(ku),4);case 4:s.g=3,s.o=0;break;case 2:return s.o=0,s.j=null,s.return(!1);case 3:return s.return(!0)}})}function Ur(s){if(this.g=s,this.listeners={},this.j={},this.H={},this.o={},this.u={},this.I=this.s=this.Z=!0,this.D=Promise.resolve(),this.Y="",this.C={},this.locateFile=s&&s.locateFile||Iu,typeof window=="object")var c=window.location.pathname.toString().substring(0,window.location.pathname.toString().lastIndexOf("/"))+"/";else if(typeof location<"u")c=location.pathname.toString().substring(0,location.pathname.toString().lastIndexOf("/"))+"/";else throw Error("solutions can only be loaded on a web page or in a web worker");if(this.$=c,s.options){c=l(Object.keys(s.options));for(var d=c.next();!d.done;d=c.next()){d=d.value;var g=s.options[d].default;g!==void 0&&(this.j[d]=typeof g=="function"?g():g)}}}t=Ur.prototype,t.close=function(){return this.i&&this.i.delete(),Promise.resolve()};function Bu(s){var c,d,g,w,y,b,C,T,M,N,V;return A(function(z){switch(z.g){case 1:return s.Z?(c=s.g.files===void 0?[]:typeof s.g.files=="function"?s.g.files(s.j):s.g.files,P(z,Ou(),2)):z.return();case 2:if(d=z.h,typeof window=="object")return ls("createMediapipeSolutionsWasm",{locateFile:s.locateFile}),ls("createMediapipeSolutionsPackedAssets",{locateFile:s.locateFile}),b=c.filter(function(L){return L.data!==void 0}),C=c.filter(function(L){return L.data===void 0}),T=Promise.all(b.map(function(L){var q=Mn(s,L.url);if(L.path!==void 0){var Q=L.path;q=q.then(function(oe){return s.overrideFile(Q,oe),Promise.resolve(oe)})}return q})),M=Promise.all(C.map(function(L){return L.simd===void 0||L.simd&&d||!L.simd&&!d?Mu(s.locateFile(L.url,s.$)):Promise.resolve()})).then(function(){var L,q,Q;return A(function(oe){if(oe.g==1)return L=window.createMediapipeSolutionsWasm,q=window.createMediapipeSolutionsPackedAssets,Q=s,P(oe,L(q),2);Q.h=oe.h,oe.g=0})}),N=(function(){return A(function(L){return s.g.graph&&s.g.graph.url?L=P(L,Mn(s,s.g.graph.url),0):(L.g=0,L=void 0),L})})(),P(z,Promise.all([M,T,N]),7);if(typeof importScripts!="function")throw Error("solutions can only be loaded on a web page or in a web worker");return g=c.filter(function(L){return L.simd===void 0||L.simd&&d||!L.simd&&!d}).map(function(L){return s.locateFile(L.url,s.$)}),importScripts.apply(null,u(g)),w=s,P(z,createMediapipeSolutionsWasm(Module),6);case 6:w.h=z.h,s.l=new OffscreenCanvas(1,1),s.h.canvas=s.l,y=s.h.GL.createContext(s.l,{antialias:!1,alpha:!1,ja:typeof WebGL2RenderingContext<"u"?2:1}),s.h.GL.makeContextCurrent(y),z.g=4;break;case 7:if(s.l=document.createElement("canvas"),V=s.l.getContext("webgl2",{}),!V&&(V=s.l.getContext("webgl",{}),!V))return alert("Failed to create WebGL canvas context when passing video frame."),z.return();s.G=V,s.h.canvas=s.l,s.h.createContext(s.l,!0,!0,{});case 4:s.i=new s.h.SolutionWasm,s.Z=!1,z.g=0}})}function Pu(s){var c,d,g,w,y,b,C,T;return A(function(M){if(M.g==1){if(s.g.graph&&s.g.graph.url&&s.Y===s.g.graph.url)return M.return();if(s.s=!0,!s.g.graph||!s.g.graph.url){M.g=2;return}return s.Y=s.g.graph.url,P(M,Mn(s,s.g.graph.url),3)}for(M.g!=2&&(c=M.h,s.i.loadGraph(c)),d=l(Object.keys(s.C)),g=d.next();!g.done;g=d.next())w=g.value,s.i.overrideFile(w,s.C[w]);if(s.C={},s.g.listeners)for(y=l(s.g.listeners),b=y.next();!b.done;b=y.next())C=b.value,ju(s,C);T=s.j,s.j={},s.setOptions(T),M.g=0})}t.reset=function(){var s=this;return A(function(c){s.i&&(s.i.reset(),s.o={},s.u={}),c.g=0})},t.setOptions=function(s,c){var d=this;if(c=c||this.g.options){for(var g=[],w=[],y={},b=l(Object.keys(s)),C=b.next();!C.done;y={R:y.R,S:y.S},C=b.next()){var T=C.value;T in this.j&&this.j[T]===s[T]||(this.j[T]=s[T],C=c[T],C!==void 0&&(C.onChange&&(y.R=C.onChange,y.S=s[T],g.push((function(M){return function(){var N;return A(function(V){if(V.g==1)return P(V,M.R(M.S),2);N=V.h,N===!0&&(d.s=!0),V.g=0})}})(y))),C.graphOptionXref&&(T={valueNumber:C.type===1?s[T]:0,valueBoolean:C.type===0?s[T]:!1,valueString:C.type===2?s[T]:""},C=Object.assign(Object.assign(Object.assign({},{calculatorName:"",calculatorIndex:0}),C.graphOptionXref),T),w.push(C))))}(g.length!==0||w.length!==0)&&(this.s=!0,this.B=(this.B===void 0?[]:this.B).concat(w),this.A=(this.A===void 0?[]:this.A).concat(g))}};function Nu(s){var c,d,g,w,y,b,C;return A(function(T){switch(T.g){case 1:if(!s.s)return T.return();if(!s.A){T.g=2;break}c=l(s.A),d=c.next();case 3:if(d.done){T.g=5;break}return g=d.value,P(T,g(),4);case 4:d=c.next(),T.g=3;break;case 5:s.A=void 0;case 2:if(s.B){for(w=new s.h.GraphOptionChangeRequestList,y=l(s.B),b=y.next();!b.done;b=y.next())C=b.value,w.push_back(C);s.i.changeOptions(w),w.delete(),s.B=void 0}s.s=!1,T.g=0}})}t.initialize=function(){var s=this;return A(function(c){return c.g==1?P(c,Bu(s),2):c.g!=3?P(c,Pu(s),3):P(c,Nu(s),0)})};function Mn(s,c){var d,g;return A(function(w){return c in s.H?w.return(s.H[c]):(d=s.locateFile(c,""),g=fetch(d).then(function(y){return y.arrayBuffer()}),s.H[c]=g,w.return(g))})}t.overrideFile=function(s,c){this.i?this.i.overrideFile(s,c):this.C[s]=c},t.clearOverriddenFiles=function(){this.C={},this.i&&this.i.clearOverriddenFiles()},t.send=function(s,c){var d=this,g,w,y,b,C,T,M,N,V;return A(function(z){switch(z.g){case 1:return d.g.inputs?(g=1e3*(c??performance.now()),P(z,d.D,2)):z.return();case 2:return P(z,d.initialize(),3);case 3:for(w=new d.h.PacketDataList,y=l(Object.keys(s)),b=y.next();!b.done;b=y.next())if(C=b.value,T=d.g.inputs[C]){e:{var L=s[C];switch(T.type){case"video":var q=d.o[T.stream];if(q||(q=new Fr(d.h,d.G),d.o[T.stream]=q),q.l===0&&(q.l=q.h.createTexture()),typeof HTMLVideoElement<"u"&&L instanceof HTMLVideoElement)var Q=L.videoWidth,oe=L.videoHeight;else typeof HTMLImageElement<"u"&&L instanceof HTMLImageElement?(Q=L.naturalWidth,oe=L.naturalHeight):(Q=L.width,oe=L.height);oe={glName:q.l,width:Q,height:oe},Q=q.g,Q.canvas.width=oe.width,Q.canvas.height=oe.height,Q.activeTexture(Q.TEXTURE0),q.h.bindTexture2d(q.l),Q.texImage2D(Q.TEXTURE_2D,0,Q.RGBA,Q.RGBA,Q.UNSIGNED_BYTE,L),q.h.bindTexture2d(0),q=oe;break e;case"detections":for(q=d.o[T.stream],q||(q=new Ru(d.h),d.o[T.stream]=q),q.data||(q.data=new q.g.DetectionListData),q.data.reset(L.length),oe=0;oe<L.length;++oe){Q=L[oe];var re=q.data,Ee=re.setBoundingBox,He=oe,Re=Q.boundingBox,J=new jr;if(me(J,1,Re.xCenter),me(J,2,Re.yCenter),me(J,3,Re.height),me(J,4,Re.width),me(J,5,Re.rotation),me(J,6,Re.rectId),Re=Lr(J,Ko),Ee.call(re,He,Re),Q.landmarks)for(re=0;re<Q.landmarks.length;++re){J=Q.landmarks[re];var ve=!!J.visibility;Ee=q.data,He=Ee.addNormalizedLandmark,Re=oe,J=Object.assign(Object.assign({},J),{visibility:ve?J.visibility:0}),ve=new In,me(ve,1,J.x),me(ve,2,J.y),me(ve,3,J.z),J.visibility&&me(ve,4,J.visibility),J=Lr(ve,Xo),He.call(Ee,Re,J)}if(Q.V)for(re=0;re<Q.V.length;++re)Ee=q.data,He=Ee.addClassification,Re=oe,J=Q.V[re],ve=new tn,me(ve,2,J.ga),J.index&&me(ve,1,J.index),J.label&&me(ve,3,J.label),J.displayName&&me(ve,4,J.displayName),J=Lr(ve,Zo),He.call(Ee,Re,J)}q=q.data;break e;default:q={}}}switch(M=q,N=T.stream,T.type){case"video":w.pushTexture2d(Object.assign(Object.assign({},M),{stream:N,timestamp:g}));break;case"detections":V=M,V.stream=N,V.timestamp=g,w.pushDetectionList(V);break;default:throw Error("Unknown input config type: '"+T.type+"'")}}return d.i.send(w),P(z,d.D,4);case 4:w.delete(),z.g=0}})};function Lu(s,c,d){var g,w,y,b,C,T,M,N,V,z,L,q,Q,oe;return A(function(re){switch(re.g){case 1:if(!d)return re.return(c);for(g={},w=0,y=l(Object.keys(d)),b=y.next();!b.done;b=y.next())C=b.value,T=d[C],typeof T!="string"&&T.type==="texture"&&c[T.stream]!==void 0&&++w;1<w&&(s.I=!1),M=l(Object.keys(d)),b=M.next();case 2:if(b.done){re.g=4;break}if(N=b.value,V=d[N],typeof V=="string")return Q=g,oe=N,P(re,Hu(s,N,c[V]),14);if(z=c[V.stream],V.type==="detection_list"){if(z){for(var Ee=z.getRectList(),He=z.getLandmarksList(),Re=z.getClassificationsList(),J=[],ve=0;ve<Ee.size();++ve){var tt=Nr(Ee.get(ve),jr,Ko);tt={boundingBox:{xCenter:$e(tt,1),yCenter:$e(tt,2),height:$e(tt,3),width:$e(tt,4),rotation:$e(tt,5,0),rectId:xo(tt,6)},landmarks:_n(Nr(He.get(ve),Jo,Cu),In,1).map(Tu),V:_u(Nr(Re.get(ve),Hr,Eu))},J.push(tt)}Ee=J}else Ee=[];g[N]=Ee,re.g=7;break}if(V.type==="proto_list"){if(z){for(Ee=Array(z.size()),He=0;He<z.size();He++)Ee[He]=z.get(He);z.delete()}else Ee=[];g[N]=Ee,re.g=7;break}if(z===void 0){re.g=3;break}if(V.type==="float_list"){g[N]=z,re.g=7;break}if(V.type==="proto"){g[N]=z,re.g=7;break}if(V.type!=="texture")throw Error("Unknown output config type: '"+V.type+"'");return L=s.u[N],L||(L=new Fr(s.h,s.G),s.u[N]=L),P(re,as(L,z,s.I),13);case 13:q=re.h,g[N]=q;case 7:V.transform&&g[N]&&(g[N]=V.transform(g[N])),re.g=3;break;case 14:Q[oe]=re.h;case 3:b=M.next(),re.g=2;break;case 4:return re.return(g)}})}function Hu(s,c,d){var g;return A(function(w){return typeof d=="number"||d instanceof Uint8Array||d instanceof s.h.Uint8BlobList?w.return(d):d instanceof s.h.Texture2dDataOut?(g=s.u[c],g||(g=new Fr(s.h,s.G),s.u[c]=g),w.return(as(g,d,s.I))):w.return(void 0)})}function ju(s,c){for(var d=c.name||"$",g=[].concat(u(c.wants)),w=new s.h.StringList,y=l(c.wants),b=y.next();!b.done;b=y.next())w.push_back(b.value);y=s.h.PacketListener.implement({onResults:function(C){for(var T={},M=0;M<c.wants.length;++M)T[g[M]]=C.get(M);var N=s.listeners[d];N&&(s.D=Lu(s,T,c.outs).then(function(V){V=N(V);for(var z=0;z<c.wants.length;++z){var L=T[g[z]];typeof L=="object"&&L.hasOwnProperty&&L.hasOwnProperty("delete")&&L.delete()}V&&(s.D=V)}))}}),s.i.attachMultiListener(w,y),w.delete()}t.onResults=function(s,c){this.listeners[c||"$"]=s},Y("Solution",Ur),Y("OptionType",{BOOL:0,NUMBER:1,ia:2,0:"BOOL",1:"NUMBER",2:"STRING"});function cs(s){var c=this;s=s||{};var d={url:"face_detection_short.binarypb"},g={type:1,graphOptionXref:{calculatorType:"TensorsToDetectionsCalculator",calculatorName:"facedetectionshortrangegpu__facedetectionshortrangecommon__TensorsToDetectionsCalculator",fieldName:"min_score_thresh"}};this.g=new Ur({locateFile:s.locateFile,files:[{data:!0,url:"face_detection_short.binarypb"},{data:!0,url:"face_detection_short_range.tflite"},{simd:!0,url:"face_detection_solution_simd_wasm_bin.js"},{simd:!1,url:"face_detection_solution_wasm_bin.js"}],graph:d,listeners:[{wants:["detections","image_transformed"],outs:{image:"image_transformed",detections:{type:"detection_list",stream:"detections"}}}],inputs:{image:{type:"video",stream:"input_frames_gpu"}},options:{useCpuInference:{type:0,graphOptionXref:{calculatorType:"InferenceCalculator",fieldName:"use_cpu_inference"},default:typeof window!="object"||window.navigator===void 0?!1:"iPad Simulator;iPhone Simulator;iPod Simulator;iPad;iPhone;iPod".split(";").includes(navigator.platform)||navigator.userAgent.includes("Mac")&&"ontouchend"in document},selfieMode:{type:0,graphOptionXref:{calculatorType:"GlScalerCalculator",calculatorIndex:1,fieldName:"flip_horizontal"}},model:{type:0,onChange:function(w){var y,b,C,T,M,N;return A(function(V){switch(V.g){case 1:y=w==="short"?["face_detection_short_range.tflite"]:["face_detection_full_range_sparse.tflite"],b=l(y),C=b.next();case 2:if(C.done){V.g=4;break}return T=C.value,M="third_party/mediapipe/modules/face_detection/"+T,P(V,Mn(c.g,T),5);case 5:N=V.h,c.g.overrideFile(M,N),C=b.next(),V.g=2;break;case 4:return d.url=w==="short"?"face_detection_short.binarypb":"face_detection_full.binarypb",g.graphOptionXref.calculatorName=w==="short"?"facedetectionshortrangegpu__facedetectionshortrangecommon__TensorsToDetectionsCalculator":"facedetectionfullrangegpu__facedetectionfullrangecommon__TensorsToDetectionsCalculator",V.return(!0)}})}},minDetectionConfidence:g}})}t=cs.prototype,t.close=function(){return this.g.close(),Promise.resolve()},t.onResults=function(s){this.g.onResults(s)},t.initialize=function(){var s=this;return A(function(c){return P(c,s.g.initialize(),0)})},t.reset=function(){this.g.reset()},t.send=function(s){var c=this;return A(function(d){return P(d,c.g.send(s),0)})},t.setOptions=function(s){this.g.setOptions(s)},Y("FaceDetection",cs),Y("FACEDETECTION_LIPS",es),Y("FACEDETECTION_LEFT_EYE",ts),Y("FACEDETECTION_LEFT_EYEBROW",ns),Y("FACEDETECTION_RIGHT_EYE",rs),Y("FACEDETECTION_RIGHT_EYEBROW",is),Y("FACEDETECTION_FACE_OVAL",os),Y("FACEDETECTION_CONTOURS",Du),Y("FACEDETECTION_TESSELATION",[[127,34],[34,139],[139,127],[11,0],[0,37],[37,11],[232,231],[231,120],[120,232],[72,37],[37,39],[39,72],[128,121],[121,47],[47,128],[232,121],[121,128],[128,232],[104,69],[69,67],[67,104],[175,171],[171,148],[148,175],[118,50],[50,101],[101,118],[73,39],[39,40],[40,73],[9,151],[151,108],[108,9],[48,115],[115,131],[131,48],[194,204],[204,211],[211,194],[74,40],[40,185],[185,74],[80,42],[42,183],[183,80],[40,92],[92,186],[186,40],[230,229],[229,118],[118,230],[202,212],[212,214],[214,202],[83,18],[18,17],[17,83],[76,61],[61,146],[146,76],[160,29],[29,30],[30,160],[56,157],[157,173],[173,56],[106,204],[204,194],[194,106],[135,214],[214,192],[192,135],[203,165],[165,98],[98,203],[21,71],[71,68],[68,21],[51,45],[45,4],[4,51],[144,24],[24,23],[23,144],[77,146],[146,91],[91,77],[205,50],[50,187],[187,205],[201,200],[200,18],[18,201],[91,106],[106,182],[182,91],[90,91],[91,181],[181,90],[85,84],[84,17],[17,85],[206,203],[203,36],[36,206],[148,171],[171,140],[140,148],[92,40],[40,39],[39,92],[193,189],[189,244],[244,193],[159,158],[158,28],[28,159],[247,246],[246,161],[161,247],[236,3],[3,196],[196,236],[54,68],[68,104],[104,54],[193,168],[168,8],[8,193],[117,228],[228,31],[31,117],[189,193],[193,55],[55,189],[98,97],[97,99],[99,98],[126,47],[47,100],[100,126],[166,79],[79,218],[218,166],[155,154],[154,26],[26,155],[209,49],[49,131],[131,209],[135,136],[136,150],[150,135],[47,126],[126,217],[217,47],[223,52],[52,53],[53,223],[45,51],[51,134],[134,45],[211,170],[170,140],[140,211],[67,69],[69,108],[108,67],[43,106],[106,91],[91,43],[230,119],[119,120],[120,230],[226,130],[130,247],[247,226],[63,53],[53,52],[52,63],[238,20],[20,242],[242,238],[46,70],[70,156],[156,46],[78,62],[62,96],[96,78],[46,53],[53,63],[63,46],[143,34],[34,227],[227,143],[123,117],[117,111],[111,123],[44,125],[125,19],[19,44],[236,134],[134,51],[51,236],[216,206],[206,205],[205,216],[154,153],[153,22],[22,154],[39,37],[37,167],[167,39],[200,201],[201,208],[208,200],[36,142],[142,100],[100,36],[57,212],[212,202],[202,57],[20,60],[60,99],[99,20],[28,158],[158,157],[157,28],[35,226],[226,113],[113,35],[160,159],[159,27],[27,160],[204,202],[202,210],[210,204],[113,225],[225,46],[46,113],[43,202],[202,204],[204,43],[62,76],[76,77],[77,62],[137,123],[123,116],[116,137],[41,38],[38,72],[72,41],[203,129],[129,142],[142,203],[64,98],[98,240],[240,64],[49,102],[102,64],[64,49],[41,73],[73,74],[74,41],[212,216],[216,207],[207,212],[42,74],[74,184],[184,42],[169,170],[170,211],[211,169],[170,149],[149,176],[176,170],[105,66],[66,69],[69,105],[122,6],[6,168],[168,122],[123,147],[147,187],[187,123],[96,77],[77,90],[90,96],[65,55],[55,107],[107,65],[89,90],[90,180],[180,89],[101,100],[100,120],[120,101],[63,105],[105,104],[104,63],[93,137],[137,227],[227,93],[15,86],[86,85],[85,15],[129,102],[102,49],[49,129],[14,87],[87,86],[86,14],[55,8],[8,9],[9,55],[100,47],[47,121],[121,100],[145,23],[23,22],[22,145],[88,89],[89,179],[179,88],[6,122],[122,196],[196,6],[88,95],[95,96],[96,88],[138,172],[172,136],[136,138],[215,58],[58,172],[172,215],[115,48],[48,219],[219,115],[42,80],[80,81],[81,42],[195,3],[3,51],[51,195],[43,146],[146,61],[61,43],[171,175],[175,199],[199,171],[81,82],[82,38],[38,81],[53,46],[46,225],[225,53],[144,163],[163,110],[110,144],[52,65],[65,66],[66,52],[229,228],[228,117],[117,229],[34,127],[127,234],[234,34],[107,108],[108,69],[69,107],[109,108],[108,151],[151,109],[48,64],[64,235],[235,48],[62,78],[78,191],[191,62],[129,209],[209,126],[126,129],[111,35],[35,143],[143,111],[117,123],[123,50],[50,117],[222,65],[65,52],[52,222],[19,125],[125,141],[141,19],[221,55],[55,65],[65,221],[3,195],[195,197],[197,3],[25,7],[7,33],[33,25],[220,237],[237,44],[44,220],[70,71],[71,139],[139,70],[122,193],[193,245],[245,122],[247,130],[130,33],[33,247],[71,21],[21,162],[162,71],[170,169],[169,150],[150,170],[188,174],[174,196],[196,188],[216,186],[186,92],[92,216],[2,97],[97,167],[167,2],[141,125],[125,241],[241,141],[164,167],[167,37],[37,164],[72,38],[38,12],[12,72],[38,82],[82,13],[13,38],[63,68],[68,71],[71,63],[226,35],[35,111],[111,226],[101,50],[50,205],[205,101],[206,92],[92,165],[165,206],[209,198],[198,217],[217,209],[165,167],[167,97],[97,165],[220,115],[115,218],[218,220],[133,112],[112,243],[243,133],[239,238],[238,241],[241,239],[214,135],[135,169],[169,214],[190,173],[173,133],[133,190],[171,208],[208,32],[32,171],[125,44],[44,237],[237,125],[86,87],[87,178],[178,86],[85,86],[86,179],[179,85],[84,85],[85,180],[180,84],[83,84],[84,181],[181,83],[201,83],[83,182],[182,201],[137,93],[93,132],[132,137],[76,62],[62,183],[183,76],[61,76],[76,184],[184,61],[57,61],[61,185],[185,57],[212,57],[57,186],[186,212],[214,207],[207,187],[187,214],[34,143],[143,156],[156,34],[79,239],[239,237],[237,79],[123,137],[137,177],[177,123],[44,1],[1,4],[4,44],[201,194],[194,32],[32,201],[64,102],[102,129],[129,64],[213,215],[215,138],[138,213],[59,166],[166,219],[219,59],[242,99],[99,97],[97,242],[2,94],[94,141],[141,2],[75,59],[59,235],[235,75],[24,110],[110,228],[228,24],[25,130],[130,226],[226,25],[23,24],[24,229],[229,23],[22,23],[23,230],[230,22],[26,22],[22,231],[231,26],[112,26],[26,232],[232,112],[189,190],[190,243],[243,189],[221,56],[56,190],[190,221],[28,56],[56,221],[221,28],[27,28],[28,222],[222,27],[29,27],[27,223],[223,29],[30,29],[29,224],[224,30],[247,30],[30,225],[225,247],[238,79],[79,20],[20,238],[166,59],[59,75],[75,166],[60,75],[75,240],[240,60],[147,177],[177,215],[215,147],[20,79],[79,166],[166,20],[187,147],[147,213],[213,187],[112,233],[233,244],[244,112],[233,128],[128,245],[245,233],[128,114],[114,188],[188,128],[114,217],[217,174],[174,114],[131,115],[115,220],[220,131],[217,198],[198,236],[236,217],[198,131],[131,134],[134,198],[177,132],[132,58],[58,177],[143,35],[35,124],[124,143],[110,163],[163,7],[7,110],[228,110],[110,25],[25,228],[356,389],[389,368],[368,356],[11,302],[302,267],[267,11],[452,350],[350,349],[349,452],[302,303],[303,269],[269,302],[357,343],[343,277],[277,357],[452,453],[453,357],[357,452],[333,332],[332,297],[297,333],[175,152],[152,377],[377,175],[347,348],[348,330],[330,347],[303,304],[304,270],[270,303],[9,336],[336,337],[337,9],[278,279],[279,360],[360,278],[418,262],[262,431],[431,418],[304,408],[408,409],[409,304],[310,415],[415,407],[407,310],[270,409],[409,410],[410,270],[450,348],[348,347],[347,450],[422,430],[430,434],[434,422],[313,314],[314,17],[17,313],[306,307],[307,375],[375,306],[387,388],[388,260],[260,387],[286,414],[414,398],[398,286],[335,406],[406,418],[418,335],[364,367],[367,416],[416,364],[423,358],[358,327],[327,423],[251,284],[284,298],[298,251],[281,5],[5,4],[4,281],[373,374],[374,253],[253,373],[307,320],[320,321],[321,307],[425,427],[427,411],[411,425],[421,313],[313,18],[18,421],[321,405],[405,406],[406,321],[320,404],[404,405],[405,320],[315,16],[16,17],[17,315],[426,425],[425,266],[266,426],[377,400],[400,369],[369,377],[322,391],[391,269],[269,322],[417,465],[465,464],[464,417],[386,257],[257,258],[258,386],[466,260],[260,388],[388,466],[456,399],[399,419],[419,456],[284,332],[332,333],[333,284],[417,285],[285,8],[8,417],[346,340],[340,261],[261,346],[413,441],[441,285],[285,413],[327,460],[460,328],[328,327],[355,371],[371,329],[329,355],[392,439],[439,438],[438,392],[382,341],[341,256],[256,382],[429,420],[420,360],[360,429],[364,394],[394,379],[379,364],[277,343],[343,437],[437,277],[443,444],[444,283],[283,443],[275,440],[440,363],[363,275],[431,262],[262,369],[369,431],[297,338],[338,337],[337,297],[273,375],[375,321],[321,273],[450,451],[451,349],[349,450],[446,342],[342,467],[467,446],[293,334],[334,282],[282,293],[458,461],[461,462],[462,458],[276,353],[353,383],[383,276],[308,324],[324,325],[325,308],[276,300],[300,293],[293,276],[372,345],[345,447],[447,372],[352,345],[345,340],[340,352],[274,1],[1,19],[19,274],[456,248],[248,281],[281,456],[436,427],[427,425],[425,436],[381,256],[256,252],[252,381],[269,391],[391,393],[393,269],[200,199],[199,428],[428,200],[266,330],[330,329],[329,266],[287,273],[273,422],[422,287],[250,462],[462,328],[328,250],[258,286],[286,384],[384,258],[265,353],[353,342],[342,265],[387,259],[259,257],[257,387],[424,431],[431,430],[430,424],[342,353],[353,276],[276,342],[273,335],[335,424],[424,273],[292,325],[325,307],[307,292],[366,447],[447,345],[345,366],[271,303],[303,302],[302,271],[423,266],[266,371],[371,423],[294,455],[455,460],[460,294],[279,278],[278,294],[294,279],[271,272],[272,304],[304,271],[432,434],[434,427],[427,432],[272,407],[407,408],[408,272],[394,430],[430,431],[431,394],[395,369],[369,400],[400,395],[334,333],[333,299],[299,334],[351,417],[417,168],[168,351],[352,280],[280,411],[411,352],[325,319],[319,320],[320,325],[295,296],[296,336],[336,295],[319,403],[403,404],[404,319],[330,348],[348,349],[349,330],[293,298],[298,333],[333,293],[323,454],[454,447],[447,323],[15,16],[16,315],[315,15],[358,429],[429,279],[279,358],[14,15],[15,316],[316,14],[285,336],[336,9],[9,285],[329,349],[349,350],[350,329],[374,380],[380,252],[252,374],[318,402],[402,403],[403,318],[6,197],[197,419],[419,6],[318,319],[319,325],[325,318],[367,364],[364,365],[365,367],[435,367],[367,397],[397,435],[344,438],[438,439],[439,344],[272,271],[271,311],[311,272],[195,5],[5,281],[281,195],[273,287],[287,291],[291,273],[396,428],[428,199],[199,396],[311,271],[271,268],[268,311],[283,444],[444,445],[445,283],[373,254],[254,339],[339,373],[282,334],[334,296],[296,282],[449,347],[347,346],[346,449],[264,447],[447,454],[454,264],[336,296],[296,299],[299,336],[338,10],[10,151],[151,338],[278,439],[439,455],[455,278],[292,407],[407,415],[415,292],[358,371],[371,355],[355,358],[340,345],[345,372],[372,340],[346,347],[347,280],[280,346],[442,443],[443,282],[282,442],[19,94],[94,370],[370,19],[441,442],[442,295],[295,441],[248,419],[419,197],[197,248],[263,255],[255,359],[359,263],[440,275],[275,274],[274,440],[300,383],[383,368],[368,300],[351,412],[412,465],[465,351],[263,467],[467,466],[466,263],[301,368],[368,389],[389,301],[395,378],[378,379],[379,395],[412,351],[351,419],[419,412],[436,426],[426,322],[322,436],[2,164],[164,393],[393,2],[370,462],[462,461],[461,370],[164,0],[0,267],[267,164],[302,11],[11,12],[12,302],[268,12],[12,13],[13,268],[293,300],[300,301],[301,293],[446,261],[261,340],[340,446],[330,266],[266,425],[425,330],[426,423],[423,391],[391,426],[429,355],[355,437],[437,429],[391,327],[327,326],[326,391],[440,457],[457,438],[438,440],[341,382],[382,362],[362,341],[459,457],[457,461],[461,459],[434,430],[430,394],[394,434],[414,463],[463,362],[362,414],[396,369],[369,262],[262,396],[354,461],[461,457],[457,354],[316,403],[403,402],[402,316],[315,404],[404,403],[403,315],[314,405],[405,404],[404,314],[313,406],[406,405],[405,313],[421,418],[418,406],[406,421],[366,401],[401,361],[361,366],[306,408],[408,407],[407,306],[291,409],[409,408],[408,291],[287,410],[410,409],[409,287],[432,436],[436,410],[410,432],[434,416],[416,411],[411,434],[264,368],[368,383],[383,264],[309,438],[438,457],[457,309],[352,376],[376,401],[401,352],[274,275],[275,4],[4,274],[421,428],[428,262],[262,421],[294,327],[327,358],[358,294],[433,416],[416,367],[367,433],[289,455],[455,439],[439,289],[462,370],[370,326],[326,462],[2,326],[326,370],[370,2],[305,460],[460,455],[455,305],[254,449],[449,448],[448,254],[255,261],[261,446],[446,255],[253,450],[450,449],[449,253],[252,451],[451,450],[450,252],[256,452],[452,451],[451,256],[341,453],[453,452],[452,341],[413,464],[464,463],[463,413],[441,413],[413,414],[414,441],[258,442],[442,441],[441,258],[257,443],[443,442],[442,257],[259,444],[444,443],[443,259],[260,445],[445,444],[444,260],[467,342],[342,445],[445,467],[459,458],[458,250],[250,459],[289,392],[392,290],[290,289],[290,328],[328,460],[460,290],[376,433],[433,435],[435,376],[250,290],[290,392],[392,250],[411,416],[416,433],[433,411],[341,463],[463,464],[464,341],[453,464],[464,465],[465,453],[357,465],[465,412],[412,357],[343,412],[412,399],[399,343],[360,363],[363,440],[440,360],[437,399],[399,456],[456,437],[420,456],[456,363],[363,420],[401,435],[435,288],[288,401],[372,383],[383,353],[353,372],[339,255],[255,249],[249,339],[448,261],[261,255],[255,448],[133,243],[243,190],[190,133],[133,155],[155,112],[112,133],[33,246],[246,247],[247,33],[33,130],[130,25],[25,33],[398,384],[384,286],[286,398],[362,398],[398,414],[414,362],[362,463],[463,341],[341,362],[263,359],[359,467],[467,263],[263,249],[249,255],[255,263],[466,467],[467,260],[260,466],[75,60],[60,166],[166,75],[238,239],[239,79],[79,238],[162,127],[127,139],[139,162],[72,11],[11,37],[37,72],[121,232],[232,120],[120,121],[73,72],[72,39],[39,73],[114,128],[128,47],[47,114],[233,232],[232,128],[128,233],[103,104],[104,67],[67,103],[152,175],[175,148],[148,152],[119,118],[118,101],[101,119],[74,73],[73,40],[40,74],[107,9],[9,108],[108,107],[49,48],[48,131],[131,49],[32,194],[194,211],[211,32],[184,74],[74,185],[185,184],[191,80],[80,183],[183,191],[185,40],[40,186],[186,185],[119,230],[230,118],[118,119],[210,202],[202,214],[214,210],[84,83],[83,17],[17,84],[77,76],[76,146],[146,77],[161,160],[160,30],[30,161],[190,56],[56,173],[173,190],[182,106],[106,194],[194,182],[138,135],[135,192],[192,138],[129,203],[203,98],[98,129],[54,21],[21,68],[68,54],[5,51],[51,4],[4,5],[145,144],[144,23],[23,145],[90,77],[77,91],[91,90],[207,205],[205,187],[187,207],[83,201],[201,18],[18,83],[181,91],[91,182],[182,181],[180,90],[90,181],[181,180],[16,85],[85,17],[17,16],[205,206],[206,36],[36,205],[176,148],[148,140],[140,176],[165,92],[92,39],[39,165],[245,193],[193,244],[244,245],[27,159],[159,28],[28,27],[30,247],[247,161],[161,30],[174,236],[236,196],[196,174],[103,54],[54,104],[104,103],[55,193],[193,8],[8,55],[111,117],[117,31],[31,111],[221,189],[189,55],[55,221],[240,98],[98,99],[99,240],[142,126],[126,100],[100,142],[219,166],[166,218],[218,219],[112,155],[155,26],[26,112],[198,209],[209,131],[131,198],[169,135],[135,150],[150,169],[114,47],[47,217],[217,114],[224,223],[223,53],[53,224],[220,45],[45,134],[134,220],[32,211],[211,140],[140,32],[109,67],[67,108],[108,109],[146,43],[43,91],[91,146],[231,230],[230,120],[120,231],[113,226],[226,247],[247,113],[105,63],[63,52],[52,105],[241,238],[238,242],[242,241],[124,46],[46,156],[156,124],[95,78],[78,96],[96,95],[70,46],[46,63],[63,70],[116,143],[143,227],[227,116],[116,123],[123,111],[111,116],[1,44],[44,19],[19,1],[3,236],[236,51],[51,3],[207,216],[216,205],[205,207],[26,154],[154,22],[22,26],[165,39],[39,167],[167,165],[199,200],[200,208],[208,199],[101,36],[36,100],[100,101],[43,57],[57,202],[202,43],[242,20],[20,99],[99,242],[56,28],[28,157],[157,56],[124,35],[35,113],[113,124],[29,160],[160,27],[27,29],[211,204],[204,210],[210,211],[124,113],[113,46],[46,124],[106,43],[43,204],[204,106],[96,62],[62,77],[77,96],[227,137],[137,116],[116,227],[73,41],[41,72],[72,73],[36,203],[203,142],[142,36],[235,64],[64,240],[240,235],[48,49],[49,64],[64,48],[42,41],[41,74],[74,42],[214,212],[212,207],[207,214],[183,42],[42,184],[184,183],[210,169],[169,211],[211,210],[140,170],[170,176],[176,140],[104,105],[105,69],[69,104],[193,122],[122,168],[168,193],[50,123],[123,187],[187,50],[89,96],[96,90],[90,89],[66,65],[65,107],[107,66],[179,89],[89,180],[180,179],[119,101],[101,120],[120,119],[68,63],[63,104],[104,68],[234,93],[93,227],[227,234],[16,15],[15,85],[85,16],[209,129],[129,49],[49,209],[15,14],[14,86],[86,15],[107,55],[55,9],[9,107],[120,100],[100,121],[121,120],[153,145],[145,22],[22,153],[178,88],[88,179],[179,178],[197,6],[6,196],[196,197],[89,88],[88,96],[96,89],[135,138],[138,136],[136,135],[138,215],[215,172],[172,138],[218,115],[115,219],[219,218],[41,42],[42,81],[81,41],[5,195],[195,51],[51,5],[57,43],[43,61],[61,57],[208,171],[171,199],[199,208],[41,81],[81,38],[38,41],[224,53],[53,225],[225,224],[24,144],[144,110],[110,24],[105,52],[52,66],[66,105],[118,229],[229,117],[117,118],[227,34],[34,234],[234,227],[66,107],[107,69],[69,66],[10,109],[109,151],[151,10],[219,48],[48,235],[235,219],[183,62],[62,191],[191,183],[142,129],[129,126],[126,142],[116,111],[111,143],[143,116],[118,117],[117,50],[50,118],[223,222],[222,52],[52,223],[94,19],[19,141],[141,94],[222,221],[221,65],[65,222],[196,3],[3,197],[197,196],[45,220],[220,44],[44,45],[156,70],[70,139],[139,156],[188,122],[122,245],[245,188],[139,71],[71,162],[162,139],[149,170],[170,150],[150,149],[122,188],[188,196],[196,122],[206,216],[216,92],[92,206],[164,2],[2,167],[167,164],[242,141],[141,241],[241,242],[0,164],[164,37],[37,0],[11,72],[72,12],[12,11],[12,38],[38,13],[13,12],[70,63],[63,71],[71,70],[31,226],[226,111],[111,31],[36,101],[101,205],[205,36],[203,206],[206,165],[165,203],[126,209],[209,217],[217,126],[98,165],[165,97],[97,98],[237,220],[220,218],[218,237],[237,239],[239,241],[241,237],[210,214],[214,169],[169,210],[140,171],[171,32],[32,140],[241,125],[125,237],[237,241],[179,86],[86,178],[178,179],[180,85],[85,179],[179,180],[181,84],[84,180],[180,181],[182,83],[83,181],[181,182],[194,201],[201,182],[182,194],[177,137],[137,132],[132,177],[184,76],[76,183],[183,184],[185,61],[61,184],[184,185],[186,57],[57,185],[185,186],[216,212],[212,186],[186,216],[192,214],[214,187],[187,192],[139,34],[34,156],[156,139],[218,79],[79,237],[237,218],[147,123],[123,177],[177,147],[45,44],[44,4],[4,45],[208,201],[201,32],[32,208],[98,64],[64,129],[129,98],[192,213],[213,138],[138,192],[235,59],[59,219],[219,235],[141,242],[242,97],[97,141],[97,2],[2,141],[141,97],[240,75],[75,235],[235,240],[229,24],[24,228],[228,229],[31,25],[25,226],[226,31],[230,23],[23,229],[229,230],[231,22],[22,230],[230,231],[232,26],[26,231],[231,232],[233,112],[112,232],[232,233],[244,189],[189,243],[243,244],[189,221],[221,190],[190,189],[222,28],[28,221],[221,222],[223,27],[27,222],[222,223],[224,29],[29,223],[223,224],[225,30],[30,224],[224,225],[113,247],[247,225],[225,113],[99,60],[60,240],[240,99],[213,147],[147,215],[215,213],[60,20],[20,166],[166,60],[192,187],[187,213],[213,192],[243,112],[112,244],[244,243],[244,233],[233,245],[245,244],[245,128],[128,188],[188,245],[188,114],[114,174],[174,188],[134,131],[131,220],[220,134],[174,217],[217,236],[236,174],[236,198],[198,134],[134,236],[215,177],[177,58],[58,215],[156,143],[143,124],[124,156],[25,110],[110,7],[7,25],[31,228],[228,25],[25,31],[264,356],[356,368],[368,264],[0,11],[11,267],[267,0],[451,452],[452,349],[349,451],[267,302],[302,269],[269,267],[350,357],[357,277],[277,350],[350,452],[452,357],[357,350],[299,333],[333,297],[297,299],[396,175],[175,377],[377,396],[280,347],[347,330],[330,280],[269,303],[303,270],[270,269],[151,9],[9,337],[337,151],[344,278],[278,360],[360,344],[424,418],[418,431],[431,424],[270,304],[304,409],[409,270],[272,310],[310,407],[407,272],[322,270],[270,410],[410,322],[449,450],[450,347],[347,449],[432,422],[422,434],[434,432],[18,313],[313,17],[17,18],[291,306],[306,375],[375,291],[259,387],[387,260],[260,259],[424,335],[335,418],[418,424],[434,364],[364,416],[416,434],[391,423],[423,327],[327,391],[301,251],[251,298],[298,301],[275,281],[281,4],[4,275],[254,373],[373,253],[253,254],[375,307],[307,321],[321,375],[280,425],[425,411],[411,280],[200,421],[421,18],[18,200],[335,321],[321,406],[406,335],[321,320],[320,405],[405,321],[314,315],[315,17],[17,314],[423,426],[426,266],[266,423],[396,377],[377,369],[369,396],[270,322],[322,269],[269,270],[413,417],[417,464],[464,413],[385,386],[386,258],[258,385],[248,456],[456,419],[419,248],[298,284],[284,333],[333,298],[168,417],[417,8],[8,168],[448,346],[346,261],[261,448],[417,413],[413,285],[285,417],[326,327],[327,328],[328,326],[277,355],[355,329],[329,277],[309,392],[392,438],[438,309],[381,382],[382,256],[256,381],[279,429],[429,360],[360,279],[365,364],[364,379],[379,365],[355,277],[277,437],[437,355],[282,443],[443,283],[283,282],[281,275],[275,363],[363,281],[395,431],[431,369],[369,395],[299,297],[297,337],[337,299],[335,273],[273,321],[321,335],[348,450],[450,349],[349,348],[359,446],[446,467],[467,359],[283,293],[293,282],[282,283],[250,458],[458,462],[462,250],[300,276],[276,383],[383,300],[292,308],[308,325],[325,292],[283,276],[276,293],[293,283],[264,372],[372,447],[447,264],[346,352],[352,340],[340,346],[354,274],[274,19],[19,354],[363,456],[456,281],[281,363],[426,436],[436,425],[425,426],[380,381],[381,252],[252,380],[267,269],[269,393],[393,267],[421,200],[200,428],[428,421],[371,266],[266,329],[329,371],[432,287],[287,422],[422,432],[290,250],[250,328],[328,290],[385,258],[258,384],[384,385],[446,265],[265,342],[342,446],[386,387],[387,257],[257,386],[422,424],[424,430],[430,422],[445,342],[342,276],[276,445],[422,273],[273,424],[424,422],[306,292],[292,307],[307,306],[352,366],[366,345],[345,352],[268,271],[271,302],[302,268],[358,423],[423,371],[371,358],[327,294],[294,460],[460,327],[331,279],[279,294],[294,331],[303,271],[271,304],[304,303],[436,432],[432,427],[427,436],[304,272],[272,408],[408,304],[395,394],[394,431],[431,395],[378,395],[395,400],[400,378],[296,334],[334,299],[299,296],[6,351],[351,168],[168,6],[376,352],[352,411],[411,376],[307,325],[325,320],[320,307],[285,295],[295,336],[336,285],[320,319],[319,404],[404,320],[329,330],[330,349],[349,329],[334,293],[293,333],[333,334],[366,323],[323,447],[447,366],[316,15],[15,315],[315,316],[331,358],[358,279],[279,331],[317,14],[14,316],[316,317],[8,285],[285,9],[9,8],[277,329],[329,350],[350,277],[253,374],[374,252],[252,253],[319,318],[318,403],[403,319],[351,6],[6,419],[419,351],[324,318],[318,325],[325,324],[397,367],[367,365],[365,397],[288,435],[435,397],[397,288],[278,344],[344,439],[439,278],[310,272],[272,311],[311,310],[248,195],[195,281],[281,248],[375,273],[273,291],[291,375],[175,396],[396,199],[199,175],[312,311],[311,268],[268,312],[276,283],[283,445],[445,276],[390,373],[373,339],[339,390],[295,282],[282,296],[296,295],[448,449],[449,346],[346,448],[356,264],[264,454],[454,356],[337,336],[336,299],[299,337],[337,338],[338,151],[151,337],[294,278],[278,455],[455,294],[308,292],[292,415],[415,308],[429,358],[358,355],[355,429],[265,340],[340,372],[372,265],[352,346],[346,280],[280,352],[295,442],[442,282],[282,295],[354,19],[19,370],[370,354],[285,441],[441,295],[295,285],[195,248],[248,197],[197,195],[457,440],[440,274],[274,457],[301,300],[300,368],[368,301],[417,351],[351,465],[465,417],[251,301],[301,389],[389,251],[394,395],[395,379],[379,394],[399,412],[412,419],[419,399],[410,436],[436,322],[322,410],[326,2],[2,393],[393,326],[354,370],[370,461],[461,354],[393,164],[164,267],[267,393],[268,302],[302,12],[12,268],[312,268],[268,13],[13,312],[298,293],[293,301],[301,298],[265,446],[446,340],[340,265],[280,330],[330,425],[425,280],[322,426],[426,391],[391,322],[420,429],[429,437],[437,420],[393,391],[391,326],[326,393],[344,440],[440,438],[438,344],[458,459],[459,461],[461,458],[364,434],[434,394],[394,364],[428,396],[396,262],[262,428],[274,354],[354,457],[457,274],[317,316],[316,402],[402,317],[316,315],[315,403],[403,316],[315,314],[314,404],[404,315],[314,313],[313,405],[405,314],[313,421],[421,406],[406,313],[323,366],[366,361],[361,323],[292,306],[306,407],[407,292],[306,291],[291,408],[408,306],[291,287],[287,409],[409,291],[287,432],[432,410],[410,287],[427,434],[434,411],[411,427],[372,264],[264,383],[383,372],[459,309],[309,457],[457,459],[366,352],[352,401],[401,366],[1,274],[274,4],[4,1],[418,421],[421,262],[262,418],[331,294],[294,358],[358,331],[435,433],[433,367],[367,435],[392,289],[289,439],[439,392],[328,462],[462,326],[326,328],[94,2],[2,370],[370,94],[289,305],[305,455],[455,289],[339,254],[254,448],[448,339],[359,255],[255,446],[446,359],[254,253],[253,449],[449,254],[253,252],[252,450],[450,253],[252,256],[256,451],[451,252],[256,341],[341,452],[452,256],[414,413],[413,463],[463,414],[286,441],[441,414],[414,286],[286,258],[258,441],[441,286],[258,257],[257,442],[442,258],[257,259],[259,443],[443,257],[259,260],[260,444],[444,259],[260,467],[467,445],[445,260],[309,459],[459,250],[250,309],[305,289],[289,290],[290,305],[305,290],[290,460],[460,305],[401,376],[376,435],[435,401],[309,250],[250,392],[392,309],[376,411],[411,433],[433,376],[453,341],[341,464],[464,453],[357,453],[453,465],[465,357],[343,357],[357,412],[412,343],[437,343],[343,399],[399,437],[344,360],[360,440],[440,344],[420,437],[437,456],[456,420],[360,420],[420,363],[363,360],[361,401],[401,288],[288,361],[265,372],[372,353],[353,265],[390,339],[339,249],[249,390],[339,448],[448,255],[255,339]]),Y("VERSION","0.4.1646425229")}).call(li)),li}var gw=hw(),ci={},Sa;function pw(){return Sa||(Sa=1,(function(){function t(A){var I=0;return function(){return I<A.length?{done:!1,value:A[I++]}:{done:!0}}}var e=typeof Object.defineProperties=="function"?Object.defineProperty:function(A,I,U){return A==Array.prototype||A==Object.prototype||(A[I]=U.value),A};function n(A){A=[typeof globalThis=="object"&&globalThis,A,typeof window=="object"&&window,typeof self=="object"&&self,typeof mr=="object"&&mr];for(var I=0;I<A.length;++I){var U=A[I];if(U&&U.Math==Math)return U}throw Error("Cannot find global object")}var r=n(this);function i(A,I){if(I)e:{var U=r;A=A.split(".");for(var G=0;G<A.length-1;G++){var Y=A[G];if(!(Y in U))break e;U=U[Y]}A=A[A.length-1],G=U[A],I=I(G),I!=G&&I!=null&&e(U,A,{configurable:!0,writable:!0,value:I})}}i("Symbol",function(A){function I(ue){if(this instanceof I)throw new TypeError("Symbol is not a constructor");return new U(G+(ue||"")+"_"+Y++,ue)}function U(ue,O){this.g=ue,e(this,"description",{configurable:!0,writable:!0,value:O})}if(A)return A;U.prototype.toString=function(){return this.g};var G="jscomp_symbol_"+(1e9*Math.random()>>>0)+"_",Y=0;return I}),i("Symbol.iterator",function(A){if(A)return A;A=Symbol("Symbol.iterator");for(var I="Array Int8Array Uint8Array Uint8ClampedArray Int16Array Uint16Array Int32Array Uint32Array Float32Array Float64Array".split(" "),U=0;U<I.length;U++){var G=r[I[U]];typeof G=="function"&&typeof G.prototype[A]!="function"&&e(G.prototype,A,{configurable:!0,writable:!0,value:function(){return o(t(this))}})}return A});function o(A){return A={next:A},A[Symbol.iterator]=function(){return this},A}function a(A){var I=typeof Symbol<"u"&&Symbol.iterator&&A[Symbol.iterator];return I?I.call(A):{next:t(A)}}function l(){this.i=!1,this.g=null,this.o=void 0,this.j=1,this.m=0,this.h=null}function u(A){if(A.i)throw new TypeError("Generator is already running");A.i=!0}l.prototype.l=function(A){this.o=A};function h(A,I){A.h={F:I,G:!0},A.j=A.m}l.prototype.return=function(A){this.h={return:A},this.j=this.m};function f(A){this.g=new l,this.h=A}function v(A,I){u(A.g);var U=A.g.g;return U?p(A,"return"in U?U.return:function(G){return{value:G,done:!0}},I,A.g.return):(A.g.return(I),m(A))}function p(A,I,U,G){try{var Y=I.call(A.g.g,U);if(!(Y instanceof Object))throw new TypeError("Iterator result "+Y+" is not an object");if(!Y.done)return A.g.i=!1,Y;var ue=Y.value}catch(O){return A.g.g=null,h(A.g,O),m(A)}return A.g.g=null,G.call(A.g,ue),m(A)}function m(A){for(;A.g.j;)try{var I=A.h(A.g);if(I)return A.g.i=!1,{value:I.value,done:!1}}catch(U){A.g.o=void 0,h(A.g,U)}if(A.g.i=!1,A.g.h){if(I=A.g.h,A.g.h=null,I.G)throw I.F;return{value:I.return,done:!0}}return{value:void 0,done:!0}}function E(A){this.next=function(I){return u(A.g),A.g.g?I=p(A,A.g.g.next,I,A.g.l):(A.g.l(I),I=m(A)),I},this.throw=function(I){return u(A.g),A.g.g?I=p(A,A.g.g.throw,I,A.g.l):(h(A.g,I),I=m(A)),I},this.return=function(I){return v(A,I)},this[Symbol.iterator]=function(){return this}}function R(A){function I(G){return A.next(G)}function U(G){return A.throw(G)}return new Promise(function(G,Y){function ue(O){O.done?G(O.value):Promise.resolve(O.value).then(I,U).then(ue,Y)}ue(A.next())})}i("Promise",function(A){function I(O){this.h=0,this.i=void 0,this.g=[],this.o=!1;var F=this.j();try{O(F.resolve,F.reject)}catch(X){F.reject(X)}}function U(){this.g=null}function G(O){return O instanceof I?O:new I(function(F){F(O)})}if(A)return A;U.prototype.h=function(O){if(this.g==null){this.g=[];var F=this;this.i(function(){F.l()})}this.g.push(O)};var Y=r.setTimeout;U.prototype.i=function(O){Y(O,0)},U.prototype.l=function(){for(;this.g&&this.g.length;){var O=this.g;this.g=[];for(var F=0;F<O.length;++F){var X=O[F];O[F]=null;try{X()}catch(de){this.j(de)}}}this.g=null},U.prototype.j=function(O){this.i(function(){throw O})},I.prototype.j=function(){function O(de){return function(Me){X||(X=!0,de.call(F,Me))}}var F=this,X=!1;return{resolve:O(this.A),reject:O(this.l)}},I.prototype.A=function(O){if(O===this)this.l(new TypeError("A Promise cannot resolve to itself"));else if(O instanceof I)this.C(O);else{e:switch(typeof O){case"object":var F=O!=null;break e;case"function":F=!0;break e;default:F=!1}F?this.v(O):this.m(O)}},I.prototype.v=function(O){var F=void 0;try{F=O.then}catch(X){this.l(X);return}typeof F=="function"?this.D(F,O):this.m(O)},I.prototype.l=function(O){this.u(2,O)},I.prototype.m=function(O){this.u(1,O)},I.prototype.u=function(O,F){if(this.h!=0)throw Error("Cannot settle("+O+", "+F+"): Promise already settled in state"+this.h);this.h=O,this.i=F,this.h===2&&this.B(),this.H()},I.prototype.B=function(){var O=this;Y(function(){if(O.I()){var F=r.console;typeof F<"u"&&F.error(O.i)}},1)},I.prototype.I=function(){if(this.o)return!1;var O=r.CustomEvent,F=r.Event,X=r.dispatchEvent;return typeof X>"u"?!0:(typeof O=="function"?O=new O("unhandledrejection",{cancelable:!0}):typeof F=="function"?O=new F("unhandledrejection",{cancelable:!0}):(O=r.document.createEvent("CustomEvent"),O.initCustomEvent("unhandledrejection",!1,!0,O)),O.promise=this,O.reason=this.i,X(O))},I.prototype.H=function(){if(this.g!=null){for(var O=0;O<this.g.length;++O)ue.h(this.g[O]);this.g=null}};var ue=new U;return I.prototype.C=function(O){var F=this.j();O.s(F.resolve,F.reject)},I.prototype.D=function(O,F){var X=this.j();try{O.call(F,X.resolve,X.reject)}catch(de){X.reject(de)}},I.prototype.then=function(O,F){function X(De,We){return typeof De=="function"?function(Mt){try{de(De(Mt))}catch(Zt){Me(Zt)}}:We}var de,Me,It=new I(function(De,We){de=De,Me=We});return this.s(X(O,de),X(F,Me)),It},I.prototype.catch=function(O){return this.then(void 0,O)},I.prototype.s=function(O,F){function X(){switch(de.h){case 1:O(de.i);break;case 2:F(de.i);break;default:throw Error("Unexpected state: "+de.h)}}var de=this;this.g==null?ue.h(X):this.g.push(X),this.o=!0},I.resolve=G,I.reject=function(O){return new I(function(F,X){X(O)})},I.race=function(O){return new I(function(F,X){for(var de=a(O),Me=de.next();!Me.done;Me=de.next())G(Me.value).s(F,X)})},I.all=function(O){var F=a(O),X=F.next();return X.done?G([]):new I(function(de,Me){function It(Mt){return function(Zt){De[Mt]=Zt,We--,We==0&&de(De)}}var De=[],We=0;do De.push(void 0),We++,G(X.value).s(It(De.length-1),Me),X=F.next();while(!X.done)})},I});var x=typeof Object.assign=="function"?Object.assign:function(A,I){for(var U=1;U<arguments.length;U++){var G=arguments[U];if(G)for(var Y in G)Object.prototype.hasOwnProperty.call(G,Y)&&(A[Y]=G[Y])}return A};i("Object.assign",function(A){return A||x});var k=this||self,B={facingMode:"user",width:640,height:480};function P(A,I){this.video=A,this.i=0,this.h=Object.assign(Object.assign({},B),I)}P.prototype.stop=function(){var A=this,I,U,G,Y;return R(new E(new f(function(ue){if(A.g){for(I=A.g.getTracks(),U=a(I),G=U.next();!G.done;G=U.next())Y=G.value,Y.stop();A.g=void 0}ue.j=0})))},P.prototype.start=function(){var A=this,I;return R(new E(new f(function(U){return navigator.mediaDevices&&navigator.mediaDevices.getUserMedia||alert("No navigator.mediaDevices.getUserMedia exists."),I=A.h,U.return(navigator.mediaDevices.getUserMedia({video:{facingMode:I.facingMode,width:I.width,height:I.height}}).then(function(G){pe(A,G)}).catch(function(G){var Y="Failed to acquire camera feed: "+G;throw console.error(Y),alert(Y),G}))})))};function $(A){window.requestAnimationFrame(function(){se(A)})}function pe(A,I){A.g=I,A.video.srcObject=I,A.video.onloadedmetadata=function(){A.video.play(),$(A)}}function se(A){var I=null;A.video.paused||A.video.currentTime===A.i||(A.i=A.video.currentTime,I=A.h.onFrame()),I?I.then(function(){$(A)}):$(A)}var Z=["Camera"],W=k;Z[0]in W||typeof W.execScript>"u"||W.execScript("var "+Z[0]);for(var Ae;Z.length&&(Ae=Z.shift());)Z.length||P===void 0?W[Ae]&&W[Ae]!==Object.prototype[Ae]?W=W[Ae]:W=W[Ae]={}:W[Ae]=P}).call(ci)),ci}var mw=pw();document.addEventListener("DOMContentLoaded",()=>{typeof window.lucide<"u"&&window.lucide.createIcons();const t=document.getElementById("video"),e=document.getElementById("face-guideline");t&&e&&ww(),document.getElementById("addFaceForm")&&bw(),document.getElementById("calendar")&&yw(),document.getElementById("userSearch")&&Ew(),document.getElementById("loginForm")&&vw()});function vw(){const t=document.getElementById("loginForm");t&&t.addEventListener("submit",async function(e){e.preventDefault();const n=new FormData(this),r=Object.fromEntries(n.entries()),i=this.querySelector("button"),o=i.innerText;try{i.disabled=!0,i.innerText="Loading...";const l=await(await fetch("/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(r)})).json();l.status==="success"?Swal.fire({icon:"success",title:"Login Successful!",text:"Redirecting to dashboard...",showConfirmButton:!1,timer:1500,background:"#0f172a",color:"#fff"}).then(()=>{window.location.href=l.redirect}):Swal.fire({icon:"error",title:"Login Failed",text:l.message||"Invalid username or password",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"})}catch{Swal.fire({icon:"error",title:"System Error",text:"Failed to connect to server",background:"#0f172a",color:"#fff"})}finally{i.disabled=!1,i.innerText=o}})}function ww(){const t=document.getElementById("video"),e=document.getElementById("face-guideline"),n=document.getElementById("status-text"),r=document.getElementById("canvas");let i=!1;if(window.speak=function(l){if("speechSynthesis"in window){window.speechSynthesis.cancel();const u=new SpeechSynthesisUtterance(l);u.lang="en-US",u.rate=1.1,u.pitch=1,window.speechSynthesis.speak(u)}},window.updateStatus=function(l,u){if(!n)return;n.innerText=l;const h=document.getElementById("status-dot");h&&(h.className=`w-2.5 h-2.5 rounded-full ${u}`)},typeof FaceDetection<"u"){const l=new FaceDetection({locateFile:v=>`/static/mediapipe/${v}`});l.setOptions({model:"short",minDetectionConfidence:.75}),l.onResults(v=>{if(v.detections.length>0){const p=v.detections[0].boundingBox,m=t.offsetWidth,E=t.offsetHeight;e.classList.remove("hidden"),e.style.width=p.width*m+"px",e.style.height=p.height*E+"px",e.style.left=m-p.xCenter*m-p.width*m/2+"px",e.style.top=p.yCenter*E-p.height*E/2+"px",i||o(t,r)}else e.classList.add("hidden")});const u=window.innerWidth<768,h=document.getElementById("cameraToggle");let f=null;window.toggleCamera=async function(v){if(v){updateStatus("Initializing...","bg-blue-500"),f||(f=new Camera(t,{onFrame:async()=>{h.checked&&await l.send({image:t})},width:u?720:1280,height:u?1280:720}));try{await f.start(),updateStatus("Scanning...","bg-emerald-500")}catch(p){console.error("Camera detection error:",p),h.checked=!1,updateStatus("Cam Error","bg-red-500"),Swal.fire({icon:"error",title:"Camera Not Detected",text:"Failed to access camera feed.",background:"#0f172a",color:"#fff"})}}else f&&(await f.stop(),e.classList.add("hidden"),updateStatus("System Idle","bg-slate-600"))},h&&h.addEventListener("change",v=>{toggleCamera(v.target.checked)})}async function o(l,u){i=!0,updateStatus("Verifying...","bg-blue-500"),u.width=640,u.height=480;const h=u.getContext("2d");h.save(),h.scale(-1,1),h.drawImage(l,-u.width,0,u.width,u.height),h.restore();const f=u.toDataURL("image/jpeg",.7);try{const p=await(await fetch("/api/process_image",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({image:f})})).json();p.status==="success"?(updateStatus(p.nama.toUpperCase(),"bg-emerald-500"),speak("Attendance successful. Thank you "+p.nama),a(),showSuccessAlert(p.nama,p.image_preview,p.waktu,p.user_id)):p.status==="already_present"?(updateStatus("DONE","bg-green-500"),speak("You have already attended today."),setTimeout(()=>{i=!1},2e3)):(updateStatus("UNKNOWN","bg-red-500"),speak("Face not recognized."),setTimeout(()=>{i=!1},1200))}catch{i=!1}}async function a(){const l=document.getElementById("today-logs"),u=document.getElementById("empty-logs-state");if(l)try{const f=await(await fetch("/api/today_log")).json();u&&u.classList.toggle("hidden",f.length>0),l.innerHTML=f.map(v=>`
-                    <div class="p-3 bg-white/5 border border-white/5 rounded-xl flex items-center justify-between">
-                        <div>
-                            <p class="text-white font-bold text-xs uppercase">${v.nama}</p>
-                            <p class="text-[9px] text-slate-400 font-bold">${v.waktu}</p>
-                        </div>
-                    </div>
-                `).join("")}catch(h){console.error("Error loading logs",h)}}window.showSuccessAlert=function(l,u,h,f){const v=document.createElement("div");v.className="scan-success-overlay",v.innerHTML=`
-            <div class="scan-success-card">
-                <div class="scan-success-badge">Scanning Success</div>
-                <div class="scan-success-img-wrapper">
-                    <img src="${u||"/static/default_user.png"}" class="scan-success-img" alt="User image">
-                </div>
-                <h2 class="scan-success-name">${l}</h2>
-                <div class="scan-success-details">
-                    <div class="scan-detail-item">
-                        <i data-lucide="clock" class="w-3 h-3 text-blue-400"></i>
-                        <span>${h}</span>
-                    </div>
-                    <div class="scan-detail-item">
-                        <i data-lucide="shield-check" class="w-3 h-3 text-emerald-400"></i>
-                        <span class="font-mono text-[8px] opacity-60">${f}</span>
-                    </div>
-                </div>
-                <div class="scan-timeline-container">
-                    <div class="scan-timeline-bar"></div>
-                </div>
-            </div>
-        `,document.body.appendChild(v),typeof window.lucide<"u"&&window.lucide.createIcons(),setTimeout(()=>{v.style.opacity="0",v.style.transition="opacity 0.5s ease-out",setTimeout(()=>{v.remove(),i=!1},500)},5e3)},a()}function bw(){const t=document.getElementById("video"),e=document.getElementById("areaCamera"),n=document.getElementById("areaUpload"),r=document.getElementById("tabCam"),i=document.getElementById("tabUp");let o="camera",a=null;window.switchUI=function(l){o!==l&&(o=l,r&&(r.classList.toggle("active",l==="camera"),r.classList.toggle("text-slate-500",l==="upload")),i&&(i.classList.toggle("active",l==="upload"),i.classList.toggle("text-slate-500",l==="camera")),l==="camera"?(e.removeAttribute("hidden"),n.setAttribute("hidden",""),startCam()):(n.removeAttribute("hidden"),e.setAttribute("hidden",""),stopCam()))},window.startCam=async function(){try{a&&stopCam();const l=window.innerWidth<768,u={video:{facingMode:"user",width:l?{ideal:720}:{ideal:1280},height:l?{ideal:1280}:{ideal:720}}};a=await navigator.mediaDevices.getUserMedia(u),t&&(t.srcObject=a)}catch(l){console.error("Kamera error",l),Swal.fire({icon:"error",title:"Camera Access Failed",text:"Make sure camera permission is enabled and not being used by another application.",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"})}},window.stopCam=function(){a&&(a.getTracks().forEach(l=>l.stop()),a=null)},window.handleFile=function(l){if(!l)return;const u=5*1024*1024;if(l.size>u)return Swal.fire({icon:"error",title:"File Too Large",text:`Maximum file size is 5MB. Your file: ${(l.size/(1024*1024)).toFixed(2)}MB`,background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"}),!1;if(!l.type.startsWith("image/"))return Swal.fire({icon:"error",title:"Invalid Format",text:"Only image files are allowed.",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"}),!1;const h=new FileReader;return h.onload=f=>{document.getElementById("imgPrev").src=f.target.result,document.getElementById("previewContainer").classList.remove("hidden"),document.getElementById("placeholderUp").classList.add("hidden"),o!=="upload"&&window.switchUI("upload")},h.readAsDataURL(l),!0},window.previewFile=function(l){l.files&&l.files[0]&&(handleFile(l.files[0])||(l.value=""))},window.initDragAndDrop=function(){const l=document.getElementById("dropOverlay");if(!l)return;let u=0;window.addEventListener("dragenter",h=>{h.preventDefault(),u++,u===1&&(l.classList.remove("hidden"),l.classList.remove("opacity-0"),l.classList.add("opacity-100"))}),window.addEventListener("dragleave",h=>{h.preventDefault(),u--,u===0&&l.classList.add("hidden")}),window.addEventListener("dragover",h=>{h.preventDefault()}),window.addEventListener("drop",h=>{h.preventDefault(),u=0,l.classList.add("hidden"),h.dataTransfer.files&&h.dataTransfer.files.length>0&&handleFile(h.dataTransfer.files[0])})},window.submitData=async function(l){l&&l.preventDefault();const u=document.getElementById("nama").value.trim();if(!u)return Swal.fire({icon:"warning",title:"Validation Failed",text:"Please enter your full name first!",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"});let h="";const f=document.getElementById("btnSubmit"),v=document.getElementById("btnContent");if(o==="camera"){const p=document.getElementById("canvas");p.width=t.videoWidth,p.height=t.videoHeight;const m=p.getContext("2d");m.scale(-1,1),m.drawImage(t,-p.width,0,p.width,p.height),h=p.toDataURL("image/jpeg",.9)}else h=document.getElementById("imgPrev").src;if(!h||h.includes("window.location"))return Swal.fire({icon:"warning",title:"No Photo",text:"Please capture a photo or upload an image first!",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"});f.disabled=!0,v.innerHTML=`
-            <div class="loader-container">
-                <div class="loader-spinner"></div>
-                <span class="tracking-[0.2em]">PROCESSING...</span>
-            </div>
-        `;try{const m=await(await fetch("/api/register_face",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({nama:u,image:h})})).json();m.status==="success"?Swal.fire({icon:"success",title:"Success!",text:"Face data successfully registered.",showConfirmButton:!1,timer:1500,background:"#0f172a",color:"#fff"}).then(()=>{window.location.href="/"}):(Swal.fire({icon:"error",title:"Failed",text:m.message||"An error occurred while registering face.",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"}),window.resetBtn())}catch{Swal.fire({icon:"error",title:"System Error",text:"Failed to connect to server.",background:"#0f172a",color:"#fff"}),window.resetBtn()}},window.resetBtn=function(){const l=document.getElementById("btnSubmit"),u=document.getElementById("btnContent");l.disabled=!1,u.innerHTML=`
-            Complete Registration
-            <i data-lucide="arrow-right" class="w-4 h-4"></i>
-        `,typeof lucide<"u"&&lucide.createIcons()},addFaceForm&&addFaceForm.addEventListener("submit",l=>{l.preventDefault(),window.submitData()}),startCam(),initDragAndDrop()}function yw(){window.deleteLog=function(u){Swal.fire({title:"Delete Log?",text:"This data will be deleted from the attendance history.",icon:"warning",showCancelButton:!0,confirmButtonColor:"#ef4444",cancelButtonColor:"#334155",confirmButtonText:"Yes, Delete!",cancelButtonText:"Cancel",background:"#0f172a",color:"#fff"}).then(h=>{h.isConfirmed&&fetch(`/api/admin/delete_log/${u}`,{method:"POST"}).then(f=>f.json()).then(f=>{if(f.status==="success"){const v=document.getElementById(`log-${u}`);v&&(v.style.transform="translateX(20px)",v.style.opacity="0",setTimeout(()=>{v.remove(),window.calendarInstance&&window.calendarInstance.refetchEvents()},300))}})})},window.deleteAllLogs=function(){Swal.fire({title:"Clear All Logs?",text:"WARNING: All attendance history data will be permanently deleted!",icon:"error",showCancelButton:!0,confirmButtonColor:"#ef4444",cancelButtonColor:"#334155",confirmButtonText:"Yes, Clear All!",cancelButtonText:"Cancel",background:"#0f172a",color:"#fff"}).then(u=>{u.isConfirmed&&(window.location.href="/api/admin/clear_logs")})};const t=document.getElementById("tableSearch"),e=document.querySelectorAll(".log-row"),n=document.getElementById("noLogsFound");let r=null;t&&t.addEventListener("input",u=>{const h=u.target.value.toLowerCase();i(h,r)});function i(u="",h=null){let f=!1;e.forEach(v=>{const p=v.innerText.toLowerCase(),m=u===""||p.includes(u);let E=!0;if(h){const x=v.querySelector("td:nth-child(2) .text-\\[8px\\]");x&&(E=x.innerText.trim()===h)}const R=m&&E;v.style.display=R?"":"none",R&&(f=!0)}),n&&(f?n.classList.add("hidden"):n.classList.remove("hidden"))}if(typeof window.FullCalendar<"u"){let h=function(p){const m=document.getElementById("date-filter-notification");m&&m.remove();const E=document.createElement("div");E.id="date-filter-notification",E.className="fixed top-20 right-4 z-50 px-4 py-3 rounded-xl bg-blue-600 text-white text-xs font-bold shadow-lg border border-blue-400 animate-slide-in",E.innerHTML=`
-        <div class="flex items-center gap-2">
-          <i data-lucide="filter" class="w-4 h-4"></i>
-          <span>${p}</span>
-        </div>
-      `,document.body.appendChild(E),typeof window.lucide<"u"&&window.lucide.createIcons(),setTimeout(()=>{E.style.opacity="0",E.style.transform="translateX(100%)",setTimeout(()=>E.remove(),300)},3e3)},f=function(p,m){const E=document.getElementById("calendar-tooltip"),R=document.getElementById("tooltip-name"),x=document.getElementById("tooltip-time");if(R&&(R.innerText=p.is_admin?"Daily Recap":p.nama),x)if(p.is_admin){let k="";(p.users||[]).forEach(B=>{k+=`
-                        <div class="flex justify-between items-center text-[10px] text-slate-300">
-                            <span>${B.nama}</span>
-                            <span class="font-mono text-blue-400">${B.waktu}</span>
-                        </div>`}),x.innerHTML=k||'<span class="text-slate-500 text-[10px]">Kosong</span>'}else x.innerHTML=`<div class="text-xs text-slate-400">Waktu Absen: <span class="text-white font-mono">${p.waktu}</span></div>`;if(E){E.style.display="block";const k=m.getBoundingClientRect(),B=k.top+window.scrollY-E.offsetHeight-10,P=k.left+window.scrollX+k.width/2-E.offsetWidth/2;E.style.top=`${B}px`,E.style.left=`${P}px`}},v=function(){const p=document.getElementById("calendar-tooltip");p&&(p.style.display="none")};var o=h,a=f,l=v;const u=document.getElementById("calendar");document.getElementById("calendar-tooltip"),window.calendarInstance=new window.FullCalendar.Calendar(u,{plugins:[window.dayGridPlugin,window.interactionPlugin],initialView:"dayGridMonth",locale:"en",height:"100%",headerToolbar:{left:"prev,next",center:"title",right:"today"},events:"/api/admin/calendar_events",dateClick:function(p){const m=p.dateStr;if(document.querySelectorAll(".fc-daygrid-day").forEach(E=>{E.classList.remove("selected-date")}),r===m)r=null,i(t?t.value.toLowerCase():"",null),h("Date filter removed - Showing all data");else{r=m,p.dayEl.classList.add("selected-date"),i(t?t.value.toLowerCase():"",m);const E=new Date(m+"T00:00:00").toLocaleDateString("id-ID",{day:"numeric",month:"long",year:"numeric"});h(`Filter active: ${E}`)}},eventContent:function(p){const m=p.event.extendedProps,E=m.is_admin,R=E?"pill-admin":"pill-user",x=E?"users":"check-circle",k=E?`${m.count}`:"Present";return{html:`
-                    <div class="custom-event-pill ${R}">
-                      <div class="flex justify-center items-center gap-2">
-                        <i data-lucide="${x}" style="width:12px; height:12px;"></i>
-                        <span>${k}</span>
-                      </div>
-                    </div>
-                `}},eventDidMount:p=>{typeof window.lucide<"u"&&window.lucide.createIcons();const m=p.el.closest(".fc-daygrid-day");if(m){m.classList.add("has-attendance");const E=p.event.extendedProps;window.innerWidth>=768&&(m.addEventListener("mouseenter",()=>f(E,m)),m.addEventListener("mouseleave",()=>v()))}}}),window.calendarInstance.render()}}function Ew(){const t=document.getElementById("userSearch"),e=document.querySelectorAll(".user-row"),n=document.getElementById("noResult");t&&t.addEventListener("input",function(r){const i=r.target.value.toLowerCase();let o=!1;e.forEach(a=>{a.getAttribute("data-search").includes(i)?(a.style.removeProperty("display"),o=!0):a.style.display="none"}),n&&(i!==""&&e.length>0?n.classList.toggle("hidden",o):n.classList.add("hidden"))}),window.toggleEdit=function(r){const i=document.getElementById(`name-${r}`),o=document.getElementById(`btn-edit-${r}`),a=document.getElementById(`icon-edit-${r}`),l=document.getElementById(`icon-save-${r}`);if(i.getAttribute("contenteditable")==="true"){const h=i.innerText.trim();h?saveEdit(r,h):alert("Nama tidak boleh kosong!")}else{i.setAttribute("contenteditable","true"),i.focus(),o.classList.add("border-blue-500","bg-blue-500/10"),a.classList.add("hidden"),l.classList.remove("hidden");const h=document.createRange(),f=window.getSelection();h.selectNodeContents(i),h.collapse(!1),f.removeAllRanges(),f.addRange(h)}},window.saveEdit=function(r,i){fetch(`/api/admin/edit_user/${r}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({nama:i})}).then(o=>{o.ok?(document.getElementById(`name-${r}`).classList.add("text-emerald-400"),setTimeout(()=>location.reload(),500)):alert("Database Sync Failed.")})},window.deleteUser=function(r){Swal.fire({title:"Delete Biometric Data?",text:"WARNING: Face data will be permanently deleted and cannot be recovered!",icon:"warning",showCancelButton:!0,confirmButtonColor:"#ef4444",cancelButtonColor:"#334155",confirmButtonText:"Yes, Delete!",cancelButtonText:"Cancel",background:"#0f172a",color:"#fff"}).then(i=>{i.isConfirmed&&fetch(`/api/admin/delete_user/${r}`,{method:"POST"}).then(o=>{if(o.ok){Swal.fire({icon:"success",title:"Successfully Deleted!",text:"Biometric data has been removed from the system.",showConfirmButton:!1,timer:1500,background:"#0f172a",color:"#fff"});const a=document.getElementById(`row-${r}`);a.style.transform="translateX(50px)",a.style.opacity="0",setTimeout(()=>a.remove(),300),setTimeout(()=>location.reload(),500)}else Swal.fire({icon:"error",title:"Delete Failed",text:"An error occurred while deleting data.",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"})})})},window.deleteAllUsers=function(){Swal.fire({title:"Delete All Biometric Data?",text:"CRITICAL WARNING: All face data will be permanently deleted and cannot be recovered!",icon:"error",showCancelButton:!0,confirmButtonColor:"#ef4444",cancelButtonColor:"#334155",confirmButtonText:"Yes, Delete All!",cancelButtonText:"Cancel",background:"#0f172a",color:"#fff"}).then(r=>{r.isConfirmed&&(Swal.fire({title:"Deleting...",text:"Please wait, deleting all biometric data.",allowOutsideClick:!1,allowEscapeKey:!1,showConfirmButton:!1,background:"#0f172a",color:"#fff",didOpen:()=>{Swal.showLoading()}}),fetch("/api/admin/delete_all_users",{method:"POST"}).then(i=>i.json()).then(i=>{i.status==="success"?Swal.fire({icon:"success",title:"Success!",text:`${i.deleted_count} biometric records have been deleted.`,showConfirmButton:!1,timer:2e3,background:"#0f172a",color:"#fff"}).then(()=>{location.reload()}):Swal.fire({icon:"error",title:"Failed",text:i.message||"An error occurred while deleting data.",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"})}).catch(i=>{Swal.fire({icon:"error",title:"System Error",text:"Failed to connect to server.",background:"#0f172a",color:"#fff",confirmButtonColor:"#3b82f6"})}))})},window.showImageModal=function(r,i){const o=document.getElementById("imageModal"),a=document.getElementById("modalImage"),l=document.getElementById("modalName");!o||!a||!l||(a.src=r,l.innerText=i,o.classList.add("active"),document.body.style.overflow="hidden")},window.closeImageModal=function(){const r=document.getElementById("imageModal");r&&(r.classList.remove("active"),document.body.style.overflow="")},document.addEventListener("keydown",r=>{r.key==="Escape"&&closeImageModal()})}window.confirmLogout=function(t){t&&t.preventDefault(),Swal.fire({title:"Sign Out?",text:"You are about to end your current session.",icon:"question",showCancelButton:!0,confirmButtonColor:"#ef4444",cancelButtonColor:"#334155",confirmButtonText:"Yes, Logout",cancelButtonText:"Cancel",background:"#0f172a",color:"#fff"}).then(e=>{e.isConfirmed&&(window.location.href="/admin/logout")})};window.Swal=tr;window.FaceDetection=gw.FaceDetection;window.Camera=mw.Camera;window.FullCalendar={Calendar:vv};window.dayGridPlugin=Wv;window.interactionPlugin=fw;window.lucide={createIcons:()=>{Ta({icons:{ShieldCheck:ud,ScanFace:ad,History:Ju,Users:vd,UserPlus:pd,LogOut:nd,LogIn:td,Search:cd,Code2:Qu,PlusSquare:fd,Fingerprint:Zu,Edit:dd,Save:sd,Trash:hd,AlertOctagon:rd,X:wd,Calendar:Gu,Rss:od,Info:ed,Filter:Xu,CheckCircle:Yu,ArrowRight:$u,Plus:id,User:md,Camera:qu,Upload:gd,ImagePlus:Ku,SearchX:ld}})}};
@@ -0,0 +1,12 @@
+"""Synthetic data shared by the benchmark scripts."""
+import numpy as np
+
+
+def synthetic_gallery(n, dim=128, seed=0):
+    """Unit-norm embeddings clustered like dlib encodings (people look alike in groups)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, n // 50), dim))
+    labels = rng.integers(0, len(centers), size=n)
+    gallery = centers[labels] + 0.6 * rng.normal(size=(n, dim))
+    gallery /= np.linalg.norm(gallery, axis=1, keepdims=True)
+    return gallery.astype(np.float32)
@@ -0,0 +1,51 @@
+import time
+import os
+import sys
+import argparse
+import numpy as np
+
+# Add current dir to path to import local modules
+sys.path.append(os.getcwd())
+from face_index import BruteForceIndex, IVFFlatIndex
+from benchmark_data import synthetic_gallery
+
+def timed_search(index, probes, **kwargs):
+    start = time.perf_counter()
+    indices = np.empty(len(probes), dtype=np.int64)
+    for i, probe in enumerate(probes):
+        indices[i] = index.search(probe, **kwargs)[0][0, 0]
+    elapsed = time.perf_counter() - start
+    return indices, elapsed / len(probes) * 1000
+
+def test_performance(size, queries, nprobes):
+    gallery = synthetic_gallery(size)
+    rng = np.random.default_rng(1)
+    probe_ids = rng.choice(size, queries, replace=False)
+    probes = gallery[probe_ids] + 0.02 * rng.normal(size=(queries, gallery.shape[1])).astype(np.float32)
+
+    print(f"--- Gallery: {size} identities, {queries} queries ---")
+
+    exact = BruteForceIndex()
+    exact.build(gallery)
+    truth, exact_ms = timed_search(exact, probes)
+    print(f"exact        : {exact_ms:8.3f} ms/query  recall@1 1.000")
+
+    start = time.perf_counter()
+    ivf = IVFFlatIndex()
+    ivf.build(gallery)
+    print(f"IVF build    : {time.perf_counter() - start:8.3f} s  (nlist={len(ivf.centroids)})")
+
+    for nprobe in nprobes:
+        found, ivf_ms = timed_search(ivf, probes, nprobe=nprobe)
+        recall = np.mean(found == truth)
+        print(f"ivf nprobe={nprobe:<3d}: {ivf_ms:8.3f} ms/query  recall@1 {recall:.3f}  "
+              f"speedup {exact_ms / ivf_ms:5.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recall@1 / latency of the IVF index vs exact search")
+    parser.add_argument("--size", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    args = parser.parse_args()
+    for size in args.size:
+        test_performance(size, args.queries, args.nprobe)
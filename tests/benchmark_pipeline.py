@@ -0,0 +1,349 @@
+"""
+End-to-end scan benchmark: per-stage timings (decode, face_locations,
+face_encodings, matching) and /api/process_image latency/throughput
+through the Flask test client, backed by mongomock and a fake Sheets
+client. Galleries are deterministic synthetic embeddings.
+
+    python tests/benchmark_pipeline.py --sizes 1000 10000 100000 --output bench.json
+    python tests/benchmark_pipeline.py --compare bench.json   # vs a previous run
+
+Without --image the frame is synthetic (no real face), so HOG finds
+nothing: the HTTP runs then use a fixed face box (detect timing is still
+reported on its own).
+"""
+import time
+import os
+import sys
+import json
+import base64
+import argparse
+import platform
+import subprocess
+import tempfile
+import numpy as np
+import cv2
+
+# Add repo root to path to import local modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+from benchmark_data import synthetic_gallery
+
+
+def synthetic_frame(width=640, height=480, seed=0):
+    """Deterministic webcam-sized JPEG (gradient + noise + a face-sized blob)"""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    base = (x / width * 120 + y / height * 80).astype(np.float32)
+    frame = np.stack([base, base * 0.9, base * 0.8], axis=-1)
+    frame += rng.normal(scale=12, size=frame.shape)
+    cv2.ellipse(frame, (width // 2, height // 2), (width // 8, height // 5), 0, 0, 360,
+                (150, 170, 200), -1)
+    frame = np.clip(frame, 0, 255).astype(np.uint8)
+    return cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])[1].tobytes()
+
+
+def summarize(samples_s):
+    ms = np.asarray(samples_s) * 1000
+    return {
+        "n": int(len(ms)),
+        "mean_ms": round(float(ms.mean()), 4),
+        "p50_ms": round(float(np.percentile(ms, 50)), 4),
+        "p99_ms": round(float(np.percentile(ms, 99)), 4),
+        "min_ms": round(float(ms.min()), 4),
+        "max_ms": round(float(ms.max()), 4),
+    }
+
+
+def time_calls(fn, iterations, warmup=2):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class FakeSheet:
+    """Stands in for the gspread worksheet (rows are only counted)"""
+
+    def __init__(self):
+        self.rows = 0
+
+    def append_row(self, row):
+        self.rows += 1
+
+    def append_rows(self, rows):
+        self.rows += len(rows)
+
+
+# ============================================
+# STAGES
+# ============================================
+
+def bench_stages(engine, image_bytes, iterations):
+    import face_recognition
+
+    b64 = "data:image/jpeg;base64," + base64.b64encode(image_bytes).decode('utf-8')
+    rgb = engine.decode_image_bytes(image_bytes)
+    stages = {
+        "decode_base64": time_calls(lambda: engine.process_base64_image(b64), iterations),
+        "decode_bytes": time_calls(lambda: engine.decode_image_bytes(image_bytes), iterations),
+        # Thumbnail exposure/blur (+ Haar when available) check ahead of HOG
+        "quality_gate": time_calls(lambda: engine.assess_frame(rgb), iterations),
+        # Production path: HOG on the downscaled frame
+        "face_locations": time_calls(lambda: engine.detect_faces(rgb), iterations),
+        "face_locations_full_frame": time_calls(
+            lambda: face_recognition.face_locations(rgb, number_of_times_to_upsample=1), iterations),
+    }
+
+    locations = engine.detect_faces(rgb)
+    if not locations:
+        locations = [fixed_box(rgb)]
+    # Kiosk-supplied face box (?box= / ?region=face): HOG on the padded region only
+    stages["face_locations_region"] = time_calls(
+        lambda: engine.detect_face_in_region(rgb, locations[0]), iterations)
+    stages["face_encodings"] = time_calls(
+        lambda: face_recognition.face_encodings(rgb, locations[:1]), iterations)
+    probe = face_recognition.face_encodings(rgb, locations[:1])[0]
+    return stages, len(engine.detect_faces(rgb)), locations[:1], probe
+
+
+def fixed_box(rgb):
+    """Centre face box (top, right, bottom, left) for frames without a real face"""
+    h, w = rgb.shape[:2]
+    return (h // 4, 3 * w // 4, 3 * h // 4, w // 4)
+
+
+def load_gallery(engine, gallery, probe):
+    """Install a synthetic gallery whose row 0 is the probe's identity"""
+    gallery = gallery.copy()
+    gallery[0] = probe
+    names = [f"Person{i:06d}" for i in range(len(gallery))]
+    start = time.perf_counter()
+    # Stamped with the store's generation so the shared-store sync keeps it
+    engine._set_gallery(gallery, names, generation=engine.embedding_store.generation())
+    return time.perf_counter() - start
+
+
+def bench_match(engine, gallery, probe, iterations, seed):
+    rng = np.random.default_rng(seed)
+    probes = gallery[rng.choice(len(gallery), 64)] + \
+        0.02 * rng.normal(size=(64, gallery.shape[1])).astype(np.float32)
+    single = probes[:1]
+    return {
+        "single": time_calls(lambda: engine.match_encodings(single), iterations),
+        "batch_64": time_calls(lambda: engine.match_encodings(probes), max(1, iterations // 4)),
+    }
+
+
+# ============================================
+# HTTP
+# ============================================
+
+def mongomock_bulk_compat():
+    """Same shim as conftest: pymongo >= 4.9 passes ``sort`` to bulk ops, mongomock 4.3 rejects it"""
+    from mongomock.collection import BulkOperationBuilder
+
+    for name in ("add_update", "add_replace"):
+        original = getattr(BulkOperationBuilder, name)
+
+        def compat(self, *args, sort=None, _original=original, **kwargs):
+            return _original(self, *args, **kwargs)
+
+        setattr(BulkOperationBuilder, name, compat)
+
+
+def setup_app(engine, workdir):
+    """Import app with its side effects in workdir, then swap in mongomock + fakes"""
+    os.environ.setdefault("ATTENDANCE_SPOOL_DIR", os.path.join(workdir, "spool"))
+    os.environ.setdefault("PREVIEW_DIR", os.path.join(workdir, "previews"))
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import app as app_module
+    finally:
+        os.chdir(cwd)
+
+    import mongomock
+    from attendance_cache import AttendanceCache
+    from attendance_writer import AttendanceWriter
+    from attendance_feed import AttendanceFeed
+    from attendance_rollup import DailyRollup
+
+    mongomock_bulk_compat()
+    db = mongomock.MongoClient()['db_absensi']
+    sheet = FakeSheet()
+    cache = AttendanceCache(db['log_absensi'], db['daftar_wajah'])
+    cache.ensure_indexes()
+    rollup = DailyRollup(db['rekap_harian'], db['log_absensi'])
+    writer = AttendanceWriter(db['log_absensi'], get_sheet=lambda: sheet,
+                              spool_dir=os.path.join(workdir, "bench-spool"), rollup=rollup)
+    app_module.attendance_writer.stop()
+    app_module.collection = db['log_absensi']
+    app_module.users_collection = db['daftar_wajah']
+    app_module.attendance_cache = cache
+    app_module.attendance_writer = writer.start()
+    app_module.attendance_feed = AttendanceFeed(db['log_absensi'])
+    app_module.daily_rollup = rollup
+    app_module.face_engine = engine
+    app_module.app.config['TESTING'] = True
+    return app_module, db, sheet
+
+
+def bench_http(app_module, image_bytes, requests, first_scan):
+    """
+    ``first_scan``: forget today's attendance before each request so every
+    scan takes the insert path; otherwise repeat scans hit the cache.
+    """
+    client = app_module.app.test_client()
+    statuses = {}
+
+    def post():
+        if first_scan:
+            app_module.attendance_cache.forget()
+        response = client.post('/api/process_image', data=image_bytes, content_type='image/jpeg')
+        status = response.get_json().get('status')
+        statuses[status] = statuses.get(status, 0) + 1
+
+    for _ in range(2):
+        post()
+    statuses.clear()
+    samples = []
+    start_all = time.perf_counter()
+    for _ in range(requests):
+        start = time.perf_counter()
+        post()
+        samples.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - start_all
+    app_module.attendance_writer.flush(force=True)
+
+    result = summarize(samples)
+    result["throughput_rps"] = round(requests / elapsed, 2)
+    result["statuses"] = statuses
+    return result
+
+
+# ============================================
+# REPORT
+# ============================================
+
+def flatten(report, prefix=""):
+    """{"stages.decode_bytes.p50_ms": 1.2, ...} for comparisons"""
+    flat = {}
+    for key, value in report.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and name.endswith(("_ms", "_rps", "_s")):
+            flat[name] = value
+    return flat
+
+
+def compare(current, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    old, new = flatten(baseline), flatten(current)
+    print(f"--- vs {baseline_path} ({baseline.get('meta', {}).get('commit')}) ---")
+    for name in sorted(set(old) & set(new)):
+        if not name.endswith(("p50_ms", "p99_ms", "throughput_rps", "build_s")):
+            continue
+        ratio = new[name] / old[name] if old[name] else float("inf")
+        print(f"{name:55s} {old[name]:12.3f} -> {new[name]:12.3f}  ({ratio:5.2f}x)")
+
+
+def run(args):
+    from face_engine import FaceEngine
+
+    if args.image:
+        with open(args.image, "rb") as f:
+            image_bytes = f.read()
+    else:
+        image_bytes = synthetic_frame(seed=args.seed)
+
+    workdir = tempfile.mkdtemp(prefix="bench-")
+    engine = FaceEngine(known_faces_dir=os.path.join(workdir, "known_faces"))
+
+    print("--- Stages ---")
+    stages, detected, locations, probe = bench_stages(engine, image_bytes, args.iterations)
+    for name, stats in stages.items():
+        print(f"{name:26s} p50 {stats['p50_ms']:9.3f} ms  p99 {stats['p99_ms']:9.3f} ms")
+
+    if detected == 0:
+        # Synthetic frame: HOG finds nothing, scan with a fixed box instead
+        engine.detect_faces = lambda rgb, scale=None, upsample=1: list(locations)
+
+    app_module, db, sheet = setup_app(engine, workdir)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "image": args.image or "synthetic",
+            "image_bytes": len(image_bytes),
+            "faces_detected": detected,
+            "seed": args.seed,
+        },
+        "stages": stages,
+        "match": {},
+        "http": {},
+    }
+
+    for size in args.sizes:
+        gallery = synthetic_gallery(size, seed=args.seed)
+        build_s = load_gallery(engine, gallery, probe)
+        match = bench_match(engine, gallery, probe, args.iterations, args.seed)
+        match["kind"] = engine.index.kind
+        match["build_s"] = round(build_s, 4)
+        report["match"][str(size)] = match
+        print(f"--- Gallery {size} ({engine.index.kind}, build {build_s:.3f} s) ---")
+        print(f"match single             p50 {match['single']['p50_ms']:9.3f} ms  "
+              f"p99 {match['single']['p99_ms']:9.3f} ms")
+
+        http = {
+            "repeat_scan": bench_http(app_module, image_bytes, args.requests, first_scan=False),
+            "first_scan": bench_http(app_module, image_bytes, args.requests, first_scan=True),
+        }
+        report["http"][str(size)] = http
+        for mode, stats in http.items():
+            print(f"http {mode:20s} p50 {stats['p50_ms']:9.3f} ms  p99 {stats['p99_ms']:9.3f} ms  "
+                  f"{stats['throughput_rps']:8.1f} req/s  {stats['statuses']}")
+
+    app_module.attendance_writer.stop()
+    report["meta"]["sheet_rows"] = sheet.rows
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-stage and HTTP benchmark of the scan pipeline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--iterations", type=int, default=50, help="timed calls per stage")
+    parser.add_argument("--requests", type=int, default=200, help="HTTP requests per gallery size")
+    parser.add_argument("--image", help="JPEG with a real face (default: synthetic frame)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", help="previous JSON report to compare against")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        compare(report, args.compare)
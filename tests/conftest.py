@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def mongomock_bulk_compat(monkeypatch):
+    """
+    pymongo >= 4.9 passes ``sort`` to bulk update/replace ops, which
+    mongomock 4.3 does not accept yet. Drop it so bulk_write works
+    against mongomock.
+    """
+    try:
+        from mongomock.collection import BulkOperationBuilder
+    except ImportError:
+        return
+
+    for name in ("add_update", "add_replace"):
+        original = getattr(BulkOperationBuilder, name)
+
+        def compat(self, *args, sort=None, _original=original, **kwargs):
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(BulkOperationBuilder, name, compat)
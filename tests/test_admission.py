@@ -0,0 +1,62 @@
+import pytest
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from admission import AdmissionController, Overloaded, parse_frame_timestamp
+
+
+def test_sheds_when_saturated():
+    admission = AdmissionController(max_in_flight=2, max_wait=0.05, retry_after=3)
+    first = admission.acquire()
+    second = admission.acquire()
+
+    with pytest.raises(Overloaded) as e:
+        admission.acquire()
+    assert (e.value.reason, e.value.retry_after) == ("saturated", 3)
+
+    admission.release(first)
+    admission.release(admission.acquire())
+    admission.release(second)
+    assert admission.stats == {"admitted": 3, "saturated": 1, "stale_frame": 0}
+    assert admission.depth() == {"in_flight": 0, "waiting": 0}
+
+def test_waiter_admitted_when_slot_frees():
+    admission = AdmissionController(max_in_flight=1, max_wait=2.0)
+    slots = admission.acquire()
+    threading.Timer(0.1, admission.release, args=(slots,)).start()
+
+    start = time.monotonic()
+    admission.release(admission.acquire())
+
+    assert time.monotonic() - start < 1.5
+
+def test_weight_is_capped_at_capacity():
+    admission = AdmissionController(max_in_flight=4, max_wait=0)
+    slots = admission.acquire(weight=16)
+
+    assert slots == 4
+    with pytest.raises(Overloaded):
+        admission.acquire()
+    admission.release(slots)
+
+def test_stale_frames_dropped():
+    admission = AdmissionController(max_frame_age=5)
+
+    with pytest.raises(Overloaded) as e:
+        admission.acquire(captured_at=time.time() - 10)
+    assert e.value.reason == "stale_frame"
+    admission.release(admission.acquire(captured_at=time.time() - 1))
+    assert admission.depth()["in_flight"] == 0
+
+    # Age check disabled
+    AdmissionController(max_frame_age=0).acquire(captured_at=0)
+
+def test_parse_frame_timestamp():
+    assert parse_frame_timestamp("1700000000000") == 1700000000.0
+    assert parse_frame_timestamp(None) is None
+    assert parse_frame_timestamp("soon") is None
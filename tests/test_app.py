@@ -1,4 +1,5 @@
 import pytest
+import hashlib
 import sys
 import os
 from unittest.mock import MagicMock, patch
@@ -6,6 +7,7 @@ from unittest.mock import MagicMock, patch
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import app as app_module
 from app import app
 
 @pytest.fixture
@@ -103,3 +105,530 @@ def test_api_process_image_duplicate(client, mock_face_engine, mocker):
     json_data = response.get_json()
     assert json_data['status'] == 'already_present'
     assert 'sudah terabsensi' in json_data['message']
+
+@pytest.fixture
+def mongo_db(mocker):
+    """mongomock-backed collections + a fresh attendance cache"""
+    import mongomock
+    from attendance_cache import AttendanceCache
+    from attendance_writer import AttendanceWriter
+    from attendance_history import AttendanceHistory
+    from attendance_feed import AttendanceFeed
+    from attendance_rollup import DailyRollup
+    db = mongomock.MongoClient()['db_absensi']
+    mocker.patch('app.collection', db['log_absensi'])
+    mocker.patch('app.users_collection', db['daftar_wajah'])
+    cache = AttendanceCache(db['log_absensi'], db['daftar_wajah'])
+    cache.ensure_indexes()
+    mocker.patch('app.attendance_cache', cache)
+    mocker.patch('app.log_to_sheets')
+    rollup = DailyRollup(db['rekap_harian'], db['log_absensi'])
+    mocker.patch('app.daily_rollup', rollup)
+    # Writer without spool/thread; tests call flush() explicitly
+    writer = AttendanceWriter(db['log_absensi'], rollup=rollup)
+    mocker.patch('app.attendance_writer', writer)
+    mocker.patch('app.attendance_history', AttendanceHistory(db['log_absensi']))
+    mocker.patch('app.attendance_feed', AttendanceFeed(db['log_absensi']))
+    return db
+
+@pytest.fixture
+def previews(mocker, tmp_path):
+    from preview_store import PreviewStore
+    store = PreviewStore(str(tmp_path / 'previews'))
+    mocker.patch('app.preview_store', store)
+    return store
+
+def test_api_process_batch_per_frame_results(client, mock_face_engine, mongo_db):
+    mongo_db['daftar_wajah'].insert_one({"nama": "Alice", "image_preview": None})
+    # First "Alice" frame inserts, the repeat in the same batch is deduplicated
+    mock_face_engine.recognize_batch.return_value = [
+        ("success", "Face recognized", "Alice"),
+        ("error", "Face not detected", None),
+        ("success", "Face recognized", "Alice"),
+    ]
+
+    response = client.post('/api/process_batch', json={'frames': [
+        {'image': 'frame1', 'kiosk_id': 'gate-1'},
+        'frame2',
+        {'image': 'frame3', 'kiosk_id': 'gate-2'},
+    ]})
+
+    json_data = response.get_json()
+    assert json_data['status'] == 'success'
+    results = json_data['results']
+    assert [r['status'] for r in results] == ['success', 'error', 'already_present']
+    assert results[0]['kiosk_id'] == 'gate-1'
+    assert results[2]['kiosk_id'] == 'gate-2'
+    mock_face_engine.recognize_batch.assert_called_once_with(['frame1', 'frame2', 'frame3'])
+    app_module.attendance_writer.flush()
+    assert mongo_db['log_absensi'].count_documents({}) == 1
+
+def test_api_process_batch_too_many_frames(client, mock_face_engine):
+    response = client.post('/api/process_batch', json={'frames': ['x'] * 1000})
+
+    assert response.status_code == 413
+    mock_face_engine.recognize_batch.assert_not_called()
+
+def test_api_process_image_raw_jpeg_body(client, mock_face_engine):
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_face.return_value = ("error", "Face not recognized", None)
+
+    response = client.post('/api/process_image', data=b'\xff\xd8jpeg-bytes',
+                           content_type='image/jpeg')
+
+    assert response.get_json()['status'] == 'error'
+    mock_face_engine.decode_image.assert_called_once_with(b'\xff\xd8jpeg-bytes')
+
+def test_api_process_image_multipart(client, mock_face_engine):
+    import io
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_face.return_value = ("error", "Face not recognized", None)
+
+    response = client.post('/api/process_image', data={
+        'image': (io.BytesIO(b'jpeg-bytes'), 'frame.jpg')
+    }, content_type='multipart/form-data')
+
+    assert response.get_json()['status'] == 'error'
+    mock_face_engine.decode_image.assert_called_once_with(b'jpeg-bytes')
+
+def test_api_process_image_client_face_box(client, mock_face_engine):
+    import numpy as np
+    mock_face_engine.decode_image.return_value = np.zeros((480, 640, 3), dtype=np.uint8)
+    mock_face_engine.recognize_face.return_value = ("error", "Face not recognized", None)
+
+    client.post('/api/process_image?box=0.25,0.5,0.5,0.25', data=b'jpeg', content_type='image/jpeg')
+    assert mock_face_engine.recognize_face.call_args[1]['face_box'] == (240, 480, 360, 160)
+
+    client.post('/api/process_image?region=face', data=b'jpeg', content_type='image/jpeg')
+    assert mock_face_engine.recognize_face.call_args[1]['face_box'] == (0, 640, 480, 0)
+
+    client.post('/api/process_image', data=b'jpeg', content_type='image/jpeg')
+    assert mock_face_engine.recognize_face.call_args[1]['face_box'] is None
+
+    response = client.post('/api/process_image?box=oops', data=b'jpeg', content_type='image/jpeg')
+    assert response.get_json() == {"status": "error", "message": "Invalid box (expected x,y,w,h)"}
+
+def test_api_process_image_quality_rejection_reason(client, mock_face_engine):
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_face.return_value = ("rejected", "blurry", None)
+
+    response = client.post('/api/process_image', data=b'jpeg', content_type='image/jpeg')
+
+    data = response.get_json()
+    assert data["status"] == "error"
+    assert data["reason"] == "blurry"
+    assert "blurry" in data["message"]
+
+def test_api_process_image_json_still_supported(client, mock_face_engine):
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_face.return_value = ("error", "Face not recognized", None)
+
+    client.post('/api/process_image', json={'image': 'data:image/jpeg;base64,abcd'})
+
+    mock_face_engine.decode_image.assert_called_once_with('data:image/jpeg;base64,abcd')
+
+def test_api_register_face_raw_body(client, mock_face_engine, mocker, previews):
+    mock_users = mocker.patch('app.users_collection')
+    mocker.patch('preview_store.compress_image_to_jpeg', return_value=b'small-jpeg')
+    mock_face_engine.register_face.return_value = (True, "Success! Face Alice saved.")
+
+    response = client.post('/api/register_face?nama=Alice', data=b'jpeg-bytes',
+                           content_type='image/jpeg')
+
+    assert response.get_json()['status'] == 'success'
+    doc = mock_users.insert_one.call_args[0][0]
+    mock_face_engine.register_face.assert_called_once_with('Alice', b'jpeg-bytes', face_id=str(doc['_id']))
+    assert 'image_preview' not in doc
+    # Thumbnail is stored after the response, then the etag is set
+    previews.drain(timeout=5)
+    assert previews.get(str(doc['_id'])) == b'small-jpeg'
+    mock_users.update_one.assert_called_once_with(
+        {"_id": doc['_id']}, {"$set": {"preview_etag": hashlib.sha1(b'small-jpeg').hexdigest()}})
+
+def test_api_register_face_base64_decoded_once(client, mock_face_engine, mongo_db, previews):
+    import base64
+    import cv2
+    import numpy as np
+    jpeg = cv2.imencode('.jpg', np.full((300, 800, 3), 128, np.uint8))[1].tobytes()
+    mock_face_engine.register_face.return_value = (True, "Success! Face Bob saved.")
+
+    response = client.post('/api/register_face', json={
+        'nama': 'Bob', 'image': 'data:image/jpeg;base64,' + base64.b64encode(jpeg).decode()})
+
+    assert response.get_json()['status'] == 'success'
+    assert mock_face_engine.register_face.call_args[0][1] == jpeg
+    previews.drain(timeout=5)
+    user = mongo_db['daftar_wajah'].find_one({"nama": "Bob"})
+    preview = previews.get(str(user['_id']))
+    assert user['preview_etag'] == hashlib.sha1(preview).hexdigest()
+    assert cv2.imdecode(np.frombuffer(preview, np.uint8), cv2.IMREAD_COLOR).shape[1] == 400
+
+def test_api_process_image_repeat_scan_served_from_cache(client, mock_face_engine, mongo_db, mocker):
+    user_id = mongo_db['daftar_wajah'].insert_one({"nama": "Alice", "preview_etag": "ab" * 20}).inserted_id
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_face.return_value = ("success", "Face recognized", "Alice")
+
+    first = client.post('/api/process_image', json={'image': 'frame'}).get_json()
+    app_module.attendance_writer.flush()
+    find_one = mocker.spy(mongo_db['log_absensi'], 'find_one')
+    second = client.post('/api/process_image', json={'image': 'frame'}).get_json()
+
+    assert first['status'] == 'success'
+    assert first['image_preview'] == f'/api/preview/{user_id}?v={"ab" * 8}'
+    assert second['status'] == 'already_present'
+    find_one.assert_not_called()
+    assert mongo_db['log_absensi'].count_documents({}) == 1
+
+def test_api_process_image_multi_face(client, mock_face_engine, mongo_db):
+    mongo_db['daftar_wajah'].insert_one({"nama": "Alice", "image_preview": None})
+    mongo_db['daftar_wajah'].insert_one({"nama": "Bob", "image_preview": None})
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_faces.return_value = ("success", "2 of 3 faces recognized", ["Alice", "Bob"])
+
+    response = client.post('/api/process_image?multi=1', json={'image': 'frame'})
+
+    json_data = response.get_json()
+    assert json_data['status'] == 'success'
+    assert [(r['status'], r['nama']) for r in json_data['results']] == \
+        [('success', 'Alice'), ('success', 'Bob')]
+    mock_face_engine.recognize_face.assert_not_called()
+    app_module.attendance_writer.flush()
+    assert mongo_db['log_absensi'].count_documents({}) == 2
+
+def test_api_process_image_multi_face_json_flag_no_match(client, mock_face_engine):
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_faces.return_value = ("error", "Face not detected", [])
+
+    response = client.post('/api/process_image', json={'image': 'frame', 'multi': True})
+
+    assert response.get_json() == {"status": "error", "message": "Face not detected", "results": []}
+
+@pytest.fixture
+def admin_client(client):
+    with client.session_transaction() as sess:
+        sess['role'] = 'admin'
+    return client
+
+def insert_logs(db, count, start=None):
+    from datetime import datetime, timedelta
+    start = start or datetime(2024, 1, 1, 8, 0, 0)
+    for i in range(count):
+        created_at = start + timedelta(hours=12 * i)
+        db['log_absensi'].insert_one({"nama": f"User{i}", "tanggal": created_at.strftime("%Y-%m-%d"),
+                                      "waktu": created_at.strftime("%H:%M:%S"), "created_at": created_at})
+
+def test_api_admin_logs_pages_through_history(admin_client, mongo_db):
+    insert_logs(mongo_db, 5)
+
+    first = admin_client.get('/api/admin/logs?limit=2').get_json()
+    second = admin_client.get(f"/api/admin/logs?limit=2&cursor={first['next_cursor']}").get_json()
+    third = admin_client.get(f"/api/admin/logs?limit=2&cursor={second['next_cursor']}").get_json()
+
+    names = [l['nama'] for page in (first, second, third) for l in page['logs']]
+    assert names == ['User4', 'User3', 'User2', 'User1', 'User0']
+    assert third['next_cursor'] is None
+
+def test_api_admin_logs_date_filter_and_bad_cursor(admin_client, mongo_db):
+    insert_logs(mongo_db, 6)
+
+    data = admin_client.get('/api/admin/logs?date_from=2024-01-02&date_to=2024-01-02').get_json()
+    assert [l['nama'] for l in data['logs']] == ['User3', 'User2']
+
+    response = admin_client.get('/api/admin/logs?cursor=not-a-cursor')
+    assert response.status_code == 400
+
+def test_api_admin_logs_search_beyond_first_page(admin_client, mongo_db):
+    insert_logs(mongo_db, 6)
+
+    data = admin_client.get('/api/admin/logs?limit=2&search=user0').get_json()
+    assert [l['nama'] for l in data['logs']] == ['User0']
+    assert data['next_cursor'] is None
+
+def test_api_admin_calendar_events_window(admin_client, mongo_db):
+    insert_logs(mongo_db, 6)
+    app_module.daily_rollup.rebuild()
+
+    events = admin_client.get(
+        '/api/admin/calendar_events?start=2024-01-02T00:00:00%2B07:00&end=2024-01-03T00:00:00%2B07:00').get_json()
+
+    assert [(e['start'], e['extendedProps']['count']) for e in events] == [('2024-01-02', 2)]
+    assert 'users' not in events[0]['extendedProps']
+
+def test_api_admin_calendar_day_details(admin_client, mongo_db):
+    insert_logs(mongo_db, 6)
+
+    data = admin_client.get('/api/admin/calendar_day/2024-01-02').get_json()
+
+    assert data['users'] == [{"nama": "User2", "waktu": "08:00:00"}, {"nama": "User3", "waktu": "20:00:00"}]
+    assert admin_client.get('/api/admin/calendar_day/someday').status_code == 400
+
+def test_rollup_follows_scans_and_deletions(admin_client, mock_face_engine, mongo_db):
+    from datetime import datetime
+    today = datetime.now().strftime("%Y-%m-%d")
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_face.return_value = ("success", "Face recognized", "Alice")
+
+    admin_client.post('/api/process_image', json={'image': 'frame'})
+    app_module.attendance_writer.flush()
+    assert mongo_db['rekap_harian'].find_one({"_id": today})['members'] == ['Alice']
+
+    log_id = mongo_db['log_absensi'].find_one({"nama": "Alice"})['_id']
+    admin_client.post(f'/api/admin/delete_log/{log_id}')
+    assert mongo_db['rekap_harian'].find_one({"_id": today})['members'] == []
+
+def test_admin_history_renders_first_page(admin_client, mongo_db, mocker):
+    mocker.patch.object(app_module.attendance_history, 'default_limit', 2)
+    insert_logs(mongo_db, 3)
+
+    response = admin_client.get('/admin/history')
+
+    assert response.status_code == 200
+    assert b'User2' in response.data and b'User0' not in response.data
+    assert b'data-next-cursor="ey' in response.data
+
+def test_api_preview_etag_and_cache_headers(client, mongo_db, previews):
+    user_id = mongo_db['daftar_wajah'].insert_one({"nama": "Alice"}).inserted_id
+    etag = previews.put(str(user_id), b'jpeg-bytes')
+
+    versioned = client.get(f'/api/preview/{user_id}?v={etag[:16]}')
+    assert versioned.data == b'jpeg-bytes'
+    assert versioned.mimetype == 'image/jpeg'
+    assert versioned.headers['ETag'] == f'"{etag}"'
+    assert 'immutable' in versioned.headers['Cache-Control']
+
+    # Without an admin session the content token is required
+    assert client.get(f'/api/preview/{user_id}').status_code == 404
+    assert client.get(f'/api/preview/{user_id}?v={"0" * 16}').status_code == 404
+    assert client.get(f'/api/preview/{user_id}?v=%C3%A9t%C3%A9').status_code == 404
+
+    with client.session_transaction() as sess:
+        sess['role'] = 'admin'
+    unversioned = client.get(f'/api/preview/{user_id}')
+    assert unversioned.headers['Cache-Control'] == 'private, no-cache'
+
+    revalidated = client.get(f'/api/preview/{user_id}', headers={'If-None-Match': f'"{etag}"'})
+    assert revalidated.status_code == 304
+    assert client.get('/api/preview/not-an-id').status_code == 404
+
+def test_api_preview_migrates_inline_preview(admin_client, mongo_db, previews):
+    import base64
+    user_id = mongo_db['daftar_wajah'].insert_one({
+        "nama": "Alice",
+        "image_preview": "data:image/jpeg;base64," + base64.b64encode(b'legacy').decode()}).inserted_id
+
+    response = admin_client.get(f'/api/preview/{user_id}')
+
+    assert response.data == b'legacy'
+    user = mongo_db['daftar_wajah'].find_one({"_id": user_id})
+    assert 'image_preview' not in user
+    assert user['preview_etag'] == hashlib.sha1(b'legacy').hexdigest()
+
+def test_admin_database_lists_without_inline_previews(admin_client, mongo_db, previews):
+    user_id = mongo_db['daftar_wajah'].insert_one({"nama": "Alice", "preview_etag": "cd" * 20}).inserted_id
+
+    response = admin_client.get('/admin/database')
+
+    assert f'/api/preview/{user_id}?v={"cd" * 8}'.encode() in response.data
+    assert b'loading="lazy"' in response.data
+
+def test_api_today_log_etag_and_since(client, mongo_db):
+    from datetime import datetime, timedelta
+    now = datetime.now().replace(microsecond=0)
+    today = now.strftime("%Y-%m-%d")
+    for i, nama in enumerate(["Alice", "Bob"]):
+        mongo_db['log_absensi'].insert_one({"nama": nama, "tanggal": today, "waktu": "08:00:00",
+                                            "created_at": now - timedelta(minutes=10 - 5 * i)})
+
+    full = client.get('/api/today_log')
+    assert [l['nama'] for l in full.get_json()] == ['Bob', 'Alice']
+    assert client.get('/api/today_log', headers={'If-None-Match': full.headers['ETag']}).status_code == 304
+
+    since = (now - timedelta(minutes=7)).isoformat()
+    data = client.get(f'/api/today_log?since={since}').get_json()
+    assert [l['nama'] for l in data['logs']] == ['Bob']
+    assert data['since'] == (now - timedelta(minutes=5)).isoformat()
+    assert client.get('/api/today_log?since=yesterday').status_code == 400
+
+    # Offset cursors (e.g. a UTC "Z" timestamp) compare against naive local created_at
+    from datetime import timezone
+    utc_since = (now - timedelta(minutes=7)).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    data = client.get(f'/api/today_log?since={utc_since}').get_json()
+    assert [l['nama'] for l in data['logs']] == ['Bob']
+
+def test_api_today_log_fed_by_process_image(client, mock_face_engine, mongo_db):
+    mongo_db['daftar_wajah'].insert_one({"nama": "Alice"})
+    mock_face_engine.decode_image.return_value = "fake_img"
+    mock_face_engine.recognize_face.return_value = ("success", "Face recognized", "Alice")
+    client.get('/api/today_log')
+
+    client.post('/api/process_image', json={'image': 'frame'})
+
+    # Visible before the batched writer flushed it to MongoDB
+    assert mongo_db['log_absensi'].count_documents({}) == 0
+    assert [l['nama'] for l in client.get('/api/today_log').get_json()] == ['Alice']
+
+def test_api_today_log_stream_replays_since_last_event(client, mongo_db, mocker):
+    from datetime import datetime, timedelta
+    mocker.patch('app.FEED_STREAM_SECONDS', 0)
+    now = datetime.now().replace(microsecond=0)
+    mongo_db['log_absensi'].insert_one({"nama": "Alice", "tanggal": now.strftime("%Y-%m-%d"),
+                                        "waktu": "08:00:00", "created_at": now})
+
+    response = client.get('/api/today_log/stream',
+                          headers={'Last-Event-ID': (now - timedelta(minutes=5)).isoformat()})
+
+    assert response.mimetype == 'text/event-stream'
+    body = response.get_data(as_text=True)
+    assert f"id: {now.isoformat()}\nevent: attendance\n" in body
+    assert '"nama": "Alice"' in body
+    assert app_module.attendance_feed.stats()['subscribers'] == 0
+
+def test_api_today_log_stream_limit(client, mongo_db, mocker):
+    mocker.patch.object(app_module.attendance_feed, 'max_subscribers', 0)
+
+    response = client.get('/api/today_log/stream')
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '30'
+
+def test_metrics_endpoint_reports_scan_stages(client, mock_face_engine, mongo_db, mocker):
+    mock_face_engine.recognize_face.return_value = ("success", "Face recognized", "Metric User")
+    client.post('/api/process_image', data=b'jpeg', content_type='image/jpeg')
+
+    response = client.get('/metrics')
+
+    text = response.get_data(as_text=True)
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    assert 'absensi_stage_seconds_count{stage="attendance_dedup"}' in text
+    assert 'absensi_http_request_seconds_bucket{endpoint="process_image",method="POST",status="200",le="+Inf"}' in text
+    assert 'absensi_attendance_total{result="recorded"}' in text
+    assert '# TYPE absensi_attendance_queue_depth gauge' in text
+
+    mocker.patch('app.METRICS_TOKEN', 'secret')
+    assert client.get('/metrics').status_code == 401
+    assert client.get('/metrics', headers={'Authorization': 'Bearer secret'}).status_code == 200
+
+def test_api_process_image_sheds_load(client, mock_face_engine, mocker):
+    import time
+    from admission import AdmissionController
+    admission = AdmissionController(max_in_flight=1, max_wait=0, retry_after=2, max_frame_age=5)
+    mocker.patch('app.scan_admission', admission)
+    mock_face_engine.recognize_face.return_value = ("error", "Face not recognized", None)
+
+    held = admission.acquire()
+    response = client.post('/api/process_image', data=b'jpeg', content_type='image/jpeg')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '2'
+    assert response.get_json()['reason'] == 'saturated'
+    mock_face_engine.decode_image.assert_not_called()
+    admission.release(held)
+
+    stale = str(int((time.time() - 60) * 1000))
+    response = client.post('/api/process_image', data=b'jpeg', content_type='image/jpeg',
+                           headers={'X-Frame-Timestamp': stale})
+    assert response.status_code == 408
+    assert response.get_json()['reason'] == 'stale_frame'
+
+    fresh = str(int(time.time() * 1000))
+    response = client.post('/api/process_image', data=b'jpeg', content_type='image/jpeg',
+                           headers={'X-Frame-Timestamp': fresh})
+    assert response.status_code == 200
+    # Server clock echo the kiosk uses to send timestamps in server time
+    assert abs(int(response.headers['X-Server-Time']) / 1000 - time.time()) < 5
+    assert 'X-Server-Time' not in client.get('/login').headers
+    assert admission.depth()["in_flight"] == 0
+
+def test_api_process_image_pool_busy_is_503(client, mock_face_engine):
+    from face_pool import FacePoolBusy
+    mock_face_engine.recognize_face.side_effect = FacePoolBusy("Face pool busy")
+
+    response = client.post('/api/process_image', data=b'jpeg', content_type='image/jpeg')
+
+    assert response.status_code == 503
+    assert response.get_json()['reason'] == 'pool_busy'
+    assert 'Retry-After' in response.headers
+
+def test_api_admin_bulk_enroll_job(admin_client, mongo_db, mocker):
+    import io
+    import zipfile
+    mocker.patch('app.import_jobs', mongo_db['import_jobs'])
+    run = mocker.patch('app._run_bulk_enroll')
+
+    response = admin_client.post('/api/admin/bulk_enroll', data={'archive': (io.BytesIO(b'nope'), 'x.zip')},
+                                 content_type='multipart/form-data')
+    assert response.status_code == 400
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as z:
+        z.writestr('Alice.jpg', b'jpeg')
+    archive.seek(0)
+    response = admin_client.post('/api/admin/bulk_enroll',
+                                 data={'archive': (archive, 'team.zip'), 'names': (io.BytesIO(b'Alice.jpg,Alice'), 'n.csv')},
+                                 content_type='multipart/form-data')
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+    run.assert_called_once()
+    assert run.call_args[0][2] == b'Alice.jpg,Alice'
+    os.remove(run.call_args[0][1])
+    app_module.bulk_enroll_lock.release()
+
+    job = admin_client.get(f'/api/admin/bulk_enroll/{job_id}').get_json()
+    assert job['status'] == 'running' and job['file'] == 'team.zip'
+    assert admin_client.get('/api/admin/bulk_enroll/nope').status_code == 404
+
+def test_api_admin_bulk_enroll_setup_failure_releases_lock(admin_client, mocker, tmp_path):
+    import io
+    import tempfile
+    import zipfile
+    jobs = mocker.patch('app.import_jobs')
+    jobs.insert_one.side_effect = RuntimeError("mongo down")
+    mkstemp = tempfile.mkstemp
+    mocker.patch('app.tempfile.mkstemp', side_effect=lambda **kw: mkstemp(dir=str(tmp_path), **kw))
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as z:
+        z.writestr('Alice.jpg', b'jpeg')
+    archive.seek(0)
+    response = admin_client.post('/api/admin/bulk_enroll', data={'archive': (archive, 'team.zip')},
+                                 content_type='multipart/form-data')
+
+    assert response.status_code == 500
+    assert os.listdir(tmp_path) == []
+    assert app_module.bulk_enroll_lock.acquire(blocking=False)
+    app_module.bulk_enroll_lock.release()
+
+def test_run_bulk_enroll_refreshes_gallery_and_releases_lock(mock_face_engine, mongo_db, mocker, tmp_path):
+    mocker.patch('app.import_jobs', mongo_db['import_jobs'])
+    mocker.patch('app.bulk_enroller').run.side_effect = RuntimeError("bad zip")
+    archive = tmp_path / "bulk.zip"
+    archive.write_bytes(b'zip')
+    job_id = mongo_db['import_jobs'].insert_one({"status": "running"}).inserted_id
+    app_module.bulk_enroll_lock.acquire()
+
+    app_module._run_bulk_enroll(job_id, str(archive), None)
+
+    assert mongo_db['import_jobs'].find_one({"_id": job_id})['status'] == 'error'
+    assert not archive.exists()
+    mock_face_engine.refresh_gallery.assert_called_once()
+    assert app_module.bulk_enroll_lock.acquire(blocking=False)
+    app_module.bulk_enroll_lock.release()
+
+def test_api_admin_edit_and_delete_user_update_gallery(admin_client, mock_face_engine, mongo_db, previews):
+    user_id = mongo_db['daftar_wajah'].insert_one({"nama": "Alice"}).inserted_id
+    mock_face_engine.rename_face.return_value = (False, "Name Bob is already registered")
+
+    response = admin_client.post(f'/api/admin/edit_user/{user_id}', json={'nama': 'Bob'})
+    assert response.get_json() == {"status": "error", "message": "Name Bob is already registered"}
+    assert mongo_db['daftar_wajah'].find_one({"_id": user_id})['nama'] == 'Alice'
+
+    mock_face_engine.rename_face.return_value = (True, "Face renamed to Alicia")
+    response = admin_client.post(f'/api/admin/edit_user/{user_id}', json={'nama': 'Alicia'})
+    assert response.get_json()['status'] == 'success'
+    mock_face_engine.rename_face.assert_called_with(str(user_id), 'Alicia', name='Alice')
+    assert mongo_db['daftar_wajah'].find_one({"_id": user_id})['nama'] == 'Alicia'
+
+    response = admin_client.post(f'/api/admin/delete_user/{user_id}')
+    assert response.get_json()['status'] == 'success'
+    mock_face_engine.remove_face.assert_called_once_with(str(user_id), name='Alicia')
+    assert mongo_db['daftar_wajah'].count_documents({}) == 0
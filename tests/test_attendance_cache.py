@@ -0,0 +1,94 @@
+import pytest
+import mongomock
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from attendance_cache import AttendanceCache
+
+TODAY = "2024-01-01"
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient()['db_absensi']
+
+@pytest.fixture
+def cache(db):
+    cache = AttendanceCache(db['log_absensi'], db['daftar_wajah'])
+    cache.ensure_indexes()
+    return cache
+
+def test_warm_loads_today_only(db, cache):
+    db['log_absensi'].insert_many([
+        {"nama": "Alice", "tanggal": TODAY},
+        {"nama": "Bob", "tanggal": "2023-12-31"},
+    ])
+
+    assert cache.warm(TODAY) == 1
+    assert cache.is_present("Alice", TODAY) is True
+    assert cache.is_present("Bob", TODAY) is False
+
+def test_mark_present_upserts_once(db, cache):
+    assert cache.mark_present("Alice", TODAY, {"waktu": "08:00:00"}) is True
+    assert cache.mark_present("Alice", TODAY, {"waktu": "08:00:05"}) is False
+
+    docs = list(db['log_absensi'].find({"nama": "Alice"}))
+    assert len(docs) == 1
+    assert docs[0]["waktu"] == "08:00:00"
+
+def test_dedup_across_workers(db):
+    worker_a = AttendanceCache(db['log_absensi'], db['daftar_wajah'])
+    worker_b = AttendanceCache(db['log_absensi'], db['daftar_wajah'])
+    worker_a.warm(TODAY)
+    worker_b.warm(TODAY)
+
+    assert worker_a.mark_present("Alice", TODAY, {}) is True
+    # B's local set is stale, the upsert still refuses a second row
+    assert worker_b.is_present("Alice", TODAY) is False
+    assert worker_b.mark_present("Alice", TODAY, {}) is False
+    assert worker_b.is_present("Alice", TODAY) is True
+    assert db['log_absensi'].count_documents({}) == 1
+
+def test_midnight_rollover_rewarms(db, cache):
+    cache.warm(TODAY)
+    cache.mark_present("Alice", TODAY, {})
+
+    assert cache.is_present("Alice", "2024-01-02") is False
+    assert cache.stats()["day"] == "2024-01-02"
+
+def test_forget_after_log_delete(db, cache):
+    cache.warm(TODAY)
+    cache.mark_present("Alice", TODAY, {})
+    db['log_absensi'].delete_many({})
+
+    cache.forget("Alice", TODAY)
+
+    assert cache.is_present("Alice", TODAY) is False
+    assert cache.mark_present("Alice", TODAY, {}) is True
+
+def test_user_info_lru(db, mocker):
+    cache = AttendanceCache(db['log_absensi'], db['daftar_wajah'], user_cache_size=2)
+    db['daftar_wajah'].insert_many([{"nama": n, "preview_etag": n.lower()} for n in ("A", "B", "C")])
+    find_one = mocker.spy(db['daftar_wajah'], 'find_one')
+
+    assert cache.user_info("A")["preview_etag"] == "a"
+    cache.user_info("A")
+    assert find_one.call_count == 1
+
+    cache.user_info("B")
+    cache.user_info("C")  # evicts A
+    cache.user_info("A")
+    assert find_one.call_count == 4
+    assert cache.stats()["users_cached"] == 2
+
+def test_invalidate_user(db, cache):
+    db['daftar_wajah'].insert_one({"nama": "A", "preview_etag": "old"})
+    cache.user_info("A")
+    db['daftar_wajah'].update_one({"nama": "A"}, {"$set": {"preview_etag": "new"}})
+
+    cache.invalidate_user("A")
+
+    assert cache.user_info("A")["preview_etag"] == "new"
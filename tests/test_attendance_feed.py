@@ -0,0 +1,123 @@
+import pytest
+import mongomock
+import os
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from attendance_feed import AttendanceFeed, parse_since
+
+
+NOW = datetime.now()
+TODAY = NOW.strftime("%Y-%m-%d")
+
+
+def insert(collection, nama, created_at):
+    collection.insert_one({"nama": nama, "tanggal": created_at.strftime("%Y-%m-%d"),
+                           "waktu": created_at.strftime("%H:%M:%S"), "created_at": created_at})
+
+@pytest.fixture
+def collection():
+    return mongomock.MongoClient()['db_absensi']['log_absensi']
+
+@pytest.fixture
+def feed(collection):
+    return AttendanceFeed(collection, poll_interval=0, reload_seconds=3600, overlap_seconds=30)
+
+def test_rows_newest_first_and_since(feed, collection):
+    insert(collection, "Alice", NOW - timedelta(minutes=10))
+    insert(collection, "Bob", NOW - timedelta(minutes=5))
+    insert(collection, "Old", NOW - timedelta(days=1))
+
+    assert [r["nama"] for r in feed.rows()] == ["Bob", "Alice"]
+    assert [r["nama"] for r in feed.rows(NOW - timedelta(minutes=7))] == ["Bob"]
+
+def test_parse_since_converts_offsets_to_local_naive(feed, collection):
+    local = NOW.replace(microsecond=0)
+    utc = local.astimezone(timezone.utc)
+    assert parse_since(utc.isoformat().replace("+00:00", "Z")) == local
+    assert parse_since(local.isoformat()) == local
+    assert parse_since(None) is None
+    with pytest.raises(ValueError):
+        parse_since("yesterday")
+
+    # Comparable with the naive created_at of stored rows
+    insert(collection, "Alice", NOW - timedelta(minutes=5))
+    since = parse_since((NOW - timedelta(minutes=7)).astimezone(timezone.utc).isoformat())
+    assert [r["nama"] for r in feed.rows(since)] == ["Alice"]
+
+def test_poll_picks_up_rows_from_other_workers(feed, collection):
+    feed.rows()
+    insert(collection, "Alice", NOW)
+
+    assert [r["nama"] for r in feed.rows()] == ["Alice"]
+    assert feed.stats()["rows"] == 1
+
+def test_poll_is_rate_limited(collection, mocker):
+    feed = AttendanceFeed(collection, poll_interval=60, reload_seconds=3600)
+    feed.rows()
+    find = mocker.spy(collection, 'find')
+
+    feed.rows()
+    feed.rows()
+
+    find.assert_not_called()
+
+def test_publish_wakes_waiters(feed):
+    feed.refresh()
+    seq, epoch = feed.cursor()
+    result = {}
+
+    def waiter():
+        result["value"] = feed.wait(seq, epoch, timeout=5)
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    feed.publish("Alice", "08:00:00", NOW)
+    thread.join(5)
+
+    rows, new_seq, _, reset = result["value"]
+    assert [r["nama"] for r in rows] == ["Alice"]
+    assert new_seq == seq + 1 and reset is False
+
+def test_publish_dedups_names(feed):
+    feed.refresh()
+
+    feed.publish("Alice", "08:00:00", NOW)
+    feed.publish("Alice", "08:00:05", NOW)
+
+    assert len(feed.rows()) == 1
+
+def test_deleted_rows_reset_subscribers(feed, collection):
+    insert(collection, "Alice", NOW - timedelta(minutes=5))
+    feed.refresh()
+    seq, epoch = feed.cursor()
+
+    collection.delete_many({})
+    feed.invalidate()
+    rows, _, new_epoch, reset = feed.wait(seq, epoch, timeout=0)
+
+    assert reset is True and new_epoch != epoch
+    assert feed.rows() == []
+
+def test_reload_keeps_unflushed_local_rows(feed, collection):
+    feed.refresh()
+    feed.publish("Alice", "08:00:00", NOW)  # still in the writer's queue
+
+    feed.invalidate()
+    seq, epoch = feed.cursor()
+    feed.refresh()
+
+    assert [r["nama"] for r in feed.rows()] == ["Alice"]
+    assert feed.cursor() == (seq, epoch)
+
+def test_subscriber_limit(collection):
+    feed = AttendanceFeed(collection, max_subscribers=1)
+
+    assert feed.subscribe() is True
+    assert feed.subscribe() is False
+    feed.unsubscribe()
+    assert feed.subscribe() is True
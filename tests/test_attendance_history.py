@@ -0,0 +1,110 @@
+import pytest
+import mongomock
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from attendance_history import AttendanceHistory, decode_cursor, encode_cursor, serialize_log
+
+
+@pytest.fixture
+def collection():
+    collection = mongomock.MongoClient()['db_absensi']['log_absensi']
+    start = datetime(2024, 1, 1, 8, 0, 0)
+    for i in range(10):
+        created_at = start + timedelta(hours=6 * i)
+        collection.insert_one({"nama": f"User{i}", "tanggal": created_at.strftime("%Y-%m-%d"),
+                               "waktu": created_at.strftime("%H:%M:%S"), "created_at": created_at,
+                               "extra": "x" * 100})
+    return collection
+
+@pytest.fixture
+def history(collection):
+    history = AttendanceHistory(collection, default_limit=3, max_limit=4)
+    history.ensure_indexes()
+    return history
+
+def test_ensure_indexes(history, collection):
+    assert "created_at_id" in collection.index_information()
+    assert "tanggal_waktu" in collection.index_information()
+
+def test_pages_cover_everything_once(history):
+    seen = []
+    cursor = None
+    while True:
+        logs, cursor = history.page(cursor=cursor)
+        seen.extend(log["nama"] for log in logs)
+        if cursor is None:
+            break
+
+    assert seen == [f"User{i}" for i in range(9, -1, -1)]
+
+def test_page_projection_and_limit_cap(history):
+    logs, _ = history.page(limit=100)
+
+    assert len(logs) == 4
+    assert "extra" not in logs[0]
+
+def test_ties_on_created_at_broken_by_id(collection):
+    collection.delete_many({})
+    same = datetime(2024, 1, 1, 8, 0, 0)
+    for i in range(5):
+        collection.insert_one({"nama": f"User{i}", "tanggal": "2024-01-01", "created_at": same})
+    history = AttendanceHistory(collection, default_limit=2)
+
+    first, cursor = history.page()
+    second, cursor = history.page(cursor=cursor)
+    third, cursor = history.page(cursor=cursor)
+
+    names = [log["nama"] for log in first + second + third]
+    assert sorted(names) == [f"User{i}" for i in range(5)]
+    assert cursor is None
+
+def test_search_matches_name_substring_across_pages(history, collection):
+    collection.insert_one({"nama": "Dr. Smith", "tanggal": "2023-12-31", "waktu": "08:00:00",
+                           "created_at": datetime(2023, 12, 31, 8, 0, 0)})
+
+    logs, cursor = history.page(search="user")
+    assert len(logs) == 3 and cursor is not None
+    logs, cursor = history.page(search="sEr9")
+    assert [log["nama"] for log in logs] == ["User9"] and cursor is None
+    # Regex characters are literal; the oldest row is found beyond page one
+    assert [log["nama"] for log in history.page(search="dr.")[0]] == ["Dr. Smith"]
+    assert history.page(search="d.")[0] == []
+
+def test_date_range_is_inclusive(history):
+    logs, _ = history.page(limit=4, date_from="2024-01-02", date_to="2024-01-02")
+
+    assert {log["tanggal"] for log in logs} == {"2024-01-02"}
+    assert len(logs) == 4
+
+def test_invalid_inputs(history):
+    with pytest.raises(ValueError):
+        history.page(cursor="garbage")
+    with pytest.raises(ValueError):
+        history.page(date_from="yesterday")
+
+def test_cursor_roundtrip():
+    log = {"_id": "65a000000000000000000001", "created_at": datetime(2024, 1, 1, 8, 0, 0)}
+
+    created_at, _id = decode_cursor(encode_cursor(log))
+
+    assert created_at == log["created_at"]
+    assert str(_id) == log["_id"]
+
+def test_day_details_sorted_by_time(history):
+    details = history.day("2024-01-02")
+
+    assert [d["nama"] for d in details] == ["User3", "User4", "User5", "User6"]
+    assert details[0] == {"nama": "User3", "waktu": "02:00:00"}
+
+def test_serialize_log(history):
+    logs, _ = history.page(limit=1)
+
+    row = serialize_log(logs[0])
+
+    assert row["nama"] == "User9"
+    assert row["created_at"] == "2024-01-03T14:00:00"
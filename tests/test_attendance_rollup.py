@@ -0,0 +1,85 @@
+import pytest
+import mongomock
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from attendance_rollup import DailyRollup
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient()['db_absensi']
+
+@pytest.fixture
+def rollup(db):
+    return DailyRollup(db['rekap_harian'], db['log_absensi'])
+
+def test_add_is_idempotent(rollup):
+    rollup.add_many([("Alice", "2024-01-01"), ("Bob", "2024-01-01"), ("Alice", "2024-01-02")])
+    rollup.add("Alice", "2024-01-01")
+
+    assert rollup.counts("2024-01-01", "2024-02-01") == [
+        {"_id": "2024-01-01", "count": 2}, {"_id": "2024-01-02", "count": 1}]
+
+def test_counts_respect_range_and_skip_empty_days(rollup):
+    rollup.add_many([("Alice", "2023-12-31"), ("Alice", "2024-01-01"), ("Bob", "2024-01-02")])
+    rollup.remove("Bob", "2024-01-02")
+
+    assert rollup.counts("2024-01-01", "2024-02-01") == [{"_id": "2024-01-01", "count": 1}]
+
+def test_rebuild_from_log(rollup, db):
+    db['log_absensi'].insert_many([
+        {"nama": "Alice", "tanggal": "2024-01-01"},
+        {"nama": "Bob", "tanggal": "2024-01-01"},
+        {"nama": "Alice", "tanggal": "2024-01-02"},
+    ])
+    rollup.add("Ghost", "2024-01-05")
+
+    assert rollup.rebuild() == 2
+
+    assert sorted(db['rekap_harian'].find_one({"_id": "2024-01-01"})["members"]) == ["Alice", "Bob"]
+    assert db['rekap_harian'].find_one({"_id": "2024-01-05"}) is None
+
+def test_clear(rollup, db):
+    rollup.add("Alice", "2024-01-01")
+
+    rollup.clear()
+
+    assert db['rekap_harian'].count_documents({}) == 0
+
+def test_rebuild_once_across_workers(rollup, db):
+    db['log_absensi'].insert_many([{"nama": "Alice", "tanggal": "2024-01-01"},
+                                   {"nama": "Bob", "tanggal": "2024-01-02"}])
+    other_worker = DailyRollup(db['rekap_harian'], db['log_absensi'])
+    # A live row recorded before the rebuild is merged, not replaced
+    rollup.add("Carol", "2024-01-01")
+
+    assert rollup.rebuild_once() == 2
+    assert other_worker.rebuild_once() is None
+    assert rollup.rebuild_once() is None
+
+    assert sorted(db['rekap_harian'].find_one({"_id": "2024-01-01"})["members"]) == ["Alice", "Carol"]
+    # The lock document never shows up as a day
+    assert rollup.counts("2000-01-01", "2100-01-01") == [
+        {"_id": "2024-01-01", "count": 2}, {"_id": "2024-01-02", "count": 1}]
+
+def test_rebuild_lock_held_then_expired(rollup, db):
+    from datetime import datetime, timedelta
+    db['log_absensi'].insert_one({"nama": "Alice", "tanggal": "2024-01-01"})
+    assert rollup.claim_rebuild() is True
+
+    # Held by a live worker: skipped; its holder died: reclaimed after expiry
+    assert rollup.rebuild_once() is None
+    db['rekap_harian'].update_one({"_id": DailyRollup.REBUILD_LOCK},
+                                  {"$set": {"expires_at": datetime.now() - timedelta(seconds=1)}})
+    assert rollup.rebuild_once() == 1
+
+def test_failed_rebuild_releases_lock(rollup, db, mocker):
+    mocker.patch.object(rollup, 'rebuild', side_effect=RuntimeError("boom"))
+    with pytest.raises(RuntimeError):
+        rollup.rebuild_once()
+
+    assert db['rekap_harian'].find_one({"_id": DailyRollup.REBUILD_LOCK}) is None
@@ -0,0 +1,187 @@
+import pytest
+import mongomock
+import os
+import sys
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from attendance_writer import AttendanceWriter
+
+
+def make_doc(nama, tanggal="2024-01-01"):
+    return {"nama": nama, "tanggal": tanggal, "waktu": "08:00:00",
+            "created_at": datetime(2024, 1, 1, 8, 0, 0)}
+
+@pytest.fixture
+def collection():
+    return mongomock.MongoClient()['db_absensi']['log_absensi']
+
+@pytest.fixture
+def sheet():
+    return MagicMock()
+
+def make_writer(collection, sheet, spool_dir, **kwargs):
+    writer = AttendanceWriter(collection, get_sheet=lambda: sheet, spool_dir=str(spool_dir),
+                              flush_interval=60, **kwargs)
+    writer.start()
+    return writer
+
+def test_batches_mongo_and_sheets(collection, sheet, tmp_path):
+    writer = make_writer(collection, sheet, tmp_path)
+    for nama in ("Alice", "Bob", "Carol"):
+        assert writer.submit(make_doc(nama), ["01-01-2024", "08:00:00", nama, "ID"]) is True
+
+    writer.flush()
+
+    assert collection.count_documents({}) == 3
+    assert collection.find_one({"nama": "Bob"})["created_at"] == datetime(2024, 1, 1, 8, 0, 0)
+    sheet.append_rows.assert_called_once()
+    assert [row[2] for row in sheet.append_rows.call_args[0][0]] == ["Alice", "Bob", "Carol"]
+    assert writer.depth() == {"queue": 0, "mongo": 0, "sheets": 0}
+    writer.stop()
+
+def test_duplicate_rows_not_sent_to_sheets(collection, sheet, tmp_path):
+    collection.insert_one(make_doc("Alice"))
+    writer = make_writer(collection, sheet, tmp_path)
+
+    writer.submit(make_doc("Alice"), ["row-alice"])
+    writer.submit(make_doc("Bob"), ["row-bob"])
+    writer.flush()
+
+    assert collection.count_documents({}) == 2
+    sheet.append_rows.assert_called_once_with([["row-bob"]])
+    writer.stop()
+
+def test_sheets_failure_is_retried(collection, sheet, tmp_path):
+    on_error = MagicMock()
+    writer = make_writer(collection, sheet, tmp_path, on_sheets_error=on_error)
+    sheet.append_rows.side_effect = [Exception("quota"), None]
+
+    writer.submit(make_doc("Alice"), ["row-alice"])
+    writer.flush()
+    assert writer.depth()["sheets"] == 1
+    on_error.assert_called_once()
+
+    # Backoff skipped with force=True
+    writer.flush(force=True)
+    assert writer.depth()["sheets"] == 0
+    assert sheet.append_rows.call_count == 2
+    writer.stop()
+
+def test_spool_survives_restart(collection, sheet, tmp_path):
+    broken = MagicMock()
+    broken.bulk_write.side_effect = Exception("network down")
+    writer = make_writer(broken, sheet, tmp_path)
+    writer.submit(make_doc("Alice"), ["row-alice"])
+    writer.flush()
+    assert collection.count_documents({}) == 0
+
+    # Simulate the process dying: its spool lock is released, nothing flushed
+    writer._spool.close()
+    os.rename(writer._spool_path, os.path.join(tmp_path, "attendance-999999.jsonl"))
+
+    restarted = make_writer(collection, sheet, tmp_path)
+    assert restarted.stats["recovered"] == 1
+    restarted.flush()
+
+    assert collection.count_documents({"nama": "Alice"}) == 1
+    sheet.append_rows.assert_called_once_with([["row-alice"]])
+    assert not os.path.exists(os.path.join(tmp_path, "attendance-999999.jsonl"))
+    restarted.stop()
+
+def test_replay_after_mongo_stage_only_sends_sheets(collection, sheet, tmp_path):
+    sheet.append_rows.side_effect = Exception("quota")
+    writer = make_writer(collection, sheet, tmp_path)
+    writer.submit(make_doc("Alice"), ["row-alice"])
+    writer.flush()
+    writer._spool.close()
+    os.rename(writer._spool_path, os.path.join(tmp_path, "attendance-999998.jsonl"))
+
+    sheet.append_rows.side_effect = None
+    restarted = make_writer(collection, sheet, tmp_path)
+    assert restarted.depth() == {"queue": 0, "mongo": 0, "sheets": 1}
+    restarted.flush()
+
+    assert collection.count_documents({}) == 1
+    sheet.append_rows.assert_called_with([["row-alice"]])
+    restarted.stop()
+
+def test_replay_after_crash_before_mongo_marker_sends_sheets(collection, sheet, tmp_path):
+    writer = make_writer(collection, sheet, tmp_path)
+    writer.submit(make_doc("Alice"), ["row-alice"])
+    writer.submit(make_doc("Bob"), ["row-bob"])
+    # Rows committed to MongoDB, then the process died before the spool "mongo" marker
+    writer._append_spool = lambda entry: None
+    writer._flush_mongo()
+    writer._spool.close()
+    os.rename(writer._spool_path, os.path.join(tmp_path, "attendance-999997.jsonl"))
+
+    restarted = make_writer(collection, sheet, tmp_path)
+    assert restarted.depth()["mongo"] == 2
+    restarted.flush()
+
+    assert collection.count_documents({}) == 2
+    sheet.append_rows.assert_called_once_with([["row-alice"], ["row-bob"]])
+    restarted.stop()
+
+def test_replayed_duplicate_of_other_writer_not_sent_to_sheets(collection, sheet, tmp_path):
+    broken = MagicMock()
+    broken.bulk_write.side_effect = Exception("network down")
+    writer = make_writer(broken, sheet, tmp_path)
+    writer.submit(make_doc("Alice"), ["row-alice"])
+    writer.flush()
+    writer._spool.close()
+    os.rename(writer._spool_path, os.path.join(tmp_path, "attendance-999996.jsonl"))
+    collection.insert_one(make_doc("Alice"))  # another worker got there first
+
+    restarted = make_writer(collection, sheet, tmp_path)
+    restarted.flush()
+
+    assert collection.count_documents({}) == 1
+    sheet.append_rows.assert_not_called()
+    restarted.stop()
+
+def test_backlog_limit(collection, sheet, tmp_path):
+    writer = make_writer(collection, sheet, tmp_path, max_queue=2)
+
+    assert writer.submit(make_doc("A"), None) is True
+    assert writer.submit(make_doc("B"), None) is True
+    assert writer.submit(make_doc("C"), None) is False
+    writer.stop()
+
+def test_background_thread_flushes_on_stop(collection, sheet, tmp_path):
+    writer = make_writer(collection, sheet, tmp_path)
+    writer.submit(make_doc("Alice"), ["row-alice"])
+
+    writer.stop()
+
+    assert collection.count_documents({}) == 1
+
+def test_rollup_updated_with_batch(collection, sheet, tmp_path):
+    from attendance_rollup import DailyRollup
+    rollup = DailyRollup(collection.database['rekap_harian'], collection)
+    writer = make_writer(collection, sheet, tmp_path, rollup=rollup)
+
+    writer.submit(make_doc("Alice"), None)
+    writer.submit(make_doc("Bob"), None)
+    writer.flush()
+
+    assert rollup.counts("2024-01-01", "2024-01-02") == [{"_id": "2024-01-01", "count": 2}]
+    writer.stop()
+
+def test_rollup_failure_does_not_hold_back_sheets(collection, sheet, tmp_path):
+    rollup = MagicMock()
+    rollup.add_many.side_effect = Exception("rollup down")
+    writer = make_writer(collection, sheet, tmp_path, rollup=rollup)
+
+    writer.submit(make_doc("Alice"), ["row-alice"])
+    writer.flush()
+
+    assert collection.count_documents({}) == 1
+    sheet.append_rows.assert_called_once_with([["row-alice"]])
+    assert writer.stats["rollup_errors"] == 1
+    assert writer.depth() == {"queue": 0, "mongo": 0, "sheets": 0}
+    writer.stop()
@@ -0,0 +1,125 @@
+import pytest
+import cv2
+import mongomock
+import numpy as np
+import os
+import sys
+import zipfile
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bulk_enroll
+from bulk_enroll import BulkEnroller, iter_photos, load_name_mapping
+from embedding_store import EmbeddingStore
+from preview_store import PreviewStore
+
+
+def jpeg(seed):
+    img = np.random.RandomState(seed).randint(0, 255, (60, 60, 3), dtype=np.uint8)
+    return cv2.imencode(".jpg", img)[1].tobytes()
+
+
+@pytest.fixture
+def enroller(tmp_path, mocker):
+    """In-process enroller; dlib replaced by a per-image fake encoding"""
+    def fake_encode(img_rgb, detect_img=None, retry_enhanced=True):
+        if img_rgb.std() < 1:
+            return None, "No face detected. Please face the camera directly."
+        return np.full(128, img_rgb.mean() / 255.0), None
+
+    mocker.patch('bulk_enroll.encode_single_face', side_effect=fake_encode)
+    known_faces = tmp_path / "known_faces"
+    known_faces.mkdir()
+    users = mongomock.MongoClient()['db_absensi']['daftar_wajah']
+    return BulkEnroller(str(known_faces), users, PreviewStore(str(tmp_path / "previews")), workers=1)
+
+
+def test_iter_photos_directory_and_zip(tmp_path):
+    photos = tmp_path / "photos"
+    (photos / "sales").mkdir(parents=True)
+    (photos / "Alice.jpg").write_bytes(b"a")
+    (photos / "sales" / "Bob.PNG").write_bytes(b"b")
+    (photos / "notes.txt").write_bytes(b"x")
+    (photos / ".hidden.jpg").write_bytes(b"x")
+    assert list(iter_photos(str(photos))) == [("Alice.jpg", b"a"), ("sales/Bob.PNG", b"b")]
+
+    archive = tmp_path / "photos.zip"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("team/Carol.jpeg", b"c")
+        z.writestr("__MACOSX/._Carol.jpeg", b"x")
+        z.writestr("readme.md", b"x")
+    assert list(iter_photos(str(archive))) == [("team/Carol.jpeg", b"c")]
+
+    with pytest.raises(ValueError):
+        list(iter_photos(str(tmp_path / "missing")))
+
+
+def test_load_name_mapping_header_optional():
+    assert load_name_mapping(b"file,nama\nA.jpg, Alice \n\nB.jpg,Bob\n") == \
+        {"A.jpg": "Alice", "B.jpg": "Bob"}
+    assert load_name_mapping(b"A.jpg,Alice") == {"A.jpg": "Alice"}
+
+
+def test_run_enrolls_in_bulk_and_skips_known_hashes(enroller, tmp_path):
+    photos = tmp_path / "photos"
+    photos.mkdir()
+    (photos / "Alice.jpg").write_bytes(jpeg(1))
+    (photos / "b.jpg").write_bytes(jpeg(2))
+    (photos / "copy.jpg").write_bytes(jpeg(1))           # same content as Alice
+    (photos / "Blank.jpg").write_bytes(cv2.imencode(".jpg", np.zeros((60, 60, 3), np.uint8))[1].tobytes())
+    (photos / "broken.jpg").write_bytes(b"not an image")
+    names = tmp_path / "names.csv"
+    names.write_text("file,nama\nb.jpg,Bob\n")
+
+    progress = []
+    report = enroller.run(str(photos), names_csv=str(names), on_progress=lambda r: progress.append(r["failed"]))
+
+    assert report["total"] == 5
+    assert report["enrolled"] == 2
+    assert sorted(report["enrolled_names"]) == ["Alice", "Bob"]
+    assert report["skipped"] == 1 and report["skipped_files"] == ["copy.jpg"]
+    assert report["failed"] == 2
+    assert {f["file"] for f in report["failures"]} == {"Blank.jpg", "broken.jpg"}
+    assert len(progress) == 4 and report["images_per_second"] > 0
+
+    # One store save with both encodings, gallery JPEGs, previews and documents
+    store = EmbeddingStore(enroller.known_faces_dir)
+    store.load()
+    assert sorted(store.gallery()[1]) == ["Alice", "Bob"]
+    assert os.path.exists(os.path.join(enroller.known_faces_dir, "Bob.jpg"))
+    docs = {d["nama"]: d for d in enroller.users_collection.find()}
+    assert set(docs) == {"Alice", "Bob"}
+    for doc in docs.values():
+        assert doc["source_sha1"] and doc["preview_etag"]
+        assert enroller.preview_store.get(str(doc["_id"])) is not None
+
+    # Re-running the same directory decodes nothing new
+    again = enroller.run(str(photos), names_csv=str(names))
+    assert again["enrolled"] == 0
+    assert again["skipped"] == 3
+    assert enroller.users_collection.count_documents({}) == 2
+
+
+def test_run_rejects_duplicate_and_invalid_names(enroller, tmp_path):
+    archive = tmp_path / "photos.zip"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("a/Dana.jpg", jpeg(3))
+        z.writestr("b/Dana.jpg", jpeg(4))
+        z.writestr("Eve.jpg", jpeg(5))
+    report = enroller.run(str(archive), names_csv=b"Eve.jpg,../Eve\n")
+
+    assert report["enrolled_names"] == ["Dana"]
+    assert [f["file"] for f in report["failures"]] == ["Eve.jpg", "b/Dana.jpg"]
+
+
+def test_rerun_replaces_existing_user_face(enroller, tmp_path):
+    existing = enroller.users_collection.insert_one({"nama": "Alice"}).inserted_id
+    photos = tmp_path / "photos"
+    photos.mkdir()
+    (photos / "Alice.jpg").write_bytes(jpeg(6))
+
+    assert enroller.run(str(photos))["enrolled"] == 1
+    doc = enroller.users_collection.find_one({"nama": "Alice"})
+    assert doc["_id"] == existing and doc["source_sha1"]
+    assert enroller.preview_store.get(str(existing)) is not None
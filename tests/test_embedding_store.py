@@ -0,0 +1,251 @@
+import pytest
+import numpy as np
+import json
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from embedding_store import EmbeddingStore
+
+
+def write_image(directory, filename, content=b"fake-jpeg"):
+    path = os.path.join(directory, filename)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+def test_load_missing_cache(tmp_path):
+    store = EmbeddingStore(str(tmp_path))
+    assert store.load() == 0
+    assert store.matrix.shape == (0, 128)
+
+
+def test_save_and_reload_roundtrip(tmp_path):
+    path_a = write_image(tmp_path, "Alice.jpg", b"alice")
+    path_b = write_image(tmp_path, "Blank.jpg", b"blank")
+
+    store = EmbeddingStore(str(tmp_path))
+    store.load()
+    store.put("Alice.jpg", path_a, "Alice", np.full(128, 0.5))
+    store.put("Blank.jpg", path_b, "Blank", None)
+    assert store.save() is True
+
+    reloaded = EmbeddingStore(str(tmp_path))
+    assert reloaded.load() == 2
+    assert isinstance(reloaded.matrix, np.memmap)
+    assert reloaded.matrix.dtype == np.float32
+
+    hit, encoding = reloaded.lookup("Alice.jpg", path_a)
+    assert hit is True
+    assert np.allclose(encoding, 0.5)
+
+    # Cached "no face" result is a hit too, so it is not re-encoded
+    hit, encoding = reloaded.lookup("Blank.jpg", path_b)
+    assert hit is True
+    assert encoding is None
+
+
+def test_changed_content_is_a_miss(tmp_path):
+    path = write_image(tmp_path, "Alice.jpg", b"alice")
+    store = EmbeddingStore(str(tmp_path))
+    store.put("Alice.jpg", path, "Alice", np.zeros(128))
+    store.save()
+
+    write_image(tmp_path, "Alice.jpg", b"alice-new-photo")
+    os.utime(path, ns=(1, 1))
+
+    store.load()
+    hit, _ = store.lookup("Alice.jpg", path)
+    assert hit is False
+
+
+def test_touched_file_with_same_content_is_a_hit(tmp_path):
+    path = write_image(tmp_path, "Alice.jpg", b"alice")
+    store = EmbeddingStore(str(tmp_path))
+    store.put("Alice.jpg", path, "Alice", np.ones(128))
+    store.save()
+
+    os.utime(path, ns=(1, 1))
+
+    store.load()
+    hit, encoding = store.lookup("Alice.jpg", path)
+    assert hit is True
+    assert np.allclose(encoding, 1.0)
+    assert store.dirty is True
+
+
+def test_prune_removes_deleted_files(tmp_path):
+    path = write_image(tmp_path, "Alice.jpg", b"alice")
+    store = EmbeddingStore(str(tmp_path))
+    store.put("Alice.jpg", path, "Alice", np.ones(128))
+    store.save()
+
+    store.load()
+    store.prune([])
+    store.save()
+
+    assert EmbeddingStore(str(tmp_path)).load() == 0
+
+
+def test_corrupt_index_is_ignored(tmp_path):
+    with open(os.path.join(tmp_path, EmbeddingStore.INDEX_FILE), "w") as f:
+        f.write("{not json")
+
+    store = EmbeddingStore(str(tmp_path))
+    assert store.load() == 0
+    assert store.dirty is True
+
+
+def test_remove_leaves_tombstone_until_compaction(tmp_path):
+    path_a = write_image(tmp_path, "Alice.jpg", b"alice")
+    path_b = write_image(tmp_path, "Bob.jpg", b"bob")
+    store = EmbeddingStore(str(tmp_path))
+    store.load()
+    store.put("Alice.jpg", path_a, "Alice", np.full(128, 0.1), face_id="u1")
+    store.put("Bob.jpg", path_b, "Bob", np.full(128, 0.2))
+    store.save()
+    epoch = store.epoch
+    matrix_mtime = os.stat(store.matrix_path).st_mtime_ns
+
+    # Remove + rename only rewrite the index; rows and epoch stay
+    store.remove("Alice.jpg")
+    store.rename("Bob.jpg", "Robert.jpg", "Robert")
+    store.save()
+    reloaded = EmbeddingStore(str(tmp_path))
+    reloaded.load()
+    assert os.stat(store.matrix_path).st_mtime_ns == matrix_mtime
+    assert reloaded.epoch == epoch
+    assert reloaded.gallery()[1] == [None, "Robert"]
+    assert list(reloaded.tombstones()) == [0]
+    assert reloaded.find("u1") is None
+
+    assert reloaded.save(compact=True) is True
+    assert reloaded.epoch != epoch
+    assert reloaded.gallery()[1] == ["Robert"]
+    assert len(reloaded.tombstones()) == 0
+    assert reloaded.save(compact=True) is False
+
+
+def test_appends_write_rows_in_place(tmp_path):
+    store = EmbeddingStore(str(tmp_path))
+    store.load()
+    path = write_image(tmp_path, "user0.jpg", b"user0")
+    store.put("user0.jpg", path, "user0", np.zeros(128))
+    store.save()
+    inode = os.stat(store.matrix_path).st_ino
+    assert np.load(store.matrix_path, mmap_mode="r").shape == (EmbeddingStore.MIN_CAPACITY, 128)
+
+    # Rows fit in the preallocated file: same file, only the new rows written
+    reader = EmbeddingStore(str(tmp_path))
+    reader.load()
+    mapped = reader._map
+    for i in range(1, EmbeddingStore.MIN_CAPACITY):
+        path = write_image(tmp_path, f"user{i}.jpg", f"user{i}".encode())
+        store.put(f"user{i}.jpg", path, f"user{i}", np.full(128, i, dtype=np.float32))
+        store.save()
+    assert os.stat(store.matrix_path).st_ino == inode
+    reader.load()
+    assert reader._map is mapped and len(reader.matrix) == EmbeddingStore.MIN_CAPACITY
+    assert np.allclose(reader.encoding_for("user5.jpg"), 5)
+
+    # Full: copied once into a file of twice the capacity, rows keep their ids
+    path = write_image(tmp_path, "extra.jpg", b"extra")
+    store.put("extra.jpg", path, "extra", np.full(128, -1.0))
+    store.save()
+    assert os.stat(store.matrix_path).st_ino != inode
+    reader.load()
+    assert reader._map.shape == (2 * EmbeddingStore.MIN_CAPACITY, 128)
+    assert reader.entries["extra.jpg"]["row"] == EmbeddingStore.MIN_CAPACITY
+    assert np.allclose(reader.encoding_for("user5.jpg"), 5)
+    assert len(reader.tombstones()) == 0
+
+
+def test_loads_store_without_row_count(tmp_path):
+    # Written before the matrix file was preallocated: every row is used
+    path = write_image(tmp_path, "Alice.jpg", b"alice")
+    np.save(os.path.join(tmp_path, EmbeddingStore.MATRIX_FILE), np.full((2, 128), 0.5, dtype=np.float32))
+    stat = os.stat(path)
+    index = {"version": 1, "dim": 128, "epoch": "e1", "files": {"Alice.jpg": {
+        "name": "Alice", "id": None, "sha1": "x", "mtime": stat.st_mtime_ns,
+        "size": stat.st_size, "row": 1}}}
+    with open(os.path.join(tmp_path, EmbeddingStore.INDEX_FILE), "w") as f:
+        json.dump(index, f)
+
+    store = EmbeddingStore(str(tmp_path))
+    assert store.load() == 1
+    assert store.matrix.shape == (2, 128)
+    assert list(store.tombstones()) == [0]
+    hit, encoding = store.lookup("Alice.jpg", path)
+    assert hit is True and np.allclose(encoding, 0.5)
+
+
+def test_changes_are_appended_to_log_and_replayed_incrementally(tmp_path):
+    store = EmbeddingStore(str(tmp_path))
+    store.load()
+    for i, name in enumerate(("Alice", "Bob", "Carol")):
+        path = write_image(tmp_path, f"{name}.jpg", name.encode())
+        store.put(f"{name}.jpg", path, name, np.full(128, i, dtype=np.float32), face_id=f"u{i}")
+    store.save()
+    reader = EmbeddingStore(str(tmp_path))
+    reader.load()
+    index_stat = os.stat(store.index_path)
+
+    store.remove("Alice.jpg")
+    store.rename("Bob.jpg", "Robert.jpg", "Robert")
+    store.save()
+
+    # Only the log grew; the reader applies just that line
+    assert os.stat(store.index_path) == index_stat
+    with open(store.log_path, "rb") as f:
+        assert len(f.readlines()) == 2  # header + one change
+    assert reader.load() == 2
+    assert reader.find("u0") is None and reader.find("u1") == "Robert.jpg"
+    assert reader.gallery()[1] == [None, "Robert", "Carol"]
+    assert list(reader.tombstones()) == [0]
+    assert EmbeddingStore(str(tmp_path)).load() == 2
+
+
+def test_log_is_folded_into_index_once_it_outgrows_it(tmp_path):
+    path = write_image(tmp_path, "Alice.jpg", b"alice")
+    store = EmbeddingStore(str(tmp_path))
+    store.MIN_LOG_LINES = 3
+    store.load()
+    store.put("Alice.jpg", path, "Alice", np.ones(128), face_id="u1")
+    store.save()
+
+    for i in range(5):
+        store.rename(store.find("u1"), f"name{i}.jpg", f"name{i}")
+        store.save()
+
+    with open(store.log_path, "rb") as f:
+        assert len(f.readlines()) == 2  # folded at the 4th save, then one more line
+    reloaded = EmbeddingStore(str(tmp_path))
+    assert reloaded.load() == 1
+    assert reloaded.find("u1") == "name4.jpg"
+
+
+def test_torn_or_stale_log_lines_are_ignored(tmp_path):
+    path_a = write_image(tmp_path, "Alice.jpg", b"alice")
+    path_b = write_image(tmp_path, "Bob.jpg", b"bob")
+    store = EmbeddingStore(str(tmp_path))
+    store.load()
+    store.put("Alice.jpg", path_a, "Alice", np.ones(128))
+    store.save()
+
+    # A writer died mid-append: the partial line is skipped, then cut off
+    with open(store.log_path, "ab") as f:
+        f.write(b'{"rows": 9, "set": {"Ghost.jpg"')
+    assert store.load() == 1
+    store.put("Bob.jpg", path_b, "Bob", np.zeros(128))
+    store.save()
+    reloaded = EmbeddingStore(str(tmp_path))
+    assert reloaded.load() == 2 and len(reloaded.matrix) == 2
+
+    # Log of an older index (crash between index and log rewrite): only the index counts
+    with open(store.log_path, "wb") as f:
+        f.write(b'{"log": "old"}\n{"rows": 0, "set": {}, "del": ["Alice.jpg"]}\n')
+    stale = EmbeddingStore(str(tmp_path))
+    assert stale.load() == 1 and list(stale.entries) == ["Alice.jpg"]
@@ -1,12 +1,14 @@
 import pytest
 import numpy as np
 import os
+import threading
 from unittest.mock import MagicMock, patch, mock_open
 import sys
 
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import face_engine as face_engine_module
 from face_engine import FaceEngine
 
 @pytest.fixture
@@ -124,3 +126,553 @@ def test_register_face_success(face_engine, mocker):
     assert success is True
     assert "berhasil didaftarkan" in msg
     mock_reload.assert_called_once()
+
+def test_match_encodings_single_pass(face_engine):
+    rng = np.random.default_rng(0)
+    gallery = rng.normal(size=(50, 128)).astype(np.float32)
+    face_engine._set_gallery(gallery, [f"user{i}" for i in range(50)])
+
+    probes = gallery[[7, 42]] + 0.01
+    indices, distances = face_engine.match_encodings(probes)
+
+    assert indices[:, 0].tolist() == [7, 42]
+    expected = np.linalg.norm(gallery[[7, 42]] - probes, axis=1)
+    assert np.allclose(distances[:, 0], expected, atol=1e-3)
+
+def test_match_encodings_top_k_sorted(face_engine):
+    rng = np.random.default_rng(1)
+    gallery = rng.normal(size=(20, 128)).astype(np.float32)
+    face_engine._set_gallery(gallery, [str(i) for i in range(20)])
+
+    probe = gallery[3]
+    indices, distances = face_engine.match_encodings([probe], k=5)
+
+    exact = np.argsort(np.linalg.norm(gallery - probe, axis=1))[:5]
+    assert indices[0].tolist() == exact.tolist()
+    assert np.all(np.diff(distances[0]) >= 0)
+
+def test_match_encodings_empty_gallery(face_engine):
+    assert face_engine.match_encodings([np.zeros(128)]) is None
+
+def test_append_gallery_grows_buffer(face_engine):
+    for i in range(40):
+        face_engine._append_gallery(np.full(128, i, dtype=np.float32), f"user{i}")
+
+    assert face_engine.known_encodings.shape == (40, 128)
+    assert face_engine.known_names[-1] == "user39"
+    assert np.allclose(face_engine.index.sq_norms, [128.0 * i * i for i in range(40)])
+
+def test_recognize_face_vectorized_match(face_engine, mock_face_recognition):
+    alice = np.full(128, 0.1, dtype=np.float32)
+    face_engine._set_gallery([alice], ["Alice"])
+    mock_face_recognition.face_locations.return_value = [(0, 1, 1, 0)]
+    mock_face_recognition.face_encodings.return_value = [alice + 0.001]
+
+    status, message, name = face_engine.recognize_face(np.zeros((48, 64, 3), dtype=np.uint8))
+
+    assert status == "success"
+    assert name == "Alice"
+    mock_face_recognition.compare_faces.assert_not_called()
+
+def test_append_gallery_switches_to_ann(face_engine):
+    face_engine.ann_threshold = 64
+    rng = np.random.default_rng(2)
+    for i in range(64):
+        face_engine._append_gallery(rng.normal(size=128), f"user{i}")
+
+    assert face_engine.index.kind == "ivf"
+    assert len(face_engine.index) == 64
+    indices, _ = face_engine.match_encodings(face_engine.known_encodings[10], k=1)
+    assert indices[0, 0] == 10
+
+def register_with_encoding(engine, mock_face_recognition, name, encoding):
+    engine.process_base64_image = MagicMock(return_value=np.zeros((8, 8, 3), dtype=np.uint8))
+    mock_face_recognition.face_locations.return_value = [(0, 8, 8, 0)]
+    mock_face_recognition.face_encodings.return_value = [np.asarray(encoding)]
+    return engine.register_face(name, "ignored")
+
+def scan_after_refresh(engine, mock_face_recognition, encoding):
+    """The scan that notices a new generation starts the refresh; the next one sees it"""
+    mock_face_recognition.face_encodings.return_value = [np.asarray(encoding)]
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    engine.recognize_face(frame)
+    assert engine._poll_lock.acquire(timeout=5)
+    engine._poll_lock.release()
+    return engine.recognize_face(frame)
+
+def test_shared_gallery_registration_visible_to_other_worker(tmp_path, mock_face_recognition):
+    worker_a = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_b = FaceEngine(known_faces_dir=str(tmp_path))
+
+    success, _ = register_with_encoding(worker_a, mock_face_recognition, "Alice", np.full(128, 0.1))
+    assert success is True
+
+    # Worker B never reloaded, it only sees the bumped generation counter
+    status, _, name = scan_after_refresh(worker_b, mock_face_recognition, np.full(128, 0.1))
+    assert status == "success"
+    assert name == "Alice"
+    # Read-only view of the shared mmap, not a private copy
+    assert worker_b.known_encodings.flags.writeable is False
+
+def test_shared_gallery_append_extends_index(tmp_path, mock_face_recognition):
+    worker_a = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_b = FaceEngine(known_faces_dir=str(tmp_path))
+    register_with_encoding(worker_a, mock_face_recognition, "Alice", np.full(128, 0.1))
+    worker_b._sync_gallery()
+    epoch = worker_b._gallery_epoch
+
+    register_with_encoding(worker_a, mock_face_recognition, "Bob", np.full(128, -0.1))
+    assert worker_b._sync_gallery() is True
+
+    assert worker_b._gallery_epoch == epoch
+    assert worker_b.known_names == ["Alice", "Bob"]
+    assert worker_b._sync_gallery() is False
+
+def test_shared_gallery_clear_faces(tmp_path, mock_face_recognition):
+    worker_a = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_b = FaceEngine(known_faces_dir=str(tmp_path))
+    register_with_encoding(worker_a, mock_face_recognition, "Alice", np.full(128, 0.1))
+    worker_b._sync_gallery()
+    assert worker_b.known_names == ["Alice"]
+
+    assert worker_a.clear_faces() == 1
+
+    status, message, _ = scan_after_refresh(worker_b, mock_face_recognition, np.full(128, 0.1))
+    assert status == "error"
+    assert message == "Face not recognized"
+    assert not os.path.exists(os.path.join(tmp_path, "Alice.jpg"))
+
+def test_remove_face_tombstones_row_for_every_worker(tmp_path, mock_face_recognition, mocker):
+    worker_a = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_b = FaceEngine(known_faces_dir=str(tmp_path))
+    register_with_encoding(worker_a, mock_face_recognition, "Alice", np.full(128, 0.1))
+    register_with_encoding(worker_a, mock_face_recognition, "Bob", np.full(128, -0.1))
+    worker_b._sync_gallery()
+    epoch = worker_b._gallery_epoch
+    build = mocker.spy(face_engine_module, 'build_index')
+
+    # Legacy entry (no id) found by name; the image file goes too
+    assert worker_a.remove_face("id-alice", name="Alice") is True
+    assert not os.path.exists(os.path.join(tmp_path, "Alice.jpg"))
+    assert worker_a.remove_face("id-alice", name="Alice") is False
+
+    assert worker_b._sync_gallery() is True
+    # Same epoch: the row was tombstoned in a clone, nothing rebuilt
+    assert build.call_count == 0 and worker_b._gallery_epoch == epoch
+    assert worker_b.gallery_size() == 1
+    mock_face_recognition.face_encodings.return_value = [np.full(128, 0.1)]
+    assert worker_b.recognize_face(np.zeros((48, 64, 3), dtype=np.uint8))[0] == "error"
+    mock_face_recognition.face_encodings.return_value = [np.full(128, -0.1)]
+    assert worker_b.recognize_face(np.zeros((48, 64, 3), dtype=np.uint8))[2] == "Bob"
+
+    # Compaction drops the dead row and starts a new epoch
+    assert worker_a.compact_gallery() is True
+    worker_b._sync_gallery()
+    assert worker_b._gallery_epoch != epoch
+    assert worker_b.known_names == ["Bob"] and worker_b.index.tombstones == 0
+
+def test_rename_face_by_stable_id(tmp_path, mock_face_recognition, mocker):
+    worker_a = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_b = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_a.process_base64_image = MagicMock(return_value=np.zeros((8, 8, 3), dtype=np.uint8))
+    mock_face_recognition.face_locations.return_value = [(0, 8, 8, 0)]
+    mock_face_recognition.face_encodings.return_value = [np.full(128, 0.1)]
+    assert worker_a.register_face("Alice", "ignored", face_id="u1")[0] is True
+    register_with_encoding(worker_a, mock_face_recognition, "Bob", np.full(128, -0.1))
+    worker_b._sync_gallery()
+    build = mocker.spy(face_engine_module, 'build_index')
+
+    assert worker_a.rename_face("u1", "Bob")[0] is False
+    assert worker_a.rename_face("u1", "../x")[0] is False
+    assert worker_a.rename_face("u1", "Alicia") == (True, "Face renamed to Alicia")
+    assert os.path.exists(os.path.join(tmp_path, "Alicia.jpg"))
+    assert not os.path.exists(os.path.join(tmp_path, "Alice.jpg"))
+
+    worker_b._sync_gallery()
+    assert build.call_count == 0
+    assert worker_b.known_names == ["Alicia", "Bob"]
+    # Id survives the rename; a restart keeps the new name without re-encoding
+    assert worker_a.remove_face("u1") is True
+    mock_face_recognition.load_image_file.reset_mock()
+    restarted = FaceEngine(known_faces_dir=str(tmp_path))
+    mock_face_recognition.load_image_file.assert_not_called()
+    assert restarted.known_names == ["Bob"]
+
+def test_reregistration_tombstones_old_row(tmp_path, mock_face_recognition):
+    engine = FaceEngine(known_faces_dir=str(tmp_path))
+    register_with_encoding(engine, mock_face_recognition, "Alice", np.full(128, 0.1))
+    epoch = engine._gallery_epoch
+    register_with_encoding(engine, mock_face_recognition, "Alice", np.full(128, 0.3))
+
+    assert engine._gallery_epoch == epoch
+    # Row-aligned names keep the tombstone; known_names and counts do not
+    assert engine.gallery.names == [None, "Alice"]
+    assert engine.known_names == ["Alice"]
+    assert engine.gallery_size() == 1
+
+def test_background_compaction_after_many_removals(tmp_path, mock_face_recognition, mocker):
+    mocker.patch('face_engine.COMPACT_MIN_TOMBSTONES', 2)
+    engine = FaceEngine(known_faces_dir=str(tmp_path))
+    for i in range(4):
+        register_with_encoding(engine, mock_face_recognition, f"user{i}", np.full(128, i / 10))
+
+    engine.remove_face(None, name="user0")
+    assert engine.index.tombstones == 1
+    engine.remove_face(None, name="user1")
+
+    # Held by the background compaction until it is done
+    assert engine._compact_lock.acquire(timeout=5)
+    engine._compact_lock.release()
+    engine._sync_gallery()
+    assert engine.known_names == ["user2", "user3"]
+    assert engine.index.tombstones == 0
+
+def test_register_face_stores_upright_jpeg_as_is(tmp_path, mock_face_recognition):
+    import cv2
+    engine = FaceEngine(known_faces_dir=str(tmp_path))
+    jpeg = cv2.imencode('.jpg', np.full((60, 80, 3), 120, np.uint8))[1].tobytes()
+    mock_face_recognition.face_locations.return_value = [(0, 8, 8, 0)]
+    mock_face_recognition.face_encodings.return_value = [np.full(128, 0.1)]
+
+    assert engine.register_face("Alice", jpeg)[0] is True
+    with open(os.path.join(tmp_path, "Alice.jpg"), "rb") as f:
+        assert f.read() == jpeg
+
+def test_scan_keeps_snapshot_taken_before_concurrent_swap(face_engine, mock_face_recognition):
+    alice, bob = np.full(128, 0.1, dtype=np.float32), np.full(128, -0.1, dtype=np.float32)
+    face_engine._set_gallery([alice], ["Alice"])
+    before = face_engine.gallery
+    mock_face_recognition.face_locations.return_value = [(0, 1, 1, 0)]
+
+    # A reload publishing a reordered gallery mid-scan (after encoding)
+    def encode_then_swap(*args, **kwargs):
+        face_engine._set_gallery([bob, alice], ["Bob", "Alice"])
+        return [alice]
+    mock_face_recognition.face_encodings.side_effect = encode_then_swap
+
+    assert face_engine.recognize_face(np.zeros((48, 64, 3), dtype=np.uint8))[2] == "Alice"
+    assert before.names == ["Alice"] and len(before.index) == 1
+    assert face_engine.known_names == ["Bob", "Alice"]
+
+def test_scan_does_not_wait_for_running_refresh(tmp_path, mock_face_recognition):
+    worker_a = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_b = FaceEngine(known_faces_dir=str(tmp_path))
+    register_with_encoding(worker_a, mock_face_recognition, "Alice", np.full(128, 0.1))
+
+    # Another thread holds the refresh: the scan matches the current snapshot
+    with worker_b._sync_lock:
+        assert worker_b._sync_gallery() is False
+        mock_face_recognition.face_encodings.return_value = [np.full(128, 0.1)]
+        assert worker_b.recognize_face(np.zeros((48, 64, 3), dtype=np.uint8))[1] == "Face not recognized"
+    assert scan_after_refresh(worker_b, mock_face_recognition, np.full(128, 0.1))[2] == "Alice"
+
+def test_scan_refreshes_gallery_in_background(tmp_path, mock_face_recognition, mocker):
+    worker_a = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_b = FaceEngine(known_faces_dir=str(tmp_path))
+    register_with_encoding(worker_a, mock_face_recognition, "Alice", np.full(128, 0.1))
+    load = mocker.spy(worker_b.embedding_store, 'load')
+    started = threading.Event()
+    release = threading.Event()
+    sync = worker_b._sync_gallery
+
+    def slow_sync(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return sync(*args, **kwargs)
+    worker_b._sync_gallery = slow_sync
+
+    # The scan only compares generations; load/copy happen on the refresh thread
+    mock_face_recognition.face_encodings.return_value = [np.full(128, 0.1)]
+    assert worker_b.recognize_face(np.zeros((48, 64, 3), dtype=np.uint8))[1] == "Face not recognized"
+    assert started.wait(5) and load.call_count == 0
+    assert worker_b._poll_gallery() is False  # one refresh at a time
+    release.set()
+    assert worker_b._poll_lock.acquire(timeout=5)
+    worker_b._poll_lock.release()
+    assert load.call_count == 1 and worker_b.known_names == ["Alice"]
+
+def test_ivf_rebuild_runs_in_background(tmp_path, mock_face_recognition):
+    worker_a = FaceEngine(known_faces_dir=str(tmp_path))
+    worker_b = FaceEngine(known_faces_dir=str(tmp_path), ann_threshold=2)
+    for i in range(4):
+        register_with_encoding(worker_a, mock_face_recognition, f"user{i}", np.full(128, i / 10))
+    worker_a.remove_face(None, name="user0")
+    worker_a.compact_gallery()
+    before = worker_b.gallery
+
+    # New epoch at IVF size: the old snapshot stays live until the build is published
+    assert worker_b._sync_gallery() is False
+    assert worker_b._sync_lock.acquire(timeout=5)
+    worker_b._sync_lock.release()
+    assert worker_b.gallery is not before
+    assert worker_b.index.kind == "ivf" and worker_b.known_names == ["user1", "user2", "user3"]
+
+def test_sync_reads_store_consistently_with_other_threads(tmp_path, mock_face_recognition):
+    engine = FaceEngine(known_faces_dir=str(tmp_path))
+    register_with_encoding(engine, mock_face_recognition, "Alice", np.full(128, 0.1))
+    store = engine.embedding_store
+
+    # Another thread is mid-load() on the shared store object (entries and
+    # matrix reset) after a generation bump: the sync must not publish that
+    with engine._locked_store():
+        store.entries, store.matrix = {}, np.empty((0, 128), dtype=np.float32)
+        store._index_key = None  # a full load, not a log replay
+        store._bump_generation()
+        syncing = threading.Thread(target=engine._sync_gallery)
+        syncing.start()
+        syncing.join(timeout=0.2)
+        assert syncing.is_alive() and engine.known_names == ["Alice"]
+        store.load()
+    syncing.join(timeout=5)
+    assert engine.known_names == ["Alice"] and engine.gallery_size() == 1
+
+def test_append_and_batch_executor_do_not_wait_for_rebuild(face_engine):
+    done = []
+
+    def work():
+        face_engine._append_gallery(np.full(128, 0.1), "Alice")
+        face_engine._batch_executor()
+        done.append(True)
+
+    # A background rebuild holds _sync_lock for its whole duration
+    with face_engine._sync_lock:
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join(timeout=5)
+        assert done == [True]
+    assert face_engine.known_names == ["Alice"]
+
+def test_load_known_faces_uses_cache(tmp_path, mock_face_recognition):
+    engine = FaceEngine(known_faces_dir=str(tmp_path))
+    register_with_encoding(engine, mock_face_recognition, "Alice", np.full(128, 0.1))
+    mock_face_recognition.load_image_file.reset_mock()
+
+    restarted = FaceEngine(known_faces_dir=str(tmp_path))
+
+    mock_face_recognition.load_image_file.assert_not_called()
+    assert restarted.known_names == ["Alice"]
+
+def test_detect_faces_remaps_downscaled_boxes(face_engine, mock_face_recognition):
+    face_engine.detection_scale = 0.5
+    mock_face_recognition.face_locations.return_value = [(10, 60, 70, 20)]
+    rgb_img = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    locations = face_engine.detect_faces(rgb_img)
+
+    small = mock_face_recognition.face_locations.call_args[0][0]
+    assert small.shape == (240, 320, 3)
+    assert locations == [(20, 120, 140, 40)]
+
+def test_detect_faces_full_resolution(face_engine, mock_face_recognition):
+    mock_face_recognition.face_locations.return_value = [(10, 60, 70, 20)]
+    rgb_img = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    assert face_engine.detect_faces(rgb_img, scale=1.0) == [(10, 60, 70, 20)]
+    assert mock_face_recognition.face_locations.call_args[0][0] is rgb_img
+
+def test_recognize_face_encodes_full_resolution(face_engine, mock_face_recognition):
+    mock_face_recognition.face_locations.return_value = [(10, 60, 70, 20)]
+    mock_face_recognition.face_encodings.return_value = []
+    rgb_img = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    face_engine.recognize_face(rgb_img)
+
+    image, locations = mock_face_recognition.face_encodings.call_args[0]
+    assert image is rgb_img
+    assert locations == [(20, 120, 140, 40)]
+
+def test_detect_face_in_region_skips_full_frame(face_engine, mock_face_recognition):
+    # Client box 100x100 at (100, 200) -> padded 150x150 region resized to 200 px
+    mock_face_recognition.face_locations.return_value = [(40, 160, 160, 40), (0, 10, 10, 0)]
+    rgb_img = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    locations = face_engine.detect_face_in_region(rgb_img, (100, 300, 200, 200))
+
+    region = mock_face_recognition.face_locations.call_args[0][0]
+    assert region.shape[:2] == (200, 200)
+    assert mock_face_recognition.face_locations.call_args[1]["number_of_times_to_upsample"] == 0
+    # Largest face only, mapped back to frame coordinates
+    assert locations == [(105, 295, 195, 205)]
+
+def test_detect_face_in_region_rejects_tiny_or_empty(face_engine, mock_face_recognition):
+    rgb_img = np.zeros((480, 640, 3), dtype=np.uint8)
+    assert face_engine.detect_face_in_region(rgb_img, (0, 10, 10, 0)) == []
+    mock_face_recognition.face_locations.assert_not_called()
+
+    mock_face_recognition.face_locations.return_value = []
+    assert face_engine.detect_face_in_region(rgb_img, (100, 300, 200, 200)) == []
+
+def test_recognize_face_with_client_box(face_engine, mock_face_recognition):
+    alice = np.full(128, 0.1, dtype=np.float32)
+    face_engine._set_gallery([alice], ["Alice"])
+    mock_face_recognition.face_locations.return_value = [(40, 160, 160, 40)]
+    mock_face_recognition.face_encodings.return_value = [alice]
+    rgb_img = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    status, _, name = face_engine.recognize_face(rgb_img, face_box=(100, 300, 200, 200))
+
+    assert (status, name) == ("success", "Alice")
+    image, locations = mock_face_recognition.face_encodings.call_args[0]
+    assert image is rgb_img
+    assert locations == [(105, 295, 195, 205)]
+
+@pytest.fixture
+def gated_engine(face_engine):
+    face_engine.quality_gate = True
+    face_engine._face_cascade = None
+    return face_engine
+
+def textured(mean, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.clip(rng.normal(mean, 40, (240, 320, 3)), 0, 255).astype(np.uint8)
+
+def test_quality_gate_rejects_before_dlib(gated_engine, mock_face_recognition):
+    import cv2
+    sharp = textured(128)
+    cases = {
+        "too_dark": np.full((240, 320, 3), 5, dtype=np.uint8),
+        "overexposed": np.full((240, 320, 3), 250, dtype=np.uint8),
+        "blurry": cv2.GaussianBlur(sharp, (0, 0), 12),
+    }
+    for reason, img in cases.items():
+        assert gated_engine.recognize_face(img) == ("rejected", reason, None)
+
+    mock_face_recognition.face_locations.assert_not_called()
+    mock_face_recognition.face_encodings.assert_not_called()
+    stats = gated_engine.quality_stats()
+    assert stats["checked"] == 3 and stats["passed"] == 0
+    assert stats["too_dark"] == stats["overexposed"] == stats["blurry"] == 1
+
+def test_quality_gate_enhances_dark_frames_for_detection(gated_engine, mock_face_recognition):
+    mock_face_recognition.face_locations.return_value = []
+    mock_face_recognition.face_encodings.return_value = []
+    dark = textured(60)
+
+    assert gated_engine.recognize_face(dark) == ("error", "Face not detected", None)
+
+    # HOG saw the enhanced copy (brighter than the input)
+    detected_on = mock_face_recognition.face_locations.call_args[0][0]
+    assert detected_on.mean() > dark.mean() * 1.2
+    assert gated_engine.quality_stats()["enhanced"] == 1
+
+def test_quality_gate_cascade_no_face(gated_engine, mock_face_recognition):
+    gated_engine._face_cascade = MagicMock()
+    gated_engine._face_cascade.detectMultiScale.return_value = ()
+
+    assert gated_engine.recognize_faces(textured(128)) == ("rejected", "no_face", [])
+    # A kiosk face box is verified by HOG on the region, not the cascade
+    mock_face_recognition.face_locations.return_value = []
+    status, _, _ = gated_engine.recognize_face(textured(128), face_box=(40, 200, 200, 40))
+    assert status == "error"
+    gated_engine._face_cascade.detectMultiScale.assert_called_once()
+
+def test_quality_gate_batch_reason_per_frame(gated_engine, mock_face_recognition, mocker):
+    mocker.patch.object(gated_engine, 'decode_image', side_effect=lambda img: img)
+    mock_face_recognition.face_locations.return_value = []
+    mock_face_recognition.face_encodings.return_value = []
+
+    results = gated_engine.recognize_batch([np.zeros((240, 320, 3), dtype=np.uint8), textured(128)])
+
+    assert results == [("rejected", "too_dark", None), ("error", "Face not detected", None)]
+
+def test_register_face_gate_replaces_second_hog_pass(gated_engine, mock_face_recognition, mocker):
+    mocker.patch.object(gated_engine, 'decode_image', return_value=textured(128))
+    mock_face_recognition.face_locations.return_value = []
+
+    success, message = gated_engine.register_face("Bob", "image")
+
+    assert not success and "Face not found" in message
+    assert mock_face_recognition.face_locations.call_count == 1
+
+def test_encode_faces_dispatches_to_pool(face_engine, mock_face_recognition):
+    from face_engine import detect_and_encode
+    alice = np.full(128, 0.1, dtype=np.float32)
+    face_engine._set_gallery([alice], ["Alice"])
+    face_engine.pool = MagicMock()
+    face_engine.pool.run.return_value = ([alice], {"detect": 0.01, "encode": 0.02})
+    rgb_img = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    status, _, name = face_engine.recognize_face(rgb_img)
+
+    assert (status, name) == ("success", "Alice")
+    fn, image, face_box, detect_img, scale = face_engine.pool.run.call_args[0]
+    assert fn is detect_and_encode and image is rgb_img
+    assert (face_box, detect_img, scale) == (None, None, 0.5)
+    mock_face_recognition.face_locations.assert_not_called()
+
+def test_process_base64_image_fused_brightness(face_engine):
+    import base64
+    import cv2
+    bgr = np.random.default_rng(0).integers(0, 256, (48, 64, 3), dtype=np.uint8)
+    _, png = cv2.imencode('.png', bgr)
+    data = "data:image/png;base64," + base64.b64encode(png.tobytes()).decode()
+
+    result = face_engine.process_base64_image(data)
+
+    expected = cv2.cvtColor(cv2.convertScaleAbs(bgr, alpha=1.1, beta=10), cv2.COLOR_BGR2RGB)
+    assert result.shape == expected.shape
+    assert np.abs(result.astype(int) - expected).max() <= 1
+
+def test_recognize_batch_single_match_call(face_engine, mocker):
+    alice = np.full(128, 0.1, dtype=np.float32)
+    bob = np.full(128, -0.1, dtype=np.float32)
+    face_engine._set_gallery([alice, bob], ["Alice", "Bob"])
+    stranger = np.full(128, 0.9, dtype=np.float32)
+
+    frames = {"f1": [alice], "f2": [], "f3": [stranger, bob]}
+    mocker.patch.object(face_engine, 'process_base64_image', side_effect=lambda b64: b64)
+    mocker.patch.object(face_engine, 'encode_faces', side_effect=lambda img: frames[img])
+    match = mocker.spy(face_engine, 'match_encodings')
+
+    results = face_engine.recognize_batch(["f1", "f2", "f3"])
+
+    assert results == [
+        ("success", "Face recognized", "Alice"),
+        ("error", "Face not detected", None),
+        ("success", "Face recognized", "Bob"),
+    ]
+    assert match.call_count == 1
+    assert len(match.call_args[0][0]) == 3
+
+def test_recognize_batch_bad_frame(face_engine, mocker):
+    mocker.patch.object(face_engine, 'process_base64_image', side_effect=ValueError("bad data"))
+
+    status, message, name = face_engine.recognize_batch(["garbage"])[0]
+
+    assert status == "error"
+    assert "bad data" in message
+
+def test_decode_image_accepts_raw_bytes(face_engine):
+    import cv2
+    bgr = np.zeros((16, 24, 3), dtype=np.uint8)
+    bgr[..., 0] = 200  # blue
+    _, png = cv2.imencode('.png', bgr)
+
+    rgb = face_engine.decode_image(png.tobytes())
+
+    assert rgb.shape == (16, 24, 3)
+    assert rgb[0, 0, 2] == 230  # blue channel brightened and moved last
+    with pytest.raises(ValueError):
+        face_engine.decode_image(b'not an image')
+
+def test_recognize_faces_returns_every_match(face_engine, mocker):
+    alice = np.full(128, 0.1, dtype=np.float32)
+    bob = np.full(128, -0.1, dtype=np.float32)
+    face_engine._set_gallery([alice, bob], ["Alice", "Bob"])
+    stranger = np.full(128, 0.9, dtype=np.float32)
+    mocker.patch.object(face_engine, 'encode_faces', return_value=[bob, stranger, alice, bob])
+    match = mocker.spy(face_engine, 'match_encodings')
+
+    status, message, names = face_engine.recognize_faces(np.zeros((8, 8, 3), dtype=np.uint8))
+
+    assert status == "success"
+    assert names == ["Bob", "Alice"]
+    assert message == "2 of 4 faces recognized"
+    assert match.call_count == 1
+
+def test_recognize_faces_none_recognized(face_engine, mocker):
+    face_engine._set_gallery([np.full(128, 0.1, dtype=np.float32)], ["Alice"])
+    mocker.patch.object(face_engine, 'encode_faces', return_value=[np.full(128, 0.9, dtype=np.float32)])
+
+    assert face_engine.recognize_faces(np.zeros((8, 8, 3), dtype=np.uint8)) == \
+        ("error", "Face not recognized", [])
@@ -0,0 +1,108 @@
+import pytest
+import numpy as np
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from face_index import BruteForceIndex, IVFFlatIndex, build_index, kmeans
+
+
+def clustered_gallery(n, dim=128, clusters=32, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    labels = rng.integers(0, clusters, size=n)
+    return (centers[labels] + 0.3 * rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def test_brute_force_matches_numpy():
+    gallery = clustered_gallery(300)
+    index = BruteForceIndex()
+    index.build(gallery)
+
+    probes = gallery[:5] + 0.01
+    indices, distances = index.search(probes, k=3)
+
+    for probe, row, dist in zip(probes, indices, distances):
+        exact = np.linalg.norm(gallery - probe, axis=1)
+        assert row.tolist() == np.argsort(exact)[:3].tolist()
+        assert np.allclose(dist, np.sort(exact)[:3], atol=1e-3)
+
+def test_brute_force_empty():
+    assert BruteForceIndex().search(np.zeros(128)) is None
+
+def test_build_index_threshold():
+    gallery = clustered_gallery(200)
+    assert build_index(gallery, ann_threshold=1000).kind == "exact"
+    assert build_index(gallery, ann_threshold=100).kind == "ivf"
+    assert build_index(gallery, ann_threshold=0).kind == "exact"
+
+def test_ivf_full_probe_is_exact():
+    gallery = clustered_gallery(500)
+    index = IVFFlatIndex(nlist=16)
+    index.build(gallery)
+
+    probes = gallery[::50] + 0.01
+    exact_idx, _ = build_index(gallery, ann_threshold=0).search(probes)
+    ivf_idx, _ = index.search(probes, nprobe=16)
+
+    assert ivf_idx[:, 0].tolist() == exact_idx[:, 0].tolist()
+
+def test_ivf_recall_with_default_nprobe():
+    gallery = clustered_gallery(2000)
+    index = IVFFlatIndex(nprobe=8)
+    index.build(gallery)
+
+    probes = gallery[::20] + 0.01
+    indices, _ = index.search(probes)
+
+    recall = np.mean(indices[:, 0] == np.arange(0, 2000, 20))
+    assert recall >= 0.95
+
+def test_ivf_incremental_add():
+    gallery = clustered_gallery(400)
+    index = IVFFlatIndex(nlist=8)
+    index.build(gallery[:200])
+
+    for row in gallery[200:]:
+        index.add(row)
+
+    assert len(index) == 400
+    assert index.needs_retrain is True
+    indices, _ = index.search(gallery[350], nprobe=8)
+    assert indices[0, 0] == 350
+
+    index.train()
+    assert index.needs_retrain is False
+    assert index.stats()["trained_size"] == 400
+
+def test_kmeans_shape():
+    centroids = kmeans(clustered_gallery(100), 10, iters=3)
+    assert centroids.shape == (10, 128)
+    assert centroids.dtype == np.float32
+
+def test_extend_with_shared_matrix():
+    gallery = clustered_gallery(300)
+    shared = gallery.copy()
+    shared.setflags(write=False)
+
+    exact = BruteForceIndex()
+    exact.build(shared[:200], copy=False)
+    ivf = IVFFlatIndex(nlist=8)
+    ivf.build(shared[:200], copy=False)
+
+    for index in (exact, ivf):
+        assert list(index.extend(shared)) == list(range(200, 300))
+        assert len(index) == 300
+        assert np.shares_memory(index.vectors, shared)
+        indices, _ = index.search(gallery[250], k=1)
+        assert indices[0, 0] == 250
+
+def test_ivf_rebuild_reuses_centroids():
+    gallery = clustered_gallery(400)
+    first = build_index(gallery, ann_threshold=100, nlist=8)
+    second = build_index(gallery[::2], ann_threshold=100, centroids=first.centroids)
+
+    assert np.array_equal(second.centroids, first.centroids)
+    assert len(second) == 200
@@ -0,0 +1,52 @@
+import pytest
+import os
+import sys
+import threading
+import time
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from face_engine import detect_and_encode
+from face_pool import FacePool, FacePoolBusy
+
+
+@pytest.fixture
+def pool():
+    pool = FacePool(1, max_pending=1, queue_timeout=0.1)
+    yield pool
+    pool.stop()
+
+def test_detect_and_encode_in_process(pool):
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    encodings, timings = pool.run(detect_and_encode, frame, None, None, 0.5)
+
+    assert encodings == []
+    assert set(timings) == {"detect", "encode"}
+    assert pool.stats["completed"] == 1
+    assert pool.depth() == 0
+
+def test_bounded_queue_raises_busy(pool):
+    pool.run(time.sleep, 0)   # processes up before timing the slot
+    holder = threading.Thread(target=pool.run, args=(time.sleep, 1.0))
+    holder.start()
+    time.sleep(0.2)
+
+    with pytest.raises(FacePoolBusy):
+        pool.run(time.sleep, 0)
+
+    holder.join()
+    assert pool.stats["busy"] == 1
+    pool.run(time.sleep, 0)
+
+def test_dead_process_restarts_pool(pool):
+    pool.run(time.sleep, 0)
+
+    # os._exit kills the pool process mid-call: pool is rebuilt and the call retried
+    with pytest.raises(Exception):
+        pool.run(os._exit, 1)
+
+    assert pool.stats["restarts"] >= 1
+    assert pool.run(abs, -3) == 3
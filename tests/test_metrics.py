@@ -0,0 +1,115 @@
+import pytest
+import json
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import Metrics, MongoCommandMetrics
+
+
+@pytest.fixture
+def registry():
+    return Metrics(prefix="t", buckets=(0.01, 0.1, 1.0))
+
+def test_histogram_buckets_are_cumulative(registry):
+    registry.describe("stage_seconds", "histogram", "Stage latency")
+    for seconds in (0.005, 0.01, 0.05, 2.0):
+        registry.observe("stage_seconds", seconds, stage="detect")
+
+    text = registry.render()
+
+    assert "# TYPE t_stage_seconds histogram" in text
+    assert 't_stage_seconds_bucket{stage="detect",le="0.01"} 2' in text
+    assert 't_stage_seconds_bucket{stage="detect",le="1"} 3' in text
+    assert 't_stage_seconds_bucket{stage="detect",le="+Inf"} 4' in text
+    assert 't_stage_seconds_count{stage="detect"} 4' in text
+    assert 't_stage_seconds_sum{stage="detect"} 2.065' in text
+
+def test_timer_counter_and_callbacks(registry):
+    with registry.timer("stage_seconds", stage="match"):
+        pass
+    registry.inc("scans_total", result="ok")
+    registry.inc("scans_total", 2, result="ok")
+    registry.register("gallery_size", lambda: 42, "Gallery rows")
+    registry.register("writer_total", lambda: {"written": 5}, "Rows", kind="counter", label="result")
+    registry.register("broken", lambda: 1 / 0, "Never rendered")
+
+    text = registry.render()
+
+    assert 't_stage_seconds_count{stage="match"} 1' in text
+    assert 't_scans_total{result="ok"} 3' in text
+    assert f't_gallery_size{{worker="{os.getpid()}"}} 42' in text
+    assert 't_writer_total{result="written"} 5' in text
+    assert "t_broken" not in text
+
+def test_label_values_are_escaped(registry):
+    registry.inc("scans_total", endpoint='a"b\\c')
+
+    assert 't_scans_total{endpoint="a\\"b\\\\c"} 1' in registry.render()
+
+def test_render_merges_worker_snapshots(registry, tmp_path):
+    registry.directory = str(tmp_path)
+    registry.boot_id = "boot"
+    registry.observe("stage_seconds", 0.05, stage="detect")
+    registry.inc("scans_total", result="ok")
+    registry.register("gallery_size", lambda: 10, "Gallery rows")
+    other = {"pid": 1, "time": time.time(),
+             "counters": {"t_scans_total": {'result="ok"': 4}},
+             "histograms": {"t_stage_seconds": {'stage="detect"': [1, 0, 0, 0, 0.005]}},
+             "gauges": {"t_gallery_size": {"": 10}}}
+    stale = dict(other, pid=2, time=time.time() - 3600)
+    (tmp_path / "worker-boot-1-100.json").write_text(json.dumps(other))
+    (tmp_path / "worker-boot-2-100.json").write_text(json.dumps(stale))
+    # Left over from an earlier server run: ignored entirely
+    (tmp_path / "worker-old-1-50.json").write_text(json.dumps(other))
+
+    text = registry.render()
+
+    # Totals of every worker (exited ones included), gauges of live workers only
+    assert 't_scans_total{result="ok"} 9' in text
+    assert 't_stage_seconds_count{stage="detect"} 3' in text
+    assert 't_gallery_size{worker="1"} 10' in text
+    assert 't_gallery_size{worker="2"}' not in text
+
+def test_snapshot_file_written_on_stop(registry, tmp_path):
+    registry.start(str(tmp_path), flush_interval=60, boot_id="boot")
+    registry.inc("scans_total", result="ok")
+    registry.stop()
+
+    paths = list(tmp_path.glob(f"worker-boot-{os.getpid()}-*.json"))
+    assert len(paths) == 1
+    with open(paths[0]) as f:
+        snapshot = json.load(f)
+    assert snapshot["counters"]["t_scans_total"] == {'result="ok"': 1}
+
+def test_reused_pid_does_not_overwrite_exited_worker(tmp_path):
+    first = Metrics(prefix="t")
+    first.start(str(tmp_path), flush_interval=60, boot_id="boot")
+    first.inc("scans_total", result="ok")
+    first.stop()
+
+    # A later worker of the same boot that got the same pid
+    second = Metrics(prefix="t")
+    second._started = first._started + 1
+    second.start(str(tmp_path), flush_interval=60, boot_id="boot")
+    second.inc("scans_total", result="ok")
+    second.stop()
+
+    assert len(list(tmp_path.glob("worker-boot-*.json"))) == 2
+    assert 't_scans_total{result="ok"} 2' in second.render()
+
+def test_mongo_command_listener(registry):
+    class Event:
+        command_name = "find"
+        duration_micros = 1500
+
+    listener = MongoCommandMetrics(registry)
+    listener.succeeded(Event())
+    listener.failed(Event())
+
+    text = registry.render()
+    assert 't_mongo_command_seconds_count{command="find"} 2' in text
+    assert 't_mongo_command_failures_total{command="find"} 1' in text
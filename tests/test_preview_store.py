@@ -0,0 +1,48 @@
+import pytest
+import base64
+import hashlib
+import mongomock
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preview_store import PreviewStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PreviewStore(str(tmp_path / "previews"))
+
+def test_put_get_remove(store):
+    etag = store.put("u1", b"jpeg")
+
+    assert etag == hashlib.sha1(b"jpeg").hexdigest()
+    assert store.get("u1") == b"jpeg"
+    store.remove("u1")
+    store.remove("u1")
+    assert store.get("u1") is None
+
+def test_clear(store):
+    store.put("u1", b"a")
+    store.put("u2", b"b")
+
+    store.clear()
+
+    assert store.get("u1") is None and store.get("u2") is None
+
+def test_migrate_moves_inline_previews(store):
+    users = mongomock.MongoClient()['db_absensi']['daftar_wajah']
+    legacy = users.insert_one({"nama": "A", "image_preview":
+                               "data:image/jpeg;base64," + base64.b64encode(b"a-jpeg").decode()}).inserted_id
+    users.insert_one({"nama": "B", "image_preview": None})
+    users.insert_one({"nama": "C", "preview_etag": "x"})
+
+    assert store.migrate(users) == 1
+
+    doc = users.find_one({"_id": legacy})
+    assert "image_preview" not in doc
+    assert doc["preview_etag"] == hashlib.sha1(b"a-jpeg").hexdigest()
+    assert store.get(str(legacy)) == b"a-jpeg"
+    assert store.migrate(users) == 0
@@ -2,7 +2,7 @@ import pytest
 import base64
 import io
 from PIL import Image
-from utils import compress_base64_image, get_image_size_kb
+from utils import compress_base64_image, compress_image_bytes, compress_image_to_jpeg, get_image_size_kb, is_upright_jpeg
 
 
 def create_test_image_base64(width=800, height=600, color=(255, 0, 0), format='JPEG'):
@@ -247,3 +247,46 @@ class TestIntegration:
         assert image.format == 'JPEG'
         assert image.size[0] <= 400  # Width should be <= max_width
         assert compressed_size < 100, "Compressed image should be less than 100KB for typical use"
+
+
+class TestCompressImageBytes:
+    """Test suite for compress_image_bytes (binary uploads)"""
+
+    def test_compress_raw_bytes(self):
+        """Raw JPEG bytes compress to the same data URI format"""
+        _, base64_data = create_test_image_base64(width=1600, height=900).split(',', 1)
+        image_bytes = base64.b64decode(base64_data)
+
+        compressed_image = compress_image_bytes(image_bytes, max_width=400)
+
+        assert compressed_image.startswith('data:image/jpeg;base64,')
+        _, data = compressed_image.split(',', 1)
+        image = Image.open(io.BytesIO(base64.b64decode(data)))
+        assert image.size == (400, 225)
+
+    def test_compress_invalid_bytes_raises_error(self):
+        with pytest.raises(ValueError) as exc_info:
+            compress_image_bytes(b'not an image')
+
+        assert "Failed to compress image" in str(exc_info.value)
+
+
+class TestDraftModeAndUprightJpeg:
+    """JPEG draft-mode downscale and the gallery pass-through check"""
+
+    def test_large_jpeg_downscaled_to_max_width(self):
+        image_bytes = base64.b64decode(create_test_image_base64(width=3200, height=1800).split(',', 1)[1])
+        image = Image.open(io.BytesIO(compress_image_to_jpeg(image_bytes, max_width=400)))
+        assert image.size == (400, 225)
+
+    def test_is_upright_jpeg(self):
+        jpeg = base64.b64decode(create_test_image_base64(width=40, height=30).split(',', 1)[1])
+        png = base64.b64decode(create_test_image_base64(width=40, height=30, format='PNG').split(',', 1)[1])
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        rotated = io.BytesIO()
+        Image.open(io.BytesIO(jpeg)).save(rotated, format='JPEG', exif=exif)
+
+        assert is_upright_jpeg(jpeg) is True
+        assert is_upright_jpeg(png) is False
+        assert is_upright_jpeg(rotated.getvalue()) is False
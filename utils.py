@@ -25,14 +25,58 @@ def compress_base64_image(base64_string, max_width=400, quality=85):
         else:
             base64_data = base64_string
         
-        # Always use JPEG header since we're converting to JPEG
-        header = "data:image/jpeg;base64"
-        
         # Decode base64 to bytes
         image_bytes = base64.b64decode(base64_data)
-        
+    except Exception as e:
+        raise ValueError(f"Failed to compress image: {str(e)}")
+
+    return compress_image_bytes(image_bytes, max_width=max_width, quality=quality)
+
+
+def compress_image_bytes(image_bytes, max_width=400, quality=85):
+    """
+    Compress raw encoded image bytes (binary upload) by resizing and reducing quality.
+    
+    Args:
+        image_bytes (bytes): Encoded image (JPEG, PNG, ...)
+        max_width (int): Maximum width for the compressed image (default: 400px)
+        quality (int): JPEG quality (1-100, default: 85)
+    
+    Returns:
+        str: Compressed base64 encoded image string with data URI prefix
+    
+    Raises:
+        ValueError: If the input is not a valid image
+    """
+    # Always use JPEG header since we're converting to JPEG
+    header = "data:image/jpeg;base64"
+    jpeg_bytes = compress_image_to_jpeg(image_bytes, max_width=max_width, quality=quality)
+    return f"{header},{base64.b64encode(jpeg_bytes).decode('utf-8')}"
+
+
+def compress_image_to_jpeg(image_bytes, max_width=400, quality=85):
+    """
+    Resize and re-encode an image as JPEG.
+    
+    Args:
+        image_bytes (bytes): Encoded image (JPEG, PNG, ...)
+        max_width (int): Maximum width for the compressed image (default: 400px)
+        quality (int): JPEG quality (1-100, default: 85)
+    
+    Returns:
+        bytes: Compressed JPEG
+    
+    Raises:
+        ValueError: If the input is not a valid image
+    """
+    try:
         # Open image with PIL
         image = Image.open(io.BytesIO(image_bytes))
+
+        # JPEG: let libjpeg downscale by 1/2, 1/4 or 1/8 in the DCT domain
+        # while decoding (draft mode), LANCZOS only resizes what is left
+        if image.format == 'JPEG' and image.width > max_width:
+            image.draft('RGB', (max_width, max(1, image.height * max_width // image.width)))
         
         # Convert RGBA to RGB if necessary (for JPEG compatibility)
         if image.mode in ('RGBA', 'LA', 'P'):
@@ -56,18 +100,42 @@ def compress_base64_image(base64_string, max_width=400, quality=85):
         # Compress image to JPEG format
         output_buffer = io.BytesIO()
         image.save(output_buffer, format='JPEG', quality=quality, optimize=True)
-        output_buffer.seek(0)
-        
-        # Encode back to base64
-        compressed_base64 = base64.b64encode(output_buffer.read()).decode('utf-8')
-        
-        # Return with data URI prefix
-        return f"{header},{compressed_base64}"
+        return output_buffer.getvalue()
     
     except Exception as e:
         raise ValueError(f"Failed to compress image: {str(e)}")
 
 
+def is_upright_jpeg(image_bytes):
+    """
+    True for JPEG bytes without an EXIF rotation, i.e. files that can be
+    stored as-is and decode the same everywhere (only the header is read).
+    """
+    if not image_bytes[:3] == b'\xff\xd8\xff':
+        return False
+    try:
+        return Image.open(io.BytesIO(image_bytes)).getexif().get(0x0112, 1) == 1
+    except Exception:
+        return False
+
+
+def decode_data_uri(base64_string):
+    """
+    Decode a base64 image string (with or without data URI prefix) to bytes.
+    
+    Raises:
+        ValueError: If the input is not valid base64
+    """
+    if ',' in base64_string:
+        _, base64_data = base64_string.split(',', 1)
+    else:
+        base64_data = base64_string
+    try:
+        return base64.b64decode(base64_data)
+    except Exception as e:
+        raise ValueError(f"Invalid base64 image: {str(e)}")
+
+
 def get_image_size_kb(base64_string):
     """
     Calculate the size of a base64 encoded image in kilobytes.